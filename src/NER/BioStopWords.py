@@ -1,50731 +1,39 @@
+'''
+Stop word lists of the NER package.
 
-DOMAIN_STOP_WORDS = [
-    "'ll",
-    "'ve",
-    "0",
-    "1",
-    "10",
-    "100",
-    "11",
-    "12",
-    "13",
-    "14",
-    "15",
-    "16",
-    "17",
-    "18",
-    "19",
-    "2",
-    "20",
-    "21",
-    "22",
-    "23",
-    "24",
-    "25",
-    "26",
-    "27",
-    "28",
-    "29",
-    "3",
-    "30",
-    "31",
-    "32",
-    "33",
-    "34",
-    "35",
-    "36",
-    "37",
-    "38",
-    "39",
-    "4",
-    "40",
-    "41",
-    "42",
-    "43",
-    "44",
-    "45",
-    "46",
-    "47",
-    "48",
-    "49",
-    "5",
-    "50",
-    "51",
-    "52",
-    "53",
-    "54",
-    "55",
-    "56",
-    "57",
-    "58",
-    "59",
-    "6",
-    "60",
-    "61",
-    "62",
-    "63",
-    "64",
-    "65",
-    "66",
-    "67",
-    "68",
-    "69",
-    "7",
-    "70",
-    "71",
-    "72",
-    "73",
-    "74",
-    "75",
-    "76",
-    "77",
-    "78",
-    "79",
-    "8",
-    "80",
-    "81",
-    "82",
-    "83",
-    "84",
-    "85",
-    "86",
-    "87",
-    "88",
-    "89",
-    "9",
-    "90",
-    "91",
-    "92",
-    "93",
-    "94",
-    "95",
-    "96",
-    "97",
-    "98",
-    "99",
-    "a",
-    "able",
-    "about",
-    "above",
-    "abst",
-    "accordance",
-    "according",
-    "accordingly",
-    "across",
-    "act",
-    "actually",
-    "added",
-    "adj",
-    "affected",
-    "affecting",
-    "affects",
-    "after",
-    "afterwards",
-    "again",
-    "against",
-    "ah",
-    "all",
-    "almost",
-    "alone",
-    "along",
-    "already",
-    "also",
-    "although",
-    "always",
-    "am",
-    "among",
-    "amongst",
-    "an",
-    "and",
-    "announce",
-    "another",
-    "any",
-    "anybody",
-    "anyhow",
-    "anymore",
-    "anyone",
-    "anything",
-    "anyway",
-    "anyways",
-    "anywhere",
-    "apparently",
-    "approximately",
-    "are",
-    "aren",
-    "arent",
-    "arise",
-    "around",
-    "as",
-    "aside",
-    "ask",
-    "asking",
-    "at",
-    "auth",
-    "available",
-    "away",
-    "awfully",
-    "b",
-    "back",
-    "be",
-    "became",
-    "because",
-    "become",
-    "becomes",
-    "becoming",
-    "been",
-    "before",
-    "beforehand",
-    "begin",
-    "beginning",
-    "beginnings",
-    "begins",
-    "behind",
-    "being",
-    "believe",
-    "below",
-    "beside",
-    "besides",
-    "between",
-    "beyond",
-    "biol",
-    "both",
-    "brief",
-    "briefly",
-    "but",
-    "by",
-    "c",
-    "ca",
-    "came",
-    "can",
-    "can't",
-    "cannot",
-    "cause",
-    "causes",
-    "certain",
-    "certainly",
-    "co",
-    "com",
-    "come",
-    "comes",
-    "contain",
-    "containing",
-    "contains",
-    "could",
-    "couldnt",
-    "d",
-    "date",
-    "did",
-    "didn't",
-    "different",
-    "do",
-    "does",
-    "doesn't",
-    "doing",
-    "don't",
-    "done",
-    "down",
-    "downwards",
-    "due",
-    "during",
-    "e",
-    "each",
-    "ed",
-    "edu",
-    "effect",
-    "eg",
-    "eight",
-    "eighty",
-    "either",
-    "else",
-    "elsewhere",
-    "end",
-    "ending",
-    "enough",
-    "especially",
-    "et",
-    "et-al",
-    "etc",
-    "even",
-    "ever",
-    "every",
-    "everybody",
-    "everyone",
-    "everything",
-    "everywhere",
-    "ex",
-    "except",
-    "f",
-    "far",
-    "few",
-    "ff",
-    "fifth",
-    "first",
-    "five",
-    "fix",
-    "followed",
-    "following",
-    "follows",
-    "for",
-    "former",
-    "formerly",
-    "forth",
-    "found",
-    "four",
-    "from",
-    "further",
-    "furthermore",
-    "g",
-    "gave",
-    "get",
-    "gets",
-    "getting",
-    "give",
-    "given",
-    "gives",
-    "giving",
-    "go",
-    "goes",
-    "gone",
-    "got",
-    "gotten",
-    "h",
-    "had",
-    "happens",
-    "hardly",
-    "has",
-    "hasn't",
-    "have",
-    "haven't",
-    "having",
-    "he",
-    "hed",
-    "hence",
-    "her",
-    "here",
-    "hereafter",
-    "hereby",
-    "herein",
-    "heres",
-    "hereupon",
-    "hers",
-    "herself",
-    "hes",
-    "hi",
-    "hid",
-    "him",
-    "himself",
-    "his",
-    "hither",
-    "home",
-    "how",
-    "howbeit",
-    "however",
-    "hundred",
-    "i",
-    "i'll",
-    "i've",
-    "id",
-    "ie",
-    "if",
-    "im",
-    "immediate",
-    "immediately",
-    "importance",
-    "important",
-    "in",
-    "inc",
-    "indeed",
-    "index",
-    "information",
-    "instead",
-    "into",
-    "invention",
-    "inward",
-    "is",
-    "isn't",
-    "it",
-    "it'll",
-    "itd",
-    "its",
-    "itself",
-    "j",
-    "just",
-    "k",
-    "keep",
-    "keeps",
-    "kept",
-    "kg",
-    "km",
-    "know",
-    "known",
-    "knows",
-    "l",
-    "largely",
-    "last",
-    "lately",
-    "later",
-    "latter",
-    "latterly",
-    "least",
-    "less",
-    "lest",
-    "let",
-    "lets",
-    "like",
-    "liked",
-    "likely",
-    "line",
-    "little",
-    "look",
-    "looking",
-    "looks",
-    "ltd",
-    "m",
-    "made",
-    "mainly",
-    "make",
-    "makes",
-    "many",
-    "may",
-    "maybe",
-    "me",
-    "mean",
-    "means",
-    "meantime",
-    "meanwhile",
-    "merely",
-    "mg",
-    "might",
-    "million",
-    "miss",
-    "ml",
-    "more",
-    "moreover",
-    "most",
-    "mostly",
-    "mr",
-    "mrs",
-    "much",
-    "mug",
-    "must",
-    "my",
-    "myself",
-    "n",
-    "na",
-    "name",
-    "namely",
-    "nay",
-    "nd",
-    "near",
-    "nearly",
-    "necessarily",
-    "necessary",
-    "need",
-    "needs",
-    "neither",
-    "never",
-    "nevertheless",
-    "new",
-    "next",
-    "nine",
-    "ninety",
-    "no",
-    "nobody",
-    "non",
-    "none",
-    "nonetheless",
-    "noone",
-    "nor",
-    "normally",
-    "nos",
-    "not",
-    "noted",
-    "nothing",
-    "now",
-    "nowhere",
-    "o",
-    "obtain",
-    "obtained",
-    "obviously",
-    "of",
-    "off",
-    "often",
-    "oh",
-    "ok",
-    "okay",
-    "old",
-    "omitted",
-    "on",
-    "once",
-    "one",
-    "ones",
-    "only",
-    "onto",
-    "or",
-    "ord",
-    "other",
-    "others",
-    "otherwise",
-    "ought",
-    "our",
-    "ours",
-    "ourselves",
-    "out",
-    "outside",
-    "over",
-    "overall",
-    "owing",
-    "own",
-    "p",
-    "page",
-    "pages",
-    "part",
-    "particular",
-    "particularly",
-    "past",
-    "per",
-    "perhaps",
-    "placed",
-    "please",
-    "plus",
-    "poorly",
-    "possible",
-    "possibly",
-    "potentially",
-    "pp",
-    "predominantly",
-    "present",
-    "previously",
-    "primarily",
-    "probably",
-    "promptly",
-    "proud",
-    "provides",
-    "put",
-    "q",
-    "que",
-    "quickly",
-    "quite",
-    "qv",
-    "r",
-    "ran",
-    "rather",
-    "rd",
-    "re",
-    "readily",
-    "really",
-    "recent",
-    "recently",
-    "ref",
-    "refs",
-    "regarding",
-    "regardless",
-    "regards",
-    "related",
-    "relatively",
-    "research",
-    "respectively",
-    "resulted",
-    "resulting",
-    "results",
-    "right",
-    "run",
-    "s",
-    "said",
-    "same",
-    "saw",
-    "say",
-    "saying",
-    "says",
-    "sec",
-    "section",
-    "see",
-    "seeing",
-    "seem",
-    "seemed",
-    "seeming",
-    "seems",
-    "seen",
-    "self",
-    "selves",
-    "sent",
-    "seven",
-    "several",
-    "shall",
-    "she",
-    "she'll",
-    "shed",
-    "shes",
-    "should",
-    "shouldn't",
-    "show",
-    "showed",
-    "shown",
-    "showns",
-    "shows",
-    "significant",
-    "significantly",
-    "similar",
-    "similarly",
-    "since",
-    "six",
-    "slightly",
-    "so",
-    "some",
-    "somebody",
-    "somehow",
-    "someone",
-    "somethan",
-    "something",
-    "sometime",
-    "sometimes",
-    "somewhat",
-    "somewhere",
-    "soon",
-    "sorry",
-    "specifically",
-    "specified",
-    "specify",
-    "specifying",
-    "still",
-    "stop",
-    "strongly",
-    "sub",
-    "substantially",
-    "successfully",
-    "such",
-    "sufficiently",
-    "suggest",
-    "sup",
-    "sure",
-    "t",
-    "take",
-    "taken",
-    "taking",
-    "tell",
-    "tends",
-    "th",
-    "than",
-    "thank",
-    "thanks",
-    "thanx",
-    "that",
-    "that'll",
-    "that've",
-    "thats",
-    "the",
-    "their",
-    "theirs",
-    "them",
-    "themselves",
-    "then",
-    "thence",
-    "there",
-    "there'll",
-    "there've",
-    "thereafter",
-    "thereby",
-    "thered",
-    "therefore",
-    "therein",
-    "thereof",
-    "therere",
-    "theres",
-    "thereto",
-    "thereupon",
-    "these",
-    "they",
-    "they'll",
-    "they've",
-    "theyd",
-    "theyre",
-    "think",
-    "this",
-    "those",
-    "thou",
-    "though",
-    "thoughh",
-    "thousand",
-    "throug",
-    "through",
-    "throughout",
-    "thru",
-    "thus",
-    "til",
-    "tip",
-    "to",
-    "together",
-    "too",
-    "took",
-    "toward",
-    "towards",
-    "tried",
-    "tries",
-    "truly",
-    "try",
-    "trying",
-    "ts",
-    "twice",
-    "two",
-    "u",
-    "un",
-    "under",
-    "unfortunately",
-    "unless",
-    "unlike",
-    "unlikely",
-    "until",
-    "unto",
-    "up",
-    "upon",
-    "ups",
-    "us",
-    "use",
-    "used",
-    "useful",
-    "usefully",
-    "usefulness",
-    "uses",
-    "using",
-    "usually",
-    "v",
-    "value",
-    "various",
-    "very",
-    "via",
-    "viz",
-    "vol",
-    "vols",
-    "vs",
-    "w",
-    "want",
-    "wants",
-    "was",
-    "wasnt",
-    "way",
-    "we",
-    "we'll",
-    "we've",
-    "wed",
-    "welcome",
-    "went",
-    "were",
-    "werent",
-    "what",
-    "what'll",
-    "whatever",
-    "whats",
-    "when",
-    "whence",
-    "whenever",
-    "where",
-    "whereafter",
-    "whereas",
-    "whereby",
-    "wherein",
-    "wheres",
-    "whereupon",
-    "wherever",
-    "whether",
-    "which",
-    "while",
-    "whim",
-    "whither",
-    "who",
-    "who'll",
-    "whod",
-    "whoever",
-    "whole",
-    "whom",
-    "whomever",
-    "whos",
-    "whose",
-    "why",
-    "widely",
-    "willing",
-    "wish",
-    "with",
-    "within",
-    "without",
-    "wont",
-    "words",
-    "world",
-    "would",
-    "wouldnt",
-    "www",
-    "x",
-    "y",
-    "yes",
-    "yet",
-    "you",
-    "you'll",
-    "you've",
-    "youd",
-    "your",
-    "youre",
-    "yours",
-    "yourself",
-    "yourselves",
-    "z",
-    "zero",
-    "cell",
-    "cells",
-    "expression",
-    "patient",
-    "patients",
-    "person",
-    "people",
-    "study",
-    "studies",
-    "protein",
-    "proteins",
-    "gene",
-    "genes",
-    "mRNA",
-    "transcript",
-    "domain",
-    "domains",
-    "factor",
-    "factors",
-    "level",
-    "levels",
-    "disease",
-    "diseases"]
+The words are kept in plain text files in the stopwords folder, one word per line, and each list is
+only read the first time it is accessed, so that importing the package does not pay for the ~50k
+words of the brown corpus list that the tagger never uses:
 
+    from NER.BioStopWords import DOMAIN_STOP_WORDS
+'''
+import os
 
-COMMON_WORDS_CORPUS={
-  "brown_corpus": [
-    "conjugating",
-    "red-haired",
-    "automotive",
-    "persecutory",
-    "arabia",
-    "symptomatic",
-    "wister",
-    "age",
-    "214,938",
-    "tasting",
-    "enchanting",
-    "melanesian",
-    "lafe",
-    "unconditioned",
-    "maniclike",
-    "plow",
-    "flavoring",
-    "capitulated",
-    "search",
-    "holzman",
-    "embittered",
-    "manslaughter",
-    "builders'",
-    "awful",
-    "flood-ravaged",
-    "coachwork",
-    "pimen's",
-    "12:01",
-    "dioramas",
-    "zealously",
-    "cudmore",
-    "unwire",
-    "drummer",
-    "cliches",
-    "forty-year",
-    "bacillus",
-    "sera",
-    "norwegian",
-    "scissors",
-    "shyly",
-    "restaurant",
-    "$20,447,000",
-    "bayaderka",
-    "blocking",
-    "rider",
-    "hawk-faced",
-    "50-foot",
-    "submarine-ball",
-    "coal",
-    "recursive",
-    "pasty",
-    "prophetically",
-    "helene",
-    "shietz",
-    "ex-yankee",
-    "crisply",
-    "shortening",
-    "lobby",
-    "adventurers",
-    "underclothes",
-    "abridged",
-    "flail",
-    "colonialism",
-    "kwame",
-    "marijuana",
-    "immobility",
-    "prometheus",
-    "square's",
-    "speakin'",
-    "locust",
-    "intra-city",
-    "moore",
-    "overtones",
-    "disunion",
-    "government",
-    "rousseau",
-    "desk",
-    "charity",
-    "pledged",
-    "ruffled",
-    "hasher",
-    "inflammatory",
-    "legislation-delaying",
-    "horizon",
-    "hitters",
-    "10-yr.",
-    "fermenting",
-    "proceedings",
-    "re-examine",
-    "contorted",
-    "muddy",
-    "petipa-minkus",
-    "notes",
-    "ridiculed",
-    "beaulieu",
-    "resting",
-    "cocktails",
-    "sailboat",
-    "broad",
-    "constitutional",
-    "authorship",
-    "chargeable",
-    "madness",
-    "harass",
-    "dia.",
-    "pocketed",
-    "isham",
-    "tahse",
-    "heck",
-    "corrette",
-    "diego",
-    "cornwall",
-    "warned",
-    "track-signal",
-    "faintly",
-    "tarkington",
-    "impotency",
-    "thumped",
-    "diathermy",
-    "fatboy",
-    "revellings",
-    "bucolic",
-    "agates",
-    "circularity",
-    "hey",
-    "resurrected",
-    "effort",
-    "rollins",
-    "authenticator",
-    "thankless",
-    "flagrant",
-    "discoveries",
-    "forged",
-    "piercing",
-    "enthralling",
-    "dominating",
-    "dialectical",
-    "buchheister",
-    "filagree",
-    "nbc",
-    "aeration",
-    "specifics",
-    "high-up",
-    "supernatant",
-    "disagreed",
-    "sukuma",
-    "whereby",
-    "booby-trap",
-    "bookcase",
-    "confided",
-    "debentures",
-    "resistive",
-    "vibrant",
-    "soutane",
-    "drowns",
-    "nux",
-    "morass",
-    "night",
-    "34.7",
-    "miraculously",
-    "steppes",
-    "trusses",
-    "f{t}",
-    "june",
-    "gosaimasu",
-    "plasticity",
-    "1942",
-    "encyclopedic",
-    "gems",
-    "sex-manuals",
-    "penetrating",
-    "patient",
-    "dietary",
-    "diluzio",
-    "marshall's",
-    "lab",
-    "pythagoreans",
-    "cask",
-    "underwriters",
-    "jay",
-    "1,225",
-    "hatchway",
-    "banal",
-    "unappeasably",
-    "swearinge",
-    "preprepared",
-    "nationality",
-    "frankfurt",
-    "teaspoons",
-    "treaty",
-    "haunt",
-    "audio",
-    "tolek",
-    "indonesian",
-    "dramatically",
-    "sentiments",
-    "stavropoulos",
-    "coosa",
-    "squeal",
-    "query",
-    "blanc",
-    "she'll",
-    "sancho",
-    "wickets",
-    "occupation",
-    "bewail",
-    "garza",
-    "nonparticulate",
-    "whitehead's",
-    "high-minded",
-    "morgan",
-    "kronenberger",
-    "anti-infective",
-    "non-scientific",
-    "divisive",
-    "skepticism",
-    "ominously",
-    "16-22",
-    "clannish",
-    "indirectly",
-    "playbacks",
-    "guthman",
-    "flounced",
-    "scapin",
-    "ash-can",
-    "turin",
-    "stifling",
-    "clean-shaven",
-    "decomposition",
-    "sentry's",
-    "commissions",
-    "comforts",
-    "hansen",
-    "great-grandfather",
-    "wave",
-    "sideshow",
-    "collins'",
-    "assuredly",
-    "crozier",
-    "hero-worship",
-    "deacon",
-    "casals",
-    "coddington",
-    "cancelling",
-    "gord",
-    "spanish-born",
-    "1,212",
-    "75-minute",
-    "rinsing",
-    "pleasing",
-    "supports",
-    "schoolmate",
-    "aviation",
-    "coble",
-    "disharmony",
-    "adaptable",
-    "motet",
-    "postponing",
-    "smokers",
-    "waterbury",
-    "senium",
-    "swallow-barn",
-    "penalized",
-    "imitation-caning",
-    "grinning",
-    "open-end",
-    "grokking",
-    "notoriously",
-    "wemmick",
-    "collectors",
-    "zealot",
-    "que",
-    "thud",
-    "whirlwind's",
-    "statesmen",
-    "illnesses",
-    "1700's",
-    "landis'",
-    "fieldwork",
-    "row",
-    "15-to-one",
-    "willie's",
-    "mob's",
-    "eight-inch",
-    "sande's",
-    "simultaneously",
-    "mine",
-    "finger-tips",
-    "buxom",
-    "winslow",
-    "threadbare",
-    "berlitz",
-    "100-megaton",
-    "competes",
-    "gull",
-    "bottleneck",
-    "splendidly",
-    "lovie",
-    "yokuts",
-    "rehabilitating",
-    "hohlbein",
-    "ortega",
-    "soyaburgers",
-    "her",
-    "serenade",
-    "emigration",
-    "os",
-    "squadron",
-    "manfred",
-    "paix",
-    "worth",
-    "denying",
-    "mountaineering",
-    "rubble",
-    "ante-bellum",
-    "child-cloud",
-    "plant",
-    "minimize",
-    "aristocrats",
-    "8-inch",
-    "sanantonio",
-    "unconventional",
-    "treasures",
-    "best",
-    "substructure",
-    "kenyon",
-    "chatte",
-    "stiffness",
-    "mistrusted",
-    "portland",
-    "suggestions",
-    "planetoids",
-    "angrily",
-    "clarity",
-    "reduce",
-    "preference",
-    "crowing",
-    "contrary-to-reality",
-    "tedium",
-    "circuits",
-    "ridiculing",
-    "new-york",
-    "board",
-    "needs",
-    "sprinkling",
-    "unclaimed",
-    "standin'",
-    "danny's",
-    "526",
-    "twos",
-    "retribution",
-    "weakened",
-    "1065",
-    "pretentious",
-    "misrepresentation",
-    "goodies",
-    "tunnard",
-    "emerged",
-    "cleanups",
-    "dashwood",
-    "3-cm",
-    "haggling",
-    "goin'",
-    "2:30.3-:36",
-    "enrich",
-    "vicenza",
-    "disclose",
-    "suite",
-    "gogh",
-    "transferred",
-    "ammoniac",
-    "child-face",
-    "contraction",
-    "nonsensical",
-    "jean-pierre",
-    "distinctly",
-    "third-",
-    "6000",
-    "muse",
-    "currencies",
-    "eschew",
-    "listed",
-    "lung",
-    "clamors",
-    "lausanne",
-    "cycles",
-    "some",
-    "zoo",
-    "quality",
-    "loosli",
-    "collapsing",
-    "grandma",
-    "weather-royal",
-    "magnificent",
-    "grubb",
-    "promising",
-    "carruthers",
-    "bruce",
-    "maude's",
-    "counteract",
-    "doweling",
-    "trapdoors",
-    "crafty",
-    "quicker",
-    "pace",
-    "regrouped",
-    "wrenching",
-    "oman",
-    "intensive",
-    "suffuse",
-    "hissing",
-    "black-bearded",
-    "non-party",
-    "quizzical",
-    "contemplated",
-    "dealings",
-    "paganism",
-    "scrutiny",
-    "irate",
-    "garlic",
-    "gate-post",
-    "mulching",
-    "francoisette",
-    "radetzky",
-    "hanoverian",
-    "pansy",
-    "rockabye",
-    "dean's",
-    "um",
-    "bela",
-    "megatons",
-    "newts",
-    "patties",
-    "jenkins's",
-    "clash",
-    "skill",
-    "exact",
-    "regattas",
-    "rooftop",
-    "hangars",
-    "musicians",
-    "fumble",
-    "ablation",
-    "demon",
-    "patents",
-    "anhemolyticus",
-    "bob's",
-    "gallonage",
-    "aggravated",
-    "climate",
-    "snoring",
-    "coffin",
-    "demand",
-    "newly-married",
-    "bursts",
-    "sobbingly",
-    "uplift",
-    "anonymity",
-    "luette",
-    "appeasing",
-    "noes",
-    "concern",
-    "eerily",
-    "isaiah",
-    "liberty",
-    "1922",
-    "exalting",
-    "149",
-    "co-ordinate",
-    "hogan's",
-    "nile",
-    "railways",
-    "20th-century",
-    "leclair",
-    "brace's",
-    "corso",
-    "disappearing",
-    "dovetail",
-    "andover",
-    "declines",
-    "jaggers",
-    "long-overdue",
-    "plasm",
-    "finot",
-    "controller's",
-    "forbore",
-    "switzer",
-    "hawker",
-    "rossoff",
-    "telephoned",
-    "airport",
-    "glinting",
-    "20-inch-barrel",
-    "smithtown",
-    "appearance",
-    "maude",
-    "patriot",
-    "groomed",
-    "what-will-t.",
-    "instrumentals",
-    "135",
-    "darrow",
-    "sincerest",
-    "narcotic",
-    "subsystem",
-    "thicket",
-    "localisms",
-    "surrounded",
-    "pity",
-    "kolpakova",
-    "distinguishing",
-    "groped",
-    "seed-pods",
-    "sextuor",
-    "test-run",
-    "monotone",
-    "atom-like",
-    "exceptionally",
-    "long-lived",
-    "yachtel",
-    "greeted",
-    "dolly",
-    "gilman",
-    "exerts",
-    "1788",
-    "level",
-    "hunch",
-    "symbolically",
-    "ordinarius",
-    "leatherneck",
-    "participation",
-    "as-it-were",
-    "birdwood",
-    "paraxial",
-    "turnout",
-    "scream",
-    "mashed",
-    "pecked",
-    "egocentric",
-    "quadrupled",
-    "1040",
-    "surged",
-    "glycerin",
-    "keene",
-    "swiss",
-    "molotov",
-    "glutted",
-    "circumference",
-    "reformation",
-    "controlling",
-    "expressed",
-    "tsh-treated",
-    "brett",
-    "understood",
-    "chelmno",
-    "area",
-    "lulls",
-    "feats",
-    "bayly",
-    "criss-cross",
-    "crooks",
-    "4,900",
-    "churchly",
-    "w.'s",
-    "iron",
-    "hatters",
-    "washings",
-    "though",
-    "downtrend",
-    "dome",
-    "hint",
-    "big-game",
-    "counter-offensive",
-    "keenly",
-    "wagner",
-    "conceded",
-    "swiftly",
-    "fella",
-    "pheasants",
-    "narrowness",
-    "far",
-    "three-inning",
-    "tactful",
-    "hardwoods",
-    "earth-touching",
-    "debate",
-    "baronial",
-    "lawful",
-    "affectation",
-    "blume",
-    "ould",
-    "chevrolet",
-    "fact",
-    "tubs",
-    "caving",
-    "obverse",
-    "stack",
-    "unplowed",
-    "loving",
-    "memory-images",
-    "lats",
-    "there",
-    "squad",
-    "no-good",
-    "tuborg",
-    "free",
-    "presidential",
-    "gathering",
-    "tanner",
-    "terram",
-    "brimful",
-    "we've",
-    "sterios",
-    "artery-pulmonary",
-    "probably",
-    "incurred",
-    "thermostated",
-    "bravura",
-    "enjoined",
-    "that'd",
-    "hawkins'",
-    "gray-thatched",
-    "hooghli",
-    "stolidly",
-    "1769-1842",
-    "dismembered",
-    "territories",
-    "bandages",
-    "delightful",
-    "toxin",
-    "saloons",
-    "infant's",
-    "quick-kill",
-    "facile",
-    "intensification",
-    "loyal",
-    "publicly",
-    "hopeless",
-    "flexed",
-    "asinine",
-    "announces",
-    "undergone",
-    "shoettle",
-    "photos",
-    "alors",
-    "pulverized",
-    "self-indulgence",
-    "accessible",
-    "fraternisation",
-    "rules",
-    "nascent",
-    "vioiln",
-    "growled",
-    "milwaukee's",
-    "sailorly",
-    "stockholders",
-    "psalm",
-    "doughnuttery",
-    "truant",
-    "wield",
-    "surplus",
-    "ponkob",
-    "lyford's",
-    "strafaci",
-    "juridical",
-    "bull",
-    "waterways",
-    "fun-loving",
-    "expedient",
-    "peabody's",
-    "argonauts",
-    "low-duty",
-    "bigoted",
-    "baltimore",
-    "victorians",
-    "amazon",
-    "sun'll",
-    "devastation",
-    "swallowed",
-    "hipster",
-    "dawn",
-    "niger",
-    "subdivisions",
-    "admitting",
-    "blurted",
-    "rawlins",
-    "lengths",
-    "administration",
-    "abduction",
-    "swarms",
-    "wieland",
-    "willard",
-    "inbreeding",
-    "impersonal",
-    "integrated",
-    "ferry",
-    "accounts",
-    "courses",
-    "masters",
-    "tingling",
-    "leathery",
-    "andre",
-    "emma's",
-    "bangles",
-    "cav",
-    "arrest",
-    "graham",
-    "stares",
-    "subscribers",
-    "keng",
-    "yaqui",
-    "1783",
-    "hayek",
-    "investment",
-    "wrappers",
-    "devoting",
-    "anye",
-    "alternately",
-    "gridley",
-    "two-week",
-    "delmore",
-    "exalt",
-    "wasted",
-    "consoled",
-    "intermittently",
-    "brandin'",
-    "fair-priced",
-    "heisted",
-    "quarreled",
-    "furthermore",
-    "parrots",
-    "kenneth",
-    "adams'",
-    "fossilized",
-    "jokers",
-    "bromfield's",
-    "ba-a-a",
-    "snobs",
-    "recklessness",
-    "encouraging",
-    "acquitted",
-    "stowey",
-    "scotch",
-    "aux",
-    "rider's",
-    "disarranged",
-    "unstaring",
-    "wozzek",
-    "angriest",
-    "empathy",
-    "plated",
-    "fads",
-    "non-systematic",
-    "tapis",
-    "medication",
-    "beautiful",
-    "dystopia",
-    "insinuating",
-    "gary",
-    "settles",
-    "perpendicularly",
-    "first-hand",
-    "puerto",
-    "disown",
-    "luise",
-    "bumpers",
-    "hissed",
-    "terrestrial",
-    "commit",
-    "boss's",
-    "sinuous",
-    "beefed",
-    "kline",
-    "went",
-    "rooney",
-    "pretexts",
-    "button",
-    "faced",
-    "$24,926,615",
-    "carla",
-    "brothel",
-    "2:34",
-    "outputs",
-    "metal-hydrido",
-    "knot",
-    "letitia",
-    "underdeveloped",
-    "165-unit",
-    "theses",
-    "truest",
-    "48,000",
-    "dag",
-    "uncharted",
-    "salty",
-    "deliberation",
-    "approximately",
-    "answers",
-    "frustrations",
-    "1,065",
-    "spittle",
-    "bubble",
-    "travelled",
-    "bedlam",
-    "fourth",
-    "23d",
-    "twenty-year",
-    "calvary",
-    "divining",
-    "activism",
-    "salami",
-    "$8",
-    "disabuse",
-    "18'.5",
-    "punted",
-    "confidence",
-    "shuddered",
-    "t'ai-shan",
-    "pursued",
-    "filde",
-    "command",
-    "ashikaga",
-    "advised",
-    "everlastingly",
-    "dale",
-    "envelopes",
-    "tubing",
-    "backbend",
-    "theoriticians",
-    "836-901",
-    "atreus",
-    "psyche",
-    "implication",
-    "prefabricated",
-    "immoral",
-    "titer",
-    "1898",
-    "navel",
-    "simpliciter",
-    "kerby",
-    "six-point",
-    "zipper",
-    "speak",
-    "greg",
-    "alleging",
-    "globe-democrat",
-    "streaked",
-    "potboiler",
-    "janis",
-    "marv",
-    "malocclusion",
-    "pushing",
-    "lounge",
-    "starr",
-    "adios-on",
-    "x",
-    "sanctified",
-    "1808-1895",
-    "restating",
-    "harvard's",
-    "sliced",
-    "lapse",
-    "five-column",
-    "business",
-    "laguerre",
-    "commands",
-    "apprehend",
-    "baneful",
-    "splendid",
-    "featherbed",
-    "rump",
-    "electrocardiograph",
-    "miglia",
-    "headquarters",
-    "leather",
-    "1893",
-    "builder/active",
-    "remainder",
-    "thumbing",
-    "lalauries",
-    "unlashed",
-    "reestablish",
-    "chicken",
-    "decorative",
-    "recurrence",
-    "couples",
-    "adriatic",
-    "$2.50",
-    "redefined",
-    "thruston",
-    "11-month-old",
-    "aspects",
-    "peculiar",
-    "registrant's",
-    "under-developed",
-    "tensionless",
-    "grotesques",
-    "editors",
-    "introducing",
-    "alvise",
-    "syria",
-    "friendly",
-    "graphically",
-    "imperiales",
-    "nehru's",
-    "fumed-oak",
-    "appeased",
-    "homesickness",
-    "bronze",
-    "enchant",
-    "extraction",
-    "weatherbeaten",
-    "subservience",
-    "oscillator",
-    "nominally",
-    "mitch",
-    "items",
-    "waggling",
-    "pooh-poohed",
-    "elated",
-    "bontempo",
-    "put",
-    "displeased",
-    "aristotle",
-    "disdains",
-    "believers",
-    "wilder's",
-    "meters",
-    "nameless",
-    "red-tile",
-    "phonology",
-    "deserve",
-    "sacrament",
-    "line-pairs",
-    "hope's",
-    "limply",
-    "reared",
-    "authoritatively",
-    "pregnancy",
-    "ambitiously",
-    "gallons",
-    "stomped",
-    "huntingtons",
-    "1858",
-    "teammate's",
-    "16-mesh",
-    "thornton",
-    "narrative",
-    "unpromising",
-    "wage-earning",
-    "purpling",
-    "sciences",
-    "phantasy",
-    "unfertilized",
-    "leaped",
-    "chartres",
-    "racing",
-    "devol",
-    "edison's",
-    "superposed",
-    "constant",
-    "4-homer",
-    "kretchmer",
-    "sarmi",
-    "electron-microscopical",
-    "arithmetized",
-    "wits",
-    "argue",
-    "incorruptibility",
-    "hamilton",
-    "referent",
-    "drink",
-    "bantu",
-    "dame",
-    "dark-gray",
-    "topcoats",
-    "orinoco",
-    "soothsayers",
-    "hostility",
-    "stratum",
-    "grossman",
-    "whichever-the-hell",
-    "aouelloul",
-    "mosquitoes",
-    "money-winner",
-    "region's",
-    "'way",
-    "bout-de-souffle",
-    "gracie's",
-    "withholding",
-    "knappertsbusch",
-    "frown",
-    "soloists",
-    "pursuer",
-    "popping",
-    "mobutu",
-    "gratified",
-    "imprinted",
-    "cut-down",
-    "incarcerated",
-    "october",
-    "well-kept",
-    "452",
-    "charnock",
-    "hawksworth",
-    "glass-bottom",
-    "competitive",
-    "unhurriedly",
-    "banging",
-    "cops",
-    "helped",
-    "forsan",
-    "bachelors",
-    "atmosphere",
-    "'bout",
-    "hammock",
-    "reveal",
-    "poignancy",
-    "buckets",
-    "juanita's",
-    "otter",
-    "matisse",
-    "describe",
-    "input/output",
-    "competitors",
-    "improper",
-    "private-eye",
-    "rubicund",
-    "discounted",
-    "converted",
-    "merrimack",
-    "modus",
-    "lift",
-    "sufficient",
-    "gaines",
-    "cleburne's",
-    "radial",
-    "shatter",
-    "$251",
-    "machinegun",
-    "carbines",
-    "diapers",
-    "redheader",
-    "hess",
-    "promised",
-    "innovation",
-    "undisguised",
-    "crisis-oriented",
-    "appraise",
-    "brushlike",
-    "journalese",
-    "homer",
-    "insanely",
-    "offending",
-    "accretion",
-    "growling",
-    "incipient",
-    "not",
-    "mumbled",
-    "mencius",
-    "tsar's",
-    "legitimized",
-    "unfenced",
-    "beetling",
-    "sectors",
-    "apostle",
-    "offing",
-    "week",
-    "non-contributory",
-    "heavers",
-    "perennian",
-    "consequence",
-    "east-west",
-    "fielders",
-    "retinal",
-    "motivations",
-    "bi",
-    "mercier",
-    "w.h.",
-    "intestines",
-    "tidal",
-    "deadliest",
-    "synchronized",
-    "brooke",
-    "steer",
-    "stubblefields",
-    "hide",
-    "pressure",
-    "phases",
-    "neutralized",
-    "affirming",
-    "painless",
-    "eight-week",
-    "isolde",
-    "outlying",
-    "charleston",
-    "visitations",
-    "doled",
-    "unfold",
-    "egghead",
-    "pre-penicillin",
-    "knead",
-    "14-2",
-    "subpoena",
-    "licking",
-    "camille",
-    "diagnosed",
-    "luminous",
-    "coltish",
-    "infinity",
-    "18-25",
-    "anglia",
-    "senior",
-    "creamer",
-    "gusher",
-    "checker",
-    "up-and-coming",
-    "unfriendly",
-    "accents",
-    "openly",
-    "hour-long",
-    "composites",
-    "empirical",
-    "zionism",
-    "minimizing",
-    "seventy-foot",
-    "nonmythological",
-    "antithyroid",
-    "novitiate",
-    "cps",
-    "corporations",
-    "justified",
-    "dust-swirling",
-    "ksan",
-    "lay-offs",
-    "brien",
-    "pails",
-    "origins",
-    "teams'",
-    "bow",
-    "stardel",
-    "oilheating",
-    "firms",
-    "dieux",
-    "butted",
-    "12-oz.",
-    "drugless",
-    "folk-lore",
-    "various",
-    "cascading",
-    "daylight",
-    "straw",
-    "chump",
-    "pocket",
-    "magnificence",
-    "residual",
-    "navigating",
-    "swank",
-    "ebony",
-    "non-poetry",
-    "weights",
-    "enquirer",
-    "substitutes",
-    "mainliner-highland",
-    "unfrozen",
-    "elegances",
-    "polaris",
-    "insoluble",
-    "1609",
-    "$2,323,867",
-    "shutdown",
-    "wooed",
-    "naturalistic",
-    "cosmetics",
-    "disapproved",
-    "c.c.n.y.",
-    "187.5",
-    "1793",
-    "dictate",
-    "op.",
-    "renville",
-    "recognizable",
-    "justine",
-    "pro-trujillo",
-    "cleared",
-    "telegrams",
-    "fun",
-    "bottoms",
-    "gloom",
-    "frosted",
-    "45-degrees",
-    "kyo-zan",
-    "pocket's",
-    "1840's",
-    "crashing",
-    "pillage",
-    "panyotis",
-    "aquinas",
-    "fathoms",
-    "competitively",
-    "fens",
-    "cinq",
-    "izaak's",
-    "colombia",
-    "publications",
-    "insipid",
-    "six-foot",
-    "archtype",
-    "orissa",
-    "distrust",
-    "ovens",
-    "chartist",
-    "esp",
-    "sacrificium",
-    "ingratitude",
-    "brochures",
-    "shouting",
-    "ownself",
-    "parenchyma",
-    "quilted",
-    "politics-ridden",
-    "theorizing",
-    "spurns",
-    "assiniboine",
-    "seriousness",
-    "short-range",
-    "six-shooter",
-    "pontificates",
-    "historiography",
-    "legendary",
-    "willamette",
-    "lint",
-    "overlook",
-    "cheekbone",
-    "murray",
-    "cocoa",
-    "auditions",
-    "uni-directional",
-    "bans",
-    "stratforde",
-    "adolescent",
-    "stubble",
-    "toneless",
-    "havana",
-    "soothingly",
-    "ultrasonic",
-    "we",
-    "resurgent",
-    "vehicles",
-    "mynheer",
-    "williamson's",
-    "oakland",
-    "identifiable",
-    "corresponds",
-    "harriet",
-    "ex-musician",
-    "broccoli",
-    "adversary",
-    "presumes",
-    "resiny",
-    "violated",
-    "loose",
-    "python",
-    "one-",
-    "packing",
-    "sharpen",
-    "isodine",
-    "taming",
-    "batteries",
-    "taui",
-    "deductions",
-    "vetoed",
-    "dionysus",
-    "15-17",
-    "abounding",
-    "threw",
-    "ruining",
-    "960-mc",
-    "teen-age",
-    "wragge",
-    "slow",
-    "terminating",
-    "brute",
-    "enthusiastic",
-    "arms",
-    "minter",
-    "distinctive",
-    "recollected",
-    "skiff",
-    "niepce",
-    "on",
-    "erdmann's",
-    "blandly",
-    "ripening",
-    "whitehaired",
-    "garine",
-    "superceded",
-    "chortled",
-    "like",
-    "seward",
-    "marks",
-    "unrealistic",
-    "goolick",
-    "stanford",
-    "prerogatives",
-    "motivate",
-    "raucous",
-    "affirmation",
-    "dreaded",
-    "streamer",
-    "unifil",
-    "unwisely",
-    "knowed",
-    "shivering",
-    "remember",
-    "stropping",
-    "erupts",
-    "gai",
-    "cavorting",
-    "kahler-craft",
-    "vice-president",
-    "forgetting",
-    "pens",
-    "monument",
-    "berto",
-    "two-color",
-    "loudest",
-    "slashed",
-    "jackass",
-    "brother's",
-    "red-necked",
-    "brash",
-    "treasurer",
-    "rabid",
-    "exaggerating",
-    "roofer's",
-    "wisman's",
-    "deigned",
-    "westport",
-    "epigenetic",
-    "16-hour",
-    "control",
-    "soul's",
-    "anti-discriminatory",
-    "precipitate",
-    "mucking",
-    "gallstone",
-    "decadent",
-    "florence",
-    "boulez",
-    "batted",
-    "den",
-    "normative",
-    "oneself",
-    "alibi",
-    "brain's",
-    "tricky",
-    "frenzied",
-    "norfolk",
-    "determinism",
-    "valmet",
-    "sonority",
-    "diety",
-    "2:33",
-    "hated",
-    "cuffs",
-    "sixty-two",
-    "design-conscious",
-    "intolerant",
-    "wind-swept",
-    "teter",
-    "strained",
-    "cinema",
-    "filling",
-    "trust",
-    "thermoformed",
-    "mien",
-    "dietrich",
-    "mono-iodotyrosine",
-    "dave's",
-    "irregularities",
-    "critic",
-    "abusive",
-    "suspiciously",
-    "gained",
-    "private-school",
-    "foiled",
-    "psychology",
-    "epitomize",
-    "geographers",
-    "algebraically",
-    "garbled",
-    "farrar",
-    "shrank",
-    "well-regulated",
-    "rode",
-    "d.j.",
-    "wyoming",
-    "corps",
-    "unknowns",
-    "apportion",
-    "flurry",
-    "bunters",
-    "indigo",
-    "off-farm",
-    "polio",
-    "jealousy",
-    "earthy",
-    "masterly",
-    "mailer",
-    "recounts",
-    "musician's",
-    "1231",
-    "seattle",
-    "disliking",
-    "rebutted",
-    "full-sized",
-    "hapgood",
-    "campground",
-    "parasites",
-    "brelin",
-    "francis",
-    "phone",
-    "landlord",
-    "wander",
-    "high-legged",
-    "sigue",
-    "vaguest",
-    "confidentially",
-    "alcorn",
-    "rattlesnake",
-    "forgiving",
-    "brindisi",
-    "offered",
-    "ketches",
-    "warmth",
-    "hartsfield",
-    "incontestable",
-    "bouffe",
-    "clumsy",
-    "vocal",
-    "spoon",
-    "compares",
-    "boxy",
-    "helping",
-    "juste",
-    "anticipating",
-    "1926",
-    "dow-jones",
-    "imitate",
-    "pecorone",
-    "endures",
-    "biscayne",
-    "yielded",
-    "ties",
-    "swans",
-    "smack",
-    "budweisers",
-    "gran'dad",
-    "gimme",
-    "fink's",
-    "problem-solving",
-    "overvaulting",
-    "kirov's",
-    "completions",
-    "syntactic",
-    "bolingbroke",
-    "shied",
-    "quarts",
-    "improbably",
-    "supermarket",
-    "cafe",
-    "bout",
-    "pockets",
-    "rembrandt's",
-    "fille",
-    "bardell",
-    "rotary",
-    "narragansett",
-    "nawth",
-    "deliverance",
-    "jaross",
-    "falsify",
-    "869",
-    "organization's",
-    "ordinances",
-    "metis",
-    "opening",
-    "sant'",
-    "ma'am",
-    "filets",
-    "gazinosu",
-    "graining",
-    "momentary",
-    "metrically",
-    "heap",
-    "beatie",
-    "7-5",
-    "chlorpromazine",
-    "satirical",
-    "conant's",
-    "operated",
-    "unrecognizable",
-    "armata",
-    "prosecutions",
-    "holy",
-    "referendum",
-    "beyond",
-    "foreami",
-    "tediously",
-    "allow",
-    "ballgowns",
-    "gullible",
-    "court's",
-    "finished",
-    "tethers",
-    "two-story",
-    "veeck's",
-    "calluses",
-    "bystrzyca",
-    "precious",
-    "cigarette",
-    "tamp",
-    "strategic",
-    "apparition",
-    "fringed-wrapped",
-    "paramagnetic",
-    "road-shy",
-    "citrated",
-    "landscape",
-    "sleeper",
-    "objective",
-    "quyney",
-    "esthetic",
-    "racy",
-    "metropolitian",
-    "justifiably",
-    "olympics",
-    "bystander",
-    "potentially",
-    "stacks",
-    "physiological",
-    "them",
-    "field-flattening",
-    "brooklyn's",
-    "scalded",
-    "blatz's",
-    "adulthood",
-    "qua",
-    "vikulov",
-    "accent",
-    "round-bottom",
-    "abernathys",
-    "slow-scrambling",
-    "notable",
-    "league's",
-    "lappets",
-    "businessmen",
-    "cambodia's",
-    "heavy-coated",
-    "sweathruna",
-    "despoiling",
-    "half-closed",
-    "typography",
-    "inquisition",
-    "p(t)",
-    "seashore",
-    "melting",
-    "every-day",
-    "bombardment",
-    "racers",
-    "reckon",
-    "one-night",
-    "state's",
-    "grasp",
-    "plowing",
-    "giveaways",
-    "purring",
-    "eggshell",
-    "alkylbenzenesulfonates",
-    "ascertainable",
-    "emanated",
-    "lecture",
-    "scans",
-    "evensen",
-    "astounding",
-    "pebbles",
-    "non-god",
-    "cominform",
-    "masque",
-    "martyrdom",
-    "prostitution",
-    "loesser",
-    "educate",
-    "turtle-neck",
-    "dauntless",
-    "atrophic",
-    "honotassa",
-    "voyageurs",
-    "foreboding",
-    "tapestries",
-    "w-2",
-    "court-length",
-    "cyclohexanol",
-    "forts",
-    "globulin",
-    "kromy",
-    "gibbon",
-    "perfect",
-    "nutrients",
-    "tech",
-    "annoys",
-    "revived",
-    "tenors",
-    "librarians",
-    "whoosh",
-    "stroke",
-    "shell",
-    "paradigmatic",
-    "cradled",
-    "neutralization",
-    "environs",
-    "solicitous",
-    "lacked",
-    "traitorous",
-    "intrepid",
-    "shuld",
-    "overflowed",
-    "practiced",
-    "personages",
-    "watson-watt",
-    "clothesline",
-    "recopied",
-    "adored",
-    "pascal",
-    "getting",
-    "tortures",
-    "lawless",
-    "lightning-occurrence",
-    "toppings",
-    "**b",
-    "also",
-    "lsu",
-    "myopic",
-    "mid-shimmy",
-    "twinkling",
-    "kelts",
-    "torpedoes",
-    "climes",
-    "flare",
-    "gunner",
-    "enlightening",
-    "roman-camp",
-    "tits",
-    "formulas",
-    "jotting",
-    "klein",
-    "bordner",
-    "crushed",
-    "nareb",
-    "musee",
-    "wispy",
-    "humanity",
-    "jilted",
-    "contemptuously",
-    "newman",
-    "skolovsky's",
-    "lore",
-    "graves'",
-    "eager",
-    "photoelectrons",
-    "hangs",
-    "non-christians",
-    "ky.",
-    "classroom",
-    "trustees",
-    "yearned",
-    "latitude",
-    "premarital",
-    "slap",
-    "gordin",
-    "censorship",
-    "placeless",
-    "prosceniums",
-    "ex-liberals",
-    "sussex",
-    "nashville",
-    "washington-oregon",
-    "ablard",
-    "introduced",
-    "sponges",
-    "badly",
-    "lobo",
-    "authors",
-    "passively",
-    "cognac",
-    "concentrations",
-    "loads",
-    "mantegna",
-    "listings",
-    "poseur",
-    "belief",
-    "kernels",
-    "materially",
-    "evangelical",
-    "buttoned",
-    "fractionation",
-    "weeklies",
-    "exponents",
-    "moderns",
-    "ann",
-    "jazz",
-    "circling",
-    "grads",
-    "controlled",
-    "shade",
-    "patriots",
-    "term-end",
-    "twisting",
-    "affectionately",
-    "tough",
-    "407",
-    "innovate",
-    "fool",
-    "mahua",
-    "modigliani",
-    "baying",
-    "discussant",
-    "incursion",
-    "companions",
-    "eschewing",
-    "automobile",
-    "abaringe",
-    "bodenheim",
-    "culvers",
-    "opens",
-    "rickey's",
-    "recovering",
-    "connoisseurs",
-    "sulzberger",
-    "alveoli",
-    "contract",
-    "thirsted",
-    "flush",
-    "unam",
-    "34",
-    "homemade",
-    "leyden",
-    "parker",
-    "flautist's",
-    "pot",
-    "rutabaga",
-    "labyrinth",
-    "fight",
-    "condiments",
-    "murder",
-    "montrachet",
-    "offal",
-    "botanical",
-    "abbas",
-    "marking",
-    "basketball",
-    "unfurled",
-    "confines",
-    "kinesthetically",
-    "naturalized",
-    "gullibility",
-    "$2,500",
-    "waterproofing",
-    "institutional",
-    "headstand",
-    "merited",
-    "rational",
-    "mercer",
-    "snowing",
-    "obeying",
-    "consigned",
-    "venable",
-    "magnifying",
-    "reams",
-    "mcelvaney",
-    "curator",
-    "savior",
-    "sailor",
-    "reclassification",
-    "gainesville",
-    "cycled",
-    "in-groups",
-    "nihilistic",
-    "tangled",
-    "wiring",
-    "unexamined",
-    "verse",
-    "blurry",
-    "electriques",
-    "drafters",
-    "impasse",
-    "flag-stick",
-    "two-timed",
-    "olivet",
-    "what're",
-    "aloof",
-    "untimely",
-    "8,500",
-    "cauffman",
-    "ffortescue",
-    "kolkhoz",
-    "cinder",
-    "soap",
-    "kindly",
-    "triphenylphosphine",
-    "procured",
-    "activating",
-    "wracked",
-    "meadows",
-    "amphitheater",
-    "intrusions",
-    "quasi-governmental",
-    "warwickshire",
-    "fulfilling",
-    "haze",
-    "19",
-    "raphaels",
-    "motivation",
-    "minimally",
-    "evidently",
-    "avocado",
-    "pre-drilled",
-    "gouged",
-    "thea",
-    "deplore",
-    "selfishness",
-    "finney's",
-    "highlights",
-    "grovelike",
-    "lubrication",
-    "erie",
-    "fracases",
-    "takings",
-    "egyptian",
-    "comedie",
-    "mantic",
-    "nationhood",
-    "fisher",
-    "loyalist",
-    "bebop",
-    "9,910,741",
-    "camusfearna",
-    "tubules",
-    "addiction",
-    "commission's",
-    "fast-moving",
-    "thwack",
-    "cook's",
-    "caldwell",
-    "rimanelli",
-    "blastdown",
-    "charitable",
-    "confabulated",
-    "surmises",
-    "hemus",
-    "modestly",
-    "spenders",
-    "faculties",
-    "barons",
-    "saliva",
-    "permanent",
-    "aligned",
-    "favour",
-    "homebuilders",
-    "adaptations",
-    "leaping",
-    "hard",
-    "dream-miss",
-    "statutory",
-    "winding-clothes",
-    "spacious",
-    "purposes",
-    "el",
-    "biosynthesized",
-    "unstained",
-    "beadle",
-    "155",
-    "tigress",
-    "interviewed",
-    "inconsistent",
-    "confiscated",
-    "$300",
-    "corticotropin",
-    "125th",
-    "autonavigator",
-    "gadget",
-    "lies",
-    "lives",
-    "brotherhood",
-    "earliest",
-    "practically",
-    "u.",
-    "100-200",
-    "dystopias",
-    "disbelief",
-    "moneymaking",
-    "greedy",
-    "prevent",
-    "255",
-    "centrist",
-    "sidled",
-    "packaging",
-    "whirling",
-    "joshua",
-    "shayne",
-    "wynston",
-    "islands'",
-    "responsiveness",
-    "movement",
-    "ira",
-    "attend",
-    "harry's",
-    "pressure-formed",
-    "kika",
-    "subtle",
-    "innocence",
-    "correspondingly",
-    "elaine's",
-    "sprue",
-    "allergy",
-    "epic",
-    "revisionist",
-    "dumped",
-    "lovelace",
-    "saltbush",
-    "demi-monde",
-    "mvp",
-    "edwin",
-    "outcry",
-    "knocks",
-    "sanger-harris",
-    "styrene's",
-    "disarmed",
-    "underneath",
-    "3:30",
-    "desirability",
-    "swinging",
-    "dawns",
-    "reconciling",
-    "dune",
-    "restaurateur",
-    "essential",
-    "allocation",
-    "rank",
-    "imagine",
-    "5-3/4''",
-    "usurped",
-    "vaccination",
-    "shaded",
-    "fund",
-    "blistered",
-    "riegger",
-    "depletion",
-    "stationery",
-    "uranium",
-    "merchandising",
-    "minimal",
-    "creditors",
-    "leaderless",
-    "maneuverability",
-    "expands",
-    "awe-inspiring",
-    "sweetness",
-    "fiske",
-    "orphaned",
-    "mussels",
-    "secretaries",
-    "sonorities",
-    "stetsons",
-    "probabilities",
-    "localized",
-    "margaretville",
-    "app",
-    "chantilly",
-    "doers",
-    "comfortable",
-    "slash-b",
-    "daydreamed",
-    "outsized",
-    "sumner",
-    "ribs",
-    "decking",
-    "wage",
-    "avaricious",
-    "student's",
-    "butte",
-    "belligerent",
-    "circular",
-    "stanza-form",
-    "nmr",
-    "fiori",
-    "headstones",
-    "790",
-    "vaulting",
-    "gerby",
-    "slimmer",
-    "light-mindedness",
-    "numerals",
-    "established",
-    "65",
-    "top",
-    "gambit",
-    "1608",
-    "cartoons",
-    "funeral-accessories",
-    "tom",
-    "shivered",
-    "low-calorie",
-    "langhorne",
-    "oats",
-    "campaigners",
-    "sea's",
-    "piazzo",
-    "descending",
-    "on-sure",
-    "visibly",
-    "mine-safety",
-    "deposited",
-    "1593",
-    "sardines",
-    "weede",
-    "temperatures",
-    "airline",
-    "heaving",
-    "cowering",
-    "abandonment",
-    "artists",
-    "jeroboams",
-    "occurs",
-    "begging",
-    "liberace",
-    "machines",
-    "sobbing",
-    "tillie's",
-    "nipe's",
-    "civilized",
-    "adjusted",
-    "austere",
-    "classificatory",
-    "self's",
-    "untidiness",
-    "riven",
-    "gillespie",
-    "salvador",
-    "75%",
-    "efficacy",
-    "long-vanished",
-    "self-conceited",
-    "taliesin",
-    "espanol",
-    "erdos",
-    "nonresidential",
-    "demarcated",
-    "trouble-shooter",
-    "eclipsed",
-    "self-respect",
-    "trolls",
-    "ye",
-    "cognizant",
-    "bodleian",
-    "ordered",
-    "aug.",
-    "swingy",
-    "flashed",
-    "boisbriant",
-    "recover",
-    "rancho",
-    "topcoat",
-    "inconclusive",
-    "abe",
-    "garage",
-    "poirot",
-    "merge",
-    "hindoo",
-    "enigma",
-    "spewing",
-    "moliere's",
-    "broeg",
-    "moans",
-    "receding",
-    "transposed",
-    "pig-drunk",
-    "scratchy",
-    "racket",
-    "slamming",
-    "economists",
-    "reverie",
-    "20",
-    "proportionately",
-    "self-reliant",
-    "ana",
-    "talk-aboutiveness",
-    "franck",
-    "cris",
-    "olivetti",
-    "rolls",
-    "mossberg's",
-    "whitcomb",
-    "image-provoking",
-    "inquisitor-general",
-    "by-passes",
-    "roast",
-    "stayed",
-    "indisposed",
-    "barton",
-    "daubed",
-    "archdiocese",
-    "triptych",
-    "ordnance",
-    "impractical",
-    "haskins",
-    "presentation",
-    "bridget's",
-    "petrie",
-    "unimpressed",
-    "creator",
-    "elapses",
-    "self-restraint",
-    "recruits",
-    "seebohm's",
-    "$0.9",
-    "erythroid",
-    "condemn",
-    "swarmed",
-    "waldo",
-    "bluff",
-    "10:30",
-    "reeves-type",
-    "satires",
-    "confronting",
-    "equivocal",
-    "unmoved",
-    "$18.9",
-    "proscription",
-    "lash",
-    "financing",
-    "familiarity",
-    "batting",
-    "child's",
-    "race",
-    "indentations",
-    "tomonggong",
-    "reins",
-    "three-dimensionality",
-    "pirates",
-    "antiquated",
-    "cultivated",
-    "prosecute",
-    "latitudes",
-    "grocer's",
-    "musique",
-    "premature",
-    "informally",
-    "thine",
-    "well-defined",
-    "jimmie",
-    "handlebars",
-    "mice",
-    "chilblains",
-    "sharkey",
-    "unwanted",
-    "rosebush",
-    "fostering",
-    "unsupportable",
-    "inns",
-    "generates",
-    "motherly",
-    "dialing",
-    "passing",
-    "purple-black",
-    "bianco",
-    "gonna",
-    "infinitive",
-    "coloring",
-    "sucess",
-    "lilian",
-    "functionalism",
-    "miniscule",
-    "wrapper",
-    "crew's",
-    "persuaded",
-    "streamlined",
-    "sculptor",
-    "existed",
-    "conformance",
-    "three-night",
-    "capitalists",
-    "declaring",
-    "genre",
-    "2:24",
-    "field's",
-    "orlando",
-    "skin",
-    "ifni",
-    "mended",
-    "outward",
-    "hp.",
-    "cabinets",
-    "electress",
-    "solicitor",
-    "miantonomi",
-    "pastry",
-    "photochemical",
-    "daintily",
-    "llewellyn",
-    "328",
-    "soaking",
-    "shenandoah",
-    "agreeably",
-    "kali",
-    "barnett",
-    "poultice",
-    "termed",
-    "culture's",
-    "crown",
-    "gaited",
-    "footstep",
-    "seas",
-    "to-do",
-    "audrey",
-    "removing",
-    "gompachi",
-    "agoeng",
-    "colchicum",
-    "down-and-out",
-    "banquetings",
-    "side-arm",
-    "engineers'",
-    "groan",
-    "hartweger",
-    "odilo",
-    "babin-festival",
-    "designs",
-    "crude",
-    "cafes",
-    "side-looking",
-    "philippoff",
-    "softens",
-    "glycerolized",
-    "wager",
-    "gratuitously",
-    "$7.20",
-    "tumultuous",
-    "workbench",
-    "prefaced",
-    "sourdough",
-    "venom",
-    "argued",
-    "center's",
-    "portwatchers",
-    "strophe",
-    "life-long",
-    "unsmilingly",
-    "grasped",
-    "dope",
-    "lyking",
-    "one-minute",
-    "indoctrinating",
-    "rheumatism",
-    "barrier",
-    "followed",
-    "forborne",
-    "danes",
-    "overplayed",
-    "cm",
-    "seductive",
-    "lighters",
-    "gustav",
-    "spoiling",
-    "85",
-    "bought",
-    "britisher",
-    "clyfford",
-    "devoured",
-    "propagandist",
-    "bridesmaids",
-    "1/2-inch",
-    "halts",
-    "dumb",
-    "gulled",
-    "craggy",
-    "non-literary",
-    "scraped",
-    "winked",
-    "yorker",
-    "adame",
-    "1.24",
-    "hate",
-    "n.c.",
-    "wherefores",
-    "self-consciously",
-    "beliefs",
-    "asher",
-    "auburn",
-    "sensuous",
-    "confrontation",
-    "bullying",
-    "traversed",
-    "pecans",
-    "navigable",
-    "peptidases",
-    "reappraisal",
-    "coccidiosis",
-    "unsteady",
-    "egalitarianism",
-    "dostoevsky's",
-    "leather-bound",
-    "goethe",
-    "thank",
-    "skylights",
-    "executing",
-    "bienville",
-    "scraping",
-    "galophone-kimberly",
-    "congressional",
-    "favors",
-    "honshu",
-    "philology",
-    "cunningham",
-    "pellegrini",
-    "cairns",
-    "mityukh",
-    "dogtown",
-    "faces",
-    "vertical-takeoff-and-landing",
-    "aldermen",
-    "alva",
-    "balloons",
-    "quasi-mechanistic",
-    "gantlet",
-    "cries",
-    "administratively",
-    "1747",
-    "discrimination",
-    "divine's",
-    "donates",
-    "endowed",
-    "trader",
-    "chutney",
-    "communize",
-    "persecuted",
-    "fortifications",
-    "cellular",
-    "z",
-    "explain",
-    "sham",
-    "leesona's",
-    "iceland",
-    "56-yard",
-    "socket",
-    "bolo",
-    "develops",
-    "directionality",
-    "$94",
-    "watson",
-    "huff's",
-    "congdon",
-    "largely-silent",
-    "polytechnic",
-    "bleacher-type",
-    "rest",
-    "weems's",
-    "pops's",
-    "carcass",
-    "shanty",
-    "$139.3",
-    "assemblies",
-    "awaiting",
-    "octavia",
-    "confusing",
-    "efficacious",
-    "spires",
-    "line-drying",
-    "wao",
-    "cassite",
-    "darkened",
-    "rein",
-    "sweater",
-    "lown",
-    "municipally-sponsored",
-    "unpaved",
-    "zombies",
-    "dealt",
-    "podger",
-    "orgies",
-    "joyful",
-    "craddock",
-    "harpers",
-    "outgrip",
-    "celia",
-    "decomposes",
-    "dam'",
-    "alla",
-    "confessional",
-    "coleridge",
-    "locality",
-    "decimal",
-    "patient's",
-    "mimetically",
-    "re-activate",
-    "a-coming",
-    "tackle",
-    "symphonies",
-    "war-time",
-    "invaluable",
-    "audiences",
-    "deferents",
-    "beneficiaries",
-    "over",
-    "tipperary",
-    "inter-relation",
-    "clean",
-    "flowed",
-    "ivy",
-    "loincloth",
-    "virtuous",
-    "shipyards",
-    "co-ordinating",
-    "tualatin",
-    "magazines",
-    "5-7",
-    "variously",
-    "applause-happy",
-    "alleghenies",
-    "ranch",
-    "bodice",
-    "transgression",
-    "pfau",
-    "shortened",
-    "napped",
-    "only",
-    "artemis",
-    "territory",
-    "grounder",
-    "hitched",
-    "overwhelmed",
-    "marquees",
-    "jinny",
-    "1941",
-    "follicular",
-    "liberally",
-    "times'",
-    "grownups",
-    "crystallizing",
-    "crazy",
-    "fingering",
-    "reserving",
-    "buildin'",
-    "gag",
-    "disparagement",
-    "appear",
-    "taunted",
-    "descends",
-    "rebuild",
-    "outstandingly",
-    "cascaded",
-    "over-achievers",
-    "troup",
-    "coefficient",
-    "pronouncement",
-    "tommy's",
-    "expressible",
-    "refrigerator",
-    "dudley",
-    "thereunder",
-    "pantasaph",
-    "contended",
-    "palms",
-    "chaperone",
-    "17-1/2-inch",
-    "contouring",
-    "anarchy",
-    "coast-to-coast",
-    "hull",
-    "discorporated",
-    "sells",
-    "ludmilla",
-    "cavallinis",
-    "obligation",
-    "relieve",
-    "casework",
-    "independently",
-    "neuron",
-    "pinholes",
-    "socioeconomic",
-    "7599",
-    "mentions",
-    "remarque's",
-    "double-valued",
-    "exposure-time",
-    "228",
-    "clefts",
-    "byrd",
-    "fantastically",
-    "were",
-    "tasti-freeze",
-    "cant",
-    "irv",
-    "smokehouse",
-    "malfeasant",
-    "palisades",
-    "year-earlier",
-    "kaufnabb",
-    "cultivation",
-    "chillier",
-    "buxtehude",
-    "scotty's",
-    "blowing",
-    "suburbanized",
-    "attuned",
-    "ex-fighter",
-    "veered",
-    "artful",
-    "high-priced",
-    "lippman",
-    "enquired",
-    "sensational",
-    "demonstratives",
-    "disapproves",
-    "boss",
-    "pinafores",
-    "impair",
-    "flee",
-    "scrupulosity",
-    "publishing",
-    "assistance",
-    "anne's",
-    "schapiro",
-    "revolted",
-    "knelt",
-    "railbirds",
-    "milwaukee",
-    "ballistics",
-    "clown",
-    "ten-day",
-    "bailly",
-    "taylors",
-    "dishearten",
-    "bridget",
-    "inaccurate",
-    "assigns",
-    "maitre",
-    "desmond",
-    "blouses",
-    "nullify",
-    "ado",
-    "mediating",
-    "inductees",
-    "burrs",
-    "germane",
-    "ben's",
-    "lesser-known",
-    "neanderthal",
-    "belasco",
-    "bright-green",
-    "jacchia",
-    "montmorillonites",
-    "closely",
-    "contracted",
-    "ashen",
-    "nymphomaniac",
-    "unreconstructed",
-    "toccata",
-    "vice-chancellor",
-    "role-experimentation",
-    "gesturing",
-    "graph",
-    "okla.",
-    "details",
-    "mecca",
-    "tech's",
-    "leathered",
-    "diam",
-    "splendor",
-    "talons",
-    "esthetics",
-    "quatrain",
-    "bard",
-    "sowered",
-    "langer",
-    "silica-glass",
-    "jure",
-    "yalies",
-    "presumed",
-    "commiserate",
-    "idols'",
-    "semi-minor",
-    "adversely",
-    "ejaculated",
-    "rolled",
-    "bilharziasis",
-    "117",
-    "filament",
-    "thundered",
-    "addressed",
-    "pageants",
-    "flame",
-    "college",
-    "repaired",
-    "dais",
-    "disheartening",
-    "omit",
-    "swarm",
-    "modify",
-    "merely",
-    "excelsin",
-    "sandy",
-    "compliments",
-    "garrisoned",
-    "nozzle",
-    "dancelike",
-    "harboring",
-    "book-review",
-    "aniseikonic",
-    "defining",
-    "missionary",
-    "veterinarian",
-    "12.8",
-    "absorber",
-    "theatergoer",
-    "busted",
-    "politic",
-    "towel",
-    "silhouettes",
-    "career",
-    "kalmuk",
-    "inferno",
-    "vendome",
-    "systemization",
-    "grenades",
-    "volatile",
-    "apologist",
-    "underpins",
-    "son-of-a-bitch",
-    "legislate",
-    "beggary",
-    "explaining",
-    "drew",
-    "u.s.c.",
-    "face-saving",
-    "astonished",
-    "sorghum",
-    "dine",
-    "submission",
-    "debilitated",
-    "showmen",
-    "depot",
-    "icbm's",
-    "outfit",
-    "toes",
-    "johns-manville",
-    "units",
-    "additionally",
-    "shantz",
-    "soil-bearing",
-    "guts",
-    "yen",
-    "laborers",
-    "fausto",
-    "salter's",
-    "glued",
-    "valedictorian",
-    "calmer",
-    "success-oriented",
-    "individuation",
-    "1874",
-    "costaggini's",
-    "sailed",
-    "creek-filled",
-    "veteran",
-    "sojourn",
-    "vadstena",
-    "colour-prints",
-    "elena",
-    "penciled",
-    "mythologies",
-    "self-victimized",
-    "antoine's",
-    "druid",
-    "first-born",
-    "rosebuds",
-    "roving",
-    "gymnasts",
-    "des",
-    "c'un",
-    "refined",
-    "servings",
-    "keerist",
-    "relinquish",
-    "instantaneous",
-    "clothbound",
-    "24''",
-    "mushrooming",
-    "quickly",
-    "prognosticator",
-    "sinan",
-    "recalling",
-    "quasi-performer",
-    "sphinx",
-    "self-evident",
-    "vallfart",
-    "patrice",
-    "poured",
-    "footpath",
-    "anti",
-    "turf",
-    "besetting",
-    "profane",
-    "slow-firing",
-    "patristic",
-    "posture",
-    "walcott",
-    "sketches",
-    "earsplitting",
-    "second-",
-    "federal-right",
-    "d'arlay",
-    "norma",
-    "tablet",
-    "adams",
-    "return",
-    "thong",
-    "resentful",
-    "broken-down",
-    "army's",
-    "korra",
-    "georgia-pacific",
-    "stalins",
-    "pacify",
-    "irreconcilable",
-    "asymptotic",
-    "voluntarily",
-    "comprising",
-    "extemporize",
-    "commemorated",
-    "flat-bed",
-    "trading",
-    "churchyard",
-    "knights",
-    "ellen",
-    "monkish",
-    "oven",
-    "they're",
-    "jen",
-    "lute",
-    "cryostat",
-    "futhermore",
-    "menacing",
-    "rob's",
-    "1938-1939",
-    "preoccupation",
-    "islands",
-    "officeholders",
-    "pelting",
-    "clark's",
-    "704",
-    "command's",
-    "ligament",
-    "walter's",
-    "chambermaids",
-    "bordel",
-    "aec",
-    "accustomed",
-    "fujimoto",
-    "heavy-armed",
-    "transmitting",
-    "three-front",
-    "inferred",
-    "lurid",
-    "riddling",
-    "southey",
-    "tags",
-    "answering",
-    "iocs",
-    "theatricals",
-    "gothicism",
-    "ghoreyeb",
-    "hand-holding",
-    "dots",
-    "management's",
-    "read's",
-    "proto-senility",
-    "arte",
-    "solo",
-    "delegate",
-    "frantic",
-    "spy",
-    "newel",
-    "neal",
-    "flicked",
-    "mathematically",
-    "viale",
-    "tidelands",
-    "boliou",
-    "suffer",
-    "dives",
-    "provincialism",
-    "rapists",
-    "lewis'",
-    "gentians",
-    "konrad",
-    "envious",
-    "disappearance",
-    "incompleteness",
-    "easthampton",
-    "gadgetry",
-    "corrupt",
-    "duel",
-    "furnish",
-    "derives",
-    "r-stage",
-    "unimpaired",
-    "rulings",
-    "spur",
-    "utterly",
-    "biceps",
-    "self-righteousness",
-    "doaty",
-    "revert",
-    "nassau",
-    "crates",
-    "indexing",
-    "catechism",
-    "specifying",
-    "compels",
-    "eastern",
-    "loped",
-    "bonhoffer",
-    "workingmen",
-    "florist's",
-    "incorporate",
-    "bide",
-    "campitelli",
-    "rattler",
-    "restraining",
-    "emitted",
-    "greenland",
-    "coincided",
-    "uncounted",
-    "enormity",
-    "advertisers",
-    "reconvenes",
-    "nimbly",
-    "gomez",
-    "semi-precious",
-    "kissing",
-    "potter",
-    "harrison's",
-    "three-masted",
-    "participant",
-    "sleek",
-    "checkbook",
-    "prosodic",
-    "scoop",
-    "rayburn",
-    "clapping",
-    "eyeteeth",
-    "contested",
-    "planner",
-    "five-and-twenty",
-    "designer",
-    "shallow",
-    "yachts",
-    "oops",
-    "everyone",
-    "grades",
-    "mandate",
-    "nationally",
-    "sturgeon",
-    "perelman",
-    "chapter",
-    "sexy",
-    "correction",
-    "bittersweet",
-    "stepmother",
-    "chuffing",
-    "tolerable",
-    "meld",
-    "saloonkeeper",
-    "allison",
-    "occurred",
-    "legs",
-    "cosmos",
-    "unsafe",
-    "jabs",
-    "replete",
-    "cliff",
-    "fox-terrier",
-    "joseph",
-    "fault",
-    "iodothyronines",
-    "boeing",
-    "overheard",
-    "hansom",
-    "round-the-clock",
-    "perverted",
-    "jaggers'",
-    "jabberings",
-    "calamitous",
-    "sir",
-    "gunpowder",
-    "overture",
-    "porto",
-    "rallies",
-    "1,107",
-    "nighted",
-    "benington",
-    "eyelashes",
-    "1885",
-    "mardi",
-    "slighter",
-    "amazons",
-    "brush-off",
-    "snap-in",
-    "crashes",
-    "crevice",
-    "chromium-plated",
-    "46,000",
-    "rummel",
-    "availing",
-    "hoc",
-    "refilled",
-    "disbelieves",
-    "berger",
-    "majesty's",
-    "$1,600",
-    "burns",
-    "john'll",
-    "cheerful",
-    "venusians",
-    "conforms",
-    "non-residents",
-    "drifting",
-    "toch",
-    "swells",
-    "fiend",
-    "sladang",
-    "gresham",
-    "wiping",
-    "whereof",
-    "proceeds",
-    "borax",
-    "betrayal",
-    "intima",
-    "606",
-    "broadest",
-    "fifty",
-    "forerunners",
-    "greece's",
-    "heaters",
-    "?",
-    "peale's",
-    "your",
-    "light",
-    "colonnade",
-    "steaming",
-    "hyde",
-    "okamoto",
-    "intentionally",
-    "hersey",
-    "sopsaisana",
-    "paired",
-    "410",
-    "resuspension",
-    "status-roles",
-    "devisee",
-    "mattathias",
-    "energizes",
-    "spurring",
-    "apologized",
-    "patrolman",
-    "duyvil",
-    "affirmations",
-    "taoists",
-    "willow",
-    "motionless",
-    "saxon",
-    "serratus",
-    "natrona",
-    "god-forsaken",
-    "magnums",
-    "playground",
-    "seurat",
-    "rock-strewn",
-    "bernardo",
-    "hauling",
-    "cartridge",
-    "jackman",
-    "charts",
-    "treatment",
-    "turbine",
-    "hammerless",
-    "dry-eyed",
-    "sainthood",
-    "heirs",
-    "deepest",
-    "sylvania",
-    "exercises",
-    "parliament",
-    "depressants",
-    "$40,000,000",
-    "thieves",
-    "lent",
-    "$325",
-    "harnick",
-    "dereliction",
-    "vindicated",
-    "ordinarily",
-    "highlighting",
-    "excursion",
-    "publicizing",
-    "timidly",
-    "expiation",
-    "vainly",
-    "farina",
-    "flying-mount",
-    "perceives",
-    "unwelcome",
-    "imports",
-    "sangiovanni",
-    "chrome",
-    "herb",
-    "spectator-type",
-    "repairing",
-    "dynamic",
-    "nelson",
-    "long-settled",
-    "american's",
-    "full",
-    "geysers",
-    "tracked",
-    "alexander",
-    "n.a.",
-    "chartroom",
-    "devout",
-    "subpoenas",
-    "curiously",
-    "turnouts",
-    "neil",
-    "pounds'",
-    "coil",
-    "monaural",
-    "self-betrayal",
-    "ulcerations",
-    "valuation",
-    "focally",
-    "imparted",
-    "firemen",
-    "moorish",
-    "methodist",
-    "negro's",
-    "beckoning",
-    "future",
-    "sensation",
-    "dived",
-    "ld056",
-    "programmer",
-    "yelping",
-    "gold-wire",
-    "apologia",
-    "withes",
-    "synthesize",
-    "middle-gaelic",
-    "far-flung",
-    "butcher",
-    "oversoftness",
-    "pending",
-    "compounded",
-    "jim's",
-    "$200",
-    "peer",
-    "horizons",
-    "frictional",
-    "romulo",
-    "stepwise",
-    "lemma",
-    "heathen",
-    "alfred",
-    "spot-news",
-    "1890s",
-    "thyroids",
-    "trundling",
-    "versa",
-    "tomatoes",
-    "w.r.",
-    "officers'",
-    "job",
-    "camp-made",
-    "masquerading",
-    "contacted",
-    "focusing",
-    "fortune-happy",
-    "gently",
-    "paragraph",
-    "forcing",
-    "fragments",
-    "basket",
-    "whyn't",
-    "fixations",
-    "s.p.c.a.",
-    "housework",
-    "newark",
-    "savagery",
-    "disorderliness",
-    "drum",
-    "allowing",
-    "oysters",
-    "lamechian",
-    "indwelling",
-    "evangelist",
-    "burma",
-    "domination",
-    "strauss",
-    "development",
-    "soared",
-    "marlowe",
-    "amazed",
-    "speckled",
-    "lerner",
-    "professeur",
-    "shopping",
-    "mentioned",
-    "rawhide",
-    "little-known",
-    "cumulus",
-    "trackdown",
-    "borak",
-    "boites",
-    "$1.1",
-    "crabs",
-    "anne",
-    "electoral",
-    "bang-jensen",
-    "facetiously",
-    "formidable",
-    "housed",
-    "twice",
-    "screwed",
-    "instinctual",
-    "billet",
-    "rhinotracheitis",
-    "piraeus",
-    "rob",
-    "tribunal",
-    "audited",
-    "wonderful",
-    "tri-motor",
-    "windowpanes",
-    "personally",
-    "andrena",
-    "amaze",
-    "engine's",
-    "enrique",
-    "cristo",
-    "heart's",
-    "stuart-family",
-    "malaise",
-    "supra-expressionism",
-    "relives",
-    "corroborating",
-    "rundfunkchor",
-    "uncharged",
-    "dulcet",
-    "prolonging",
-    "1,509",
-    "hanover-misty",
-    "circuit",
-    "discouraged",
-    "tyrannis",
-    "bovines",
-    "blueberry",
-    "donnybrook",
-    "armory",
-    "fourth-hand",
-    "con",
-    "single-foot",
-    "travelogue-like",
-    "culminates",
-    "variation",
-    "boal",
-    "anarchist",
-    "displaced",
-    "contingencies",
-    "veer",
-    "menuhin-amadeus",
-    "portland's",
-    "gibault",
-    "motel-keepers",
-    "commodities",
-    "mile",
-    "1908",
-    "cabaret",
-    "blondes",
-    "millivoltmeter",
-    "imcomplete",
-    "shrewish",
-    "greatest",
-    "de-iodinated",
-    "giacometti",
-    "dallas",
-    "goods",
-    "kililngsworth",
-    "ventilated",
-    "uncalled",
-    "schwarzen",
-    "exaggerated",
-    "thee",
-    "fellow-creatures",
-    "florid",
-    "hideous",
-    "stabilizing-conserving",
-    "82",
-    "rehearsal",
-    "structures",
-    "interacting",
-    "hummocks",
-    "alumni",
-    "slanted",
-    "atmospheres",
-    "guardino's",
-    "miniature",
-    "ginner's",
-    "stephen",
-    "built-detergent",
-    "saver",
-    "souci",
-    "wreaths",
-    "world-wide",
-    "retaliating",
-    "beach-drift",
-    "most-valuable",
-    "pitiful",
-    "cop",
-    "pursuant",
-    "institutionalized",
-    "writer",
-    "nude",
-    "vexing",
-    "garth's",
-    "disassemble",
-    "1960",
-    "obedient",
-    "josef",
-    "565",
-    "revenge",
-    "2:05.1",
-    "model",
-    "tensed",
-    "continent",
-    "1213-15",
-    "german-language",
-    "peeking",
-    "maitres",
-    "complacent",
-    "krishna",
-    "2''",
-    "glimpsed",
-    "homefolk",
-    "halfway",
-    "30-30",
-    "aristide",
-    "sags",
-    "high-pitched",
-    "enterprise",
-    "sunshades",
-    "counterpointing",
-    "r-5th",
-    "blinkers",
-    "survivor",
-    "thriving",
-    "usurp",
-    "shady",
-    "statutes",
-    "axles",
-    "sonoma",
-    "misdemeanor",
-    "tabulation",
-    "cynicism",
-    "priest",
-    "baltimore's",
-    "gears",
-    "tenths",
-    "lakewood",
-    "walk",
-    "subroutine",
-    "swath",
-    "studebaker",
-    "reuben",
-    "whining",
-    "horizontal",
-    "humbly",
-    "conning",
-    "realities",
-    "water-balance",
-    "h.",
-    "unifies",
-    "communist",
-    "dell",
-    "three-quarters",
-    "knobby-knuckled",
-    "demoniac",
-    "macdonald",
-    "hesperus",
-    "non-nonsense",
-    "day-watch",
-    "scarce",
-    "kiefferm",
-    "ribas",
-    "depicted",
-    "string",
-    "u.n.",
-    "police-dodging",
-    "thar",
-    "backwards",
-    "iodide-concentrating",
-    "page",
-    "summoned",
-    "playhouse",
-    "pacifies",
-    "ramirez",
-    "commissioned",
-    "color-tv",
-    "truism",
-    "matchmaking",
-    "marvel",
-    "render",
-    "grassroots",
-    "well-stretched",
-    "condense",
-    "20-piece",
-    "bldg.",
-    "masu's",
-    "baslot",
-    "epoxy",
-    "discreet",
-    "tamiris-daniel",
-    "hardwick",
-    "crystallography",
-    "nester",
-    "lucretius",
-    "proctor",
-    "maiden",
-    "thickening",
-    "horsewoman",
-    "under-achievers",
-    "wegener",
-    "objected",
-    "component",
-    "fugitive",
-    "holdin'",
-    "zeme",
-    "larkspur",
-    "racial",
-    "jess",
-    "twirler",
-    "intendants",
-    "mcgruder",
-    "baggage",
-    "pirandello",
-    "high-salaried",
-    "brevet",
-    "slum",
-    "tolls",
-    "shipper",
-    "$1,961,000",
-    "extenuate",
-    "solder",
-    "chaves",
-    "feeney",
-    "air",
-    "crying",
-    "chance",
-    "husbands",
-    "stratified",
-    "lamon",
-    "attacker's",
-    "self-portraits",
-    "entwhistle",
-    "convenient",
-    "90%",
-    "educator",
-    "window-washing",
-    "restorative",
-    "perchance",
-    "fangs",
-    "manifestly",
-    "loudspeakers",
-    "discussed",
-    "garvier",
-    "fabulous",
-    "bleak",
-    "luxury",
-    "thermoplastic",
-    "rejections",
-    "vertical",
-    "polling",
-    "obstacles",
-    "contemporaries",
-    "rugged",
-    "$2400",
-    "to",
-    "norms",
-    "delicate-beyond-description",
-    "trachea",
-    "modern",
-    "prevention",
-    "re-emphasise",
-    "archives",
-    "reconnaissanace",
-    "canterbury",
-    "neighbors'",
-    "bonanza",
-    "ludicrous",
-    "postcards",
-    "prospect",
-    "etv",
-    "infest",
-    "place",
-    "gaetan",
-    "cringed",
-    "header",
-    "electrophorus",
-    "mg/l",
-    "autocrats",
-    "friendlier",
-    "exhibiting",
-    "prejudice",
-    "macropathology",
-    "woman's",
-    "lorena",
-    "worrell",
-    "reexamination",
-    "severely",
-    "carrier",
-    "triangle",
-    "seven-inch",
-    "hal's",
-    "$1,390",
-    "epicyclically",
-    "unadulterated",
-    "9e",
-    "nadine's",
-    "yardage",
-    "editorship",
-    "uncle",
-    "particle",
-    "woe",
-    "unripe",
-    "horrid",
-    "pascagoula",
-    "mears",
-    "rhodesia",
-    "solidly",
-    "jealously",
-    "21-cm",
-    "sec.",
-    "crisscrossed",
-    "crumley",
-    "luther's",
-    "pullman's",
-    "missionaries",
-    "stepped",
-    "teenage",
-    "jamaican",
-    "1%",
-    "barber's",
-    "britannic",
-    "incantation",
-    "healthiest",
-    "numbingly",
-    "supervision",
-    "lambert",
-    "conelrad",
-    "involvements",
-    "availabilities",
-    "postulate",
-    "prominently",
-    "furnishings",
-    "charred",
-    "em",
-    "else",
-    "haverfield",
-    "untraditional",
-    "95",
-    "&",
-    "alundum",
-    "b-47's",
-    "t'ien",
-    "always",
-    "caper",
-    "sixty-nine",
-    "acutely",
-    "alert",
-    "president-elect",
-    "stormy",
-    "carrying",
-    "escapees",
-    "thrift",
-    "carey",
-    "significance",
-    "dejection",
-    "$14.00",
-    "anniston",
-    "dukes",
-    "frankly",
-    "alongside",
-    "performing",
-    "polis",
-    "science's",
-    "night-sight",
-    "stellar",
-    "320",
-    "caterer's",
-    "company-wide",
-    "meteoric",
-    "seventy-fourth",
-    "ki-yi-ing",
-    "socialism",
-    "10,000",
-    "trucking",
-    "colonists",
-    "hypothalamically",
-    "poltawa",
-    "hostage",
-    "runner-up",
-    "bye",
-    "goyette",
-    "marr",
-    "campfire",
-    "namesake",
-    "well-wishers",
-    "parents'",
-    "slavered",
-    "myosin",
-    "ethical",
-    "menagerie",
-    "$50",
-    "sheep",
-    "cons",
-    "denmark",
-    "measuring",
-    "ken",
-    "storefront",
-    "observational",
-    "kennett",
-    "dwyer's",
-    "epileptic",
-    "compassion",
-    "commitments",
-    "certificate",
-    "garibaldi",
-    "freedom's",
-    "see",
-    "gershwins'",
-    "exchanges",
-    "lower-cut",
-    "tie-in",
-    "kok",
-    "8%",
-    "scurrilous",
-    "impressing",
-    "characterizes",
-    "stone's",
-    "priestly",
-    "solenoid",
-    "parsimonious",
-    "pertinence",
-    "gulf",
-    "authorizations",
-    "transmitter",
-    "crowning",
-    "thumbs",
-    "lifer",
-    "kegham",
-    "complication",
-    "novaya",
-    "trastevere",
-    "fragmented",
-    "play",
-    "screenland",
-    "sorrel",
-    "yang",
-    "13.8",
-    "sit-in",
-    "subpenas",
-    "bremerton",
-    "flowered",
-    "rustlers",
-    "2:02.3",
-    "lundy",
-    "5155",
-    "deceitful",
-    "ultra-modern",
-    "grain-storage",
-    "browne",
-    "blunted",
-    "huff",
-    "gutzon",
-    "coffeepot",
-    "tell-tale",
-    "phineoppus",
-    "unfinished",
-    "invalidated",
-    "grooming",
-    "auditorium",
-    "compatriot",
-    "instead",
-    "wicket",
-    "hartlib",
-    "it's",
-    "plot",
-    "adjudication",
-    "cacophonist",
-    "subtly",
-    "roxy",
-    "lavato",
-    "cancelled",
-    "waterfall",
-    "sign",
-    "olney",
-    "widths",
-    "norway",
-    "sturbridge",
-    "detonated",
-    "comparing",
-    "undertaker",
-    "paradox",
-    "button's",
-    "kahler",
-    "peopled",
-    "check-out",
-    "mont.",
-    "clot",
-    "paine",
-    "sun-times",
-    "ra",
-    "intimal",
-    "lynched",
-    "repel",
-    "repeats",
-    "grins",
-    "segments",
-    "originated",
-    "dungeon",
-    "companionship",
-    "childbirth",
-    "full-dress",
-    "palates",
-    "linus",
-    "fellow-employees",
-    "lions",
-    "theirs",
-    "emory",
-    "pale-blue",
-    "redistributed",
-    "ruddy",
-    "demandingly",
-    "shucks",
-    "1817",
-    "spacers",
-    "lyric",
-    "growl",
-    "irresistible",
-    "unfounded",
-    "entranceway",
-    "tracks",
-    "deduced",
-    "cruz",
-    "megawatt",
-    "exalted",
-    "fogged",
-    "collapsed",
-    "law-abiding",
-    "88's",
-    "c'n",
-    "revitalize",
-    "perpendicular",
-    "dispersal",
-    "send",
-    "whisking",
-    "garish",
-    "airfield",
-    "fearful",
-    "pinkish-white",
-    "supinely",
-    "23-30",
-    "perturbed",
-    "enchantingly",
-    "stretcher",
-    "grottoes",
-    "vein",
-    "ultra-efficient",
-    "rapping",
-    "cosily",
-    "capsule",
-    "hackers",
-    "service-connected",
-    "loyalties",
-    "jewel-bright",
-    "beaching",
-    "sober",
-    "adverse",
-    "ruling",
-    "outdrew",
-    "dryness",
-    "1960-1961",
-    "5/8-inch",
-    "juliet",
-    "dresbach",
-    "fifth",
-    "symbolic",
-    "14-power",
-    "velasquez",
-    "translating",
-    "disguises",
-    "$10",
-    "berton",
-    "ellie",
-    "spaces",
-    "unintended",
-    "jamestown",
-    "release",
-    "thrombosis",
-    "erupting",
-    "leaflet",
-    "plagiarism",
-    "integration",
-    "flapping",
-    "ireland's",
-    "perhaps",
-    "crusade",
-    "coal-railroad",
-    "heterogamous",
-    "scherer",
-    "britain's",
-    "carmine",
-    "croydon",
-    "plan's",
-    "bungalow",
-    "mucus",
-    "ancestry",
-    "super-sets",
-    "smith",
-    "get-together",
-    "setbacks",
-    "despots",
-    "trinidad",
-    "varieties",
-    "bred",
-    "shape-up",
-    "lumpe",
-    "fatter",
-    "gulley",
-    "good-looking",
-    "semi-circle",
-    "clutched",
-    "hotel",
-    "convection",
-    "dalton",
-    "refrain",
-    "gumption",
-    "mambo",
-    "vantage-points",
-    "deep-set",
-    "sako",
-    "roe",
-    "heightening",
-    "victimized",
-    "stressed",
-    "swaggered",
-    "quarry",
-    "junks",
-    "directorate",
-    "porter",
-    "arianists",
-    "widest",
-    "stockings",
-    "conditioner",
-    "mid-twentieth",
-    "moon-round",
-    "tooling",
-    "dallas-based",
-    "guard-room",
-    "eppler",
-    "observant",
-    "leguminous",
-    "sophoclean",
-    "neilson",
-    "beat-up",
-    "princeton",
-    "mycenae",
-    "copes",
-    "twigs",
-    "stepson",
-    "truman",
-    "ducks",
-    "maintaining",
-    "hard-liquor",
-    "oversubscribed",
-    "semipublic",
-    "target-language",
-    "ch",
-    "rubbish",
-    "sposato",
-    "decision-making",
-    "speaker",
-    "co",
-    "criteria",
-    "48''",
-    "white-clad",
-    "coloratura",
-    "holster",
-    "globes",
-    "variables",
-    "inopportune",
-    "absolution",
-    "sinuousness",
-    "attendant",
-    "foil",
-    "rivalry",
-    "working",
-    "stabilizes",
-    "kroening",
-    "fink",
-    "wrongly",
-    "antigone",
-    "degrading",
-    "handclasp",
-    "pastes",
-    "joblessness",
-    "poultices",
-    "**yp",
-    "fold",
-    "mother",
-    "bleating",
-    "charlatans",
-    "ledgers",
-    "stewardesses",
-    "unsuitably",
-    "involve",
-    "furrowed",
-    "frankfurter's",
-    "equitable",
-    "nondriver",
-    "socialize",
-    "sea-beach",
-    "piquant",
-    "mitchell's",
-    "bogus",
-    "epigrams",
-    "pre-cast",
-    "mommy's",
-    "consoling",
-    "no-o",
-    "bourbons",
-    "singling",
-    "appalachians",
-    "non-federal",
-    "l'orchestre",
-    "oceanographic",
-    "thighs",
-    "faier",
-    "thrill",
-    "retreated",
-    "dalloway",
-    "self-extinguishing",
-    "requisites",
-    "xenophobia",
-    "$2,300,000",
-    "malfunctioning",
-    "runner",
-    "towards",
-    "sheldon",
-    "program's",
-    "lagerlof",
-    "lutihaw",
-    "portuguese",
-    "schelling",
-    "flux",
-    "unbearably",
-    "front-page",
-    "relations",
-    "papa's",
-    "burton's",
-    "obliquely",
-    "oversize",
-    "balkanize",
-    "molvar",
-    "fearlessly",
-    "berth",
-    "hydrolyzed",
-    "dictators",
-    "2809",
-    "dropping",
-    "shifte",
-    "thirteen",
-    "one-quarter",
-    "molly",
-    "well-bred",
-    "wynn",
-    "secrets",
-    "hydrostatic",
-    "whiskers",
-    "retarding",
-    "leningrad",
-    "1971",
-    "cessation",
-    "340tr",
-    "afloat",
-    "bien",
-    "plazek",
-    "union-industry",
-    "resigned",
-    "achieves",
-    "agreements",
-    "obstructionist",
-    "absolutely",
-    "inspector's",
-    "beer-runners",
-    "innate",
-    "polity",
-    "composer",
-    "feared",
-    "discourse",
-    "poconos",
-    "necessities",
-    "resulting",
-    "discernment",
-    "cocteau",
-    "enigmatic",
-    "$3.15",
-    "pale",
-    "second-level",
-    "confounding",
-    "chipped",
-    "castles",
-    "potency",
-    "suitable",
-    "similarity",
-    "picketing",
-    "curzon",
-    "b.b.c.'s",
-    "worcestershire",
-    "they've",
-    "engineering-management",
-    "exploits",
-    "zemlinsky",
-    "unknowingly",
-    "fuming",
-    "stratford",
-    "renting",
-    "splicing",
-    "indochina",
-    "chairmanship",
-    "smallest",
-    "fourth-class",
-    "abell",
-    "engisch",
-    "assailants",
-    "roadbuilding",
-    "appetizing",
-    "4:45",
-    "$30,000",
-    "credibility",
-    "costumed",
-    "taxable",
-    "hinge",
-    "seriously",
-    "96",
-    "epitomized",
-    "tsem",
-    "contusions",
-    "margo",
-    "plasterer",
-    "wiederum",
-    "bonded",
-    "curvaceously",
-    "bounded",
-    "howry",
-    "widen",
-    "hackmann",
-    "fermate",
-    "paucity",
-    "groupings",
-    "tillet",
-    "costs",
-    "23:34",
-    "relationships",
-    "potentials",
-    "merritt",
-    "overpaid",
-    "10.6%",
-    "peacemaking",
-    "spared",
-    "larval",
-    "water-ski",
-    "perseveres",
-    "maneuvers",
-    "break-neck",
-    "regi",
-    "stamp",
-    "lyricism",
-    "linoleum",
-    "reside",
-    "cushman",
-    "farr",
-    "cloddishness",
-    "1044",
-    "exposing",
-    "ephesians",
-    "line",
-    "vexed",
-    "pastel",
-    "entombed",
-    "monumental",
-    "tremble",
-    "smith's",
-    "pyhrric",
-    "psychologist",
-    "leaves",
-    "roi",
-    "herrmann",
-    "second-class",
-    "glees",
-    "reckless",
-    "forums",
-    "mario",
-    "realty",
-    "bustard",
-    "commuting",
-    "kubek",
-    "potemkin",
-    "lebanese",
-    "across-the-board",
-    "h.p.r.",
-    "commenced",
-    "mccarthy's",
-    "instance",
-    "frostbite",
-    "sideways",
-    "fleeing",
-    "squirted",
-    "patrolled",
-    "cobalt-60",
-    "bastards",
-    "gustavus",
-    "drahve",
-    "bullet",
-    "syndrome",
-    "pliny's",
-    "-20-degrees",
-    "mutational",
-    "debt",
-    "kennard",
-    "truck",
-    "preferred",
-    "tinkled",
-    "phenomenal",
-    "corporal",
-    "utilizing",
-    "suffragettes",
-    "tongs",
-    "swooped",
-    "clout",
-    "beringer",
-    "duty",
-    "musicality",
-    "clearer",
-    "9n",
-    "sublease",
-    "conventionality",
-    "mcgeorge",
-    "marching",
-    "cedvet",
-    "overlapping",
-    "genuinely",
-    "engendered",
-    "avery",
-    "liberty-and-union",
-    "maku",
-    "self-defeat",
-    "anti-democratic",
-    "luminosity",
-    "convoy",
-    "ions",
-    "dystopian",
-    "researchable",
-    "persuasion",
-    "keane",
-    "8,000,000",
-    "well-developed",
-    "unblemished",
-    "exuberant",
-    "abbe",
-    "contribs",
-    "fearfully",
-    "binge",
-    "brigantine",
-    "breaths",
-    "pfc",
-    "anti-personality",
-    "tenement",
-    "near-at-hand",
-    "syllables",
-    "pimen",
-    "regulation",
-    "tournament",
-    "berle",
-    "distally",
-    "safari",
-    "rafer",
-    "inoculation",
-    "drama",
-    "clustering",
-    "option",
-    "laotians",
-    "splitting",
-    "chimney",
-    "architect",
-    "cholera",
-    "recluse",
-    "middletown",
-    "holt's",
-    "quartet",
-    "riefling",
-    "abdominis",
-    "presto",
-    "visible",
-    "undergoing",
-    "oblivious",
-    "path",
-    "stabilizers",
-    "works",
-    "reconsidered",
-    "ariadne",
-    "eighties",
-    "short-term",
-    "pre-eminent",
-    "excuses",
-    "ala.",
-    "blandness",
-    "oversight",
-    "molest",
-    "cahoots",
-    "allot",
-    "written",
-    "overlords",
-    "slocum",
-    "timbers",
-    "queasiness",
-    "ghosts",
-    "sun-burned",
-    "rails",
-    "loophole",
-    "closure",
-    "shackled",
-    "horse-trail",
-    "armored",
-    "directional",
-    "salacious",
-    "jude",
-    "whirlwind",
-    "echelons",
-    "distal",
-    "1789",
-    "announced",
-    "post-census",
-    "dictionary",
-    "bernardine",
-    "pullings",
-    "fauna",
-    "malaria",
-    "frieze",
-    "frilly",
-    "broiled",
-    "booboo",
-    "denoting",
-    "bucs",
-    "rocking",
-    "helplessness",
-    "natural",
-    "ablaze",
-    "uncontrolled",
-    "terra",
-    "prudent",
-    "patronizing",
-    "voyager",
-    "bonfiglio",
-    "hostile",
-    "north-bound",
-    "yardstick",
-    "cagayan",
-    "rose-pink",
-    "hershel",
-    "warts",
-    "prayer-time",
-    "yards",
-    "road-circuit",
-    "knotted",
-    "ballroom",
-    "slave's",
-    "blackbirds",
-    "unceasingly",
-    "naturalness",
-    "raesz",
-    "melissa",
-    "unquestioningly",
-    "7:10",
-    "occupant",
-    "dusky",
-    "yankees",
-    "editing",
-    "commendable",
-    "cozier",
-    "ungoverned",
-    "gymnastics",
-    "millionaire",
-    "differentiation",
-    "orchestras",
-    "collar-to-collar",
-    "sat",
-    "sundays",
-    "reverberated",
-    "softly",
-    "principle",
-    "situation",
-    "snowed",
-    "cypress",
-    "isaac",
-    "buri",
-    "unquestionably",
-    "**zq",
-    "inexpensive",
-    "frenziedly",
-    "narrow",
-    "dynasties",
-    "slipper",
-    "plantations",
-    "$4,177.37",
-    "pillars",
-    "6'.7",
-    "luang",
-    "boat-yard",
-    "soddenly",
-    "dubin",
-    "$2.09",
-    "rossilini's",
-    "jerking",
-    "crusaders",
-    "noncommittally",
-    "showpiece",
-    "crutches",
-    "knock",
-    "consecutive",
-    "oso's",
-    "fredrik",
-    "forestall",
-    "southwest",
-    "expositions",
-    "nishima",
-    "absentmindedly",
-    "reps.",
-    "instinctive",
-    "vigorous",
-    "clicked",
-    "around",
-    "foraging",
-    "baseless",
-    "flyers",
-    "matisses",
-    "thenceforth",
-    "protestants",
-    "tetrachloride",
-    "interactions",
-    "goals",
-    "isis",
-    "tacked",
-    "verboten",
-    "slide",
-    "$3,675",
-    "peggin'",
-    "safeguards",
-    "rusk",
-    "1800-square-foot",
-    "ultra-high-speed",
-    "gowned",
-    "missile-type",
-    "mantel",
-    "80,000",
-    "pilots'",
-    "paraded",
-    "jagan",
-    "hilliard",
-    "spartan",
-    "rapidity",
-    "copying",
-    "tirades",
-    "yakima",
-    "dorr",
-    "metamorphic",
-    "heels",
-    "astaires",
-    "tintype",
-    "excellences",
-    "lofty",
-    "compartments",
-    "ragged",
-    "barefooted",
-    "sushi",
-    "flawless",
-    "steroids",
-    "glycerinated",
-    "d'identite",
-    "ziraldo",
-    "sulks",
-    "cossacks",
-    "tenure",
-    "wheezes",
-    "schonberg's",
-    "uninhibited",
-    "athletes'",
-    "workouts",
-    "idealized",
-    "darling",
-    "contention",
-    "secretion",
-    "shoot-down",
-    "cleva",
-    "impulses",
-    "hearers",
-    "lovelies",
-    "jo",
-    "foamed-core",
-    "game",
-    "labouisse",
-    "smoother",
-    "re-evaluation",
-    "platters",
-    "opulent",
-    "nucleotide",
-    "fists",
-    "smatterings",
-    "hid",
-    "tangents",
-    "hack",
-    "maelstrom",
-    "candle",
-    "bee",
-    "unlicensed",
-    "mathias'",
-    "41-8",
-    "brandishing",
-    "disagreeable",
-    "milties",
-    "road-show",
-    "dekalb",
-    "sie",
-    "lilting",
-    "chernishev",
-    "winner",
-    "turpentine",
-    "second-stage",
-    "tantalizing",
-    "flng",
-    "1:218",
-    "pearl-gray",
-    "campmate",
-    "bonaventure",
-    "sought",
-    "coal-black",
-    "channel-type",
-    "introductions",
-    "dispel",
-    "hunkered",
-    "capacitor",
-    "calibration",
-    "pectoral-ribcage",
-    "brachii",
-    "longsuffering",
-    "tunis",
-    "soybean",
-    "elec",
-    "wifely",
-    "freezing",
-    "libido",
-    "romancing",
-    "mountainous",
-    "chapter's",
-    "sweat-soaked",
-    "fairmont",
-    "bustling",
-    "$115,000",
-    "mailman",
-    "farley",
-    "barges",
-    "postwar",
-    "emmett's",
-    "27-year-old",
-    "muskets",
-    "languid",
-    "$75",
-    "sugar",
-    "berlin-west",
-    "divisible",
-    "keddah",
-    "batterie",
-    "97",
-    "clump",
-    "overcooked",
-    "definitely",
-    "mosaic-like",
-    "preoccupations",
-    "intentioned",
-    "headsman",
-    "prejudicial",
-    "sid",
-    "authority",
-    "smarted",
-    "relaying",
-    "sprinkled",
-    "celtic",
-    "retrovision",
-    "idyllic",
-    "evermounting",
-    "overnighters",
-    "churning",
-    "tailor-make",
-    "non-catholics",
-    "mid-1960's",
-    "ultra-fast",
-    "payne",
-    "pliant",
-    "uncomfortable",
-    "blonde-haired",
-    "zenith",
-    "soldiering",
-    "studious",
-    "relativism",
-    "spiralis",
-    "quieter",
-    "goodbody",
-    "withstood",
-    "xreserve",
-    "spectator",
-    "devoutly",
-    "set-up",
-    "mendelssohn",
-    "yachtsman",
-    "intransigence",
-    "blaze",
-    "centigrade",
-    "english-speaking",
-    "senate's",
-    "vocalist",
-    "glazer",
-    "surfeited",
-    "reactants",
-    "regimented",
-    "wont",
-    "lidless",
-    "motion",
-    "rinse",
-    "1860",
-    "keegan",
-    "detectable",
-    "rat-a-tat-tatty",
-    "unbound",
-    "arthur's",
-    "doctrinaire",
-    "urns",
-    "handled",
-    "stiffs",
-    "$133",
-    "croix",
-    "skinner",
-    "casino's",
-    "in-fighting",
-    "africans",
-    "owed",
-    "pawtuxet",
-    "overcome",
-    "once-popular",
-    "center",
-    "hierarchies",
-    "rickettsia",
-    "disparate",
-    "mulligatawny",
-    "anti-monopoly",
-    "longhorns",
-    "collett",
-    "weir",
-    "fuhrmann",
-    "supposed",
-    "saner",
-    "prompt",
-    "gyms",
-    "sociability",
-    "youth",
-    "infection",
-    "too",
-    "ben",
-    "falter",
-    "6-foot",
-    "clamored",
-    "half-reached",
-    "broadens",
-    "elephant's",
-    "unreal",
-    "physical-chemical",
-    "tighter",
-    "coarsened",
-    "knuckleball",
-    "arc",
-    "pyschiatrist",
-    "offenders",
-    "steam-baths",
-    "staley",
-    "enjoyment",
-    "hitch",
-    "strangers",
-    "tootsie",
-    "dazzler",
-    "gliders",
-    "dominion",
-    "moths",
-    "firzite",
-    "eloquently",
-    "m.a.",
-    "sleepwalker",
-    "taiwan",
-    "authorize",
-    "auschwitz",
-    "alia",
-    "honor",
-    "stare",
-    "tolstoy",
-    "apportionments",
-    "surpluses",
-    "extreme",
-    "fibrocalcific",
-    "gaps",
-    "canestrani",
-    "roofed",
-    "screams",
-    "nap",
-    "cartoonist",
-    "endeavor",
-    "battle-cry",
-    "loquacity",
-    "massacred",
-    "oum",
-    "nickel-iron",
-    "esteem",
-    "forisque",
-    "humid",
-    "dens",
-    "shabby",
-    "lodges",
-    "minutely",
-    "paint",
-    "schaefer",
-    "prolusion",
-    "dimitri",
-    "underwriter",
-    "carbonyl",
-    "rainy",
-    "cousins'",
-    "programmes",
-    "earth's",
-    "teased",
-    "bargaining",
-    "smash",
-    "duffer",
-    "rapid-transit",
-    "rushed",
-    "giveth",
-    "emperor's",
-    "wonduh",
-    "sawyer",
-    "safe",
-    "coughing",
-    "stoves",
-    "occasion",
-    "beatrice",
-    "san",
-    "prisons",
-    "inhabit",
-    "brothels",
-    "chartered",
-    "killpath",
-    "rough-tough",
-    "gantry",
-    "cowhand'd",
-    "komleva",
-    "rockies",
-    "anybody",
-    "hatch",
-    "considerably",
-    "reverse",
-    "hit-and-run",
-    "puddle",
-    "frothier",
-    "chef",
-    "spotty",
-    "prevailing",
-    "pianistic",
-    "wrangler",
-    "chest-back-lat-shoulder",
-    "gauss",
-    "judgments",
-    "badlands",
-    "diatoms",
-    "emasculation",
-    "phonetics",
-    "fund-raiser",
-    "art's",
-    "irrevocable",
-    "kob",
-    "individuals",
-    "genesis",
-    "congresswoman",
-    "sameness",
-    "vicious",
-    "hickok",
-    "godless",
-    "543",
-    "chmn.",
-    "mothers",
-    "creativeness",
-    "quartermaster",
-    "burgher",
-    "ex-national",
-    "askew",
-    "alligator",
-    "philip's",
-    "kegs",
-    "tiring",
-    "arenas",
-    "civilizational",
-    "2-3/4''",
-    "giddings",
-    "sho'",
-    "construed",
-    "udon",
-    "sanctuary",
-    "two-bits'",
-    "boulle",
-    "drains",
-    "pickman",
-    "hastened",
-    "carty",
-    "preferences",
-    "1640",
-    "zachrisson",
-    "daytime",
-    "molard",
-    "break-through",
-    "microwave",
-    "decked",
-    "vectrol",
-    "actuated",
-    "glittering",
-    "ruthenium",
-    "paymaster",
-    "tangle",
-    "fade-in",
-    "replying",
-    "shrubbery",
-    "depositions",
-    "athena",
-    "romagnosi",
-    "judge's",
-    "race-driver",
-    "introjects",
-    "derangement",
-    "interlibrary",
-    "tenaciously",
-    "discontinuous",
-    "francaise",
-    "excellency",
-    "self-sustaining",
-    "conquer",
-    "message",
-    "sprawl",
-    "cremated",
-    "tex",
-    "fond",
-    "unpleasant",
-    "cost-accounting",
-    "writer-turned-painter",
-    "reproductions",
-    "appian",
-    "wood-grained",
-    "saves",
-    "malediction",
-    "unhappiest",
-    "loin",
-    "562",
-    "evaluation",
-    "plum",
-    "merc",
-    "religions",
-    "mr.",
-    "grattan",
-    "private",
-    "goddess",
-    "2-inch",
-    "squinted",
-    "tell",
-    "choreographic",
-    "resided",
-    "sulky's",
-    "invercalt",
-    "airdrops",
-    "idealization",
-    "neo-romanticism",
-    "cusp",
-    "chimneys",
-    "2705",
-    "telefunken",
-    "twenty-six",
-    "261",
-    "175,000",
-    "m.e.'s",
-    "recalculated",
-    "grinders",
-    "pre-conscious",
-    "plastically",
-    "bolder",
-    "illegally",
-    "edified",
-    "virginity",
-    "grubs",
-    "2,418",
-    "york",
-    "blair",
-    "perpetuated",
-    "moving",
-    "herewith",
-    "flyer",
-    "constantly",
-    "wanton",
-    "logging",
-    "using",
-    "lure",
-    "presuppose",
-    "conversion",
-    "pennell",
-    "evensong",
-    "sentimentalize",
-    "on-again-off-again",
-    "boissoneault",
-    "terminus",
-    "round-faced",
-    "foreign-sounding",
-    "gauleiter",
-    "beale",
-    "spenglerian",
-    "tour",
-    "ravine",
-    "hooliganism",
-    "mud-sweat-and-tears",
-    "aplomb",
-    "olde",
-    "evinced",
-    "unmatched",
-    "fords",
-    "moccasins",
-    "blood-flow",
-    "francie's",
-    "forge",
-    "said",
-    "shih",
-    "ebbing",
-    "44-year-old",
-    "thirty",
-    "1812",
-    "irons",
-    "confirmed",
-    "formerly",
-    "troopships",
-    "tchaikovsky",
-    "carolinas",
-    "global",
-    "comprehensive",
-    "cognizance",
-    "cleat",
-    "pyrometers",
-    "rainstorm",
-    "precept",
-    "aerobic",
-    "pet",
-    "scathing",
-    "unhappily",
-    "diseased",
-    "preserves",
-    "publicists",
-    "unfulfilled",
-    "still-building",
-    "ellipsoid",
-    "dim",
-    "out-reaching",
-    "detergent",
-    "wig",
-    "tiniest",
-    "fast-firing",
-    "noyes",
-    "touring",
-    "exasperated",
-    "conductor",
-    "brannon's",
-    "calming",
-    "persevere",
-    "mysteriously",
-    "mistrust",
-    "encylopedia",
-    "1,212,000",
-    "condicions",
-    "grappled",
-    "keine",
-    "danaher",
-    "sneaky",
-    "rebellious",
-    "baseball",
-    "devils",
-    "in-person",
-    "emotionalism",
-    "analogues",
-    "barnard",
-    "one-step",
-    "sparkle",
-    "reaction",
-    "jardin",
-    "telegrapher",
-    "395",
-    "farmer-type",
-    "saturday",
-    "allah",
-    "**yj",
-    "holabird",
-    "semiempirical",
-    "centered",
-    "holdups",
-    "centimeters",
-    "tooke",
-    "compost",
-    "bryant",
-    "walled",
-    "marinas",
-    "large",
-    "mark",
-    "pleasure",
-    "inductions",
-    "balking",
-    "teensy",
-    "spells",
-    "tuc",
-    "$2,700",
-    "appliances",
-    "souls",
-    "kentfield",
-    "pistol-whipping",
-    "pride's",
-    "straddled",
-    "covertly",
-    "historically",
-    "its",
-    "tribulation",
-    "vulpine",
-    "peel",
-    "publique",
-    "operable",
-    "'n'",
-    "vicolo",
-    "swum",
-    "superseded",
-    "apricot",
-    "floured",
-    "distension",
-    "text-form",
-    "torquemada",
-    "iced",
-    "decorticated",
-    "253",
-    "foundering",
-    "prematurely",
-    "non-violently",
-    "rebuttal",
-    "calving",
-    "cometary",
-    "throw",
-    "reliance",
-    "over-stitched",
-    "fix",
-    "rator",
-    "franco-german",
-    "1638",
-    "att",
-    "freight-car",
-    "bar",
-    "police",
-    "unguided",
-    "overturning",
-    "permeated",
-    "bunter",
-    "downers",
-    "insisting",
-    "uncommon",
-    "chanted",
-    "restricting",
-    "benefits",
-    "simulated",
-    "skipjack",
-    "gasped",
-    "reprobating",
-    "peer-group",
-    "stirrin",
-    "virdon",
-    "embezzle",
-    "exiles",
-    "bcd",
-    "somebody's",
-    "bas-relief",
-    "demythologizing",
-    "loathsome",
-    "anthropological",
-    "harris",
-    "noces",
-    "jenni",
-    "inventors",
-    "resemblance",
-    "maryed",
-    "jovial",
-    "sustenance",
-    "roars",
-    "criticize",
-    "progandist",
-    "indestructible",
-    "daylight's",
-    "carol",
-    "pall",
-    "madrigal",
-    "evasions",
-    "380-foot",
-    "dromozoa",
-    "disliked",
-    "retention",
-    "etymological",
-    "leggett",
-    "tetragonal",
-    "orioles'",
-    "'50's",
-    "gaped",
-    "barricade",
-    "begins",
-    "skillfully",
-    "beef-feeding",
-    "tippecanoe",
-    "goethe's",
-    "--",
-    "nonacid",
-    "rca",
-    "kaplan",
-    "goodwill",
-    "casuals",
-    "bragging",
-    "opinion",
-    "overran",
-    "lambs",
-    "heel-terka",
-    "spec.",
-    "insulators",
-    "non-partisan",
-    "taras-tchaikovsky",
-    "menderes",
-    "toulouse",
-    "foundation",
-    "hayfields",
-    "close-up",
-    "mouthful",
-    "alaska",
-    "rok",
-    "white's",
-    "wins",
-    "historicism",
-    "paso",
-    "geographical",
-    "woodberry",
-    "apples",
-    "improperly",
-    "racketeer",
-    "matured",
-    "urging",
-    "plugs",
-    "basis",
-    "salutary",
-    "fathered",
-    "buffetings",
-    "fooled",
-    "monteverdi",
-    "noteworthy",
-    "dignity",
-    "followin'",
-    "benson",
-    "leonato's",
-    "maclean",
-    "gleaned",
-    "happenstance",
-    "beman",
-    "fountain",
-    "freshened",
-    "pendleton's",
-    "gregarious",
-    "syrup",
-    "peterhouse",
-    "claude's",
-    "hurtling",
-    "semblance",
-    "silly",
-    "globe-girdling",
-    "appropriates",
-    "drs.",
-    "sterilized",
-    "ratios",
-    "scimitar",
-    "enrollment",
-    "ironpants",
-    "refolded",
-    "sits",
-    "terrible",
-    "issued",
-    "haulage",
-    "ahmiri",
-    "nippur",
-    "strictly",
-    "newtown",
-    "shield",
-    "committeeman",
-    "kissed",
-    "holiness",
-    "confiscating",
-    "sister",
-    "45%",
-    "conspicuously",
-    "mytton",
-    "literary",
-    "fantastic",
-    "irritable",
-    "694",
-    "newsman",
-    "disagrees",
-    "windmill",
-    "2/3",
-    "116,000",
-    "encores",
-    "fawn",
-    "statute",
-    "mindless",
-    "facts",
-    "westerly",
-    "lasses",
-    "dining",
-    "rochester",
-    "blasphemies",
-    "socio-political",
-    "lodgment",
-    "neuberger",
-    "hexagonal",
-    "analysts",
-    "life's",
-    "warm-blooded",
-    "wine-",
-    "appearin'",
-    "dusty",
-    "drowsily",
-    "marquess",
-    "145",
-    "inks",
-    "realist",
-    "depose",
-    "abnormalities",
-    "unheated",
-    "filaments",
-    "anticipates",
-    "aschenbach",
-    "impurities",
-    "washes",
-    "poseidon",
-    "retaliatory",
-    "slats",
-    "treasured",
-    "paying",
-    "quietism",
-    "half-conscious",
-    "spokes",
-    "hulk",
-    "sorest",
-    "forbade",
-    "predestined",
-    "assure",
-    "eighty-five",
-    "arcs",
-    "dissented",
-    "leeds'",
-    "asia",
-    "spofford",
-    "unite",
-    "big-boned",
-    "chamberlain",
-    "saturated",
-    "ministries",
-    "grumbled",
-    "fugitives",
-    "braden",
-    "wages",
-    "eked",
-    "literalism",
-    "celerity",
-    "northfield",
-    "navy-blue",
-    "mobilization",
-    "likewise",
-    "awfulness",
-    "hempstead",
-    "redeem",
-    "one-sixth",
-    "endorse",
-    "devastatingly",
-    "gaspingly",
-    "eighteenth-century",
-    "state-local",
-    "dislocations",
-    "dance-theatre",
-    "teamed",
-    "universally",
-    "galapagos",
-    "rosenmueller",
-    "compagnie",
-    "45",
-    "volts",
-    "vance's",
-    "rounded",
-    "prefectures",
-    "dead",
-    "crowed",
-    "reawaken",
-    "conquests",
-    "hit-and-miss",
-    "carnal",
-    "dollars",
-    "lethal",
-    "marketing",
-    "pepinsky",
-    "inflamed",
-    "dyer",
-    "pagnol's",
-    "autopsy",
-    "furnishing",
-    "bessarabia",
-    "heavy",
-    "titled",
-    "cerise",
-    "rumored",
-    "failed",
-    "withdrawal",
-    "mated",
-    "83",
-    "tactual",
-    "calamity",
-    "mapping",
-    "weed",
-    "2:05",
-    "darwinism",
-    "polyethers",
-    "all-consuming",
-    "pro",
-    "chattanooga",
-    "masseur",
-    "manumitted",
-    "rabbit",
-    "rivals",
-    "sweet-throated",
-    "vestige",
-    "well-fed",
-    "wallenstein",
-    "whereupon",
-    "evolutionary",
-    "unofficial",
-    "sweethearts",
-    "marketings",
-    "fetching",
-    "jannsen",
-    "bonjour",
-    "conductivity",
-    "courtier",
-    "selection",
-    "marcus",
-    "pohl",
-    "ego's",
-    "myn",
-    "predictors",
-    "angular",
-    "sakos",
-    "shrub-covered",
-    "0.5",
-    "forum",
-    "judith",
-    "horizontally",
-    "batter's",
-    "metered",
-    "department",
-    "digby's",
-    "named",
-    "advocate",
-    "controversial",
-    "rata",
-    "lb.",
-    "high-sounding",
-    "doris'",
-    "ship's",
-    "fuselage",
-    "boomerangs",
-    "banquets",
-    "zanzibar",
-    "pro-neutralist",
-    "oration",
-    "mathues",
-    "retch",
-    "churchgoers",
-    "albicans",
-    "wildly",
-    "paean",
-    "delphine",
-    "steinhager",
-    "classification",
-    "lace",
-    "profoundity",
-    "intrinsic",
-    "angeles'",
-    "dill",
-    "n.c.'s",
-    "fellows",
-    "amateur",
-    "tournaments",
-    "biographer",
-    "serene",
-    "claimed",
-    "supply",
-    "pitilessly",
-    "remembrance",
-    "newt",
-    "ax",
-    "dirge",
-    "distributors",
-    "rome's",
-    "outlandish",
-    "gilt",
-    "well-deserved",
-    "rube",
-    "pitifully",
-    "buffeted",
-    "denominators",
-    "albany",
-    "sorrows",
-    "dr.",
-    "blinking",
-    "harrow",
-    "giaour",
-    "agin",
-    "redactions",
-    "centralized",
-    "souvenirs",
-    "semiarid",
-    "grateful",
-    "pont",
-    "chemically",
-    "nonpolitical",
-    "heed",
-    "contented",
-    "arabs",
-    "peony",
-    "berra's",
-    "pleasantness",
-    "alternate",
-    "derive",
-    "wildhack",
-    "hoak",
-    "wastewater",
-    "rickshaw",
-    "wearisome",
-    "censorial",
-    "escalation",
-    "infighting",
-    "surgery",
-    "illinois'",
-    "no-valued",
-    "treelike",
-    "fair",
-    "paragraphing",
-    "crave",
-    "observations",
-    "broadcasters",
-    "laces",
-    "stop",
-    "unchanging",
-    "redactor",
-    "no-nonsense",
-    "nociceptive",
-    "ugliness",
-    "wreak",
-    "sons",
-    "fascinating",
-    "dusseldorf",
-    "prize-fight",
-    "bold",
-    "marched",
-    "telli",
-    "cambodia",
-    "super-city",
-    "veined",
-    "respective",
-    "sicurella",
-    "unhurried",
-    "presenting",
-    "colfax",
-    "7-room",
-    "facility",
-    "pit",
-    "wanderjahr",
-    "verstrichen",
-    "bookkeeping",
-    "deprived",
-    "fist",
-    "socialistic",
-    "whiteface",
-    "confessing",
-    "awaye",
-    "earned",
-    "lohmans",
-    "1.09.3",
-    "thanked",
-    "negligence",
-    "enmities",
-    "sawdust",
-    "ineffectiveness",
-    "anglicans",
-    "secessionist",
-    "quarter-century-old",
-    "charcoaled",
-    "fdr",
-    "lui",
-    "volkswagens",
-    "excerpts",
-    "baited",
-    "troubling",
-    "pledges",
-    "brazier",
-    "linguistically",
-    "unpadded",
-    "eclipsing",
-    "timetables",
-    "month",
-    "arteriolar",
-    "elsie",
-    "dentist",
-    "medium's",
-    "cleaved",
-    "overwhelming",
-    "hi",
-    "reporters",
-    "rabies",
-    "osaka",
-    "eucalyptus",
-    "ruth",
-    "enoch",
-    "jensen",
-    "interviews",
-    "big-town",
-    "fascinatingly",
-    "pondered",
-    "callousness",
-    "bathtub",
-    "sensitive",
-    "turning",
-    "saxony",
-    "budget-altering",
-    "means's",
-    "mullendore",
-    "parchment",
-    "lined",
-    "orgiastic",
-    "planters",
-    "matsuo's",
-    "pendant",
-    "reinforcement",
-    "microfilm",
-    "steprelationship",
-    "alan",
-    "quiney's",
-    "dharma",
-    "synapses",
-    "plummeting",
-    "fraction",
-    "searched",
-    "kaminsky",
-    "parenthood",
-    "rooster's",
-    "67",
-    "budzyn",
-    "west",
-    "archangels",
-    "ruffians",
-    "consumer's",
-    "single-step",
-    "skybolt",
-    "stadium",
-    "lattimer's",
-    "subtilis",
-    "feudal",
-    "fifty-five",
-    "ground-level",
-    "gorges",
-    "indefinable",
-    "matter",
-    "acrobatics",
-    "bartholf",
-    "babylonians",
-    "good-by",
-    "perken",
-    "co-operating",
-    "escort",
-    "far-off",
-    "plowman's",
-    "self-defeating",
-    "non-objects",
-    "caress",
-    "hoyle's",
-    "analyst's",
-    "demoralized",
-    "filial",
-    "repeat",
-    "amidst",
-    "miasmal",
-    "$1,276",
-    "butyrate",
-    "fanning",
-    "unshaven",
-    "sirs",
-    "philosophic",
-    "stubborn",
-    "organification",
-    "spaghetti",
-    "velocity",
-    "magic-practicing",
-    "murky",
-    "rheinholdt",
-    "stepanovich",
-    "calabria",
-    "copywriter",
-    "don't-know's",
-    "geometrically",
-    "yesterday's",
-    "dries",
-    "everything's",
-    "minister",
-    "non-skid",
-    "quasi-folk",
-    "wounds",
-    "according",
-    "hopefully",
-    "1886",
-    "mpl",
-    "punctually",
-    "bacchus",
-    "risked",
-    "bolt",
-    "suggested",
-    "restorability",
-    "precipice-walled",
-    "fluted",
-    "aeon",
-    "reedville",
-    "acquisitiveness",
-    "clemente",
-    "anthems",
-    "runoff",
-    "eatable",
-    "cameo",
-    "pantry",
-    "executioner",
-    "agony",
-    "convince",
-    "arak",
-    "sedentary",
-    "clients",
-    "eclectically",
-    "pal",
-    "pallor",
-    "thc",
-    "humanist",
-    "quintet",
-    "back-issue",
-    "socially",
-    "bottlenecks",
-    "berated",
-    "tax-avoidance",
-    "hemoglobin",
-    "bullish",
-    "frowns",
-    "anticipatory",
-    "downtrodden",
-    "over-emphasize",
-    "1980",
-    "skirts",
-    "senesac",
-    "fringe",
-    "cost-data",
-    "holored",
-    "predicts",
-    "al",
-    "earrings",
-    "27",
-    "frugally",
-    "codified",
-    "ike",
-    "bonus",
-    "refreshingly",
-    "irrigate",
-    "inspirations",
-    "unthaw",
-    "important",
-    "$4,800",
-    "cromwell's",
-    "pankowski",
-    "systematically-simple",
-    "felt",
-    "migrates",
-    "dumping",
-    "nouvelle",
-    "torah",
-    "oxygen",
-    "va",
-    "strutted",
-    "rated",
-    "elaborately",
-    "asham'd",
-    "transgressed",
-    "panelization",
-    "unskilled",
-    "wynne",
-    "updated",
-    "jacob",
-    "mathewson",
-    "leadings",
-    "inventory",
-    "carters",
-    "alpharetta",
-    "befuddled",
-    "appaloosas",
-    "benevolence",
-    "ithacan",
-    "jolliffe",
-    "pizarro",
-    "parkway",
-    "prestidigitator",
-    "awfully",
-    "shipwrecked",
-    "contraceptive",
-    "intensifying",
-    "notables",
-    "grabs",
-    "aesthetes",
-    "larder",
-    "shahn",
-    "declining",
-    "hypoactive",
-    "appeared",
-    "salons",
-    "katharine's",
-    "blindly",
-    "miso",
-    "trammel",
-    "332",
-    "cashed",
-    "vernava",
-    "struggling",
-    "musician",
-    "laplace",
-    "homeric",
-    "rebel",
-    "december",
-    "treasonable",
-    "piles",
-    "macleishes",
-    "ocelot",
-    "safely",
-    "entourage",
-    "nibelungenlied",
-    "unstructured",
-    "herds",
-    "cieca",
-    "out-of-the-way",
-    "pessimistic",
-    "websterville",
-    "boxes",
-    "expansiveness",
-    "vallee",
-    "individualism",
-    "heorot",
-    "uxbridge",
-    "watterson",
-    "2,500",
-    "double-crossed",
-    "tootley-toot-tootled",
-    "retard",
-    "prime",
-    "mackinac",
-    "flocculated",
-    "seven-week",
-    "opium",
-    "faultless",
-    "ignition",
-    "prospers",
-    "guimet",
-    "airplane",
-    "doubloon",
-    "somnolence",
-    "over-the-counter",
-    "disabled",
-    "bricker",
-    "calcutta",
-    "trenchant",
-    "deck",
-    "recovered",
-    "priority",
-    "green-brown",
-    "soothe",
-    "adminstration",
-    "puncher",
-    "wind-blown",
-    "intractable",
-    "heinkel",
-    "tricked",
-    "amy",
-    "necessitated",
-    "track",
-    "lesbians",
-    "ink",
-    "interpretable",
-    "compensated",
-    "buckle-on",
-    "rotenone",
-    "courageous",
-    "scr",
-    "mid-twentieth-century",
-    "murat",
-    "experimental",
-    "keo",
-    "patrons",
-    "tested",
-    "percent",
-    "kathy",
-    "mansions",
-    "odors",
-    "shareholder",
-    "capitalists'",
-    "jitters",
-    "buildings",
-    "seaboard",
-    "muffled",
-    "pottawatomie",
-    "boltzmann",
-    "**zg",
-    "discussion",
-    "tasty",
-    "troupes",
-    "political",
-    "bella",
-    "185",
-    "extravagant",
-    "divulging",
-    "chests",
-    "visceral",
-    "titre",
-    "counterparts",
-    "landslides",
-    "coons",
-    "acquiesced",
-    "untruth",
-    "collaborator",
-    "surfaced",
-    "bean",
-    "commanded",
-    "squibb",
-    "processing",
-    "shintoism",
-    "alleviate",
-    "brooked",
-    "visage",
-    "acoustics",
-    "keel",
-    "graunt",
-    "alexeyeva",
-    "mis-reading",
-    "herter",
-    "idea-exchange",
-    "156",
-    "onward",
-    "dumbbell",
-    "ignited",
-    "borders",
-    "refunds",
-    "taller",
-    "frosts",
-    "moneys",
-    "largely",
-    "shadowed",
-    "befogged",
-    "signaling",
-    "snapshots",
-    "bulls",
-    "chien",
-    "mc.",
-    "matheson",
-    "ica's",
-    "bogged",
-    "growing-waiting",
-    "creepy",
-    "danced",
-    "truculent",
-    "tuhulhulzote",
-    "wil",
-    "kelp",
-    "diamond",
-    "kids",
-    "reputation",
-    "winging",
-    "gaming",
-    "mahayanist",
-    "spirituality",
-    "prence",
-    "moroccan",
-    "exchange",
-    "bahia",
-    "technicalities",
-    "stupidly",
-    "commoner",
-    "queens",
-    "warily",
-    "did",
-    "adequacy",
-    "painted",
-    "bellow",
-    "meditated",
-    "bone",
-    "taxicab",
-    "smaller-size",
-    "water's",
-    "fluent",
-    "encompasses",
-    "inverse",
-    "wide-eyed",
-    "fathuh",
-    "i.e.",
-    "re-thinking",
-    "dilthey",
-    "heroically",
-    "british",
-    "outlaw",
-    "tenses",
-    "762",
-    "smooching",
-    "veldt",
-    "reappear",
-    "vickers",
-    "disregarded",
-    "anniversary",
-    "bellow's",
-    "birdie",
-    "scrap",
-    "weekly",
-    "moot",
-    "consummately",
-    "comparable",
-    "lunar",
-    "tunnels",
-    "sedimentation",
-    "lifetime",
-    "yesteryear",
-    "ulbricht",
-    "grey-skied",
-    "epicycles",
-    "monuments",
-    "bereavements",
-    "undeserved",
-    "v-shaped",
-    "replace",
-    "catfish",
-    "unnerving",
-    "deputy",
-    "telegraph",
-    "ionized",
-    "cow-people",
-    "streamside",
-    "chocks",
-    "examiantion",
-    "lenin",
-    "low-voltage",
-    "non-writers",
-    "peaked",
-    "swarthy",
-    "derogate",
-    "problem",
-    "worlds",
-    "one",
-    "pettigrew's",
-    "verge",
-    "voice",
-    "ambled",
-    "micrometeorite",
-    "recoverable",
-    "sizova",
-    "deteriorating",
-    "shops",
-    "france's",
-    "knob",
-    "worshipful",
-    "attitude",
-    "unacknowledged",
-    "all-knowing",
-    "breakfast",
-    "aggressive",
-    "disbanded",
-    "hemorrhage",
-    "interrogator",
-    "used",
-    "polka",
-    "poetics",
-    "democrats",
-    "polarized",
-    "toll-rate",
-    "fichte",
-    "turnoff",
-    "stringed",
-    "induces",
-    "capitalist",
-    "icelandic",
-    "prowlers",
-    "dispossessed",
-    "quart",
-    "obligational",
-    "rapped",
-    "maximums",
-    "haaek",
-    "gloria",
-    "phagocytes",
-    "unwitting",
-    "enlightenment",
-    "continually",
-    "utilities",
-    "barr",
-    "delineating",
-    "capitalism",
-    "hobbled",
-    "kid-isoletta",
-    "reupholstering",
-    "miriani's",
-    "embarrassment",
-    "droughts",
-    "left-of-center",
-    "impelled",
-    "jesting",
-    "papiers",
-    "singsonged",
-    "rink",
-    "love-making",
-    "hemisphere",
-    "hunger",
-    "25-mile-square",
-    "gyros",
-    "buster",
-    "half-starved",
-    "entry-limiting",
-    "lenygon's",
-    "tallchief",
-    "advance",
-    "misery",
-    "acala",
-    "smu",
-    "axially",
-    "quirk",
-    "broaden",
-    "dictatorship",
-    "freud",
-    "5-mile",
-    "intermediate",
-    "hansen's",
-    "asilomar",
-    "socio-structural",
-    "abstain",
-    "atheistic",
-    "well-organized",
-    "subservient",
-    "phrase",
-    "provisions",
-    "loose-leaf",
-    "geered",
-    "monopolies",
-    "acoustic",
-    "wishing",
-    "wert's",
-    "ailment",
-    "okinawa",
-    "disengagement",
-    "liters",
-    "dead-weight",
-    "erased",
-    "hurling",
-    "nooks",
-    "ottawa",
-    "palm-studded",
-    "bonn",
-    "sweeney",
-    "tricolor",
-    "steep",
-    "pitt",
-    "homemaker",
-    "dehumanised",
-    "picked",
-    "4-day",
-    "design-side",
-    "oks",
-    "looting",
-    "undressing",
-    "shirtfront",
-    "reintroduces",
-    "overactive",
-    "tortured",
-    "medal",
-    "orchester",
-    "passengers",
-    "objection",
-    "speakership",
-    "day-to-day",
-    "carl",
-    "dell'",
-    "welcomed",
-    "grovel",
-    "speculative",
-    "lappenberg",
-    "excluded",
-    "populated",
-    "bonhoeffer",
-    "ucla",
-    "absorbency",
-    "elegantly",
-    "2:06",
-    "motivated",
-    "sanctions",
-    "hempel",
-    "compiling",
-    "danged",
-    "ivies",
-    "1934",
-    "grassroots-fueled",
-    "cathodophoretic",
-    "storming",
-    "analyzes",
-    "carbide",
-    "charges",
-    "facilities",
-    "chicagoans",
-    "bluebush",
-    "gentility",
-    "italy's",
-    "nonism",
-    "owl's",
-    "chronologically",
-    "negate",
-    "farmland",
-    "two-year",
-    "amenitskii",
-    "scorched",
-    "reid",
-    "speculation",
-    "lordship",
-    "rimini",
-    "helpfully",
-    "darnell",
-    "strands",
-    "jelke",
-    "sullenly",
-    "harburg",
-    "duck",
-    "offsaddled",
-    "half-mile",
-    "1910-14",
-    "ngandlu",
-    "end-product",
-    "players'",
-    "amigo",
-    "tormented",
-    "1789-1839",
-    "burr's",
-    "dow",
-    "iocsixg",
-    "shuddery",
-    "s-values",
-    "penance",
-    "collyer",
-    "confidant",
-    "insure",
-    "landon",
-    "vehemence",
-    "surely",
-    "'90s",
-    "amis",
-    "aab/",
-    "capricious",
-    "6-3",
-    "seduction",
-    "layman",
-    "squash",
-    "cerebral",
-    "sagged",
-    "lummus",
-    "goal-values",
-    "commonweal",
-    "poach",
-    "taffycolored",
-    "genial",
-    "metaphysic",
-    "infringement",
-    "robber",
-    "mondonville",
-    "all",
-    "pamphlets",
-    "aches",
-    "plates",
-    "university's",
-    "versus",
-    "morticians",
-    "mineral",
-    "sourly",
-    "brinkmanship",
-    "110-degrees-c",
-    "secretarial",
-    "53-year-old",
-    "tortoises",
-    "strategists",
-    "cavanagh",
-    "cuban-american",
-    "liberal",
-    "featuring",
-    "magnolia",
-    "vehicle",
-    "undetected",
-    "unblushing",
-    "overlying",
-    "escritoire",
-    "tavern",
-    "sonny-boy",
-    "chevy",
-    "palfrey",
-    "demythologize",
-    "1748",
-    "maurier",
-    "1928",
-    "mart",
-    "palazzos",
-    "amen",
-    "reconnaissance",
-    "smashing",
-    "fluids",
-    "closeness",
-    "waxworks",
-    "hotels",
-    "moon",
-    "carboloy",
-    "knocked",
-    "erickson",
-    "committee",
-    "creche",
-    "prognosis",
-    "lateran",
-    "statesmanship",
-    "unfalteringly",
-    "reporting",
-    "blanche",
-    "immodesty",
-    "conceptuality",
-    "richardson",
-    "hove",
-    "societies",
-    "misstep",
-    "fallow",
-    "turbulent",
-    "receivers",
-    "murville",
-    "punctured",
-    "motioning",
-    "brewing",
-    "robes",
-    "undergrowth",
-    "framing",
-    "assesment",
-    "alex",
-    "true-false",
-    "920",
-    "upper-",
-    "jakes",
-    "forging",
-    "tatian",
-    "aptness",
-    "reaped",
-    "rural",
-    "ten-thousand-dollar",
-    "threaded",
-    "duds",
-    "foisted",
-    "idiomatic",
-    "moll",
-    "interfering",
-    "delancy",
-    "confusin'",
-    "resistance",
-    "scripps",
-    "strasny",
-    "drop-block",
-    "factions",
-    "'60",
-    "innuendos",
-    "childish",
-    "heitschmidt",
-    "drywall",
-    "wellington",
-    "wandered",
-    "employer",
-    "tyme",
-    "unable",
-    "jug",
-    "denver's",
-    "$43,000",
-    "bedraggled",
-    "racquet",
-    "beardless",
-    "urban",
-    "paglieri's",
-    "kleiber",
-    "book-lined",
-    "cartesian",
-    "copland",
-    "full-year",
-    "home-run",
-    "gusto",
-    "sierra",
-    "achieve",
-    "6:30",
-    "outlays",
-    "stinking",
-    "order",
-    "relates",
-    "spewings",
-    "helper",
-    "runners",
-    "intangibles",
-    "mcgovern's",
-    "point-blank",
-    "wallet",
-    "runyon",
-    "tiredly",
-    "885",
-    "arithmetic",
-    "phonemes",
-    "attire",
-    "semi-heights",
-    "anger",
-    "intellectually",
-    "busch",
-    "disparity",
-    "glamorous",
-    "powers",
-    "exhausted",
-    "dump",
-    "a-z's",
-    "fussily",
-    "domicilium",
-    "cubic",
-    "handles",
-    "wolcott",
-    "contingents",
-    "stumbles",
-    "elution",
-    "honolulu",
-    "parrillo",
-    "subnormal",
-    "24%",
-    "comanche",
-    "reborn",
-    "panes",
-    "tombs",
-    "gold-phone",
-    "accelerate",
-    "rioting",
-    "memorable",
-    "unpleasantness",
-    "subjective",
-    "settings",
-    "buddha",
-    "evocations",
-    "deferments",
-    "prophet",
-    "crash",
-    "hubie's",
-    "constituent",
-    "hausman",
-    "interlobular",
-    "range",
-    "bourguiba",
-    "consider",
-    "shades",
-    "carlo",
-    "viselike",
-    "sponging",
-    "longer-lived",
-    "lights",
-    "proliferation",
-    "smug",
-    "brokenly",
-    "death",
-    "misguided",
-    "acclimatized",
-    "1,488",
-    "hairless",
-    "semi-serious",
-    "equilibriums",
-    "sow",
-    "rim",
-    "assiniboia",
-    "burlington",
-    "half-dressed",
-    "arty",
-    "arising",
-    "surfactant",
-    "herridge",
-    "berliners",
-    "well's",
-    "sabol",
-    "abberations",
-    "deviation",
-    "skillet",
-    "worcester",
-    "cloudless",
-    "frontier",
-    "tutorials",
-    "longstreet",
-    "flourishes",
-    "ostracism",
-    "siepi",
-    "horne's",
-    "scientifically-trained",
-    "chile",
-    "causing",
-    "suzerain",
-    "finger",
-    "thermistor",
-    "licked",
-    "poitrine",
-    "curtness",
-    "1,253",
-    "wetting",
-    "maplecrest",
-    "1776",
-    "pains",
-    "25,000,000",
-    "sanchez",
-    "nutrient",
-    "culminated",
-    "seraphim",
-    "opening-day",
-    "vero",
-    "1:48",
-    "skolman",
-    "19th-century",
-    "prettiness",
-    "drab",
-    "cramp",
-    "noisily",
-    "missouri-illinois",
-    "trademarks",
-    "11-year",
-    "redecorating",
-    "tractors",
-    "leopold",
-    "shorter",
-    "earnestness",
-    "customer's",
-    "cupboard",
-    "raiser",
-    "vivid",
-    "entry",
-    "incipiency",
-    "labor-management",
-    "podolia",
-    "doubtless",
-    "1891",
-    "biophysicist",
-    "hillman",
-    "accomplishing",
-    "bare-footed",
-    "fanfare",
-    "founding",
-    "trusted",
-    "solicits",
-    "colde",
-    "top-grade",
-    "moratorium",
-    "accountant",
-    "katanga",
-    "comings",
-    "x-rays",
-    "pooling",
-    "divided",
-    "frighteningly",
-    "must've",
-    "bandage",
-    "flights",
-    "body",
-    "theorem",
-    "glove",
-    "conflagration",
-    "college's",
-    "muff",
-    "peralta",
-    "getaway",
-    "snows",
-    "nutcracker",
-    "electrons",
-    "sixth-sense",
-    "gamecock",
-    "elaboration",
-    "aiding",
-    "candlewick",
-    "cosmologists",
-    "marion",
-    "intermolecular",
-    "categorize",
-    "detachment",
-    "floresville",
-    "insignificance",
-    "hypodermic",
-    "taskmaster",
-    "immanent",
-    "douglas",
-    "catering",
-    "visrhanik",
-    "lobularity",
-    "anti-discrimination",
-    "supervising",
-    "varian",
-    "cubans",
-    "tennessee",
-    "tasso",
-    "northernmost",
-    "turks",
-    "steichen",
-    "remorse",
-    "wagner's",
-    "wreck",
-    "captain",
-    "validly",
-    "warfare",
-    "cobalt",
-    "whore",
-    "hard-hit",
-    "marshall",
-    "granulocytic",
-    "susie",
-    "champion",
-    "successively",
-    "duke's",
-    "cowling",
-    "granules",
-    "telescope",
-    "bein",
-    "soothing",
-    "stewart's",
-    "coming",
-    "bishopsgate",
-    "mate",
-    "tate",
-    "percy",
-    "1881-85",
-    "consumed",
-    "temple",
-    "analyzable",
-    "pickets",
-    "acidulous",
-    "bear's",
-    "irreverence",
-    "washoe",
-    "sudden",
-    "chauffeur's",
-    "rodent",
-    "bakery",
-    "raoul",
-    "trumped-up",
-    "rehearsed",
-    "compresses",
-    "woman",
-    "internalized",
-    "resins",
-    "jules",
-    "caraway",
-    "wilted",
-    "despairingly",
-    "armisteads",
-    "sending",
-    "constitution",
-    "night's",
-    "shantung",
-    "alarmed",
-    "recipes",
-    "adjourns",
-    "nudism",
-    "photoluminescence",
-    "connally",
-    "almagest",
-    "misty-eyed",
-    "richmond",
-    "da-da-da-dum",
-    "telephoning",
-    "grindstone",
-    "chute",
-    "small-scale",
-    "inhibitory",
-    "succumbed",
-    "thigh-bone",
-    "pistol-whipped",
-    "slogans",
-    "kingstown",
-    "conciliator",
-    "veritable",
-    "so's",
-    "subjected",
-    "malice",
-    "trager",
-    "mcfeely",
-    "slaughtering",
-    "disjointed",
-    "melon",
-    "scooted",
-    "simples",
-    "dispell",
-    "packs",
-    "five-seventeen",
-    "handicrafts",
-    "marrying",
-    "guatemalan",
-    "five-and-dime",
-    "irrevocably",
-    "restrictions",
-    "yawn",
-    "procurement",
-    "mid-continent",
-    "footnote",
-    "bruise",
-    "genus",
-    "ngo",
-    "crayons",
-    "amorphous",
-    "pharmacist",
-    "u-i",
-    "delahanty",
-    "mixture",
-    "roared",
-    "permissibility",
-    "history",
-    "well-read",
-    "nine-thirty",
-    "stringy",
-    "mare",
-    "fours",
-    "lessen",
-    "permissible",
-    "half-blood",
-    "rockstrewn",
-    "loblolly",
-    "effectual",
-    "rosaries",
-    "ex-convicts",
-    "dialectically",
-    "1693",
-    "11-year-old",
-    "bulked",
-    "joust",
-    "positively",
-    "grandmother's",
-    "perrin",
-    "pepping",
-    "suspensions",
-    "4.6",
-    "platonism",
-    "invitation",
-    "credo",
-    "abetted",
-    "enervation",
-    "slumber",
-    "better-remembered",
-    "probity",
-    "grandson",
-    "sugared",
-    "ncta",
-    "painting",
-    "dana's",
-    "parenthetically",
-    "dotted",
-    "berg's",
-    "disfigured",
-    "pooched",
-    "sweeter",
-    "thanks",
-    "travesty",
-    "mounds",
-    "galloped",
-    "bruckner",
-    "maggots",
-    "n.y.u.",
-    "effected",
-    "bronchiolar",
-    "authorization",
-    "stairways",
-    "charge-excess",
-    "buncha",
-    "animated",
-    "unfathomable",
-    "time's",
-    "266-366",
-    "vies",
-    "mutually",
-    "current",
-    "seemingly",
-    "guerin",
-    "molars",
-    "1930",
-    "edgerton's",
-    "resultant",
-    "broken-nosed",
-    "fingernails",
-    "shooter",
-    "temperately",
-    "discontinuance",
-    "illuminated",
-    "punctuated",
-    "incarnate",
-    "curse",
-    "quell",
-    "maps",
-    "policing",
-    "declaration",
-    "xxxx",
-    "deerstalker",
-    "mademoiselle",
-    "ebbs",
-    "gravely",
-    "forecasts",
-    "relativist",
-    "enhance",
-    "deflated",
-    "roundups",
-    "over-large",
-    "facing",
-    "leaning",
-    "valeur",
-    "boa",
-    "sd",
-    "ridiculous",
-    "kyoto",
-    "it'll",
-    "aesthetic",
-    "choosy",
-    "francesca",
-    "diagnosis",
-    "rachmaninoff",
-    "thyrotrophin",
-    "first-floor",
-    "crimes",
-    "mid-1960",
-    "facilitates",
-    "outdo",
-    "pajamas",
-    "bite",
-    "greg's",
-    "specks",
-    "presser",
-    "sponsor's",
-    "burnt-red",
-    "seventy-five-foot",
-    "harassing",
-    "g'ahn",
-    "chennault's",
-    "herberet",
-    "roster",
-    "berteros",
-    "registration",
-    "know-nothing",
-    "baggy",
-    "lovin",
-    "interface",
-    "approves",
-    "sba's",
-    "flattered",
-    "camels",
-    "declares",
-    "intonation",
-    "taxation",
-    "searchlight",
-    "18-1/2",
-    "ordinates",
-    "beaver",
-    "periphrastic",
-    "nil",
-    "undoing",
-    "thickened",
-    "transcendence",
-    "popularity",
-    "halting",
-    "worn-faced",
-    "throats",
-    "470-degrees-c",
-    "emblematic",
-    "bijouterie",
-    "ivan",
-    "weighing",
-    "expressions",
-    "obelisk",
-    "precooked",
-    "armchairs",
-    "fallible",
-    "laodicean",
-    "boston's",
-    "subtler",
-    "1853",
-    "checklist",
-    "wondrously",
-    "60-month",
-    "1.10.8",
-    "homopolymers",
-    "druther",
-    "always-present",
-    "cartridges",
-    "animate",
-    "croaked",
-    "controversialists",
-    "refinements",
-    "lengthen",
-    "piero",
-    "9b",
-    "oneness",
-    "non-verbal",
-    "seems",
-    "auberge",
-    "goodby",
-    "chelas",
-    "judgment",
-    "$800,000",
-    "curbs",
-    "looky",
-    "birch-paneled",
-    "inquire",
-    "midstream",
-    "consumption",
-    "469",
-    "transparency",
-    "first-class",
-    "war-ridden",
-    "col.",
-    "jones-imboden",
-    "foley",
-    "nan",
-    "proof",
-    "bleary",
-    "pigeon",
-    "carreer",
-    "sufficiently",
-    "subbing",
-    "huck",
-    "protein",
-    "grimesby",
-    "wanders",
-    "europe's",
-    "polemic",
-    "county-wide",
-    "bullies",
-    "octaves",
-    "kingwood",
-    "levitt",
-    "godwin",
-    "stored",
-    "mellal",
-    "cubs",
-    "resources",
-    "debuting",
-    "'fess",
-    "pointing",
-    "stained-glass",
-    "viscosity",
-    "realms",
-    "way",
-    "soubriquet",
-    "wash",
-    "remanded",
-    "sanctam",
-    "eutectic",
-    "ethic",
-    "rasp",
-    "tultul",
-    "interacts",
-    "molecules",
-    "suppress",
-    "sigma",
-    "rostagnos",
-    "unrealism",
-    "all-american",
-    "stoneware",
-    "gentlemen",
-    "drawing-rooms",
-    "shepherds",
-    "lowered",
-    "styka",
-    "squashy",
-    "gaston",
-    "excitatory",
-    "chris",
-    "deviants",
-    "offices",
-    "janitor",
-    "dross",
-    "sedgwick",
-    "tethered",
-    "ferreted",
-    "clinton",
-    "effectuate",
-    "dodge",
-    "monotony",
-    "b'dikkat",
-    "draper",
-    "fucks",
-    "eastland",
-    "vice-regent",
-    "obsequies",
-    "drift",
-    "nischwitz'",
-    "defender",
-    "16,000",
-    "conceding",
-    "knows",
-    "warnings",
-    "anterior",
-    "orzae",
-    "inventories",
-    "lavishly",
-    "insufficient",
-    "curve",
-    "tasmania",
-    "gloriously",
-    "crescendo",
-    "historicity",
-    "cawing",
-    "southerner",
-    "subpenaed",
-    "non-authoritative",
-    "journalism",
-    "tullio",
-    "cavemen",
-    "spanned",
-    "tiepolo",
-    "280",
-    "charm",
-    "ninth",
-    "foster",
-    "wintry",
-    "autocracies",
-    "imcomparable",
-    "patina",
-    "birthed",
-    "statistics",
-    "wisenheimer",
-    "mulligan",
-    "dissimilar",
-    "$100",
-    "ultimate",
-    "braids",
-    "howorth",
-    "endearment",
-    "rivalries",
-    "semmes",
-    "dollarette",
-    "hoijer's",
-    "phosphorus-bridged",
-    "cigar",
-    "thermodynamics",
-    "grade-equivalent",
-    "maguire",
-    "onto",
-    "relinquishing",
-    "fail-safe",
-    "schema",
-    "picasso",
-    "u.m.c.i.a.",
-    "delay",
-    "wartorn",
-    "mooring",
-    "leaky",
-    "lanky",
-    "boxwood",
-    "enchanted",
-    "$5,000",
-    "t",
-    "hijacking",
-    "out",
-    "intend",
-    "mammalian",
-    "drawled",
-    "gesangverein",
-    "self-consciousness",
-    "third",
-    "forbears",
-    "$200,000",
-    "nay",
-    "falmouth",
-    "fires",
-    "sighs",
-    "hungry",
-    "coveted",
-    "furniture",
-    "312",
-    "entitles",
-    "fha",
-    "crewel",
-    "minoso",
-    "200-odd",
-    "terrestial",
-    "double-talk",
-    "roads",
-    "housing",
-    "emphatically",
-    "meager",
-    "successors",
-    "glands",
-    "venezuelan",
-    "inlet",
-    "rows",
-    "fierceness",
-    "impersonation",
-    "parent",
-    "peep",
-    "promotion",
-    "newest",
-    "australites",
-    "agamemnon",
-    "whooping",
-    "jews",
-    "seerey",
-    "tomblike",
-    "palazzo",
-    "lioness",
-    "meddle",
-    "strand",
-    "$10.50",
-    "dervishes",
-    "numerical",
-    "provenance",
-    "realistic",
-    "shadowy",
-    "learns",
-    "lucks",
-    "opposite",
-    "2:06.1",
-    "slide-lock",
-    "haint",
-    "pyrex",
-    "diseases",
-    "darkening",
-    "discharged",
-    "clamorous",
-    "olatunji",
-    "gates",
-    "exasperatingly",
-    "cone-sphere",
-    "1105",
-    "sun-browned",
-    "mineral-rich",
-    "sampling",
-    "immigration",
-    "traditionnel",
-    "unmurmuring",
-    "aiming",
-    "compact",
-    "batista's",
-    "indirect",
-    "homecomings",
-    "1952-1958",
-    "saddled",
-    "asiatic",
-    "bravo",
-    "disentangle",
-    "senora",
-    "farmwife's",
-    "corder",
-    "outgrow",
-    "rifles",
-    "all-purpose",
-    "annihilate",
-    "reappearance",
-    "kicks",
-    "underestimated",
-    "pietism",
-    "grosvenor",
-    "concretely",
-    "strategy",
-    "much-needed",
-    "home-city",
-    "muller",
-    "prognostication",
-    "ports",
-    "timmy",
-    "alternative",
-    "classmates",
-    "precaution",
-    "relevant",
-    "vinyl",
-    "trespasses",
-    "communist-led",
-    "rigorously",
-    "concessionaire",
-    "two-seaters",
-    "utopian",
-    "red-turbaned",
-    "monotonous",
-    "homogeneity",
-    "superimpose",
-    "hypophysectomised",
-    "correlation",
-    "separation",
-    "time-cast",
-    "frightfully",
-    "heaves",
-    "recalled",
-    "lili",
-    "solved",
-    "dallas-headquartered",
-    "dare-base",
-    "presume",
-    "hardings",
-    "wratten",
-    "ingratitoode",
-    "130",
-    "21-2",
-    "forty-second",
-    "kristallstrukturen",
-    "sam",
-    "brookmont",
-    "float",
-    "ritter's",
-    "yd.",
-    "guild",
-    "hideously",
-    "inquisitive",
-    "workmanlike",
-    "stubblefield",
-    "wabash",
-    "gouge",
-    "antecedent",
-    "stung",
-    "big-league",
-    "songbag",
-    "unstapled",
-    "10.2",
-    "lords",
-    "juicy",
-    "cordon",
-    "declaimed",
-    "margin",
-    "affiliation",
-    "pageant",
-    "clobbers",
-    "1000-m-diameter",
-    "sibley",
-    "102",
-    "chronic",
-    "overexploited",
-    "tiefes",
-    "megalopolises",
-    "conspiracies",
-    "sustain",
-    "enrichment",
-    "turtlebacks",
-    "intellectual",
-    "exhusband",
-    "lion",
-    "occur",
-    "locked",
-    "hoisted",
-    "mouthing",
-    "double-married",
-    "beverage",
-    "mesta",
-    "compendium",
-    "nightclubs",
-    "hessians",
-    "arbitrate",
-    "seaquake",
-    "foggia",
-    "analysis",
-    "licensing",
-    "impossibility",
-    "acidity",
-    "up-pp",
-    "advertisements",
-    "unachieved",
-    "stepping",
-    "dog's",
-    "sours",
-    "wagged",
-    "multiphastic",
-    "lifeguards",
-    "lodge",
-    "doppler",
-    "171",
-    "fairs",
-    "watchmaker",
-    "wallboard",
-    "wreathed",
-    "driven",
-    "intercede",
-    "profound",
-    "corrode",
-    "she'arim",
-    "blue-black",
-    "abstractors",
-    "fluctuations",
-    "thirty-sixth",
-    "grandma's",
-    "therapeutic",
-    "aspis",
-    "holystones",
-    "stafford",
-    "post-serialism",
-    "manchester",
-    "blind-folded",
-    "declarations",
-    "c",
-    "unstuffy",
-    "grain",
-    "undivided",
-    "precepts",
-    "inquiry",
-    "pencils",
-    "shippin'",
-    "wolpe",
-    "non-color",
-    "ham",
-    "jenny's",
-    "captives",
-    "sprains",
-    "corduroy",
-    "northeast",
-    "inherently",
-    "consanguineous",
-    "generated",
-    "hoofs",
-    "deep-sounding",
-    "omits",
-    "criticisms",
-    "absoluteness",
-    "thiamin",
-    "pelham",
-    "halo",
-    "marathon",
-    "remodeling",
-    "burghley",
-    "leagued",
-    "impressions",
-    "carriage-step",
-    "streak",
-    "good-humoredly",
-    "simba",
-    "warless",
-    "fat",
-    "elliott",
-    "god-given",
-    "wearily",
-    "honeymooned",
-    "lapidary",
-    "graze",
-    "reinstitution",
-    "sabbath",
-    "362",
-    "girlie",
-    "kershbaum",
-    "responsible",
-    "rabble",
-    "imperial",
-    "tift",
-    "seeker",
-    "onsets",
-    "profile",
-    "same",
-    "specific",
-    "forlorn",
-    "deux",
-    "harvie",
-    "advertisement",
-    "snacks",
-    "mania",
-    "exploratory",
-    "gun-slinging",
-    "pullmans",
-    "senses",
-    "pseudo-feeling",
-    "doctor",
-    "barrack",
-    "kick-up",
-    "linkage",
-    "ultracentrifugation",
-    "helpmate",
-    "fifteen-minute",
-    "inspiring",
-    "asses",
-    "dupont",
-    "abbot",
-    "baptist's",
-    "interferometers",
-    "associations",
-    "gogol's",
-    "fondness",
-    "plywood",
-    "mazurka",
-    "disrespect",
-    "re-assumed",
-    "submissions",
-    "communiques",
-    "yet",
-    "optimo",
-    "penned",
-    "1892",
-    "headroom",
-    "mourners",
-    "painlessly",
-    "marrowbones",
-    "yujobo",
-    "theology",
-    "impulse",
-    "mennonites",
-    "inches",
-    "climbs",
-    "submit",
-    "bulletins",
-    "aware",
-    "anti-missile",
-    "waspishly",
-    "repercussions",
-    "dispositions",
-    "50%",
-    "easily",
-    "discredit",
-    "automated",
-    "diminishes",
-    "justinian",
-    "socks",
-    "generators",
-    "rodeos",
-    "customary",
-    "fifteen-mile",
-    "seventy-two",
-    "rifle-shotgun",
-    "despatched",
-    "promenade",
-    "twenty-first",
-    "divider",
-    "farm",
-    "venti",
-    "thorp",
-    "pioneers",
-    "chemise",
-    "douce",
-    "maximal",
-    "goodwin",
-    "shu",
-    "sets",
-    "14th",
-    "entreated",
-    "sky-god",
-    "dewy-eyed",
-    "refocusing",
-    "constructive",
-    "defeatists",
-    "moors",
-    "big-business",
-    "chiseled",
-    "whopping",
-    "dusting",
-    "turban",
-    "immodest",
-    "50-megaton",
-    "d-night",
-    "geriatric",
-    "biographical",
-    "two-disc",
-    "land-based",
-    "avc",
-    "fuhrer",
-    "skipped",
-    "booklet",
-    "basler",
-    "rubbing",
-    "fizzled",
-    "gooshey",
-    "bats",
-    "textile",
-    "accuses",
-    "chronicled",
-    "wetness",
-    "you'd",
-    "ladies",
-    "mayo",
-    "millimeter",
-    "ugh",
-    "insertions",
-    "advocated",
-    "fore-play",
-    "reputed",
-    "chinese-inspired",
-    "25-liter",
-    "vicissitudes",
-    "skillful",
-    "terror",
-    "kitti",
-    "copernicus-the-astronomer",
-    "robbery",
-    "blended",
-    "froth",
-    "biochemical",
-    "officered",
-    "amory",
-    "hilar",
-    "nomination",
-    "2:04.2",
-    "flames",
-    "preposition",
-    "hans'",
-    "left-hand",
-    "coherent",
-    "conscientious",
-    "owners'",
-    "shotshells",
-    "gloomy",
-    "friedman",
-    "four-thirty",
-    "caps",
-    "sub-zero",
-    "foodstuffs",
-    "omitted",
-    "opposed",
-    "banker",
-    "reviewers",
-    "dynafac",
-    "tom's",
-    "abo",
-    "mussolinis",
-    "industrially",
-    "gontran",
-    "symbolize",
-    "blazer",
-    "hands-off-all-sweets",
-    "disasters",
-    "e.",
-    "grate",
-    "spurdle",
-    "dusted",
-    "interrogation",
-    "whoa",
-    "demythologized",
-    "firebug",
-    "bigger",
-    "hawthorne",
-    "audience",
-    "thought",
-    "knightes",
-    "six-gallon",
-    "encroach",
-    "practised",
-    "childless",
-    "buddhist",
-    "directs",
-    "brandon's",
-    "defines",
-    "spaced",
-    "deliberations",
-    "commonness",
-    "joke",
-    "adios-rena",
-    "makepeace",
-    "gripped",
-    "tannenbaum",
-    "glowed",
-    "unluckily",
-    "laendler",
-    "exploiting",
-    "contaminated",
-    "thwart",
-    "breakfasted",
-    "372",
-    "$214",
-    "green",
-    "almond",
-    "emergent",
-    "alimony",
-    "d8",
-    "reddened",
-    "sinusoidal",
-    "reflect",
-    "trumpeter",
-    "department's",
-    "demodocus",
-    "falloff",
-    "duped",
-    "low-power",
-    "highland",
-    "exceeded",
-    "public-spirited",
-    "routed",
-    "brown-paper",
-    "certifying",
-    "witnessing",
-    "travelers",
-    "bibliography",
-    "deactivation",
-    "ibrahim",
-    "scarcely",
-    "typhoid",
-    "branchville",
-    "chowder",
-    "stand-ups",
-    "kimmell",
-    "minoan-mycenaean",
-    "schoolmaster's",
-    "inexpressibly",
-    "dynasts",
-    "pam",
-    "seahorse",
-    "inexperience",
-    "packages",
-    "pen",
-    "matamoras",
-    "glance",
-    "intonaco",
-    "ambulances",
-    "grit-impregnated",
-    "provision",
-    "prentice's",
-    "rag",
-    "pandelli's",
-    "cigars",
-    "cabbage",
-    "establishments",
-    "tearfully",
-    "steels",
-    "babin",
-    "2.325%",
-    "manufactures",
-    "lamp",
-    "fall",
-    "punishments",
-    "affectionate",
-    "moonlike",
-    "unimproved",
-    "250,000",
-    "hot-honey",
-    "deegan's",
-    "calibrations",
-    "batwings",
-    "heel-holiday",
-    "versions",
-    "rifleman's",
-    "ticonderoga",
-    "retaliation",
-    "improbable",
-    "gentile",
-    "shangri-la",
-    "lads",
-    "decry",
-    "1964",
-    "seceded",
-    "considerations",
-    "alginates",
-    "swiftness",
-    "nourishment",
-    "lingering",
-    "supersonic",
-    "climates",
-    "age-and-sex",
-    "horselike",
-    "ist",
-    "mediums",
-    "beethoven",
-    "future-day",
-    "unlaced",
-    "northward",
-    "trails",
-    "adventists'",
-    "scene",
-    "rank-and-file",
-    "brightened",
-    "deras",
-    "kedgeree",
-    "involves",
-    "habitants",
-    "ancel",
-    "weaken",
-    "antiquity",
-    "brazos",
-    "prossed",
-    "wharton",
-    "bumming",
-    "desultory",
-    "protestant-dominated",
-    "reassure",
-    "195",
-    "acolyte",
-    "cadaver",
-    "estimate",
-    "freaks",
-    "sportsmen",
-    "holloway",
-    "frise",
-    "stuffed",
-    "'60s",
-    "aiee",
-    "bullshit",
-    "messing",
-    "bloch",
-    "doldrums",
-    "motivating",
-    "registry",
-    "adrien",
-    "new-waver",
-    "interne",
-    "joyride",
-    "encounters",
-    "honeymoon",
-    "buffets",
-    "vanguard",
-    "anderson",
-    "gorshin",
-    "olive",
-    "closeup",
-    "haec",
-    "supplementary",
-    "manic",
-    "soaps",
-    "dropouts",
-    "seekin'",
-    "hegemony",
-    "yield",
-    "bathe",
-    "gesamtkunstwerke",
-    "lightens",
-    "researchers",
-    "4,000",
-    "tansy",
-    "iniquities",
-    "strongly",
-    "democratization",
-    "morphological",
-    "passable",
-    "televised",
-    "inefficient",
-    "ill-conceived",
-    "sunbonnet",
-    "careened",
-    "strapped",
-    "grammatically",
-    "atune",
-    "disk",
-    "delegates'",
-    "derivative",
-    "beckett's",
-    "manipulate",
-    "heavy-weight",
-    "sludge",
-    "dies",
-    "starving",
-    "self-image",
-    "initiate",
-    "petitioner's",
-    "hackwork",
-    "swimmers",
-    "reconditioning",
-    "staunchest",
-    "enables",
-    "region",
-    "1/2",
-    "rape",
-    "492",
-    "$550",
-    "expansion-contraction",
-    "vasa",
-    "force's",
-    "low-lying",
-    "impotence",
-    "incidentally",
-    "whirl",
-    "gel",
-    "70-mile-long",
-    "naw",
-    "achieving",
-    "weathering",
-    "half-forgotten",
-    "heinze",
-    "equalize",
-    "handyman-carpenter",
-    "red-light",
-    "joiner",
-    "child-rearing",
-    "relentlessly",
-    "shortest",
-    "winnipesaukee",
-    "scarcity",
-    "balustrade",
-    "1933",
-    "arbeitskommando",
-    "hothouse",
-    "soldierly",
-    "precedence",
-    "cudkowicz",
-    "blot",
-    "sawing",
-    "harveys",
-    "coroner",
-    "pop'lar",
-    "fernberger",
-    "crumbling",
-    "meriwether",
-    "catchwords",
-    "outpouring",
-    "conservatives",
-    "payne's",
-    "invested",
-    "lumen/watt",
-    "ineligible",
-    "minerals",
-    "printemps",
-    "snack",
-    "immunoelectrophoresis",
-    "horn-rim",
-    "dali",
-    "half-darkness",
-    "extra-curricular",
-    "9.8",
-    "hemphill",
-    "beckman",
-    "manikin",
-    "mingling",
-    "stifled",
-    "voltages",
-    "capo",
-    "erection",
-    "tariff",
-    "949",
-    "pays",
-    "dilys",
-    "postponed",
-    "all-american-boy",
-    "insularity",
-    "unspoken",
-    "swathed",
-    "calif.",
-    "46",
-    "borneo",
-    "horse-radish",
-    "rostagno",
-    "pursues",
-    "jacinto",
-    "post-operative",
-    "stuff",
-    "nolens",
-    "couple",
-    "offhand",
-    "upstanding",
-    "anthony's",
-    "intergroup",
-    "cap",
-    "suzuki",
-    "wilkinson",
-    "merchant",
-    "undisputed",
-    "two-colored",
-    "winfield",
-    "iodinate",
-    "strainin'",
-    "presley",
-    "schoolgirls",
-    "gobbledygook",
-    "b-52s",
-    "horrifyingly",
-    "registrants",
-    "speak-easy",
-    "meanwhile",
-    "hymen",
-    "prussia",
-    "amici",
-    "coexistent",
-    "unsung",
-    "opener",
-    "revolt",
-    "coriander",
-    "arriving",
-    "cures",
-    "monologist",
-    "permitting",
-    "haul",
-    "dist.",
-    "shockwave",
-    "two-stem",
-    "refinance",
-    "commandeering",
-    "structure",
-    "siamese",
-    "liz",
-    "divination",
-    "400-kc.",
-    "bondage",
-    "bernhard",
-    "exacts",
-    "exploitation",
-    "organizing",
-    "supplemental",
-    "cibula's",
-    "submarine",
-    "ecumenicists",
-    "coincidence",
-    "flooring",
-    "duvol",
-    "sustains",
-    "168",
-    "sophisticate",
-    "judicious",
-    "scraps",
-    "announcing",
-    "0.95",
-    "cycly",
-    "invited",
-    "hauls",
-    "leavitt's",
-    "30",
-    "moulton",
-    "recreating",
-    "hookworm",
-    "ingratiating",
-    "$253,355,000",
-    "sayin'",
-    "brady",
-    "red-prone",
-    "boggled",
-    "instrument",
-    "conversational",
-    "pokerfaced",
-    "biases",
-    "tribuna",
-    "shitts",
-    "twins'",
-    "conic",
-    "trollop",
-    "orkney",
-    "agents",
-    "appliques",
-    "bran",
-    "sub-surface",
-    "fieldmice",
-    "perfidious",
-    "delimit",
-    "interaxial",
-    "childhood's",
-    "rubber",
-    "lang",
-    "straightaway",
-    "credits",
-    "uncompromising",
-    "fuzzy",
-    "epiphany",
-    "skulk",
-    "regulatory",
-    "ingredient",
-    "palpably",
-    "20-degrees-c",
-    "feed",
-    "personality",
-    "$3,500,000",
-    "lemons",
-    "habe",
-    "bombing",
-    "longer-term",
-    "advises",
-    "impressive",
-    "clumsily",
-    "rope",
-    "mortal",
-    "talkative",
-    "memorizing",
-    "conductors",
-    "fragrant",
-    "blackwell",
-    "deglycerolized",
-    "drinks",
-    "bewilderedly",
-    "congressman's",
-    "belated",
-    "bessie",
-    "cooling-heating",
-    "hubby",
-    "$1.8",
-    "personae",
-    "focal",
-    "particularistic-seeming",
-    "impenetrable",
-    "admirers",
-    "prescriptive",
-    "available",
-    "warranty",
-    "whig",
-    "2:00.3",
-    "art-filled",
-    "highfield",
-    "captured",
-    "infallible",
-    "schaack",
-    "emil",
-    "responses",
-    "specialists",
-    "cocktail",
-    "moderate-income",
-    "federico",
-    "1890",
-    "vermont's",
-    "ogled",
-    "2,417",
-    "greenish",
-    "24-year-old",
-    "mississippians",
-    "burt",
-    "120,000",
-    "1678",
-    "brushy",
-    "pincian",
-    "financier",
-    "rainbow-hued",
-    "monsieur",
-    "collars",
-    "memoirs",
-    "klauber",
-    "inland",
-    "wbai",
-    "seven-shot",
-    "scoreboards",
-    "incongruous",
-    "sky",
-    "confuted",
-    "sari",
-    "hallmarks",
-    "chautauqua",
-    "alter",
-    "plaque",
-    "speedy",
-    "fried",
-    "archaeological",
-    "solid",
-    "debris",
-    "adsorbed",
-    "peroxide",
-    "pre-easter",
-    "fine-feathered",
-    "banded",
-    "9230",
-    "interlude",
-    "guitar-strumming",
-    "serviettes",
-    "bull-like",
-    "2:12",
-    "nonpayment",
-    "churchmen",
-    "protected",
-    "pre-assault",
-    "larks",
-    "1900's",
-    "evidenced",
-    "blister",
-    "circonscription",
-    "half-acceptance",
-    "bulge",
-    "definable",
-    "high-school",
-    "nearby",
-    "blanchard",
-    "aunts",
-    "welcomes",
-    "injected",
-    "woodside",
-    "taxpayers",
-    "sawmill",
-    "effloresce",
-    "fishes",
-    "miss",
-    "invoking",
-    "gillis",
-    "regained",
-    "shiny",
-    "supt.",
-    "armond",
-    "detonating",
-    "breathes",
-    "imputed",
-    "imagined",
-    "playwriting",
-    "too-large",
-    "sobered",
-    "capote",
-    "adroitness",
-    "killebrew",
-    "roswell",
-    "proteins",
-    "initiative",
-    "donation",
-    "haughtily",
-    "homogenize",
-    "harve",
-    "mccrady",
-    "hodges",
-    "currys",
-    "georgian",
-    "substitution",
-    "chuck-a-luck",
-    "influence",
-    "mort",
-    "1665.32",
-    "48",
-    "forswears",
-    "bombs",
-    "disillusioning",
-    "pill",
-    "victories",
-    "nordstrom",
-    "redondo",
-    "reservoirs",
-    "curd",
-    "defendant's",
-    "kinship",
-    "characteristic",
-    "pontissara",
-    "popularism",
-    "hurts",
-    "creators",
-    "poverty",
-    "variety",
-    "middle-aged",
-    "golfers",
-    "perez",
-    "serial",
-    "supervisors",
-    "traders",
-    "contract-negotiation",
-    "a-gracious",
-    "kidnapping",
-    "mismanaged",
-    "fluttered",
-    "challenge",
-    "gaynor",
-    "embryo",
-    "spokesmen",
-    "empires",
-    "whole-wheat",
-    "lettered",
-    "homesteaders",
-    "penna.",
-    "allurement",
-    "roar",
-    "torque",
-    "turbines",
-    "regrettable",
-    "bohart",
-    "allowance",
-    "argos",
-    "orphanage",
-    "apollonian",
-    "mortgages",
-    "trustingly",
-    "virginia's",
-    "lustful",
-    "direct-sum",
-    "channel",
-    "tuttle's",
-    "mastiff",
-    "post-attack",
-    "interference-like",
-    "regrets",
-    "wheeler's",
-    "icbm",
-    "polities",
-    "caleb",
-    "presumption",
-    "per",
-    "silenced",
-    "thus",
-    "sport",
-    "tooth",
-    "manufacturer",
-    "psychopharmacological",
-    "memoranda",
-    "stimulations",
-    "nudged",
-    "compounding",
-    "feather",
-    "nobility",
-    "rip-roaring",
-    "cared",
-    "442",
-    "straggling",
-    "geroge",
-    "canons",
-    "kiwanis",
-    "khrushchev",
-    "alternated",
-    "pastels",
-    "contacting",
-    "transports",
-    "reputations",
-    "sceneries",
-    "deathward",
-    "cmdr.",
-    "hyperbolically",
-    "lettermen",
-    "fete",
-    "northern",
-    "kruger",
-    "salsich",
-    "shelf",
-    "off-flavors",
-    "$12.50",
-    "realistically",
-    "libertine",
-    "carols",
-    "copy",
-    "ainsley",
-    "site",
-    "able",
-    "gram",
-    "philantrophy",
-    "generals",
-    "nocturnal",
-    "pastimes",
-    "astringent",
-    "warhead",
-    "reconsideration",
-    "apple-tree",
-    "producers",
-    "centuries",
-    "curtains",
-    "reopen",
-    "saws",
-    "absolute",
-    "cattlemen",
-    "timen",
-    "posing",
-    "refuse",
-    "rall",
-    "rue",
-    "kilowatts",
-    "mollified",
-    "thirty-eighth",
-    "in-state",
-    "eleven",
-    "courthouse",
-    "klemperer's",
-    "bossed",
-    "27th",
-    "horsepower",
-    "381",
-    "i.l.",
-    "legacies",
-    "erroneously",
-    "playmates",
-    "altenburg",
-    "deutsch",
-    "trial",
-    "wrenched",
-    "carefulness",
-    "tempted",
-    "aunt",
-    "re-scheduled",
-    "palatable",
-    "implausibly",
-    "sway",
-    "stilted",
-    "ignore",
-    "diddle",
-    "adele",
-    "vernon's",
-    "bevor",
-    "still",
-    "purled",
-    "uninitiate",
-    "cabrini",
-    "oust",
-    "goal-oriented",
-    "470",
-    "chevalier",
-    "keening",
-    "foothills",
-    "y'all",
-    "heave",
-    "hallucinating",
-    "zoologist",
-    "purest",
-    "overalls",
-    "yucca",
-    "planets",
-    "brought",
-    "cimabue",
-    "foreclosed",
-    "down-and-outers",
-    "petitioned",
-    "logarithms",
-    "frankford",
-    "unsolved",
-    "endangered",
-    "economize",
-    "a.i.d.",
-    "798",
-    "satan",
-    "tool-and-die",
-    "fenced",
-    "bestselling",
-    "portray",
-    "hollowness",
-    "best-educated",
-    "fiorello",
-    "culprit",
-    "diverting",
-    "furiouser",
-    "0.12",
-    "calorie-heavy",
-    "golden",
-    "7.6%",
-    "whitman's",
-    "corporation",
-    "free-burning",
-    "spills",
-    "ruin",
-    "speculated",
-    "$7",
-    "hastings",
-    "gpd",
-    "beware",
-    "adios-trustful",
-    "textual",
-    "buffs",
-    "aroma",
-    "putains",
-    "oakes",
-    "mckee",
-    "sequestration",
-    "salesman's",
-    "blacked",
-    "segovia's",
-    "wholeness",
-    "clairvoyance",
-    "expounding",
-    "cadesi",
-    "15-",
-    "stratford's",
-    "holty",
-    "dissonances",
-    "subjects",
-    "anxious",
-    "linguist",
-    "telegraphing",
-    "disreputable",
-    "beatings",
-    "1947",
-    "gabriel's",
-    "destination",
-    "fumbling",
-    "trenches",
-    "jeopardize",
-    "declivity",
-    "scarborough",
-    "diaries",
-    "exhilarating",
-    "mementos",
-    "cortege",
-    "pretending",
-    "staffing",
-    "dutifully",
-    "areaways",
-    "chairmen",
-    "bishops'",
-    "thirty-caliber",
-    "distant",
-    "separate",
-    "dot",
-    "aqua-lung",
-    "outlaws",
-    "discernible",
-    "gamma",
-    "apportioned",
-    "irony",
-    "cheered",
-    "cylinder",
-    "divest",
-    "chickasaws",
-    "wines",
-    "quirking",
-    "measles",
-    "kodaks",
-    "injuns",
-    "shallowness",
-    "coliseum",
-    "buoys",
-    "kikiyus",
-    "29-5",
-    "quadric",
-    "frozen",
-    "rand",
-    "nietzsche",
-    "baylor",
-    "unnamed",
-    "spray-dried",
-    "outrageous",
-    "non-dissonant",
-    "deduction",
-    "conciliatory",
-    "carraway",
-    "swoops",
-    "gyration",
-    "bandon",
-    "imitating",
-    "twins",
-    "restoring",
-    "christ-like",
-    "3/64''",
-    "indulgence",
-    "bechhofer",
-    "pin-point",
-    "longing",
-    "excusable",
-    "paradigms",
-    "sloppy",
-    "faze",
-    "peace",
-    "timeworn",
-    "hampshire",
-    "prai",
-    "babel",
-    "leaded",
-    "sabras",
-    "hildy",
-    "deposit",
-    "oak-log",
-    "mind's",
-    "bidding",
-    "germs",
-    "diphosphopyridine",
-    "mathematician",
-    "monies",
-    "tilts",
-    "unappreciated",
-    "tollhouse",
-    "yorkers",
-    "adjuncts",
-    "nature",
-    "gilkson",
-    "stitch",
-    "alleviation",
-    "tiburon",
-    "garson",
-    "crosswise",
-    "a.",
-    "scandinavian",
-    "840,503",
-    "eleventh",
-    "forever-cathy",
-    "dusty-green",
-    "detached",
-    "solesmes",
-    "crouchin'",
-    "rises",
-    "dry-gulchin'",
-    "complaining",
-    "256",
-    "patio",
-    "cheerfully",
-    "kulturbund",
-    "condensed",
-    "tufts",
-    "fluting",
-    "22-acre",
-    "obsesses",
-    "assume",
-    "grazed",
-    "unmixed",
-    "wylie",
-    "scrupulously",
-    "eel",
-    "effective",
-    "stags",
-    "nike-zeus",
-    "mountains",
-    "shouts",
-    "cheated",
-    "constricted",
-    "unqualifiedly",
-    "musical",
-    "years",
-    "insidiously",
-    "staff",
-    "2.4",
-    "hurried",
-    "clanged",
-    "thatt",
-    "politically",
-    "silicate",
-    "musculature",
-    "fogg's",
-    "life-and-death",
-    "2-year-old",
-    "deprivation",
-    "schuylkill",
-    "enact",
-    "awkwardness",
-    "passed",
-    "personally-owned",
-    "traditionalism",
-    "sculptured",
-    "142",
-    "searchings",
-    "preceeding",
-    "tractor-trailer",
-    "well-house",
-    "discontinuity",
-    "hypervelocity",
-    "notifying",
-    "senate",
-    "1833",
-    "antisocial",
-    "psychological-intellectual",
-    "6",
-    "dicke",
-    "doomsday",
-    "marcel's",
-    "encouragingly",
-    "hereunto",
-    "ditty",
-    "carboxy-labeled",
-    "calmness",
-    "souvenir",
-    "foreign-policy",
-    "total",
-    "directives",
-    "ruddiness",
-    "tweed",
-    "remonstrate",
-    "desegregation-from-court-order",
-    "bush",
-    "hailstorm",
-    "technician",
-    "handkerchief",
-    "filbert",
-    "snuffed",
-    "tease",
-    "eluding",
-    "cha-chas",
-    "minns",
-    "sadness",
-    "reap",
-    "cellulose",
-    "joys",
-    "hardly",
-    "bucking",
-    "raillery",
-    "wolcyrz",
-    "protozoan",
-    "roiling",
-    "immense",
-    "luis",
-    "liberal-radical",
-    "tensional",
-    "commercially",
-    "libertarians",
-    "huddling",
-    "medically",
-    "overlapped",
-    "tahse's",
-    "slouch",
-    "slowing",
-    "settling",
-    "half-century",
-    "pepperoni",
-    "orchestra's",
-    "indolent",
-    "seton",
-    "discloses",
-    "numbering",
-    "commentator",
-    "pupates",
-    "newburyport",
-    "doo",
-    "apprehensions",
-    "substerilization",
-    "collaborate",
-    "sing's",
-    "expeditiously",
-    "donnell",
-    "blizzard",
-    "conformations",
-    "rothko",
-    "overburden",
-    "tartary",
-    "brooding",
-    "myths",
-    "curled",
-    "solitudes",
-    "rethink",
-    "utah",
-    "retrieve",
-    "pualani",
-    "nourished",
-    "genuine",
-    "nutritional",
-    "released",
-    "alleviating",
-    "money-fed",
-    "i.m.f.",
-    "fifties",
-    "bosom",
-    "didn't",
-    "assistant",
-    "diarrhea",
-    "omsk",
-    "tamper",
-    "baroness",
-    "homemaster",
-    "investigators",
-    "railing",
-    "105,000",
-    "synthesis",
-    "madstones",
-    "radically",
-    "cyclades",
-    "fosterites",
-    "greatcoat",
-    "occupied",
-    "tragedies",
-    "navels",
-    "disguise",
-    "philharmonique",
-    "gathering-in",
-    "thiouracil",
-    "boyhood",
-    "essays",
-    "terminate",
-    "mckinney",
-    "clam",
-    "something",
-    "muddied",
-    "developer",
-    "forays",
-    "governed",
-    "gusts",
-    "gene",
-    "sirens",
-    "particulate",
-    "casca",
-    "trend",
-    "classically",
-    "frequently",
-    "bombproof",
-    "hop-skipped",
-    "chisholm",
-    "confucius",
-    "damn",
-    "sky-reaching",
-    "respectful",
-    "caricatured",
-    "randall",
-    "natal",
-    "seven-iron",
-    "'most",
-    "onetime",
-    "grownups'",
-    "arrangement",
-    "b.'s",
-    "greenhouse",
-    "weaker",
-    "thursday",
-    "office",
-    "worldwide",
-    "graybeards",
-    "ghana",
-    "offenbach's",
-    "commonplaces",
-    "howled",
-    "yarrow",
-    "1,900",
-    "david's",
-    "condensation",
-    "many-sided",
-    "equinox",
-    "lenygon",
-    "proportionality",
-    "worn-out",
-    "resurrection",
-    "gelatin-like",
-    "wall",
-    "oersted",
-    "status",
-    "land-rover",
-    "debates",
-    "whole-house",
-    "smoke-stained",
-    "prosodies",
-    "figured",
-    "maladroit",
-    "amp",
-    "fleawort",
-    "dip",
-    "sphere",
-    "squashing",
-    "lean",
-    "strange",
-    "vex",
-    "minutiae",
-    "cautioned",
-    "massacre",
-    "gracie",
-    "anchors",
-    "exactly",
-    "overdeveloped",
-    "researching",
-    "awaited",
-    "treaties",
-    "westerner",
-    "protested",
-    "rockefeller",
-    "germany",
-    "cost-raising",
-    "identifications",
-    "rough-housing",
-    "campaigning",
-    "lawmen",
-    "screeched",
-    "abstrusenesses",
-    "deductive",
-    "informant",
-    "hengesbach",
-    "malposed",
-    "helva",
-    "viyella",
-    "germinal",
-    "jussel",
-    "kinsey",
-    "hoist",
-    "lenient",
-    "irruptions",
-    "belied",
-    "unseasonable",
-    "mortar",
-    "hunt",
-    "yugoslav",
-    "hillsdale",
-    "aerates",
-    "home-and-home",
-    "spiced",
-    "celebrates",
-    "polarity",
-    "reminders",
-    "shuttled",
-    "canny",
-    "254",
-    "caricaturist",
-    "coldness",
-    "babbiting",
-    "five-a-week",
-    "weekends",
-    "possession",
-    "typifying",
-    "alarmingly",
-    "benny",
-    "higher",
-    "elevation",
-    "whoever",
-    "spare",
-    "seafarers",
-    "paralysis",
-    "emmett",
-    "disagree",
-    "irreproducibility",
-    "connect",
-    "impress",
-    "deviated",
-    "stewed",
-    "futile",
-    "picnickers",
-    "i.q.",
-    "chic",
-    "reginald",
-    "congressman",
-    "coordinated",
-    "hues",
-    "blasted",
-    "pensive",
-    "uh-uh",
-    "dick's",
-    "diocs",
-    "ancestors",
-    "nectar",
-    "hume",
-    "vendor",
-    "boatloads",
-    "gould",
-    "unblinkingly",
-    "22111",
-    "ashmolean",
-    "dan",
-    "rites",
-    "reflexes",
-    "narrowing",
-    "binding",
-    "trigg",
-    "anastomoses",
-    "peacocks",
-    "accordance",
-    "1781",
-    "chiropractor",
-    "big-stage",
-    "hen",
-    "pentecostal",
-    "corporation's",
-    "clever",
-    "sequel",
-    "geographic",
-    "charlie",
-    "velvety",
-    "teakettle",
-    "turned",
-    "pupil",
-    "vouchers",
-    "istiqlal",
-    "1628",
-    "gaither",
-    "herein",
-    "telomeric",
-    "ainu",
-    "imperiously",
-    "woodbury's",
-    "proud",
-    "concertmaster",
-    "dirion",
-    "pyramid",
-    "explores",
-    "marcellus",
-    "isaacs",
-    "fusion",
-    "home-keeping",
-    "atavistic",
-    "vulcanized",
-    "tack",
-    "alabaster",
-    "130-year",
-    "cross-purposes",
-    "0.002''",
-    "chose",
-    "points",
-    "quick-handling",
-    "109-degrees-f",
-    "walloping",
-    "$11",
-    "rusted",
-    "hurok",
-    "esprit",
-    "cult",
-    "carpets",
-    "boiler",
-    "enumeration",
-    "foam",
-    "maneret",
-    "herd",
-    "crackpots",
-    "raging",
-    "differ",
-    "swift's",
-    "aliah",
-    "splintery",
-    "intersections",
-    "stratify",
-    "035",
-    "turtle",
-    "56a",
-    "minutes",
-    "merleau-ponty",
-    "silone",
-    "ooh",
-    "gentiles",
-    "lustrous",
-    "once-dry",
-    "bosch",
-    "dammed-up",
-    "square-built",
-    "westfield",
-    "developers",
-    "hampered",
-    "le",
-    "figurines",
-    "keys",
-    "smugglers",
-    "infinitely",
-    "duration",
-    "slate",
-    "know-how",
-    "narrated",
-    "trailer",
-    "furrow",
-    "styrenes",
-    "bluthenzweig",
-    "sightseeing",
-    "meyers",
-    "shortcut",
-    "approvingly",
-    "seniority",
-    "rattlesnakes",
-    "nonreactors",
-    "age-old",
-    "proudest",
-    "waltz",
-    "selfeffacing",
-    "error",
-    "hens",
-    "smokes",
-    "viva",
-    "frost's",
-    "juice",
-    "boxcars",
-    "redo",
-    "chignon",
-    "mouse",
-    "lovering",
-    "rudy",
-    "subterfuges",
-    "pal's",
-    "tunnel",
-    "lolotte's",
-    "cape",
-    "football",
-    "pre-shaped",
-    "dronk",
-    "voluble",
-    "intrigue",
-    "roleplaying",
-    "frayne's",
-    "happenings",
-    "grains",
-    "nothings",
-    "poynting-robertson",
-    "witch",
-    "blemish",
-    "concessions",
-    "wised",
-    "round-tipped",
-    "brandy",
-    "musicals",
-    "indisputably",
-    "weirdly",
-    "$3.11",
-    "topple",
-    "fought",
-    "huh",
-    "r's",
-    "horn-rimmed",
-    "blinked",
-    "creams",
-    "indolence",
-    "grand-slam",
-    "softened",
-    "mohammedanism",
-    "pleased",
-    "state-supported",
-    "war's",
-    "equines",
-    "open-meeting",
-    "20,000,000",
-    "picture-palace",
-    "kennan's",
-    "sinkhole",
-    "nonresident",
-    "next-to-last",
-    "adipic",
-    "retrieved",
-    "politeness",
-    "ballad",
-    "gulf's",
-    "attacks",
-    "sole",
-    "vermejo",
-    "accorded",
-    "well-played",
-    "uninjured",
-    "embraces",
-    "impaled",
-    "equity",
-    "microseconds",
-    "winehead",
-    "wonderfulness",
-    "brain",
-    "sew",
-    "high-tension",
-    "nouns",
-    "wustman",
-    "pigeonhole",
-    "observatory",
-    "lessons",
-    "fierce",
-    "eeae-cellulose",
-    "existing",
-    "meinung",
-    "anzilotti",
-    "**yl",
-    "hydrous",
-    "microbial",
-    "mutiny",
-    "3-game",
-    "morel",
-    "self-observation",
-    "seeking",
-    "high-powered",
-    "sees",
-    "snarling",
-    "ill-starred",
-    "commercialization",
-    "evacuation",
-    "icelandic-speaking",
-    "statisticians",
-    "agitate",
-    "industralization",
-    "norm",
-    "handiest",
-    "note",
-    "skillfulness",
-    "presbyterian",
-    "ouster",
-    "tank",
-    "processors",
-    "pressure-measuring",
-    "carelessness",
-    "money-making",
-    "asserts",
-    "87",
-    "kettle",
-    "$25,000",
-    "willcox",
-    "sonata",
-    "meat",
-    "prepublication",
-    "about-faced",
-    "meted",
-    "few",
-    "scholarships",
-    "venturesome",
-    "10:00",
-    "anti-assignment",
-    "lushes",
-    "kinesics",
-    "eh",
-    "tucked",
-    "pills",
-    "kombo",
-    "transfered",
-    "morosely",
-    "600-mile",
-    "indoctrinated",
-    "locatin'",
-    "quinzaine",
-    "budd",
-    "bright-eyed",
-    "deluxe",
-    "pfennig",
-    "undreamt",
-    "storekeepers",
-    "drivers",
-    "reavey's",
-    "durability",
-    "microphoning",
-    "2,300",
-    "examining",
-    "rawlings",
-    "angeles",
-    "fodder",
-    "quakers",
-    "intercollegiate",
-    "reigning",
-    "nightclub",
-    "disenfranchised",
-    "manhood",
-    "rochdale",
-    "357",
-    "all-round",
-    "amplitude",
-    "vulnerability",
-    "touchdown",
-    "hauled",
-    "jungian",
-    "smoldering",
-    "cinerama",
-    "paeans",
-    "cringing",
-    "boniface",
-    "recovery",
-    "overtures",
-    "auctioneer",
-    "hose",
-    "day's",
-    "front",
-    "log-house",
-    "winning",
-    "tentacle",
-    "each",
-    "perspiring",
-    "lawyer",
-    "clements",
-    "tropidoclonion",
-    "thills",
-    "varnishes",
-    "gasse",
-    "pillsbury",
-    "rigidly",
-    "hermanovski",
-    "mustn't",
-    "faiths",
-    "kekisheva",
-    "warehouseman's",
-    "fathers",
-    "intra-stellar",
-    "anglo-protestant",
-    "crystalline",
-    "preparedness",
-    "presuming",
-    "writ",
-    "reappears",
-    "reviled",
-    "nothing",
-    "griffith",
-    "d'albert",
-    "doormen",
-    "dismounting",
-    "fresno",
-    "reservoir",
-    "coconut-containing",
-    "stress-temperature",
-    "graphic",
-    "beallsville",
-    "co-opting",
-    "moreland",
-    "xenia",
-    "6,768",
-    "flatus",
-    "surprises",
-    "blacks",
-    "theological",
-    "gallus-snapping",
-    "antietam",
-    "subscripts",
-    "three-room",
-    "elms",
-    "643",
-    "nosebag",
-    "suitors",
-    "astra",
-    "dangling",
-    "conspiracy",
-    "ity",
-    "franker",
-    "thrusting",
-    "deaf",
-    "ransack",
-    "undressed",
-    "3181",
-    "alluring",
-    "gemlike",
-    "absorption",
-    "creed",
-    "tilghman",
-    "paws",
-    "peugeot",
-    "rally",
-    "industrialized",
-    "ruger's",
-    "flotation-type",
-    "on-the-job",
-    "partisan",
-    "embrace",
-    "thursday-night",
-    "perseverance",
-    "pane",
-    "clergy",
-    "citizens'",
-    "hierarchy",
-    "hoses",
-    "poking",
-    "perusing",
-    "despise",
-    "two-room",
-    "yeats",
-    "pantheist",
-    "heroics",
-    "bordeaux",
-    "publisher",
-    "1.58",
-    "viall",
-    "lobster-backed",
-    "gaspard",
-    "rocco",
-    "bundestag",
-    "bettering",
-    "deferent",
-    "role",
-    "joking",
-    "elicit",
-    "paunchy",
-    "royalties",
-    "possesses",
-    "obtrusiveness",
-    "rhu-beb",
-    "dans",
-    "miuchi",
-    "helion",
-    "son-in-law",
-    "2:37.3--:36.1",
-    "apalachicola",
-    "scrumptious",
-    "executive's",
-    "orientations",
-    "vitamins",
-    "hardboard",
-    "pomp",
-    "semi-ambiguous",
-    "medici",
-    "keeps",
-    "two-timing",
-    "henchmen",
-    "bitters",
-    "distinct",
-    "$10.3",
-    "crazed",
-    "cooperating",
-    "jackets",
-    "scheming",
-    "exquisitely",
-    "urgencies",
-    "shootin'",
-    "saute",
-    "soybeans",
-    "thanking",
-    "0.85",
-    "677",
-    "untoward",
-    "table",
-    "prodigious",
-    "housebreaking",
-    "neat",
-    "ceases",
-    "browsing",
-    "smythe",
-    "provincial",
-    "plee-zing",
-    "washed",
-    "alleyways",
-    "ganessa",
-    "broken-backed",
-    "friction",
-    "aubrey's",
-    "rediscover",
-    "2:30-:36",
-    "dental",
-    "clothed",
-    "18th-century",
-    "65-degrees",
-    "unanimous",
-    "triple-tank",
-    "5/64''",
-    "lindbergh's",
-    "waffle-pattern",
-    "meetin'",
-    "well-cemented",
-    "triphenylarsine",
-    "vouching",
-    "status-conscious",
-    "uncomplainingly",
-    "buffer",
-    "calligraphy",
-    "methuselahs",
-    "white-collar",
-    "s.s.r.",
-    "banister",
-    "141",
-    "quota",
-    "skip",
-    "needing",
-    "r.p.m.",
-    "happily",
-    "assn.",
-    "interview",
-    "liste",
-    "aec's",
-    "unchecked",
-    "55,000",
-    "rhythmical",
-    "ex-president",
-    "outraged",
-    "collective-bargaining",
-    "evidential",
-    "threesome",
-    "err",
-    "continentally",
-    "commuter",
-    "heidelberg",
-    "co-operate",
-    "sulky",
-    "confining",
-    "reasoned",
-    "disconcertingly",
-    "canon",
-    "$7,082",
-    "conclave",
-    "drawbridge",
-    "perishes",
-    "treacheries",
-    "wandering",
-    "mediocre",
-    "nw",
-    "tau",
-    "yearning",
-    "stallion",
-    "zipped",
-    "jiving",
-    "backstitch",
-    "volney",
-    "aversion",
-    "unobtrusive",
-    "contemplate",
-    "balanced",
-    "spikes",
-    "unstressed",
-    "bus",
-    "hotly",
-    "well-adjusted",
-    "iraqw",
-    "olgivanna",
-    "flood's",
-    "forgeries",
-    "hewed",
-    "assiduity",
-    "dully",
-    "elongated",
-    "rennell",
-    "farces",
-    "reef",
-    "initials",
-    "pickled",
-    "feeds",
-    "orchard",
-    "coward",
-    "burbank",
-    "blackmailed",
-    "induce",
-    "endothelial",
-    "brutally",
-    "sparring",
-    "staffs",
-    "bypass",
-    "clockwise",
-    "pant-legs",
-    "repealed",
-    "septuagenarian's",
-    "behaviors",
-    "deportees",
-    "rapid-fire",
-    "messes",
-    "carved-out-of-solid",
-    "myrtle",
-    "santo",
-    "sharecrop",
-    "advantageously",
-    "diurnal",
-    "conceived",
-    "road",
-    "sevigli",
-    "taken",
-    "armchair",
-    "shooters",
-    "rommel's",
-    "inconveniently",
-    "reversible",
-    "saxophonist",
-    "1-ton",
-    "autosuggestibility",
-    "counterpoint",
-    "leningrad-kirov",
-    "ownership",
-    "system's",
-    "expert",
-    "crittenden",
-    "heade",
-    "constantin",
-    "palindromes",
-    "extended",
-    "curtain",
-    "gabriel",
-    "wrestle",
-    "tappet",
-    "stein's",
-    "dreamed",
-    "capability",
-    "electrification",
-    "likened",
-    "selkirkers",
-    "trim",
-    "unshakeable",
-    "coachmen",
-    "walt",
-    "unreleased",
-    "impassioned",
-    "heroism",
-    "carne",
-    "nun",
-    "manner",
-    "well-baby",
-    "u.s.s.r.",
-    "ij",
-    "yanks",
-    "solemnis",
-    "whatman",
-    "$66,000",
-    "muddy-tasting",
-    "nahce",
-    "sonambula",
-    "horsemen",
-    "molecule",
-    "body-tissue",
-    "scour",
-    "slackening",
-    "tempers",
-    "undersecretary's",
-    "summer-winter",
-    "scholarly",
-    "eyeglasses",
-    "ilyushin",
-    "doffing",
-    "foot-loose",
-    "congratulation",
-    "gleam",
-    "pertains",
-    "orifices",
-    "high-speed",
-    "realism",
-    "broncs",
-    "miners",
-    "1954",
-    "elysees",
-    "boring",
-    "historians",
-    "claimant",
-    "oblige",
-    "django's",
-    "boheme",
-    "sulphur",
-    "give-and-take",
-    "souphanouvong",
-    "major-market",
-    "tube-nosed",
-    "sucked",
-    "stalemate",
-    "terrorists",
-    "potpourri",
-    "ejection",
-    "zoning",
-    "selectmen",
-    "portfolio-maker",
-    "godkin",
-    "stanchest",
-    "jimmied",
-    "stewardship",
-    "formed",
-    "rebelled",
-    "kinesthetic",
-    "mould",
-    "merrymaking",
-    "germans",
-    "lull",
-    "lizzie",
-    "coy",
-    "corrugations",
-    "philanthropies",
-    "corner-",
-    "barrington",
-    "great",
-    "mcwhinney",
-    "spacesuits",
-    "gee",
-    "document",
-    "retelling",
-    "resorting",
-    "terminates",
-    "household-type",
-    "pops",
-    "repent",
-    "cytolysis",
-    "costume",
-    "hoodlum",
-    "parishioners",
-    "saleslady",
-    "how-2",
-    "complicated",
-    "errs",
-    "totally",
-    "nickel",
-    "riddles",
-    "norethandrolone",
-    "cleaners",
-    "rollicking",
-    "b.s.",
-    "guest",
-    "notify",
-    "wide",
-    "gurgle",
-    "bon",
-    "abed",
-    "platform-controller",
-    "prerequisite",
-    "thankful",
-    "seventy-five",
-    "ambassador-designate",
-    "feed-lot",
-    "hellenic",
-    "capes",
-    "pursuers",
-    "reversed",
-    "venezuela",
-    "brad",
-    "protest",
-    "reigned",
-    "reverdy",
-    "$3.22",
-    "departing",
-    "materialized",
-    "genie",
-    "rides",
-    "aikin",
-    "exaltations",
-    "bedfast",
-    "partial",
-    "optically",
-    "felling",
-    "yacht",
-    "inch",
-    "accelerator",
-    "audibly",
-    "aaron",
-    "door",
-    "fools",
-    "gannett's",
-    "typewriter",
-    "grey-haired",
-    "piloting",
-    "ter.",
-    "utility",
-    "atypical",
-    "orators",
-    "title",
-    "concealment",
-    "rancher",
-    "mackey",
-    "barbaric",
-    "loners",
-    "silicates",
-    "pimplike",
-    "2:26.2",
-    "forte-pianos",
-    "detection",
-    "scalloped",
-    "brigadoon",
-    "deacons",
-    "low-priced",
-    "epics",
-    "responds",
-    "preradiation",
-    "anti-slavery",
-    "fungal",
-    "continents",
-    "hutments",
-    "aaa-ee",
-    "non-readers",
-    "megalomania",
-    "prone",
-    "oratory",
-    "sans",
-    "to-the-death",
-    "revved",
-    "sparsely",
-    "rte.",
-    "reiterated",
-    "4-13",
-    "compliment",
-    "testing",
-    "intriguingly",
-    "650",
-    "watchful",
-    "11th",
-    "antoinette",
-    "habitual",
-    "froissart",
-    "dervish",
-    "squeak",
-    "pilgrims",
-    "olaf",
-    "verboort",
-    "capitals",
-    "unique-ingrown-screwedup",
-    "unchangeable",
-    "mixtures",
-    "criticality",
-    "clogging",
-    "avenues",
-    "backwoods",
-    "circumstances",
-    "hide-out",
-    "faustus",
-    "kitten",
-    "christiana",
-    "graveyard",
-    "haydn",
-    "manufacturer's",
-    "charcoal",
-    "toughs",
-    "futotsu",
-    "english",
-    "unbelievable",
-    "curtin",
-    "not-strictly-practical",
-    "react",
-    "arbitrarily",
-    "self-confident",
-    "surmount",
-    "jonathan",
-    "laps",
-    "daphne",
-    "intelligence",
-    "extant",
-    "privileges",
-    "teamster",
-    "decay",
-    "coffee",
-    "af-inch",
-    "despoiled",
-    "connolly's",
-    "7.19",
-    "differentiability",
-    "penetrated",
-    "cession",
-    "8-10",
-    "congratulatory",
-    "person",
-    "turrets",
-    "seaton's",
-    "jaycees",
-    "linz",
-    "carnarvon's",
-    "1/8''",
-    "cofactors",
-    "articles",
-    "widthwise",
-    "maynard",
-    "trujillo's",
-    "sewickley",
-    "foamy-necked",
-    "maddalena",
-    "steepest",
-    "260-member",
-    "t.",
-    "sean",
-    "abused",
-    "udall",
-    "crankshaft",
-    "tarzan",
-    "appraisingly",
-    "kern",
-    "alerted",
-    "crust",
-    "roach",
-    "ground",
-    "suppers",
-    "reformers",
-    "thirty-six",
-    "scobee-frazier",
-    "sellers",
-    "bagatelles",
-    "university-trained",
-    "formulated",
-    "glossary",
-    "pacifism",
-    "economics",
-    "blueprints",
-    "guilford",
-    "charisma",
-    "upright",
-    "arm's",
-    "filigreed",
-    "scopes",
-    "secretions",
-    "booker",
-    "merest",
-    "nicknames",
-    "homestead",
-    "chaise",
-    "maleness",
-    "proponent",
-    "nonconformist",
-    "ruts",
-    "i'm",
-    "fluorescein-labeled",
-    "78-79",
-    "konzerthaus",
-    "solly",
-    "synchrony",
-    "foundation's",
-    "greenleaf",
-    "l'arcade",
-    "year-to-year",
-    "duponts",
-    "biophysical",
-    "suzanne",
-    "proffered",
-    "fabled",
-    "krautheads",
-    "discolored",
-    "fran",
-    "thaxters",
-    "estimated",
-    "astwood",
-    "eurydice",
-    "incubation",
-    "truce",
-    "heavier",
-    "households",
-    "paprika",
-    "apache",
-    "lairs",
-    "rupee",
-    "madonna's",
-    "0.1",
-    "cannibal",
-    "stop-overs",
-    "canada's",
-    "pinball",
-    "1479",
-    "sputniks",
-    "cams",
-    "2.44",
-    "schnapps",
-    "skies",
-    "132,000",
-    "wire-haired",
-    "soule",
-    "hurdle",
-    "misinterpreted",
-    "turbulence",
-    "2.2",
-    "whizzing",
-    "sculptors",
-    "multi-product",
-    "we'uns",
-    "thermal",
-    "watched",
-    "23a",
-    "condescending",
-    "verdi's",
-    "indispensible",
-    "6-1/2",
-    "reproduced",
-    "fine-chiseled",
-    "corduroys",
-    "drizzle",
-    "four-story",
-    "butting",
-    "strafing",
-    "non-scientist",
-    "practitioners",
-    "compile",
-    "dosed",
-    "clive",
-    "nearsightedly",
-    "reportedly",
-    "consolidated",
-    "tapping",
-    "liberality",
-    "fare",
-    "employing",
-    "unbroken",
-    "bootlegger",
-    "deviant",
-    "richter-haaser",
-    "sluicehouse",
-    "brewers",
-    "6'",
-    "anglicanism",
-    "'pache",
-    "missing",
-    "assassins",
-    "junketeering",
-    "''",
-    "1916",
-    "phyllis",
-    "offenses",
-    "redwood",
-    "luger",
-    "slowed",
-    "englanders",
-    "fiesta",
-    "kits",
-    "antibody",
-    "helium",
-    "adversity",
-    "onleh",
-    "unmodified",
-    "extracted",
-    "one-reel",
-    "urban-fringe",
-    "knobs",
-    "vine",
-    "engraving",
-    "extracts",
-    "fearing",
-    "housman's",
-    "resale",
-    "injurious",
-    "embargo",
-    "sparta",
-    "scrooge-like",
-    "disquisition",
-    "salivary",
-    "warner",
-    "exiled",
-    "adherence",
-    "mourn",
-    "fleshy",
-    "robbing",
-    "star's",
-    "john-and-linda",
-    "arabesque",
-    "rings",
-    "beasties",
-    "mon",
-    "instructors",
-    "construct",
-    "counteracted",
-    "masked",
-    "succeed",
-    "myopia",
-    "reckoned",
-    "quarters",
-    "dresbachs",
-    "unmistakable",
-    "sophias",
-    "reno",
-    "anesthetics",
-    "ungracious",
-    "sorrentino",
-    "lo",
-    "toleration",
-    "comenico",
-    "woven-root",
-    "monasticism",
-    "goodnight",
-    "normalcy",
-    "ghettos",
-    "editorial",
-    "buckshot",
-    "51st",
-    "75th",
-    "rev.",
-    "victoria",
-    "rallying",
-    "banishment",
-    "leopard's",
-    "importation",
-    "hadrian",
-    "their",
-    "inadvertence",
-    "joe's",
-    "pimps",
-    "'61",
-    "cumara",
-    "electronically",
-    "mixing",
-    "mandarin",
-    "velvet",
-    "marvels",
-    "allegations",
-    "ventilation",
-    "soft-spoken",
-    "supra",
-    "scratch",
-    "center-fire",
-    "eccentricity",
-    "critter",
-    "magnum",
-    "1879",
-    "fonds",
-    "cup",
-    "third-rate",
-    "dominate",
-    "wept",
-    "probings",
-    "strengtened",
-    "appropriating",
-    "typescript",
-    "beta",
-    "dialectics",
-    "lipstick",
-    "bruises",
-    "pups",
-    "pripet",
-    "groin",
-    "wahtahm",
-    "cratered",
-    "galatians",
-    "1866",
-    "monarque",
-    "hermeneutics",
-    "squires",
-    "rowswell",
-    "pool-side",
-    "conquerors",
-    "rhythm-and-blues",
-    "cease-fire",
-    "gassings",
-    "davis'",
-    "dangled",
-    "phonemic",
-    "pavletich",
-    "ceremonies",
-    "unreliable",
-    "leather-hard",
-    "waving",
-    "forecasting",
-    "confide",
-    "sued",
-    "voroshilov",
-    "geldings",
-    "century",
-    "espouses",
-    "grow",
-    "martinez",
-    "promptly",
-    "carriers",
-    "supreme",
-    "vented",
-    "furlongs",
-    "pest",
-    "consternation",
-    "shovel",
-    "quenching",
-    "english-dialogue",
-    "punk",
-    "self-help",
-    "are",
-    "literal",
-    "glass",
-    "escheat",
-    "pretence",
-    "esters",
-    "ditmar",
-    "teletype",
-    "archaized",
-    "4:00",
-    "magician",
-    "m.p.h.",
-    "motors'",
-    "flynn's",
-    "enny",
-    "thousand-legged",
-    "aloofness",
-    "arsines",
-    "lessing",
-    "parks",
-    "grenville",
-    "city-dweller",
-    "dictum",
-    "bears",
-    "unrecognized",
-    "192",
-    "stacking",
-    "howsam",
-    "inaccessible",
-    "doorknob",
-    "crepe",
-    "7''",
-    "fisted",
-    "inhaling",
-    "mustaches",
-    "rawboned",
-    "contributory",
-    "death-like",
-    "frenzy",
-    "butchery",
-    "intricately",
-    "loren",
-    "scent",
-    "punishment",
-    "kilhour",
-    "spreader",
-    "insomniacs",
-    "enunciation",
-    "billows",
-    "torment",
-    "delude",
-    "munich's",
-    "dynastic",
-    "warrant",
-    "schedule",
-    "scrivener",
-    "taft-hartley",
-    "lancashire",
-    "undertakings",
-    "howda",
-    "yellow-green",
-    "anomie",
-    "orthodontist",
-    "melancholy",
-    "oscillating",
-    "dozing",
-    "tatler",
-    "determing",
-    "crosswalk",
-    "psychotherapy",
-    "frolicking",
-    "petitioner",
-    "parvenu",
-    "abyss",
-    "butt",
-    "regulative",
-    "iran",
-    "glasgow",
-    "awakened",
-    "perpetrator",
-    "beginner",
-    "attaches",
-    "comany's",
-    "smith-hughes",
-    "legation",
-    "wisman",
-    "spiller",
-    "crummy",
-    "eclat",
-    "wilfred",
-    "overshoots",
-    "carreon",
-    "uncircumcision",
-    "1-6",
-    "poll",
-    "gray-looking",
-    "victim",
-    "above-ground",
-    "short-run",
-    "lalaurie's",
-    "porch",
-    "intoxicating",
-    "buzzed",
-    "elk",
-    "whispering",
-    "breakaway",
-    "mandhata",
-    "tactic",
-    "$40",
-    "angling",
-    "unacceptable",
-    "gymnasium",
-    "polystyrene",
-    "intently",
-    "3-to-o",
-    "librarian's",
-    "microscope",
-    "nonmusical",
-    "conestoga",
-    "dyspeptic",
-    "1918-19",
-    "nazi-minded",
-    "granther",
-    "booked",
-    "tab-lifter",
-    "endorsing",
-    "pratt",
-    "durocher",
-    "tying",
-    "twist",
-    "fragrances",
-    "obediences",
-    "newly-appointed",
-    "mobilizing",
-    "importunately",
-    "quirks",
-    "savings",
-    "co-educational",
-    "gratis",
-    "agree",
-    "photogenic",
-    "girth",
-    "innuendoes",
-    "lewis's",
-    "matrix",
-    "cultural",
-    "rebut",
-    "buell's",
-    "regrettably",
-    "bunched",
-    "peacefully",
-    "fostered",
-    "mortally",
-    "home-for-the-night",
-    "shipmates",
-    "schedules",
-    "ltd.",
-    "psychopathic",
-    "wrigley",
-    "375",
-    "inaudible",
-    "succinct",
-    "accommodated",
-    "scrutinizing",
-    "les",
-    "comedian",
-    "mira",
-    "fuss",
-    "54-17",
-    "cimabue's",
-    "salt-edged",
-    "completely-restored",
-    "clinging",
-    "bricks",
-    "facades",
-    "luthuli",
-    "disorders",
-    "atom's",
-    "underbedding",
-    "species-dependent",
-    "monster",
-    "fractures",
-    "weider",
-    "hoogli",
-    "submitting",
-    "bedtime",
-    "10,517",
-    "file",
-    "prowl",
-    "young's",
-    "87-1/2",
-    "prosecution",
-    "talkin'",
-    "4-h",
-    "hamilton-oriented",
-    "mayor-nominate",
-    "forgotten",
-    "yehhh",
-    "bonnor",
-    "66",
-    "planetoid",
-    "armentieres",
-    "nettled",
-    "$12.1",
-    "continuum",
-    "bootleggers",
-    "scanning",
-    "rose's",
-    "dictates",
-    "clearance",
-    "ranks",
-    "lands",
-    "unnecessary",
-    "hockett",
-    "allen",
-    "growers",
-    "any",
-    "and/or",
-    "handguns",
-    "perfusion",
-    "dogwood",
-    "lumbered",
-    "breakfast-table",
-    "ramsey",
-    "unfoldment",
-    "slimed",
-    "60's",
-    "zealand",
-    "subparagraph",
-    "doused",
-    "spoonful",
-    "booster",
-    "serve",
-    "kit",
-    "marella",
-    "explicable",
-    "grayson",
-    "beatification",
-    "daunted",
-    "shames",
-    "clara",
-    "copious",
-    "rustling",
-    "prowling",
-    "o'donnell's",
-    "glee",
-    "factory",
-    "thrillers",
-    "grade",
-    "light-year",
-    "typified",
-    "buff",
-    "pizza",
-    "captain's",
-    "lavished",
-    "trooper",
-    "insurgence",
-    "earthquakes",
-    "provoke",
-    "registers",
-    "cub's",
-    "needless",
-    "idealism",
-    "chairs",
-    "abstracting",
-    "maze",
-    "2:25",
-    "frowning",
-    "classicist",
-    "ultra-violet",
-    "panting",
-    "bespeaks",
-    "rustler-hunter",
-    "startle",
-    "samba",
-    "huntington",
-    "open-collared",
-    "indiscreet",
-    "klimt",
-    "lorain",
-    "venereal",
-    "difficulty",
-    "perils",
-    "hollowware",
-    "microcosm",
-    "vidal's",
-    "unasked",
-    "adopt",
-    "seventeen-year-old",
-    "jan",
-    "fairgoers",
-    "belleville",
-    "outreach",
-    "less-hurried",
-    "mid-1950's",
-    "imitates",
-    "joey",
-    "customs",
-    "infraction",
-    "monsoon",
-    "josiah",
-    "similar",
-    "mea",
-    "sholom",
-    "unconscious",
-    "goodbye",
-    "mystical",
-    "findings",
-    "personified",
-    "damning",
-    "warping",
-    "heel",
-    "delighting",
-    "misleads",
-    "less-dramatic",
-    "dey",
-    "zurcher",
-    "glistening",
-    "pennants",
-    "self-esteem",
-    "mennen",
-    "noel",
-    "microscopic",
-    "plaintiffs",
-    "onions",
-    "density",
-    "fables",
-    "bonds",
-    "aeschbacher",
-    "bogeymen",
-    "comparisons",
-    "triumphs",
-    "attachment",
-    "squads",
-    "tokenish",
-    "reverted",
-    "peter's",
-    "suffrage",
-    "bridgework",
-    "tanned",
-    "stern",
-    "paved",
-    "marketable",
-    "fee-per-day",
-    "filter",
-    "ionic",
-    "one-plane",
-    "unckle",
-    "overt",
-    "liver",
-    "gold",
-    "clerk's",
-    "shirking",
-    "necromantic",
-    "forest",
-    "flubbed",
-    "alteration",
-    "dwindle",
-    "wealth",
-    "paxton",
-    "lyttleton",
-    "clotheshorse",
-    "4.0",
-    "cynewulf",
-    "hesitant",
-    "ideological",
-    "nondefeatist",
-    "staples",
-    "hollows",
-    "rotelli",
-    "cleveland",
-    "indignities",
-    "room",
-    "fray",
-    "armful",
-    "nestor",
-    "dack-rihs",
-    "ambushed",
-    "clamped",
-    "grazing",
-    "crowding",
-    "exclusion",
-    "escapist",
-    "scandinavians",
-    "wearying",
-    "soldering",
-    "dishwater",
-    "self-examination",
-    "suites",
-    "simple-minded",
-    "smothered",
-    "tawdry",
-    "segur",
-    "abatuno",
-    "connelly",
-    "yucatan",
-    "spread-eagled",
-    "extrapolations",
-    "poring",
-    "physicians",
-    "laxative",
-    "laymen",
-    "withered",
-    "benets",
-    "accelerated",
-    "phrasemaking",
-    "jap's",
-    "greer",
-    "high-rep",
-    "plate",
-    "adjusting",
-    "thicken",
-    "stram",
-    "rudyard",
-    "59",
-    "mid-section",
-    "particular",
-    "prefers",
-    "dsm",
-    "schweizer",
-    "kidnaper",
-    "nucleic",
-    "season's",
-    "distract",
-    "1540",
-    "dashes",
-    "gizenga",
-    "suicides",
-    "knifelike",
-    "guiftes",
-    "unpatriotic",
-    "diplomatic",
-    "hypothesizing",
-    "canyon",
-    "developmental",
-    "signalizes",
-    "repressed",
-    "spherical",
-    "honorably",
-    "nonsegregated",
-    "explosives",
-    "radiations",
-    "therein",
-    "lineal",
-    "classmate",
-    "mad",
-    "wtv",
-    "territorial",
-    "revivalism",
-    "careers",
-    "gnashing",
-    "hardships",
-    "journal-bulletin's",
-    "spoilables",
-    "sponged",
-    "overpowering",
-    "voodoo",
-    "critters",
-    "speedily",
-    "complicity",
-    "pumblechook's",
-    "capacitors",
-    "heavily-upholstered",
-    "gum",
-    "tides",
-    "refresh",
-    "clemenceau",
-    "rougher",
-    "heeded",
-    "kathleen",
-    "stainless",
-    "chairmanships",
-    "democrat",
-    "views",
-    "vita",
-    "bedazzlement",
-    "brilliant",
-    "pier-table",
-    "gauged",
-    "remorseless",
-    "hardscrabble",
-    "bul'ba",
-    "thiot",
-    "hearing-aid",
-    "plantation",
-    "wrangled",
-    "outpost",
-    "ricocheted",
-    "ladgham",
-    "hambric",
-    "consideration",
-    "irenaeus",
-    "jessie",
-    "denote",
-    "mundane",
-    "75,000",
-    "neglected",
-    "pineapple",
-    "georgians",
-    "arhats",
-    "franciscan",
-    "25-gallon",
-    "grew",
-    "osis",
-    "downfall",
-    "negation",
-    "louis'",
-    "1307",
-    "jeb",
-    "farmlands",
-    "to-day",
-    "major",
-    "destroying",
-    "inter-species",
-    "molecular",
-    "tsunami-warning",
-    "mode",
-    "mantrap",
-    "ambiance",
-    "uniqueness",
-    "reverent",
-    "trophy",
-    "formats",
-    "ologies",
-    "consanguinity",
-    "emulsion",
-    "multivalent",
-    "belligerence",
-    "irritated",
-    "giveaway",
-    "pastel-like",
-    "democratic",
-    "affiliates",
-    "highboard",
-    "demeanor",
-    "transistors",
-    "appleby",
-    "indifference",
-    "convictions",
-    "argon",
-    "aromatick",
-    "laurie",
-    "manderscheid",
-    "wall-tex",
-    "bankers",
-    "roped",
-    "aunt's",
-    "2-degrees-c",
-    "characterizing",
-    "vietnam",
-    "make-up",
-    "routines",
-    "replacement",
-    "sneer",
-    "interama",
-    "leaguer",
-    "unashamedly",
-    "tuneful",
-    "unimaginable",
-    "montreal",
-    "mid-1963",
-    "extending",
-    "highly",
-    "frist",
-    "rumble",
-    "harnessing",
-    "axiom",
-    "intensively",
-    "monophonic",
-    "broadcasting",
-    "idea",
-    "grasses",
-    "gunflint",
-    "biscuits",
-    "banbury",
-    "jaded",
-    "thinkers",
-    "western",
-    "convenience",
-    "vive",
-    "$1,000,000,000",
-    "localize",
-    "mitigate",
-    "lentils",
-    "commutation",
-    "hardest",
-    "perlman",
-    "eyewitness",
-    "three-hour",
-    "hindus",
-    "prim",
-    "rebuilding",
-    "constituency",
-    "plantain",
-    "touchdowns",
-    "autumn",
-    "stamps",
-    "eloise",
-    "bipartisan",
-    "instituting",
-    "8-b-2",
-    "refers",
-    "1938",
-    "1870's",
-    "abortive",
-    "cedar",
-    "necks",
-    "ten-year",
-    "prominence",
-    "overcurious",
-    "pelts",
-    "mastery",
-    "absurdly",
-    "revels",
-    "3.46",
-    "leak",
-    "foal",
-    "tolerated",
-    "improvement",
-    "saintsbury",
-    "strongest",
-    "4,369",
-    "742c",
-    "subduing",
-    "whosever",
-    "frelinghuysen's",
-    "non-institutionalized",
-    "aviators",
-    "oud",
-    "intruding",
-    "lessened",
-    "embellished",
-    "citron",
-    "coop",
-    "one-thousandth",
-    "sheeted",
-    "undertaking",
-    "substrates",
-    "ordo",
-    "prolixity",
-    "stipulates",
-    "upward",
-    "regarding",
-    "prado",
-    "hot-shot",
-    "brocklin's",
-    "stimuli",
-    "50,000",
-    "rockbound",
-    "giffen",
-    "shank",
-    "dampen",
-    "dissatisfactions",
-    "affronting",
-    "abiding",
-    "might",
-    "resuming",
-    "readings",
-    "creativity",
-    "short-contact",
-    "relay",
-    "wellsley",
-    "ringsiders",
-    "don't",
-    "7-2",
-    "declinations",
-    "bostonian",
-    "uneconomic",
-    "ludlow",
-    "hydraulics",
-    "all-female",
-    "aspencade",
-    "wilt",
-    "dismayed",
-    "mystification",
-    "objections",
-    "day",
-    "ikey-kikey",
-    "hundredth",
-    "compulsives",
-    "saddlebags",
-    "mingles",
-    "auntie",
-    "terrace",
-    "deducting",
-    "convicting",
-    "rumford",
-    "volunteer",
-    "paradigm",
-    "iniquitous",
-    "500,000",
-    "abel",
-    "determinants",
-    "smacked",
-    "anywhere",
-    "wholesale",
-    "anti-submarine",
-    "frau",
-    "re-adopt",
-    "leprae",
-    "latched",
-    "bonnet",
-    "hustle",
-    "bloomfield",
-    "bbb",
-    "zaroubin",
-    "specimentalia",
-    "symington",
-    "lauchli",
-    "8861",
-    "classes",
-    "diaphragms",
-    "calmed",
-    "szold",
-    "overindulged",
-    "goin",
-    "wiser",
-    "friars",
-    "lieut",
-    "weariness",
-    "manure-scented",
-    "baked",
-    "polyphosphate",
-    "kinder",
-    "searchlights",
-    "centric",
-    "entropy-increasing",
-    "principally",
-    "umbrella",
-    "ss.",
-    "smiling",
-    "rocked",
-    "revery",
-    "**yb",
-    "alumnae",
-    "conflicts",
-    "preferably",
-    "graffiti",
-    "porcupines",
-    "refreshed",
-    "mistletoe",
-    "pods",
-    "drawers",
-    "kamieniec",
-    "imaginations",
-    "fluoresces",
-    "unselfishly",
-    "unorthodox",
-    "14%",
-    "unsettling",
-    "wiggling",
-    "undergoes",
-    "squeezing",
-    "scavenger",
-    "antagonism",
-    "bari's",
-    "burnet",
-    "metabolites",
-    "downcast",
-    "picket",
-    "foods",
-    "graded",
-    "brighetti",
-    "sidewise",
-    "unutterably",
-    "sunday",
-    "insofar",
-    "wes",
-    "160",
-    "thrones",
-    "peanut",
-    "tempera",
-    "clogged",
-    "wu",
-    "paulah",
-    "anti-americanism",
-    "unforgivable",
-    "derisively",
-    "manipulators",
-    "spends",
-    "round-table",
-    "sigmund",
-    "querying",
-    "kitchin",
-    "allure",
-    "tipoff",
-    "cocao",
-    "scotty",
-    "6-",
-    "half-standard",
-    "brunettes",
-    "escorting",
-    "compounds",
-    "balaguer",
-    "dogged",
-    "calorie",
-    "equ",
-    "can't",
-    "stood",
-    "wielded",
-    "abolished",
-    "typewritten",
-    "indices",
-    "m.p.",
-    "finely-spun",
-    "cafeteria",
-    "prayin'",
-    "rise",
-    "$165",
-    "loose-knit",
-    "europeanization",
-    "topics",
-    "totaling",
-    "verreau",
-    "langford",
-    "hem",
-    "kopstein",
-    "bowdoin",
-    "epstein",
-    "uncas",
-    "mille",
-    "87-31",
-    "beardens",
-    "trampling",
-    "batch",
-    "broached",
-    "competing",
-    "31730",
-    "jot",
-    "10-m-diameter",
-    "booth",
-    "cabinet",
-    "thompson",
-    "gun-slinger",
-    "two-part",
-    "sadist",
-    "ten-hour",
-    "unruly",
-    "companionway",
-    "museums",
-    "blighted",
-    "islam",
-    "hobbies",
-    "baldness",
-    "flouted",
-    "ubiquitous",
-    "dog-pin",
-    "105",
-    "resigns",
-    "anyplace",
-    "chirped",
-    "supplier",
-    "geography",
-    "quelch",
-    "electrically",
-    "implored",
-    "artfully",
-    "aroused",
-    "patmore",
-    "reached",
-    "gulp",
-    "no-hit",
-    "haywood",
-    "none",
-    "greying",
-    "generating",
-    "bunny",
-    "boismassif",
-    "pirie",
-    "commander-in-chief",
-    "tremulously",
-    "thereafter",
-    "designer's",
-    "bright-looking",
-    "secularism",
-    "dandy's",
-    "pokes",
-    "anomalous",
-    "fudo",
-    "5-6",
-    "over-produce",
-    "bruckner's",
-    "beach-head",
-    "docilely",
-    "halves",
-    "artistically",
-    "aperture",
-    "empire",
-    "indifferent",
-    "neo-swing",
-    "no",
-    "{0,t}",
-    "discrepancy",
-    "unrelated",
-    "sieux",
-    "cud",
-    "unfunnily",
-    "consisted",
-    "safavids",
-    "hors",
-    "harding",
-    "warfield",
-    "adjustable",
-    "wise",
-    "intermediary",
-    "briefly",
-    "widegrip",
-    "optimizing",
-    "cornmeal",
-    "bells",
-    "spanning",
-    "balancing",
-    "arrowheads",
-    "348",
-    "diaghileff",
-    "shambled",
-    "peddler",
-    "peanuts",
-    "hardbake",
-    "pranha",
-    "bedside",
-    "community's",
-    "coast",
-    "60-inch",
-    "renal",
-    "360",
-    "abbott",
-    "filthy",
-    "commercialism",
-    "sentenced",
-    "belgium",
-    "familistical",
-    "scientist",
-    "on-the-scene",
-    "prediction",
-    "spine",
-    "galleys",
-    "zeroed",
-    "approach",
-    "ezra",
-    "five-hundred-year-old",
-    "venison",
-    "trimmed",
-    "siberian",
-    "anionics",
-    "pauper's",
-    "sixty-day",
-    "toolmaker",
-    "prepared",
-    "middle-range",
-    "pornsen",
-    "listener-supported",
-    "whodunnit",
-    "leaden",
-    "screened",
-    "hell-for-leather",
-    "master",
-    "potent",
-    "experimenting",
-    "asheville",
-    "theon's",
-    "mosaic",
-    "silences",
-    "inactive",
-    "brazil",
-    "ethiopians",
-    "undreamed",
-    "semple-lisle",
-    "goody",
-    "by-laws",
-    "flake",
-    "townsend",
-    "distributions",
-    "intimidated",
-    "self-crimination",
-    "diameter",
-    "unwarrantable",
-    "reliable",
-    "plumbed",
-    "200-degrees",
-    "hopples",
-    "1786",
-    "english-dutch",
-    "rateable",
-    "37-degrees",
-    "conform",
-    "palatability",
-    "five-hundred-dollar",
-    "munitions",
-    "self-reliance",
-    "complement",
-    "irregularly",
-    "circumpolar",
-    "ready-made",
-    "19-1/2",
-    "slack",
-    "proceeding",
-    "breakoff",
-    "holed",
-    "kuhn",
-    "informative",
-    "menfolk",
-    "perilously",
-    "state-administered",
-    "brightest",
-    "pronouncing",
-    "rationale",
-    "creston's",
-    "railroad",
-    "$4.98",
-    "bestimmung",
-    "turntable",
-    "terminated",
-    "dyke",
-    "playable",
-    "shirt-sleeved",
-    "anisotropy",
-    "caucuses",
-    "value-system",
-    "emptier",
-    "wrings",
-    "rung",
-    "proposed",
-    "agenda",
-    "newburger",
-    "fps",
-    "rensselaer",
-    "lot",
-    "elected",
-    "organs",
-    "carolina's",
-    "conditioners",
-    "dressers",
-    "savoyards",
-    "tragically",
-    "constrictors",
-    "rests",
-    "referral",
-    "pay",
-    "nolan",
-    "grader",
-    "stock's",
-    "flea",
-    "headland",
-    "bigots",
-    "muir",
-    "loud-voiced",
-    "exceed",
-    "bounty",
-    "morphology",
-    "viewed",
-    "grabbin'",
-    "bel-air",
-    "angeles-pasadena",
-    "unsheathing",
-    "expressionist",
-    "super-set",
-    "nobleman",
-    "coconuts",
-    "23:30",
-    "3''",
-    "vacant",
-    "43*0c.",
-    "endanger",
-    "cans",
-    "half-inch",
-    "layette",
-    "voter",
-    "welcome",
-    "sandman",
-    "high-interest",
-    "shopping-center",
-    "machine-gunned",
-    "shoulder",
-    "circulation",
-    "unplagued",
-    "court",
-    "arsenic",
-    "pint-sized",
-    "beckstrom",
-    "390",
-    "brides",
-    "lateiner",
-    "sealed",
-    "exasperate",
-    "appears",
-    "throwing",
-    "hollowell",
-    "conventions",
-    "unify",
-    "pate",
-    "buffoons",
-    "texan",
-    "muscle",
-    "0.005",
-    "treacherous",
-    "70,000",
-    "star-spangled",
-    "under-achievement",
-    "freewheelers",
-    "y-cell",
-    "feversham",
-    "riffle",
-    "norton",
-    "wentworth",
-    "rights",
-    "5-1/2",
-    "pitchers",
-    "stealer",
-    "wilderness",
-    "eating",
-    "pump",
-    "wesleyan",
-    "shillings",
-    "parched",
-    "80%",
-    "salivate",
-    "grass-green",
-    "seaborg",
-    "duet",
-    "gateways",
-    "imbruing",
-    "clouds",
-    "frisco",
-    "frustrate",
-    "pumped",
-    "exclaims",
-    "knuckle",
-    "denouncing",
-    "parry's",
-    "rebuilds",
-    "confirming",
-    "botany",
-    "trench",
-    "peltz",
-    "logical",
-    "sweetest",
-    "anylabel",
-    "valves",
-    "class",
-    "disloyalty",
-    "aerobacter",
-    "tucking",
-    "marcmann",
-    "riverbanks",
-    "morphine",
-    "casualties",
-    "dabbed",
-    "adamantly",
-    "pa",
-    "centerline",
-    "clandestine",
-    "cane's",
-    "finite-dimensional",
-    "penal",
-    "vasilievitch",
-    "resolving",
-    "infiltration",
-    "parasols",
-    "unsee",
-    "mazeroski",
-    "rapidly-diminishing",
-    "unpacking",
-    "juxtaposition",
-    "nerve",
-    "three-month",
-    "1946-52",
-    "boite",
-    "all-powerful",
-    "bros.'",
-    "resnik",
-    "basked",
-    "1,119",
-    "senese",
-    "perk",
-    "hmm",
-    "monoclinic",
-    "tripping",
-    "slip",
-    "def",
-    "abasement",
-    "big-shouldered",
-    "monopolize",
-    "crassness",
-    "dixon",
-    "fawcett",
-    "schwada",
-    "ventures",
-    "silesia",
-    "homer's",
-    "seigner",
-    "galactic",
-    "trempler",
-    "cairoli",
-    "sr's",
-    "hendrik",
-    "whip's",
-    "edgewater",
-    "bores",
-    "reconstructed",
-    "wedge-shaped",
-    "borglum",
-    "infinite",
-    "deluxer",
-    "pizzicato",
-    "caramel",
-    "humanize",
-    "bearings",
-    "nervously",
-    "strike",
-    "wrappin'",
-    "january",
-    "prescribed",
-    "strait",
-    "moccasin",
-    "constantinople",
-    "bib",
-    "tonally",
-    "optimal",
-    "tenderloin",
-    "judea",
-    "braying",
-    "turnaround",
-    "authorizing",
-    "military",
-    "raisin",
-    "tougher",
-    "coercion",
-    "freshmen",
-    "chiba",
-    "abolition",
-    "really",
-    "illustrative",
-    "alfred's",
-    "tightly",
-    "second-degree",
-    "attractions",
-    "hundreds",
-    "quest",
-    "slop",
-    "atlas",
-    "unstuck",
-    "preserving",
-    "forand",
-    "9:30",
-    "bassi",
-    "luncheon-table",
-    "mustering",
-    "narcotics",
-    "2.75",
-    "mingle",
-    "twain's",
-    "recognizes",
-    "412",
-    "grace",
-    "violations",
-    "approved",
-    "social-climbing",
-    "afghan",
-    "leavitt",
-    "sway-backed",
-    "plots",
-    "devising",
-    "translator",
-    "dimes",
-    "humans",
-    "felled",
-    "shortness",
-    "cuddleback",
-    "predicting",
-    "airspeed",
-    "marquis",
-    "petals",
-    "examiner",
-    "primates",
-    "playin'",
-    "prowess",
-    "combining",
-    "spleen",
-    "proteases",
-    "blabbed",
-    "bull's-eye",
-    "malamud",
-    "nadine",
-    "danish",
-    "neuritis",
-    "papers",
-    "pointless",
-    "41",
-    "feelers",
-    "trauma",
-    "ghormley",
-    "anatomically",
-    "choir",
-    "grinds",
-    "rutted",
-    "funny",
-    "crooked",
-    "rulers'",
-    "sonenberg",
-    "footsteps",
-    "larceny",
-    "ranging",
-    "weigh",
-    "curb",
-    "hooch",
-    "dtf",
-    "wooooosh",
-    "technicians",
-    "wretch",
-    "milligrams",
-    "sulphured",
-    "two-year-old",
-    "skits",
-    "hooks",
-    "teletypes",
-    "diplomacy",
-    "propitiate",
-    "general-purpose",
-    "furbishing",
-    "harry",
-    "clung",
-    "behalf",
-    "stolid",
-    "brakke",
-    "wakefulness",
-    "all-white",
-    "undersea",
-    "mai",
-    "3,450",
-    "pistol-packing",
-    "rasa",
-    "process",
-    "combustibles",
-    "hangman",
-    "22-24",
-    "pellagra",
-    "clothing",
-    "distortions",
-    "idol",
-    "atheists",
-    "result",
-    "breathlessly",
-    "steered",
-    "angelic",
-    "erudition",
-    "guessing",
-    "beall",
-    "grocer",
-    "0.50",
-    "sectionalized",
-    "jackdaws",
-    "migrate",
-    "proclamation",
-    "richly",
-    "26,500",
-    "woodshed",
-    "middle-south",
-    "1846",
-    "$7,500,000",
-    "158-pounder",
-    "x's",
-    "morris",
-    "deviating",
-    "chosen",
-    "cheetal",
-    "self-correcting",
-    "digestive",
-    "coulson",
-    "mcconnell's",
-    "pockmanster's",
-    "chinaman",
-    "s'posin'",
-    "indecisiveness",
-    "illustrating",
-    "harmed",
-    "frivolous",
-    "nellie",
-    "betties",
-    "commune",
-    "steve",
-    "scale",
-    "criminal",
-    "frescoing",
-    "red-clay",
-    "trace",
-    "feedback",
-    "unused",
-    "assumptions",
-    "dispersement",
-    "mio",
-    "apologie",
-    "yearnings",
-    "joseph's",
-    "reproducibility",
-    "pioneered",
-    "typesetting",
-    "possibilities",
-    "neuter",
-    "bosler",
-    "hoops",
-    "k.j.p.",
-    "weeping",
-    "buggy",
-    "stropped",
-    "beyond-normal",
-    "meaningless",
-    "peered",
-    "prohibit",
-    "explanation",
-    "contour",
-    "desoto",
-    "19,000,000",
-    "sweazey",
-    "dryer",
-    "myth",
-    "yeast",
-    "freehand",
-    "decides",
-    "mass.",
-    "skylark",
-    "ductwork",
-    "squirmed",
-    "self-effacing",
-    "dilworth",
-    "doctors",
-    "micelle",
-    "praise",
-    "burleson",
-    "single-spaced",
-    "provided",
-    "oldsmobile",
-    "responsibility",
-    "forefathers",
-    "dalzell-cousin",
-    "warmhearted",
-    "syrupy",
-    "breathtaking",
-    "tortuous",
-    "pram",
-    "oft",
-    "sulking",
-    "cunningly",
-    "bags",
-    "kindness",
-    "offshore",
-    "failures",
-    "cal-neva",
-    "over-simple",
-    "microanalysis",
-    "inkling",
-    "rangoni's",
-    "south-east",
-    "broad-scale",
-    "noisemakers",
-    "goitrogen",
-    "amicable",
-    "pants",
-    "out'n",
-    "conveying",
-    "trait",
-    "alai",
-    "unco-operative",
-    "kingston",
-    "baking",
-    "loew's",
-    "mezzo",
-    "walked",
-    "begotten",
-    "blot-like",
-    "stevenson's",
-    "aflame",
-    "underside",
-    "someplace",
-    "sohn",
-    "leprosy",
-    "spree",
-    "bornholm",
-    "imbrium",
-    "sleepy-eyed",
-    "krzywy-rog",
-    "experience",
-    "hand-painted",
-    "coaching",
-    "bellboy",
-    "todman",
-    "hypothalamus",
-    "studs",
-    "requirements",
-    "1550",
-    "mephistopheles",
-    "pains-taking",
-    "schutz",
-    "laymen's",
-    "long-awaited",
-    "carthage",
-    "min.",
-    "mosquito",
-    "recalcitrant",
-    "regions",
-    "jeffersonians",
-    "ovation",
-    "giles",
-    "ernst",
-    "derived",
-    "rhyme",
-    "inhabitants",
-    "rendering",
-    "spectacle",
-    "dreamer",
-    "battens",
-    "trees",
-    "code",
-    "tiveden",
-    "entry-limited",
-    "divert",
-    "neighbor's",
-    "timberlands",
-    "abbas's",
-    "tax-exemption",
-    "toll",
-    "twosome",
-    "$350,000",
-    "crane's",
-    "violation",
-    "hard-sell",
-    "young",
-    "aptitude",
-    "pearl",
-    "bahi",
-    "potlatches",
-    "tenite",
-    "lange",
-    "unerringly",
-    "sop",
-    "schooling",
-    "immortal",
-    "drudgery",
-    "ch'an",
-    "roy's",
-    "mon-fay",
-    "near-synonyms",
-    "fry",
-    "entertainer",
-    "analogy",
-    "quarterback",
-    "grant-in-aid",
-    "newells",
-    "oh-the-pain-of-it",
-    "hallowell's",
-    "hanover-precious",
-    "stooooomp",
-    "poets",
-    "wage-rates",
-    "winter",
-    "irreparable",
-    "spaniel-like",
-    "wayne",
-    "cabins",
-    "vinegar",
-    "accused",
-    "eluded",
-    "chaucer",
-    "2:26",
-    "pantheon's",
-    "tech.",
-    "busy-work",
-    "s-s-sahjunt",
-    "consultation",
-    "screaming",
-    "mechanization",
-    "rituals",
-    "incubating",
-    "evident",
-    "unanimity",
-    "transplant",
-    "gorboduc",
-    "wisp",
-    "narcosis",
-    "tigard",
-    "unnecessarily",
-    "alternatively",
-    "determining",
-    "pertaining",
-    "emeritus",
-    "neck",
-    "kaisers",
-    "sweet-sounding",
-    "hoa-whup",
-    "fat's",
-    "$500",
-    "expertly",
-    "madagascar",
-    "they'd",
-    "$8.00",
-    "water-proof",
-    "competitor",
-    "rundfunk-sinfonie-orchester",
-    "industrialistes",
-    "essences",
-    "shatilov",
-    "squall",
-    "markers",
-    "blasting",
-    "14",
-    "festivities",
-    "carts",
-    "unproductive",
-    "cott",
-    "roomy",
-    "bordens",
-    "oresme",
-    "miscalculations",
-    "actuality",
-    "centrifugal",
-    "puritans",
-    "conservative",
-    "vineyards",
-    "constitute",
-    "yapping",
-    "barnyards",
-    "naming",
-    "castorbean",
-    "hooves",
-    "stabbed",
-    "motional",
-    "enfant",
-    "1730",
-    "emancipate",
-    "montero's",
-    "basin",
-    "mfg.",
-    "endured",
-    "seventeenth-century",
-    "spot",
-    "shabbat",
-    "rearranging",
-    "coursing",
-    "romanticism",
-    "stocking",
-    "purify",
-    "dampening",
-    "halkett",
-    "charitably",
-    "jed's",
-    "swabbed",
-    "resolutely",
-    "zoomed",
-    "revealing",
-    "nonsystematic",
-    "sands",
-    "warbling",
-    "permanence",
-    "imitation-woodgrain",
-    "20-22",
-    "fortiori",
-    "manned",
-    "holmes'",
-    "marketability",
-    "tacitus",
-    "rutabagas",
-    "kilowatt-hours",
-    "bartoli's",
-    "bog",
-    "dogmatic",
-    "mcintosh",
-    "bang-sashes",
-    "jake",
-    "nautical",
-    "telegraphie",
-    "lincoln's",
-    "employee's",
-    "scarcely-tapped",
-    "vowel-length",
-    "sympathy",
-    "raton",
-    "prepolymer",
-    "phenonenon",
-    "head-cold",
-    "lowlands",
-    "visibility",
-    "corrupts",
-    "disciplinary",
-    "lousie",
-    "curtail",
-    "husky-voiced",
-    "ghastly",
-    "raids",
-    "bridegroom's",
-    "gre.",
-    "incitements",
-    "yachting",
-    "oxytetracycline",
-    "d'aumont",
-    "k.c.",
-    "luray",
-    "skunks",
-    "honey-in-the-sun",
-    "tawney",
-    "pretense",
-    "dissatisfaction",
-    "anti-french",
-    "halfback",
-    "gil",
-    "rattzhenfuut",
-    "whereas",
-    "dove",
-    "coolidges'",
-    "regeneration",
-    "displace",
-    "schwarzkopf",
-    "polar",
-    "repeater",
-    "suits",
-    "willya",
-    "culminate",
-    "nastiest",
-    "urea",
-    "shotwell",
-    "pestilent",
-    "dior",
-    "veal",
-    "whiplashes",
-    "krakatoa",
-    "enrico",
-    "prodigies",
-    "home-bound",
-    "milky",
-    "-ing",
-    "24",
-    "foliage",
-    "scholar-businessman",
-    "lumbar",
-    "jeopardy",
-    "magenta",
-    "break-away",
-    "geopolitical",
-    "unromantic",
-    "tutors",
-    "advice",
-    "early-season",
-    "sidewalks",
-    "unattended",
-    "58",
-    "renditions",
-    "other",
-    "crusades",
-    "sokolov",
-    "anteater",
-    "stillwell",
-    "ahead",
-    "tearle",
-    "disbursed",
-    "iraj",
-    "comparison",
-    "experimentations",
-    "dwyer",
-    "non-representation",
-    "exciting",
-    "correlated",
-    "matches",
-    "quickstep",
-    "cami",
-    "anti-trust",
-    "nikolai",
-    "displayed",
-    "wheezing",
-    "summitry",
-    "violate",
-    "mayflower",
-    "intimacy",
-    "burman's",
-    "entirety",
-    "surname",
-    "macgregors",
-    "pittsboro",
-    "product",
-    "densmore",
-    "mann",
-    "one-o'clock",
-    "roused",
-    "extendibles",
-    "enriching",
-    "dooms",
-    "lackadaisical",
-    "revolver",
-    "citybred",
-    "glendora's",
-    "hearn",
-    "neuralgia",
-    "e.g.",
-    "lanes",
-    "pre-legislative",
-    "hiram",
-    "turmoil",
-    "nonequivalent",
-    "695",
-    "cdc's",
-    "roebuck",
-    "carport",
-    "anglo-saxon",
-    "boyars",
-    "longwood",
-    "veiled",
-    "450-mile-long",
-    "lizards",
-    "plainly",
-    "coils",
-    "involutorial",
-    "spokesman",
-    "puncturing",
-    "centimeter",
-    "diagnoses",
-    "1-hp",
-    "exuberance",
-    "impelling",
-    "b-52",
-    "$35,823",
-    "forklift",
-    "carte",
-    "functioning",
-    "hyperbolic",
-    "hinged",
-    "skye",
-    "vermont",
-    "atlanta's",
-    "principals",
-    "willfully",
-    "pristine",
-    "curettage",
-    "alters",
-    "dislodge",
-    "insuring",
-    "killpath's",
-    "enterprising",
-    "11:20",
-    "stirrup-guard",
-    "planeload",
-    "distractions",
-    "fetish",
-    "stanislas",
-    "mistaken",
-    "head",
-    "shadows",
-    "ornamented",
-    "attached",
-    "inducement",
-    "shimmer",
-    "indicates",
-    "statuette",
-    "rusk's",
-    "lonsdale",
-    "anti-communist",
-    "disaffected",
-    "antifundamentalist",
-    "feuds",
-    "70%",
-    "thule",
-    "vermeil",
-    "reimburseable",
-    "parlayed",
-    "enervating",
-    "crusher",
-    "tattered",
-    "kroger's",
-    "policemen",
-    "unpicturesque",
-    "floridian",
-    "tuned",
-    "terming",
-    "arcilla",
-    "concepts",
-    "tried",
-    "clothe",
-    "waxing",
-    "shotguns",
-    "one-dumbbell",
-    "cooler",
-    "re-living",
-    "howdy",
-    "pretensions",
-    "liquidity",
-    "curses",
-    "shareholders",
-    "obtain",
-    "spicy",
-    "refraction",
-    "voraciously",
-    "editorially",
-    "contrasts",
-    "projectile",
-    "by-gone",
-    "glassless",
-    "toni",
-    "bordeau",
-    "systematically",
-    "uphold",
-    "mavis",
-    "kindliness",
-    "polite",
-    "governing",
-    "carter",
-    "deficiency",
-    "interfaces",
-    "open-minded",
-    "rendition",
-    "contendere",
-    "enterprises",
-    "tubes",
-    "shortly",
-    "equanimity",
-    "pompadour",
-    "marker",
-    "junior-senior",
-    "devens",
-    "remembered",
-    "gone",
-    "amortization",
-    "sanction",
-    "follies",
-    "vociferousness",
-    "woodward",
-    "pinpoints",
-    "dolley",
-    "desprez",
-    "alderman",
-    "jee-sus",
-    "parsonage",
-    "friends'",
-    "idols",
-    "electromagnetism",
-    "24-in.",
-    "duces",
-    "pavlov",
-    "katherine",
-    "hi-graders",
-    "gentian",
-    "ouse",
-    "nebraska",
-    "scarify",
-    "reformed",
-    "exponential",
-    "equidistant",
-    "remark",
-    "buddhists",
-    "incessant",
-    "race-drivers",
-    "napoleon's",
-    "lattimer",
-    "considerin'",
-    "laredo",
-    "insets",
-    "submerging",
-    "cotten",
-    "neo-classicism",
-    "52",
-    "billiken",
-    "noxious",
-    "multiversity",
-    "traded",
-    "airframe",
-    "necessary",
-    "kaleidescope",
-    "destroyed",
-    "simulate",
-    "outsmarted",
-    "donkey",
-    "gosson",
-    "milquetoasts",
-    "resultants",
-    "drizzling",
-    "fortescue",
-    "sybil",
-    "twittering",
-    "unliterary",
-    "magoun",
-    "bari",
-    "chatted",
-    "cemetery",
-    "eventuate",
-    "superiors",
-    "proprietor",
-    "resides",
-    "grapes",
-    "importunities",
-    "denuded",
-    "wide-open",
-    "re-emergence",
-    "gush",
-    "yakov",
-    "almighty",
-    "alreadeh",
-    "smirked",
-    "cowessett-east",
-    "prisoner",
-    "natures",
-    "organizations",
-    "parole",
-    "cerv",
-    "sparkling",
-    "dark-haired",
-    "wilcox",
-    "safeguard",
-    "radical",
-    "manservant",
-    "contradicts",
-    "ferdinand",
-    "attributed",
-    "reproduces",
-    "half-intensity",
-    "grabski",
-    "potentiometer",
-    "elegy",
-    "chlorothiazide",
-    "mph",
-    "sprightly",
-    "hendricks",
-    "regression",
-    "contain",
-    "eng.",
-    "cameo-like",
-    "amassing",
-    "unhesitatingly",
-    "rican",
-    "1962",
-    "bayerische",
-    "delightfully",
-    "reloaded",
-    "explorer",
-    "limbic",
-    "restored",
-    "jon",
-    "hubba",
-    "attempted",
-    "backgrounds",
-    "glass-like",
-    "cooperative",
-    "kazan",
-    "ludwick",
-    "rebelling",
-    "subjugate",
-    "manes",
-    "fetes",
-    "lso",
-    "bronx",
-    "torrid",
-    "russians'",
-    "conceive",
-    "ponchartrain",
-    "associate",
-    "brew",
-    "budieshein",
-    "subatomic",
-    "compelled",
-    "instantly",
-    "volumetric",
-    "1,000,000",
-    "preacher-singer",
-    "four-sided",
-    "diluting",
-    "exhibit",
-    "riddled",
-    "impartation",
-    "atom",
-    "splattered",
-    "ritualized",
-    "1895",
-    "1899",
-    "historian",
-    "tee",
-    "corridors",
-    "partisans",
-    "imbedded",
-    "discounts",
-    "chops",
-    "forty-seven",
-    "basil",
-    "gazer",
-    "ninety-eight",
-    "philly",
-    "indulgent",
-    "pachelbel",
-    "m.",
-    "gasser",
-    "lapsed",
-    "impunity",
-    "liveried",
-    "usefulness",
-    "omniscient",
-    "heartily",
-    "intelligently",
-    "concretistic",
-    "yodeling",
-    "bridewell",
-    "severe-looking",
-    "aftuh",
-    "wesley",
-    "jidge",
-    "eluard",
-    "congruent",
-    "bombus",
-    "underlie",
-    "finger-held",
-    "lissa",
-    "ambiguity",
-    "22-year-old",
-    "blood-bought",
-    "lanthanum",
-    "skinless",
-    "bleakly",
-    "aggravates",
-    "reportorial",
-    "grinsfelder",
-    "misalignment",
-    "ex-schoolteacher",
-    "privations",
-    "difference",
-    "reading",
-    "quantitative",
-    "get",
-    "shearing",
-    "barcus",
-    "oats's",
-    "untch",
-    "literature",
-    "fidelity",
-    "histochemistry",
-    "hollingshead",
-    "hustler",
-    "uso",
-    "faker",
-    "data",
-    "far-famed",
-    "perversely",
-    "benzedrine",
-    "dos",
-    "loans",
-    "introspection",
-    "luckily",
-    "state-sponsored",
-    "infusion",
-    "past",
-    "biologist",
-    "toland",
-    "self-consuming",
-    "puppy",
-    "self-destructive",
-    "not-less-deadly",
-    "beating",
-    "sacre",
-    "proven",
-    "fiasco",
-    "commission-controlled",
-    "1946",
-    "victrola",
-    "monodisperse",
-    "bearer",
-    "gender",
-    "carnochan",
-    "strips",
-    "assai",
-    "noblest",
-    "patrols",
-    "electrode",
-    "allotments",
-    "looming",
-    "shunt",
-    "extrovert",
-    "calcification",
-    "cygne",
-    "levin",
-    "switchblade",
-    "remy",
-    "voyages",
-    "impressed",
-    "dainty-legged",
-    "lemmas",
-    "neversink",
-    "sympathized",
-    "divides",
-    "alain",
-    "becket",
-    "$1",
-    "smolders",
-    "f-108",
-    "nonchalant",
-    "11,000",
-    "bmews",
-    "chemist's",
-    "exaggeration",
-    "momentoes",
-    "organize",
-    "errand",
-    "demonstrates",
-    "depended",
-    "switch",
-    "pinch-hitter",
-    "saint-saens",
-    "goodness",
-    "classed",
-    "adventure",
-    "shoulder-to-shoulder",
-    "eminonu",
-    "three",
-    "roloff",
-    "fractional",
-    "badness",
-    "mcn.",
-    "dreary",
-    "dere",
-    "scars",
-    "chancellorsville",
-    "poltava",
-    "flattened",
-    "fer",
-    "hollyhock",
-    "well-written",
-    "salisbury",
-    "contradistinction",
-    "quotations",
-    "instigating",
-    "birches",
-    "successes",
-    "agonizes",
-    "salamander",
-    "sterilize",
-    "blue-collar",
-    "reclaimed",
-    "sexes",
-    "foyer",
-    "sights",
-    "8,280",
-    "l'institut",
-    "$.50",
-    "nugget",
-    "fiber",
-    "wonderland",
-    "sausage",
-    "basement",
-    "whores",
-    "technology",
-    "pre-empting",
-    "kipling's",
-    "deliciously",
-    "half-sister",
-    "coastline",
-    "social",
-    "wade",
-    "shatters",
-    "prairie",
-    "unless",
-    "twice-a-year",
-    "morning-frightened",
-    "investigation",
-    "110",
-    "biblical",
-    "bounced",
-    "aggrieved",
-    "bemoan",
-    "3.75",
-    "40,000,000",
-    "tango",
-    "whine",
-    "african",
-    "gorging",
-    "finish",
-    "invert",
-    "jumper",
-    "chromic",
-    "5th",
-    "725's",
-    "highest",
-    "curves",
-    "week-end",
-    "nullified",
-    "brow",
-    "49th",
-    "baer",
-    "1827",
-    "renaturation",
-    "brass",
-    "championships",
-    "e",
-    "stagnant",
-    "mined",
-    "metabolite",
-    "somerset",
-    "disc",
-    "ripe",
-    "gratefully",
-    "womb",
-    "dogumenti",
-    "hanover-lucy",
-    "conformational",
-    "bugler",
-    "registrant",
-    "tripods",
-    "sarasate",
-    "beers",
-    "adenomas",
-    "nyu",
-    "packwood",
-    "month's",
-    "interpretations",
-    "doubtfully",
-    "faber",
-    "roof",
-    "world-renowned",
-    "dream-way",
-    "recounted",
-    "mantle",
-    "hostess",
-    "syntactically",
-    "houk",
-    "chandler",
-    "echoed",
-    "stimulation",
-    "infinitesimally",
-    "litorigin",
-    "amusements",
-    "venture",
-    "28-30",
-    "fire-crackers",
-    "manon",
-    "selections",
-    "annoy",
-    "queen",
-    "tension",
-    "1771",
-    "cowpuncher",
-    "sultry",
-    "bagley",
-    "disease",
-    "invalids",
-    "bail",
-    "nagasaki",
-    "am",
-    "fund's",
-    "ward-heelers",
-    "trustees'",
-    "hitching",
-    "big-daddy",
-    "tuesday",
-    "switch-hitter",
-    "enviously",
-    "mothers'",
-    "maestro's",
-    "equilibrium",
-    "applicability",
-    "shortcuts",
-    "forthrightly",
-    "par-5",
-    "attributing",
-    "sheraton-dallas",
-    "caron",
-    "misplacements",
-    "choring",
-    "initially",
-    "henrietta's",
-    "hall-mark",
-    "hurdled",
-    "resemble",
-    "blacking",
-    "owi",
-    "hot-blooded",
-    "jackie",
-    "damnit",
-    "honoree",
-    "grimness",
-    "letterhead",
-    "since",
-    "nesting",
-    "antarctica",
-    "purchased",
-    "pancrazio",
-    "hebrew",
-    "tribune",
-    "dense",
-    "non-dramas",
-    "endure",
-    "veterinary",
-    "precedent",
-    "descriptive",
-    "v.",
-    "devotedly",
-    "aberration",
-    "maxwell",
-    "anti-communists",
-    "calvin",
-    "spray",
-    "brushcut",
-    "schott",
-    "0.025-in.",
-    "ratto",
-    "coughed",
-    "citizen",
-    "pastor",
-    "multi-state",
-    "out-of-step",
-    "pals",
-    "covert",
-    "35%",
-    "fiefdom",
-    "adhere",
-    "dreamlike",
-    "perluss",
-    "brisbane",
-    "stirling",
-    "janitors'",
-    "wintered",
-    "cleanly",
-    "spelling",
-    "branded",
-    "aiken",
-    "4-d",
-    "30th",
-    "tcu's",
-    "presupposes",
-    "halftime",
-    "lyrics",
-    "flower",
-    "pertinent",
-    "cooperman",
-    "whigs",
-    "346",
-    "rebuffed",
-    "demonstrated",
-    "85-piece",
-    "wilfully",
-    "71",
-    "secession",
-    "undisturbed",
-    "breasted",
-    "distinguished",
-    "ring",
-    "deficits",
-    "applicant",
-    "microscopes",
-    "hateful",
-    "quavering",
-    "watch-spring",
-    "reprisals",
-    "tripoli",
-    "25-year-old",
-    "mingus",
-    "hemorrhages",
-    "demoralize",
-    "sold-out",
-    "collaborators",
-    "memento",
-    "varitinted",
-    "dear",
-    "nautilus",
-    "required",
-    "spain",
-    "120-degrees",
-    "bubbled",
-    "unclouded",
-    "poet's",
-    "unscathed",
-    "rots",
-    "comprehended",
-    "cork",
-    "green-tinted",
-    "precipitin",
-    "brahms",
-    "responsibly",
-    "foolproof",
-    "premiere",
-    "mahogany",
-    "bonaparte",
-    "dreamin",
-    "venetian",
-    "tempos",
-    "imperiled",
-    "possibility",
-    "flemish",
-    "spheres",
-    "constitutes",
-    "mays'",
-    "doorways",
-    "lionel",
-    "ed",
-    "marshmallows",
-    "bankhead",
-    "dared",
-    "monterey",
-    "pleasantly",
-    "lobbied",
-    "'80's",
-    "unusually",
-    "hearer",
-    "copernican",
-    "nucleated",
-    "omen",
-    "mamaroneck",
-    "hook",
-    "by-word",
-    "cleaned",
-    "pursue",
-    "conquest",
-    "offerings",
-    "valley",
-    "handcuffs",
-    "coincides",
-    "karp's",
-    "thoroughfares",
-    "jurists",
-    "temples",
-    "engulfs",
-    "malevolent",
-    "flipping",
-    "nigeria",
-    "stamens",
-    "0.25",
-    "simonelli",
-    "insinuates",
-    "hold",
-    "complex",
-    "roommates",
-    "non-objective",
-    "eighty-sixth",
-    "fifty-fifty",
-    "insinuated",
-    "$55,000",
-    "honoured",
-    "5-5",
-    "prosperous",
-    "emphasized",
-    "inconsequential",
-    "forcibly",
-    "sheepe",
-    "matilda",
-    "wholewheat",
-    "fueled",
-    "flicks",
-    "one-week-old",
-    "laze",
-    "adept",
-    "undercut",
-    "french-born",
-    "tripod",
-    "dour",
-    "900-student",
-    "contradictory",
-    "outburst",
-    "salt-fractionation",
-    "stanley",
-    "vying",
-    "sabre",
-    "civilian",
-    "katya",
-    "aleck",
-    "barry",
-    "outdistancing",
-    "elburn",
-    "uncaused",
-    "donated",
-    "familiarly",
-    "sintered",
-    "denunciations",
-    "monagan",
-    "leasing",
-    "xydis'",
-    "pork-barrel",
-    "pancho",
-    "schmidl-seeberg",
-    "566",
-    "homecoming",
-    "fade",
-    "sanitarium",
-    "voegelin",
-    "unprofessional",
-    "gilded",
-    "creston",
-    "sifted",
-    "memoir",
-    "peeled",
-    "prostitutes",
-    "steadfastly",
-    "exasperating",
-    "sequences",
-    "encephalitis",
-    "linked",
-    "senators",
-    "circumcision",
-    "corcoran",
-    "cohorts",
-    "revolution",
-    "maybe",
-    "merriest",
-    "redevelopers",
-    "well-informed",
-    "cornell-dubilier",
-    "bombers'",
-    "chunk",
-    "institution-wide",
-    "good-night",
-    "grumble",
-    "would-be",
-    "neighborliness",
-    "celie's",
-    "helps",
-    "finally",
-    "discusses",
-    "freinkel",
-    "invitational",
-    "firebreaks",
-    "reprimanded",
-    "sensed",
-    "contrabass",
-    "machinery",
-    "123",
-    "apprehensively",
-    "dirt",
-    "soy",
-    "tub",
-    "rubber-like",
-    "poetry-and-jazz",
-    "guiltiness",
-    "rolnick",
-    "theatre",
-    "unanswered",
-    "480",
-    "oregonians",
-    "mcghie",
-    "heavy-faced",
-    "public-school",
-    "kissings",
-    "haqvin",
-    "primitive-eclogue",
-    "south",
-    "arable",
-    "naps",
-    "flippers",
-    "andrews",
-    "almaden",
-    "uttered",
-    "lamming",
-    "target's",
-    "inference",
-    "deftness",
-    "'20's",
-    "hevin",
-    "accommodation",
-    "anglo-saxons",
-    "top-drawer",
-    "ruminants",
-    "damsel",
-    "torpetius",
-    "louisa",
-    "goodis",
-    "less-traveled",
-    "ignoring",
-    "hamiltonian",
-    "faithfully",
-    "hecatomb",
-    "investors",
-    "bookies",
-    "bones",
-    "tories",
-    "hotel-motel",
-    "nbc-tv",
-    "skeptical",
-    "delaware",
-    "clipper",
-    "typing",
-    "sherrill",
-    "planters'",
-    "anguish",
-    "abdallah",
-    "newspaperman",
-    "fig.",
-    "tinkering",
-    "domiciled",
-    "laborer",
-    "open-work",
-    "galvanizing",
-    "stylemark",
-    "morningstar",
-    "williams",
-    "thirty-one",
-    "36-year-old",
-    "why'n",
-    "tyrants",
-    "defeatism",
-    "herrick",
-    "troyes",
-    "teleological",
-    "anthropomorphic",
-    "schoolroom",
-    "cain",
-    "sublime",
-    "bristled",
-    "huey",
-    "forgo",
-    "kinetic",
-    "favore",
-    "hazy",
-    "reassert",
-    "palace's",
-    "needed",
-    "shish",
-    "scholastically",
-    "gage",
-    "jonquils",
-    "gaspee",
-    "instructor's",
-    "removed",
-    "opponent",
-    "exacerbation",
-    "meanness",
-    "primary",
-    "whiteness",
-    "philosophies",
-    "refused",
-    "mallinckrodt",
-    "unitarian",
-    "dusk",
-    "retaliated",
-    "nine-year",
-    "open-ended",
-    "stumps",
-    "lady-bugs",
-    "sandbars",
-    "tailored",
-    "receiving",
-    "finest",
-    "souls'",
-    "dehydration",
-    "berman",
-    "elm",
-    "trances",
-    "manufacturing",
-    "merriment",
-    "earth",
-    "luscious",
-    "survivalists",
-    "holderlin",
-    "hetman",
-    "tim",
-    "6.2",
-    "interpolation",
-    "eurasian",
-    "ranking",
-    "twenty-one",
-    "cockatoo",
-    "mayoral",
-    "deficient",
-    "charities",
-    "gosh",
-    "conservatism",
-    "christendom",
-    "momentarily",
-    "snow-white",
-    "berkeley",
-    "2,489,000",
-    "overage",
-    "should",
-    "prolongation",
-    "one-sixteenth",
-    "redecorated",
-    "defeating",
-    "duffy",
-    "clamoring",
-    "hoarse",
-    "injecting",
-    "slick",
-    "chester",
-    "subcontinent",
-    "junctures",
-    "downed",
-    "socked",
-    "incorporates",
-    "brunt",
-    "retain",
-    "alger",
-    "engulfed",
-    "thermoforming",
-    "coherence",
-    "spring-training",
-    "pensions",
-    "bini",
-    "progressed",
-    "tail",
-    "1881",
-    "landis",
-    "cooper",
-    "provisioned",
-    "algorithm",
-    "stud",
-    "warred",
-    "prints",
-    "fleming",
-    "reno-lake",
-    "admitted",
-    "weinberg",
-    "objectiveness",
-    "viphakone",
-    "queer",
-    "707",
-    "ring-around-the-rosie",
-    "york's",
-    "singers'",
-    "coulda",
-    "rail",
-    "copied",
-    "francisco's",
-    "diethylaminoethyl",
-    "der",
-    "interclass",
-    "mellow",
-    "oxford",
-    "unconsciously",
-    "significants",
-    "apotheosis",
-    "17th",
-    "predecessor",
-    "reader",
-    "experienced",
-    "dimesize",
-    "epidemic",
-    "topnotch",
-    "inanimate",
-    "phenothiazine",
-    "powers-that-be",
-    "tobacco-juice",
-    "impoundments",
-    "treasury's",
-    "guizot",
-    "thefin",
-    "beardsley's",
-    "expressly",
-    "unthinking",
-    "weldwood",
-    "zachrisson's",
-    "bg",
-    "unitarians",
-    "too-naked",
-    "molly's",
-    "diesel",
-    "blooded",
-    "momma",
-    "attack",
-    "standard-times",
-    "eagle's",
-    "emerge",
-    "sybert",
-    "bindle",
-    "equitably",
-    "quick-wate",
-    "micawber",
-    "catkin",
-    "pompey",
-    "inferiority",
-    "silently",
-    "rockville",
-    "great-grandson",
-    "chin",
-    "centralizing",
-    "pushed",
-    "distrusted",
-    "polluted",
-    "super-secret",
-    "photomicrograph",
-    "executions",
-    "interdependent",
-    "clay-mining",
-    "suburbanites",
-    "middle-class",
-    "combellack",
-    "cyprian",
-    "macneff",
-    "extremes",
-    "lionesses",
-    "autobiographic",
-    "jamaica",
-    "rowdy",
-    "1613",
-    "threaten",
-    "smirk",
-    "1581",
-    "all-star",
-    "word",
-    "darted",
-    "stripe",
-    ":",
-    "insolence",
-    "kraft",
-    "sutherland",
-    "renown",
-    "barnaba",
-    "finial",
-    "flotte's",
-    "neon-lighted",
-    "trapezoid",
-    "destructive",
-    "seed",
-    "throbbing",
-    "unteach",
-    "coup",
-    "cinders",
-    "fire-resistant",
-    "lauderdale",
-    "residing",
-    "oilcloth",
-    "derivations",
-    "converts",
-    "ophthalmic",
-    "future-time",
-    "teen-ager",
-    "textile-exporting",
-    "szolds",
-    "germania",
-    "scrambling",
-    "shortages",
-    "rebs",
-    "interpret",
-    "scores",
-    "unnnt",
-    "secretariat",
-    "czechoslovakia",
-    "tornado",
-    "lilly",
-    "darkhaired",
-    "jacobs",
-    "lousy",
-    "einstein's",
-    "pontiac",
-    "naturally",
-    "boehmer",
-    "rewritten",
-    "stirups",
-    "uncover",
-    "indignation",
-    "generalists",
-    "generalization",
-    "wax",
-    "stripped",
-    "knick-knacks",
-    "slurped",
-    "wohaws",
-    "dramatize",
-    "dice",
-    "iron-shod",
-    "modulation",
-    "45-passenger",
-    "domineering",
-    "board's",
-    "socializes",
-    "unconstitutional",
-    "predominated",
-    "muhammad",
-    "deteriorates",
-    "farrell",
-    "vaska",
-    "seat",
-    "astin",
-    "bueno",
-    "mass",
-    "mattered",
-    "foreknown",
-    "leaf",
-    "jobs",
-    "beccaria",
-    "ranted",
-    "-.5",
-    "aloes",
-    "$450",
-    "q.",
-    "migratory",
-    "6-ounce",
-    "shortage",
-    "dabbing",
-    "sellin'",
-    "power-starved",
-    "receptionist",
-    "seafaring",
-    "anyway",
-    "ungodly",
-    "frayed",
-    "dante's",
-    "bluntly",
-    "proviso",
-    "oath-taking",
-    "dressings",
-    "congruence",
-    "indefiniteness",
-    "causal",
-    "marketplace",
-    "handbag",
-    "crushers",
-    "wlib",
-    "managing",
-    "fe",
-    "representing",
-    "pillar",
-    "intercepted",
-    "balked",
-    "gettin'",
-    "tacitly",
-    "gaily",
-    "complained",
-    "student",
-    "gabrielle",
-    "piston",
-    "2.512",
-    "oriented",
-    "text-lookup",
-    "quantitatively",
-    "misty",
-    "balaguer's",
-    "colmer",
-    "strives",
-    "miscreant",
-    "trifle",
-    "falsity",
-    "unification",
-    "stranded",
-    "movements",
-    "hails",
-    "whizzed",
-    "pianist's",
-    "surveyed",
-    "communists",
-    "langeland",
-    "convulsions",
-    "eddie's",
-    "greece",
-    "ell",
-    "gator",
-    "overpowers",
-    "canoe",
-    "pique",
-    "rifle",
-    "listenin'",
-    "addison",
-    "cutest",
-    "fidel",
-    "candidate",
-    "ably",
-    "divarco",
-    "6th",
-    "sharpshooters",
-    "boldness",
-    "ole",
-    "spector",
-    "landesco",
-    "warming",
-    "propose",
-    "screening",
-    "eccentricities",
-    "reliably",
-    "brilliance",
-    "legends",
-    "nearer",
-    "demolished",
-    "speechlessness",
-    "healthily",
-    "longshoremen's",
-    "chantey",
-    "hephzibah",
-    "complaints",
-    "blevins",
-    "fish",
-    "gruller",
-    "screamed",
-    "truckdriver",
-    "stench",
-    "61st",
-    "obscurely",
-    "degrees",
-    "peacetime",
-    "roosevelt",
-    "filippo",
-    "retort",
-    "foot",
-    "1626",
-    "willow-lined",
-    "guideposts'",
-    "baseman",
-    "tapped",
-    "cousin",
-    "arylesterases",
-    "self-discipline",
-    "kauffeld",
-    "bosses",
-    "propeller-driven",
-    "imitation",
-    "raspberry",
-    "birds",
-    "hammond",
-    "blossomed",
-    "qualifies",
-    "banner",
-    "step-by-step",
-    "veneto",
-    "impropriety",
-    "precede",
-    "post",
-    "rodeo",
-    "leaving",
-    "1,524",
-    "repnin",
-    "eradication",
-    "gisors",
-    "non-english",
-    "scouring",
-    "frontal",
-    "response",
-    "avoid",
-    "hanover-mauri",
-    "431",
-    "maker",
-    "salary",
-    "liverpool",
-    "conscription",
-    "tuskegee",
-    "counts",
-    "corona",
-    "martinelli",
-    "self-enclosed",
-    "guile",
-    "caseworkers",
-    "nothingness",
-    "seminal",
-    "intrigues",
-    "peterson",
-    "balconies",
-    "5-3",
-    "ticking",
-    "quyne",
-    "transformer",
-    "$37,500",
-    "estranging",
-    "selves",
-    "1918",
-    "stagecoach",
-    "1690",
-    "koan",
-    "goaded",
-    "whenever",
-    "yale's",
-    "ft.",
-    "hunter-killer",
-    "electric-utility",
-    "rodgers'",
-    "pupils",
-    "nondescriptly",
-    "landslide",
-    "bazaars",
-    "experimenter",
-    "respond",
-    "welfare",
-    "erroneous",
-    "west's",
-    "stopovers",
-    "secede",
-    "morbid-minded",
-    "counter-escalation",
-    "vickery",
-    "caucusing",
-    "hilprecht",
-    "calculation",
-    "varied",
-    "over-arranged",
-    "gagline",
-    "therefore",
-    "synthetic",
-    "shifts",
-    "belgians",
-    "february's",
-    "conversations",
-    "assemblage",
-    "cupped",
-    "galt",
-    "shamrock",
-    "encroaching",
-    "tiredness",
-    "christian",
-    "amplified",
-    "warwick",
-    "macaulay's",
-    "tapering",
-    "workday",
-    "projectiles",
-    "whitney",
-    "unrelenting",
-    "serfs",
-    "specimens",
-    "complainant",
-    "fences",
-    "circumstance",
-    "baritone",
-    "corruption",
-    "supplanting",
-    "immaculate",
-    "w-i-d-e",
-    "locking",
-    "cursory",
-    "nearing",
-    "athletics",
-    "long-endurance",
-    "linguists",
-    "interprets",
-    "swears",
-    "expenditures",
-    "meanest",
-    "donors",
-    "zounds",
-    "holiday",
-    "maxine",
-    "comprised",
-    "survives",
-    "signals",
-    "skimpy",
-    "decreased",
-    "lion's",
-    "telegraphers",
-    "wainscoted",
-    "dowel",
-    "evaporate",
-    "libellos",
-    "microchemistry",
-    "frederik",
-    "lots",
-    "knee-type",
-    "belshazzar",
-    "arrington",
-    "clobber",
-    "banishing",
-    "posey",
-    "opposing",
-    "cross-top",
-    "hepker",
-    "quicken",
-    "transactions",
-    "disintegrative",
-    "plopped",
-    "bowls",
-    "ever-tightening",
-    "p(q)",
-    "baptist",
-    "familar",
-    "caked",
-    "forty",
-    "anachronisms",
-    "lately",
-    "enzymes",
-    "reckoning",
-    "assets",
-    "dazzled",
-    "logs",
-    "waked",
-    "equipotent",
-    "endowment",
-    "minds",
-    "forty-third",
-    "258",
-    "reorganization",
-    "editorialist",
-    "humiliation",
-    "deepened",
-    "cart",
-    "rabbeting",
-    "ansley",
-    "contradictorily",
-    "redcoats",
-    "tuition",
-    "1764",
-    "mythology",
-    "lb-plus",
-    "biographers",
-    "magee",
-    "supplied",
-    "virility",
-    "greenfield",
-    "dull",
-    "interminable",
-    "reacting",
-    "scurried",
-    "21-year-old",
-    "demography",
-    "unsure",
-    "twenty-nine-foot-wide",
-    "frustration",
-    "repainting",
-    "chunky",
-    "tetrasodium",
-    "cbs",
-    "week-old",
-    "serviceable",
-    "fern",
-    "sheeting",
-    "coldly",
-    "inaugurating",
-    "giver",
-    "convict",
-    "two-lane",
-    "guardini",
-    "reincarnated",
-    "offensive",
-    "specify",
-    "superimposes",
-    "ns",
-    "barbecues",
-    "bonham",
-    "sis",
-    "minnesota",
-    "persuasions",
-    "because",
-    "prolusions",
-    "polyisocyanates",
-    "road's",
-    "apocrypha",
-    "bertha",
-    "ekstrohm",
-    "plucking",
-    "segregate",
-    "strang",
-    "fawned",
-    "knife's",
-    "discontinued",
-    "glee-club",
-    "linear",
-    "haney's",
-    "dollar-sign",
-    "dilation",
-    "krutch's",
-    "allocable",
-    "happened",
-    "suffocation",
-    "hyperemic",
-    "tie",
-    "two-inch",
-    "$11,900,000",
-    "zendo",
-    "monte",
-    "terse",
-    "originate",
-    "lund",
-    "crib",
-    "sesame",
-    "manometer",
-    "aimless",
-    "messinesi",
-    "trillion",
-    "ineptness",
-    "excessively",
-    "tareytown",
-    "bag",
-    "dinghy",
-    "cosmopolitanism",
-    "coudn",
-    "isolationistic",
-    "societal",
-    "time-consuming",
-    "feelings",
-    "submariners",
-    "drive-yourself",
-    "wrong-o",
-    "klan",
-    "sunbaked",
-    "insanity",
-    "oneasy",
-    "besmirching",
-    "off-shore",
-    "nasser's",
-    "patted",
-    "commerce",
-    "2:01.1",
-    "foundling",
-    "ghazals",
-    "underprivileged",
-    "needles",
-    "deformity",
-    "vexatious",
-    "canonized",
-    "heavy-duty",
-    "133",
-    "shrewdest",
-    "rapt",
-    "blessed",
-    "off-flavor",
-    "devotees",
-    "glinted",
-    "nuance",
-    "tolley's",
-    "birthday",
-    "accidentally",
-    "gaylor's",
-    "chilly",
-    "spherules",
-    "embroiled",
-    "floorboards",
-    "bandstand",
-    "glanced",
-    "bondsman's",
-    "sausages",
-    "indiscriminantly",
-    "mano",
-    "gleamed",
-    "flirtatious",
-    "p's",
-    "maxentius",
-    "await",
-    "yale",
-    "gasp",
-    "comet",
-    "induction",
-    "lob",
-    "willingly",
-    "denounce",
-    "winsor",
-    "upper-lower",
-    "horses'",
-    "phobic-like",
-    "tote",
-    "breeches",
-    "arms-making",
-    "lighthouses",
-    "betrothed",
-    "from",
-    "core-jacket",
-    "saracens",
-    "heidegger's",
-    "singlehandedly",
-    "2:02.2",
-    "tardy",
-    "how'd",
-    "nijinsky",
-    "persimmons",
-    "khaneh",
-    "ryusenji",
-    "novelist",
-    "beaumont",
-    "corsi",
-    "remanding",
-    "murderers",
-    "catastrophic",
-    "'",
-    "cube",
-    "n-dimensional",
-    "disgusting",
-    "absorptive",
-    "actuate",
-    "snap",
-    "pry",
-    "tons",
-    "lew",
-    "filed",
-    "self-mastery",
-    "surmounted",
-    "fictitious",
-    "carleton's",
-    "fulfilled",
-    "sums",
-    "hesitates",
-    "management-trained",
-    "ormsby",
-    "contractor's",
-    "co-extinction",
-    "fortune-tellers",
-    "desynchronizing",
-    "pawnshop",
-    "plasters",
-    "joyous",
-    "snow-fence",
-    "ainsworth",
-    "perpetuation",
-    "tabulations",
-    "hector's",
-    "derelict",
-    "habla",
-    "1,850",
-    "pores",
-    "mule",
-    "rosemary",
-    "abbey",
-    "candlestick",
-    "saledo",
-    "hyperfine",
-    "draped",
-    "falcons'",
-    "habitable",
-    "glide",
-    "disloyal",
-    "exclusively",
-    "bang-jensen's",
-    "amply",
-    "linden",
-    "lack",
-    "vertex",
-    "icy",
-    "foals",
-    "searles",
-    "orgasm",
-    "uselessness",
-    "gelly",
-    "disaster",
-    "searching",
-    "heresy",
-    "sayings",
-    "temptingly",
-    "$1,750,000",
-    "calhoun's",
-    "expressionistic",
-    "clerical",
-    "distributive",
-    "elimination",
-    "low-tension",
-    "publication",
-    "fueloil",
-    "median",
-    "cobwebs",
-    "centuries-old",
-    "mathias",
-    "evidences",
-    "striding",
-    "cretaceous",
-    "relishes",
-    "segura",
-    "specialization",
-    "deutsche",
-    "eclipse",
-    "oedipal",
-    "pinpointing",
-    "ballots",
-    "penman",
-    "pundits",
-    "wigmaker",
-    "lukewarm",
-    "long-cruise",
-    "reread",
-    "renunciations",
-    "expendable",
-    "usis",
-    "trend-following",
-    "crazily",
-    "valued",
-    "enviable",
-    "skullcap",
-    "whirring",
-    "interviewers",
-    "imperious",
-    "ladylike",
-    "identified",
-    "copernicus'",
-    "knees",
-    "$25-a-plate",
-    "mushroom",
-    "dewars",
-    "tout",
-    "perpetually",
-    "325-degrees-c",
-    "factual",
-    "staten",
-    "occluded",
-    "speeds",
-    "lightened",
-    "fringed",
-    "relieved",
-    "below",
-    "patched",
-    "day-by-day",
-    "theoretically",
-    "st.-pol",
-    "bearded",
-    "whippet",
-    "summons",
-    "oczakov",
-    "slanders",
-    "caucasian",
-    "$3,500",
-    "swamps",
-    "overestimated",
-    "teems",
-    "taoism",
-    "corn-belt",
-    "nerves",
-    "jordon",
-    "senatorial",
-    "devotions",
-    "manipulations",
-    "clown's",
-    "justifications",
-    "mid-thirties",
-    "jym",
-    "investigator",
-    "21st",
-    "tshombe-gizenga-goa-ghana",
-    "simplicities",
-    "hirey",
-    "bids",
-    "sickened",
-    "3.25''",
-    "renfrew",
-    "bruxelles",
-    "mccone's",
-    "miles",
-    "pastors",
-    "northumberland",
-    "overheat",
-    "michelson",
-    "mutineer",
-    "1820",
-    "aspirin",
-    "pours",
-    "agreement",
-    "eccentrics",
-    "to-and-fro",
-    "samoa",
-    "psychopath",
-    "demagogues",
-    "red-visored",
-    "copings",
-    "reflecting",
-    "longings",
-    "bete",
-    "perier's",
-    "a-stoopin'",
-    "displaying",
-    "seynes",
-    "apple",
-    "reportage",
-    "limiting",
-    "warmish",
-    "grubby",
-    "vol.",
-    "fireplace",
-    "joshual",
-    "reflectors",
-    "viennese",
-    "pawtucket",
-    "repelled",
-    "perceptible",
-    "mettwurst",
-    "caliphs",
-    "caldwell's",
-    "cocu",
-    "princess-in-a-carriage",
-    "imperialism",
-    "apparently",
-    "insufficiently",
-    "concedes",
-    "third-shift",
-    "pillow",
-    "gravitational",
-    "dazed",
-    "admonition",
-    "hemisphere's",
-    "bourn",
-    "agnese",
-    "melodic",
-    "traineeships",
-    "cowboys",
-    "twenty-five-dollar",
-    "conventionalized",
-    "retraction",
-    "oatmeal",
-    "cooperated",
-    "fillies",
-    "lee",
-    "augment",
-    "steady",
-    "fallen",
-    "volstead",
-    "preparative",
-    "dialectic",
-    "ducking",
-    "near-absence",
-    "jour",
-    "pressure-happy",
-    "colh",
-    "mannerhouse",
-    "commonest",
-    "baptismal",
-    "shafts",
-    "floating-load",
-    "provocative",
-    "circumspection",
-    "braun",
-    "revelry",
-    "spuyten",
-    "amide",
-    "characterized",
-    "prepupal",
-    "risking",
-    "conant",
-    "gabbling",
-    "gazettes",
-    "demeans",
-    "assyriology",
-    "vigreux",
-    "sonar",
-    "sear",
-    "hurrying",
-    "10,500",
-    "unvarying",
-    "architects'",
-    "interact",
-    "accord",
-    "sedative",
-    "dan'l",
-    "batten",
-    "rockin'",
-    "roadway",
-    "dearer",
-    "dialect",
-    "thayer",
-    "ledge",
-    "drizzly",
-    "barricades",
-    "footage",
-    "dished",
-    "managers",
-    "verandas",
-    "atomic",
-    "catechize",
-    "admonitions",
-    "countervailing",
-    "morse",
-    "bookish",
-    "ct.",
-    "viola's",
-    "1599",
-    "exotic",
-    "portentous",
-    "laban",
-    "curtiss",
-    "webster",
-    "slave-laborers",
-    "yanking",
-    "jacopo",
-    "figure",
-    "confabulation",
-    "whitman",
-    "parts-suppliers",
-    "pantomime",
-    "pastime",
-    "tenting",
-    "shuiski",
-    "purpose",
-    "lest",
-    "undeniably",
-    "quibble",
-    "victoria's",
-    "dainty",
-    "twotiming",
-    "unglued",
-    "1961-62",
-    "readjusted",
-    "nbs",
-    "stager",
-    "blimp",
-    "stearns",
-    "outright",
-    "lists",
-    "revamped",
-    "alberto",
-    "opportune",
-    "incredulity",
-    "majesterial",
-    "incorporation",
-    "inspiration",
-    "clinches",
-    "somersault",
-    "uncurled",
-    "byronism",
-    "nationalize",
-    "ama",
-    "foundations",
-    "analogous",
-    "recovers",
-    "inordinately",
-    "suburbs",
-    "hiawatha",
-    "prie-dieu",
-    "newarker",
-    "throat's",
-    "dogs",
-    "gown",
-    "1854",
-    "giuseppe",
-    "inception",
-    "dollars-and-cents",
-    "pedigree",
-    "cigarettes",
-    "builder",
-    "army",
-    "incinerator",
-    "communist-inspired",
-    "clambering",
-    "magazine's",
-    "glenn",
-    "mariner",
-    "patting",
-    "militantly",
-    "chemists",
-    "0.3",
-    "seers",
-    "lampoon",
-    "reeder",
-    "colonus",
-    "householders",
-    "reported",
-    "idol-worship",
-    "malmros",
-    "roughed",
-    "mayer",
-    "drapes",
-    "muezzin",
-    "encamp",
-    "aaa",
-    "hour",
-    "anorexia",
-    "shattering",
-    "flexibility",
-    "tarry",
-    "mopping",
-    "remedies",
-    "fortress",
-    "finned",
-    "grievance",
-    "propagandistic",
-    "diplomats",
-    "kelseyville",
-    "stimson",
-    "hereditary",
-    "clare",
-    "adding",
-    "convicts",
-    "movingly",
-    "liturgical",
-    "widows",
-    "rich",
-    "hick-self",
-    "bathrobe",
-    "vade",
-    "minaces",
-    "atheromatous",
-    "favorer",
-    "labrador",
-    "askin'",
-    "announcements",
-    "instincts",
-    "anachronism",
-    "offstage",
-    "paxam",
-    "ropers",
-    "fluid-filled",
-    "sinless",
-    "rewarded",
-    "shawano",
-    "grief-stricken",
-    "vanilla",
-    "foh",
-    "$227.72",
-    "callers",
-    "mono-",
-    "pads",
-    "$20,000",
-    "verstandig",
-    "opponents",
-    "stage-plays",
-    "jew",
-    "absurdities",
-    "gunbarrel",
-    "actives",
-    "foul-smelling",
-    "half-hearted",
-    "writing",
-    "uncertainty",
-    "boyd",
-    "charlayne",
-    "association's",
-    "sweet-sour",
-    "verbs",
-    "bio-assay",
-    "truth",
-    "gradient",
-    "topography",
-    "dionysian",
-    "rottger",
-    "disclosure",
-    "browbeaten",
-    "boatsmen",
-    "anticipated",
-    "radiation",
-    "modular",
-    "owners",
-    "israel's",
-    "originating",
-    "autoloader",
-    "stumble",
-    "aristocracy",
-    "results",
-    "legato",
-    "suppleness",
-    "bellwethers",
-    "enlighten",
-    "edmonia",
-    "lanterns",
-    "pushin'",
-    "rigger",
-    "salable",
-    "pull",
-    "grass-fed",
-    "kremlin's",
-    "nationalcar",
-    "paperwads",
-    "nectaries",
-    "andy's",
-    "disowned",
-    "girls'",
-    "brenner's",
-    "overestimation",
-    "decidedly",
-    "brains",
-    "rimless",
-    "guy",
-    "apparel",
-    "court-appointed",
-    "coups",
-    "renovo",
-    "ex-prize",
-    "hesitation",
-    "stir",
-    "combed",
-    "crippling",
-    "daniel's",
-    "self-images",
-    "colonialist",
-    "moi",
-    "castigates",
-    "auto",
-    "opinions",
-    "lame",
-    "forellen",
-    "decrement",
-    "congregational",
-    "penny-wise",
-    "alone",
-    "growing",
-    "farouk",
-    "cronies",
-    "transistor",
-    "byzantium",
-    "discorporate",
-    "flu",
-    "dookiyoon",
-    "corks",
-    "fumbled",
-    "meanin'",
-    "u.'s",
-    "gunplay",
-    "aventino",
-    "preventing",
-    "giving",
-    "soma",
-    "barnard's",
-    "convulsed",
-    "ear",
-    "bleats",
-    "brestowe",
-    "frick",
-    "finicky",
-    "driftin",
-    "carbones",
-    "enacting",
-    "improvises",
-    "oxford's",
-    "attention",
-    "scornful",
-    "doug",
-    "weighty",
-    "ensolite",
-    "bitterness",
-    "45.6",
-    "lashed",
-    "donna",
-    "upstate",
-    "creamed",
-    "one-stroke",
-    "taunt",
-    "misquoted",
-    "theaf",
-    "salida",
-    "corpus",
-    "modifiers",
-    "1804",
-    "carven",
-    "master-race",
-    "feud",
-    "discord",
-    "hunts",
-    "mayor's",
-    "hugo's",
-    "panted",
-    "guests",
-    "chantier",
-    "jest",
-    "inconsiderable",
-    "well-ruled",
-    "yawl",
-    "workin'",
-    "ban",
-    "$35",
-    "guesses",
-    "dana",
-    "non-stop",
-    "semi-isolated",
-    "much-copied",
-    "straw-colored",
-    "luster",
-    "rectitude",
-    "narrowed",
-    "blamed",
-    "186",
-    "diffused",
-    "attempts",
-    "meq",
-    "saber",
-    "violet",
-    "canada",
-    "round's",
-    "docketed",
-    "yuse",
-    "snapper",
-    "cowessett",
-    "allies",
-    "back-lighted",
-    "unfaithful",
-    "veronica",
-    "vividness",
-    "neutron",
-    "vinnicum",
-    "reactors",
-    "one-gee",
-    "formulating",
-    "9a",
-    "reciprocate",
-    "mid-april",
-    "prouder",
-    "large-scale",
-    "tractarians",
-    "countered",
-    "poem",
-    "matriculate",
-    "coalescence",
-    "reads",
-    "yelling",
-    "nothin'",
-    "richard",
-    "grand-looking",
-    "pip",
-    "surrendered",
-    "super-protein",
-    "chaikoff",
-    "bugeyed",
-    "purling",
-    "reckons",
-    "veridical",
-    "disrobe",
-    "bowes",
-    "crowds",
-    "wrists",
-    "champagne",
-    "breve",
-    "rested",
-    "missile's",
-    "kamens",
-    "formosan",
-    "low-foam",
-    "capellan",
-    "anti-polio",
-    "graven",
-    "hergesheimer",
-    "perception",
-    "burlingham",
-    "tuba",
-    "rankles",
-    "soothsayer",
-    "diversionary",
-    "beat",
-    "defended",
-    "reproaches",
-    "unenvied",
-    "mawkish",
-    "lipowa",
-    "fireplaces",
-    "video",
-    "inept",
-    "null-type",
-    "peeked",
-    "platoons",
-    "oldies",
-    "merry",
-    "flattery",
-    "cunning",
-    "239",
-    "glittered",
-    "took",
-    "harvard",
-    "bombers",
-    "sunken",
-    "nyberg",
-    "shoestring",
-    "dirty",
-    "arlen",
-    "fatally",
-    "pickle",
-    "ada's",
-    "toujours",
-    "palermo",
-    "repulsed",
-    "pro-hearst",
-    "sidearms",
-    "kilometer",
-    "recouped",
-    "guides",
-    "referrals",
-    "set",
-    "tsou",
-    "fitc",
-    "green-scaled",
-    "harelips",
-    "arapacis",
-    "art",
-    "moment",
-    "petroleum",
-    "slant",
-    "zamiatin's",
-    "anagram",
-    "heart",
-    "monk",
-    "wolfishly",
-    "maitland's",
-    "traveller",
-    "montaigne",
-    "visualized",
-    "savonarola",
-    "676",
-    "russe",
-    "collisions",
-    "vitamin",
-    "hotter",
-    "waded",
-    "tasteless",
-    "palaces",
-    "schoolers",
-    "sopping",
-    "tooth-hurty",
-    "faltered",
-    "0.52",
-    "occidental",
-    "intranasal",
-    "ironed",
-    "risk",
-    "positivists",
-    "hay-shakers",
-    "rarified",
-    "cameron",
-    "0.906",
-    "harley's",
-    "dogberry",
-    "gide",
-    "$140",
-    "darwin's",
-    "means",
-    "schemes",
-    "anchovy",
-    "anchor",
-    "marquet",
-    "raiding",
-    "algae",
-    "trinket",
-    "rajah",
-    "conceiving",
-    "capital's",
-    "eye-deceiving",
-    "sibylla",
-    "2.1.6",
-    "hull-first",
-    "wet",
-    "$1,800",
-    "ithaca",
-    "noose",
-    "burned-out",
-    "foothill",
-    "mccafferty",
-    "represents",
-    "rummy",
-    "epicenter",
-    "barium",
-    "ethos",
-    "sheriffs",
-    "wearing",
-    "selectivity",
-    "oak",
-    "expunging",
-    "let",
-    "mercilessly",
-    "misrepresents",
-    "outclass",
-    "figgered",
-    "mitral",
-    "sprinkel",
-    "encircled",
-    "mobsters",
-    "obvious",
-    "madrigaling",
-    "promote",
-    "thrived",
-    "twenty-two",
-    "pairs",
-    "pretest",
-    "sinuses",
-    "comfortably",
-    "matched",
-    "wheat-germ",
-    "globally",
-    "assorted",
-    "treasuries",
-    "capetown",
-    "self-deceptions",
-    "claps",
-    "eventshahleh",
-    "meteors",
-    "bibb",
-    "dissatisfied",
-    "raise",
-    "188",
-    "non-romantic",
-    "father-god",
-    "afar",
-    "thirty-foot",
-    "anions",
-    "custody",
-    "frightened",
-    "interrupted",
-    "crystallization",
-    "exclusions",
-    "shone",
-    "washing",
-    "r-6th",
-    "trickster",
-    "ben-gurion",
-    "vienna",
-    "160,000",
-    "schism",
-    "vanity",
-    "force",
-    "conrad's",
-    "angelo's",
-    "homozygous",
-    "peptide",
-    "fingerings",
-    "dreamlessly",
-    "subsystems",
-    "1,525,000",
-    "tiered",
-    "surreptitiously",
-    "shibboleths",
-    "aging",
-    "vibrionic",
-    "anderlini",
-    "instrumentally",
-    "unconvincing",
-    "recriminations",
-    "trolley",
-    "revenge-seeking",
-    "kremlin",
-    "capturing",
-    "nathan",
-    "weiss",
-    "ferdinando",
-    "half-grown",
-    "poldowski",
-    "industry",
-    "spice-laden",
-    "haranguing",
-    "dealers",
-    "ballooning",
-    "los",
-    "adelia",
-    "waterflows",
-    "electroshocks",
-    "reprisal",
-    "corpse",
-    "tee-wah",
-    "self-sacrificing",
-    "scourge",
-    "estates",
-    "pq",
-    "unbalanced",
-    "adenauer",
-    "middle-eastern",
-    "contemplative",
-    "respite",
-    "buckled",
-    "$1.80",
-    "legged",
-    "debora",
-    "stress",
-    "freshly-ground",
-    "4,427",
-    "graying",
-    "griggs",
-    "awash",
-    "clarify",
-    "bushels",
-    "connective",
-    "resembles",
-    "$6,100,000,000",
-    "rachel's",
-    "besiegers",
-    "reflex",
-    "stream's",
-    "steel's",
-    "plato's",
-    "purposive",
-    "jewels",
-    "malraux",
-    "mack's",
-    "denotes",
-    "ion",
-    "fokine's",
-    "catchers",
-    "fluidity",
-    "sulked",
-    "riot",
-    "trafficked",
-    "selena",
-    "whitely",
-    "difficult",
-    "$4200",
-    "mackerel",
-    "hedison",
-    "medley",
-    "stored-up",
-    "omitting",
-    "abridgment",
-    "breakers",
-    "neared",
-    "freshman",
-    "democracies",
-    "returned",
-    "purgatory",
-    "iq",
-    "beige's",
-    "deafened",
-    "erskine",
-    "unreasoning",
-    "freedoms",
-    "flanagan",
-    "schuman",
-    "matriarch",
-    "anciently",
-    "lipson",
-    "passerby",
-    "gaines'",
-    "anti-freeze",
-    "stubbornly",
-    "bemoans",
-    "disciplining",
-    "floral",
-    "luftwaffe",
-    "gazette",
-    "recorder",
-    "isopleths",
-    "grocery",
-    "172",
-    "elector",
-    "orthicon",
-    "non-soviet",
-    "insidious",
-    "$380",
-    "hell's",
-    "stableman",
-    "snared",
-    "circumscribed",
-    "coroner's",
-    "diligence",
-    "mercifully",
-    "makeshift",
-    "treetops",
-    "rental",
-    "unsmiling",
-    "corsage",
-    "standards",
-    "vaporization",
-    "4%",
-    "antiphonal",
-    "excite",
-    "kind's",
-    "scoffing",
-    "free-holders",
-    "demolition",
-    "accessions",
-    "professional",
-    "dinnertime",
-    "stumpy",
-    "ah",
-    "affected",
-    "strut",
-    "active",
-    "evaluated",
-    "gables",
-    "flagellated",
-    "dancing",
-    "atonement",
-    "keeper",
-    "sermons",
-    "knack",
-    "italo",
-    "schuyler",
-    "unambiguity",
-    "rebels",
-    "midi",
-    "refrigeration",
-    "minuteman",
-    "wouldbe",
-    "vocabulary",
-    "woke",
-    "1707",
-    "usurious",
-    "sliding",
-    "collects",
-    "maxine's",
-    "powell's",
-    "china's",
-    "oftener",
-    "disruptive",
-    "bumbry",
-    "meats",
-    "eddyman",
-    "ndola",
-    "burrowing",
-    "harlan-hickory",
-    "sherlock",
-    "strong",
-    "confer",
-    "choke",
-    "ideology",
-    "laugh",
-    "extern",
-    "pastern",
-    "subsurface",
-    "galantuomo",
-    "y-region",
-    "splotches",
-    "lord's",
-    "right-handed",
-    "raf",
-    "illumination",
-    "walford",
-    "defeat",
-    "$10.00",
-    "masterpiece",
-    "directing",
-    "gentler",
-    "uniformed",
-    "animation",
-    "mores",
-    "nilpotent",
-    "analytic",
-    "peels",
-    "intrudes",
-    "geodetic",
-    "1,083,000",
-    "legislators",
-    "coach",
-    "commending",
-    "specifies",
-    "hamlet",
-    "pitfall",
-    "cowhide",
-    "predominately",
-    "ground-glass",
-    "kick",
-    "hooking",
-    "survivability",
-    "calf",
-    "thick-walled",
-    "butterflies",
-    "incident",
-    "bidders",
-    "oleophobic",
-    "concessionaires",
-    "stone-blind",
-    "hash",
-    "hundred-and-eighty-degree",
-    "perse",
-    "medical",
-    "bathrooms",
-    "unattainable",
-    "scare",
-    "owned",
-    "edwina",
-    "informality",
-    "overeat",
-    "gorham's",
-    "hasps",
-    "significantly",
-    "expectable",
-    "oceanside",
-    "boggs",
-    "haverhill",
-    "freeze-out",
-    "once-in-a-lifetime",
-    "lobl",
-    "favre's",
-    "pin",
-    "olivia",
-    "itching",
-    "relentless",
-    "graceful",
-    "synod",
-    "grigori",
-    "90-degrees-f",
-    "overrode",
-    "korean",
-    "shay",
-    "ok",
-    "lunchtime",
-    "fear",
-    "identities",
-    "convex",
-    "swaying",
-    "polycrystalline",
-    "love",
-    "farms",
-    "shan't",
-    "commemorate",
-    "pavement",
-    "gulps",
-    "confederates",
-    "acclamation",
-    "stoop",
-    "rumors",
-    "torrents",
-    "re-created",
-    "individually",
-    "haystacks",
-    "horseplay",
-    "berry",
-    "puff",
-    "brandt's",
-    "enough",
-    "commingled",
-    "salter",
-    "x-ray-proof",
-    "radio",
-    "billboard",
-    "poetrie",
-    "cream",
-    "discovers",
-    "swivel",
-    "roughly",
-    "aquisition",
-    "harris'",
-    "volley-ball",
-    "shares",
-    "pecos",
-    "opera",
-    "comique",
-    "understated",
-    "correggio",
-    "gradualist",
-    "sky's",
-    "restates",
-    "assert",
-    "unacquainted",
-    "instructed",
-    "doubly",
-    "monogamy",
-    "revolutionibus",
-    "dublin",
-    "gainer",
-    "empower",
-    "faults",
-    "existence",
-    "souvanna",
-    "slacking",
-    "hafiz",
-    "guided",
-    "lovelorn",
-    "civilians",
-    "retinue",
-    "hopkinsian",
-    "uncovered",
-    "engrossed",
-    "atrophy",
-    "textron",
-    "prickly",
-    "dreamboat",
-    "politician",
-    "p.d.i.",
-    "tremor",
-    "industrial",
-    "aside",
-    "fly",
-    "pragmatism",
-    "unidirectional",
-    "frambesia",
-    "redder",
-    "overtime",
-    "mishap",
-    "cherokees",
-    "boarder",
-    "women-trodden",
-    "wedlock",
-    "elucidated",
-    "unavailing",
-    "shells",
-    "whittier",
-    "explorations",
-    "mills",
-    "lowly",
-    "listless",
-    "southland",
-    "banished",
-    "youngster's",
-    "malign",
-    "unto",
-    "0.16",
-    "pond",
-    "inspect",
-    "expresses",
-    "outskirts",
-    "powderpuff",
-    "specialty",
-    "recede",
-    "eye-filling",
-    "pig",
-    "last-round",
-    "predictions",
-    "earthquake",
-    "chest-back-shoulder",
-    "frederic",
-    "teaspoonfuls",
-    "rejoiced",
-    "sonora",
-    "nixon's",
-    "rooster",
-    "illegitimacy",
-    "amphibious",
-    "walnuts",
-    "festivus",
-    "austerely",
-    "mumbo-jumbo",
-    "builds",
-    "spotted",
-    "635",
-    "assyrian",
-    "arthritis",
-    "ditmars",
-    "$80",
-    "iodotyrosines",
-    "shirley",
-    "memphis",
-    "striking",
-    "emit",
-    "emmerich",
-    "pseudophloem",
-    "kee-reist",
-    "indistinguishable",
-    "240",
-    "constables",
-    "mount",
-    "disappointments",
-    "unselfconsciousness",
-    "spectrum",
-    "groaning",
-    "sort",
-    "mama",
-    "shoji",
-    "hoover",
-    "stalin's",
-    "soulful",
-    "untrammeled",
-    "understructure",
-    "carla's",
-    "$.10-a-minute",
-    "amatory",
-    "idolatry",
-    "overcooled",
-    "dimensions",
-    "15.4",
-    "procurer",
-    "throaty",
-    "montana",
-    "clowns",
-    "appropriation",
-    "identification",
-    "$15.5",
-    "asserted",
-    "doxiadis",
-    "schlieren",
-    "ruthlessness",
-    "undeclared",
-    "folklike",
-    "barnet",
-    "delinquency",
-    "mussett",
-    "carpenters",
-    "knit",
-    "dial",
-    "cheerfulness",
-    "robbie",
-    "shutting",
-    "vacuolization",
-    "bottling",
-    "tenuously",
-    "clean-up",
-    "wizard",
-    "tabernacles",
-    "abyssinians",
-    "soft-shell",
-    "medicine",
-    "adjournment",
-    "height-to-diameter",
-    "sinusoids",
-    "1,700",
-    "successor",
-    "gamebird",
-    "disrupt",
-    "hallelujahs",
-    "exhaustive",
-    "teaspoonful",
-    "fly-dotted",
-    "moth-eaten",
-    "surface-declaring",
-    "lining",
-    "ryerson",
-    "mom",
-    "escape's",
-    "half-light",
-    "transpiring",
-    "snapped",
-    "freak",
-    "magnet",
-    "intellectuality",
-    "dissensions",
-    "writers'",
-    "massage",
-    "negotiate",
-    "kafka",
-    "towers",
-    "involved",
-    "sailboats",
-    "gain",
-    "bodin",
-    "attopeu",
-    "disorderly",
-    "firing",
-    "iron-clad",
-    "chase",
-    "sheraton-biltmore",
-    "leaks",
-    "planks",
-    "regime",
-    "emancipated",
-    "folk-music",
-    "cranberries",
-    "bibliographies",
-    "severed",
-    "b.t.u./sq.",
-    "example",
-    "merry-go-round",
-    "choice",
-    "illogical",
-    "kibbutzim",
-    "hurl",
-    "diverging",
-    "pulverizing",
-    "beryllium",
-    "on-to-spokane",
-    "bern",
-    "arnold-foster",
-    "1040a",
-    "handbooks",
-    "net",
-    "fourth-of-july",
-    "thousand-fold",
-    "ontario",
-    "exercised",
-    "sreserve",
-    "lisle",
-    "fateful",
-    "burgeoning",
-    "officials",
-    "divisional",
-    "late",
-    "prechlorination",
-    "untrained",
-    "fosterite",
-    "today'll",
-    "b.c.",
-    "non-jews",
-    "consciously",
-    "stendler",
-    "julian",
-    "fungus",
-    "oversized",
-    "dose",
-    "bothered",
-    "hirelings",
-    "beasts",
-    "gobblers",
-    "emanuele",
-    "mop",
-    "misunderstanding",
-    "adversaries",
-    "buffaloes",
-    "elbowing",
-    "scientifically",
-    "boo",
-    "devastate",
-    "parent-child",
-    "extremity",
-    "pathologist",
-    "rapoport",
-    "h.w.",
-    "faint",
-    "rowley",
-    "heideman",
-    "cornbread",
-    "sacker",
-    "schnooks",
-    "lethality",
-    "ministrations",
-    "submitted",
-    "pope's",
-    "interrogatives",
-    "infidel",
-    "prevails",
-    "refuted",
-    "drovers",
-    "zing",
-    "lloyd's",
-    "tire",
-    "averell",
-    "fancied",
-    "re-incorporated",
-    "bellowing",
-    "glycol",
-    "amazement",
-    "tuberculosis",
-    "science",
-    "chopin's",
-    "thrashed",
-    "retrospect",
-    "antibiotics",
-    "sub",
-    "firmly",
-    "post-civil",
-    "liniments",
-    "irreverent",
-    "ease",
-    "saratoga",
-    "unsteadily",
-    "emanuel",
-    "hand",
-    "classics",
-    "first-families",
-    "muskoka",
-    "fire-fighting",
-    "fruitless",
-    "semi-major",
-    "micelles",
-    "sufferers",
-    "congestion",
-    "apartheid",
-    "tantrums",
-    "twenty-first-century",
-    "owns",
-    "fiedler's",
-    "marbleizing",
-    "pound-foolish",
-    "decoration",
-    "rakestraw",
-    "conflict's",
-    "acth",
-    "landscaping",
-    "done",
-    "ticks",
-    "plasti-bars",
-    "4-year",
-    "spread",
-    "cheery",
-    "inspecting",
-    "wales'",
-    "gray",
-    "1951",
-    "mccullers",
-    "efficient",
-    "movies",
-    "sifting",
-    "sites",
-    "plaintive",
-    "bouffant",
-    "morton's",
-    "knowledgeable",
-    "receptive",
-    "fore",
-    "populations",
-    "strays",
-    "fiance",
-    "hillel",
-    "urbanized",
-    "butterfly",
-    "dislikes",
-    "garth",
-    "eliminating",
-    "three-body",
-    "3.5",
-    "coe",
-    "burkes'",
-    "panel's",
-    "rheumatic",
-    "properly",
-    "explodes",
-    "gm",
-    "forfeited",
-    "england-born",
-    "nephew",
-    "ceaselessly",
-    "simmer",
-    "science-fiction",
-    "refurbishing",
-    "perle",
-    "undeveloped",
-    "$840,000",
-    "nation",
-    "cracks",
-    "resume",
-    "tradition-minded",
-    "dappertutto",
-    "lippincott",
-    "photosensitive",
-    "occurring",
-    "stirrings",
-    "anti-intellectual",
-    "red-blooded",
-    "romantic",
-    "baltic",
-    "arrack",
-    "directory",
-    "savagely",
-    "immeasurable",
-    "halma",
-    "critique",
-    "truthful",
-    "internationalized",
-    "starvation",
-    "idling",
-    "imprecates",
-    "chieftain",
-    "imply",
-    "afford",
-    "hitless",
-    "sensitivity",
-    "linville",
-    "mendacious",
-    "softwood",
-    "harford",
-    "easements",
-    "tregnums",
-    "lieutenant's",
-    "bars",
-    "weybosset",
-    "summerdale",
-    "asking",
-    "pickins",
-    "astonishingly",
-    "legatee",
-    "vocationally",
-    "beef-hungry",
-    "benediction",
-    "eph",
-    "cursing",
-    "entertainments",
-    "scriptural",
-    "enjoy",
-    "squandered",
-    "advisor",
-    "fanatics",
-    "built",
-    "pennies",
-    "superstructure",
-    "motivates",
-    "hangar",
-    "maintained",
-    "throttle",
-    "oui",
-    "resolute",
-    "lavish",
-    "antinomians",
-    "iosola",
-    "theatregoer",
-    "comeback",
-    "huh-uh",
-    "branched",
-    "bad",
-    "covington",
-    "italian",
-    "abroade",
-    "brandon",
-    "radioed",
-    "justices",
-    "life-death",
-    "conveys",
-    "dynamite",
-    "oughta",
-    "mcalester",
-    "zebra",
-    "gatlinburg",
-    "suvorov",
-    "flat-topped",
-    "r.'s",
-    "threatens",
-    "prejudices",
-    "defect",
-    "disrupts",
-    "care",
-    "wide-ranging",
-    "fascists",
-    "underlining",
-    "licensed",
-    "self-perceived",
-    "sounder",
-    "messiah",
-    "lucas",
-    "morton",
-    "launched",
-    "reversing",
-    "pecks",
-    "spaceship",
-    "tuttle",
-    "$10,000-per-year",
-    "deceived",
-    "chaplin",
-    "belts",
-    "speck",
-    "twinges",
-    "pasadena",
-    "wolves",
-    "best-gaited",
-    "happy",
-    "mcdaniel",
-    "maternal",
-    "nine-chambered",
-    "vernon",
-    "whiteley",
-    "punching",
-    "breezes",
-    "unilateral",
-    "becoming",
-    "slang",
-    "forensic",
-    "megakaryocytic",
-    "$148.50",
-    "fundamentals",
-    "burnes",
-    "sailors",
-    "coloration",
-    "oratorio",
-    "marry",
-    "warty",
-    "ulcerated",
-    "25%",
-    "ashamed",
-    "korneyeva",
-    "lawsuit",
-    "1914",
-    "summer",
-    "iberia",
-    "eyeful",
-    "yourself",
-    "infra",
-    "purtiest",
-    "earth-weeks",
-    "away",
-    "stove",
-    "resorts",
-    "stimulated",
-    "side-effects",
-    "adios",
-    "thermodynamically",
-    "hast",
-    "guttural",
-    "gettysburg",
-    "wording",
-    "krupa",
-    "constructively",
-    "servatius",
-    "mains",
-    "standardized",
-    "bevy",
-    "eighty-fifth",
-    "tsarism",
-    "exported",
-    "amusement",
-    "covenants",
-    "will",
-    "thrumming",
-    "beauchamps",
-    "high-level",
-    "fatalities",
-    "gruonded",
-    "explode",
-    "trans-lingually",
-    "strutting",
-    "magnetisms",
-    "piazza",
-    "perplexity",
-    "alias",
-    "non-absorbent",
-    "drummed",
-    "phony",
-    "vienot",
-    "fork-lift",
-    "1890's",
-    "2:30.3-:36.1",
-    "beget",
-    "six-ton",
-    "conscripted",
-    "predictive",
-    "loveways",
-    "unmarried",
-    "constituencies",
-    "ambassador",
-    "filing",
-    "dimensional",
-    "radar",
-    "sniper",
-    "insides",
-    "stevens",
-    "recoil",
-    "heritage",
-    "staring",
-    "chaotic",
-    "ashley",
-    "luisa",
-    "ascend",
-    "mating",
-    "torquato",
-    "alcinous'",
-    "boxed",
-    "unprotected",
-    "textured",
-    "ox",
-    "layering",
-    "clarinet",
-    "elicited",
-    "lobular",
-    "supplicating",
-    "galilee",
-    "jews'",
-    "alignments",
-    "soldier",
-    "validated",
-    "deputized",
-    "alluded",
-    "scuttling",
-    "recaptured",
-    "44,000",
-    "statement",
-    "predomination",
-    "roughened",
-    "steeves",
-    "murtaugh",
-    "simonson's",
-    "turns",
-    "hereinafter",
-    "re-election",
-    "mother-naked",
-    "seasons",
-    "monastic",
-    "hino",
-    "logan",
-    "dorcas",
-    "agitators",
-    "occupation's",
-    "sang-froid",
-    "desperadoes",
-    "lectures",
-    "legislator",
-    "booklets",
-    "red's",
-    "investigates",
-    "downward",
-    "unsinkable",
-    "itemizing",
-    "slights",
-    "curing",
-    "whittaker",
-    "freely",
-    "vopos",
-    "dooley",
-    "refractory",
-    "deducing",
-    "braves'",
-    "sandpaper",
-    "katherine's",
-    "swatches",
-    "acacia",
-    "beautifully-tapered",
-    "inter-american",
-    "effete",
-    "someone's",
-    "desolation",
-    "046",
-    "bookshelf",
-    "succor",
-    "glottochronology",
-    "schlek",
-    "publically",
-    "1958-60",
-    "piecewise",
-    "boil",
-    "second-echelon",
-    "boomed",
-    "dinh",
-    "un-english",
-    "contemplation",
-    "phelan",
-    "deerskins",
-    "semiquantitative",
-    "citizenship",
-    "appallingly",
-    "editorials",
-    "recite",
-    "instillation",
-    "sulamite",
-    "conjunctions",
-    "departmental",
-    "irrespective",
-    "richey",
-    "flicking",
-    "cur",
-    "livermore",
-    "hap",
-    "grey",
-    "pip's",
-    "suavity",
-    "jurisdiction",
-    "default",
-    "shuz",
-    "jollying",
-    "2-week",
-    "colombian",
-    "app.",
-    "arabs'",
-    "franklin's",
-    "vendors",
-    "orthography",
-    "deter",
-    "swallows",
-    "butchered",
-    "2-4",
-    "overlooking",
-    "automaton",
-    "specters",
-    "pari-mutuel",
-    "hypocellularity",
-    "snivelings",
-    "heavy-electrical-goods",
-    "more-than-average",
-    "mali",
-    "cut",
-    "taksim",
-    "tsunami",
-    "mixers",
-    "chum",
-    "deae",
-    "outlet",
-    "polemical",
-    "metaphosphate",
-    "bird-brain",
-    "donner",
-    "stanbury",
-    "2048",
-    "milledgeville",
-    "judgements",
-    "harshness",
-    "arboreal",
-    "nanook",
-    "quarrelsome",
-    "limited",
-    "tenacity",
-    "presupposition",
-    "boathouses",
-    "blackening",
-    "withal",
-    "absence",
-    "behold",
-    "maniacs",
-    "summertime",
-    "voluntary",
-    "overshot",
-    "moldboard",
-    "dimaggio",
-    "shook",
-    "idealist",
-    "counties",
-    "moral",
-    "resistors",
-    "bower",
-    "1957b",
-    "memorization",
-    "dough",
-    "inactivate",
-    "usn.",
-    "erysipelas",
-    "congregational-baptist",
-    "skyjacked",
-    "briefcase",
-    "godfrey",
-    "theology's",
-    "dispensation",
-    "4,000-foot",
-    "efficaciously",
-    "1162",
-    "convey",
-    "sforzt",
-    "delicately",
-    "aspiration",
-    "unmagnified",
-    "epistemology",
-    "reactions",
-    "advent",
-    "karshilama",
-    "0.8",
-    "magdalene",
-    "1788-1873",
-    "craved",
-    "shop's",
-    "enthusiastically",
-    "form-creating",
-    "aces",
-    "telegraphic",
-    "sept",
-    "offences",
-    "announcer",
-    "redoute",
-    "sterno-cleido",
-    "koreans",
-    "isolated",
-    "rendezvous",
-    "afield",
-    "darwen",
-    "chamfer",
-    "jerked",
-    "mediocrity",
-    "volens",
-    "menarche",
-    "prefixes",
-    "economical",
-    "incentive",
-    "blind",
-    "incited",
-    "spectacles",
-    "diem",
-    "curious",
-    "passions",
-    "240-grain",
-    "activate",
-    "reacts",
-    "divans",
-    "sinton",
-    "estep",
-    "leopoldville",
-    "finer",
-    "gabler",
-    "inconspicuous",
-    "parsifal",
-    "complection",
-    "excel",
-    "remarking",
-    "stirred",
-    "talking",
-    "pedersen",
-    "bloodiest",
-    "alexander's",
-    "neatest",
-    "re-birth",
-    "278",
-    "elan",
-    "w.",
-    "reconciliation",
-    "dualities",
-    "absenteeism",
-    "tainted",
-    "surveillance",
-    "meandered",
-    "tick",
-    "moderating",
-    "extrapolation",
-    "shansi",
-    "while",
-    "plausible",
-    "quarrel",
-    "claire",
-    "defy",
-    "books",
-    "slanting",
-    "dolphin",
-    "despoilers",
-    "degraded",
-    "polychemicals",
-    "revolution's",
-    "fleeting",
-    "macbeth",
-    "louisiana",
-    "subscribe",
-    "internist's",
-    "brisk",
-    "oil",
-    "lescaut",
-    "gasset",
-    "monthly",
-    "snowy",
-    "indolently",
-    "increasing",
-    "partook",
-    "sulamith",
-    "damas",
-    "carmen",
-    "ab1,040",
-    "laos",
-    "peppered",
-    "restful",
-    "cautiously",
-    "flora",
-    "pilate",
-    "breeds",
-    "trades",
-    "less-than-carload",
-    "via's",
-    "baseball's",
-    "spreading",
-    "billiard",
-    "paging",
-    "bonenfant",
-    "endless",
-    "tape",
-    "sponge",
-    "muzzle",
-    "presidency",
-    "diluents",
-    "borough",
-    "congo",
-    "erotic",
-    "repels",
-    "insurgents",
-    "nipples",
-    "'cept",
-    "inclusive",
-    "orbiting",
-    "supplements",
-    "a-crowing",
-    "sagging",
-    "dionie",
-    "operations",
-    "tabernacle",
-    "family-community",
-    "anaconda",
-    "$65",
-    "liberals",
-    "pictorial",
-    "simplified",
-    "pathless",
-    "1970",
-    "pooled",
-    "umbrellas",
-    "tindal",
-    "tempest",
-    "nineteen",
-    "13.5",
-    "area-wide",
-    "skirted",
-    "divan-like",
-    "reserved",
-    "northerly",
-    "erupted",
-    "holder",
-    "64",
-    "ruthless",
-    "toffenetti's",
-    "ruins",
-    "follow-through",
-    "fancy-free",
-    "ahm",
-    "decisions",
-    "single-color",
-    "uphill",
-    "therapist's",
-    "flavors",
-    "slender",
-    "bulwark",
-    "manassas",
-    "broglio",
-    "consular",
-    "crass",
-    "notched",
-    "enormous",
-    "perpetuating",
-    "ensemble",
-    "dwell",
-    "machinists'",
-    "wally's",
-    "cleft",
-    "agent",
-    "eugenic",
-    "frances",
-    "tunefulness",
-    "unions",
-    "research-staff",
-    "myself",
-    "choicest",
-    "scrapings",
-    "ledyard",
-    "five-minute",
-    "olive-green",
-    "infirm",
-    "lasting",
-    "globocnik",
-    "eq.",
-    "russians",
-    "aquidneck",
-    "moment's",
-    "leaches",
-    "ekstrohm's",
-    "disrepair",
-    "second-order",
-    "toward",
-    "14.7",
-    "out-moded",
-    "puckered",
-    "nev.",
-    "luncheons",
-    "grade-equivalents",
-    "frills",
-    "designed",
-    "beaujolais",
-    "whichever",
-    "eden",
-    "how's",
-    "dachshund",
-    "thet's",
-    "kemble's",
-    "drawback",
-    "rep.",
-    "romeo's",
-    "levity",
-    "enchained",
-    "worried",
-    "stock",
-    "unpartisan",
-    "128",
-    "after-duty",
-    "2433",
-    "basics",
-    "aventine",
-    "campaign's",
-    "pennock",
-    "hyalinization",
-    "shifty",
-    "summing",
-    "eye-strain",
-    "bewilders",
-    "speedometer",
-    "forgiveness",
-    "arrogantly",
-    "einsteinian",
-    "proctors",
-    "grievances",
-    "associatively",
-    "decorated",
-    "saabye",
-    "parent-teacher",
-    "scouting",
-    "lustily",
-    "crowded",
-    "porridge",
-    "animal's",
-    "overstepping",
-    "buffet",
-    "roughshod",
-    "insensitive",
-    "placid",
-    "exacting",
-    "indecipherable",
-    "tulle",
-    "turbofan",
-    "birnbaum",
-    "size",
-    "602.2",
-    "eye-undeceiving",
-    "comprehending",
-    "impacted",
-    "inscriptions",
-    "perimeter",
-    "modernistic",
-    "drunkards",
-    "nothin",
-    "canvas",
-    "inefficiency",
-    "slope",
-    "passive",
-    "lowdown",
-    "compiled",
-    "gorham",
-    "transluscent",
-    "staffe",
-    "enos",
-    "obsolete",
-    "lublin",
-    "80",
-    "counseling",
-    "quebec's",
-    "steamship",
-    "back-yard",
-    "chivalrous",
-    "scarsdale",
-    "kay",
-    "appreciates",
-    "haste",
-    "vicky",
-    "bushwhackin'",
-    "3/4",
-    "puts",
-    "smoothbore",
-    "slashes",
-    "truer",
-    "navigation",
-    "educating",
-    "arrow",
-    "neuroses",
-    "multiplicity",
-    "teammates",
-    "p.l.",
-    "cliffs",
-    "bonfires",
-    "rectangular",
-    "jealousies",
-    "inner",
-    "wrestles",
-    "moire",
-    "marsha",
-    "ghosted",
-    "miserable",
-    "locale",
-    "worldly",
-    "cradle",
-    "gogo",
-    "defensive",
-    "solicit",
-    "beans",
-    "creditable",
-    "harlingen",
-    "progress",
-    "polygynous",
-    "landing",
-    "carmichael",
-    "remphan",
-    "souths",
-    "inappropriateness",
-    "blish's",
-    "illumines",
-    "bubenik",
-    "czerny",
-    "pakistanis",
-    "remorseful",
-    "cutlass",
-    "roundly",
-    "recalls",
-    "roofing",
-    "slothful",
-    "incubi",
-    "duchess",
-    "nomia",
-    "oas",
-    "schooner",
-    "reigns",
-    "grevile",
-    "johnnie's",
-    "exultantly",
-    "eskimos",
-    "alertly",
-    "jannequin",
-    "joie",
-    "isocyanate",
-    "reconciled",
-    "1,286",
-    "cremate",
-    "shelter",
-    "microsomal",
-    "committee's",
-    "kel",
-    "butternut",
-    "family-oriented",
-    "morgan's",
-    "lila",
-    "waterskiing",
-    "ambuscade",
-    "heliocentric",
-    "morphologic",
-    "multistage",
-    "basing",
-    ":35.3",
-    "expressiveness",
-    "tubular",
-    "abrasion-resistant",
-    "resettling",
-    "barco's",
-    "dannehower",
-    "arhat",
-    "dramatization",
-    "communicator's",
-    "therefor",
-    "prancing",
-    "rubric",
-    "prevalence",
-    "marmon",
-    "sprouted",
-    "village",
-    "printable",
-    "camilla",
-    "compromise",
-    "bernini's",
-    "chest",
-    "2118",
-    "cyr",
-    "languished",
-    "thigh",
-    "1.2",
-    "isabel",
-    "farnum",
-    "blasphemy",
-    "marston",
-    "vegas",
-    "roots",
-    "artificial",
-    "all-inclusive",
-    "determinations",
-    "evacuated",
-    "untellable",
-    "unjust",
-    "westchester",
-    "clams",
-    "grenier",
-    "adviser",
-    "travels",
-    "calls",
-    "idiotic",
-    "$3,825",
-    "uremia",
-    "dimension",
-    "n/g",
-    "purchasing",
-    "winds",
-    "chalk",
-    "dismay",
-    "targo",
-    "quipping",
-    "heidegger",
-    "exploiters",
-    "seeley",
-    "employments",
-    "belle",
-    "psychoanalysis",
-    "quagmire",
-    "ever-growing",
-    "contrite",
-    "10-day",
-    "undershirt",
-    "baldrige",
-    "spite",
-    "torino",
-    "helena",
-    "austerity",
-    "releases",
-    "hi-fi",
-    "wacklin",
-    "pvt",
-    "evelyn",
-    "w-region",
-    "interstate",
-    "scottish",
-    "calm",
-    "raine",
-    "fitzroy",
-    "gentleness",
-    "clocking",
-    "petrified",
-    "shams",
-    "1592",
-    "carnegey",
-    "vigilantism",
-    "phonies",
-    "macrophages",
-    "sandwiches",
-    "unmeshed",
-    "sheets",
-    "curls",
-    "horse's",
-    "nuclide",
-    "patients",
-    "invite",
-    "carcinoma",
-    "outmaneuvered",
-    "cosmic",
-    "postal",
-    "central-city",
-    "actual",
-    "courtesy",
-    "endorsement",
-    "usp",
-    "flite-king",
-    "unpleased",
-    "steadily",
-    "verner",
-    "nineveh",
-    "alicia",
-    "subsided",
-    "corpuscular",
-    "banks",
-    "kerr",
-    "antiquities",
-    "disimone",
-    "campobello",
-    "ceramic",
-    "(",
-    "ching",
-    "saved",
-    "degrade",
-    "bass",
-    "bi-monthly",
-    "rationally",
-    "soloists'",
-    "agonale",
-    "emergency",
-    "yielding",
-    "undistinguished",
-    "reassurance",
-    "extricate",
-    "bellini",
-    "cackly",
-    "scours",
-    "schmalma",
-    "conjugation",
-    "preparation",
-    "launchings",
-    "sunburnt",
-    "materialistic",
-    "keg",
-    "laboriously",
-    "throng",
-    "shibboleth",
-    "guitar",
-    "sixty-one",
-    "gassed",
-    "saw",
-    "loudspeaker",
-    "transposition",
-    "brings",
-    "1867",
-    "centers",
-    "autonomic",
-    "grit",
-    "iridium",
-    "twitch",
-    "slash",
-    "bullyboys",
-    "landmarks",
-    "quit",
-    "sanctioned",
-    "legitimately",
-    "brokers",
-    "drone",
-    "commercials",
-    "banned",
-    "playboy",
-    "superstitious",
-    "tiber",
-    "supervisory",
-    "mahzeer",
-    "pasterns",
-    "15-degree",
-    "agonized",
-    "rib",
-    "softer",
-    "chambermaid",
-    "drdw",
-    "climaxes",
-    "nigs",
-    "fluffy",
-    "pinkly",
-    "billikens",
-    "phillips",
-    "procrastination",
-    "incanted",
-    "$1,200",
-    "traditions",
-    "for",
-    "mame",
-    "sibling",
-    "monmouth's",
-    "alphabetical",
-    "charlottesville",
-    "blazing",
-    "2:28-:36",
-    "typify",
-    "bads",
-    "whaddya",
-    "ffa",
-    "simplify",
-    "blackwells",
-    "disking",
-    "106",
-    "travelling",
-    "edged",
-    "1.25",
-    "letter",
-    "siciliana",
-    "buoyed",
-    "counters",
-    "janet",
-    "deppy",
-    "nuclear",
-    "arisen",
-    "jurisdictional",
-    "meyer",
-    "reily's",
-    "petition",
-    "parrot",
-    "overseas",
-    "fenway",
-    "budgetary",
-    "reduced",
-    "sullam",
-    "enforces",
-    "pilot's",
-    "satisfies",
-    "writers",
-    "sordid",
-    "unconnected",
-    "arrivals",
-    "clench",
-    "cornucopia",
-    "nonsense",
-    "closets",
-    "counting",
-    "superposition",
-    "bonn's",
-    "influenced",
-    "spear-throwing",
-    "2051",
-    "deviations",
-    "catatonia",
-    "delicious",
-    "intentional",
-    "scenery",
-    "redeeming",
-    "marocaine",
-    "explains",
-    "calumny",
-    "credited",
-    "vending",
-    "bureaus",
-    "galls",
-    "2:05.3",
-    "overrun",
-    "absentee",
-    "susie's",
-    "passes",
-    "fellow-men",
-    "32*0c.",
-    "1961",
-    "brood",
-    "partaker",
-    "class-d",
-    "whiff",
-    "slice",
-    "recreational",
-    "billets",
-    "weaknesses",
-    "doria",
-    "spans",
-    "coach's",
-    "apergillus",
-    "sideboard",
-    "cady",
-    "libertie",
-    "greenock",
-    "near-mutiny",
-    "taft",
-    "perplexing",
-    "imprint",
-    "lightly",
-    "orthodontists",
-    "callable",
-    "secco",
-    "thuds",
-    "his",
-    "electronography",
-    "retracing",
-    "haughtiness",
-    "frosty",
-    "wilhelmina",
-    "editor",
-    "tacking",
-    "scooped",
-    "unimposing",
-    "suggs",
-    "1598/9",
-    "technically",
-    "perturbation",
-    "euphemism",
-    "mountainously",
-    "uncombable",
-    "renamed",
-    "participants",
-    "nineteenth-century",
-    "idolized",
-    "duplicated",
-    "troopship",
-    "poplin",
-    "cleaner",
-    "dark-green",
-    "strikingly",
-    "sighing",
-    "snubbed",
-    "alkali",
-    "eye-gouging",
-    "swivels",
-    "lyriist",
-    "litz",
-    "styles",
-    "roadways",
-    "staircases",
-    "adsorbs",
-    "scrawled",
-    "raphael",
-    "sitting",
-    "diagonally",
-    "grail",
-    "sangallo",
-    "lobule",
-    "acadia",
-    "dissident",
-    "ceremonial",
-    "easing",
-    "strukturbericht",
-    "black-clad",
-    "affects",
-    "odor",
-    "dispensers",
-    "redoubled",
-    "afl-cio",
-    "orestes",
-    "stooped",
-    "tetrahalides",
-    "4-0",
-    "rosy",
-    "basically",
-    "pleura",
-    "chugging",
-    "flies",
-    "phrasings",
-    "london's",
-    "sarcasm",
-    "marvin",
-    "plastics",
-    "stewards",
-    "run-down",
-    "guerrillas",
-    "kizzie",
-    "laughing",
-    "thoroughly",
-    "mastering",
-    "blade",
-    "gluttons",
-    "ilona",
-    "stallion's",
-    "wedged",
-    "forwarded",
-    "adjectival",
-    "non-conformists",
-    "incorporating",
-    "winthrop",
-    "openings",
-    "paleo-",
-    "acre-feet",
-    "abandoning",
-    "lisbon",
-    "wry",
-    "rameau's",
-    "unofficially",
-    "hostler",
-    "accomplishment",
-    "natchez",
-    "slimly",
-    "chain",
-    "blockading",
-    "oil-bearing",
-    "detractor",
-    "reflectance",
-    "waterline",
-    "british-american",
-    "hair-trigger",
-    "half-straightened",
-    "swedish",
-    "circumspectly",
-    "cholinesterase",
-    "billing",
-    "fahrenheit",
-    "herpetology",
-    "vern",
-    "pseudo-willing",
-    "peers",
-    "pout",
-    "perforations",
-    "specialized",
-    "year-'round",
-    "southward",
-    "rio",
-    "door-to-door",
-    "intensify",
-    "conformed",
-    "armbro",
-    "lurching",
-    "veils",
-    "nested",
-    "coagulating",
-    "studiously",
-    "underlined",
-    "sack",
-    "pianist",
-    "buoyant",
-    "poodle",
-    "neural",
-    "longitude",
-    "mixed",
-    "euclid's",
-    "czar",
-    "composes",
-    "even",
-    "jonesborough",
-    "musicianship",
-    "enters",
-    "permeates",
-    "wornout",
-    "waist",
-    "time-mynah",
-    "conclusively",
-    "jaw",
-    "sea-road",
-    "self-aggrandizement",
-    "theme",
-    "concretistic-seeming",
-    "occurrence",
-    "girl",
-    "eddies",
-    "'76",
-    "composition",
-    "insomma",
-    "affairs",
-    "carnegie",
-    "non-college",
-    "fully",
-    "dips",
-    "outlived",
-    "rum-tum-tum",
-    "maladaptive",
-    "pigmented",
-    "flatter",
-    "inhibit",
-    "romance",
-    "interest",
-    "enemies",
-    "extraordinary",
-    "pachinko",
-    "songbook",
-    "**yg",
-    "stunned",
-    "pasha",
-    "millennia",
-    "madden",
-    "lovely",
-    "fascinates",
-    "receive",
-    "macarthur",
-    "applause",
-    "bloc",
-    "allons",
-    "vegetable",
-    "historian's",
-    "touched",
-    "tinkers",
-    "grassed",
-    "91",
-    "gyro-stabilized",
-    "thrills",
-    "martyrs",
-    "teeming",
-    "reformer",
-    "transcendentalism",
-    "rods",
-    "enzyme",
-    "phipps",
-    "archery",
-    "flumenophobe",
-    "coldest",
-    "money-saving",
-    "parliamentary",
-    "everybody",
-    "cricket",
-    "50-year-old",
-    "simms",
-    "batchelder",
-    "eugene",
-    "veers",
-    "christianizing",
-    "hexen",
-    "unsharpened",
-    "unshed",
-    "horrifying",
-    "roller",
-    "probable",
-    "situated",
-    "joan",
-    "fromm",
-    "dizziness",
-    "seekers",
-    "pectorals",
-    "btu's",
-    "newbiggin",
-    "labans",
-    "cement-and-glass",
-    "polymerization",
-    "pathogenic",
-    "ruggiero",
-    "irenaeus'",
-    "vintage",
-    "slatted",
-    "frondel",
-    "afranio",
-    "tri-state",
-    "consoles",
-    "industrious",
-    "archaeology",
-    "dejeuner",
-    "secretary",
-    "bulldoze",
-    "self-imposed",
-    "afro-cuban",
-    "1.0-mg.",
-    "rejoinder",
-    "copies",
-    "fleet's",
-    "subtypes",
-    "necessitates",
-    "question",
-    "lying",
-    "krist",
-    "acrobatic",
-    "cohesively",
-    "never",
-    "patrolman's",
-    "protests",
-    "voting",
-    "plucked",
-    "30,000,000",
-    "source",
-    "intactible",
-    "ade",
-    "vital",
-    "postponement",
-    "naturopath",
-    "dissociated",
-    "repressions",
-    "do",
-    "quok",
-    "cardinals",
-    "rhine-main",
-    "underhandedness",
-    "tablespoon",
-    "chateau",
-    "non-polygynous",
-    "antic",
-    "giggle",
-    "designers",
-    "patronne's",
-    "giggling",
-    "hamiltonians",
-    "cowboy",
-    "avert",
-    "pickers",
-    "oregon",
-    "expectation",
-    "analyze",
-    "lower-middle",
-    "tatras",
-    "minnett",
-    "1:59.3",
-    "paneling",
-    "disarmament",
-    "shakes",
-    "ecuador",
-    "acs",
-    "a-1",
-    "constable's",
-    "sudier",
-    "clobbered",
-    "underlying",
-    "post-bellum",
-    "revivified",
-    "torches",
-    "warren's",
-    "binomial",
-    "trimester",
-    "geocentric",
-    "fillings",
-    "cease",
-    "half-digested",
-    "smashed",
-    "invariant",
-    "thickness",
-    "spencer",
-    "$67,000",
-    "clenches",
-    "fishpond",
-    "fontainebleau",
-    "wyman",
-    "dislocated",
-    "cross-fertilized",
-    "velociter",
-    "conference's",
-    "wayside",
-    "furnished",
-    "workable",
-    "raided",
-    "kid's",
-    "benjamin",
-    "perturbations",
-    "comer",
-    "dromozootic",
-    "skipping",
-    "33-man",
-    "tortoise",
-    "whisper",
-    "drinker",
-    "capture",
-    "pseudo-emotion",
-    "dummies",
-    "xylem",
-    "vectrol's",
-    "polaroid",
-    "unfairly",
-    "within",
-    "despondency",
-    "amateurishness",
-    "leaflets",
-    "described",
-    "mach't",
-    "brakes",
-    "bobbles",
-    "exoneration",
-    "rubbery",
-    "enlargd",
-    "macro-instructions",
-    "resentment",
-    "severing",
-    "information",
-    "rabb",
-    "indictment",
-    "hendricks'",
-    "notorious",
-    "emile",
-    "chung",
-    "life",
-    "rearguard",
-    "delia",
-    "mouthpiece",
-    "public-limit",
-    "salomonovich",
-    "stealth",
-    "pines",
-    "glayre",
-    "elite",
-    "burly",
-    "ship",
-    "schoolmarm",
-    "group's",
-    "allowances",
-    "pithy",
-    "murrow",
-    "electors",
-    "caring",
-    "10th",
-    "cornering",
-    "emanating",
-    "facade",
-    "herzog",
-    "ferlenghetti",
-    "noyon-la-sainte",
-    "samovar",
-    "$2,170",
-    "gran",
-    "grigorss",
-    "patent",
-    "glutamic",
-    "replaced",
-    "cam",
-    "theologian",
-    "20-megaton",
-    "stomachs",
-    "sprouting",
-    "vociferously",
-    "rumpus",
-    "yolk",
-    "bryson",
-    "fever",
-    "milk",
-    "thousand",
-    "miscalculated",
-    "riviera",
-    "calude",
-    "latest",
-    "fromm's",
-    "loosening",
-    "sealing",
-    "crackling",
-    "neighbor",
-    "gauntley",
-    "flanking",
-    "industries",
-    "munich",
-    "tied",
-    "162",
-    "olga",
-    "croupier",
-    "leeds",
-    "conversions",
-    "adjustment",
-    "assent",
-    "pleasure-boat",
-    "pseudo-patriotism",
-    "channels",
-    "entreat",
-    "particles",
-    "214",
-    "surcliffes'",
-    "cuirassiers",
-    "sponsored",
-    "percussion",
-    "f.r.",
-    "horace",
-    "magog",
-    "unsprayed",
-    "11.6",
-    "torpor",
-    "reservation",
-    "trafton",
-    "formulation",
-    "bending",
-    "shunning",
-    "prying",
-    "doberman",
-    "reuther",
-    "side-stepped",
-    "pierced",
-    "bulbs",
-    "wasting",
-    "francesca's",
-    "idleness",
-    "counterbalance",
-    "pedagogue",
-    "liquid",
-    "angles",
-    "palladian",
-    "winnipeg",
-    "voice's",
-    "winches",
-    "cumulate",
-    "raincoats",
-    "wan",
-    "anti-catholicism",
-    "celestial",
-    "charms",
-    "survivors",
-    "golfer",
-    "kirk",
-    "diagonalizable",
-    "abscesses",
-    "$4",
-    "moluccas",
-    "abnormal",
-    "fatten",
-    "abstractions",
-    "lurch",
-    "violent",
-    "constructions",
-    "indexes",
-    "scotch-irish-scandinavian",
-    "explosive",
-    "unearthed",
-    "variability",
-    "anticipations",
-    "soaring",
-    "1966",
-    "constants",
-    "help",
-    "republicanism",
-    "masu",
-    "learned",
-    "granular",
-    "remarkable",
-    "heinzes",
-    "lunged",
-    "tax-exempt",
-    "6,000",
-    "381(c)(6)",
-    "regius",
-    "gourmets",
-    "degroot",
-    "trumps",
-    "p.-t.a.",
-    "dragons",
-    "screw",
-    "rundown",
-    "delinquent",
-    "haggard",
-    "blue",
-    "intensified",
-    "lascar",
-    "drowned",
-    "culprits",
-    "mightiest",
-    "i'd",
-    "roadside",
-    "half-educated",
-    "neuropathology",
-    "screeches",
-    "tenebrous",
-    "euphoric",
-    "1409",
-    "honeymooning",
-    "women's",
-    "separated",
-    "gangster",
-    "planted",
-    "constitutions",
-    "resists",
-    "seclude",
-    "salinger",
-    "lm",
-    "pursewarden",
-    "menaced",
-    "trans-atlantic",
-    "garages",
-    "korea",
-    "generale",
-    "rhyming",
-    "balls",
-    "tearing",
-    "graduating",
-    "siecle",
-    "cable",
-    "push-pull",
-    "old-timers",
-    "$2.98",
-    "cennino",
-    "soft-shoe",
-    "proportionally",
-    "craving",
-    "delivers",
-    "workmanship",
-    "prophesied",
-    "laughed",
-    "nestled",
-    "you",
-    "puffing",
-    "darlin'",
-    "not-yet-married",
-    "unpaintable",
-    "headboard",
-    "fine-drawn",
-    "fretted",
-    "compressive",
-    "short-of-war",
-    "reps",
-    "santa's",
-    "astronaut",
-    "hardshell",
-    "achieved",
-    "enunciated",
-    "retrace",
-    "outhouse",
-    "smokies",
-    "sex",
-    "hard-surface",
-    "thermostatics",
-    "berkshires",
-    "canute",
-    "5-to-1",
-    "byron",
-    "nihilist",
-    "hobble",
-    "correspondent",
-    "alexandria",
-    "furrows",
-    "promoted",
-    "pedantic",
-    "vaguely-imagined",
-    "reimburse",
-    "mussorgsky's",
-    "planes",
-    "friday's",
-    "unresolved",
-    "somethin'",
-    "anglophilia",
-    "winchester",
-    "dixie",
-    "realtor's",
-    "working-class",
-    "motherhood",
-    "declare",
-    "soft-drink",
-    "r",
-    "boos",
-    "voorhees",
-    "piracy",
-    "biologic",
-    "monetary",
-    "desensitized",
-    "hawing",
-    "fertilized",
-    "methodically",
-    "kittler",
-    "hangers",
-    "wooden-leg",
-    "politicians",
-    "refreshing",
-    "obsessive-compulsive",
-    "fire-colored",
-    "conan",
-    "celebration",
-    "father-murder",
-    "unburdened",
-    "layman's",
-    "remolding",
-    "feint",
-    "$12",
-    "o.k.",
-    "'25",
-    "vaster",
-    "peru",
-    "ultravehement",
-    "swig",
-    "plumber",
-    "propylaea",
-    "1857",
-    "epistolatory",
-    "commando",
-    "stipulation",
-    "regalia",
-    "osram",
-    "unoriginals",
-    "aku",
-    "bearish",
-    "unglazed",
-    "fungicides",
-    "285",
-    "skorich",
-    "bourcier",
-    "gesticulating",
-    "jerk",
-    "inspires",
-    "cocoon",
-    "220-degrees",
-    "pro-europe",
-    "technological",
-    "awhile",
-    "khrush",
-    "bargen",
-    "elastic",
-    "recording",
-    "'fore",
-    "newbiggin's",
-    "die-dead",
-    "1,450,000",
-    "clear-cut",
-    "bartlett",
-    "gaafer",
-    "a.a.u.",
-    "destroyer",
-    "diman's",
-    "$4,500",
-    "overeager",
-    "unidentified",
-    "doorman",
-    "ingo",
-    "realtor",
-    "companionable",
-    "tablets",
-    "brooks",
-    "spahn",
-    "destruction",
-    "reasonably",
-    "scabbard",
-    "trompe-l'oeil",
-    "how",
-    "imputation",
-    "joining",
-    "boeotian",
-    "swell",
-    "sanctity",
-    "say-speak",
-    "correlate",
-    "freight's",
-    "varner",
-    "payson",
-    "transylvania",
-    "suffixes",
-    "maxim",
-    "justify",
-    "cautious",
-    "plowed",
-    "exhorting",
-    "schoolwork",
-    "cripple",
-    "antics",
-    "pragmatic",
-    "leary",
-    "rummaged",
-    "shreveport",
-    "palmer's",
-    "baird",
-    "mongolia",
-    "dorothy",
-    "clinics",
-    "paratroops",
-    "wall-flowers",
-    "a-z",
-    "credulousness",
-    "checkin'",
-    "seminole",
-    "induced",
-    "unperformed",
-    "guards",
-    "pussy",
-    "misfortunes",
-    "restrains",
-    "cages",
-    "forearm",
-    "quetzal",
-    "howl",
-    "wallow",
-    "pigments",
-    "creamery",
-    "$2",
-    "tetanus",
-    "gurla",
-    "ominous",
-    "milord",
-    "ledoux",
-    "1919",
-    "break-even",
-    "oleanders",
-    "napoleonic",
-    "boadicea",
-    "danchin",
-    "accrued",
-    "pretends",
-    "marinade",
-    "rusty",
-    "suburbanite",
-    "arid",
-    "cacophony",
-    "butterwyn",
-    "peculiarity",
-    "rationalistic",
-    "skilled",
-    "mirrors",
-    "pear",
-    "12-year-old",
-    "bawdy",
-    "$200,000,000",
-    "correspond",
-    "utopia",
-    "agriculture's",
-    "hostesses",
-    "freights",
-    "cone",
-    "brigadier",
-    "charmer",
-    "devote",
-    "1803",
-    "sciatica",
-    "l.s.u.",
-    "traitor",
-    "magnified",
-    "d.a.",
-    "glimco's",
-    "leiden",
-    "sigmen",
-    "coed",
-    "tripolyphosphate",
-    "standby",
-    "acknowledgement",
-    "gall",
-    "spinach",
-    "sayers",
-    "restructured",
-    "cropping",
-    "whined",
-    "greene",
-    "arrogant",
-    "1-1/2-inch",
-    "admissions",
-    "transversely",
-    "physique",
-    "anticipate",
-    "lions'",
-    "2-baser",
-    "flyways",
-    "gastrocnemius",
-    "roberts",
-    "matunuck",
-    "edwards",
-    "suppressed",
-    "plastic-covered",
-    "ex-justice",
-    "overgenerous",
-    "spontaneous",
-    "1:35",
-    "guitarist",
-    "unease",
-    "resettlement",
-    "applicator",
-    "levittown",
-    "winced",
-    "beguiled",
-    "tommie",
-    "husbandry",
-    "inning",
-    "malady",
-    "bucking-up",
-    "projecting",
-    "unabridged",
-    "cancel",
-    "duplicable",
-    "supervened",
-    "$2.30/mbf",
-    "figurative",
-    "ecstatic",
-    "ruysch",
-    "newly",
-    "hoosegow",
-    "liquidation",
-    "trickling",
-    "skeptics",
-    "meets",
-    "fox",
-    "distillation",
-    "unaggressive",
-    "authority's",
-    "dimensionally",
-    "contractual",
-    "subic",
-    "estella",
-    "decrees",
-    "1960-61",
-    "classiest",
-    "adjustments",
-    "tumors",
-    "beth",
-    "corneilus",
-    "low-wage",
-    "selectively",
-    "hurry",
-    "desecrated",
-    "workshop",
-    "imaginatively",
-    "newspapermen",
-    "detecting",
-    "carriages",
-    "1957-1958",
-    "hell-fire",
-    "canyonside",
-    "freeway",
-    "37,000",
-    "scanned",
-    "short-time",
-    "uneasy",
-    "breathed",
-    "representation",
-    "tabit",
-    "hubris",
-    "franz",
-    "revisited",
-    "fourth-century",
-    "breathless",
-    "publicity",
-    "polishing",
-    "essence",
-    "glutinous",
-    "midweek",
-    "sublimate",
-    "ringers",
-    "premiums",
-    "sand",
-    "transoms",
-    "rifled",
-    "intuition",
-    "segovia",
-    "animism",
-    "additives",
-    "punitive",
-    "sighted",
-    "crystal",
-    "willie",
-    "275-300",
-    "aristotelean-thomistic",
-    "tacit",
-    "floater",
-    "unjacketed",
-    "wisconsin's",
-    "ptolemaic",
-    "unstrung",
-    "christie",
-    "1596",
-    "four-fold",
-    "concededly",
-    "moistening",
-    "gambits",
-    "stringently",
-    "wohd",
-    "europeanized",
-    "dew",
-    "marshes",
-    "lustre",
-    "cousin's",
-    "prix",
-    "corral",
-    "nominee",
-    "perspired",
-    "notches",
-    "taffeta",
-    "exports",
-    "trigger",
-    "cargo",
-    "levis",
-    "hydroxyl-rich",
-    "work-satisfaction",
-    "simpson",
-    "attorney's",
-    "contretemps",
-    "dreadfully",
-    "8:30",
-    "nubile",
-    "squeamish",
-    "exhibitors",
-    "greater",
-    "preface",
-    "quemoy",
-    "candidly",
-    "filmy",
-    "brunches",
-    "menshikov",
-    "brawle",
-    "2.405",
-    "relaxes",
-    "earphones",
-    "daring",
-    "4-1",
-    "laicos",
-    "hyaline",
-    "boiling",
-    "microcytochemistry",
-    "muscles",
-    "kercheval",
-    "circulatory",
-    "herself",
-    "shuts",
-    "gre't",
-    "strict",
-    "characters",
-    "unreservedly",
-    "symmetrically",
-    "propulsion",
-    "radicalism",
-    "coriolanus",
-    "untrue",
-    "sequenced",
-    "rep'tation",
-    "arm-rise",
-    "letting",
-    "3247",
-    "khrushchev's",
-    "sequoia",
-    "bumper",
-    "gazes",
-    "skirmishes",
-    "bizerte",
-    "riches",
-    "ventricles",
-    "students",
-    "inscrutable",
-    "sextillion",
-    "gris",
-    "delta",
-    "koop",
-    "bolster",
-    "infringements",
-    "commentaries",
-    "muscled",
-    "combat-tested",
-    "you'uns",
-    "tennessee's",
-    "harvey",
-    "brass-bound",
-    "splenetic",
-    "floundered",
-    "sutpen",
-    "beakers",
-    "reinvestigation",
-    "insiders",
-    "berrellez",
-    "bum",
-    "assessors'",
-    "lao-tse",
-    "nonfood",
-    "summarizing",
-    "deviate",
-    "producers'",
-    "owes",
-    "three-foot",
-    "kimpton",
-    "movie-goer",
-    "organization",
-    "like-minded",
-    "inclination",
-    "transcendentalists",
-    "disabling",
-    "amado",
-    "fort",
-    "hanover-bertie",
-    "juniors'",
-    "patterson",
-    "diagnosticians",
-    "varlaam's",
-    "cavalry",
-    "sidelines",
-    "regularly",
-    "housman",
-    "railhead",
-    "dubois",
-    "profusely",
-    "saddles",
-    "conformation",
-    "tragedy",
-    "unobtainable",
-    "pidgin",
-    "designations",
-    "subverting",
-    "dissenters",
-    "rossi",
-    "insecticide",
-    "journal-bulletin",
-    "shawls",
-    "enumerated",
-    "scuff",
-    "inboard",
-    "pulitzer",
-    "movie-to-be",
-    "philip",
-    "76",
-    "intraepithelial",
-    "containers",
-    "fairies",
-    "weigand",
-    "torrid-adios",
-    "belzec",
-    "flourished",
-    "50-year",
-    "badmen",
-    "gild",
-    "two-and-a-half-mile",
-    "shrines",
-    "kohnstamm-negative",
-    "protoplasmic",
-    "birthright",
-    "adapted",
-    "threats",
-    "peeping",
-    "**ymg",
-    "mops",
-    "mary",
-    "actively",
-    "hideaway",
-    "4-year-old",
-    "sharpe's",
-    "prevost",
-    "antler",
-    "malignancy",
-    "meteoritic",
-    "gute",
-    "horses",
-    "neitzbohr",
-    "identifies",
-    "court-packing",
-    "violence",
-    "ecumenists",
-    "crow",
-    "davits",
-    "hoaxes",
-    "cloisters",
-    "empedocles",
-    "$457,000",
-    "productivity-share",
-    "window",
-    "aristocratic",
-    "l'union",
-    "clarifying",
-    "secularist",
-    "preferable",
-    "bison",
-    "hydro-electric",
-    "buck",
-    "tacloban",
-    "interference",
-    "acquaintance",
-    "industrialists",
-    "glare",
-    "buber-think",
-    "ogden",
-    "relating",
-    "administration's",
-    "gentleman",
-    "newfound",
-    "meistersinger",
-    "solitude",
-    "phrasing",
-    "holyoke",
-    "ethicists",
-    "streets",
-    "family",
-    "discouraging",
-    "annoyed",
-    "guns",
-    "sp-44006",
-    "pocasset",
-    "dresses",
-    "mariano",
-    "potato",
-    "price-setting",
-    "issuing",
-    "coalesce",
-    "spies",
-    "pictures",
-    "health",
-    "misfired",
-    "fabricius",
-    "scrubbed",
-    "beaker",
-    "certificates",
-    "croak",
-    "flagler's",
-    "flurried",
-    "ille",
-    "bing",
-    "kemchenjunga",
-    "polynomials",
-    "generalities",
-    "rdf",
-    "westmore",
-    "despairing",
-    "blauberman",
-    "consonantal",
-    "injuring",
-    "fundamentalism",
-    "subjectively",
-    "temporize",
-    "unhealthy",
-    "volcanic",
-    "salting",
-    "semi-rigid",
-    "10%",
-    "parallelism",
-    "recently-passed",
-    "sub-freezing",
-    "artery's",
-    "calder",
-    "eluted",
-    "barrow",
-    "stroll",
-    "individualistic",
-    "pod",
-    "tendons",
-    "mid-air",
-    "gallon-loren",
-    "ruler",
-    "tactically",
-    "jailed",
-    "raggedness",
-    "clear",
-    "picker",
-    "foolishly",
-    "vault",
-    "tibialis",
-    "paperweight",
-    "direction",
-    "whitetail",
-    "delights",
-    "startled",
-    "look",
-    "50-50",
-    "hooting",
-    "inpost",
-    "aromas",
-    "excursions",
-    "defaulted",
-    "1923",
-    "conservatory",
-    "0.080-in.",
-    "stiles",
-    "deliberate",
-    "sophomores",
-    "payoff",
-    "exist",
-    "mails",
-    "governor-general",
-    "rinker",
-    "encloses",
-    "d'argent",
-    "velour",
-    "lineages",
-    "confounded",
-    "sufficiency",
-    "chalk-white",
-    "confinement",
-    "lower-priced",
-    "ammonium",
-    "leapt",
-    "jr.'s",
-    "unburned",
-    "jab",
-    "realest",
-    "bassinet",
-    "salu",
-    "skeletal",
-    "herry",
-    "tamiris'",
-    "inventive",
-    "viscous",
-    "reedbuck",
-    "blood-kinship",
-    "sleepily",
-    "constantino",
-    "orbital",
-    "giggles",
-    "anna",
-    "1944",
-    "phonograph",
-    "gear",
-    "immediately",
-    "coves",
-    "value",
-    "facaded",
-    "swords",
-    "sarum's",
-    "surging",
-    "blackmail",
-    "patti",
-    "mauve",
-    "unfolding",
-    "winking",
-    "nicaragua",
-    "immunization",
-    "restrain",
-    "poke",
-    "whereon",
-    "$2,461,000",
-    "centenary",
-    "strive",
-    "deficit",
-    "portago",
-    "burnham's",
-    "edythe's",
-    "straight-line",
-    "knecht",
-    "expanse",
-    "nostril",
-    "loper",
-    "reefs",
-    "stamping",
-    "highlight",
-    "healer",
-    "tampering",
-    "isn't",
-    "lectured",
-    "decreeing",
-    "tongue-thrusting",
-    "self-preservation",
-    "neutrality",
-    "exclude",
-    "picnics",
-    "legacy",
-    "suhthuhn",
-    "leone",
-    "sunset",
-    "fear-filled",
-    "grab",
-    "weil",
-    "casey's",
-    "trembling",
-    "burrows",
-    "insurgent",
-    "proprietors",
-    "corpsman",
-    "rochford",
-    "vice-chairman",
-    "sticky",
-    "mitchell",
-    "differs",
-    "mondrian",
-    "mcnamara",
-    "mileage",
-    "meditation",
-    "privacy",
-    "barrage",
-    "re-enforces",
-    "gott",
-    "befoh",
-    "fanatical",
-    "collector",
-    "mycobacteria",
-    "duf",
-    "grease",
-    "morrow",
-    "staggeringly",
-    "unifications",
-    "supposedly",
-    "funston",
-    "sympathetically",
-    "obstruct",
-    "recognize",
-    "headline",
-    "ensign",
-    "sail",
-    "ciphers",
-    "berkely",
-    "many-bodied",
-    "rum",
-    "demons",
-    "audible",
-    "sandra",
-    "chick",
-    "brahm's",
-    "phosphorus",
-    "symmetric",
-    "subspecies",
-    "discuss",
-    "870,000",
-    "accreditation",
-    "tarnished",
-    "fledgling",
-    "unscramble",
-    "sakellariadis",
-    "league",
-    "consort",
-    "1860's",
-    "doses",
-    "abundance",
-    "$28,700,000",
-    "unbearable",
-    "normals",
-    "irredeemably",
-    "dropped",
-    "rhenium",
-    "courtyards",
-    "weigel's",
-    "cleanth",
-    "especially",
-    "carbine",
-    "trenchard",
-    "157",
-    "rationality",
-    "white-columned",
-    "whiplash",
-    "rambling",
-    "westerners",
-    "enzymatic",
-    "deepening",
-    "price-earnings",
-    "enlisted",
-    "assail",
-    "propertius",
-    "transferee",
-    "paling",
-    "dining-room",
-    "leigh",
-    "averted",
-    "demonstrate",
-    "determine",
-    "noncommissioned",
-    "concede",
-    "innermost",
-    "members'",
-    "conchita",
-    "wardroom",
-    "perishable",
-    "partnership",
-    "presences",
-    "ashtrays",
-    "glimmering",
-    "sacheverell",
-    "rococo",
-    "pye",
-    "plenipotentiary",
-    "ramble",
-    "harvest",
-    "well-designed",
-    "brian",
-    "perch",
-    "fine-featured",
-    "reuveni",
-    "distiller",
-    "sweetpeas",
-    "systematization",
-    "alwin",
-    "tamale",
-    "conniver",
-    "knitted",
-    "solar-corpuscular-radiation",
-    "magnitudes",
-    "flaw",
-    "meticulously",
-    "pig-infested",
-    "ciceronian",
-    "volunteering",
-    "ambitious",
-    "uniformity",
-    "ass",
-    "commonwealth",
-    "lifted",
-    "peripherally",
-    "modernized",
-    "behaves",
-    "1786-1865",
-    "best-selling",
-    "shambling",
-    "inlets",
-    "craven",
-    "wheat",
-    "roaringest",
-    "sally",
-    "storehouse",
-    "15.8",
-    "egg-hatching",
-    "broglio's",
-    "expensive",
-    "removal",
-    "$230,000",
-    "modesty",
-    "squeamishness",
-    "plastisols",
-    "happen",
-    "share-holders",
-    "oaths",
-    "shark-infested",
-    "teammate",
-    "saltis-mcerlane",
-    "livshitz",
-    "allied",
-    "honan",
-    "webber",
-    "quiet",
-    "cobb's",
-    "edgar",
-    "alto",
-    "effusive",
-    "exhaling",
-    "physiognomy",
-    "crannies",
-    "ginning",
-    "discretion",
-    "sowing",
-    "lifters",
-    "essayed",
-    "studied",
-    "lewelleyn",
-    "corault",
-    "ex-tory",
-    "grammophon",
-    "budgets",
-    "tweezed",
-    "h'all",
-    "perfected",
-    "sergeant",
-    "truckee",
-    "lalaurie",
-    "tintable",
-    "thurber",
-    "ever",
-    "comportment",
-    "teleprompter",
-    "catastrophe",
-    "kite",
-    "repeating",
-    "carpet",
-    "cassius",
-    "re-creates",
-    "doubles",
-    "patrolling",
-    "minber",
-    "ambushes",
-    "nocturne",
-    "hays",
-    "pallid",
-    "devour",
-    "imperfection",
-    "badinage",
-    "shaft",
-    "man",
-    "thirty-year",
-    "thermometers",
-    "mrs.",
-    "semi-skilled",
-    "incipience",
-    "anything",
-    "dodged",
-    "1862",
-    "university",
-    "metabolic",
-    "concurrent",
-    "pianos",
-    "portsmouth",
-    "lubricant",
-    "twofold",
-    "5.4865771",
-    "seceding",
-    "well-worn",
-    "felske",
-    "departments",
-    "metals",
-    "motif",
-    "centrally",
-    "pith",
-    "balled",
-    "do-gooders",
-    "expansively",
-    "squatted",
-    "one-iron",
-    "crowns",
-    "scoreless",
-    "professorship",
-    "ultrasonically",
-    "folk-tale",
-    "stabs",
-    "sweeneys",
-    "unscrewed",
-    "preservation",
-    "york-pennsylvania",
-    "disaffection",
-    "festering",
-    "agglutination",
-    "prevot",
-    "$77,389,000",
-    "utterance",
-    "wordlessly",
-    "grotesquely",
-    "bets",
-    "tannin",
-    "congresses",
-    "michael's",
-    "riggs",
-    "byron's",
-    "aged",
-    "87th",
-    "unimpeachably",
-    "wove",
-    "fda's",
-    "e.g.t.",
-    "collation",
-    "addabbo",
-    "instituted",
-    "389",
-    "protease",
-    "mullenax",
-    "sensing",
-    "buyer",
-    "50,000,000",
-    "sandalphon",
-    "berger's",
-    "spider-leg",
-    "five-day",
-    "assurances",
-    "enforcement",
-    "play's",
-    "chaplains",
-    "strangest",
-    "include",
-    "sippers",
-    "conjectured",
-    "pony",
-    "13%",
-    "girl-san",
-    "phosphate-buffered",
-    "bed",
-    "$30,000,000",
-    "battling",
-    "1949",
-    "abstractionists",
-    "stalls",
-    "fleck",
-    "viability",
-    "brailsford",
-    "feudalism",
-    "twelve-year-old",
-    "93",
-    "fame",
-    "tool-kit",
-    "stoics",
-    "pfffted",
-    "bronchiole",
-    "anomic",
-    "dispersed",
-    "symptoms",
-    "geeing",
-    "slyly",
-    "emotion",
-    "seeping",
-    "symbols",
-    "bleat",
-    "hendl",
-    "bordering",
-    "scimitars",
-    "valve",
-    "hodges'",
-    "backpack",
-    "setup",
-    "robustness",
-    "lincoln",
-    "succumb",
-    "$.30/mbf",
-    "headache",
-    "faring",
-    "hiking",
-    "raptures",
-    "commencement",
-    "freest",
-    "orpheus",
-    "hand-filed",
-    "portfolio",
-    "synthesized",
-    "battered",
-    "expectant",
-    "small-game",
-    "sheckley's",
-    "florican-my",
-    "catecholamines",
-    "tex.",
-    "auctioneer's",
-    "restricted",
-    "ditch",
-    "pars",
-    "deplorably",
-    "yancey-6",
-    "karipo",
-    "nightmare",
-    "extensor",
-    "willis",
-    "meandering",
-    "wallpapers",
-    "inaccuracy",
-    "encourages",
-    "complete",
-    "generalist",
-    "hoyt",
-    "noskova",
-    "bomber's",
-    "baby-dear",
-    "abbe-direct",
-    "deluge",
-    "career-bound",
-    "6.3",
-    "spangled",
-    "contained",
-    "conceptions",
-    "lovett",
-    "appoint",
-    "wrapped",
-    "thinker",
-    "muffling",
-    "wall-stabilized",
-    "utilization",
-    "seam",
-    "burgesses",
-    "pugh",
-    "polyphosphates",
-    "khaki-bound",
-    "yankeefication",
-    "fiberglas",
-    "specialize",
-    "smuggling",
-    "irreducible",
-    "2.54",
-    "intimate",
-    "helluva",
-    "carl's",
-    "podger's",
-    "greek",
-    "7/16''",
-    "1947-49",
-    "1,419,833",
-    "wickedness",
-    "benelux",
-    "whiz",
-    "intolerable",
-    "believer",
-    "reluctantly",
-    "murkland",
-    "glimco",
-    "stems",
-    "going",
-    "25,000",
-    "bauer",
-    "cookfire",
-    "disintegrating",
-    "thelma's",
-    "outset",
-    "reflections",
-    "hieronymus",
-    "1714",
-    "blanton",
-    "niven",
-    "ragging",
-    "trotted",
-    "aerials",
-    "extractor",
-    "riboflavin",
-    "fayette",
-    "adhesives",
-    "instances",
-    "preached",
-    "airlift",
-    "hexagon",
-    "2:36",
-    "drones",
-    "starved",
-    "estimating",
-    "lavaughn",
-    "druncke",
-    "goes",
-    "buckhorn's",
-    "unpleasantly",
-    "whims",
-    "poet-painter",
-    "36-in.",
-    "aegean",
-    "motion-pattern",
-    "grille-route",
-    "drought",
-    "crisis",
-    "esperanza",
-    "hydraulically",
-    "coaxed",
-    "parlors",
-    "justification",
-    "fanny",
-    "bobbie",
-    "septation",
-    "734",
-    "valewe",
-    "contagion",
-    "downturn",
-    "romp",
-    "dust-thick",
-    "playwright-director",
-    "60,000",
-    "television",
-    "twelve-hour",
-    "disconcert",
-    "gloated",
-    "fixture",
-    "encroachment",
-    "sed",
-    "vogue",
-    "shoup",
-    "conversion-by-renovation",
-    "washboard",
-    "accompaniments",
-    "drips",
-    "receptionist's",
-    "baskets",
-    "harvests",
-    "regains",
-    "activated",
-    "bless",
-    "patriotic",
-    "1290",
-    "samplers",
-    "populaire",
-    "poussins",
-    "homewards",
-    "reorientation",
-    "anthropological-religious",
-    "conferred",
-    "francie",
-    "exile",
-    "chandeliers",
-    "picnic",
-    "grazer",
-    "mon-goddess",
-    "menelaus'",
-    "annunciated",
-    "visigoths",
-    "persiflage",
-    "desegregate",
-    "unveiled",
-    "midway",
-    "chadwick",
-    "assaulting",
-    "rebellion",
-    "club",
-    "regenerating",
-    "gargantuan",
-    "maine",
-    "anniston's",
-    "incestuous",
-    "funnier",
-    "monty",
-    "weeks",
-    "beowulf",
-    "shit-sick",
-    "expressing",
-    "nilly",
-    "gorgeous",
-    "markel",
-    "objector",
-    "suitably-loaded",
-    "fifty-fifth",
-    "incorrect",
-    "rocket's",
-    "curia",
-    "blasphemed",
-    "axes",
-    "assay",
-    "hershey's",
-    "framed",
-    "vacancy",
-    "pentagon",
-    "time-olivette",
-    "shelters",
-    "monic",
-    "mater",
-    "lubra",
-    "989",
-    "amplify",
-    "unexplored",
-    "belgian",
-    "has",
-    "braggadocio",
-    "inexhaustible",
-    "anxiety-released",
-    "calibrated",
-    "sell",
-    "options",
-    "gansevoort",
-    "medicinal",
-    "justifiable",
-    "freer",
-    "impersonated",
-    "sweet-tongued",
-    "metalworking",
-    "henh",
-    "oppressors",
-    "retailer",
-    "arrears",
-    "osteoporosis",
-    "514c",
-    "exploding-wire",
-    "sash",
-    "overrated",
-    "reichenberg",
-    "creating",
-    "enhanced",
-    "doings",
-    "1300",
-    "periods",
-    "generator",
-    "inexcusable",
-    "completing",
-    "inspection",
-    "innovations",
-    "self-sufficient",
-    "ceaseless",
-    "delusion",
-    "connote",
-    "rodney-the",
-    "piersee",
-    "decisiveness",
-    "bride-gift",
-    "bois",
-    "cloakrooms",
-    "interlaced",
-    "30-odd",
-    "craig's",
-    "asian",
-    "boldest",
-    "barkeep",
-    "greenville",
-    "julep",
-    "silicone",
-    "substituted",
-    "thruways",
-    "you'll",
-    "imperfections",
-    "third-story",
-    "price-cutting",
-    "271",
-    "republic",
-    "swahili",
-    "recondite",
-    "quashed",
-    "shrugged",
-    "mastered",
-    "soignee",
-    "cagey",
-    "assess",
-    "majestically",
-    "understandings",
-    "faustian",
-    "aliquots",
-    "besmirch",
-    "run",
-    "astringency",
-    "shunts",
-    "overlaps",
-    "superstition",
-    "inshore",
-    "22-12",
-    "four-wood",
-    "'13",
-    "moonlight",
-    "lockup",
-    "israelite",
-    "nine-state",
-    "falling",
-    "enfield",
-    "injection-molded",
-    "polarization",
-    "hiccups",
-    "proximate",
-    "nostalgia",
-    "crack",
-    "stronger",
-    "snappy",
-    "one-tenth",
-    "pool-care",
-    "accumulated",
-    "avoided",
-    "mechanics",
-    "deceptively",
-    "punched-card",
-    "design",
-    "staffordshire",
-    "fifty-seven",
-    "task",
-    "sharper",
-    "steals",
-    "1.10.1",
-    "jaunty",
-    "haupts'",
-    "domicile",
-    "vevay",
-    "carryover",
-    "gustaf",
-    "chipping",
-    "prod",
-    "four-lane",
-    "split",
-    "degas",
-    "persona",
-    "19,000",
-    "noticing",
-    "chuckles",
-    "elephant",
-    "laws",
-    "tonics",
-    "spaniel's",
-    "outfitted",
-    "stalked",
-    "lyricist's",
-    "1m",
-    "munroe",
-    "outcrops",
-    "reshaped",
-    "unusual",
-    "mast",
-    "metaphysical",
-    "calibers",
-    "eerie",
-    "kale",
-    "constatation",
-    "parliaments",
-    "knight-errant",
-    "recusant",
-    "compulsively",
-    "peeter",
-    "glandular",
-    "lesourd",
-    "fast-grossing",
-    "mandated",
-    "backwoods-and-sand-hill",
-    "rudolph",
-    "stranahan",
-    "majdanek",
-    "southerner's",
-    "recklessly",
-    "ratcliffe",
-    "unsuccessful",
-    "ligget",
-    "oily",
-    "endowments",
-    "supermatic",
-    "wife-to-be",
-    "iron-poor",
-    "vocalism",
-    "faber's",
-    "boomerang",
-    "moultons",
-    "mcpherson's",
-    "underrated",
-    "smoothly",
-    "faithful",
-    "cyclical",
-    "plunder",
-    "1671",
-    "retired",
-    "pre-anglo-saxon",
-    "freedmen",
-    "encountered",
-    "suppliers",
-    "dill's",
-    "avant-garde",
-    "hooper",
-    "ozarks",
-    "wealthy",
-    "takes",
-    "buttrick",
-    "loose-jowled",
-    "$6",
-    "contemplating",
-    "herringbone",
-    "trusts",
-    "drunk-and-disorderlies",
-    "mid-week",
-    "proximity",
-    "verbenas",
-    "growths",
-    "constriction",
-    "thrower",
-    "advanced",
-    "mahayana",
-    "flageolet",
-    "plunges",
-    "stabilized",
-    "bitch",
-    "mauve-colored",
-    "sims",
-    "urge",
-    "oh",
-    "preliminary",
-    "leagues",
-    "$650",
-    "logistic",
-    "roughish",
-    "lunation",
-    "ica",
-    "blood-flecked",
-    "brok",
-    "tenor",
-    "assign",
-    "incoming",
-    "handbook",
-    "one-year",
-    "hattie",
-    "winding",
-    "tongued",
-    "1.23",
-    "bushell",
-    "lennie",
-    "estuaries",
-    "ten-by-ten-mile",
-    "israel",
-    "fellowfeeling",
-    "skywave",
-    "winos",
-    "semester",
-    "1848",
-    "wittingly",
-    "sedimentary",
-    "breed",
-    "appealing",
-    "sentry",
-    "impetus",
-    "2:32.4",
-    "transmit",
-    "heart-stopping",
-    "scarecrowish",
-    "23-year-old",
-    "matinals",
-    "eloped",
-    "jogs",
-    "stillness",
-    "ratings",
-    "mindanao",
-    "price-level",
-    "sounded",
-    "prince",
-    "shaping",
-    "non-academic",
-    "unworthy",
-    "r.h.",
-    "90-degrees",
-    "catsup",
-    "setsw",
-    "interchangeable",
-    "carnality",
-    "communist-type",
-    "gerosa",
-    "nominate",
-    "methode",
-    "intendant",
-    "cave-men",
-    "corporis",
-    "computation",
-    "canandaigua",
-    "33",
-    "tower",
-    "mondays",
-    "filters",
-    "rescind",
-    "present-time",
-    "pour",
-    "eaten",
-    "craig",
-    "potassium",
-    "refusal",
-    "parties",
-    "wive's",
-    "fatigue",
-    "grassfire",
-    "mischief",
-    "lucid",
-    "pilate's",
-    "river",
-    "conditional",
-    "guileless",
-    "multiply",
-    "volare",
-    "robert",
-    "postulates",
-    "bombed",
-    "soldered",
-    "rees",
-    "trajectory",
-    "manhours",
-    "jazzy",
-    "blooms",
-    "cure",
-    "bw",
-    "spinning",
-    "implacable",
-    "mizell",
-    "althea",
-    "d'you",
-    "lucretia",
-    "dell'arca",
-    "grassland",
-    "blebs",
-    "spanish",
-    "nuttall",
-    "armada's",
-    "murdered",
-    "infiltrated",
-    "ain't",
-    "concert-disc",
-    "78th",
-    "hemolytic",
-    "tomorrow's",
-    "hypnotized",
-    "neo-",
-    "shakespearean",
-    "catch",
-    "dock",
-    "presentlye",
-    "cutting-edge",
-    "rockettes",
-    "whipsawed",
-    "marxist",
-    "gypsies",
-    "idal",
-    "encompass",
-    "sherman",
-    "1951-1956",
-    "full-of-the-moon",
-    "radiochlorine",
-    "sausage-meat",
-    "liquidated",
-    "3.25",
-    "fuller",
-    "handsomest",
-    "prize-winning",
-    "dyeing",
-    "incongruity",
-    "pronounce",
-    "burl",
-    "brewer's",
-    "bills",
-    "castorbeans",
-    "agone",
-    "ruffian",
-    "aviv",
-    "practicing",
-    "grounds",
-    "bovine",
-    "severity",
-    "greate",
-    "ranches",
-    "prof.",
-    "collected",
-    "moan",
-    "eighteenth",
-    "purposely",
-    "land",
-    "dactyls",
-    "home",
-    "betrays",
-    "schmalzried",
-    "semi-nude",
-    "resource-use",
-    "convoluted",
-    "alliance's",
-    "homogeneously",
-    "keynote",
-    "pit-run",
-    "orphans",
-    "peonies",
-    "gymnast",
-    "hymselfe",
-    "uneasiness",
-    "oliver's",
-    "grimly",
-    "inhibition",
-    "nam",
-    "ares",
-    "transparent",
-    "sunrise",
-    "795,586",
-    "1778",
-    "multi-",
-    "sociable",
-    "lefthanders",
-    "fantasia",
-    "1596/7",
-    "fleisher",
-    "capacities",
-    "observer's",
-    "presentations",
-    "stanhope",
-    "authentication",
-    "prudently",
-    "delectation",
-    "pak",
-    "$18",
-    "assembling",
-    "grass",
-    "colquitt",
-    "costaggini",
-    "22nd",
-    "giddy",
-    "indulgences",
-    "england's",
-    "sadie",
-    "quarrymen",
-    "decor",
-    "2d",
-    "information-seeking",
-    "sagebrush",
-    "estate",
-    "revaluation",
-    "kamchatka",
-    "astonishment",
-    "mascara",
-    "lydia",
-    "7.5",
-    "soukhouma",
-    "india",
-    "resourcefully",
-    "quake's",
-    "kare",
-    "pseudo-sophistication",
-    "librarian",
-    "acumen",
-    "micrometers",
-    "devil's",
-    "powerless",
-    "molesting",
-    "nodules",
-    "caravan",
-    "relentlessness",
-    "dolan",
-    "filipino",
-    "antagonised",
-    "jefferson",
-    "nighters",
-    "aspirants",
-    "programed",
-    "qualify",
-    "uncommunicative",
-    "120",
-    "macromolecular",
-    "immediacy",
-    "brim",
-    "herd-owner",
-    "exchequer",
-    "routine",
-    "clapped",
-    "wryly",
-    "cracking",
-    "patenting",
-    "woodworking",
-    "$9.50",
-    "vacuolated",
-    "revelations",
-    "showering",
-    "conserving",
-    "july",
-    "distinguish",
-    "custodian",
-    "interludes",
-    "toys",
-    "$.80",
-    "abuses",
-    "liars",
-    "parliamentarians",
-    "davao",
-    "metaphysicals",
-    "prayerfully",
-    "cleaning",
-    "wiry",
-    "remington",
-    "libretto",
-    "patty",
-    "verie",
-    "teen",
-    "indefensible",
-    "rye",
-    "1702-14",
-    "cutter",
-    "elasticity",
-    "demarcation",
-    "relationship",
-    "handsomer",
-    "mandamus",
-    "together",
-    "widow",
-    "roaming",
-    "worryin'",
-    "kingpin",
-    "strap",
-    "fauteuil",
-    "posse",
-    "koussevitzky",
-    "eventually",
-    "alkylarysulfonate",
-    "1,080,062",
-    "hastily-summoned",
-    "masks",
-    "expounded",
-    "dion",
-    "$8,250",
-    "loneliest",
-    "domokous",
-    "huxley's",
-    "intimidate",
-    "merrill",
-    "shakespeare's",
-    "mahler's",
-    "resealed",
-    "progressivism",
-    "foamy",
-    "trenton",
-    "fervently",
-    "annals",
-    "clericis",
-    "grappely",
-    "insecurity",
-    "robinsonville",
-    "dammed",
-    "archbishops'",
-    "doltish",
-    "bernhardt",
-    "observing",
-    "stubbornness",
-    "testaments",
-    "tumefaciens",
-    "nudist",
-    "youthful",
-    "misfortune",
-    "converting",
-    "darius",
-    "deluged",
-    "381(c)(14)",
-    "valerie",
-    "world-famous",
-    "congratulations",
-    "don",
-    "starchy",
-    "last-ditch",
-    "baden-baden",
-    "maturational",
-    "sacraments",
-    "line-driven",
-    "lipton",
-    "reissue",
-    "firmer",
-    "$20,000,000",
-    "yearningly",
-    "kennedy's",
-    "self-control",
-    "raiders",
-    "defunct",
-    "twigged",
-    "gestapo",
-    "distracted",
-    "tsarevich",
-    "fifty-ninth",
-    "2544",
-    "18th",
-    "pericles",
-    "dissent",
-    "sing",
-    "teams",
-    "crassest",
-    "confucian",
-    "internationalist",
-    "4-inch",
-    "smilingly",
-    "over-subscribed",
-    "symphony's",
-    "schramm",
-    "lunatic",
-    "entitle",
-    "ind",
-    "reminder",
-    "journals",
-    "dline",
-    "slickers",
-    "wolfe's",
-    "karns'",
-    "bury",
-    "non-indian",
-    "grooms",
-    "pinpoint",
-    "decline",
-    "presided",
-    "distributor",
-    "lascivious",
-    "mother-in-law",
-    "brannon",
-    "promulgating",
-    "hinting",
-    "summarized",
-    "brand",
-    "powerplants",
-    "buds",
-    "pocketful",
-    "lifelong",
-    "carload",
-    "physicalness",
-    "unremitting",
-    "re-emerged",
-    "shearn",
-    "marches",
-    "autobiography",
-    "wide-cut",
-    "scrapiron",
-    "bultmann",
-    "golly",
-    "absences",
-    "perfectly",
-    "troubles",
-    "mantlepiece",
-    "misconception",
-    "thumb",
-    "duke",
-    "flying",
-    "blazed",
-    "1870",
-    "rotting",
-    "tyson",
-    "waterproof",
-    "super-imposed",
-    "heart-warming",
-    "vienna's",
-    "$150",
-    "well-known",
-    "jones's",
-    "gratification",
-    "16th",
-    "syllabicity",
-    "unbidden",
-    "sinews",
-    "annie",
-    "adhesive",
-    "spraying",
-    "stressing",
-    "unprepared",
-    "avoidance",
-    "grilled",
-    "retirements",
-    "tapestry",
-    "shrieked",
-    "plasma",
-    "presenter",
-    "beriberi",
-    "macon",
-    "redhook",
-    "trigonal",
-    "dousman",
-    "watercolorist",
-    "overall",
-    "host",
-    "buzz-buzz-buzz",
-    "examinations",
-    "unconscionable",
-    "where's",
-    "sulcer",
-    "austria",
-    "chlorides",
-    "sepulchred",
-    "solving",
-    "jacobean",
-    "swings",
-    "exertions",
-    "necropsy",
-    "sufferings",
-    "three-story",
-    "unlawful",
-    "phosphines",
-    "braided",
-    "archimedes",
-    "irsac",
-    "finan",
-    "floodheads",
-    "unhappy",
-    "phalanx",
-    "fractionated",
-    "retires",
-    "ignite",
-    "jerkings",
-    "denting",
-    "glared",
-    "mike",
-    "crevices",
-    "acting-president",
-    "janitors",
-    "uncluttered",
-    "tantrum",
-    "stair-well",
-    "cruelly",
-    "injustices",
-    "outside",
-    "colman",
-    "hustled",
-    "balinese",
-    "mauler",
-    "sails",
-    "disadvantage",
-    "3,000-foot",
-    "clerks",
-    "ekwanok",
-    "hog",
-    "commoners",
-    "rumanian",
-    "dehydrated",
-    "l.",
-    "disaffiliation",
-    "robards",
-    "non-thermal",
-    "sp.",
-    "bosis",
-    "rock-ribbed",
-    "disembodied",
-    "elec's",
-    "lecky",
-    "shipmate",
-    "buena",
-    "hoping",
-    "rhythm-wily",
-    "unsaid",
-    "misanthrope",
-    "formed-tooth",
-    "profiles",
-    "nra",
-    "panther",
-    "deduct",
-    "affronted",
-    "battlefields",
-    "pressure-sensing",
-    "patented",
-    "hatchet",
-    "photomicrography",
-    "questioners",
-    "starring",
-    "spongy",
-    "dream",
-    "captaincy",
-    "meyner",
-    "building",
-    "othon",
-    "sub-chiefs",
-    "33d",
-    "imperishable",
-    "giddiness",
-    "fondly",
-    "award",
-    "noticeable",
-    "inclement",
-    "minded",
-    "sagami",
-    "miriam",
-    "envied",
-    "$2,000,000",
-    "scaffold",
-    "concurrence",
-    "robby",
-    "caddy",
-    "dartmouth's",
-    "statuto",
-    "leila",
-    "flammable",
-    "corpses",
-    "affluence",
-    "ailerons",
-    "horde",
-    "quo",
-    "waite",
-    "three-year",
-    "congregated",
-    "37,679",
-    "cocaine",
-    "unforeseen",
-    "$.054/mbf",
-    "boxed-in",
-    "bind",
-    "tenacious",
-    "heatwole",
-    "supervisor's",
-    "bellyfull",
-    "braille",
-    "clears",
-    "$12.7",
-    "steps",
-    "consequential",
-    "draught",
-    "canvassed",
-    "owner's",
-    "knee-length",
-    "disproportionately",
-    "arrived",
-    "seventh",
-    "academics",
-    "tea-leaf",
-    "mealynose",
-    "shah",
-    "picayune",
-    "connotes",
-    "involuntarily",
-    "mutual",
-    "doctrinally",
-    "herberet's",
-    "wipe",
-    "scolding",
-    "spavined",
-    "temporal",
-    "seaside",
-    "$16",
-    "week-ends",
-    "scathingly",
-    "metaphors",
-    "gardener",
-    "rex",
-    "pegboard",
-    "regardless",
-    "pollen-and-nectar",
-    "reagents",
-    "clodhoppers",
-    "eligio",
-    "tugaru",
-    "conversation",
-    "1184",
-    "horsely",
-    "neutral",
-    "hence",
-    "tastes",
-    "terramycin",
-    "orgone",
-    "exigencies",
-    "oberlin",
-    "consultant",
-    "pax",
-    "unamused",
-    "priced",
-    "thirty-five",
-    "adamo",
-    "detestable",
-    "concetta",
-    "tax-paying",
-    "fingerprints",
-    "gorshek",
-    "cackled",
-    "vaginal",
-    "burning",
-    "probl'y",
-    "$.076",
-    "severe",
-    "fatima",
-    "folding",
-    "billed",
-    "chartings",
-    "obscurity",
-    "eighty-one",
-    "three-judge",
-    "parental",
-    "sill",
-    "naivete",
-    "non-social",
-    "zapala",
-    "pricks",
-    "donizetti's",
-    "isolationism",
-    "accompanied",
-    "bewildered",
-    "pete",
-    "third-inning",
-    "bedding",
-    "amplification",
-    "agitating",
-    "illusions",
-    "sympathies",
-    "buckwheat",
-    "courier",
-    "followeth",
-    "layered",
-    "tanks",
-    "desert",
-    "manningham",
-    "vaughn",
-    "swear",
-    "bentley",
-    "radiosterilization",
-    "tinder",
-    "awoc",
-    "$26,000,000",
-    "drinking",
-    "halter",
-    "stout",
-    "concentrate",
-    "apparent",
-    "gorton",
-    "respectfully",
-    "conversant",
-    "reinforcing",
-    "essay",
-    "distressing",
-    "hobbes'",
-    "vows",
-    "vitiated",
-    "commensurate",
-    "call-backs",
-    "corroding",
-    "windy",
-    "jellyby",
-    "mauch",
-    "coined",
-    "candour",
-    "wrongful",
-    "mounts",
-    "hatted",
-    "adorns",
-    "transforming",
-    "intelligent",
-    "wrought",
-    "bronislaw",
-    "tulane",
-    "$1.0",
-    "inadvertent",
-    "infarction",
-    "behaved",
-    "swaggering",
-    "invoked",
-    "noncompliance",
-    "nagamo",
-    "toasted",
-    "stereotype",
-    "absently",
-    "ginnin'",
-    "push",
-    "wracking",
-    "hardened",
-    "doaty's",
-    "lathered",
-    "ethyl",
-    "ind.",
-    "scrambled",
-    "1/4''",
-    "culte",
-    "clerical-lay",
-    "soften",
-    "athletic",
-    "useable",
-    "privilege",
-    "concealing",
-    "stark",
-    "clays",
-    "retrieval",
-    "oldsters",
-    "confidentiality",
-    "nationalized",
-    "'ello",
-    "indivisibility",
-    "shakespearian",
-    "oppressed",
-    "forgot",
-    "hypocritical",
-    "half-year",
-    "$610",
-    "kneeling",
-    "orders",
-    "upturned",
-    "join",
-    "cannot",
-    "cartons",
-    "dearborn",
-    "grafin",
-    "velours",
-    "ijal",
-    "k'ang-si",
-    "eulogizers",
-    "$1,000,000",
-    "non-commissioned",
-    "statuary",
-    "possessed",
-    "skeet",
-    "eternity",
-    "koussevitzky's",
-    "poor-white-trash",
-    "eagles",
-    "denominated",
-    "tantalizingly",
-    "manville",
-    "azalea",
-    "quelling",
-    "angel's",
-    "toughness",
-    "alvear",
-    "watercolorists",
-    "curdling",
-    "giant",
-    "benita",
-    "unfitting",
-    "sin-ned",
-    "texas",
-    "smallpox",
-    "pianists",
-    "saps",
-    "oxen's",
-    "areas",
-    "teaches",
-    "tramp",
-    "brocade",
-    "bedspread",
-    "et",
-    "vernor",
-    "mainstream",
-    "$1.7",
-    "cosmetic",
-    "throughput",
-    "horse-trading",
-    "galveston-port",
-    "minute's",
-    "refrigerated",
-    "loopholes",
-    "asbestos-cement",
-    "flappers",
-    "demagnification",
-    "feverish",
-    "couches",
-    "heretics",
-    "accredited",
-    "participate",
-    "leases",
-    "arthur",
-    "pave",
-    "seaton",
-    "nicolas",
-    "cherishing",
-    "carve",
-    "assassinated",
-    "facilitate",
-    "capital",
-    "hospitals",
-    "$4.9",
-    "med-chemical",
-    "vacation",
-    "traxel",
-    "earthmen's",
-    "beirut",
-    "corelli",
-    "smolderingly",
-    "richardson's",
-    "nationalizing",
-    "stemmed",
-    "digs",
-    "rebelliously",
-    "rustled",
-    "razor-sharp",
-    "shoved",
-    "tommy",
-    "worthy",
-    "galena",
-    "peruvian",
-    "outnumber",
-    "submachine",
-    "slated",
-    "ponderous",
-    "segregating",
-    "rosenberg",
-    "ge",
-    "distinguishable",
-    "taunting",
-    "impious",
-    "laced",
-    "u.s.'s",
-    "lineback",
-    "motto",
-    "accolade",
-    "antidote",
-    "semicircular",
-    "graphite",
-    "oshkosh",
-    "intruder",
-    "browny",
-    "floundering",
-    "anyone",
-    "grok",
-    "maht",
-    "impaling",
-    "timepiece",
-    "choosing",
-    "ascending",
-    "bore",
-    "heartening",
-    "hairier",
-    "schoolbooks",
-    "amounts",
-    "holdup",
-    "fighter",
-    "claiming",
-    "schaffner",
-    "grits",
-    "pagodas",
-    "insistence",
-    "e.o.",
-    "levy",
-    "nonogenarian",
-    "sensibly",
-    "chekhov",
-    "arbitration",
-    "manly",
-    "defraud",
-    "jean-marie",
-    "corridor",
-    "co-ordination",
-    "darkly",
-    "conceits",
-    "0.24",
-    "disarming",
-    "specified",
-    "100%",
-    "therapies",
-    "machinelike",
-    "$16,000",
-    "vacationland",
-    "bouquet",
-    "satin-covered",
-    "graduation",
-    "menial",
-    "readable",
-    "belong",
-    "harbored",
-    "inducements",
-    "formby's",
-    "unrecoverable",
-    "rationalization",
-    "sublunary",
-    "rumscheidt",
-    "superb",
-    "retrograde",
-    "possessions",
-    "counter-clockwise",
-    "anastomosis",
-    "sapling",
-    "flooded",
-    "south-eastern",
-    "lucien",
-    "returning",
-    "decathlon",
-    "rightly",
-    "budgeted",
-    "bifocal",
-    "bouanahsha",
-    "tackles",
-    "fast",
-    "lad",
-    "supermarkets",
-    "corresponded",
-    "respondents",
-    "envisions",
-    "settled",
-    "verification",
-    "juke",
-    "semester's",
-    "gab",
-    "crucifixion",
-    "universal-international",
-    "revolutions",
-    "bun",
-    "designating",
-    "totaled",
-    "uppercut",
-    "7287",
-    "walkin'",
-    "rocklike",
-    "stepladders",
-    "duels",
-    "watt",
-    "invalid",
-    "whisperings",
-    "affaires",
-    "treason",
-    "congregationalism",
-    "benzell",
-    "originally",
-    "fudomae",
-    "measured",
-    "bizarre",
-    "broadened",
-    "luggage",
-    "enforcers",
-    "full-scale",
-    "lockheed",
-    "rastus",
-    "strewn",
-    "dialysis",
-    "varigrad",
-    "kelsey",
-    "sticky-fingered",
-    "shannon",
-    "filles",
-    "ecclesiastical",
-    "talker",
-    "comically",
-    "confine",
-    "feline",
-    "off-stage",
-    "martians",
-    "devonshire",
-    "strivings",
-    "pore",
-    "noticed",
-    "filmed",
-    "milton",
-    "middle-sized",
-    "interred",
-    "interpreter",
-    "process-server",
-    "all-county",
-    "officer",
-    "fusty",
-    "meteorite",
-    "squelched",
-    "1657",
-    "rancidity",
-    "evaluations",
-    "couperin",
-    "ensuring",
-    "70,000,000",
-    "15th",
-    "money's",
-    "55,987",
-    "anvil",
-    "lehner",
-    "sicilians",
-    "hundred-yen",
-    "cores",
-    "ungallant",
-    "easterners",
-    "copenhagen",
-    "tough-looking",
-    "flow",
-    "actualities",
-    "grover",
-    "workmen",
-    "daniels",
-    "hydrochloride",
-    "equality",
-    "u.n.f.p.",
-    "hobo",
-    "miyagi",
-    "1-inch",
-    "overbearing",
-    "eleanor",
-    "horne",
-    "decolletage",
-    "reminiscent",
-    "275",
-    "christopher",
-    "lumumba",
-    "gathered",
-    "cilia",
-    "laying",
-    "bumping",
-    "restlessly",
-    "airfields",
-    "3000",
-    "guttered",
-    "nonequivalence",
-    "histology",
-    "aimed",
-    "realtors",
-    "inflame",
-    "dissolution",
-    "anaesthesia",
-    "21-year",
-    "handling",
-    "unassisted",
-    "coolant",
-    "sedulously",
-    "delivering",
-    "numbers",
-    "twenty-page",
-    "erected",
-    "estrangement",
-    "tryin",
-    "appetite",
-    "length",
-    "plaid",
-    "bloom",
-    "elmer",
-    "onlookers",
-    "classless",
-    "gauge",
-    "bestes",
-    "grev.",
-    "609",
-    "salutaris",
-    "santayana's",
-    "rains",
-    "deemed",
-    "moments",
-    "typicality",
-    "tardily",
-    "news",
-    "twisty",
-    "self-energizing",
-    "ammo",
-    "die-up",
-    "entertainment",
-    "thereby",
-    "flour-milling",
-    "invulnerability",
-    "myeloid",
-    "arkabutla",
-    "brest",
-    "wide-grip",
-    "hand-written",
-    "compatability",
-    "dearest",
-    "stunningly",
-    "fuses",
-    "friezes",
-    "mclish",
-    "kidnapped",
-    "icebox",
-    "chorus",
-    "adrift",
-    "caliber",
-    "reconcile",
-    "invaded",
-    "little",
-    "a/3",
-    "melanderi",
-    "stator",
-    "drunk",
-    "headwalls",
-    "disdain",
-    "high-energy",
-    "steed",
-    "doctrinal",
-    "bushes",
-    "whacked",
-    "analogously",
-    "uttering",
-    "year-end",
-    "evidencing",
-    "homerists",
-    "64-13",
-    "cozy",
-    "sub-conscious-level",
-    "davy",
-    "rushing",
-    "soviets'",
-    "amaral",
-    "accidents",
-    "personifying",
-    "defense",
-    "2/4",
-    "animals",
-    "sidewinder",
-    "paramagnet",
-    "twenty-five",
-    "remarried",
-    "commandment",
-    "jams",
-    "geese",
-    "partaking",
-    "bashaw",
-    "krim",
-    "0.075",
-    "s.k.",
-    "built-soap",
-    "bewitching",
-    "categorical",
-    "firelight",
-    "expend",
-    "eva",
-    "freshly",
-    "tracking",
-    "nebular",
-    "itinerant",
-    "color",
-    "77",
-    "wycoff's",
-    "megaton",
-    "verified",
-    "sensibility",
-    "enciphered",
-    "impinge",
-    "143",
-    "neo-popularism",
-    "huston",
-    "rewt",
-    "psychoanalytic",
-    "proliferated",
-    "grape-arbor",
-    "miserably",
-    "netting",
-    "bleeps",
-    "exposed",
-    "strippers",
-    "that-a-way",
-    "neoliberal",
-    "snick",
-    "mardis",
-    "end-to-end",
-    "coffeecup",
-    "amended",
-    "transvestitism",
-    "iliad",
-    "thin",
-    "exercise",
-    "stepmothers",
-    "oxygens",
-    "watercolor",
-    "summon",
-    "greenest",
-    "clover",
-    "twinge",
-    "fyodor",
-    "drunkard's",
-    "flash",
-    "frigid",
-    "commons",
-    "foursome",
-    "constant-temperature",
-    "water-washed",
-    "completion",
-    "eben",
-    "bribed",
-    "squeeze",
-    "martini",
-    "pamphili",
-    "ague",
-    "schoolhouse",
-    "colzani",
-    "182",
-    "socio-economic",
-    "surfaces",
-    "evegeni",
-    "flimsy",
-    "selected",
-    "silica",
-    "scenes",
-    "top-heavy",
-    "nagged",
-    "4-month",
-    "ursuline",
-    "sticle",
-    "student-loan",
-    "approximation",
-    "excavations",
-    "installments",
-    "**yt",
-    "impartiality",
-    "claims",
-    "well-planned",
-    "winged",
-    "timex",
-    "initiation",
-    "crippled",
-    "capitalizing",
-    "borderline",
-    "loy",
-    "mischa",
-    "empowered",
-    "3.1",
-    "aryl",
-    "stable-garage",
-    "dewey",
-    "inspector",
-    "planners",
-    "sunay",
-    "1976",
-    "pe",
-    "vocalization",
-    "mowed",
-    "dobbins",
-    "toughest",
-    "telescopic",
-    "incendiaries",
-    "egon",
-    "nairobi",
-    "velon",
-    "reflected",
-    "usable",
-    "rip",
-    "misjudged",
-    "smiles",
-    "conceives",
-    "anonymous",
-    "discretionary",
-    "languages",
-    "traveler",
-    "stigma",
-    "airborne",
-    "profitability",
-    "ruling's",
-    "traditionalistic",
-    "forty-nine",
-    "dogleg",
-    "155-yarder",
-    "affirmative",
-    "rasping",
-    "banged",
-    "eileen's",
-    "equated",
-    "sweepingly",
-    "economizing",
-    "case-by-case",
-    "quacked",
-    "calmly",
-    "eileen",
-    "bondi",
-    "catastrophes",
-    "cares",
-    "79-cents",
-    "patinas",
-    "togs",
-    "resolved",
-    "maverick",
-    "owing",
-    "precedes",
-    "cents",
-    "monde",
-    "weakens",
-    "pitied",
-    "cotten's",
-    "dark-skinned",
-    "famille",
-    "long-stemmed",
-    "ineffective",
-    "bio-medical",
-    "gilmore",
-    "disturbance",
-    "spout",
-    "longshot",
-    "ter-arutunian",
-    "viewpoint",
-    "allstates'",
-    "40",
-    "concentrated",
-    "governors",
-    "accusations",
-    "operators",
-    "whip",
-    "aborigines",
-    "eatables",
-    "124",
-    "groth",
-    "speedboat",
-    "tithes",
-    "reveals",
-    "invading",
-    "godlike",
-    "instructor",
-    "triumphant",
-    "fifty-pound",
-    "stalinist",
-    "votes",
-    "blackstone",
-    "foreleg",
-    "umm",
-    "characterization",
-    "nod",
-    "5-run",
-    "frauds",
-    "inheriting",
-    "steeped",
-    "warn",
-    "asteria",
-    "adrar",
-    "bumptious",
-    "reciprocal",
-    "asunder",
-    "eyd",
-    "hardtack",
-    "blend",
-    "poland's",
-    "braces",
-    "mousy",
-    "bodies",
-    "snatching",
-    "one-kiloton",
-    "fifty-one",
-    "unequivocally",
-    "inadequacies",
-    "lauchli's",
-    "hydrated",
-    "400-lb.",
-    "tentative",
-    "toll-road",
-    "betide",
-    "marseilles",
-    "phraseology",
-    "4.5",
-    "rampage",
-    "nobody's",
-    "servicemen",
-    "quadrille",
-    "dams",
-    "rondo",
-    "unmanaged",
-    "meredith",
-    "stool",
-    "hamrick's",
-    "foolishness",
-    "marksman",
-    "vulture",
-    "darbuka",
-    "cowley",
-    "rumanians",
-    "extraneousness",
-    "durin'",
-    "sub-human",
-    "mom's",
-    "enlist",
-    "immeasurably",
-    "understanded",
-    "happiness",
-    "fatty",
-    "themes",
-    "salton",
-    "rock-carved",
-    "dunne",
-    "southpaw",
-    "manors",
-    "motel",
-    "esnards",
-    "gladdy's",
-    "wilder",
-    "massing",
-    "realizes",
-    "farmhouses",
-    "anacondas",
-    "unwired",
-    "harrowing",
-    "bombastic",
-    "cr--spe",
-    "unready",
-    "pharmical",
-    "mud",
-    "generosity",
-    "deferred",
-    "misdeeds",
-    "mittens",
-    "caviar",
-    "$538",
-    "800,000",
-    "sexton",
-    "walking",
-    "disagreements",
-    "intending",
-    "equation",
-    "morsel",
-    "noblesse",
-    "lingerie",
-    "sayed",
-    "cappy",
-    "conservationist",
-    "8-balls",
-    "cosmological",
-    "erikson's",
-    "disaffiliate",
-    "individualizing",
-    "appoints",
-    "b-47",
-    "buss",
-    "natty",
-    "mongi",
-    "antelope",
-    "korneyev",
-    "goulding's",
-    "capet",
-    "0.15",
-    "237%",
-    "zionists",
-    "restriction",
-    "nagrin",
-    "variable-speed",
-    "gregory",
-    "fiercest",
-    "taxpayer",
-    "11",
-    "morocco",
-    "hertz",
-    "vicksburg",
-    "concentric",
-    "niccolo",
-    "25-ft.",
-    "akron",
-    "single-handedly",
-    "sawalisch",
-    "knowlton",
-    "discovery",
-    "han",
-    "not-ace",
-    "almanac",
-    "eduard",
-    "consonant",
-    "mainland",
-    "co-ops",
-    "stalin",
-    "repudiated",
-    "impatiently",
-    "innesfree",
-    "dusts",
-    "alamein",
-    "sub-interval",
-    "colvin's",
-    "marmi",
-    "muzo",
-    "manifold",
-    "single-barrel",
-    "f.b.i.",
-    "scatters",
-    "patterns",
-    "penny's",
-    "half-dozen",
-    "formulae",
-    "jones",
-    "winded",
-    "rousseau's",
-    "cooked-over",
-    "buckskins",
-    "borrowed",
-    "peoples",
-    "exquisite",
-    "gabardine",
-    "saturn",
-    "norell",
-    "heatedly",
-    "apologies",
-    "sw",
-    "commutator-like",
-    "alfresco",
-    "62-63",
-    "lecturer",
-    "clip",
-    "porgy",
-    "successors-in-spirit",
-    "messieurs",
-    "hugh",
-    "sahara",
-    "47.6",
-    "dulles's",
-    "deviance",
-    "metaphor",
-    "1970s",
-    "labile",
-    "seemed",
-    "talky",
-    "layers",
-    "beefsteak",
-    "redevelopment",
-    "traditionalist",
-    "long-keeping",
-    "manliness",
-    "exuded",
-    "possessing",
-    "breakfasts",
-    "semra",
-    "supposing",
-    "d'eiffel",
-    "smothering",
-    "bookings",
-    "doan",
-    "manipulating",
-    "slavic",
-    "rod",
-    "sabina",
-    "lecturing",
-    "inquiries",
-    "billy",
-    "dictated",
-    "critics'",
-    "inexperienced",
-    "2:05.2",
-    "panaceas",
-    "feathered",
-    "ghost",
-    "marcel",
-    "thumb-",
-    "baby-sitter",
-    "2,800",
-    "rotationally",
-    "387",
-    "possum-hunting",
-    "campaigned",
-    "disclaimer",
-    "thirteenth",
-    "simple",
-    "steinkerque",
-    "makeshifts",
-    "english-scottish-french",
-    "houses",
-    "compound-engine",
-    "hobday",
-    "repetitive",
-    "psychologically",
-    "fun-filled",
-    "90-degree",
-    "payment",
-    "mealtime",
-    "vitiates",
-    "yearly",
-    "7-4",
-    "fevered",
-    "ephesus",
-    "teens",
-    "pow",
-    "hewett",
-    "starred",
-    "driers",
-    "1601",
-    "$900",
-    "burned",
-    "khmer",
-    "5.3",
-    "tessie",
-    "curvature",
-    "contaminating",
-    "contractors'",
-    "ibm",
-    "bric-a-brac",
-    "fire",
-    "installing",
-    "half-turned",
-    "wasteful",
-    "law",
-    "burkette",
-    "unbeknownst",
-    "obedience",
-    "contributor",
-    "holding",
-    "asters",
-    "18-month",
-    "dentures",
-    "deadheads",
-    "clear-headed",
-    "lycidas",
-    "fused",
-    "lt.",
-    "12-1/2",
-    "sigemund",
-    "originates",
-    "familarity",
-    "service",
-    "unstable",
-    "harriman",
-    "knuckles",
-    "1607",
-    "representatives",
-    "additive",
-    "kick-off",
-    "washbasin",
-    "wher",
-    "uptake",
-    "compote",
-    "suburbia",
-    "cow's",
-    "slow-growing",
-    "must",
-    "arnold",
-    "agglomerate",
-    "79,400",
-    "titan",
-    "rainbow",
-    "diligent",
-    "bias",
-    "meekest",
-    "wolff's",
-    "recipe",
-    "concordance",
-    "swallowing",
-    "nearness",
-    "louse",
-    "populaires",
-    "repress",
-    "newton",
-    "subs",
-    "credentials",
-    "cadence",
-    "sprang",
-    "jr.",
-    "connecting",
-    "battle",
-    "pro-yankee",
-    "sha.",
-    "singly",
-    "mates",
-    "blues",
-    "lime",
-    "laundering",
-    "contributions",
-    "200-megaton",
-    "stem",
-    "rubbin'",
-    "manas",
-    "sampled",
-    "half-time",
-    "lou",
-    "racin'",
-    "perished",
-    "macropathological",
-    "athlete",
-    "counterattack",
-    "minimized",
-    "wacs",
-    "vaughan",
-    "fielded",
-    "gilbert",
-    "bulks",
-    "brucellosis",
-    "samuel",
-    "mirth",
-    "sublimed",
-    "freud's",
-    "carolina",
-    "reek",
-    "semi-conscious",
-    "thrives",
-    "renewing",
-    "'low",
-    "laudanum",
-    "coastal",
-    "grahamstown",
-    "corner-posts",
-    "muskadell",
-    "abortion",
-    "prior-year",
-    "james",
-    "half-crocked",
-    "looseness",
-    "abjection",
-    "alabamas",
-    "slavish",
-    "pamphlet",
-    "en-lai",
-    "before",
-    "profuse",
-    "mats",
-    "contours",
-    "hints",
-    "gutter",
-    "low-moisture",
-    "marcile",
-    "knuckle-duster",
-    "masking",
-    "necking",
-    "spinneret",
-    "macassar",
-    "skull",
-    "transatlantic",
-    "reprovingly",
-    "b",
-    "bilge",
-    "simplicitude",
-    "punks",
-    "myrrh",
-    "key-punched",
-    "grouped",
-    "morris'",
-    "outspread",
-    "37th",
-    "moon-splashed",
-    "volcanos",
-    "indebted",
-    "panel",
-    "questions",
-    "stranding",
-    "brag",
-    "amity",
-    "christ's",
-    "compensation",
-    "goings",
-    "t'jawn",
-    "two-fold",
-    "homogeneous",
-    "comrades",
-    "hampton",
-    "snoop",
-    "wilkes-barre",
-    "$84,000,000",
-    "deteriorated",
-    "testicular",
-    "mischievous",
-    "blithely",
-    "blitz",
-    "aspr",
-    "steiners",
-    "pons",
-    "piccadilly",
-    "toulouse-lautrec",
-    "bloodhounds",
-    "dustin'",
-    "vergessen",
-    "unbounded",
-    "holdings",
-    "hazlitt",
-    "obviousness",
-    "fox-hounds",
-    "lengthwise",
-    "unquestionable",
-    "mailing",
-    "handgun",
-    "harmonious",
-    "luxuries",
-    "sown",
-    "$2,557,111",
-    "barring",
-    "garb",
-    "ormoc",
-    "non-military",
-    "shatteringly",
-    "punch",
-    "manager's",
-    "sic",
-    "tickled",
-    "isabell",
-    "illustrious",
-    "potowomut",
-    "quasimodo's",
-    "lids",
-    "1875",
-    "marquette",
-    "shorts",
-    "chandelle",
-    "costlier",
-    "crosses",
-    "b-plane",
-    "consent",
-    "shan",
-    "headings",
-    "1688",
-    "modernization",
-    "hugging",
-    "vichy",
-    "nylon",
-    "cow",
-    "try",
-    "cooked",
-    "fawning",
-    "curtly",
-    "sub-tests",
-    "213",
-    "keys's",
-    "adherent",
-    "$12,192,865",
-    "celiac",
-    "enthrones",
-    "level's",
-    "buttocks",
-    "lucille",
-    "travancore",
-    "1800's",
-    "middles",
-    "eddy",
-    "neon",
-    "jemela",
-    "jerebohm",
-    "stasis",
-    "obtained",
-    "amendment's",
-    "technologically",
-    "resin",
-    "articulation",
-    "coolest",
-    "julius",
-    "topped",
-    "mat",
-    "**yc",
-    "chalmers",
-    "eardrums",
-    "awarded",
-    "mew",
-    "pungency",
-    "survey-type",
-    "mispronunciation",
-    "sheriff",
-    "interrelations",
-    "gospel",
-    "paw",
-    "wall-switch",
-    "reinforces",
-    "register",
-    "polyisocyanate",
-    "election",
-    "delayed",
-    "staple",
-    "inn",
-    "trademark",
-    "contributes",
-    "update",
-    "cattle-car",
-    "compositions",
-    "7-passenger",
-    "formally",
-    "haruo",
-    "$22.50",
-    "2825",
-    "fountain-head",
-    "inter-plant",
-    "ingested",
-    "likee",
-    "availed",
-    "fallacy",
-    "where'd",
-    "paralleling",
-    "summarize",
-    "prettier",
-    "somebody'll",
-    "daughter's",
-    "segregationist",
-    "8th",
-    "dummy",
-    "manzanita",
-    "cladding",
-    "valentine",
-    "toynbee",
-    "sobbed",
-    "nonfunctional",
-    "petting",
-    "1630",
-    "brochure",
-    "cowrtiers",
-    "detroit",
-    "preoccupied",
-    "charlie's",
-    "gird",
-    "chirping",
-    "globetrotter",
-    "doll",
-    "self-consistent",
-    "canvass",
-    "domes",
-    "lieu",
-    "hijacked",
-    "hick",
-    "heated",
-    "essentials",
-    "mm.",
-    "grammatical",
-    "commonwealths",
-    "preserve",
-    "portal",
-    "recapitulation",
-    "belt-driven",
-    "putas",
-    "phyla",
-    "ironies",
-    "state",
-    "disunited",
-    "aggregation",
-    "daley",
-    "agent's",
-    "c-plane",
-    "cen-tennial",
-    "disappears",
-    "telephone-booth",
-    "420",
-    "sworde",
-    "saintliness",
-    "sinner",
-    "show-down",
-    "coward's",
-    "160-ml.",
-    "neighbours",
-    "32",
-    "dominated",
-    "evolution",
-    "couldn't",
-    "boycott",
-    "bluestocking",
-    "skidding",
-    "l'",
-    "glycosides",
-    "3.10",
-    "swartz",
-    "bright's",
-    "6124",
-    "atrophied",
-    "stunk",
-    "furs",
-    "aparicio",
-    "sun-tan",
-    "upturn",
-    "stabilizing",
-    "time-&-motion",
-    "split-level",
-    "seized",
-    "residential",
-    "reduces",
-    "del.",
-    "entrusted",
-    "gennaro",
-    "acculturated",
-    "momentum",
-    "pasted",
-    "aaawww",
-    "confuse",
-    "inclosed",
-    "bedford",
-    "nastier",
-    "enthusiasts",
-    "projections",
-    "loeser",
-    "poppies",
-    "jeweled",
-    "false",
-    "likely",
-    "scrimmage",
-    "krauts",
-    "luminescent",
-    "backstairs",
-    "rickards",
-    "rotonda",
-    "pathways",
-    "eight-bar",
-    "bucket-shop",
-    "knitting",
-    "reveling",
-    "15,000",
-    "teething",
-    "perasso",
-    "rd.",
-    "kv",
-    "collimated",
-    "himselfe",
-    "d'etat",
-    "minifying",
-    "herford",
-    "confessor",
-    "elections",
-    "delegation",
-    "worthless",
-    "10-o'clock",
-    "accompanist",
-    "hypo-",
-    "construe",
-    "relaxed",
-    "sr",
-    "houghton's",
-    "sampson",
-    "moise",
-    "splashy",
-    "reinforcements",
-    "repeatedly",
-    "sparing",
-    "litowski",
-    "broad-nibbed",
-    "slanderer",
-    "brenner",
-    "omelet",
-    "slid",
-    "peppery",
-    "exclusive",
-    "afoot",
-    "controllers",
-    "featherbedding",
-    "expense",
-    "perforated",
-    "systemic",
-    "laden",
-    "invulnerable",
-    "amphibology",
-    "drive",
-    "height",
-    "littlepage",
-    "36-a",
-    "hajime",
-    "thirtieth",
-    "stoic-patristic",
-    "four-element",
-    "fair's",
-    "ample",
-    "laundered",
-    "judeo-christian",
-    "tactually",
-    "hyperplasia",
-    "outsider",
-    "versatile",
-    "spotlights",
-    "distance",
-    "dramatists",
-    "mentor",
-    "altercation",
-    "oedipus",
-    "1832",
-    "prentiss'",
-    "sprays",
-    "salesmen",
-    "stereophonic",
-    "63d",
-    "ionosphere",
-    "worn",
-    "twenty-fifth",
-    "certify",
-    "mannerism",
-    "beef",
-    "pungent",
-    "windup",
-    "jewishness",
-    "bowed",
-    "pier",
-    "neusteter",
-    "old-fashioned",
-    "old-line",
-    "tawes",
-    "vivaldi",
-    "redecoration",
-    "wife",
-    "disbelieve",
-    "communicator",
-    "criticized",
-    "boonton",
-    "dive",
-    "ambiguities",
-    "inescapable",
-    "peddled",
-    "export-import",
-    "latch",
-    "over/under",
-    "blustered",
-    "focuses",
-    "pondering",
-    "essentially",
-    "pressures",
-    "payday",
-    "admire",
-    "regiment",
-    "radiography",
-    "smoothing",
-    "alterman",
-    "harmonies",
-    "congenial",
-    "leninism-marxism",
-    "armageddon",
-    "handhold",
-    "bellows",
-    "completes",
-    "3-7/8",
-    "inactivation",
-    "385",
-    "six-dollar",
-    "verdict",
-    "fishmongers",
-    "prophecy",
-    "brackets",
-    "feverishly",
-    "curly",
-    "detestation",
-    "copernicus",
-    "durlach",
-    "biologists",
-    "comb",
-    "$58,918",
-    "letch",
-    "orthorhombic",
-    "non-productive",
-    "72-hole",
-    "leyte",
-    "braweling",
-    "fineness",
-    "spooned",
-    "kelly",
-    "concerned",
-    "subsection",
-    "libelous",
-    "2:21",
-    "443",
-    "rushes",
-    "commodore",
-    "tsh",
-    "upper-class",
-    "gossamer",
-    "$.12",
-    "unseemly",
-    "dufresne",
-    "aid-to-education",
-    "uncomforted",
-    "pin-curl",
-    "lowe's",
-    "subtends",
-    "endeavors",
-    "$.75",
-    "readers",
-    "rhode",
-    "abstracted",
-    "hazel",
-    "medics",
-    "silke",
-    "substantive",
-    "mil.",
-    "farthest",
-    "kenning",
-    "uncanny",
-    "maximilian",
-    "steadiness",
-    "chattering",
-    "onrushing",
-    "376",
-    "hard-to-please",
-    "ambulatory",
-    "subconscious",
-    "burr",
-    "theatergoing",
-    "lillian",
-    "considerate",
-    "patches",
-    "forerunner",
-    "wrinkles",
-    "holders",
-    "discourteous",
-    "replaces",
-    "1589",
-    "riflemen's",
-    "galen",
-    "spada",
-    "facetious",
-    "diversification",
-    "lop",
-    "cohesive",
-    "anti-christian",
-    "armpits",
-    "puzzlement",
-    "540",
-    "roy",
-    "0.36",
-    "honest",
-    "fence-line",
-    "operation",
-    "$350",
-    "humming",
-    "honeysuckle",
-    "rimmed",
-    "sor'l",
-    "me'a",
-    "9329",
-    "father",
-    "delirium",
-    "52-year-old",
-    "montreux",
-    "breaker",
-    "inharmonious",
-    "wrought-iron",
-    "infer",
-    "duplex",
-    "external",
-    "other-directed",
-    "uninterruptedly",
-    "stragglers",
-    "tiger's",
-    "workman's",
-    "patent-sharing",
-    "resifted",
-    "felix",
-    "severalty",
-    "analytically",
-    "humidity",
-    "pope",
-    "stifle",
-    "infested",
-    "sotun",
-    "halls",
-    "non-artistic",
-    "levers",
-    "presentments",
-    "invented",
-    "navigators",
-    "compatible",
-    "devery",
-    "complementing",
-    "1799",
-    "proximal",
-    "healthy",
-    "waxen",
-    "chip-o's",
-    "miter",
-    "cu",
-    "tangency",
-    "krakow",
-    "brassica",
-    "london-bred",
-    "yalta",
-    "caveat",
-    "lockian",
-    "doesn't",
-    "unclear",
-    "11-18",
-    "redirect",
-    "ensures",
-    "outbreaks",
-    "three-round",
-    "hogan",
-    "thidiu",
-    "hughes",
-    "writhe",
-    "gauer",
-    "author",
-    "strange-sounding",
-    "meinckian",
-    "depressed",
-    "begs",
-    "personification",
-    "indefinity",
-    "blackout",
-    "digested",
-    "muscovy",
-    "usages",
-    "stepchild",
-    "legislation",
-    "zwei",
-    "numerological",
-    "cosmopolitan",
-    "subdue",
-    "igbo",
-    "negligent",
-    "lacerations",
-    "burle",
-    "sumter",
-    "203",
-    "insists",
-    "mc/sec",
-    "silicon",
-    "colonel's",
-    "26.8",
-    "resorted",
-    "patricia",
-    "domina",
-    "milliamperes/cell",
-    "ketchup",
-    "reoriented",
-    "butterfat",
-    "aw",
-    "serpents",
-    "stowed",
-    "squirms",
-    "alusik",
-    "prostate",
-    "12",
-    "birdbath",
-    "mink",
-    "stranger's",
-    "steroid",
-    "x-ray",
-    "18e",
-    "pioneer",
-    "leger",
-    "potatoes",
-    "weight",
-    "salvo",
-    "jade-handled",
-    "cotillion",
-    "carrel",
-    "amino",
-    "schillinger",
-    "place-kicker",
-    "char",
-    "felonious",
-    "stephanotis",
-    "games",
-    "observers",
-    "fullback",
-    "education",
-    "purposefully",
-    "grevouselye",
-    "twenty-five-year-old",
-    "harpsichord",
-    "rookie-of-the-year",
-    "horatio's",
-    "assignments",
-    "cells",
-    "guanidine",
-    "asme",
-    "disneyland",
-    "quartz",
-    "rotund",
-    "testings",
-    "607-608",
-    "sterilizing",
-    "particularity",
-    "pseudo-glamorous",
-    "intial",
-    "bull-roaring",
-    "mmm",
-    "directorship",
-    "fund-raising",
-    "redress",
-    "'40's",
-    "bar'l",
-    "distinctively",
-    "agreeableness",
-    "spiritual",
-    "shoreline",
-    "symphony",
-    "anemic",
-    "tangere",
-    "conductor's",
-    "succeeds",
-    "simplest",
-    "harmony",
-    "sibilant",
-    "ingeniously",
-    "aridity",
-    "exemption",
-    "jew-haters",
-    "encounter",
-    "torrid-breeze",
-    "thor",
-    "minister's",
-    "voltaic",
-    "thankfulness",
-    "november-december",
-    "cruelest",
-    "dijon",
-    "underpinning",
-    "preston",
-    "scotchgard",
-    "tel",
-    "pathological",
-    "lethargy",
-    "nibble",
-    "crawls",
-    "leader's",
-    "colds",
-    "admired",
-    "self-unloading",
-    "makes",
-    "chieftains",
-    "questionnaire",
-    "susan's",
-    "muted",
-    "thumbed",
-    "resort",
-    "cock",
-    "minus",
-    "unpack",
-    "kentuck'",
-    "emissary",
-    "dialyzed",
-    "2,800,000",
-    "bobby",
-    "corp",
-    "chockfull",
-    "bartender",
-    "surrounding",
-    "2:00.2",
-    "269",
-    "sx-21",
-    "etiquette",
-    "telephones",
-    "collie",
-    "clues",
-    "1883",
-    "italicized",
-    "gangway",
-    "detention",
-    "cole's",
-    "chronicles",
-    "edward",
-    "dialects",
-    "mild-mannered",
-    "constraining",
-    "disqualified",
-    "shouldered",
-    "copeland",
-    "alphonse",
-    "blunders",
-    "whitey",
-    "dowager",
-    "indo-china",
-    "telegram",
-    "needham",
-    "predicator",
-    "not-so-lonely",
-    "snobbery",
-    "ballet",
-    "easy-to-reach",
-    "hits",
-    "tung",
-    "room's",
-    "polymerizations",
-    "scurvy",
-    "revenuers",
-    "communicating",
-    "divine",
-    "creatures",
-    "1632",
-    "categories",
-    "lower-level",
-    "overhangs",
-    "athleticism",
-    "washizu's",
-    "believing",
-    "stumped",
-    "semantically",
-    "adventuring",
-    "pandemic",
-    "deformational",
-    "jana",
-    "patriarchy",
-    "belonging",
-    "classrooms",
-    "stidger",
-    "buffoon",
-    "catholicism",
-    "gazing",
-    "play-acting",
-    "monitoring",
-    "laotian",
-    "strengths",
-    "technical",
-    "unheard",
-    "testify",
-    "numerically",
-    "electrical",
-    "muslims",
-    "tahiti",
-    "leering",
-    "jesus's",
-    "50th",
-    "purified",
-    "48,500",
-    "brookmeyer's",
-    "push-ups",
-    "garden",
-    "municipality's",
-    "clarke",
-    "biopsies",
-    "cesare",
-    "roman",
-    "anderson's",
-    "perfection",
-    "workman",
-    "vampires",
-    "geometric",
-    "bomb",
-    "180",
-    "non-negative",
-    "43*0c",
-    "fluorine",
-    "half-acre",
-    "1665",
-    "paralyze",
-    "men",
-    "orthophosphate",
-    "essex",
-    "misconstruction",
-    "conpired",
-    "helen",
-    "researches",
-    "god's",
-    "elapse",
-    "525",
-    "a.m.a.",
-    "confluent",
-    "depression",
-    "takeoffs",
-    "434",
-    "shirl",
-    "food-preservation",
-    "368(a)(1)",
-    "boaters",
-    "profession",
-    "completely",
-    "correspondents",
-    "leopards",
-    "asians",
-    "foreseeing",
-    "experts",
-    "unaccountably",
-    "jesus'",
-    "tattooed",
-    "amortize",
-    "glazer-fine",
-    "soldiers'",
-    "profoundly",
-    "head-in-the-clouds",
-    "'stead",
-    "undertakes",
-    "respirators",
-    "lexicostatistics",
-    "havisham's",
-    "101b",
-    "hammarskjold",
-    "decency",
-    "sashayed",
-    "maggoty",
-    "gnp",
-    "morphemic",
-    "resistor",
-    "pedal",
-    "unhook",
-    "buckhannon",
-    "whipping-boys",
-    "admirable",
-    "ziggy",
-    "once-over",
-    "woonsocket",
-    "speed",
-    "configuration",
-    "pacta",
-    "deloused",
-    "markets",
-    "watchings",
-    "yokel",
-    "cambridgeport",
-    "nato's",
-    "worsened",
-    "winchell",
-    "advocating",
-    "stumbling",
-    "belligerently",
-    "ozone",
-    "matson",
-    "jail",
-    "byinge",
-    "mediaevalist",
-    "principia",
-    "infants",
-    "swampy",
-    "expenses",
-    "kriss",
-    "plane",
-    "msec.",
-    "hypophyseal",
-    "soggy",
-    "vow",
-    "entropy",
-    "good",
-    "measure",
-    "pictorially",
-    "sickly-tolerant",
-    "suddenness",
-    "shims",
-    "mouldering",
-    "scapegoats",
-    "picks",
-    "half-gourd",
-    "ethicist",
-    "fitzhugh",
-    "yelp",
-    "coquette",
-    "correspondence",
-    "descend",
-    "half-brother",
-    "jangling",
-    "persecution",
-    "call",
-    "30,000",
-    "staminate",
-    "amendment",
-    "printmaking",
-    "annual",
-    "preparatory",
-    "inflation",
-    "querulous",
-    "vale",
-    "avon",
-    "hilarious",
-    "reenact",
-    "punched",
-    "virtuoso",
-    "harrows",
-    "marchin'",
-    "inasmuch",
-    "fifteenth-century",
-    "shop",
-    "steering",
-    "hazards",
-    "n-trial",
-    "non-success",
-    "dripped",
-    "rome",
-    "exhibition",
-    "yokels",
-    "outwit",
-    "frenchmen",
-    "prosecutor",
-    "unsophisticated",
-    "eliot-or-martin",
-    "celebrities",
-    "far-sighted",
-    "ruggedly",
-    "roadblock",
-    "k",
-    "christmas-season",
-    "morally",
-    "address",
-    "proportion",
-    "inconsistencies",
-    "anarchic",
-    "dazzles",
-    "credibly",
-    "sophisticates",
-    "600-degrees",
-    "underlay",
-    "salubrious",
-    "westward",
-    "primacy",
-    "seismic",
-    "melodies",
-    "drank",
-    "bea",
-    "truthfully",
-    "brambles",
-    "glazing",
-    "missive",
-    "bedbugs",
-    "synonyms",
-    "bonfire",
-    "wads",
-    "alsing",
-    "regulate",
-    "losing",
-    "preferentially",
-    "hovel",
-    "stockhausen",
-    "beacon",
-    "artfulness",
-    "irksome",
-    "unheeding",
-    "skiddy",
-    "crystallite",
-    "c.",
-    "pharmacy",
-    "enmeshed",
-    "readying",
-    "aristotelian",
-    "spot-promoted",
-    "bonzes",
-    "mayorship",
-    "tracers",
-    "india's",
-    "beginning",
-    "porcelain",
-    "ffreind",
-    "burgeoned",
-    "encroached",
-    "dislodged",
-    "fleets",
-    "cauliflower",
-    "partake",
-    "meredith's",
-    "picon",
-    "suffocating",
-    "kebob",
-    "dolls",
-    "woodwards",
-    "furnace's",
-    "corollaries",
-    "blutwurst",
-    "seaquarium",
-    "endearing",
-    "bee-hunter",
-    "madison's",
-    "riding",
-    "recreate",
-    "insects",
-    "manmade",
-    "colors",
-    "injured",
-    "hardship",
-    "ever-changing",
-    "buckley",
-    "costing",
-    "assimilated",
-    "kai-shek's",
-    "trans-illumination",
-    "enslaving",
-    "varnessa",
-    "whipsnade",
-    "saadi",
-    "153",
-    "senile",
-    "milligram",
-    "discarded",
-    "mesa",
-    "boston",
-    "favre",
-    "sexually",
-    "ethan",
-    "tuesday's",
-    "whoop",
-    "nixon",
-    "dares",
-    "malformations",
-    "bonnie",
-    "henpecked",
-    "kernel",
-    "conrad",
-    "sut",
-    "comminge",
-    "tame",
-    "boys'",
-    "scholastica",
-    "incisive",
-    "cosy",
-    "college-oriented",
-    "coins",
-    "oder",
-    "doerner's",
-    "network's",
-    "cancers",
-    "tartarughe",
-    "400-pound",
-    "now-misplaced",
-    "royalty-free",
-    "showmanship",
-    "tariff-free",
-    "condemned",
-    "dauphin",
-    "stockpiling",
-    "nitrogen-mustard",
-    "awards",
-    "authentications",
-    "butyl-lithium",
-    "bellhops",
-    "shave",
-    "8-mm",
-    "faucet",
-    "sequence",
-    "step",
-    "optional",
-    "lotte",
-    "'emselves",
-    "test",
-    "marenzio",
-    "thorn",
-    "scouted",
-    "gourmet",
-    "herded",
-    "bobby-soxer",
-    "shapes",
-    "lay-sisters",
-    "mannered",
-    "24th",
-    "matriarchal",
-    "healing",
-    "wolde",
-    "pinned",
-    "broome",
-    "31",
-    "arching",
-    "non-sentimental",
-    "lyle",
-    "cylindrical",
-    "121,000",
-    "hoarseness",
-    "defined",
-    "archaeologists",
-    "rascals",
-    "crazing",
-    "di",
-    "woomera",
-    "cedar-roofed",
-    "grudgingly",
-    "reopened",
-    "plastic",
-    "weatherproof",
-    "monet",
-    "session",
-    "unformed",
-    "thesis",
-    "brawl",
-    "accordion",
-    "cotton",
-    "yelped",
-    "scrape",
-    "clark",
-    "furiously",
-    "salk",
-    "coolnesses",
-    "sofar",
-    "gallants",
-    "discoid",
-    "diva",
-    "octoroon",
-    "ebbetts",
-    "hockey",
-    "institutes",
-    "feasibility",
-    "propagate",
-    "franny",
-    "maurine",
-    "obtainable",
-    "60-day",
-    "sentiment",
-    "khaju",
-    "wardrobe",
-    "tulln",
-    "cured",
-    "desegregation",
-    "ticket",
-    "nichtige",
-    "pratt's",
-    "ration",
-    "knowing",
-    "digressions",
-    "weeded",
-    "snowballs",
-    "vengeance",
-    "slipstream",
-    "soloviev-sedoi",
-    "wraith-like",
-    "antihistorical",
-    "hegelian",
-    "c'mon",
-    "451",
-    "85%",
-    "impurity",
-    "admonishments",
-    "satellites",
-    "strawberries",
-    "safer",
-    "exuberantly",
-    "sociologist",
-    "heating",
-    "1:00",
-    "waddell",
-    "undimmed",
-    "remembers",
-    "fluctuates",
-    "flirted",
-    "kqed",
-    "elegies",
-    "brae",
-    "stramonium",
-    "opprobrium",
-    "bear",
-    "calendars",
-    "manipulation",
-    "coverage",
-    "howard's",
-    "ailey",
-    "wilkey",
-    "virginians",
-    "1/16''",
-    "pee",
-    "coombs",
-    "morose",
-    "mumble",
-    "breastworks",
-    "p.ga",
-    "brake",
-    "coachman",
-    "legibility",
-    "cherish",
-    "reviewing",
-    "sansom",
-    "wage-price",
-    "barbs",
-    "compleated",
-    "pavements",
-    "ottoman",
-    "cried",
-    "ayes",
-    "assessments",
-    "dillinger",
-    "rifleman",
-    "guidelines",
-    "hoped-for",
-    "duffel",
-    "tikopia",
-    "religionists",
-    "bosphorus",
-    "danseur",
-    "definitions",
-    "adjoining",
-    "leathers",
-    "bulletin",
-    "waco",
-    "deep-tendon",
-    "blew",
-    "dream-next",
-    "such",
-    "rumbled",
-    "hockaday",
-    "13-1/2",
-    "y.w.c.a.",
-    "ornament",
-    "churned",
-    "respondent",
-    "vivify",
-    "elbow",
-    "charting",
-    "arkansas",
-    "zorrillas",
-    "hears",
-    "trellises",
-    "sure-sure",
-    "creativity-oriented",
-    "nobler",
-    "notoriety",
-    "blackness",
-    "vortex",
-    "groves",
-    "hatteras",
-    "servo",
-    "forbids",
-    "deceit's",
-    "work-weary",
-    "polyesters",
-    "conservation",
-    "notebook",
-    "limbo",
-    "2:31",
-    "assignee",
-    "crump",
-    "throwed",
-    "watershed",
-    "guide's",
-    "surprise",
-    "r.a.f.",
-    "8-channel",
-    "precarious",
-    "dineen",
-    "mounted",
-    "invisible",
-    "locker-room",
-    "epsilon",
-    "rouge",
-    "racine",
-    "meltzer's",
-    "distinctions",
-    "costive",
-    "wrap",
-    "windham",
-    "neocortex",
-    "sly",
-    "blowup",
-    "exterior",
-    "42-degrees-f.",
-    "argentina",
-    "remarks",
-    "conjugates",
-    "thaddeus",
-    "recommend",
-    "ommission",
-    "cakes",
-    "anatomic",
-    "television-electronics",
-    "cromwell",
-    "swap",
-    "morikawa",
-    "skyjackers",
-    "entrepreneurs",
-    "watered",
-    "sulfide",
-    "londonderry",
-    "laurel",
-    "estherson",
-    "boyer",
-    "beyeler",
-    "seizing",
-    "marshal's",
-    "strait-laced",
-    "better",
-    "ribes",
-    "avidly",
-    "substantiation",
-    "danzig",
-    "royce",
-    "onset",
-    "differences",
-    "cameramen",
-    "cobb",
-    "finger-post",
-    "titular",
-    "rule",
-    "worst-marked",
-    "overheated",
-    "subjectivist",
-    "bevel",
-    "stall",
-    "drive-in",
-    "rosburg",
-    "depressions",
-    "l'turu",
-    "lighted",
-    "273",
-    "parkish",
-    "ornately",
-    "impudence",
-    "1745",
-    "parthenon",
-    "countin'",
-    "dull-gray",
-    "59,780",
-    "391",
-    "dabbled",
-    "prompts",
-    "neglecting",
-    "edward's",
-    "half-expressed",
-    "stand",
-    "gaiety",
-    "oils",
-    "rousseauan",
-    "hernandez",
-    "bodybuilders",
-    "neiman-marcus",
-    "semi-autonomous",
-    "maximize",
-    "1720",
-    "hypostatization",
-    "anglican",
-    "chablis",
-    "uncomfortably",
-    "argiento",
-    "1939",
-    "refine",
-    "parlor",
-    "marina",
-    "macisaacs",
-    "tong",
-    "prandtl",
-    "wycliffe",
-    "circumscribing",
-    "orvil",
-    "epistles",
-    "slab",
-    "nitroglycerine",
-    "haydn's",
-    "anti-a",
-    "low-budget",
-    "ego-adaptive",
-    "zooming",
-    "envoys",
-    "d'artaguette",
-    "navy's",
-    "drury",
-    "mcquillan",
-    "exhaled",
-    "swellings",
-    "ileum",
-    "volumes",
-    "ex-mayor",
-    "acclaims",
-    "sapped",
-    "clairaudiently",
-    "wonderingly",
-    "avaliable",
-    "ito",
-    "scimitar-wielding",
-    "almost",
-    "faked",
-    "subsidiaries",
-    "swastika",
-    "reifenrath",
-    "100-yard",
-    "hanover-justitia",
-    "simplex",
-    "throne",
-    "11.2",
-    "lacey",
-    "warys",
-    "1845",
-    "brynge",
-    "bergson",
-    "straps",
-    "over-achievement",
-    "sacking",
-    "neighbourhood",
-    "expedition",
-    "wing-shooting",
-    "clock",
-    "$8.5",
-    "record-tying",
-    "recommended",
-    "ecstasy",
-    "825,000",
-    "oases",
-    "avenging",
-    "half-past",
-    "tending",
-    "sonnet",
-    "instant's",
-    "musn't",
-    "revolts",
-    "$3,000",
-    "glass-fiber",
-    "algebra",
-    "aggression",
-    "built-in",
-    "accompany",
-    "disorganization",
-    "wider",
-    "long-sleeved",
-    "muscular",
-    "brown's",
-    "dufresne's",
-    "restatement",
-    "affied",
-    "15-20",
-    "interned",
-    "watling",
-    "priorities",
-    "worms",
-    "pt.",
-    "1959",
-    "kooning",
-    "carelessly",
-    "impudent",
-    "animal",
-    "harriet's",
-    "group",
-    "evaporative",
-    "buildup",
-    "dealer's",
-    "trackless",
-    "dignify",
-    "starched",
-    "emulated",
-    "spineless",
-    "resign",
-    "study",
-    "eye-to-eye",
-    "choral",
-    "meg",
-    "gazelle",
-    "3mm",
-    "radiant",
-    "t-34",
-    "extremis",
-    "over-occupied",
-    "warns",
-    "condemning",
-    "elba",
-    "mouths",
-    "winsome",
-    "haflis",
-    "electra",
-    "steak",
-    "sometime",
-    "emeralds",
-    "**yf",
-    "bait",
-    "dregs",
-    "orchards",
-    "rejoining",
-    "docile",
-    "conventionally",
-    "vile",
-    "guys",
-    "zaporogian",
-    "weaver",
-    "categorized",
-    "thrombosed",
-    "per-day",
-    "conformist",
-    "polybutenes",
-    "endow",
-    "realized",
-    "casino",
-    "$1.9",
-    "five-hundred",
-    "mall",
-    "well-received",
-    "insinuations",
-    "fair-weather",
-    "unequally",
-    "$450,000",
-    "gift",
-    "thatched-roof",
-    "died",
-    "perfumes",
-    "tipped",
-    "out-group",
-    "unarmed",
-    "controls",
-    "freedom",
-    "imposition",
-    "portended",
-    "reassemble",
-    "hytt",
-    "reach",
-    "lura",
-    "savannakhet",
-    "jameson",
-    "parted",
-    "detachable",
-    "unsavory",
-    "traitors",
-    "spectacularly",
-    "1/16",
-    "torquer",
-    "actress",
-    "seating",
-    "possessive",
-    "eros",
-    "banning",
-    "ill-prepared",
-    "featureless",
-    "nuisances",
-    "balances",
-    "nonagricultural",
-    "roslev",
-    "crooning",
-    "half-swamped",
-    "campaigns",
-    "fm",
-    "glazed",
-    "doorkeeper",
-    "ameaux",
-    "neighbors",
-    "traceable",
-    "0.001",
-    "crook",
-    "philosophically",
-    "reunions",
-    "'50",
-    "topographic",
-    "hulking",
-    "operates",
-    "inheritors",
-    "machado",
-    "shuffle",
-    "thievin",
-    "discounting",
-    "detriment",
-    "avail",
-    "denomination's",
-    "gal",
-    "bundle",
-    "mets",
-    "slammed",
-    "pershing",
-    "firm's",
-    "187-mile",
-    "veblen",
-    "rattling",
-    "residents",
-    "master's",
-    "enjoyable",
-    "soviet-chinese",
-    "plows",
-    "glide-bombed",
-    "uninvited",
-    "crank",
-    "briggs",
-    "possemen",
-    "gassy",
-    "critically",
-    "1887",
-    "vincent",
-    "savage",
-    "crawlspace",
-    "satiric",
-    "owne",
-    "shepherd",
-    "subsoil",
-    "low-ceilinged",
-    "snaked",
-    "take-off",
-    "curative",
-    "fields",
-    "renovated",
-    "rhythmically",
-    "buaford",
-    "adjourning",
-    "next",
-    "vegetation",
-    "wedded",
-    "calling",
-    "right-of-entry",
-    "hawkins",
-    "carr",
-    "fermentation",
-    "carryovers",
-    "prowazwki",
-    "producer-hubby",
-    "arterioles",
-    "guar",
-    "coolly",
-    "damon",
-    "dividing",
-    "co-operated",
-    "finland",
-    "sackes",
-    "network",
-    "tojos",
-    "configurations",
-    "somersaults",
-    "inviolability",
-    "pulley",
-    "nymphs",
-    "midwestern",
-    "thutmose",
-    "wars",
-    "189",
-    "brod",
-    "$40,000",
-    "demented",
-    "representations",
-    "pietro",
-    "maccabeus",
-    "problematical",
-    "so-far",
-    "lothario",
-    "doe",
-    "cow-man",
-    "relevancy",
-    "stimulates",
-    "parallel",
-    "lex",
-    "white-suited",
-    "revolving",
-    "etudes",
-    "headless",
-    "shalom",
-    "joblot",
-    "rainless",
-    "motoring",
-    "fed",
-    "full-grown",
-    "impresses",
-    "extinguish",
-    "geneva",
-    "expe",
-    "ten-gallon",
-    "julia",
-    "jordan",
-    "purchaser's",
-    "sure",
-    "storms",
-    "deluding",
-    "cord",
-    "english-born",
-    "900",
-    "capricorn",
-    "tyburn",
-    "pinning",
-    "fussy",
-    "sacrificing",
-    "drove",
-    "left-front",
-    "gnawed",
-    "sensory",
-    "$90",
-    "fundamental",
-    "outspoken",
-    "scientific",
-    "baths",
-    "loan",
-    "dragoslav",
-    "silken",
-    "judy",
-    "hoxa",
-    "concordant",
-    "missail",
-    "memory",
-    "retardation",
-    "attractively",
-    "stricken",
-    "yanks'",
-    "enterprisingly",
-    "haven't",
-    "buggies",
-    "conduction",
-    "camelot",
-    "basketball-playing",
-    "edythe",
-    "eosinophilic",
-    "shaving",
-    "tore",
-    "airedale",
-    "non-comparable",
-    "counseled",
-    "3.8",
-    "depositors",
-    "flowers",
-    "43*0",
-    "siding",
-    "$184",
-    "silas",
-    "binders",
-    "surface-analyzer",
-    "easiest",
-    "contradict",
-    "platonist",
-    "kivu",
-    "please",
-    "links",
-    "purposed",
-    "high-velocity",
-    "1943",
-    "deformities",
-    "handlers'",
-    "radiator",
-    "rey",
-    "delphic",
-    "beast",
-    "troupe",
-    "itch",
-    "cubes",
-    "dunk",
-    "bit-like",
-    "127",
-    "regimen",
-    "windows",
-    "illuminating",
-    "smoke",
-    "augustin",
-    "jag",
-    "flowing",
-    "tempo",
-    "exec",
-    "oscillation",
-    "payments",
-    "bengal",
-    "renouncing",
-    "gallbladder",
-    "aghast",
-    "untouched",
-    "establishment",
-    "thimble-sized",
-    "systeme",
-    "battenkill",
-    "danville",
-    "carnegie-illinois",
-    "enactment",
-    "athlete's",
-    "maitland",
-    "1822",
-    "water-holding",
-    "grande-bretagne",
-    "shape",
-    "librarian-board",
-    "boxcar",
-    "soxhlet",
-    "jastrow",
-    "shiflett",
-    "sturley",
-    "startups",
-    "campo",
-    "atlantis",
-    "uniquely",
-    "lathe",
-    "imagining",
-    "imperfectly",
-    "gander",
-    "meals",
-    "character-education",
-    "amoral",
-    "sizzle",
-    "da",
-    "fluxes",
-    "friedenwald",
-    "viable",
-    "sculpture",
-    "exercising",
-    "choices",
-    "marksman's",
-    "fox's",
-    "beautifully-built",
-    "rigors",
-    "wimsatt",
-    "way's",
-    "optimism",
-    "berea",
-    "hindrances",
-    "norberg",
-    "wart-hog",
-    "campus",
-    "this'll",
-    "holstein",
-    "pedersen's",
-    "fright",
-    "corrupter",
-    "russell's",
-    "that'll",
-    "taras",
-    "empty",
-    "republicans'",
-    "dress",
-    "pioneering",
-    "juet",
-    "nickname",
-    "ferret",
-    "subcontracting",
-    "ariz.",
-    "logarithm",
-    "spoken",
-    "hunk",
-    "und",
-    "enmity",
-    "presidents",
-    "philippines",
-    "artifice",
-    "libyan",
-    "nubbins",
-    "$10,000",
-    "retailing",
-    "deadliness",
-    "taxpaying",
-    "walloped",
-    "pavlovsky",
-    "twice-around",
-    "beer",
-    "wasn't",
-    "preaches",
-    "saffron",
-    "confidante",
-    "crane",
-    "overwhelm",
-    "gins",
-    "schonberg",
-    "enroll",
-    "crunch",
-    "germanized",
-    "crests",
-    "sixth-grade",
-    "$600",
-    "sensibilities",
-    "critics",
-    "chesterton",
-    "pans",
-    "garde",
-    "1.8",
-    "covenant",
-    "providence's",
-    "bed-hopped",
-    "sharpness",
-    "vindictive",
-    "perky",
-    "escutcheon",
-    "sleight",
-    "rhine-westphalia",
-    "wheare",
-    "coulomb",
-    "lemon-meringue",
-    "howsabout",
-    "campuses",
-    "corrosive",
-    "morley",
-    "ernie",
-    "maximizing",
-    "14-term",
-    "haumd",
-    "planned",
-    "overconfident",
-    "merging",
-    "shod",
-    "jackson",
-    "tunes",
-    "follow-ups",
-    "monosyllable",
-    "rev's",
-    "afro-asian",
-    "sydney",
-    "precautionary",
-    "safe-driving",
-    "lautner",
-    "half-swimming",
-    "alienation",
-    "520-acre",
-    "repressive",
-    "newbury",
-    "forsythe",
-    "choked",
-    "disseminating",
-    "my",
-    "visa",
-    "domi",
-    "diverted",
-    "benevolent",
-    "choruses",
-    "cults",
-    "7/2",
-    "willett",
-    "chins",
-    "1797",
-    "riverview",
-    "lobules",
-    "miracles",
-    "embarcadero",
-    "naught",
-    "bookers",
-    "thinke",
-    "turtleneck",
-    "air-cell",
-    "rentals",
-    "volta's",
-    "somebody",
-    "desecration",
-    "dimly",
-    "convict's",
-    "rim-fire",
-    "24,400",
-    "clearing",
-    "xenon",
-    "firma",
-    "incontrovertible",
-    "ninety-five",
-    "oilers",
-    "prank",
-    "obscurities",
-    "trotter",
-    "flustered",
-    "bribe",
-    "attributes",
-    "impressionists",
-    "reproductive",
-    "town",
-    "compromised",
-    "goat",
-    "afterwards",
-    "affront",
-    "jehovah",
-    "ex-convict",
-    "cooperates",
-    "ringside",
-    "compacts",
-    "drinkers",
-    "remitted",
-    "bich",
-    "unsuited",
-    "prose",
-    "famed",
-    "virulent",
-    "depriving",
-    "huggings",
-    "intruded",
-    "kupcinet",
-    "execution",
-    "razor-edged",
-    "avid",
-    "mallory's",
-    "baudelaire",
-    "orange",
-    "392",
-    "extempore",
-    "thoroughfare",
-    "amsterdam",
-    "poultry",
-    "crawled",
-    "cement",
-    "pinnacles",
-    "pretend",
-    "adams's",
-    "unparalleled",
-    "buber",
-    "domed",
-    "tirelessly",
-    "computations",
-    "fabrics",
-    "movie",
-    "subtended",
-    "geddes",
-    "revealed",
-    "buick",
-    "mustachioed",
-    "enright",
-    "mccormack",
-    "merrimac",
-    "blob",
-    "availability",
-    "yellow-bellied",
-    "dichondra",
-    "stew",
-    "ontological",
-    "many-times",
-    "grass-roots",
-    "half-cocked",
-    "lipchitz",
-    "disputed",
-    "pestering",
-    "cat",
-    "do(c)ters",
-    "generations",
-    "challenger",
-    "naples",
-    "traditionalists",
-    "rocks",
-    "v-1",
-    "lacquered",
-    "visualizes",
-    "ryder",
-    "blushes",
-    "yardumian",
-    "shillong",
-    "beaming",
-    "officers",
-    "starbird",
-    "cutters",
-    "devil",
-    "tactics",
-    "belaboring",
-    "mozart",
-    "secretary-general",
-    "catholics'",
-    "smuggled",
-    "presbyterianism",
-    "swerved",
-    "selle",
-    "dishonor",
-    "uh-huh",
-    "five-month",
-    "sba",
-    "humanely",
-    "coolidge's",
-    "tobacco",
-    "tune",
-    "baseballs",
-    "directions",
-    "byproducts",
-    "side",
-    "baroreceptor",
-    "55",
-    "liking",
-    "anaerobic",
-    "boasted",
-    "failing",
-    "registries",
-    "seminar",
-    "non-farm",
-    "psychopomp",
-    "anti-kennedy",
-    "person-to-person",
-    "handstands",
-    "reproof",
-    "forks",
-    "secretary's",
-    "blank",
-    "not-quite-perfect",
-    "99",
-    "coolness",
-    "6:15",
-    "risen",
-    "1755",
-    "condenser",
-    "nationals",
-    "punchbowl",
-    "richmond-petersburg",
-    "wallpaper",
-    "sharpening",
-    "rambles",
-    "muffler",
-    "net-like",
-    "7,360,187",
-    "enabling",
-    "transference",
-    "new-found",
-    "toppled",
-    "carroll",
-    "snead",
-    "facilitatory",
-    "fishing",
-    "transducer",
-    "preparation-inquirers'",
-    "blocky",
-    "elapsed",
-    "lose",
-    "anecdotal",
-    "ludicrousness",
-    "forethought",
-    "wexler",
-    "jnr",
-    "upriver",
-    "horton",
-    "attakapas",
-    "shepard",
-    "tr.'s",
-    "troopers",
-    "cook",
-    "stomack",
-    "derrick",
-    "fine-boned",
-    "hev",
-    "headlines",
-    "invests",
-    "indian",
-    "riverbank",
-    "general's",
-    "unawareness",
-    "generously",
-    "class-biased",
-    "mathematical",
-    "adjective",
-    "repeal",
-    "disobedience",
-    "nurture",
-    "yoga",
-    "bevels",
-    "glorifies",
-    "humane",
-    "edwardes",
-    "lubberlanders",
-    "hunting",
-    "free-buying",
-    "jet-black",
-    "martha's",
-    "mist",
-    "alienates",
-    "petruchka",
-    "343",
-    "800",
-    "shelves",
-    "defence",
-    "cogently",
-    "harnessed",
-    "exteriors",
-    "swiss-born",
-    "high-",
-    "leverett",
-    "fishing-boat",
-    "1159",
-    "husbun",
-    "thereon",
-    "multiplication",
-    "laboratory",
-    "potentialities",
-    "genevieve",
-    "longs",
-    "gotham",
-    "herding",
-    "guerrilla",
-    "antisera",
-    "mend",
-    "cultures",
-    "sprinted",
-    "wastes",
-    "revival",
-    "nowacki",
-    "lucky",
-    "harmonization",
-    "galloping",
-    "floppy",
-    "year's",
-    "actually",
-    "pirates'",
-    "acrobats",
-    "misdemeanants",
-    "carries",
-    "sp-44002",
-    "loewe",
-    "repair",
-    "calculi",
-    "307",
-    "6-6",
-    "doin",
-    "rear-looking",
-    "bracket",
-    "tidy",
-    "gifted",
-    "osseous",
-    "camden",
-    "two-bedroom",
-    "bronzy-green-gold",
-    "turandot",
-    "glories",
-    "10-gallon",
-    "stances",
-    "diversities",
-    "saddle",
-    "materialize",
-    "voume",
-    "nieces",
-    "birthplace",
-    "scout's",
-    "stan",
-    "incapable",
-    "whole-heartedly",
-    "aerogenes",
-    "crossroads",
-    "macdonald's",
-    "appreciating",
-    "movers",
-    "intercourse",
-    "mid-1958",
-    "undergraduates",
-    "yellowed",
-    "sakellariadises",
-    "pseudo-scientific",
-    "wrecking",
-    "goddamned",
-    "restrained",
-    "indigent",
-    "signora",
-    "lapses",
-    "proficiency",
-    "deposed",
-    "depugh",
-    "jena",
-    "zealous",
-    "rupees",
-    "brittany",
-    "distributed",
-    "commended",
-    "adonis",
-    "morse's",
-    "ghiberti",
-    "higher-",
-    "irregulars",
-    "imbroglio",
-    "4000-plus",
-    "baltimorean",
-    "insomnia",
-    "stormed",
-    "remaking",
-    "boogie",
-    "bestubbled",
-    "hr.",
-    "lilies",
-    "successorship",
-    "bod/day/acre",
-    "aggressions",
-    "widowhood",
-    "sense",
-    "leale",
-    "topping",
-    "deltoid",
-    "tibetan-like",
-    "mock",
-    "psychiatry",
-    "imagnation",
-    "hettie",
-    "exegete",
-    "aeschbacher's",
-    "ocean",
-    "pretenses",
-    "clauses",
-    "arch-enemy",
-    "incline",
-    "hasty",
-    "10.8%",
-    "compilation",
-    "pick-up",
-    "o'connor",
-    "capillary",
-    "wholeheartedly",
-    "filibusters",
-    "bernoulli",
-    "lao",
-    "fbi",
-    "payable",
-    "believable",
-    "automate",
-    "popish",
-    "completed",
-    "combines",
-    "ills",
-    "51",
-    "5031",
-    "brocklin",
-    "additions",
-    "heelers",
-    "course",
-    "merle",
-    "label",
-    "agnomen",
-    "two-head",
-    "specializing",
-    "implications",
-    "lordly",
-    "enthusiasm",
-    "ten",
-    "susan",
-    "wares",
-    "lackeys",
-    "combustion",
-    "chambered",
-    "initiator",
-    "implicated",
-    "nutmeg",
-    "religiously",
-    "share",
-    "light-headed",
-    "instruct",
-    "sophie",
-    "irwin",
-    "madame",
-    "sonnets",
-    "girders",
-    "pauleys",
-    "reconstruct",
-    "impaired",
-    "cite",
-    "flanked",
-    "catkins",
-    "slugging",
-    "factors",
-    "spangle",
-    "diffring",
-    "censure",
-    "28th",
-    "begged",
-    "priests",
-    "shower",
-    "beribboned",
-    "casual",
-    "reflectance-measuring",
-    "larson",
-    "2%",
-    "tumble",
-    "pogue",
-    "barcus'",
-    "challenging",
-    "telegrapher's",
-    "discoverer",
-    "corpulence",
-    "gauze",
-    "cacao",
-    "escaped",
-    "mozart's",
-    "perched",
-    "conferring",
-    "lusts",
-    "pegs",
-    "indigenes",
-    "zero-magnitude",
-    "thrash",
-    "fluorescein",
-    "howe",
-    "benoit",
-    "epitaph",
-    "need",
-    "outweighed",
-    "thoriated",
-    "henceforth",
-    "ciao",
-    "nehru",
-    "the",
-    "changeable",
-    "torrio-capone",
-    "anti-colmer",
-    "formalize",
-    "replenishment",
-    "attaching",
-    "lava",
-    "sino-soviet",
-    "transcends",
-    "predecessors",
-    "gladiator",
-    "reels",
-    "trousers-pockets",
-    "humble",
-    "catlike",
-    "incompletely",
-    "shake",
-    "$5.2",
-    "paredon",
-    "grafton",
-    "bumblebees",
-    "contests",
-    "tip",
-    "hysteria",
-    "cramps",
-    "attlee",
-    "sieben",
-    "iowa",
-    "emphasize",
-    "baby's",
-    "4:30",
-    "everett",
-    "reeked",
-    "recruited",
-    "auto-loaders",
-    "lusignan",
-    "pompousness",
-    "binds",
-    "norborne",
-    "one-color",
-    "scenario",
-    "unexplained",
-    "indistinct",
-    "reverses",
-    "701st",
-    "draw",
-    "permissive",
-    "kingsley",
-    "cracked",
-    "trimmings",
-    "bereft",
-    "proved",
-    "bequest",
-    "spotlight",
-    "fawkes",
-    "sharks",
-    "aft",
-    "aromatic",
-    "transitional",
-    "prototypical",
-    "faery",
-    "long-view",
-    "stylistic",
-    "throneberry's",
-    "chahar",
-    "infuriation",
-    "adolescents",
-    "5-to-3",
-    "razor",
-    "mme",
-    "evade",
-    "calumniated",
-    "bereavement",
-    "observation",
-    "sends",
-    "two-run",
-    "safeties",
-    "lurched",
-    "wordy",
-    "hanch",
-    "reguli",
-    "shading",
-    "burgundy",
-    "85-student",
-    "drives",
-    "crystals",
-    "comforted",
-    "quickest",
-    "panoramic",
-    "bgs",
-    "heute",
-    "guardian",
-    "assessment",
-    "sprawled",
-    "vocabularianism",
-    "beefed-up",
-    "huskily",
-    "junior",
-    "outlining",
-    "diagonals",
-    "complements",
-    "bluebook",
-    "s-d",
-    "thunder",
-    "pistons",
-    "caliche-topped",
-    "rest-room",
-    "unscrew",
-    "hoffer",
-    "nehf",
-    "graphed",
-    "clarification",
-    "$310",
-    "comedies",
-    "indefatigable",
-    "pike's",
-    "kentucky",
-    "sanitaire",
-    "zeising",
-    "acid",
-    "preparing",
-    "ranked",
-    "dreariness",
-    "low-flying",
-    "aviary",
-    "neutrophils",
-    "coexist",
-    "gals",
-    "23rd",
-    "fernery",
-    "callan",
-    "confusions",
-    "barbarous",
-    "newlywed",
-    "messrs",
-    "uncommitted",
-    "wrestler's",
-    "combat",
-    "tactile",
-    "feb.",
-    "koh",
-    "bonner",
-    "dual",
-    "cipher",
-    "buchanan",
-    "anythin",
-    "attracted",
-    "pre-existence",
-    "$6,666.66",
-    "attesting",
-    "parable",
-    "purged",
-    "weakly",
-    "john",
-    "new",
-    "condition",
-    "lounging",
-    "ability",
-    "party's",
-    "beef's",
-    "pinnings",
-    "miro",
-    "inevitably",
-    "polymyositis",
-    "rodder",
-    "mcfee",
-    "jew-baiter",
-    "fouled",
-    "revenues",
-    "useful",
-    "texans",
-    "1843",
-    "40%",
-    "skids",
-    "footman",
-    "ladle",
-    "reversibility",
-    "endorsed",
-    "hilariously",
-    "accompanying",
-    "composer's",
-    "electro-magnetic",
-    "recommence",
-    "theaters",
-    "member",
-    "bulloch",
-    "wolpe's",
-    "client's",
-    "faust",
-    "manifesting",
-    "public-opinion",
-    "monolith",
-    "69",
-    "leafy",
-    "shaking",
-    "althaus",
-    "oilseed",
-    "shrilled",
-    "doctors'",
-    "a-bombs",
-    "rackety",
-    "nymph",
-    "most-valuable-player",
-    "initiates",
-    "pre-punic",
-    "pressure-volume-temperature",
-    "1.25%",
-    "let-down",
-    "scaffolding",
-    "reproducibly",
-    "derby",
-    "island",
-    "bolivia",
-    "ex-communist",
-    "clan",
-    "broke",
-    "glorify",
-    "pre-literate",
-    "bayezit",
-    "stolen",
-    "procure",
-    "15",
-    "safety",
-    "sweets",
-    "tabloids",
-    "rush",
-    "12-shot",
-    "causally",
-    "sheath",
-    "less",
-    "15-year-old",
-    "depraved",
-    "unself-conscious",
-    "headlights",
-    "gannon",
-    "jurisprudence",
-    "new-rich",
-    "honorable",
-    "defacing",
-    "darned",
-    "incalculable",
-    "use",
-    "sportsmanship",
-    "sihanouk's",
-    "cleansed",
-    "covered",
-    "jager",
-    "5-to-2",
-    "petits",
-    "accessories",
-    "spurious",
-    "unspectacular",
-    "perpetration",
-    "o'dwyer",
-    "skeletons",
-    "volleyball",
-    "contemptible",
-    "squarely",
-    "newly-emerging",
-    "heywood",
-    "nationalistic",
-    "sages",
-    "conscionable",
-    "mothered",
-    "inundations",
-    "hipline",
-    "gershwin",
-    "landings",
-    "semiramis",
-    "programming",
-    "ranke",
-    "refusing",
-    "lexical",
-    "patriarch",
-    "stanch",
-    "ventilating",
-    "swipe",
-    "amused",
-    "disciplines",
-    "hospitality",
-    "r-cape",
-    "than",
-    "tipple",
-    "sovereigns",
-    "upped",
-    "thickeners",
-    "fractured",
-    "governor",
-    "warrior",
-    "steel",
-    "dwor'",
-    "fiercely",
-    "laxness",
-    "rubens",
-    "cepheus",
-    "delineaments",
-    "obsessions",
-    "1792",
-    "chavis",
-    "candide",
-    "overreach",
-    "gretchen",
-    "noli",
-    "grimaced",
-    "deltoids",
-    "expression",
-    "1594-1674",
-    "spotting",
-    "bar-h",
-    "pro-western",
-    "2000",
-    "apprehended",
-    "leased",
-    "darlene",
-    "2:33.2",
-    "portents",
-    "table-top",
-    "loneliness",
-    "gnomon",
-    "exposited",
-    "internationally",
-    "mid-june",
-    "$39,000",
-    "painter",
-    "par-3",
-    "$85",
-    "insemination",
-    "define",
-    "sedate",
-    "gully",
-    "we're",
-    "vision",
-    "louis's",
-    "guttman-type",
-    "sluggishly",
-    "suffused",
-    "switches",
-    "brumby",
-    "subhumanity",
-    "2",
-    "degassed",
-    "produced",
-    "mitre",
-    "decide",
-    "hanover-sally",
-    "expurgation",
-    "overtaxed",
-    "fall-outs",
-    "cuff",
-    "comments",
-    "cain't",
-    "unquenched",
-    "commitment",
-    "accomplishments",
-    "sun's",
-    "thicknesses",
-    "leader",
-    "plenitude",
-    "messhall",
-    "hopping",
-    "cameos",
-    "peccadilloes",
-    "cytoplasm",
-    "ceramics",
-    "trotsky",
-    "goldsmith",
-    "contestants",
-    "weasel-worded",
-    "deloris",
-    "shelley",
-    "vitals",
-    "elemental",
-    "rectangle",
-    "quaking",
-    "rift",
-    "fiddlesticks",
-    "$7.50",
-    "anyone's",
-    "schoolmates",
-    "vessels",
-    "pointedly",
-    "herbs",
-    "counterchallenge",
-    "18,792",
-    "gabble",
-    "impose",
-    "retriever",
-    "garrard's",
-    "bakhtiari",
-    "watermelon",
-    "years'",
-    "leavened",
-    "nuzzled",
-    "february",
-    "substantiates",
-    "two-mile",
-    "stern-to",
-    "hardworking",
-    "mcalister",
-    "absent-minded",
-    "presumptuous",
-    "believes",
-    "waiting",
-    "dashing",
-    "stained",
-    "nicked",
-    "gibbs",
-    "cooing",
-    "thomson",
-    "opposition",
-    "hyperbole",
-    "bantus",
-    "jan.",
-    "arden",
-    "blunts",
-    "pulpits",
-    "establishing",
-    "witherspoon",
-    "eighteenth-",
-    "sheet",
-    "libertarian",
-    "dites",
-    "replication",
-    "betsy",
-    "gibes",
-    "mays",
-    "theoreticians",
-    "unsurmountable",
-    "erasers",
-    "gas",
-    "night-watchman",
-    "grosse",
-    "ruger",
-    "occupancies",
-    "snug",
-    "germanium",
-    "lowest",
-    "locker",
-    "pride-starlette",
-    "bragg",
-    "piecemeal",
-    "kansas-nebraska",
-    "willy-nilly",
-    "concentrating",
-    "noisy",
-    "wanderings",
-    "satan's",
-    "peter",
-    "superficial",
-    "bastard's",
-    "retold",
-    "nemesis",
-    "mustiness",
-    "methyl",
-    "pilloried",
-    "decayed",
-    "betel-stained",
-    "managements",
-    "shills",
-    "pettersson",
-    "505",
-    "gee's",
-    "determinedly",
-    "recreates",
-    "phonographs",
-    "intratissue",
-    "terms",
-    "textile-producing",
-    "bennett",
-    "bloodlust",
-    "polka-dotted",
-    "reactivated",
-    "brimmed",
-    "charming",
-    "naturalism",
-    "subways",
-    "switchgear",
-    "sucking",
-    "punditry",
-    "dulled",
-    "calf's-foot",
-    "j",
-    "jocose",
-    "havisham",
-    "parried",
-    "monograph",
-    "diddling",
-    "outcome",
-    "lummox",
-    "calipers",
-    "acropolis",
-    "courage",
-    "bogies",
-    "tole",
-    "orbit",
-    "floor-length",
-    "viz.",
-    "vaguely",
-    "moderates",
-    "two-thirds",
-    "avenge",
-    "rediscovery",
-    "implore",
-    "groups",
-    "franco-irishman",
-    "repairmen",
-    "coalesces",
-    "jolting",
-    "cozen",
-    "applying",
-    "spirit-gum",
-    "cudgels",
-    "walsh's",
-    "j.h.",
-    "sunning",
-    "uneasily",
-    "p",
-    "surgical",
-    "semi-inflated",
-    "radiated",
-    "reese",
-    "imminent",
-    "increase",
-    "subscribing",
-    "guardedness",
-    "cumin",
-    "mough",
-    "lorde",
-    "access",
-    "turbinates",
-    "hawksley",
-    "whitemarsh",
-    "visiting",
-    "thawed",
-    "302",
-    "tiller",
-    "lick",
-    "reverberation",
-    "resplendent",
-    "nordyke",
-    "despising",
-    "ago",
-    "figment",
-    "algerian",
-    "microfossils",
-    "taxiing",
-    "stephenson",
-    "40-degrees-f",
-    "wrong-headed",
-    "asphalt",
-    "mp's",
-    "kennedy",
-    "tangos",
-    "5.8",
-    "secure",
-    "gegenschein",
-    "rollickingly",
-    "pre-academic",
-    "braver",
-    "clarified",
-    "amuse",
-    "worry",
-    "self-pacification",
-    "shaefer",
-    "silos",
-    "shippers",
-    "spurt",
-    "limp-looking",
-    "7:45",
-    "casks",
-    "hyacinths",
-    "paot",
-    "othello",
-    "chiefly",
-    "allay",
-    "demands",
-    "desirous",
-    "descriptions",
-    "squats",
-    "overprotective",
-    "coordinating",
-    "quarter-inch",
-    "italy",
-    "quarter-mile",
-    "stiff",
-    "bmt",
-    "hypnotic",
-    "sunshine",
-    "telling",
-    "networks'",
-    "preconscious",
-    "explore",
-    "husband-stealer",
-    "flavored",
-    "pirouette",
-    "shattered",
-    "servicing",
-    "all-college",
-    "measures",
-    "unavoidable",
-    "flimsies",
-    "top-tang",
-    "methods",
-    "powdered",
-    "designated",
-    "misgivings",
-    "anomalies",
-    "richness",
-    "teagarden",
-    "serieuses",
-    "concorde",
-    "naxos",
-    "politicos",
-    "chilling",
-    "sounion",
-    "comely",
-    "hydrophobia",
-    "defrost",
-    "lewd",
-    "excised",
-    "rotated",
-    "glorification",
-    "arresting",
-    "well-understood",
-    "glum",
-    "messed",
-    "authorizes",
-    "34-hour",
-    "potions",
-    "viewpoints",
-    "ethel",
-    "rearranged",
-    "gang's",
-    "modernists",
-    "sofas",
-    "mehitabel",
-    "hackles",
-    "agamemnon's",
-    "1543",
-    "out-of-state",
-    "biches",
-    "joviality",
-    "defend",
-    "planetarium",
-    "saunders",
-    "malraux's",
-    "hydroxides",
-    "divergent",
-    "konishi",
-    "granting",
-    "priory",
-    "lundeen",
-    "vice-presidents",
-    "propagandists",
-    "afterward",
-    "introduce",
-    "continuing",
-    "vain",
-    "turnings",
-    "attraction",
-    "owner",
-    "out-of-sight",
-    "motive",
-    "powerfully",
-    "best-sellers",
-    "recalculation",
-    "ten-concert",
-    "$11.50",
-    "supper",
-    "acquire",
-    "uneconomical",
-    "psychiatrist",
-    "reb",
-    "choir's",
-    "mcpherson",
-    "attained",
-    "maquet",
-    "1791",
-    "providence",
-    "amulet",
-    "overboard",
-    "sprague",
-    "convicted",
-    "$17.8",
-    "inspirational",
-    "proverb",
-    "conjectures",
-    "dumbbells",
-    "nut",
-    "advantage",
-    "self-employed",
-    "novosibirsk",
-    "astuteness",
-    "boardinghouses",
-    "proprieter",
-    "allergic",
-    "momoyama",
-    "ok.",
-    "5%",
-    "volker",
-    "rockhall",
-    "lighter'n",
-    "kochaneks",
-    "burke",
-    "pies",
-    "marshaling",
-    "smoldered",
-    "eighty-four",
-    "37,470",
-    "ostracized",
-    "nevertheless",
-    "70's",
-    "140,414",
-    "kiosk",
-    "reverently",
-    "thundering",
-    "60-66",
-    "spegititgninino",
-    "crows",
-    "alpers",
-    "schleiermacher",
-    "parentage",
-    "oxides",
-    "twitched",
-    "strife",
-    "fahey",
-    "wit",
-    "fy",
-    "tinted",
-    "sinuously",
-    "smeared",
-    "pauling",
-    "navy",
-    "veteran's",
-    "nodded",
-    "astrophysics",
-    "listened",
-    "glibly",
-    "173",
-    "grassers",
-    "abdomen",
-    "125,000",
-    "mcleod",
-    "rebuke",
-    "expand",
-    "conyers'",
-    "$.86",
-    "30-minute",
-    "45-degree",
-    "denyin'",
-    "knife-men",
-    "phil's",
-    "embodiments",
-    "spin",
-    "junkers",
-    "complementary",
-    "altering",
-    "inventions",
-    "fatalists",
-    "barefoot",
-    "become",
-    "pistoleers",
-    "non-violent",
-    "schwab",
-    "judiciously",
-    "rbi's",
-    "thermally",
-    "serloin",
-    "2,100",
-    "carvalho",
-    "spirito",
-    "classification-angle",
-    "trikojus",
-    "alternating",
-    "hallowed",
-    "o'donnell",
-    "insult",
-    "powder",
-    "lopatnikoff's",
-    "stengel",
-    "a-drinking",
-    "sleeps",
-    "leadsman",
-    "pickles",
-    "kittenish",
-    "foreign-aid",
-    "slingshot",
-    "ghostly",
-    "line-fragments",
-    "talented",
-    "hawked",
-    "dried-out",
-    "clergyman",
-    "semi-city",
-    "transaminase",
-    "founder",
-    "sinfulness",
-    "perplex",
-    "thousands",
-    "impressionist",
-    "lyford",
-    "pushers",
-    "arizona",
-    "durable",
-    "porters",
-    "ratify",
-    "sexualized",
-    "walls",
-    "cavern",
-    "breathy",
-    "3300",
-    "low-speed",
-    "kelley's",
-    "determination",
-    "arturo",
-    "bedridden",
-    "j'ai",
-    "crouch's",
-    "eqn.",
-    "underrate",
-    "theatrical",
-    "stones",
-    "dizzy",
-    "aligning",
-    "spend",
-    "prototype",
-    "johnnie",
-    "hovers",
-    "conveyor",
-    "accepting",
-    "lush",
-    "prolong",
-    "keep",
-    "repetitious",
-    "gigantic",
-    "consanguineously",
-    "pre-french",
-    "muddling",
-    "slyness",
-    "handymen",
-    "insulate",
-    "f'r",
-    "corning",
-    "huang-ti",
-    "ozagen",
-    "kaiser's",
-    "caved",
-    "advocacy",
-    "drunkard",
-    "disapprovingly",
-    "authenticity",
-    "cold",
-    "istiqlal-sponsored",
-    "breton",
-    "intervention",
-    "montpelier",
-    "hermetic",
-    "hoop",
-    "metallic",
-    "pepper",
-    "keats's",
-    "unrestricted",
-    "cross-writing",
-    "pulse-timing",
-    "latinovich",
-    "camping-out",
-    "not-knowing",
-    "3%",
-    "thermopile",
-    "macintosh",
-    "origen",
-    "disobeyed",
-    "moneyed",
-    "onwards",
-    "ritschl",
-    "georgi",
-    "lagow",
-    "wrapping",
-    "electricity",
-    "3.1416",
-    "canned",
-    "900,000",
-    "policy-making",
-    "census",
-    "strangers'",
-    "meat-wagon",
-    "stagnation",
-    "whiteleaf",
-    "lawns",
-    "culmone",
-    "myra's",
-    "belles",
-    "macphail",
-    "isothermal",
-    "devil's-food",
-    "malia",
-    "rostrum",
-    "daughter",
-    "mmmm",
-    "carlisle",
-    "242%",
-    "exchanged",
-    "lard",
-    "appellant",
-    "cruise",
-    "sizzling",
-    "half-heartedly",
-    "osbert",
-    "spooky",
-    "subaltern",
-    "brands",
-    "hailed",
-    "menlo",
-    "piddington",
-    "gallium",
-    "caressing",
-    "interior",
-    "shell-psychology",
-    "figone",
-    "hot-colored",
-    "kwango",
-    "allege",
-    "swimming",
-    "quaver",
-    "urich",
-    "self-defense",
-    "permian",
-    "canal",
-    "transferors",
-    "vertebrate",
-    "kicked",
-    "1-degree",
-    "pigen",
-    "sonuvabitch",
-    "eyebrow",
-    "objectivity",
-    "facilitating",
-    "testicle",
-    "sword",
-    "academically",
-    "ryc'",
-    "plebeian",
-    "intermittent",
-    "rapier",
-    "2:67",
-    "adjectives",
-    "touchstones",
-    "indicate",
-    "marxist-leninist",
-    "foreman",
-    "alertness",
-    "blackboard",
-    "bloody",
-    "papillary",
-    "outing",
-    "sparks",
-    "adopting",
-    "106,500",
-    "milder",
-    "accompanists",
-    "patisseries",
-    "screeching",
-    "nisf-i-jahan",
-    "d'yquem",
-    "supportive",
-    "depersonalization",
-    "picketed",
-    "marshalling",
-    "rarity",
-    "victorious",
-    "yodel",
-    "aia",
-    "tragedians",
-    "shockingly",
-    "polarities",
-    "richards",
-    "afrika",
-    "arrangements",
-    "voltmeter",
-    "bribers",
-    "crystallites",
-    "ratio",
-    "smoking",
-    "imminence",
-    "pre-world-war-",
-    "raceway",
-    "two-family",
-    "arch",
-    "tensely",
-    "symonds",
-    "authors'",
-    "creased",
-    "balloon",
-    "decompose",
-    "meurons",
-    "illness",
-    "514",
-    "truth-revealing",
-    "whinny",
-    "millenarianism",
-    "committeewoman",
-    "angst",
-    "bead",
-    "1950's",
-    "gildas",
-    "bricklaying",
-    "mutants",
-    "pint",
-    "sung",
-    "dilate",
-    "self-appointed",
-    "totemic",
-    "haltingly",
-    "hardware",
-    "fardulli's",
-    "half-a-dozen",
-    "och",
-    "ahmad's",
-    "elongation",
-    "stings",
-    "differentiating",
-    "domains",
-    "inciting",
-    "zeffirelli",
-    "klinico",
-    "clips",
-    "coattails",
-    "wring",
-    "typhus",
-    "handshake",
-    "depths",
-    "cleansing",
-    "geniuses",
-    "sub-chiefdom",
-    "alum",
-    "computes",
-    "prison",
-    "dependency",
-    "variant",
-    "agility",
-    "benighted",
-    "1814",
-    "dorset",
-    "blueprint",
-    "ridicule",
-    "misbegotten",
-    "de-iodination",
-    "simultaneous",
-    "mais",
-    "testament",
-    "prop",
-    "semiautomatic",
-    "jutting",
-    "masterful",
-    "twister-coners",
-    "grocers",
-    "jeepers",
-    "backlash",
-    "'49",
-    "actions",
-    "pinch-hitters",
-    "express",
-    "distraught",
-    "transpirating",
-    "near-strangers",
-    "wesker's",
-    "peerless",
-    "premonitions",
-    "i",
-    "nogay",
-    "society's",
-    "$625,561",
-    "case-history",
-    "handy",
-    "triggered",
-    "utilizes",
-    "chestnut",
-    "bradley's",
-    "sophia's",
-    "sovereignty",
-    "deepen",
-    "inched",
-    "amenable",
-    "auditioning",
-    "proportionate",
-    "teresa",
-    "140",
-    "forty-two",
-    "vanishes",
-    "hangers-on",
-    "mountainside",
-    "mechanic's",
-    "exultation",
-    "giorgio",
-    "pro-ball",
-    "sung-shan",
-    "factory-to-you",
-    "mimesis",
-    "tumbling",
-    "giselle",
-    "institute",
-    "disproving",
-    "vertically",
-    "amendments",
-    "purposeful",
-    "frames",
-    "communes",
-    "uncolored",
-    "robin",
-    "graves",
-    "foresaw",
-    "heaved",
-    "eichmann",
-    "squalid",
-    "adenauer's",
-    "nilsen",
-    "niche",
-    "grizzled",
-    "40-grain",
-    "influenza-pneumonia",
-    "high-wage",
-    "trip",
-    "chambers",
-    "moons",
-    "incoherently",
-    "alveolar",
-    "well-modulated",
-    "stampede",
-    "exasperation",
-    "voted",
-    "tapdance",
-    "pleasin'",
-    "kidding",
-    "encased",
-    "1959-60",
-    "bosley",
-    "perfectibility",
-    "new-spilled",
-    "double-header",
-    "taylor",
-    "loathing",
-    "hollywood",
-    "compose",
-    "unconquerable",
-    "hairpin",
-    "super-condamine",
-    "expenditure",
-    "destroyers",
-    "senilis",
-    "corsia",
-    "heedless",
-    "organizationally",
-    "rourke",
-    "hesitate",
-    "tschilwyk",
-    "chiropractor's",
-    "minarets",
-    "manley's",
-    "scorned",
-    "jarred",
-    "evoking",
-    "thoreau",
-    "clostridium",
-    "vigil",
-    "systematized",
-    "malmud",
-    "arylesterase",
-    "unafraid",
-    "peacock",
-    "shudder",
-    "541",
-    "tosca",
-    "advertised",
-    "uninitiated",
-    "$5-8,000",
-    "platter",
-    "talent",
-    "canto",
-    "septic",
-    "inexplicably",
-    "bat",
-    "assertions",
-    "warfront",
-    "indigenous",
-    "**yr",
-    "policy-makers",
-    "inspected",
-    "assassination",
-    "sculptural",
-    "arctic",
-    "bid",
-    "flemings",
-    "penn",
-    "parapet",
-    "pas",
-    "non-western",
-    "ridgway",
-    "reunion-halloween",
-    "common",
-    "blown",
-    "arianism",
-    "marsh",
-    "1.5",
-    "uninominal",
-    "hear",
-    "tighten",
-    "mortared",
-    "gatherings",
-    "near",
-    "swingin'",
-    "system",
-    "mo.",
-    "closeted",
-    "polymers",
-    "microscopical",
-    "compositional",
-    "horn",
-    "elsewhere",
-    "silencing",
-    "correlations",
-    "higher-quality",
-    "above-mentioned",
-    "triphosphopyridine",
-    "albumin",
-    "uttuh",
-    "luxemburg",
-    "kent",
-    "timers",
-    "pollock",
-    "credit",
-    "etcetera",
-    "rosy-fingered",
-    "millenium",
-    "pious",
-    "hadd",
-    "hercule",
-    "antiquarian",
-    "nutrition",
-    "controversy",
-    "prospered",
-    "superhuman",
-    "deae-cellulose-treated",
-    "frayne",
-    "dumas",
-    "scarred",
-    "mississippi",
-    "walkways",
-    "skyros'",
-    "glendora",
-    "**yg-globulin",
-    "$.027",
-    "jubilant",
-    "shaven",
-    "32,000",
-    "decimeter-wave-length",
-    "ted",
-    "purchase",
-    "gumming",
-    "metier",
-    "unfunny",
-    "oath",
-    "perspectives",
-    "east",
-    "eye",
-    "eased",
-    "gutters",
-    "muttering",
-    "dig",
-    "145-pound",
-    "fitness",
-    "aspirant",
-    "gum-chewing",
-    "flecked",
-    "clean-top",
-    "synonym",
-    "dost",
-    "envisaged",
-    "applejack",
-    "4-cell",
-    "largesse",
-    "tewfik",
-    "accentuates",
-    "bodied",
-    "logistical",
-    "ultracentrifuge",
-    "merveilleux",
-    "upholding",
-    "socola",
-    "humanism",
-    "pine",
-    "gwen",
-    "smacks",
-    "quarreling",
-    "superhighways",
-    "nell",
-    "chesly",
-    "del",
-    "nationalism",
-    "d'art",
-    "salutation",
-    "inured",
-    "borrow",
-    "sadder",
-    "unkempt",
-    "cellophane",
-    "upholders",
-    "describing",
-    "palette",
-    "mirror",
-    "slogan",
-    "antecedents",
-    "wycombe",
-    "epoch",
-    "avarice",
-    "bolshevistic",
-    "harmony's",
-    "tragi-comic",
-    "pulsation",
-    "time-temperature",
-    "titter",
-    "thet",
-    "father-confessor",
-    "cavort",
-    "thyroid",
-    "abnormally",
-    "applicable",
-    "rootless",
-    "conspiratorial",
-    "hudson's",
-    "tar-soaked",
-    "earthworm",
-    "flakes",
-    "financial",
-    "dailey",
-    "donations",
-    "accommodate",
-    "windstorm",
-    "224-170",
-    "cutthroat",
-    "$12,500",
-    "49*0",
-    "impiety",
-    "sang",
-    "undue",
-    "thom's",
-    "she",
-    "laments",
-    "h.l.",
-    "deed",
-    "diagonal",
-    "visits",
-    "retraining",
-    "pitcher",
-    "shines",
-    "winston",
-    "fontanel",
-    "reminding",
-    "spacer",
-    "congregations",
-    "leaguers",
-    "inability",
-    "musicologists",
-    "palate",
-    "pistachio",
-    "294-degrees-k",
-    "apprenticeship",
-    "chehel",
-    "exists",
-    "snails",
-    "wooden",
-    "lakes",
-    "marum",
-    "sockets",
-    "writings",
-    "linda's",
-    "annoying",
-    "careworn",
-    "coded",
-    "fluoride",
-    "moulding",
-    "psychic",
-    "materials'",
-    "sbcs-type",
-    "thickens",
-    "provisional",
-    "harrington",
-    "mastoideus",
-    "32,589",
-    "stimulants",
-    "golden-crusted",
-    "equatorial",
-    "congolese",
-    "felicities",
-    "pseudo-happiness",
-    "trig",
-    "heartbreaking",
-    "fountains",
-    "nrlda's",
-    "fluently",
-    "pronounced",
-    "threshhold",
-    "pleaded",
-    "dialed",
-    "capitalist-democratic",
-    "purge",
-    "issuance",
-    "photographic",
-    "clients'",
-    "kurd",
-    "browning's",
-    "tolerant",
-    "baci",
-    "unappeasable",
-    "undepicted",
-    "century-fox",
-    "acceleration",
-    "motor-car",
-    "haskell",
-    "egyptians",
-    "dosage",
-    "emissaries",
-    "overgrazing",
-    "midwood",
-    "simon",
-    "colony",
-    "succumbing",
-    "enthusiast",
-    "crochet",
-    "outgrowth",
-    "whiteman",
-    "mass-production",
-    "swirl",
-    "girlishly",
-    "radic",
-    "drops",
-    "mal",
-    "litigants",
-    "underbrush",
-    "sharpened",
-    "exclusiveness",
-    "contents",
-    "hank",
-    "blockade",
-    "sumatra",
-    "prescribes",
-    "effectively",
-    "lively",
-    "officiated",
-    "mealie-meal",
-    "puzzling",
-    ";",
-    "30-",
-    "evildoers",
-    "outlines",
-    "cool",
-    "staginess",
-    "junior-grade",
-    "1986",
-    "printer's",
-    "1727",
-    "substrate",
-    "evacuate",
-    "misinterpretation",
-    "gummy",
-    "agreed-on",
-    "registrations",
-    "ultracentrifugally",
-    "proposition",
-    "sincerely",
-    "grants-in-aid",
-    "$50,000",
-    "recitation",
-    "gadfly",
-    "feels",
-    "notre",
-    "produces",
-    "empirically",
-    "refute",
-    "in-migrants",
-    "kotowaza",
-    "virtues",
-    "seekingly",
-    "fans",
-    "fellow",
-    "grounding",
-    "bathing",
-    "parker's",
-    "macklin",
-    "athabascan",
-    "waterfalls",
-    "crupper",
-    "coordinate",
-    "triumphantly",
-    "bulky",
-    "urn",
-    "mary's",
-    "strongheart",
-    "33-1/3%",
-    "superbly",
-    "carbon-14",
-    "solid-state",
-    "1844",
-    "trying",
-    "strength",
-    "showroom",
-    "premises",
-    "enforcing",
-    "alphabetic",
-    "festive",
-    "provide",
-    "fellas",
-    "high-topped",
-    "shove",
-    "forming",
-    "hausman's",
-    "20%",
-    "tt",
-    "elinor",
-    "theoretical",
-    "beneficial",
-    "validation",
-    "sketched",
-    "law-enforcement",
-    "screenplay",
-    "text-ordered",
-    "superieure",
-    "crept",
-    "thorns",
-    "biz",
-    "anthropologists",
-    "inattentive",
-    "throttling",
-    "cost-finding",
-    "rh",
-    "unemployment",
-    "moravian",
-    "jacksons",
-    "anti-semitism",
-    "realismo",
-    "franklin",
-    "assembly",
-    "disturbingly",
-    "pre-conditions",
-    "foote",
-    "foregoing",
-    "delphi",
-    "prudence",
-    "obscene",
-    "pittsburgh",
-    "diagnose",
-    "five-ply",
-    "judgeship",
-    "sculpted",
-    "perfumed",
-    "slurries",
-    "dexterity",
-    "gallstones",
-    "template",
-    "three-fold",
-    "philosophizing",
-    "humorous",
-    "koenig",
-    "peoples'",
-    "pruta",
-    "upwards",
-    "exceedingly",
-    "pacifistic",
-    "mayans",
-    "chronically",
-    "soundproof",
-    "giblet",
-    "curtained",
-    "consulted",
-    "apologize",
-    "lithographs",
-    "ballard",
-    "alludes",
-    "eschewed",
-    "partlow",
-    "wilshire",
-    "compound",
-    "canticle",
-    "ramification",
-    "impeccably",
-    "1938-39",
-    "swayed",
-    "broth",
-    "furtively",
-    "splayed",
-    "strenuous",
-    "diameters",
-    "mitigation",
-    "newcomer",
-    "13/16-inch",
-    "unpaid",
-    "digger",
-    "warehouse",
-    "jingling",
-    "repute",
-    "smuggle",
-    "aluminum",
-    "wanting",
-    "antitrust",
-    "anabaptists",
-    "crus",
-    "goat's",
-    "faulknerian",
-    "lashes",
-    "diagrams",
-    "fills",
-    "bodily",
-    "seventy-fifth",
-    "boylston",
-    "cheer",
-    "anabaptist",
-    "haphazardly",
-    "too-expensive",
-    "inevitability",
-    "cheere",
-    "sherman's",
-    "mg.",
-    "styled",
-    "protects",
-    "anorthic",
-    "corruptible",
-    "pauling's",
-    "marlowe's",
-    "despondent",
-    "hancock",
-    "$1,000",
-    "raphael's",
-    "orgy",
-    "processional",
-    "gig",
-    "waiter",
-    "2,460",
-    "carmer's",
-    "far-reaching",
-    "requirement",
-    "pasteurization",
-    "bestow",
-    "1068",
-    "recurred",
-    "wild-eyed",
-    "crudest",
-    "honeycombed",
-    "proportions",
-    "sun-inflamed",
-    "fred's",
-    "everywhere",
-    "beronio",
-    "kai-shek",
-    "renewed",
-    "resublimed",
-    "watson's",
-    "endpoints",
-    "telescoping",
-    "waters",
-    "knee-deep",
-    "grabski's",
-    "credulity",
-    "poindexter",
-    "picasso's",
-    "aldo",
-    "juries",
-    "dentist's",
-    "praisegod",
-    "mead",
-    "shayol",
-    "quantity",
-    "scratched",
-    "class'",
-    "19-12",
-    "policed",
-    "nighttime",
-    "plodded",
-    "unique",
-    "all-pervading",
-    "judge-made",
-    "dpw",
-    "spoils",
-    "lungs",
-    "du",
-    "unventilated",
-    "seeds",
-    "creon",
-    "paradoxically",
-    "tissue",
-    "wyatt",
-    "hamey",
-    "motets",
-    "breeding",
-    "regard",
-    "frictions",
-    "allegorical",
-    "wildness",
-    "poncho",
-    "enzo",
-    "textbooks",
-    "posseman",
-    "alamogordo",
-    "conjugate",
-    "stroked",
-    "styron",
-    "$135",
-    "chalon-sur-saone",
-    "southernisms",
-    "flaws",
-    "willing",
-    "re-echo",
-    "lice",
-    "geometrical",
-    "steeply",
-    "high-cost",
-    "corporate",
-    "continued",
-    "armory's",
-    "convulsive",
-    "phosphate",
-    "flops",
-    "gyp'll",
-    "fashioning",
-    "air-drifts",
-    "clamshell",
-    "federalize",
-    "bibles",
-    "junior-year-abroad",
-    "lyricists",
-    "modifies",
-    "absented",
-    "littering",
-    "quiet-spoken",
-    "imprecations",
-    "iliac",
-    "jersey's",
-    "scott's",
-    "boat",
-    "pennsylvania",
-    "$1,250,000",
-    "praying",
-    "segmental",
-    "skull-bashings",
-    "seem",
-    "slugger",
-    "rough-sanded",
-    "funari",
-    "demonstrably",
-    "worthiest",
-    "nevsky",
-    "cohn",
-    "yuh",
-    "self-certainty",
-    "21-22",
-    "chicago",
-    "graces",
-    "celebrations",
-    "overdone",
-    "stout's",
-    "brown-black",
-    "enhancing",
-    "1810",
-    "hodge-podge",
-    "polonaise",
-    "branching",
-    "tow",
-    "papa",
-    "halda",
-    "kipling",
-    "stacy",
-    "analyst",
-    "rockport",
-    "yellow-dwarf",
-    "$4,000",
-    "pleural",
-    "near-communists",
-    "kleenex",
-    "hemming",
-    "whiskey",
-    "inflexible",
-    "expunge",
-    "compression",
-    "rough",
-    "adorable",
-    "cynics",
-    "measurement",
-    "salts",
-    "old-timer",
-    "pergamon",
-    "improving",
-    "dissociation",
-    "jolly",
-    "geary",
-    "francois",
-    "gimpy",
-    "trapping",
-    "birds'",
-    "fredrikshall",
-    "cosponsored",
-    "contingent",
-    "goal-line",
-    "excitement",
-    "adores",
-    "government-supported",
-    "menus",
-    "respected",
-    "rev'rend",
-    "greenwich",
-    "fervors",
-    "trans-illuminated",
-    "quirinal",
-    "sashimi",
-    "hurray",
-    "dung",
-    "1831",
-    "nodes",
-    "approaches",
-    "weathers",
-    "varnish",
-    "could",
-    "mickie",
-    "monticello",
-    "trestle",
-    "java",
-    "freight-jumper",
-    "trinitarian",
-    "unheard-of",
-    "sardanapalus",
-    "inadequacy",
-    "conducive",
-    "disprove",
-    "an'",
-    "frothing",
-    "contingent-fee",
-    "ex-gov.",
-    "reminded",
-    "repentant",
-    "subordinates",
-    "consume",
-    "leg's",
-    "oldest",
-    "re-enter",
-    "'31",
-    "conclusive",
-    "capek's",
-    "strengthened",
-    "hereby",
-    "3-10",
-    "make-believe",
-    "gotterdammerung",
-    "infrared",
-    "knoweth",
-    "connects",
-    "drama-filled",
-    "flax",
-    "seventeen-inch",
-    "stein",
-    "towns",
-    "wind-velocity",
-    "grazin'",
-    "keeshond",
-    "taxed",
-    "composers'",
-    "bathtubs",
-    "chivalry",
-    "sterns",
-    "tormenting",
-    "144",
-    "chlorine",
-    "crosson",
-    "triplets",
-    "double-bogeyed",
-    "carloads",
-    "zion",
-    "torso-defining",
-    "dunn-atherton",
-    "lawmaking",
-    "conjugated",
-    "torsion",
-    "puckering",
-    "d-c",
-    "further",
-    "skiway",
-    "degenerated",
-    "musket",
-    "lookout",
-    "undertaken",
-    "franc",
-    "uproariously",
-    "rarely",
-    "scheduling",
-    "loop",
-    "reasoning",
-    "engravings",
-    "rebellions",
-    "chin-ups",
-    "formalities",
-    "lease",
-    "coles",
-    "discourses",
-    "followers",
-    "hart",
-    "fairbrothers",
-    "spelled",
-    "1-1/4''",
-    "pebworth",
-    "intensity",
-    "judicial",
-    "turner",
-    "complimentary",
-    "zoe",
-    "questionaire",
-    "3505o",
-    "menet",
-    "spa",
-    "nazism",
-    "astound",
-    "vasorum",
-    "pavese",
-    "apothecary",
-    "heffer",
-    "dissection",
-    "benign",
-    "unleash",
-    "undergirding",
-    "stomach",
-    "snare",
-    "fertilizer",
-    "vase",
-    "whistled",
-    "physics",
-    "snarled",
-    "forbidding",
-    "beginner's",
-    "barn-burner's",
-    "juan",
-    "knowlton's",
-    "toasting",
-    "complains",
-    "4,499,608",
-    "bewitched",
-    "well-braced",
-    "public's",
-    "chenoweth",
-    "juices",
-    "helsq'iyokom",
-    "enslavement",
-    "lodowick",
-    "rudolf",
-    "modification",
-    "unpredictably",
-    "nation-states",
-    "bug",
-    "nacht",
-    "part-time",
-    "peabody",
-    "witold",
-    "exemplifies",
-    "blood-specked",
-    "autism",
-    "doomed",
-    "aujourd'hui",
-    "second-half",
-    "2-hour-and-27-minute",
-    "effecte",
-    "particulars",
-    "radiomen",
-    "scrapbook",
-    "collector's",
-    "dragging",
-    "impassable",
-    "sumac",
-    "headmaster",
-    "picnicked",
-    "morale-enhancing",
-    "boulevard",
-    "empiricism",
-    "recordings",
-    "interiors",
-    "feeding",
-    "gras",
-    "hindu",
-    "hams",
-    "nebula",
-    "alpert",
-    "sweden's",
-    "skin-perceptiveness",
-    "abrupt",
-    "clenched",
-    "jerusalem",
-    "stickpin",
-    "codes",
-    "actors",
-    "objecting",
-    "partings",
-    "karet",
-    "lovingly",
-    "bloated",
-    "unlovely",
-    "allocated",
-    "stately",
-    "puffs",
-    "ensues",
-    "allergies",
-    "gristmill",
-    "pwa",
-    "engraver",
-    "other's",
-    "molding",
-    "whitehead",
-    "$5",
-    "17:07",
-    "annamorena",
-    "enjoyed",
-    "10-12",
-    "mutton",
-    "documentary-type",
-    "victor-butler",
-    "gratifyingly",
-    "vitality",
-    "gorge",
-    "fascism",
-    "graver",
-    "yarns",
-    "sit-down",
-    "jens",
-    "plotted",
-    "ponds",
-    "guide",
-    "vitriol",
-    "particularly",
-    "long-far",
-    "coddled",
-    "scooping",
-    "glob-flakes",
-    "crossroading",
-    "aberrations",
-    "nationalists",
-    "royale",
-    "juanita",
-    "surveys",
-    "food-processing",
-    "world",
-    "colder",
-    "brumidi's",
-    "doc",
-    "buckenham",
-    "boldly",
-    "dripping",
-    "inflated",
-    "permitted",
-    "sangaree",
-    "94",
-    "maxwell's",
-    "ironically",
-    "squatter's",
-    "wage-rate",
-    "claws",
-    "grillework",
-    "runing",
-    "cm.",
-    "coarseness",
-    "hoopla",
-    "brusquely",
-    "postscript",
-    "samples",
-    "puttana",
-    "necessitate",
-    "24-sheet",
-    "dappled",
-    "1565",
-    "gather",
-    "tribe's",
-    "sheen",
-    "triple",
-    "clubs",
-    "migrant",
-    "pta",
-    "recitals",
-    "irma",
-    "locating",
-    "subjects'",
-    "doctrine",
-    "merges",
-    "chouise",
-    "couple's",
-    "baileefe",
-    "medmenham",
-    "writes",
-    "migs",
-    "april-june",
-    "$200,000-a-year",
-    "newburgh",
-    "24-hour-day",
-    "elizabeth",
-    "fritzie",
-    "non-figurative",
-    "ridding",
-    "suitability",
-    "civility",
-    "one-thirty",
-    "noticeably",
-    "wacky",
-    "best-hearted",
-    "madman",
-    "nonpoisonous",
-    "dancers'",
-    "dramatist",
-    "hartman",
-    "debs",
-    "mel",
-    "burro",
-    "general",
-    "three-dimentional",
-    "regulus",
-    "inflammation",
-    "intensifier",
-    "week's",
-    "antithesis",
-    "decedent",
-    "shouldn't",
-    "sister-in-law",
-    "rickety",
-    "log-jam",
-    "sharp-limbed",
-    "randomization",
-    "superimposing",
-    "colonized",
-    "mimetic",
-    "barking",
-    "90-day",
-    "employers'",
-    "sustained",
-    "bauble",
-    "watchdog",
-    "arequipa",
-    "dawson",
-    "profusion",
-    "1687",
-    "hallway",
-    "mindful",
-    "tax",
-    "bases",
-    "marriages",
-    "pater",
-    "gestures",
-    "heighten",
-    "snugly",
-    "leslie",
-    "adoption",
-    "festivals",
-    "exposition",
-    "expose",
-    "drouth",
-    "see-through",
-    "andrei's",
-    "pecs",
-    "shear",
-    "longrun",
-    "interests",
-    "lousiness",
-    "grieving",
-    "breaking-out",
-    "terrifying",
-    "scapulars",
-    "permanently",
-    "invader",
-    "labour",
-    "hysterical",
-    "ass'ns'",
-    "stephanie",
-    "poorer",
-    "villa",
-    "sub-station",
-    "auction",
-    "ukrainians",
-    "memorial",
-    "wildest",
-    "reluctance",
-    "nips",
-    "progressions",
-    "granny",
-    "industrialism",
-    "unqualified",
-    "anatomical",
-    "dimers",
-    "cabana",
-    "fingers",
-    "944",
-    "hit",
-    "expediency",
-    "haircut",
-    "bravely",
-    "manifestation",
-    "disregard",
-    "hours",
-    "radio-transmitter",
-    "mae",
-    "kabalevsky",
-    "versailles",
-    "chippendale",
-    "juggling",
-    "distributes",
-    "montgomery's",
-    "genii",
-    "gardenia",
-    "doing",
-    "transom",
-    "bunks",
-    "matching-fund",
-    "tony",
-    "criticizing",
-    "high",
-    "touches",
-    "hunter's",
-    "octave",
-    "cottages",
-    "non-competitive",
-    "eight-year",
-    "impatient",
-    "tertre",
-    "villages",
-    "flamboyantly",
-    "sank",
-    "s.s.",
-    "garnett",
-    "accepts",
-    "bushwhacked",
-    "tidbit",
-    "dwells",
-    "lyndon",
-    "$26.5-billion",
-    "tobin",
-    "modish",
-    "einsatzkommandos",
-    "bolsheviks",
-    "hepatitis",
-    "sinkt",
-    "export",
-    "jerry's",
-    "vices",
-    "impertinent",
-    "maximization",
-    "wonder-working",
-    "quintillion",
-    "mayfair",
-    "federal-question",
-    "deny",
-    "fatigued",
-    "belted",
-    "imagination",
-    "broun",
-    "seymour",
-    "tablespoonfuls",
-    "neisse-oder",
-    "rubdown",
-    "voluminous",
-    "constrictor",
-    "another",
-    "muong",
-    "predisposition",
-    "coupons",
-    "massachusetts'",
-    "jean-paul",
-    "colcord",
-    "rampart",
-    "combinations",
-    "swan",
-    "vice",
-    "blossoms",
-    "generalized",
-    "skulls",
-    "insurance",
-    "dishonest",
-    "cadillac",
-    "londoner",
-    "grasping",
-    "crusading",
-    "add",
-    "quadruple",
-    "borland",
-    "reunited",
-    "beholds",
-    "bridal",
-    "saudi",
-    "armistice",
-    "magician's",
-    "hydraulic",
-    "hayter",
-    "applied",
-    "1732",
-    "altitude",
-    "landscapes",
-    "therapist",
-    "stephen's",
-    "non-propagandistic",
-    "crew",
-    "beryl",
-    "270,000",
-    "washington's",
-    "oratio",
-    "7-6",
-    "scattered",
-    "trawler",
-    "skiff's",
-    "septillion",
-    "bodhisattva",
-    "chorale",
-    "illuminations",
-    "experientially",
-    "$740,000",
-    "carpentry",
-    "nozze",
-    "scope",
-    "slender-waisted",
-    "whatever",
-    "exorbitant",
-    "forefeet",
-    "syringe",
-    "disservice",
-    "reactivity",
-    "100-million-lb.",
-    "ch.",
-    "quadrupling",
-    "toe-tips",
-    "israelites",
-    "tales",
-    "alokut",
-    "councils",
-    "kasai",
-    "emergence",
-    "zones",
-    "caltech",
-    "backers",
-    "allan",
-    "excessive",
-    "burton",
-    "ernest",
-    "brumidi-costaggini",
-    "god",
-    "20-gauge",
-    "fielder's",
-    "improvisation",
-    "complaint",
-    "stooping",
-    "moraine's",
-    "shoelace",
-    "dialogue",
-    "bohemian",
-    "paranoid",
-    "kamikaze",
-    "litta",
-    "$44.3-billion",
-    "wash.",
-    "restlessness",
-    "penury",
-    "southwestern",
-    "respiratory",
-    "recompense",
-    "tranquilizers",
-    "spurned",
-    "clawed",
-    "go-to-war",
-    "nerien",
-    "arlene",
-    "imparts",
-    "l'osservatore",
-    "character",
-    "beauties",
-    "saint",
-    "totality",
-    "$754",
-    "intersection",
-    "chisel",
-    "intransigents",
-    "drivers'",
-    "streaming",
-    "anise",
-    "matter-of-factness",
-    "3-foot",
-    "keyboarding",
-    "aeschylus",
-    "diffusing",
-    "precipitating",
-    "readjustment",
-    "surcliffe",
-    "focussed",
-    "1932-33",
-    "paraoxon",
-    "sandwich-type",
-    "bay",
-    "agleam",
-    "pamper",
-    "bethought",
-    "comic",
-    "armor",
-    "sculptor's",
-    "jerebohms",
-    "tramped",
-    "sens.",
-    "shovels",
-    "mill",
-    "vagrant",
-    "pemberton",
-    "hunkerish",
-    "aspired",
-    "surround",
-    "obsessive",
-    "16.38",
-    "remuda",
-    "reports",
-    "allows",
-    "knite",
-    "plays",
-    "addressing",
-    "volatilization",
-    "lip-sucking",
-    "strokes",
-    "recumbent",
-    "corniest",
-    "too-hearty",
-    "malapropism",
-    "wailbri",
-    "fielding",
-    "unbreakable",
-    "agitation",
-    "upton",
-    "bleaching",
-    "auxiliaries",
-    "violets",
-    "faulkner's",
-    "lully",
-    "ahem",
-    "repentance",
-    "represent",
-    "yoorick",
-    "impresser",
-    "bilinear",
-    "i-th",
-    "exert",
-    "alcoholics",
-    "manse",
-    "girlish",
-    "maturation",
-    "decentralization",
-    "15%",
-    "skolovsky",
-    "bernie",
-    "1897-8",
-    "palmed",
-    "pitiable",
-    "crystallize",
-    "quoting",
-    "staked",
-    "hedonistic",
-    "prohibits",
-    "state-law",
-    "vinogradoff",
-    "operational",
-    "horrified",
-    "anybody's",
-    "southfield",
-    "stapling",
-    "ctca",
-    "obsessed",
-    "tapered",
-    "1963",
-    "shortsightedness",
-    "inglorious",
-    "cong",
-    "assigning",
-    "expulsion",
-    "centrifuged",
-    "per-year",
-    "tap",
-    "cannonball",
-    "uninjectable",
-    "grade-a",
-    "overfeed",
-    "teamwork",
-    "child",
-    "donned",
-    "dartmouth",
-    "ellipses",
-    "ham-like",
-    "mentally",
-    "miss.",
-    "blomdahl",
-    "$9.2",
-    "likeness",
-    "bridgehead",
-    "yachtels",
-    "robs",
-    "myth-making",
-    "tuck",
-    "22,807",
-    "commute",
-    "pricked",
-    "watch",
-    "lawrence's",
-    "politics",
-    "hoi-polloi",
-    "dishonored",
-    "gate",
-    "unleavened",
-    "1906",
-    "j.d.h.",
-    "supplemented",
-    "averaged",
-    "950",
-    "seasonal",
-    "individualists",
-    "zeiss",
-    "sam's",
-    "hegel's",
-    "leg",
-    "patchwork",
-    "vine-shaded",
-    "leroy",
-    "hon.",
-    "farvel-topsy",
-    "chartaceos",
-    "contriving",
-    "antisubmarine",
-    "canceled",
-    "pup",
-    "dekalb's",
-    "pre-employment",
-    "via",
-    "charged",
-    "detribalize",
-    "labelled",
-    "short-barrel",
-    "stern-faced",
-    "oystchers'll",
-    "novels",
-    "exacerbations",
-    "walter",
-    "fashions",
-    "conlow",
-    "evaluative",
-    "bregman",
-    "bucky",
-    "frohock",
-    "gray-backs",
-    "suited",
-    "telepathy",
-    "penalty",
-    "clowning",
-    "fascinated",
-    "estimates",
-    "regular",
-    "beheld",
-    "brown",
-    "g{t}",
-    "walpole",
-    "une",
-    "preparations",
-    "scrounging",
-    "segregated",
-    "dormitory",
-    "subconsciously",
-    "townley",
-    "sunburn",
-    "strolled",
-    "thompson's",
-    "inca",
-    "sac's",
-    "chardon",
-    "fabian",
-    "tropocollagen",
-    "4-under-par",
-    "anti-liquor",
-    "overshadow",
-    "arrests",
-    "joneses",
-    "acquisition",
-    "diametrically",
-    "interlining",
-    "rolls-royce",
-    "gradual",
-    "boom-boom-boom",
-    "greenberg",
-    "resounding",
-    "ingbar",
-    "near-equivalents",
-    "clad",
-    "bigotry",
-    "2-run",
-    "dugan",
-    "graff",
-    "days",
-    "stiffer",
-    "hamilton's",
-    "sox",
-    "recruiting",
-    "hemingway",
-    "comas",
-    "caloric",
-    "wow",
-    "pre-selling",
-    "pseudo-symmetric",
-    "stubbs",
-    "periodic",
-    "earth-week",
-    "meynell",
-    "adequately",
-    "ihmsen",
-    "thematic",
-    "lalauries'",
-    "shaw's",
-    "painstakingly",
-    "money-hungry",
-    "1200",
-    "spores",
-    "skiis",
-    "olim",
-    "admonished",
-    "processes",
-    "reeking",
-    "wrecked",
-    "carbonates",
-    "county's",
-    "stenton",
-    "chromatography",
-    "de-iodinate",
-    "apaches",
-    "hand-woven",
-    "speidel",
-    "continues",
-    "fortune",
-    "764",
-    "bonne",
-    "station's",
-    "thirst",
-    "unaccustomed",
-    "imprecise",
-    "three-inch",
-    "diminution",
-    "loins",
-    "adieu",
-    "incredibly",
-    "hugo",
-    "volley",
-    "ferraro",
-    "oep",
-    "roles",
-    "extramarital",
-    "prima-facie",
-    "stoker",
-    "equals",
-    "5-day",
-    "homage",
-    "snake-like",
-    "social-welfare",
-    "servanda",
-    "pro-tem",
-    "1600",
-    "windless",
-    "mite-box",
-    "headwaters",
-    "titillating",
-    "conspicuous",
-    "rowlands'",
-    "footnotes",
-    "ramey",
-    "mauling",
-    "precocity",
-    "reaching",
-    "1.8%",
-    "area's",
-    "reproach",
-    "informed",
-    "anticus",
-    "vacations",
-    "sharply",
-    "1,541,991",
-    "clasped",
-    "shann",
-    "gnawing",
-    "kerygma",
-    "light-reflecting",
-    "indecisively",
-    "flashes",
-    "mickey",
-    "chap.",
-    "shipman",
-    "self-redefinition",
-    "owning",
-    "catchee",
-    "lowe",
-    "shrunken",
-    "deplored",
-    "naebm",
-    "14.2",
-    "perennial",
-    "von",
-    "62-year-old",
-    "jam",
-    "ditcher",
-    "confreres",
-    "commentary",
-    "sinister",
-    "surprised",
-    "voce",
-    "combat-inflicted",
-    "nairo",
-    "intrigued",
-    "floodlit",
-    "imperil",
-    "meltzer",
-    "quench",
-    "thalbergs",
-    "termini",
-    "syrian",
-    "cooped",
-    "acids",
-    "romanticizing",
-    "barrette",
-    "amending",
-    "metal-cleaning",
-    "indulged",
-    "camp",
-    "dam",
-    "conditions",
-    "material",
-    "bevo",
-    "gastronomes",
-    "quietly",
-    "boucle",
-    "periphery",
-    "cooke",
-    "normal",
-    "golfing",
-    "28",
-    "macwhyte",
-    "fingerprinting",
-    "charley's",
-    "millionaires",
-    "touch",
-    "mason's",
-    "1577",
-    "asch",
-    "camel",
-    "krutch",
-    "gortonists",
-    "bagh",
-    "heffernan",
-    "vacuous",
-    "clerfayt",
-    "comes",
-    "prosecuting",
-    "schoolgirl",
-    "refund",
-    "busses",
-    "bouncy",
-    "spiral",
-    "five-home",
-    "field-sequential",
-    "welmers",
-    "governess",
-    "warrants",
-    "feet",
-    "top-ranking",
-    "thomas'",
-    "mah",
-    "odysseus",
-    "blessing",
-    "arabians",
-    "carolyn",
-    "membership",
-    "fenwick",
-    "sensations",
-    "1,400",
-    "pawcatuck",
-    "warranted",
-    "apollinaire",
-    "loyalists",
-    "erde",
-    "leash",
-    "involution",
-    "balcony",
-    "dwelling",
-    "considerately",
-    "lawrence",
-    "liston",
-    "counterflow",
-    "pompano",
-    "canker",
-    "istiqlal's",
-    "variegated",
-    "tedious",
-    "downstairs",
-    "174",
-    "eeg",
-    "politely",
-    "recognized",
-    "surpass",
-    "colonels",
-    "ghoul",
-    "trinity",
-    "harris's",
-    "revered",
-    "composure",
-    "parisina",
-    "seaweed",
-    "immortality",
-    "extend",
-    "strengthen",
-    "perinetti",
-    "rice",
-    "literate",
-    "thermoelectric",
-    "liquidating",
-    "lower-status",
-    "stationary",
-    "deference",
-    "docks",
-    "inapt",
-    "fittest",
-    "adverb",
-    "burnings",
-    "seein'",
-    "gunfire",
-    "yonder",
-    "rector's",
-    "architecture",
-    "accidental-war",
-    "flirt",
-    "yori",
-    "head-tossing",
-    "magpies",
-    "leashes",
-    "nostrils",
-    "patriotism",
-    "honour",
-    "auf",
-    "pompous",
-    "rhymes",
-    "fibrin",
-    "discipleship",
-    "undermining",
-    "7:25",
-    "shelley's",
-    "indiana's",
-    "youngish",
-    "incredible",
-    "self-deceiving",
-    "tanin",
-    "leasure",
-    "adnan",
-    "integrative",
-    "oppression",
-    "affliction",
-    "gascony",
-    "notably",
-    "faulkner",
-    "parsons",
-    "novelized",
-    "frankness",
-    "projector",
-    "ensue",
-    "soils",
-    "esther",
-    "brazenly",
-    "rock-like",
-    "breasts",
-    "gamblers",
-    "double-crossing",
-    "rumbling",
-    "throes",
-    "vowels",
-    "fury",
-    "watchers",
-    "pompeii",
-    "differentiable",
-    "song-writing",
-    "boutflower",
-    "perplexed",
-    "blasingame",
-    "supernaturalism",
-    "aptitudes",
-    "ineffectual",
-    "anglo-americans",
-    "discernable",
-    "givers",
-    "proceeded",
-    "builtin",
-    "fluorescent",
-    "informal",
-    "non-job-connected",
-    "albania",
-    "enrage",
-    "solomon",
-    "crumlish",
-    "sprig",
-    "hug",
-    "exonerate",
-    "swinburne",
-    "papp",
-    "formative",
-    "samar",
-    "light-flared",
-    "showered",
-    "studios",
-    "empties",
-    "quixotic",
-    "humanitarian",
-    "interviewing",
-    "ponchielli",
-    "except",
-    "stereotypes",
-    "laude",
-    "straightway",
-    "heartiest",
-    "bryan",
-    "five-days-a-week",
-    "louder",
-    "published",
-    "breaks",
-    "nicer",
-    "xavier",
-    "cancer",
-    "butter",
-    "singles",
-    "steuben",
-    "guarantee",
-    "you've",
-    "humilation",
-    "callously",
-    "tolerating",
-    "clifton",
-    "siren",
-    "inoperable",
-    "calories",
-    "elementary",
-    "archipelago",
-    "gobbles",
-    "beneficence",
-    "speedup",
-    "underscore",
-    "formality",
-    "reub",
-    "pieces",
-    "unhitched",
-    "wraps",
-    "gobbled",
-    "humped",
-    "steinberg",
-    "8,293",
-    "gilborn's",
-    "double-wall",
-    "believably",
-    "verne",
-    "radar-controlled",
-    "202",
-    "abated",
-    "konitz",
-    "mill-wheel",
-    "garter",
-    "stetson",
-    "chromatogram",
-    "clifford",
-    "400,000",
-    "alfredo",
-    "attributable",
-    "noses",
-    "obe",
-    "sheridan",
-    "susceptible",
-    "chore",
-    "columns",
-    "panama",
-    "paris'",
-    "sharing",
-    "vestments",
-    "heaven's",
-    "downright",
-    "calcium",
-    "decent",
-    "silhouette",
-    "manifested",
-    "indubitable",
-    "nuovo",
-    "virus",
-    "algaecide",
-    "country-squirehood",
-    "khaki",
-    "1-701",
-    "leibowitz",
-    "flogged",
-    "pictured",
-    "loire",
-    "unsheltered",
-    "mid-september",
-    "thirty-eight",
-    "loops",
-    "recited",
-    "concurrently",
-    "putted",
-    "lieutenants",
-    "uncap",
-    "incest",
-    "allegoric",
-    "mitigating",
-    "2991",
-    "profited",
-    "docters",
-    "dozens",
-    "shafer's",
-    "envisages",
-    "oleomargarine",
-    "cavities",
-    "galtier's",
-    "worked",
-    "37",
-    "squire's",
-    "stendhal",
-    "excitedly",
-    "numbered",
-    "sane",
-    "infiltrating",
-    "defiant",
-    "wt",
-    "ishii",
-    "x-gyro",
-    "avenue",
-    "unhesitant",
-    "slater's",
-    "trips",
-    "blackmer",
-    "spun",
-    "tyranny",
-    "irritates",
-    "thiocyanate-perchlorate-fluoro",
-    "edifying",
-    "boucher",
-    "1837",
-    "spiritually",
-    "accumulating",
-    "funnels",
-    "crossing",
-    "pezza",
-    "deceleration",
-    "sanest",
-    "ends",
-    "basho's",
-    "2-1/2",
-    "telegraphed",
-    "typographic",
-    "beds",
-    "collegians",
-    "sacrifices",
-    "220",
-    "teakwood",
-    "lacy",
-    "tess",
-    "y-gyro",
-    "littered",
-    "black-and-yellow",
-    "consummated",
-    "soak",
-    "accesses",
-    "bureau",
-    "berries",
-    "encomiums",
-    "dronk's",
-    "coverlet",
-    "angell",
-    "ten-fifty-five",
-    "georges",
-    "morality",
-    "coexistence",
-    "affections",
-    "davidson's",
-    "indorsed",
-    "affirm",
-    "rents",
-    "joked",
-    "accentuated",
-    "talks",
-    "fresnel",
-    "syndicate's",
-    "whisky-on-the-rocks",
-    "ivy-covered",
-    "collecting",
-    "trapper",
-    "hasten",
-    "alix's",
-    "purposeless",
-    "phyfe",
-    "concept",
-    "inquisitor",
-    "wallace",
-    "snakes",
-    "bromley",
-    "borden",
-    "secretariate",
-    "saturation",
-    "losses",
-    "white-stucco",
-    "solution",
-    "clipped",
-    "spire",
-    "photographs",
-    "made",
-    "sabotage",
-    "surroundings",
-    "adverbs",
-    "pathet",
-    "rose-tea",
-    "refrained",
-    "good-size",
-    "betty",
-    "tammany",
-    "hale's",
-    "bands",
-    "weissmuller",
-    "likelihood",
-    "fabrication",
-    "dade's",
-    "105-degrees-f",
-    "trusteeship",
-    "hotelman's",
-    "canadian's",
-    "1514",
-    "mediterranean",
-    "balm-of-gilead",
-    "anemated",
-    "smoky",
-    "rations",
-    "transversally",
-    "sullying",
-    "honeybees",
-    "irreversible",
-    "unsolder",
-    "street",
-    "230",
-    "maria",
-    "crickets",
-    "continuation",
-    "tinplated",
-    "electrolysis",
-    "responsive",
-    "ransacked",
-    "masonry",
-    "ballot",
-    "talismanic",
-    "keeler",
-    "kool-aid",
-    "donnay",
-    "livability",
-    "ubermenschen",
-    "maecker",
-    "300th",
-    "sweated",
-    "shelagh",
-    "carrier-based",
-    "dundeen",
-    "profoundest",
-    "idiocies",
-    "asymmetry",
-    "rosalie",
-    "$1.60",
-    "jacket",
-    "decorators",
-    "ahrens",
-    "assessors",
-    "thirty-ninth",
-    "members",
-    "preconditions",
-    "1936",
-    "whyfores",
-    "eye-machine",
-    "backstitching",
-    "overheating",
-    "heaviness",
-    "corp.",
-    "coalesced",
-    "decrying",
-    "lancret",
-    "ground-swell",
-    "bloodspots",
-    "arclike",
-    "fourth-flight",
-    "gentile-jewish",
-    "embezzlement",
-    "corns",
-    "egypt",
-    "skirmishers",
-    "banding",
-    "double-glaze",
-    "consuming",
-    "mining",
-    "bump",
-    "ah-ah",
-    "captors",
-    "larry",
-    "proneness",
-    "diagram",
-    "dealers'",
-    "excelsior",
-    "vulture-like",
-    "consequent",
-    "2:34.2",
-    "boris",
-    "combe",
-    "busy",
-    "prelude",
-    "humorists",
-    "gem",
-    "gregorio",
-    "adc",
-    "emotional",
-    "interspersed",
-    "deadwood",
-    "homosexuals",
-    "herrin-murphysboro-west",
-    "nawt",
-    "achaeans'",
-    "forthright",
-    "hmpf",
-    "effluents",
-    "1830",
-    "reaping",
-    "overworked",
-    "apostles",
-    "edgy",
-    "multicolored",
-    "grandmothers",
-    "adaptation",
-    "henley's",
-    "refer",
-    "trusting",
-    "hilo",
-    "recently",
-    "hypnotically",
-    "footwork",
-    "user",
-    "mirrored",
-    "foxx",
-    "generalize",
-    "projects",
-    "taxpayers'",
-    "behave",
-    "rightist",
-    "party-line",
-    "preceded",
-    "indefinite",
-    "s.",
-    "radiate",
-    "sansome",
-    "vroman",
-    "dewdrops",
-    "1930s",
-    "install",
-    "lily",
-    "coloured",
-    "panza",
-    "omission",
-    "months",
-    "moscow",
-    "ventilates",
-    "cameras",
-    "misinterpret",
-    "repository",
-    "narrower",
-    "second-floor",
-    "understates",
-    "3-run",
-    "briton",
-    "pinching",
-    "enrolling",
-    "liebler",
-    "helmut",
-    "hoffa",
-    "fates",
-    "underline",
-    "detest",
-    "writing-like",
-    "alfa",
-    "pagnol",
-    "alvarez",
-    "scudding",
-    "dalton's",
-    "anti-human",
-    "dreadful",
-    "welts",
-    "yuki",
-    "distantly",
-    "kneecap",
-    "faget",
-    "smitten",
-    "brooken",
-    "salves",
-    "higher-priced",
-    "computed",
-    "taney's",
-    "timidity",
-    "freight-bums",
-    "pulled",
-    "mighty",
-    "modest",
-    "bethel",
-    "pensacola",
-    "retouching",
-    "stylist",
-    "among",
-    "addle-brained",
-    "splurge",
-    "shadow",
-    "neurologist",
-    "marmee",
-    "soft-heartedness",
-    "chauffeur-driven",
-    "leesona-holt",
-    "wyckoff",
-    "vapor-pressure",
-    "infirmity",
-    "by-products",
-    "ticklebrush",
-    "barsacs",
-    "lamechians",
-    "scoundrels",
-    "provoked",
-    "shiningly",
-    "raffish",
-    "inmates",
-    "thermostats",
-    "security",
-    "shipwreck",
-    "abdominal",
-    "levinger's",
-    "pasternak",
-    "go-it-alone",
-    "500",
-    "tramway",
-    "sobriety",
-    "directionally",
-    "caverns",
-    "heel-kaola",
-    "steamer",
-    "overpopulation",
-    "husky",
-    "city",
-    "walters",
-    "chortling",
-    "governments",
-    "inside",
-    "huge",
-    "prabang",
-    "clov",
-    "n-no",
-    "president",
-    "elevates",
-    "gaussian",
-    "eccentric",
-    "hopedale",
-    "albanian",
-    "traditional",
-    "criminals",
-    "robe",
-    "influences",
-    "subjectivists",
-    "offers",
-    "airflow",
-    "vasady",
-    "low-heeled",
-    "grave",
-    "totalitarianism",
-    "plight",
-    "$15,000,000",
-    "arose",
-    "franchises",
-    "eludes",
-    "pearson",
-    "lifeboats",
-    "onslaughts",
-    "cardboard",
-    "grows",
-    "holbrook",
-    "portrays",
-    "7-day",
-    "materialism",
-    "successful",
-    "koehler",
-    "countryman",
-    "schone",
-    "inflate",
-    "misses",
-    "atlanta",
-    "sluggers",
-    "strangely",
-    "refugees",
-    "constituents",
-    "non-existent",
-    "carbondale",
-    "counter-efforts",
-    "meal",
-    "freeze",
-    "frustrating",
-    "secular",
-    "offspring",
-    "akin",
-    "beadles'",
-    "fist-fighting",
-    "shed",
-    "auto-limitation",
-    "interpolated",
-    "pilots",
-    "frizzled",
-    "beauty-idiom",
-    "personalized",
-    "painfully",
-    "impediment",
-    "batista",
-    "five",
-    "claustrophobia",
-    "saucepan",
-    "worm",
-    "plans",
-    "slaps",
-    "pitch",
-    "milquetoast",
-    "mts.",
-    "worker",
-    "thomas's",
-    "flatten",
-    "1903",
-    "presents",
-    "tussard's",
-    "rainier",
-    "burlesque",
-    "victory",
-    "cousins",
-    "non-publishers",
-    "bay-front",
-    "free-will",
-    "revolutionary",
-    "rather",
-    "1902",
-    "two-nosed",
-    "escapes",
-    "17e",
-    "watching",
-    "half-breed",
-    "mrs",
-    "pluralism",
-    "foreman's",
-    "fine-looking",
-    "lovable",
-    "gotten",
-    "howling",
-    "doolittle's",
-    "sputtered",
-    "ciliated",
-    "8,100",
-    "qualitative",
-    "snickered",
-    "utopianism",
-    "illustrated",
-    "subordinate",
-    "228-229",
-    "5,000",
-    "dictionary's",
-    "forbad",
-    "motel-keeping",
-    "cicero's",
-    "soft-drinks",
-    "shivery",
-    "year-long",
-    "yorker's",
-    "co-chairmen",
-    "2274",
-    "atop",
-    "clomped",
-    "stunts",
-    "insults",
-    "contractor",
-    "bridges",
-    "torso",
-    "internal-external",
-    "textiles",
-    "multipurpose",
-    "haircuts",
-    "funds",
-    "scheherazade",
-    "laudably",
-    "o'",
-    "$46.7",
-    "exception",
-    "shamefacedly",
-    "underground",
-    "h.m.",
-    "maskers'",
-    "swadesh's",
-    "2:22",
-    "two",
-    "galley",
-    "raucously",
-    "1/2''",
-    "sexual",
-    "hand-crafted",
-    "u.s.-soviet",
-    "deficiencies",
-    "repulsion",
-    "sky-tapping",
-    "lawford",
-    "malingering",
-    "blaber",
-    "asylum",
-    "ter-stepanova",
-    "dejeuners",
-    "organ",
-    "dilute",
-    "persuasively",
-    "octillion",
-    "energetic",
-    "lotions",
-    "releasing",
-    "act",
-    "1945",
-    "oxidised",
-    "nervous",
-    "spokane",
-    "enlightened",
-    "103",
-    "far-away",
-    "violinists",
-    "aura",
-    "allocations",
-    "siva",
-    "unheeded",
-    "activity",
-    "depreciation",
-    "wavelength",
-    "parichy-hamm",
-    "yachtsmen",
-    "ball's",
-    "preludes",
-    "fearless",
-    "confuses",
-    "mellowed",
-    "lullwater",
-    "dipper",
-    "d'entretenir",
-    "whimsical",
-    "terminology",
-    "countries",
-    "mundt",
-    "importantly",
-    "sidemen",
-    "invocation",
-    "jose",
-    "cliburn",
-    "solvents",
-    "alter-parents",
-    "demanding",
-    "victorian",
-    "elaine",
-    "bubbles",
-    "stillbirths",
-    "sr.",
-    "here",
-    "engraved",
-    "thaw",
-    "footfall",
-    "bays",
-    "casebook",
-    "catcher",
-    "gap",
-    "durkin",
-    "dowex-2-chloride",
-    "preponderance",
-    "administrative",
-    "hitherto",
-    "stairwells",
-    "prosser",
-    "suspensor",
-    "contrarily",
-    "canals",
-    "teen-agers'",
-    "nato",
-    "dependence",
-    "popped",
-    "lulu",
-    "milliliter",
-    "sniff",
-    "above",
-    "icc",
-    "omaha",
-    "pronto",
-    "potboilers",
-    "conneaut",
-    "mutilated",
-    "undereducated",
-    "giffen's",
-    "analyses",
-    "sticks",
-    "venerated",
-    "decorating",
-    "nurse",
-    "7,484,268",
-    "wondrous",
-    "closeups",
-    "nonmagical",
-    "streetcars",
-    "newlyweds",
-    "budding",
-    "deadened",
-    "dominance",
-    "dummkopf",
-    "incensed",
-    "budapest",
-    "flagpoles",
-    "caution",
-    "reminisced",
-    "ronald",
-    "alibis",
-    "schoolmaster",
-    "high-set",
-    "werther",
-    "leavings",
-    "totals",
-    "coyness",
-    "experiments",
-    "miscellanies",
-    "unleashed",
-    "non-professional",
-    "gathers",
-    "wire",
-    "wavy",
-    "continuous",
-    "burghardt",
-    "warmup",
-    "manpower",
-    "concertos",
-    "oct.",
-    "disgusted",
-    "nigras",
-    "bremsstrahlung",
-    "schools",
-    "renewal",
-    "lecher",
-    "elation",
-    "relaxation",
-    "rhinos",
-    "disregarding",
-    "motional-modified",
-    "son's",
-    "wolff",
-    "citations",
-    "convertible",
-    "seek",
-    "hirsch's",
-    "maddening",
-    "accusing",
-    "gaucheries",
-    "stimulant",
-    "grabbing",
-    "1680",
-    "paper",
-    "bifocals",
-    "requiring",
-    "wants",
-    "zooey",
-    "origination",
-    "showman",
-    "flaunted",
-    "confirmation",
-    "menu",
-    "spencer's",
-    "blinding",
-    "stag",
-    "kornevey",
-    "reciting",
-    "bismark",
-    "suspend",
-    "liberalizing",
-    "low-boiling",
-    "corner",
-    "hath",
-    "thurman",
-    "six-man",
-    "parodied",
-    "subcommittee",
-    "bland",
-    "soul-searching",
-    "bockwurst",
-    "corpuscular-radiation",
-    "fitch",
-    "frighten",
-    "anti-semite",
-    "protons",
-    "outline",
-    "worth-waiting-for",
-    "denouement",
-    "easy-going",
-    "low-class",
-    "compared",
-    "repression",
-    "60%",
-    "weight-height",
-    "fuzz",
-    "64-cent",
-    "decca",
-    "rottosei",
-    "brushfire",
-    "heroin",
-    "charley",
-    "intergovernmental",
-    "rim-fires",
-    "800's",
-    "neo-paganism",
-    "carboxymethyl",
-    "sonofabitch",
-    "intemperance",
-    "marries",
-    "swiping",
-    "adventurous",
-    "supersensitive",
-    "labels",
-    "grammar",
-    "marital",
-    "pap-pap-pap-hey",
-    "rate",
-    "unrewarding",
-    "geraldine",
-    "leland",
-    "football's",
-    "toppling",
-    "unwounded",
-    "non-dealer",
-    "spirituals",
-    "sincere",
-    "prior",
-    "pertained",
-    "insisted",
-    "willed",
-    "citation",
-    "consulate",
-    "arcade",
-    "haddock",
-    "social-economic",
-    "mon-columbia",
-    "stratagems",
-    "ada",
-    "refunded",
-    "soldiers",
-    "eyelids",
-    "1,257,700",
-    "pocket-size",
-    "cyclist",
-    "hollered",
-    "eyke",
-    "argument",
-    "structurally",
-    "inspire",
-    "charter",
-    "gorton's",
-    "burdens",
-    "respondents'",
-    "body's",
-    "utmost",
-    "medallions",
-    "glaze",
-    "nuper",
-    "transferring",
-    "dowling's",
-    "interns",
-    "introspective",
-    "fast-spreading",
-    "unkind",
-    ".",
-    "raftered",
-    "tennis",
-    "overpopulated",
-    "hoagy",
-    "mid-october",
-    "scala",
-    "incautious",
-    "iroquois",
-    "one-twentieth",
-    "equidistantly",
-    "whereever",
-    "discovered",
-    "dorens",
-    "juras",
-    "it",
-    "downtalking",
-    "clubhouse",
-    "relyriced",
-    "expended",
-    "insulating",
-    "englander",
-    "chatty",
-    "mosk",
-    "mcfeeley",
-    "black-haired",
-    "fortman",
-    "laughter",
-    "fruit",
-    "germinate",
-    "relocation",
-    "safe-cracking",
-    "assented",
-    "shielding",
-    "upward-mobile",
-    "sterling",
-    "floe",
-    "327",
-    "hurtled",
-    "flashback",
-    "herry's",
-    "forbes",
-    "miscarried",
-    "attitudes",
-    "pavlovitch",
-    "effectiveness",
-    "goutte",
-    "coke",
-    "prodigal",
-    "purloined",
-    "jossy",
-    "certain",
-    "frightening",
-    "courted",
-    "consulting",
-    "delhi",
-    "memorize",
-    "housebreakers",
-    "looked",
-    "non-exempt",
-    "densitometry",
-    "bit",
-    "forgitful",
-    "perfectionists",
-    "subspace",
-    "officialdom",
-    "convexity",
-    "mae's",
-    "innumerable",
-    "babes",
-    "adios-direct",
-    "tunisian",
-    "overexcited",
-    "prayerful",
-    "handier",
-    "lapels",
-    "mesmerized",
-    "nephews",
-    "prayer-requests",
-    "biddies",
-    "monolithic",
-    "misshapen",
-    "freezes",
-    "visions",
-    "circumlocution",
-    "portrait",
-    "bouncing",
-    "uptown",
-    "independence",
-    "paid",
-    "unmanageably",
-    "hard's",
-    "l-5-vinyl-2-thio-oxazolidone",
-    "black-tipped",
-    "photo",
-    "169",
-    "white-shirted",
-    "resorcinol",
-    "satisfaction",
-    "h.m.s.",
-    "assailant",
-    "threatening",
-    "shill",
-    "swindling",
-    "coasts",
-    "satisfactorily",
-    "programs",
-    "bundles",
-    "filly",
-    "nice-looking",
-    "krim's",
-    "galli",
-    "prolonged",
-    "frescoed",
-    "timeliness",
-    "4911",
-    "method",
-    "cry",
-    "silkworms",
-    "hys",
-    "pastor's",
-    "debilitating",
-    "propeller",
-    "furloughed",
-    "whitfield",
-    "cadillacs",
-    "9th",
-    "musings",
-    "coolers",
-    "contentment",
-    "deadline",
-    "bimolecular",
-    "performer",
-    "aback",
-    "4,622,444",
-    "gasoline",
-    "loosen",
-    "roughness",
-    "acetone",
-    "federalism",
-    "parked",
-    "ornery",
-    "blockages",
-    "was",
-    "ultramodern",
-    "translations",
-    "clap",
-    "lightning",
-    "hackneyed",
-    "ellison's",
-    "monmouth",
-    "dual-channel",
-    "municipally",
-    "authorities",
-    "pilgrim's",
-    "o'gara",
-    "projective",
-    "interdependence",
-    "germ",
-    "looks",
-    "pole",
-    "dismissal",
-    "prayerbooks",
-    "bronchus",
-    "seducer",
-    "job-seekers",
-    "coiling",
-    "milhaud's",
-    "endeavored",
-    "greasy",
-    "vikings",
-    "licensee",
-    "julio",
-    "hone",
-    "indeterminate",
-    "preferring",
-    "outgoing",
-    "stoll",
-    "rifling",
-    "zoned",
-    "22-day",
-    "translucence",
-    "visitor",
-    "hoped",
-    "spoiled",
-    "surface-active",
-    "synthesised",
-    "faceless",
-    "cat-like",
-    "befuddling",
-    "bryan's",
-    "sizable",
-    "nos",
-    "fingered",
-    "lester",
-    "breakups",
-    "decried",
-    "ab63711-r",
-    "feler",
-    "1590",
-    "multitudinous",
-    "illustrates",
-    "staid",
-    "ron",
-    "sylphide",
-    "lev",
-    "woonasquatucket",
-    "democracy",
-    "ailey's",
-    "four-letter",
-    "bridged-t",
-    "loudly",
-    "gnarled",
-    "cranelike",
-    "trinitarians",
-    "astronomer",
-    "gemeinschaft",
-    "structured",
-    "taxi",
-    "expressway",
-    "embattled",
-    "visualize",
-    "ones",
-    "creations",
-    "earlier",
-    "72",
-    "vindication",
-    "underscored",
-    "norris-laguardia",
-    "dieu",
-    "corporeal",
-    "output-axis",
-    "sellout",
-    "sixties'",
-    "receave",
-    "maturing",
-    "admits",
-    "corny",
-    "petey",
-    "blithe",
-    "compressor",
-    "charge",
-    "allotment",
-    "phantom",
-    "albeit",
-    "cennini",
-    "f'ovuh",
-    "neuromuscular",
-    "rebuked",
-    "delicacies",
-    "multnomah",
-    "thynne",
-    "jefferson's",
-    "$5000",
-    "book's",
-    "plain",
-    "tours",
-    "showed",
-    "copybooks",
-    "energy",
-    "feasible",
-    "geo-political",
-    "beneath",
-    "amulets",
-    "wert",
-    "somethin",
-    "unintentionally",
-    "ontologically",
-    "sandburgs",
-    "midwest",
-    "sprout",
-    "hemlocks",
-    "possess",
-    "towels",
-    "green's",
-    "dealer",
-    "luxurious",
-    "intention",
-    "lenny",
-    "fazio",
-    "screw-loose",
-    "viscometer",
-    "stockgrowers'",
-    "drooped",
-    "5/16''",
-    "hair-raising",
-    "outcast",
-    "sorority",
-    "aficionado",
-    "caltech's",
-    "correctness",
-    "08",
-    "reconvention",
-    "mustached",
-    "vibration",
-    "lyrical",
-    "escorts",
-    "gassing",
-    "ptolemy's",
-    "conviction",
-    "elaborate",
-    "complacency",
-    "v",
-    "thug",
-    "fountain-falls",
-    "throttled",
-    "forgetful",
-    "hutchins'",
-    "towering",
-    "charmingly",
-    "derivation",
-    "papal",
-    "into",
-    "1940's",
-    "promotional",
-    "augustine",
-    "slavs",
-    "hijackers",
-    "wealthiest",
-    "thermostat",
-    "voices",
-    "tall-tale",
-    "over-night",
-    "roomful",
-    "outmoded",
-    "jenni's",
-    "gags",
-    "courtyard",
-    "illumined",
-    "give",
-    "plenty",
-    "passos",
-    "chinning",
-    "cometh",
-    "impatience",
-    "orally",
-    "emaciated",
-    "funk",
-    "skeleton",
-    "sniper's",
-    "posterity",
-    "lover",
-    "prosaic",
-    "volunteered",
-    "sieve",
-    "surge",
-    "mahone",
-    "moffett",
-    "rak",
-    "expanding",
-    "guerilla",
-    "delenda",
-    "evzone",
-    "deception",
-    "hiring",
-    "feel",
-    "adlai",
-    "complied",
-    "vietnamese",
-    "recognizing",
-    "suggestibility",
-    "unfastened",
-    "designates",
-    "sun",
-    "rustler",
-    "subscription",
-    "titian-haired",
-    "moiseyev",
-    "repulsions",
-    "baptized",
-    "short-story",
-    "shulde",
-    "minstrels",
-    "sluices",
-    "tensile",
-    "jumped",
-    "fixing",
-    "weep",
-    "harsh",
-    "ceylon",
-    "dussa",
-    "essayists",
-    "restitution",
-    "re-explore",
-    "weapons",
-    "ciardi",
-    "studies",
-    "pose",
-    "formulate",
-    "c'",
-    "speaks",
-    "hydrogen",
-    "exit",
-    "implies",
-    "b.",
-    "mental",
-    "hocking",
-    "boisterous",
-    "dissolved",
-    "played-out",
-    "$250,000",
-    "bald",
-    "mcbride",
-    "coating",
-    "hoe-down",
-    "beneficiary",
-    "fugual",
-    "aida",
-    "bodes",
-    "tugging",
-    "passion",
-    "shots",
-    "parmer",
-    "underwriting",
-    "chew",
-    "shiver",
-    "invariably",
-    "400,000,000",
-    "large-area",
-    "limps",
-    "skopas",
-    "conveniently",
-    "af-values",
-    "rhythmic",
-    "ellipsoids",
-    "mound",
-    "shin",
-    "bloodshed",
-    "neatness",
-    "schizophrenic",
-    "blooming",
-    "braud",
-    "metre",
-    "flashy",
-    "solipsism",
-    "cobbler's",
-    "simmered",
-    "ordinary",
-    "familiarness",
-    "collarbone",
-    "existentialist",
-    "alice",
-    "re-export",
-    "repairs",
-    "osmium",
-    "imprudently",
-    "sanguineum",
-    "drexel's",
-    "bible",
-    "uncorked",
-    "helplessly",
-    "administers",
-    "shh",
-    "indicating",
-    "f.",
-    "tune-belly",
-    "unwaivering",
-    "creatively",
-    "hyped-up",
-    "closing",
-    "syllable",
-    "shakers",
-    "dever",
-    "betrayer",
-    "pre-determined",
-    "provisons",
-    "detergency",
-    "dissents",
-    "levies",
-    "catches",
-    "maureen",
-    "barometric",
-    "hopkins",
-    "cryptic",
-    "depredations",
-    "stave",
-    "vague",
-    "affords",
-    "oversoft",
-    "ainus",
-    "52nd",
-    "savory",
-    "housewives",
-    "3,500",
-    "assured",
-    "meehan",
-    "bitterest",
-    "mortals",
-    "australia",
-    "seventy",
-    "theft",
-    "sneezed",
-    "ship-to-surface",
-    "caroli",
-    "65,000",
-    "datelined",
-    "banana",
-    "stalingr",
-    "mournfully",
-    "dearly",
-    "displaces",
-    "preserved",
-    "rychard",
-    "vectors",
-    "declamatory",
-    "experimentation",
-    "bah",
-    "yeni",
-    "monei",
-    "cuba",
-    "singularly",
-    "notified",
-    "raft",
-    "thirsty",
-    "3-48",
-    "nonreactivity",
-    "heliopolis",
-    "plumb",
-    "arbogast",
-    "greed",
-    "prohibition",
-    "cuba's",
-    "praised",
-    "exboyfriend",
-    "hawaii",
-    "queued",
-    "fuse",
-    "burnside's",
-    "pained",
-    "sturley's",
-    "circled",
-    "glendale",
-    "civilizing",
-    "misconstructions",
-    "us",
-    "spots",
-    "deuterated",
-    "kirby's",
-    "bothers",
-    "mutter",
-    "masons",
-    "dismally",
-    "nagrin's",
-    "trailing",
-    "drawling",
-    "abraham",
-    "abigail",
-    "confessed",
-    "schuyler's",
-    "anta",
-    "mares",
-    "embarked",
-    "inducted",
-    "romans",
-    "hell-raising",
-    "arguments",
-    "quackery",
-    "give-away",
-    "rimbaud",
-    "fiction",
-    "isotonic",
-    "less-indomitable",
-    "munching",
-    "122",
-    "eminence",
-    "lucy's",
-    "barracks",
-    "merciful",
-    "oxaloacetic",
-    "sulkily",
-    "howsomever",
-    "dismissing",
-    "agnostics",
-    "hydrolysis",
-    "kayabashi-san",
-    "staved",
-    "kieffer",
-    "sip",
-    "make-ready",
-    "unprovocative",
-    "muck's",
-    "1773",
-    "caesar",
-    "rockaways",
-    "spike",
-    "norths",
-    "writhed",
-    "unknowing",
-    "dependents",
-    "memos",
-    "poised",
-    "runabout",
-    "cavaliere",
-    "blackberry",
-    "nightly",
-    "jedec",
-    "emerald",
-    "awarding",
-    "pubescent",
-    "energetically",
-    "affiliated",
-    "o'er",
-    "334",
-    "1868",
-    "gop",
-    "insulation",
-    "unbridled",
-    "wilson",
-    "500-mile",
-    "sisters",
-    "cortex",
-    "communicators",
-    "sweetheart-secretary",
-    "liability",
-    "delaney",
-    "barley",
-    "superintendents",
-    "impromptu",
-    "stockholder",
-    "hardness",
-    "washbowl",
-    "potters",
-    "stupendous",
-    "three-hundred-foot",
-    "echo",
-    "benches",
-    "beauteous",
-    "providing",
-    "one-horse",
-    "arvey",
-    "city-bred",
-    "mahmoud",
-    "polyanka",
-    "revamping",
-    "nightfall",
-    "coax",
-    "evocation",
-    "nobody'd",
-    "hearings",
-    "falsehood",
-    "shunned",
-    "alarming",
-    "best-known",
-    "oilman-rancher",
-    "disbursements",
-    "post-graduate",
-    "marshlands",
-    "angelina",
-    "commandeered",
-    "men's",
-    "gotta",
-    "night-coach",
-    "broxodent",
-    "reine",
-    "pleasures",
-    "blackmailer",
-    "useless",
-    "subway",
-    "parades",
-    "honey",
-    "unflattering",
-    "sewers",
-    "panels",
-    "laity",
-    "probed",
-    "lowell's",
-    "11,330",
-    "worrisome",
-    "premonitory",
-    "medico-military",
-    "capita",
-    "sensual",
-    "46%",
-    "intradepartmental",
-    "hydrocarbon",
-    "scampering",
-    "borderlands",
-    "absorbing",
-    "averages",
-    "bothersome",
-    "stranger",
-    "hwang",
-    "resistances",
-    "dooleys",
-    "hanover-supermarket",
-    "threads",
-    "conjunction",
-    "trade",
-    "africa",
-    "hip",
-    "old-style",
-    "predictable",
-    "sprawling",
-    "come-uppance",
-    "guitars",
-    "oxidation",
-    "jetting",
-    "wistfully",
-    "heterozygous",
-    "half-melted",
-    "foreshortened",
-    "forgiven",
-    "nop",
-    "fifty-third",
-    "sportsmen's",
-    "wink",
-    "shotgun",
-    "carpenter's",
-    "amplifiers",
-    "backward",
-    "biological",
-    "axioms",
-    "majorities",
-    "busily",
-    "spiked",
-    "verve",
-    "blissfully",
-    "blum",
-    "stodgy",
-    "upsetting",
-    "sih",
-    "self-sufficiency",
-    "aber",
-    "plato",
-    "purcell",
-    "collins",
-    "dexamethasone",
-    "termination",
-    "acts",
-    "hammons",
-    "weary",
-    "commander",
-    "necrotic",
-    "coupe",
-    "recommends",
-    "kader",
-    "bolshevism",
-    "debutante",
-    "yooee",
-    "guinea",
-    "preliterate",
-    "gelding",
-    "withstand",
-    "gouverne",
-    "chaffey",
-    "unifying",
-    "improvise",
-    "departure",
-    "excellent",
-    "consonants",
-    "vomica",
-    "engulfing",
-    "withdrawing",
-    "magnetized",
-    "upgrade",
-    "combination",
-    "midst",
-    "l",
-    "cubed",
-    "quivering",
-    "branches",
-    "ever-increasing",
-    "84-foot",
-    "trenchermen",
-    "experiencing",
-    "chanced",
-    "tva",
-    "planetary",
-    "accelerations",
-    "sapping",
-    "friable",
-    "borrowing",
-    "swamped",
-    "emotionally",
-    "gut",
-    "enthalpy",
-    "uk",
-    "passavant",
-    "1785",
-    "remain",
-    "construing",
-    "spark",
-    "lavallade",
-    "jungle",
-    "disobedient",
-    "leona",
-    "pouted",
-    "lower",
-    "bexar",
-    "40,000",
-    "nine-game",
-    "bellicosity",
-    "encircle",
-    "majesty",
-    "predicting-machines",
-    "demythologization",
-    "dog-eared",
-    "coarse",
-    "aide",
-    "badge-toter",
-    "lenin's",
-    "marriage",
-    "crackle",
-    "6-degrees-c",
-    "victims",
-    "comprises",
-    "long-life",
-    "shows",
-    "contortion",
-    "deep-seated",
-    "wycoff",
-    "meet",
-    "warrenton",
-    "isomers",
-    "rock-and-roll",
-    "noiseless",
-    "appended",
-    "scholarship",
-    "junkerdom",
-    "temperature",
-    "out-of-school",
-    "transcending",
-    "dimensioning",
-    "constrictions",
-    "nimbler",
-    "humphrey",
-    "bargains",
-    "consolidate",
-    "gibbet",
-    "athletes",
-    "2,700,877",
-    "cooper's",
-    "nature's",
-    "requests",
-    "chip",
-    "does",
-    "piped",
-    "wiley",
-    "thinking",
-    "maris's",
-    "comiskey",
-    "'em",
-    "builder's",
-    "faciunt",
-    "ex-jazz",
-    "ages",
-    "bromphenol",
-    "bulging",
-    "nomenclature",
-    "edna",
-    "ushered",
-    "functions",
-    "redefinition",
-    "school-age",
-    "musial",
-    "stage",
-    "cadet",
-    "stores",
-    "target",
-    "co-op",
-    "chanceries",
-    "mistrial",
-    "non-catholic",
-    "deliberately",
-    "kawecki",
-    "employs",
-    "indelibly",
-    "138",
-    "manin",
-    "anniversaries",
-    "soviets",
-    "during",
-    "speech-making",
-    "limp",
-    "re-enactment",
-    "lovingood",
-    "injury",
-    "bent",
-    "exceeding",
-    "cleverly",
-    "besset",
-    "ballets",
-    "childishly",
-    "$222",
-    "breed's",
-    "entrenched",
-    "flash-bulbs",
-    "sartoris",
-    "chainlike",
-    "change-over",
-    "scuffle",
-    "springtime",
-    "satisfy",
-    "probabilistic",
-    "capello",
-    "self-centered",
-    "freckles",
-    "dead-end",
-    "contractors",
-    "dressing",
-    "punster",
-    "spidery",
-    "regular-featured",
-    "pyrophosphate",
-    "schlesinger",
-    "inform",
-    "nakedly",
-    "jackboots",
-    "vapor",
-    "1516",
-    "353",
-    "transmission",
-    "yea",
-    "announcer's",
-    "mosaics",
-    "eliminations",
-    "fulton",
-    "aid's",
-    "advancement",
-    "directors",
-    "823",
-    "convalescence",
-    "hotrod",
-    "wieners",
-    "shuns",
-    "keith",
-    "odyssey",
-    "tools",
-    "houghton",
-    "sales-conscious",
-    "dread",
-    "colossus",
-    "cestre",
-    "compressibility",
-    "unopened",
-    "operative",
-    "ptc",
-    "2-liter",
-    "thin-lipped",
-    "bewilderingly",
-    "castanets",
-    "clods",
-    "reflection",
-    "midpoint",
-    "safe-conduct",
-    "maturity",
-    "rotunda",
-    "vivacity",
-    "gun",
-    "last-minute",
-    "bolts",
-    "24-inch",
-    "wobbly",
-    "mackinack",
-    "language",
-    "dream-torkin",
-    "leesona",
-    "vowel",
-    "assessor's",
-    "effecting",
-    "700",
-    "yuri",
-    "joins",
-    "slits",
-    "epiphysis",
-    "dellwood",
-    "kaiser",
-    "house-cleaning",
-    "relevance",
-    "izaak",
-    "furnaces",
-    "underarm",
-    "gives",
-    "romped",
-    "incurably",
-    "port",
-    "scratches",
-    "discern",
-    "efficiently",
-    "homicidal",
-    "examine",
-    "revulsion",
-    "engagingly",
-    "toilsome",
-    "funniest",
-    "vandiver",
-    "pipeline",
-    "2688",
-    "surreptitious",
-    "pallet",
-    "shifters",
-    "michelangelo",
-    "obstinate",
-    "stimulate",
-    "sethness",
-    "relying",
-    "yellow",
-    "yorktown",
-    "draw-file",
-    "salem",
-    "accomplished",
-    "expansive",
-    "grist",
-    "appreciably",
-    "role-experiment",
-    "systematizing",
-    "mildly",
-    "perspective",
-    "leaps",
-    "wetly",
-    "verity",
-    "glommed",
-    "occasioned",
-    "blessings",
-    "temptation",
-    "merce",
-    "irritations",
-    "epigrammatic",
-    "75,000-ton",
-    "charters",
-    "low",
-    "matrimony",
-    "o'clock",
-    "shakily",
-    "voiceless",
-    "cassocked",
-    "lighthearted",
-    "leaked",
-    "paddies",
-    "fraternities",
-    "alps",
-    "himalayas",
-    "kings",
-    "normandy",
-    "terraced",
-    "posters",
-    "recommendation",
-    "gonne",
-    "nearest",
-    "glides",
-    "enacted",
-    "ledford",
-    "superlative",
-    "thrust",
-    "armpit",
-    "glumly",
-    "perfunctory",
-    "vehement",
-    "deal",
-    "rackmil",
-    "sings",
-    "stroking",
-    "gleason",
-    "extremities",
-    "lock-outs",
-    "zen",
-    "overcoat",
-    "breakwater",
-    "documented",
-    "gowns",
-    "marbles",
-    "yosemite",
-    "varityping",
-    "intercept",
-    "springfield",
-    "noon",
-    "denomination",
-    "ma",
-    "drying",
-    "di-iodotyrosine",
-    "equating",
-    "baylor's",
-    "braced",
-    "passage",
-    "stethoscope",
-    "villain",
-    "scholastic",
-    "somnolent",
-    "sun-bleached",
-    "gaunt",
-    "pozzatti",
-    "elmira",
-    "romaniuk",
-    "maget",
-    "acknowledgments",
-    "solar-wind",
-    "ruckus",
-    "6-12",
-    "spacing",
-    "deadweight",
-    "dinnerware",
-    "bast",
-    "nonprofit",
-    "blackwell's",
-    "kayo",
-    "civilization",
-    "local",
-    "insinuation",
-    "northwest",
-    "chastisement",
-    "pleader",
-    "rust",
-    "slough",
-    "terral",
-    "mcneill",
-    "hurdles",
-    "rico",
-    "waived",
-    "listener",
-    "switchboard",
-    "deeper",
-    "harmoniously",
-    "despises",
-    "want",
-    "whim",
-    "bsn",
-    "sediment",
-    "evicted",
-    "topical",
-    "abide",
-    "three-day",
-    "planking",
-    "insight",
-    "wilmington",
-    "1728",
-    "position",
-    "foresee",
-    "merz",
-    "stephens's",
-    "tokyo",
-    "3.15",
-    "glowered",
-    "right-hand",
-    "bleeding",
-    "canoes",
-    "affection",
-    "edentulous",
-    "dare",
-    "viscera",
-    "incomparably",
-    "obtaining",
-    "thomas",
-    "opportunism",
-    "layoffs",
-    "opponent's",
-    "l'astree",
-    "doric",
-    "caucasus",
-    "afternoon",
-    "property",
-    "crucifix",
-    "philological",
-    "discursiveness",
-    "baroque",
-    "hearty",
-    "himmler",
-    "54,320",
-    "bronchioles",
-    "subtraction",
-    "kankakee",
-    "vibes",
-    "field",
-    "recreated",
-    "malnourished",
-    "incubated",
-    "lusty",
-    "luther",
-    "pelvic",
-    "pedigreed",
-    "lawrenceville",
-    "notion",
-    "sclerosis",
-    "rpm",
-    "sickly",
-    "ss",
-    "glottochronological",
-    "idiom",
-    "succinctly",
-    "surly",
-    "inversely",
-    "paleocortical",
-    "bobbin-to-cone",
-    "obligated",
-    "ere",
-    "forestry",
-    "plebian",
-    "reverend",
-    "realize",
-    "interposed",
-    "grands",
-    "tropez",
-    "flaunting",
-    "sales",
-    "playoff",
-    "exonerated",
-    "sanitary",
-    "joyce",
-    "proclaimed",
-    "uruguay",
-    "semper",
-    "negotiating",
-    "itemized",
-    "low-frequency",
-    "yin-yang",
-    "counselors",
-    "skylight",
-    "skyscrapers",
-    "shouldering",
-    "overwhelmingly",
-    "semi-conductors",
-    "flowerpot",
-    "grimm",
-    "horns",
-    "granular-type",
-    "duncan",
-    "detrimental",
-    "academeh",
-    "nineteen-year-old",
-    "feminine",
-    "norad",
-    "authenticated",
-    "moon-washed",
-    "student-physicists",
-    "eqns.",
-    "depots",
-    "paestum",
-    "yore",
-    "brandenburg",
-    "swallow",
-    "kc-135",
-    "lacerated",
-    "snapdragons",
-    "turret",
-    "small-town",
-    "laughlin",
-    "hollyhocks",
-    "michigan",
-    "jigger",
-    "fortnight",
-    "slides",
-    "judges'",
-    "2,963",
-    "parquet",
-    "chronology",
-    "bauhaus",
-    "$4,700",
-    "phosphide",
-    "arte's",
-    "clod",
-    "admission",
-    "cylinder's",
-    "chaos",
-    "christine",
-    "chimera-chasing",
-    "devey",
-    "islamic",
-    "occupational",
-    "victimize",
-    "subsistence",
-    "extrapolated",
-    "concise",
-    "odds",
-    "grasshoppers",
-    "dancer",
-    "undersecretary",
-    "aimo",
-    "garstung",
-    "225,000",
-    "treading",
-    "fly-boy",
-    "miami",
-    "hat",
-    "hand-made",
-    "balletomane",
-    "city-wide",
-    "demanded",
-    "suspicious",
-    "impressionism",
-    "intermeshed",
-    "vs.",
-    "fall-off",
-    "campaign",
-    "$3100",
-    "enemy",
-    "more'n",
-    "ab",
-    "dynamics",
-    "inconvenient",
-    "minute",
-    "screvane",
-    "khartoum",
-    "generate",
-    "otto",
-    "sloping",
-    "decreed",
-    "complexes",
-    "phonetic",
-    "taos",
-    "interestingly",
-    "rubbed",
-    "stuttgart",
-    "kissak",
-    "rul.",
-    "reconstruction",
-    "appreciation",
-    "thakhek",
-    "38",
-    "hammett's",
-    "immigrants",
-    "angelo",
-    "dual-road-up",
-    "emancipation",
-    "deeply",
-    "government's",
-    "distasteful",
-    "crisp",
-    "parameters",
-    "greville's",
-    "full-bodied",
-    "farmer-in-the-dell",
-    "christophers'",
-    "backing",
-    "textile-importing",
-    "methuselah",
-    "artisan",
-    "relax",
-    "contrary",
-    "recognition",
-    "ninety",
-    "moaned",
-    "hundred-and-fifty",
-    "ostentatious",
-    "chafing",
-    "fortify",
-    "discard",
-    "dorenzo",
-    "keeping",
-    "surgeons",
-    "expansions",
-    "decreasing",
-    "operator",
-    "finite",
-    "asteroid",
-    "antipathy",
-    "misuse",
-    "hither",
-    "beefy",
-    "menas",
-    "collagen",
-    "longer",
-    "1-a",
-    "quill",
-    "bester",
-    "hankerin'",
-    "mohammad",
-    "cover",
-    "sneezing",
-    "thrilling",
-    "hard-earned",
-    "comprehend",
-    "shaken",
-    "quint",
-    "regenerates",
-    "mclauchlin",
-    "fiendish",
-    "silvers",
-    "pair",
-    "eisenhhower",
-    "inveigh",
-    "finely",
-    "afire",
-    "co-existence",
-    "surveyor",
-    "diction",
-    "mile-long",
-    "350,000",
-    "dehumanize",
-    "fog",
-    "apartment",
-    "one-story",
-    "tennyson",
-    "pencil-and-sepia",
-    "taps",
-    "ciliates",
-    "nickels",
-    "progression",
-    "nadir",
-    "subjectivity",
-    "open-face",
-    "supervises",
-    "fastens",
-    "confess",
-    "modified",
-    "roberto",
-    "mmes",
-    "vitus",
-    "bent-arm",
-    "executive",
-    "1861",
-    "blokes",
-    "fernand",
-    "williams's",
-    "searchingly",
-    "siege",
-    "marshal",
-    "coding",
-    "synonymy",
-    "ossify",
-    "fifteen-sixteenths",
-    "90",
-    "confession",
-    "marskmen",
-    "unitarianism",
-    "sturdy",
-    "bachelor",
-    "giacomo",
-    "accurately",
-    "olsen",
-    "interaction",
-    "pottery",
-    "maladjusted",
-    "1733",
-    "near-by",
-    "mosques",
-    "puny",
-    "incise",
-    "sp-44007",
-    "neighborhood",
-    "bucket",
-    "burst",
-    "border",
-    "agile",
-    "congress",
-    "indigestion",
-    "ancistrodon",
-    "g.o.p.",
-    "nitrates",
-    "more-than-ordinary",
-    "freudian",
-    "witnesses",
-    "eighteen",
-    "barbecued",
-    "genealogies",
-    "crystallographic",
-    "tonsil",
-    "scared",
-    "reprobate",
-    "apparatus",
-    "hurricane",
-    "playwright",
-    "selfish",
-    "hosts",
-    "absinthe",
-    "buenas",
-    "carson",
-    "fruitful",
-    "unnameable",
-    "tallow",
-    "vantage",
-    "biblically",
-    "twirling",
-    "press",
-    "store-front",
-    "emilio",
-    "soon's",
-    "anticoagulation",
-    "osric",
-    "hester",
-    "smartly",
-    "iodide",
-    "tahoe",
-    "ruefully",
-    "git",
-    "small",
-    "fisk",
-    "clairvoyant",
-    "first-order",
-    "abysmal",
-    "o'casey",
-    "clarence",
-    "peace-treaty",
-    "ayres'",
-    "leavin'",
-    "reassembled",
-    "roofer",
-    "regret",
-    "counterpart",
-    "ekaterinoslav",
-    "wolf",
-    "syrians",
-    "courtenay",
-    "revive",
-    "daises",
-    "resounds",
-    "pardoned",
-    "wheels",
-    "bolivar",
-    "brand-new",
-    "dissolve",
-    "they'll",
-    "angels",
-    "soup",
-    "parts",
-    "artur",
-    "maid",
-    "life-like",
-    "wine",
-    "wounded",
-    "mcsorley's",
-    "planer",
-    "hotham",
-    "disinterested",
-    "clattery",
-    "smaller",
-    "cause",
-    "venerable",
-    "songs",
-    "grind",
-    "creek-turn",
-    "institut",
-    "vic's",
-    "geraghtys'",
-    "shiloh",
-    "moss",
-    "carre",
-    "cleverness",
-    "strangled",
-    "rose-of-sharon",
-    "curiosity",
-    "excess",
-    "infidelity",
-    "chauffeur",
-    "grindings",
-    "spent",
-    "thiihng",
-    "naughtier",
-    "contracts",
-    "newsletter",
-    "2,000",
-    "abides",
-    "interviewee",
-    "mint",
-    "venice",
-    "folk-dance",
-    "measurable",
-    "liberties",
-    "horns'",
-    "electorate",
-    "jeopardizing",
-    "majesties",
-    "overcrowding",
-    "sea-damp",
-    "symbol",
-    "stiffens",
-    "arnolphe",
-    "coronary",
-    "pharmacopoeia",
-    "emerson's",
-    "signers",
-    "explicitness",
-    "endothermic",
-    "sauerkraut",
-    "generalizations",
-    "$.07/cwt",
-    "alliance",
-    "deane",
-    "heat",
-    "subgroups",
-    "competently",
-    "stagger",
-    "annually",
-    "nasser",
-    "beinge",
-    "popularly",
-    "$2.80",
-    "youngsters",
-    "gin",
-    "coaxial",
-    "mannequin",
-    "riflemen-rangers",
-    "weak",
-    "1.0",
-    "government-to-government",
-    "demetrius",
-    "enchantment",
-    "unachievable",
-    "on-site",
-    "richert",
-    "katangan",
-    "weaned",
-    "sideline",
-    "gauche",
-    "conservative-liberal",
-    "2.3",
-    "flourishing",
-    "symes's",
-    "someday",
-    "finalist",
-    "szelenyi",
-    "prejudiced",
-    "covent",
-    "covetousness",
-    "3:300",
-    "snowflakes",
-    "moldavian",
-    "cites",
-    "flees",
-    "underlies",
-    "minor",
-    "expressionism",
-    "luis's",
-    "3-to-3",
-    "unenforcible",
-    "superintend",
-    "mendoza",
-    "richard's",
-    "dismisses",
-    "palm-lined",
-    "conn.",
-    "potsdam",
-    "wildlife",
-    "torrio",
-    "exhausts",
-    "no-trading",
-    "changing",
-    "dreamt",
-    "fulfillment",
-    "multi-phase",
-    "setter",
-    "polled",
-    "registrar",
-    "careless",
-    "disclosures",
-    "bradykinin",
-    "allusiveness",
-    "punnished",
-    "structuring",
-    "kinds",
-    "analyticity",
-    "12-14",
-    "thevenow",
-    "straight-backed",
-    "carrier-current",
-    "unction",
-    "wasteland",
-    "hoarsely",
-    "invitations",
-    "chavez'",
-    "church",
-    "argot",
-    "liar's",
-    "worship",
-    "wrestling",
-    "lob-scuse",
-    "soloviev",
-    "roomberg",
-    "capt.",
-    "preemployment",
-    "messenger",
-    "acre",
-    "dawning",
-    "recompence",
-    "inconvenience",
-    "audits",
-    "parley",
-    "tomas",
-    "situ",
-    "outrages",
-    "symphonic",
-    "surrealism",
-    "patch",
-    "efforts",
-    "fairy-land",
-    "30-inch",
-    "autonomic-somatic",
-    "tutoring",
-    "ingleside's",
-    "cynically",
-    "taut",
-    "bolted",
-    "leading",
-    "octopus",
-    "snodgrass",
-    "hamm",
-    "chaperoned",
-    "weightlessness",
-    "antipodes",
-    "rustproof",
-    "welton",
-    "gypsy",
-    "t'gethuh",
-    "jibes",
-    "expropriated",
-    "uhhu",
-    "jowls",
-    "insertion",
-    "revolved",
-    "8.6-mm",
-    "tinning",
-    "chapters",
-    "characterizations",
-    "economy",
-    "bough",
-    "disheveled",
-    "gothic",
-    "cross-licensing",
-    "phenomena",
-    "stresses",
-    "fees",
-    "orchestre",
-    "purposively",
-    "met",
-    "meteor",
-    "r-warren",
-    "patterned",
-    "downs",
-    "ha",
-    "smash-'em-down",
-    "acheson",
-    "purse",
-    "quibs",
-    "histochemical",
-    "1802",
-    "confusion",
-    "irrawaddy",
-    "engle's",
-    "palliative",
-    "studio",
-    "scissoring",
-    "fireworks",
-    "partlow's",
-    "disallowed",
-    "abscissa",
-    "strindberg's",
-    "'30s",
-    "answered",
-    "march",
-    "exaggerate",
-    "dram",
-    "instant",
-    "residences",
-    "applauding",
-    "chopped",
-    "poorest",
-    "lumpish",
-    "1751",
-    "chapels",
-    "hippodrome",
-    "girdle",
-    "smudged",
-    "skilful",
-    "hesitating",
-    "stumbling-block",
-    "interchanges",
-    "matthew",
-    "pre-nuptial",
-    "melcher",
-    "belongings",
-    "shoot",
-    "self-styled",
-    "citizens",
-    "outdistanced",
-    "bleached",
-    "artie",
-    "64%",
-    "o'sullivan",
-    "outskirt's",
-    "victim's",
-    "soeren",
-    "bullhide",
-    "tanker",
-    "edith",
-    "familiar",
-    "flushed",
-    "chancery",
-    "solutions",
-    "exogamous",
-    "diabetic",
-    "truths",
-    "bolker",
-    "roost",
-    "axial",
-    "cents-per-hour",
-    "shortcomings",
-    "manuel",
-    "ukrainian",
-    "elevated",
-    "bawled",
-    "sweat-saturated",
-    "reproducibilities",
-    "macready",
-    "events",
-    "bullets",
-    "cauterize",
-    "seamanship",
-    "cannon",
-    "fireman",
-    "rookies",
-    "common-sense",
-    "oklahoma!",
-    "mister",
-    "heading",
-    "corrosion",
-    "unfortunately",
-    "gaping",
-    "differently",
-    "unimaginative",
-    "triviality",
-    "ansuh",
-    "filipinos",
-    "finality",
-    "simca",
-    "eave",
-    "mendelssohn's",
-    "alluding",
-    "chassis",
-    "tall-growing",
-    "rover",
-    "pool-owners",
-    "decently",
-    "wisest",
-    "misunderstanders",
-    "flood-lighted",
-    "cornered",
-    "industrialist",
-    "carried",
-    "trucks",
-    "knock-down",
-    "bani",
-    "bosco",
-    "befits",
-    "valid",
-    "congested",
-    "ashore",
-    "utterances",
-    "dixieland",
-    "untrustworthiness",
-    "obscured",
-    "anesthetized",
-    "trail-worn",
-    "moontrack",
-    "raindrops",
-    "guzzle",
-    "pseudonym",
-    "vested",
-    "riesman",
-    "sixty-five",
-    "weaning",
-    "accuracy",
-    "shotgun-type",
-    "jewel",
-    "beachhead",
-    "1639",
-    "cent",
-    "clashes",
-    "mantle's",
-    "'ceptin'",
-    "budge",
-    "seventeenth",
-    "self-sacrifice",
-    "bleachers",
-    "relied",
-    "remnants",
-    "robinson",
-    "pigment",
-    "gino",
-    "parting",
-    "communese",
-    "ballads",
-    "kills",
-    "contemporary",
-    "assistants",
-    "mouth-watering",
-    "budded",
-    "sit",
-    "client",
-    "10.3",
-    "shade-darkened",
-    "officious",
-    "stober's",
-    "moritz",
-    "spice",
-    "isles",
-    "impervious",
-    "kemble",
-    "green-bugs",
-    "plinking",
-    "twenty-seven",
-    "considered",
-    "co-operates",
-    "inexorable",
-    "thinly",
-    "pullover",
-    "huckster",
-    "n.m.",
-    "commemorates",
-    "wacker",
-    "orchestral",
-    "warships",
-    "pouches",
-    "ikle",
-    "intimating",
-    "willy",
-    "nabisco",
-    "steeple",
-    "bowels",
-    "gullet",
-    "holden",
-    "acting",
-    "westbrook",
-    "deserted",
-    "byer-rolnick",
-    "integrals",
-    "dilemmas",
-    "propitious",
-    "switched",
-    "inflected",
-    "emerson",
-    "brodbeck",
-    "this",
-    "letterman",
-    "necessarily",
-    "devotion",
-    "asteroidal",
-    "congenital",
-    "sketchbook",
-    "melisande",
-    "monumentality",
-    "balenciaga",
-    "merton's",
-    "coops",
-    "intern",
-    "blouse",
-    "antares",
-    "ardor",
-    "moonlit",
-    "dedication",
-    "feeding-pain",
-    "instigation",
-    "expressionless",
-    "woebegone",
-    "cater",
-    "meadow",
-    "cicadas",
-    "compromises",
-    "cheng",
-    "merchandise",
-    "aural",
-    "lost",
-    "short-lived",
-    "puke",
-    "poseurs",
-    "dilapidated",
-    "unworkable",
-    "foppish",
-    "pituitary",
-    "chiuchow",
-    "fiche",
-    "storyline",
-    "arrowhead",
-    "raged",
-    "bargain-priced",
-    "pappy's",
-    "stiff-backed",
-    "draughty",
-    "farther",
-    "nut-like",
-    "outsiders",
-    "1849",
-    "misbranded",
-    "petipa",
-    "patroness",
-    "salpetriere",
-    "molesworth",
-    "hover",
-    "raid",
-    "convivial",
-    "fusillades",
-    "steel-edged",
-    "danehy",
-    "vienne",
-    "portant",
-    "illumine",
-    "crestfallen",
-    "hicks",
-    "karlheinz",
-    "$109",
-    "quieted",
-    "$17,000",
-    "grudges",
-    "silk",
-    "recrimination",
-    "counter-attack",
-    "broadly",
-    "line-density",
-    "dunn's",
-    "differed",
-    "grunt",
-    "waned",
-    "brownish",
-    "two-hour",
-    "unsurpassed",
-    "chavez",
-    "delegates",
-    "awaken",
-    "oracle",
-    "bruising",
-    "academies",
-    "denounces",
-    "half-reluctant",
-    "dionigi",
-    "freebooters",
-    "fatigues",
-    "advisable",
-    "compatriots",
-    "baines",
-    "encourage",
-    "bona",
-    "plazas",
-    "femme",
-    "sl",
-    "south's",
-    "zero",
-    "church-state",
-    "donnelly",
-    "climax",
-    "3:20",
-    "bloodroot",
-    "mcclellan",
-    "fantasies",
-    "lagged",
-    "expire",
-    "tabb",
-    "shimmering",
-    "eyelets",
-    "plowshares",
-    "whipped",
-    "involuntary-control",
-    "unsightly",
-    "resinlike",
-    "echoes",
-    "tensions",
-    "bone-weary",
-    "amicably",
-    "respectable",
-    "weigle",
-    "forth",
-    "persians",
-    "depart",
-    "dogmatically",
-    "pumps",
-    "indicator",
-    "heroes",
-    "lindsay",
-    "greenwood",
-    "possible",
-    "reporter",
-    "extraterrestrial",
-    "guiding",
-    "palladium",
-    "aborigine",
-    "lewis",
-    "obnoxious",
-    "sneakers",
-    "encephalographic",
-    "stops",
-    "tenderly",
-    "violating",
-    "hirey's",
-    "dissolutions",
-    "index",
-    "carthago",
-    "nantucket",
-    "homely",
-    "aerosols",
-    "flounder",
-    "urethra",
-    "7-day-week",
-    "insurmountable",
-    "outfought",
-    "action",
-    "apprentices",
-    "abundantly",
-    "deferment",
-    "honors",
-    "neveh",
-    "ralph",
-    "enrolled",
-    "garrick",
-    "context",
-    "psychically-blind",
-    "touchstone",
-    "veracious",
-    "karol",
-    "dragged",
-    "risky",
-    "fallout",
-    "malnutrition",
-    "intends",
-    "felony",
-    "chromspun",
-    "alive",
-    "nondescript",
-    "twilight",
-    "treaty-making",
-    "parimutuels",
-    "rebecca",
-    "unalloyed",
-    "camellias",
-    "mckenzie",
-    "beginnings",
-    "death-wish",
-    "power-hungry",
-    "chess",
-    "arteriolar-pulmonary",
-    "$400",
-    "suspended",
-    "juju",
-    "numb",
-    "bernini",
-    "cockroaches",
-    "lorenz",
-    "ethics",
-    "overhearing",
-    "1605",
-    "well",
-    "confident",
-    "sickish",
-    "substantially",
-    "which",
-    "multiplies",
-    "abound",
-    "scintillating",
-    "pa'd",
-    "shackles",
-    "agglutinin",
-    "compulsory",
-    "ice-feeling",
-    "confinements",
-    "surveying",
-    "orioles",
-    "pessimists",
-    "killers",
-    "yankees'",
-    "hampton's",
-    "sight-seeing",
-    "short-cutting",
-    "overpowered",
-    "mechanist",
-    "wisps",
-    "unbent",
-    "denominational",
-    "infamy",
-    "floor-to-ceiling",
-    "citizen's",
-    "49",
-    "masses",
-    "work-study",
-    "amber",
-    "dry-dock",
-    "supplying",
-    "all-too-brief",
-    "chimiques",
-    "no-man's-land",
-    "archbishop",
-    "burnished",
-    "lucy",
-    "thicker",
-    "accurate",
-    "presumably",
-    "primitive",
-    "products",
-    "hitchcock",
-    "simulation",
-    "fairless",
-    "stannard",
-    "2,758",
-    "nonetheless",
-    "justifying",
-    "surcease",
-    "choreographed",
-    "gustave",
-    "widener",
-    "nailing",
-    "cage",
-    "tailback",
-    "carry",
-    "glad",
-    "retained",
-    "expressive",
-    "encampment",
-    "counter-balanced",
-    "defecated",
-    "portwatchers'",
-    "gulling",
-    "sheik",
-    "scrub",
-    "subsist",
-    "glint",
-    "devilish",
-    "confined",
-    "overexploitation",
-    "gulped",
-    "feathertop's",
-    "reserve",
-    "rebound",
-    "doctored",
-    "alma",
-    "drooping",
-    "inhibitions",
-    "cane",
-    "uniformly",
-    "5-game",
-    "money",
-    "outstate",
-    "fred",
-    "hurlers",
-    "anti-newtonian",
-    "sonogram",
-    "pattern",
-    "clement",
-    "liked",
-    "inhumane",
-    "unnaturalness",
-    "pickford",
-    "courting",
-    "whispers",
-    "negotiations",
-    "descent",
-    "barns",
-    "sake",
-    "reelection",
-    "klaxon",
-    "onslaught",
-    "aerosol",
-    "adrian",
-    "pi",
-    "no-name",
-    "infantile",
-    "injection",
-    "radioactive",
-    "pinar",
-    "geochemistry",
-    "ry.",
-    "d'un",
-    "conceivable",
-    "jelly",
-    "bankrupt",
-    "gentlemanly",
-    "sidechairs",
-    "scripture",
-    "welch's",
-    "filth",
-    "chabrier's",
-    "offense",
-    "out-of-bounds",
-    "threatened",
-    "tumbrels",
-    "underbelly",
-    "crouching",
-    "garry",
-    "weinstein",
-    "periscopes",
-    "kisses",
-    "anaconda's",
-    "brittle",
-    "stages",
-    "blevins'",
-    "corrugated",
-    "foci",
-    "castro's",
-    "moistened",
-    "dispensed",
-    "structural",
-    "tomato-red",
-    "rigorous",
-    "coordinator",
-    "invalidate",
-    "pasting",
-    "quickening",
-    "static",
-    "compartment",
-    "operagoers",
-    "carausius",
-    "baptists",
-    "marchand",
-    "pressed-paper",
-    "exacerbated",
-    "legation's",
-    "integers",
-    "dramatic",
-    "administered",
-    "alcoves",
-    "ethanol",
-    "zimmerman",
-    "sneaks",
-    "jalopy",
-    "automobiles",
-    "invest",
-    "conjures",
-    "consumer",
-    "wagner-peyser",
-    "straightens",
-    "rephrased",
-    "statue",
-    "preferential",
-    "gavin's",
-    "skate",
-    "accolades",
-    "papanicolaou",
-    "basel",
-    "onct",
-    "avoiding",
-    "soundness",
-    "derails",
-    "regulated",
-    "sub-christian",
-    "clue",
-    "coureurs",
-    "sound",
-    "sore-ridden",
-    "pilgrim",
-    "appraising",
-    "scald",
-    "jesse",
-    "cito",
-    "alliterative",
-    "mysticism",
-    "prices",
-    "yellin'",
-    "black",
-    "awry",
-    "bop",
-    "incompatibles",
-    "mos.",
-    "dolores",
-    "djakarta",
-    "psycho-physiology",
-    "wod",
-    "installment",
-    "responsibilities",
-    "flannels",
-    "symmetry",
-    "embryonic",
-    "potemkin's",
-    "acrid",
-    "seq.",
-    "wave-setting",
-    "post-mortem",
-    "excepting",
-    "bandwidth",
-    "phenomenological",
-    "calloused",
-    "27,000",
-    "esplanade",
-    "explicit",
-    "burch's",
-    "edifice",
-    "$102,285,000",
-    "stirrup",
-    "jagged",
-    "colossal",
-    "hacksaw",
-    "flippant",
-    "unison",
-    "wohaw",
-    "scepticism",
-    "anabel",
-    "public-address",
-    "nudge",
-    "year-round",
-    "boatload",
-    "phrases",
-    "babyhood",
-    "$4,500,000",
-    "skeptically",
-    "miseries",
-    "rationalism",
-    "bethlehem",
-    "valleys",
-    "scaffoldings",
-    "faust's",
-    "filtered",
-    "traumatic",
-    "blvd.",
-    "inextricable",
-    "truthfulness",
-    "references",
-    "bolstering",
-    "son",
-    "directed",
-    "margins",
-    "oistrakh",
-    "second-place",
-    "belvidere",
-    "cysts",
-    "mild-winter",
-    "blast",
-    "already",
-    "drinkhouse",
-    "protagonist",
-    "gawky",
-    "ideational",
-    "organic",
-    "seeks",
-    "grips",
-    "cutouts",
-    "rates",
-    "teutonic",
-    "rawson",
-    "entrust",
-    "razing",
-    "besets",
-    "advisement",
-    "pun",
-    "disobeying",
-    "thrifty",
-    "implicit",
-    "1,800",
-    "kidder",
-    "sweet",
-    "9,273",
-    "travellers",
-    "hatless",
-    "virgin",
-    "stephane",
-    "case's",
-    "creek",
-    "muster",
-    "delineation",
-    "skirt",
-    "hamming",
-    "keynotes",
-    "town's",
-    "yinger",
-    "monopolization",
-    "multi-year",
-    "juiciest",
-    "regretted",
-    "due",
-    "mor-ee-air-teeeee",
-    "centralization",
-    "waveland",
-    "commissioners",
-    "glowing",
-    "intestine",
-    "decisional",
-    "nolle",
-    "misleading",
-    "airmen",
-    "examination",
-    "fronted",
-    "rusting",
-    "braque's",
-    "wissahickon",
-    "paris",
-    "on-stage",
-    "north-south",
-    "intermarriage",
-    "1721",
-    "828",
-    "tangy",
-    "memo",
-    "northeastern",
-    "2.295%",
-    "kickoff",
-    "colorless",
-    "2130",
-    "prurient",
-    "measurements",
-    "believe",
-    "rodgers",
-    "timely",
-    "relativistic",
-    "sanctuary's",
-    "defenders",
-    "arrival",
-    "star",
-    "nondiscriminatory",
-    "lengthily",
-    "complexities",
-    "reavey",
-    "self-effacement",
-    "mule-drawn",
-    "habitually",
-    "inure",
-    "flannel",
-    "playes",
-    "archangel",
-    "told",
-    "hogging",
-    "probing",
-    "portrayal",
-    "nominating",
-    "bongo",
-    "selectors",
-    "hilt",
-    "grassy",
-    "antislavery",
-    "legations",
-    "rear",
-    "thuggee",
-    "mis-ter",
-    "wherewith",
-    "sept.",
-    "suspension",
-    "1643",
-    "freddy",
-    "automatically",
-    "side-rack",
-    "usually",
-    "jiu-jitsu",
-    "cliffhanging",
-    "notarius",
-    "unequalled",
-    "chromium",
-    "compilations",
-    "whosoever",
-    "limb",
-    "whom",
-    "hushed",
-    "situations",
-    "garrison",
-    "boarded",
-    "states-yugoslav",
-    "reluctant",
-    "repaid",
-    "bolovens",
-    "interfered",
-    "charlotte's",
-    "retaining",
-    "unrevealing",
-    "secured",
-    "decomposing",
-    "generality",
-    "gevurtz",
-    "price-wise",
-    "crammed",
-    "insect",
-    "mcfarland",
-    "beau",
-    "recurrently",
-    "mature",
-    "beauty's",
-    "irresponsibility",
-    "yancy-6",
-    "inspections",
-    "jingled",
-    "lightweight",
-    "appalachian",
-    "theory",
-    "co-ordinated",
-    "continuities",
-    "tilth",
-    "rot",
-    "write",
-    "chanter",
-    "chines",
-    "implanted",
-    "lug",
-    "interfaith",
-    "defoe",
-    "high-water",
-    "moderate",
-    "duly",
-    "windshield",
-    "darwin",
-    "enlarge",
-    "$.65",
-    "amounted",
-    "fulminating",
-    "chrissake",
-    "precipitated",
-    "59-cents",
-    "awesome",
-    "$85,000",
-    "tableau",
-    "tenets",
-    "rilke",
-    "ripple",
-    "loudon's",
-    "buoyancy",
-    "meaningfulness",
-    "m-1",
-    "thirty-seven",
-    "hare",
-    "accordingly",
-    "creeper",
-    "riemann's",
-    "outta",
-    "arab",
-    "aren't",
-    "54",
-    "farmed",
-    "rightful",
-    "missile",
-    "montenegrin",
-    "committees",
-    "prevailin'",
-    "upkeep",
-    "paddock",
-    "shawnee",
-    "understandingly",
-    "anxiety",
-    "wrinkled",
-    "spume",
-    "buddhism",
-    "expecting",
-    "$1.10",
-    "coordinates",
-    "lettin'",
-    "gen.",
-    "superlatives",
-    "achievement",
-    "addict",
-    "$63.8",
-    "tam-o'-shanter",
-    "logger",
-    "startin'",
-    "despot",
-    "toilet",
-    "courteous",
-    "misconstrued",
-    "promulgators",
-    "tertiary",
-    "macklin's",
-    "doves",
-    "upbringing",
-    "sensationalism",
-    "cornwallis",
-    "keith's",
-    "waterloo",
-    "ex-prison",
-    "warmed",
-    "harping",
-    "postpone",
-    "called",
-    "worshiped",
-    "tomb",
-    "louis",
-    "laborious",
-    "planter",
-    "non-white",
-    "canting",
-    "store",
-    "elicits",
-    "bayonets",
-    "forsake",
-    "1878",
-    "francesco",
-    "bruegel",
-    "wrenches",
-    "madonna",
-    "kilts",
-    "dime",
-    "crush",
-    "investigations",
-    "vacate",
-    "decade",
-    "scaring",
-    "aforethought",
-    "pool's",
-    "debauchery",
-    "charging",
-    "legislatures",
-    "churchgoing",
-    "rudderless",
-    "pursuit",
-    "ave.",
-    "arco",
-    "downbeat",
-    "pomaded",
-    "compulsion",
-    "bed-type",
-    "mounded",
-    "pacers",
-    "redcoat",
-    "irritant",
-    "beads",
-    "patrick",
-    "thom",
-    "expansionist",
-    "unloaded",
-    "head-on",
-    "relishing",
-    "handed",
-    "soaked",
-    "semisecret",
-    "barnyard",
-    "cabled",
-    "uplands",
-    "faintest",
-    "proudhon",
-    "ballplayers",
-    "sodden",
-    "voluptuous",
-    "unnourished",
-    "sweltering",
-    "vuhranduh",
-    "expired",
-    "mervin",
-    "tar",
-    "elements",
-    "scales",
-    "subversive",
-    "ruanda-urundi",
-    "earning",
-    "insecticides",
-    "balzac",
-    "exhilarated",
-    "kc.",
-    "vases",
-    "tears",
-    "abstractly",
-    "auditors",
-    "supporting",
-    "obligations",
-    "7026",
-    "illusionary",
-    "trevelyan",
-    "detective's",
-    "holmes",
-    "spirited",
-    "volunteers",
-    "granted",
-    "herald",
-    "tilling",
-    "timid",
-    "cusa",
-    "high-power",
-    "township",
-    "lumbering",
-    "lenses",
-    "neusteters",
-    "14-15",
-    "convincing",
-    "undergraduate",
-    "quam",
-    "kyo",
-    "lulled",
-    "punish",
-    "resolve",
-    "absent-mindedly",
-    "coolidges",
-    "pouring",
-    "immediate",
-    "'thirties",
-    "3",
-    "technique",
-    "nothing's",
-    "tao",
-    "signaled",
-    "others",
-    "marx",
-    "pre-existent",
-    "inarticulate",
-    "barber",
-    "why",
-    "gases",
-    "insights",
-    "pyramidal",
-    "6-b",
-    "earn",
-    "diligently",
-    "dope-ridden",
-    "forbidden",
-    "fleischman",
-    "wishart",
-    "legislature",
-    "materials",
-    "ibsen",
-    "cap-and-ball",
-    "snyder",
-    "vibrated",
-    "squinting",
-    "mouthpieces",
-    "fairing",
-    "machine",
-    "ritz",
-    "promoters",
-    "u.s.",
-    "chattels",
-    "weinstein's",
-    "proclamations",
-    "preceeded",
-    "burger",
-    "devised",
-    "cold-bloodedly",
-    "$1.5",
-    "thyrotoxic",
-    "stretch",
-    "spahnie",
-    "japanese",
-    "shouted",
-    "home-building",
-    "non-hydrogen-bonded",
-    "feathers",
-    "british-born",
-    "annex",
-    "enterotoxemia",
-    "all-over",
-    "carnival",
-    "becomin'",
-    "sycophants",
-    "lurk",
-    "diffuse",
-    "licenses",
-    "pesce",
-    "2's",
-    "pinscher",
-    "hokan",
-    "painful",
-    "abode",
-    "bouton",
-    "intoned",
-    "hood",
-    "fluorinated",
-    "deathly",
-    "temerity",
-    "undermine",
-    "bearing",
-    "statues",
-    "snorkle",
-    "ripa",
-    "rhea's",
-    "hand-screened",
-    "glowering",
-    "settler",
-    "radiation-produced",
-    "holocaust",
-    "readapting",
-    "affianced",
-    "1644",
-    "pivoting",
-    "frog-marched",
-    "equations",
-    "scored",
-    "tourist's",
-    "crewcut",
-    "serious-minded",
-    "buckra",
-    "ceasing",
-    "stub",
-    "calculators",
-    "match-width",
-    "morgen",
-    "marsicano",
-    "hay-wagon",
-    "hawkinses",
-    "circles",
-    "garments",
-    "turnpikes",
-    "mccone",
-    "barnes",
-    "off",
-    "littau",
-    "meekly",
-    "unremarkable",
-    "trujillo",
-    "nothing-down",
-    "precise",
-    "1920",
-    "puttin'",
-    "tumor",
-    "baffling",
-    "shrewd",
-    "policeman's",
-    "visited",
-    "enameling",
-    "dutch",
-    "satisfying",
-    "understanding",
-    "twister",
-    "attrition",
-    "ironing",
-    "brahmsian",
-    "exhibits",
-    "dwindling",
-    "hazard",
-    "galvanism",
-    "tragicomic",
-    "mood",
-    "pistols",
-    "de-iodinating",
-    "orvis",
-    "pleasant",
-    "countrymen",
-    "orwell",
-    "level-headed",
-    "double-",
-    "missoula",
-    "botulinum",
-    "sara's",
-    "stoppages",
-    "interrelation",
-    "laundry-type",
-    "syndicates",
-    "ciudad",
-    "spade",
-    "supine",
-    "hamburger",
-    "emotionality",
-    "heraclitus",
-    "latter",
-    "totalistic",
-    "granite",
-    "trio",
-    "dalles",
-    "dragonetti",
-    "contributors",
-    "coaches",
-    "passivity",
-    "transpired",
-    "social-role",
-    "tripled",
-    "arragon",
-    "foresight",
-    "light-weight",
-    "minority",
-    "evenutally",
-    "jacoby's",
-    "t'",
-    "teamsters",
-    "radio-tv",
-    "gaucherie",
-    "mexican",
-    "27-30",
-    "craft",
-    "visitors",
-    "interweaving",
-    "a.a.u.'s",
-    "sweeping",
-    "hanover-chalidale",
-    "russet",
-    "altitude-azimuth-mounted",
-    "magwitch's",
-    "railway",
-    "cousin-wife",
-    "$720",
-    "cloth",
-    "shallower",
-    "reduction",
-    "cheerleaders",
-    "pare",
-    "burckhardt",
-    "mollycoddle",
-    "riverside's",
-    "article",
-    "barstow",
-    "religiousness",
-    "knotty",
-    "bygone",
-    "oxnard",
-    "plotting",
-    "colavito",
-    "evolutionists",
-    "guerrilla-th'-wisp",
-    "suffered",
-    "tungsten",
-    "commencing",
-    "manic-depressive",
-    "buzz's",
-    "mustache",
-    "creepers",
-    "mullen",
-    "selflessness",
-    "manning",
-    "shari",
-    "lauro",
-    "capabilities",
-    "sided",
-    "modifications",
-    "played",
-    "shrilling",
-    "instinct",
-    "0.7",
-    "subverted",
-    "inverted",
-    "nonobservant",
-    "loud",
-    "accomplice",
-    "merrick",
-    "pamela's",
-    "approving",
-    "detectives",
-    "joss",
-    "raving",
-    "administrator",
-    "reprehensible",
-    "embraced",
-    "homerun",
-    "strip",
-    "buren",
-    "floating",
-    "emigrating",
-    "federal-state",
-    "audivi",
-    "advances",
-    "abc",
-    "languishing",
-    "anita",
-    "shadowing",
-    "$3.00",
-    "ritual",
-    "knoe",
-    "gladden",
-    "separates",
-    "tusks",
-    "unfortunate",
-    "goitre",
-    "finberg",
-    "roam",
-    "resembling",
-    "1929",
-    "promulgated",
-    "localities",
-    "well-oriented",
-    "1.00",
-    "million",
-    "mysteries",
-    "18",
-    "burdened",
-    "haumd's",
-    "feuchtwanger",
-    "conjugal",
-    "annoyance",
-    "replacements",
-    "max's",
-    "$1,500,000",
-    "batter",
-    "calligraphers",
-    "assisting",
-    "beckon",
-    "cincinnati",
-    "wallowing",
-    "bradbury's",
-    "infestation",
-    "self-dramatization",
-    "epiphyseal-diaphyseal",
-    "nazarene",
-    "needham's",
-    "doran",
-    "augusta's",
-    "bullwhackers",
-    "3.28",
-    "non",
-    "woodcutters",
-    "paterollers",
-    "tense",
-    "arabic",
-    "prize",
-    "rotogravures",
-    "osmotic",
-    "klux",
-    "disabilities",
-    "pliers",
-    "parasol",
-    "workings",
-    "procedures",
-    "deft",
-    "intercepts",
-    "times",
-    "iodoamino",
-    "subsistent",
-    "havoc",
-    "calorimeter",
-    "uprising",
-    "incepting",
-    "giubbonari",
-    "rigid",
-    "ciciulla",
-    "vassal",
-    "district",
-    "viscoelastic",
-    "al's",
-    "sometimes-necessary",
-    "2.5",
-    "3,400",
-    "wedding",
-    "loading",
-    "off-level",
-    "shaggy",
-    "creative",
-    "hoods",
-    "hero",
-    "bewilderment",
-    "mummies",
-    "oxide",
-    "hereford",
-    "attacked",
-    "cunard's",
-    "locomotive",
-    "kahn",
-    "elucidation",
-    "engaging",
-    "blakey",
-    "our",
-    "purists",
-    "sure-enough",
-    "interesting",
-    "fullbacking",
-    "dampness",
-    "sarcastically",
-    "$8.50",
-    "arbitrary",
-    "believeth",
-    "glassy",
-    "metropolitanization",
-    "breath-taking",
-    "narrowly",
-    "gracious",
-    "biter",
-    "0.1-mv./m.",
-    "clinical",
-    "disgrace",
-    "tuohy",
-    "militant",
-    "non-itemized",
-    "one-thousand-zloty",
-    "disbursement",
-    "melville",
-    "dance",
-    "radiators",
-    "cluster",
-    "regaining",
-    "thum",
-    "involuntary",
-    "crocked",
-    "mignon",
-    "expectantly",
-    "churchill",
-    "malay",
-    "coates",
-    "lid",
-    "roundhead",
-    "alphabet",
-    "correlating",
-    "midmorning",
-    "11-inch",
-    "evoked",
-    "paulus",
-    "specter",
-    "brodie",
-    "blemishes",
-    "enforce",
-    "liquid-glass",
-    "errors",
-    "diminutive",
-    "enclosing",
-    "bewhiskered",
-    "hens'",
-    "cabot",
-    "calculated",
-    "november",
-    "fractious",
-    "fundamentalist",
-    "gog",
-    "checking",
-    "splits",
-    "viewing",
-    "cohnfidunt",
-    "five-member",
-    "denver-area",
-    "ski",
-    "add-on",
-    "conventional-type",
-    "clinched",
-    "chrysler",
-    "rammed",
-    "romancers",
-    "huddled",
-    "idiotically",
-    "hello",
-    "disgruntled",
-    "filtering",
-    "transported",
-    "durrell's",
-    "insurrection",
-    "monitored",
-    "systems",
-    "condensing",
-    "$1.00",
-    "'tain't",
-    "1948",
-    "re-examines",
-    "koinonia",
-    "clientele",
-    "subgross",
-    "showings",
-    "aspencades",
-    "poetically",
-    "sainted",
-    "painteresque",
-    "burglar",
-    "colee",
-    "oppose",
-    "repulsive",
-    "earnestly",
-    "eades",
-    "racked",
-    "fairy",
-    "1655",
-    "britten",
-    "fosdick's",
-    "evaporated",
-    "lead",
-    "voters",
-    "refurbished",
-    "plied",
-    "left-centerfield",
-    "masterminding",
-    "enrollees",
-    "railroading",
-    "mercers",
-    "eastwick",
-    "fleet",
-    "devoid",
-    "seedcoats",
-    "flank",
-    "efficiencies",
-    "skipper",
-    "1782",
-    "carney",
-    "longish",
-    "renfro",
-    "greensward",
-    "philosophized",
-    "randolph",
-    "hal",
-    "agrees",
-    "high-protein",
-    "unwillingness",
-    "mayonnaise",
-    "shocks",
-    "jealous",
-    "head-and-shoulders",
-    "ministerial",
-    "$.09",
-    "tourists",
-    "lotion",
-    "youngest",
-    "intonations",
-    "flathead",
-    "ersatz",
-    "securities",
-    "pumblechook",
-    "stans",
-    "outdoors",
-    "homogenization",
-    "montero",
-    "philadelphia's",
-    "airpark",
-    "pat's",
-    "slipping",
-    "miniatures",
-    "shipley",
-    "grzesiak",
-    "chicago-style",
-    "judsons",
-    "preying",
-    "check",
-    "fatherly",
-    "barre",
-    "milieu",
-    "wickham",
-    "lilliputian",
-    "supernatural",
-    "johnson's",
-    "half",
-    "exempt",
-    "tjokorda",
-    "appointments",
-    "psychosomatic",
-    "jess's",
-    "harmonic",
-    "loused",
-    "washed-out",
-    "revision",
-    "proposal",
-    "over-pretended",
-    "boaz",
-    "superficially",
-    "perceptual",
-    "detroit's",
-    "oncoming",
-    "t.w.",
-    "illustrators",
-    "solar-radiation",
-    "gerstacker",
-    "prepares",
-    "thrust-to-weight",
-    "sentences",
-    "hunted",
-    "disorganized",
-    "moiseyeva",
-    "airy",
-    "horse",
-    "alterations",
-    "barging",
-    "catastrophically",
-    "bunkmates",
-    "assaulted",
-    "imaginative",
-    "jeff",
-    "sacrestia",
-    "inescapably",
-    "rash",
-    "showing",
-    "madmen",
-    "vegetarian",
-    "haberdasheries",
-    "protestantism",
-    "griston",
-    "dislike",
-    "biography",
-    "shanties",
-    "demineralization",
-    "beset",
-    "unfailingly",
-    "maritain's",
-    "cunningham's",
-    "byrd's",
-    "hartford",
-    "staging",
-    "universality",
-    "alabama",
-    "pergolesi's",
-    "darling's",
-    "troubie",
-    "prisca",
-    "tonalities",
-    "orin",
-    "cleota's",
-    "flushing-main",
-    "multiplied",
-    "heel-betty",
-    "gouldings",
-    "coping",
-    "$187",
-    "dustbin",
-    "torquers",
-    "crumpled",
-    "wood",
-    "digestible",
-    "bernet",
-    "goldfish",
-    "hanging",
-    "rain",
-    "capacity",
-    "enforced",
-    "marine's",
-    "100-brick",
-    "chickens",
-    "cross-striations",
-    "slat",
-    "indicative",
-    "frankfurter",
-    "alien",
-    "lunchroom",
-    "1907",
-    "rewards",
-    "interlacing",
-    "unfertile",
-    "extruding",
-    "3:57",
-    "skiffs",
-    "schang",
-    "horace's",
-    "earthmoving",
-    "outflow",
-    "klees",
-    "1859",
-    "ideas",
-    "lamplight",
-    "buckman",
-    "what'd",
-    "epitomizes",
-    "absorptions",
-    "plug",
-    "glamorize",
-    "$1500",
-    "broader",
-    "tellers",
-    "re-enacted",
-    "nail",
-    "1311",
-    "formby",
-    "radionic",
-    "routings",
-    "on-the-spot",
-    "popes",
-    "shipping",
-    "laurentian",
-    "deactivated",
-    "carmody",
-    "bestowal",
-    "biting",
-    "9:47",
-    "banshees",
-    "guilford-martin",
-    "criticism",
-    "kraemer",
-    "serological",
-    "aya",
-    "underplayed",
-    "86%",
-    "350",
-    "comets",
-    "barrel-vaulted",
-    "twenty-eighth",
-    "tasted",
-    "kiowa",
-    "anatole",
-    "majority",
-    "cheddi",
-    "obscenity",
-    "footstool",
-    "utopias",
-    "tight-turn",
-    "centredale",
-    "roundup",
-    "rogue",
-    "playful",
-    "diagnosing",
-    "buyin'",
-    "phthalate",
-    "develop",
-    "ginkgo",
-    "wide-awake",
-    "gleaming",
-    "stupidities",
-    "elizabethan",
-    "undigested",
-    "plaza",
-    "driveway",
-    "hattes",
-    "oft-repeated",
-    "allso",
-    "strides",
-    "kosher",
-    "briefly-illumed",
-    "ipso",
-    "mid-july",
-    "sousa",
-    "unjustifiable",
-    "comport",
-    "organismic",
-    "annoyances",
-    "storeroom",
-    "uppon",
-    "buchenwald",
-    "applaud",
-    "drenched",
-    "nae",
-    "crystallized",
-    "rehash",
-    "kenny",
-    "malicious",
-    "abolish",
-    "pat",
-    "pils",
-    "drawin'",
-    "poises",
-    "barn",
-    "1940s",
-    "solvating",
-    "liquidations",
-    "miniver",
-    "conceptualization",
-    "golf",
-    "andrew",
-    "$.30",
-    "mess",
-    "paragon",
-    "henry",
-    "maximum",
-    "side-step",
-    "pellets",
-    "song",
-    "3-1/2",
-    "hopefuls",
-    "ryan",
-    "contend",
-    "brevity",
-    "oneupmanship",
-    "soot",
-    "hair",
-    "spontaneity",
-    "isle",
-    "resolutions",
-    "advisory",
-    "semi-professionally",
-    "coronaries",
-    "anti-clericalism",
-    "savages",
-    "defenses",
-    "fela",
-    "column",
-    "veiling",
-    "lak",
-    "eight-and-a-half-foot",
-    "hitter",
-    "intense",
-    "balding",
-    "formability",
-    "nonexistent",
-    "criterion",
-    "taipei",
-    "conversing",
-    "sergeants",
-    "eight-by-ten",
-    "hand-level",
-    "acculturation",
-    "mutely",
-    "tolled",
-    "bronchi",
-    "foretell",
-    "feeder",
-    "maneuver",
-    "orney",
-    "5,014",
-    "discrepancies",
-    "yarn",
-    "disbelieved",
-    "urgent",
-    "rancor",
-    "concluding",
-    "communication",
-    "marionettes",
-    "preposterous",
-    "name's",
-    "trends",
-    "realness",
-    "billie",
-    "hard-nosed",
-    "lingers",
-    "spruced",
-    "-",
-    "manjucri",
-    "wiped",
-    "stairs",
-    "protectively",
-    "falsehoods",
-    "tilted",
-    "allstates-zenith",
-    "noisier",
-    "1787-89",
-    "collectible",
-    "siegfried",
-    "impulsive",
-    "affect",
-    "retaliate",
-    "despotism",
-    "pail",
-    "there'd",
-    "strictest",
-    "adventures",
-    "billion",
-    "elizabethans",
-    "greyhound",
-    "handiwork",
-    "bulgaria",
-    "postman",
-    "lumped",
-    "upstairs",
-    "simple-seeming",
-    "fruitfulness",
-    "$65,000",
-    "make-work",
-    "anchorite",
-    "lacquer",
-    "life-preservers",
-    "discontented",
-    "building's",
-    "rags",
-    "customers",
-    "verisimilitude",
-    "hbo",
-    "wellknown",
-    "58.8%",
-    "ksu'u'peli'afo",
-    "lurks",
-    "culmination",
-    "walk-to",
-    "home's",
-    "-16-degrees",
-    "fervor",
-    "diffidence",
-    "imperfectability",
-    "polyester",
-    "milks",
-    "weapon",
-    "worker's",
-    "components",
-    "gynecologists",
-    "spring-joints",
-    "roemer",
-    "chiefdom",
-    "smithfield",
-    "malden",
-    "expressivness",
-    "twirlingly",
-    "benefit",
-    "profundity",
-    "visual",
-    "typology",
-    "naval",
-    "eluates",
-    "handing",
-    "fergeson",
-    "folly",
-    "muzyka",
-    "mutual-aid",
-    "deification",
-    "rider-fashion",
-    "facets",
-    "characteristics",
-    "yip",
-    "198",
-    "little-town",
-    "trustworthy",
-    "agrarian",
-    "massed",
-    "referring",
-    "overhang",
-    "adapt",
-    "skimmed",
-    "modulations",
-    "entrant",
-    "bernard",
-    "unsold",
-    "9-6",
-    "portia",
-    "hungary",
-    "appetites",
-    "bracelet",
-    "barren",
-    "featherweight",
-    "ready",
-    "fibrous",
-    "radicals",
-    "siberia",
-    "henchman",
-    "pushup",
-    "empowering",
-    "weldon",
-    "long-haul",
-    "leonard",
-    "mistake",
-    "outcasts",
-    "musically",
-    "communicational",
-    "sheeran",
-    "endlessly",
-    "calculating",
-    "rocket-bombs",
-    "plaids",
-    "streetlight",
-    "moralist",
-    "unpunished",
-    "2.0",
-    "world-shaking",
-    "fitful",
-    "gourd",
-    "snook",
-    "fourth-down",
-    "on-level",
-    "northrop",
-    "adam's",
-    "crossways",
-    "friar",
-    "jacksonian",
-    "communal",
-    "ulanys",
-    "regards",
-    "139-foot",
-    "female's",
-    "surviving",
-    "these",
-    "892",
-    "arianist",
-    "tropical",
-    "scooting",
-    "headaches",
-    "vicar",
-    "stampeded",
-    "teas",
-    "endevor",
-    "indenture",
-    "ossification",
-    "warm-toned",
-    "dangerous",
-    "sirinjani",
-    "itasca",
-    "thereabouts",
-    "hemingway's",
-    "cherwell",
-    "deforest",
-    "reminiscences",
-    "all-negro",
-    "fike",
-    "divorcee",
-    "baccarat",
-    "quotes",
-    "35",
-    "prisoners'",
-    "one-day",
-    "gingerly",
-    "well-brushed",
-    "alba",
-    "joel's",
-    "a40-ajk",
-    "glimpse",
-    "madrigals",
-    "1777",
-    "beehive",
-    "cervantes",
-    "38-point",
-    "appeal",
-    "jejunum",
-    "lexington",
-    "pariah",
-    "fellowship",
-    "equalled",
-    "1,450",
-    "necklaces",
-    "cross-fertilization",
-    "wei",
-    "griffith-jones",
-    "hips",
-    "bruno",
-    "peaches",
-    "euripides",
-    "fulfill",
-    "threat",
-    "boy",
-    "marvelous",
-    "writhing",
-    "foam's",
-    "director",
-    "transfer",
-    "forthrightness",
-    "snow's",
-    "dined",
-    "watersheds",
-    "4.3",
-    "controller",
-    "endows",
-    "sting",
-    "gaveston",
-    "heal",
-    "unsatisfactory",
-    "galled",
-    "pigs",
-    "intervals",
-    "pubs",
-    "legitimacy",
-    "alcoholic",
-    "reynolds",
-    "lessening",
-    "woulda",
-    "drunkenly",
-    "captivity",
-    "serves",
-    "dover",
-    "voids",
-    "overtakin'",
-    "grappelly",
-    "friendship",
-    "paused",
-    "jessica",
-    "michael",
-    "aransas",
-    "malinovsky",
-    "uttermost",
-    "2:38",
-    "riddle",
-    "transforms",
-    "kobayashi",
-    "invigoration",
-    "specialties",
-    "diver",
-    "interplay",
-    "pervaded",
-    "box-sized",
-    "behaviorally",
-    "communism's",
-    "ab4,500",
-    "tropho-",
-    "wis.",
-    "near-blind",
-    "1900",
-    "nuts",
-    "makeup",
-    "outrun",
-    "johansen",
-    "boulevards",
-    "savvy",
-    "unpublished",
-    "titers",
-    "newtonian",
-    "guzzled",
-    "enjoying",
-    "stretched",
-    "acourse",
-    "wastage",
-    "abrams",
-    "laswick",
-    "moos",
-    "foaming",
-    "1310",
-    "levi-clad",
-    "repeated",
-    "boundary",
-    "beesemyers",
-    "masquerades",
-    "thrilled",
-    "squealing",
-    "fogelson",
-    "subscribed",
-    "prey",
-    "piano",
-    "valiant",
-    "defying",
-    "choreographer",
-    "negatively",
-    "disintegrate",
-    "explanatory",
-    "glomerular",
-    "cosmical",
-    "qualities",
-    "pants-legs",
-    "thirty-four",
-    "electrocardiogram",
-    "exploded",
-    "mucker",
-    "grande",
-    "duane",
-    "prophesies",
-    "hers",
-    "flashlight",
-    "types",
-    "dreadnought",
-    "midsummer",
-    "branum",
-    "mencken",
-    "violins",
-    "tempting",
-    "forfeit",
-    "breadth",
-    "thereof",
-    "managerial",
-    "telephone",
-    "tipsy",
-    "craters",
-    "suburb",
-    "laurence",
-    "welborn",
-    "dials",
-    "full-banded",
-    "buddies",
-    "rippling",
-    "ice-cubes",
-    "gorky",
-    "compensate",
-    "sweetly",
-    "vest",
-    "twise",
-    "radii",
-    "unyielding",
-    "after-hours",
-    "surrender",
-    "tode",
-    "sapio",
-    "stainless-steel",
-    "negociants",
-    "sicker",
-    "vacuuming",
-    "detain",
-    "reorder",
-    "ooze",
-    "custer's",
-    "doble",
-    "knife/coating",
-    "eber",
-    "tolubeyev",
-    "if",
-    "barbell",
-    "17,000",
-    "fiber-coupled",
-    "shawomet",
-    "describes",
-    "in-laws",
-    "rauschenberg",
-    "consistency",
-    "incapacity",
-    "professionals",
-    "tempore",
-    "accentuate",
-    "hundred-odd",
-    "whorls",
-    "broody",
-    "irrational",
-    "capitalize",
-    "brieff",
-    "juvenile",
-    "pears",
-    "s",
-    "wish",
-    "lehmann",
-    "cash",
-    "thrush",
-    "overloud",
-    "squat-style",
-    "wall-to-wall",
-    "pandora",
-    "vent",
-    "das",
-    "sears",
-    "cheesecloth",
-    "fled",
-    "louise",
-    "view",
-    "dealing",
-    "hedda",
-    "uninfluenced",
-    "noah",
-    "23",
-    "irrelevant",
-    "practitioner",
-    "sketch",
-    "topgallant",
-    "refracted",
-    "architectural",
-    "calisthenics",
-    "solicitousness",
-    "soluble",
-    "reproduction",
-    "impassively",
-    "winnetka",
-    "ratiocinating",
-    "splashed",
-    "floc",
-    "karsner",
-    "radish",
-    "perfumery",
-    "$80,738",
-    "relies",
-    "easy",
-    "running",
-    "w",
-    "righteousness",
-    "commences",
-    "insolent",
-    "drake",
-    "7070/7074",
-    "brush",
-    "bolting",
-    "joyfully",
-    "ringed",
-    "latex",
-    "ineluctable",
-    "claret",
-    "libel",
-    "fasten",
-    "1298",
-    "setback",
-    "cupply",
-    "behaviour",
-    "upperclassmen",
-    "sod",
-    "1629",
-    "harpy",
-    "bunker",
-    "off-beat",
-    "michaels",
-    "tyler",
-    "spasms",
-    "pre-season",
-    "man's",
-    "1611",
-    "beseech",
-    "sharpest",
-    "undercurrent",
-    "fine",
-    "illustration",
-    "crackpot",
-    "siphoned",
-    "action-packed",
-    "workers'",
-    "radhakrishnan",
-    "freckled",
-    "fair-looking",
-    "handkerchiefs",
-    "rumania",
-    "**ye",
-    "hovarter",
-    "depth",
-    "analyzed",
-    "real",
-    "perdido",
-    "commercial",
-    "placentia",
-    "arimathea",
-    "soothed",
-    "sultans",
-    "nostradamus",
-    "ribald",
-    "lean-to",
-    "municipal",
-    "student-directed",
-    "inclusion",
-    "kluckhohn",
-    "long-sought",
-    "remaining",
-    "wound",
-    "admiration",
-    "spatiality",
-    "celebrating",
-    "grooved",
-    "horned",
-    "conducted",
-    "drapers",
-    "timothy",
-    "seward's",
-    "maximizes",
-    "undersized",
-    "vue",
-    "irritation",
-    "olerichs",
-    "contribute",
-    "concave",
-    "sputter",
-    "coeds",
-    "mattresses",
-    "postcard",
-    "apathy",
-    "ravages",
-    "engaged",
-    "transmuted",
-    "ray",
-    "splintered",
-    "designate",
-    "pioneer's",
-    "fingertips",
-    "coverall",
-    "cicognani",
-    "peddlers",
-    "benefactor's",
-    "congregate",
-    "exhibitions",
-    "hanukkah",
-    "dentistry",
-    "xrelease",
-    "padded",
-    "arrayed",
-    "gray-haired",
-    "dismiss",
-    "dorsey",
-    "in.",
-    "oldenburg's",
-    "9:40",
-    "banisters",
-    "accede",
-    "patrolmen",
-    "jane's",
-    "1800",
-    "linearly",
-    "dampened",
-    "phase",
-    "sternly",
-    "excused",
-    "andruses",
-    "ocular",
-    "colorama",
-    "gnomelike",
-    "modules",
-    "peking",
-    "1960s",
-    "slippers",
-    "jewelry",
-    "shameful",
-    "expiration",
-    "rankest",
-    "insatiable",
-    "association",
-    "vertigo",
-    "grants",
-    "crawl",
-    "massacres",
-    "thing",
-    "scoped",
-    "unaccompanied",
-    "sermon",
-    "grandfather",
-    "paycheck",
-    "bested",
-    "weather-resistant",
-    "troika",
-    "mamma",
-    "lond.",
-    "trumbull",
-    "well-meaning",
-    "grape",
-    "rayburn-johnson",
-    "light-headedness",
-    "ortega's",
-    "reviving",
-    "booted",
-    "brushed",
-    "banter",
-    "$4,000,000",
-    "unmindful",
-    "twenty-eight",
-    "reverse-surface",
-    "1935",
-    "pascataqua",
-    "northwestern",
-    "lammermoor",
-    "denial",
-    "decision",
-    "ghostlike",
-    "play-off",
-    "janice",
-    "doubtful",
-    "migrating",
-    "bosoms",
-    "rigged",
-    "california",
-    "nise",
-    "enver",
-    "all-automatic",
-    "bimini",
-    "bespectacled",
-    "sedately",
-    "glossed",
-    "crosson's",
-    "card",
-    "antiserum",
-    "twittered",
-    "artless",
-    "sweetheart",
-    "fellini",
-    "block-buster",
-    "purses",
-    "argive",
-    "magpie",
-    "ferociously",
-    "hotbed",
-    "scramble",
-    "inferences",
-    "burkes",
-    "support",
-    "strasbourg",
-    "operand",
-    "romantically",
-    "stone-still",
-    "cheshire",
-    "chinless",
-    "deller",
-    "torrent",
-    "bootlegging",
-    "4/4",
-    "hardee's",
-    "sympathizing",
-    "1859-1929",
-    "petrini",
-    "mimieux",
-    "introject",
-    "dire",
-    "ironic",
-    "532",
-    "doris",
-    "tandem",
-    "infatuation",
-    "libertines",
-    "buttressed",
-    "psithyrus",
-    "polemics",
-    "choking",
-    "thatches",
-    "wooded",
-    "clinic",
-    "psychotic",
-    "insuperable",
-    "154",
-    "brisker",
-    "'mon",
-    "guillaume",
-    "retentiveness",
-    "plunderers",
-    "vine-crisscrossed",
-    "countenance",
-    "954",
-    "loot",
-    "appalling",
-    "unchanged",
-    "earthenware",
-    "starter",
-    "275-degrees-f",
-    "spectators",
-    "five-volume",
-    "skit",
-    "low-key",
-    "bravest",
-    "digit",
-    "relearns",
-    "dinosaurs",
-    "unendurable",
-    "explicitly",
-    "sue",
-    "thoughtless",
-    "arbor",
-    "williams'",
-    "statements",
-    "crossman",
-    "antigen",
-    "hypothetical",
-    "leavenworth",
-    "skidded",
-    "persuasive",
-    "methodists",
-    "fears",
-    "ribbons",
-    "earp",
-    "jerky",
-    "knives",
-    "gangsters",
-    "consumers",
-    "suspicions",
-    "anchored",
-    "quotas",
-    "nos.",
-    "paus'l",
-    "senior-graduate",
-    "seacoast",
-    "castigated",
-    "opera's",
-    "choreography",
-    "ceremonially",
-    "yum-yum",
-    "boastings",
-    "hard-to-get",
-    "prohibiting",
-    "dryfoos'",
-    "jars",
-    "belvedere",
-    "agitated",
-    "supplement",
-    "bazaar",
-    "bristol",
-    "citrus",
-    "paralyzed",
-    "coupling",
-    "mecum",
-    "21",
-    "misrelated",
-    "$3.5",
-    "maroy",
-    "diethylstilbestrol",
-    "hillman's",
-    "hunched",
-    "blanchard's",
-    "motions",
-    "broadcastings",
-    "bequeathed",
-    "pantas",
-    "draperies",
-    "reinforced",
-    "trail",
-    "modality",
-    "seven-stories",
-    "carpenter",
-    "galway",
-    "tiny",
-    "theodosian",
-    "pisces",
-    "arrange",
-    "raining",
-    "door-fronted",
-    "shies",
-    "wear",
-    "gunning",
-    "equivalence",
-    "looms",
-    "moisture",
-    "up",
-    "quotation",
-    "sabre-rattling",
-    "snout",
-    "jewish",
-    "theistic",
-    "lesion",
-    "wondered",
-    "off-duty",
-    "self-seeking",
-    "learners",
-    "journey's",
-    "1-3",
-    "novak",
-    "victoriously",
-    "panjandrum",
-    "hammered",
-    "concurs",
-    "stockade",
-    "going-over",
-    "program",
-    "cushion",
-    "carrozza",
-    "beguiling",
-    "airs",
-    "infestations",
-    "85-degrees",
-    "eleazar",
-    "boatyards",
-    "rehearsing",
-    "gayety",
-    "that",
-    "porter's",
-    "bootle's",
-    "wilcke",
-    "strengthens",
-    "snyder's",
-    "leverkuhn",
-    "$83,750",
-    "dunlop",
-    "top-level",
-    "cold-blooded",
-    "3-0",
-    "leatherman",
-    "confiding",
-    "prayers",
-    "$14",
-    "preordainment",
-    "obeyed",
-    "whips",
-    "drawings",
-    "motorists",
-    "hail",
-    "converse",
-    "mushrooms",
-    "handwriting",
-    "alabamian",
-    "bunkmate",
-    "varlaam",
-    "peaceable",
-    "ther",
-    "well-educated",
-    "offering",
-    "dipoles",
-    "caucus",
-    "staunton",
-    "alliteration",
-    "unhinged",
-    "array",
-    "city-trading",
-    "ordinance",
-    "partnered",
-    "vacationers",
-    "rocker",
-    "lounged",
-    "miffed",
-    "20th",
-    "smu's",
-    "box",
-    "powerfulness",
-    "sophomore",
-    "unseen",
-    "teaching",
-    "andrei",
-    "shavings",
-    "expelling",
-    "edited",
-    "thoughtfulness",
-    "foulest",
-    "chole",
-    "inclusions",
-    "multi-lingual",
-    "shrillness",
-    "gravy",
-    "semi-independent",
-    "propagation",
-    "sturch",
-    "ruidoso",
-    "plumbing",
-    "betty's",
-    "20-25",
-    "norris",
-    "receded",
-    "fantasist",
-    "offensives",
-    "tillich",
-    "promenades",
-    "chanting",
-    "north",
-    "unrepentant",
-    "squawk",
-    "exogamy",
-    "evenly",
-    "jackson's",
-    "magically",
-    "liberalism",
-    "suing",
-    "diminishing",
-    "mass-building",
-    "trap",
-    "preamble",
-    "traipsing",
-    "digitalis",
-    "institution's",
-    "viewless",
-    "conned",
-    "barnstormer",
-    "herr",
-    "collonaded",
-    "neckline",
-    "cheap-money",
-    "elegant",
-    "repudiating",
-    "protective",
-    "sumptuous",
-    "sinus",
-    "republican-controlled",
-    "agreed",
-    "puissant",
-    "woolly-minded",
-    "1642",
-    "third-grade",
-    "1631",
-    "believed",
-    "repartee",
-    "superficiality",
-    "calenda",
-    "yff",
-    "eventshah-leh",
-    "dent",
-    "sorriest",
-    "record",
-    "enslave",
-    "foregone",
-    "alter-ego",
-    "dressed",
-    "gesture",
-    "asymmetric",
-    "mentioning",
-    "dvorak",
-    "meaningfully",
-    "academicianship",
-    "squared",
-    "monday's",
-    "moune",
-    "vernal",
-    "migrated",
-    "authoritative",
-    "america",
-    "scrubbing",
-    "italics",
-    "$581",
-    "jack's",
-    "browny-haired",
-    "clemens'",
-    "lashings",
-    "268,900",
-    "thoughts",
-    "attest",
-    "encompassed",
-    "toxic",
-    "scotchman",
-    "condemns",
-    "laguardia's",
-    "puffed",
-    "tsitouris",
-    "kappa",
-    "luring",
-    "founder-conductor",
-    "luminescence",
-    "tunic",
-    "zone",
-    "sacrosanct",
-    "schrunk",
-    "flutist",
-    "cogs",
-    "$12.00",
-    "famine",
-    "porpoises",
-    "1923-27",
-    "frequency-independent",
-    "outbursts",
-    "inhabited",
-    "vidal",
-    "grille",
-    "suggestive",
-    "satterfield",
-    "tailin'",
-    "frost",
-    "pre-inaugural",
-    "operationally",
-    "bondsman",
-    "felicitous",
-    "1981",
-    "inadequate",
-    "thudding",
-    "var.",
-    "eatings",
-    "low-temperature",
-    "skiing",
-    "colonials",
-    "orchestra",
-    "flocculation",
-    "laminate",
-    "iconoclasm",
-    "blasphemous",
-    "occupy",
-    "municipality",
-    "wergeland",
-    "missed",
-    "huffman",
-    "eighty-nine",
-    "lukuklu",
-    "anti-communism",
-    "hangouts",
-    "1/3",
-    "appraisals",
-    "olson's",
-    "well-fleshed",
-    "poster",
-    "mousie",
-    "insulted",
-    "ethically",
-    "profitable",
-    "paralyzes",
-    "araby",
-    "warms",
-    "blackfeet",
-    "brokerage",
-    "maniac",
-    "plastering",
-    "struggle",
-    "unrehearsed",
-    "twin",
-    "unforseen",
-    "official",
-    "slow-baked",
-    "logic-rhetoric",
-    "initialed",
-    "stable",
-    "backyards",
-    "cross-cultural",
-    "208-pound",
-    "bobby-sox",
-    "kunkel's",
-    "doubled",
-    "mauldin",
-    "burglarproof",
-    "macwhorter",
-    "bowan",
-    "inflections",
-    "floats",
-    "neutralists",
-    "reedy",
-    "redheads",
-    "mug",
-    "rummaging",
-    "unexplainable",
-    "limpid",
-    "wielder",
-    "embarrassed",
-    "non-public",
-    "worth-while",
-    "multitude",
-    "apocalypse",
-    "sheaf",
-    "thinner",
-    "deserving",
-    "retiring",
-    "manuscripts",
-    "ravenous",
-    "proudly",
-    "tuxapoka",
-    "1/50th",
-    "adair",
-    "subsections",
-    "yeller",
-    "m-m-m",
-    "1950s",
-    "sterile",
-    "whipping",
-    "25",
-    "qualms",
-    "melioration",
-    "sportsman",
-    "exporting",
-    "booming",
-    "duque",
-    "mar",
-    "pleasingly",
-    "duct",
-    "magnification",
-    "affiliations",
-    "herman",
-    "amplifying",
-    "barge",
-    "tomato",
-    "beecher",
-    "snuffer",
-    "wanting-to-be-alone",
-    "south-central",
-    "disturber",
-    "itself",
-    "bas",
-    "post-dispatch",
-    "hindquarters",
-    "sentinels",
-    "resignations",
-    "cezanne's",
-    "stint",
-    "cobblestone",
-    "hell-bound",
-    "pronoun",
-    "plugged",
-    "hotei",
-    "pro-communist",
-    "fanciful",
-    "flower-scented",
-    "diets",
-    "accountants",
-    "modernism",
-    "employees",
-    "demographic",
-    "block",
-    "says",
-    "fourteen-team",
-    "sabinas",
-    "mealynosed",
-    "caryatides",
-    "united",
-    "ropes",
-    "torsos",
-    "glissade",
-    "justitia",
-    "pinging",
-    "lower-class",
-    "hessian",
-    "snobbishly",
-    "pontiff",
-    "fluke",
-    "receipts",
-    "sour",
-    "nair",
-    "slanderous",
-    "intellectual-literary",
-    "overthrow",
-    "prehistoric",
-    "coworkers",
-    "intra-mural",
-    "sojourner",
-    "peptides",
-    "brigade",
-    "clog",
-    "lemuel",
-    "croaks",
-    "outdated",
-    "gladness",
-    "amadee",
-    "pompeii's",
-    "attis",
-    "testimonials",
-    "cufflinks",
-    "incomprehensible",
-    "angelica",
-    "addition",
-    "minks",
-    "chant",
-    "liquids",
-    "lois",
-    "mesenteric",
-    "tempter",
-    "khasi",
-    "percussive",
-    "practicality",
-    "equalizing",
-    "improvised",
-    "symbolism",
-    "swim",
-    "unrest",
-    "invoke",
-    "entire",
-    "320tr",
-    "embroidery",
-    "beaten",
-    "polyether-type",
-    "canonist",
-    "lena",
-    "kirby",
-    "recollect",
-    "weird",
-    "fortresses",
-    "kaskaskia",
-    "brockle",
-    "argues",
-    "wired",
-    "prevail",
-    "tenant",
-    "beckoned",
-    "once",
-    "constance",
-    "big-chested",
-    "masson",
-    "zadel",
-    "assemble",
-    "immoralities",
-    "2.26",
-    "nearly",
-    "requisition",
-    "bartol",
-    "participates",
-    "otis",
-    "attracts",
-    "manganese",
-    "eloi",
-    "typically",
-    "cased",
-    "subordinator",
-    "meme",
-    "vivian",
-    "gravid",
-    "inertia",
-    "reproduce",
-    "promise",
-    "abandon",
-    "pomham",
-    "journalists",
-    "boating",
-    "evidence",
-    "disunity",
-    "company-paid",
-    "hangover",
-    "medico's",
-    "outrage",
-    "murphy's",
-    "pluck",
-    "judges",
-    "re-set",
-    "sluiced",
-    "1991",
-    "soconoco",
-    "cargill's",
-    "clair",
-    "atm",
-    "anti-intellectualism",
-    "codfish",
-    "dobbs",
-    "lolotte",
-    "representative",
-    "media",
-    "introduces",
-    "jeers",
-    "delawares",
-    "reign",
-    "infect",
-    "auspiciously",
-    "battle-ax",
-    "urged",
-    "wellbeing",
-    "fontana",
-    "bradford",
-    "yankee-hatred",
-    "violently",
-    "blanche's",
-    "alligatored",
-    "protect",
-    "spoke",
-    "ascetic",
-    "wrong",
-    "high-spirited",
-    "mullah",
-    "paving",
-    "$43.50",
-    "1972",
-    "limit",
-    "closer",
-    "1600/1",
-    "misgauged",
-    "appointment",
-    "wattles",
-    "lbs.",
-    "shining",
-    "morbid",
-    "animized",
-    "landes",
-    "sulzberger's",
-    "paraphrasing",
-    "defendant",
-    "seal",
-    "causes",
-    "disapprobation",
-    "steamboat",
-    "conspirators",
-    "ante",
-    "valueless",
-    "wristwatch",
-    "chandler's",
-    "115",
-    "hoots",
-    "plumped",
-    "fluid",
-    "plague",
-    "perfume",
-    "rescinded",
-    "1825-1826",
-    "crawford",
-    "warmed-over",
-    "inna",
-    "throneberry",
-    "boon",
-    "catheter",
-    "crews",
-    "trash",
-    "nonspecific",
-    "21-9",
-    "heartbreak",
-    "gloves",
-    "functionally",
-    "graft",
-    "unrolled",
-    "lithograph",
-    "mineralogical",
-    "choose",
-    "$70",
-    "fleisher's",
-    "montfaucon",
-    "downing",
-    "clotted",
-    "particularistic",
-    "canter",
-    "seventy-six",
-    "centre",
-    "vivified",
-    "dissipated",
-    "attentive",
-    "davidson",
-    "independents",
-    "disillusioned",
-    "collinsville",
-    "donaldson",
-    "overfill",
-    "1841",
-    "bleedings",
-    "mclendon-ebony",
-    "rowed",
-    "12a",
-    "thru",
-    "nations",
-    "zurich",
-    "gratt",
-    "straight-haired",
-    "sprinkle",
-    "girl's",
-    "remissions",
-    "nick",
-    "sharon",
-    "bureaucrats",
-    "apostates",
-    "assam",
-    "anton",
-    "zworykin",
-    "albert",
-    "rushmore",
-    "jails",
-    "false-fronted",
-    "accelerometers",
-    "grated",
-    "gadgets",
-    "acquires",
-    "appearing",
-    "entry-limit",
-    "amateurish",
-    "$29",
-    "delivery",
-    "kingdoms",
-    "prokofieff",
-    "mammas",
-    "presage",
-    "fate",
-    "hurt",
-    "vast",
-    "architects",
-    "startled-horse",
-    "twenties",
-    "extravaganzas",
-    "tussle",
-    "birth-control",
-    "celebrants",
-    "combinable",
-    "bardall",
-    "mohammed",
-    "gawdamighty",
-    "esse",
-    "fattening",
-    "150",
-    "schweitzer",
-    "flexible",
-    "mayhem",
-    "observable",
-    "contraptions",
-    "tiao",
-    "sundown",
-    "notices",
-    "stewart",
-    "refreshments",
-    "trustee's",
-    "barbed-wire",
-    "leisure",
-    "campbell",
-    "embodiment",
-    "u.n.-chartered",
-    "rotating",
-    "catherwood",
-    "jurist",
-    "viscoelasticity",
-    "loaf",
-    "braques",
-    "perishing",
-    "capistrano",
-    "logic",
-    "states",
-    "mose",
-    "suckers",
-    "albers",
-    "a135",
-    "shrimp",
-    "aeronautics",
-    "claw",
-    "commentators",
-    "zabel",
-    "addicts",
-    "fabric",
-    "parakeets",
-    "fames",
-    "kaleidoscope",
-    "innuendo",
-    "policy-oriented",
-    "southern-central",
-    "selling",
-    "fingerprint",
-    "oleg",
-    "ranged",
-    "farewell",
-    "hapless",
-    "lyman",
-    "inactivity",
-    "235",
-    "knight",
-    "barrett",
-    "metrecal",
-    "texas'",
-    "showers",
-    "unlikely",
-    "marjorie",
-    "panties",
-    "attorneys",
-    "mouvement",
-    "pricking",
-    "losers",
-    "familial",
-    "rapture",
-    "foy",
-    "majuh",
-    "stateless",
-    "intra-state",
-    "irreparably",
-    "saud",
-    "pegged",
-    "dodger",
-    "'55",
-    "fln",
-    "yoknapatawpha",
-    "soft",
-    "aye-yah-ah-ah",
-    "neurological",
-    "contexts",
-    "bangish",
-    "classifying",
-    "kept",
-    "psychological",
-    "pulls",
-    "motels",
-    "containing",
-    "pussycat",
-    "standardizing",
-    "inducing",
-    "sheep-lined",
-    "intramuscularly",
-    "circulating",
-    "deity",
-    "terrains",
-    "palestine",
-    "complying",
-    "misunderstood",
-    "six-inch",
-    "bearden",
-    "leggy",
-    "10.3-cm",
-    "sequins",
-    "gapt",
-    "grams",
-    "susceptibility",
-    "virsaladze",
-    "svevo",
-    "accomodations",
-    "dualism",
-    "irresistibly",
-    "decree",
-    "trundle",
-    "1,600",
-    "fencing",
-    "temporarily",
-    "two-burner",
-    "alizarin",
-    "artist",
-    "stupor",
-    "vigorously",
-    "black-market",
-    "advisers",
-    "commencements",
-    "gullies",
-    "boulders",
-    "175",
-    "dozen",
-    "terrified",
-    "scotian",
-    "'round",
-    "lifelike",
-    "bernz-o-matic",
-    "hitler",
-    "mottled",
-    "high-sudsing",
-    "parables",
-    "triple-crown",
-    "thackeray",
-    "caretaker",
-    "sombre",
-    "lookup",
-    "dispensary",
-    "headlinese",
-    "plunged",
-    "calorimetric",
-    "tenderness",
-    "hir",
-    "feeley",
-    "abandoned",
-    "dunes",
-    "big-ticket",
-    "agilely",
-    "airstrip",
-    "deadly",
-    "painters",
-    "chromed",
-    "go",
-    "brigades",
-    "philharmonic",
-    "pitches",
-    "sorry",
-    "glory",
-    "lath",
-    "elderly",
-    "frontiers",
-    "poisonous",
-    "matching",
-    "departures",
-    "rare",
-    "open",
-    "labor",
-    "zinc",
-    "hifalutin'",
-    "sixteenth",
-    "scandalized",
-    "dun",
-    "$75-billion",
-    "sitter",
-    "solos",
-    "unobtrusively",
-    "martinis",
-    "oafs",
-    "tires",
-    "parking",
-    "clutches",
-    "winder",
-    "content",
-    "a.l.a.m.",
-    "barest",
-    "button-down",
-    "othon's",
-    "correct",
-    "1924",
-    "drafts",
-    "off-the-cuff",
-    "linda",
-    "srelease",
-    "saline",
-    "who'll",
-    "poet",
-    "transferral",
-    "high's",
-    "by-roads",
-    "staiger",
-    "sisters-in-law",
-    "bedroom's",
-    "after",
-    "prudential",
-    "crimson",
-    "scalding",
-    "william's",
-    "halleck",
-    "shutdowns",
-    "eying",
-    "vladilen",
-    "distresses",
-    "kitchenette",
-    "twentieth-century",
-    "hospitalization",
-    "augusta",
-    "clambered",
-    "stopped",
-    "plaintiff",
-    "leads",
-    "teacher's",
-    "irving",
-    "bergamaschi",
-    "secretly",
-    "dwellings",
-    "195-page",
-    "shutters",
-    "lurked",
-    "subdued",
-    "ore.",
-    "mill-pond",
-    "shred",
-    "strolling",
-    "second-look",
-    "topsoil",
-    "stereo",
-    "anti-catholic",
-    "twenty-mile",
-    "umschlagplatz",
-    "towne",
-    "gurkhas",
-    "convinced",
-    "christsake",
-    "sacramento",
-    "affair",
-    "subtleties",
-    "conciseness",
-    "committed",
-    "$740",
-    "wheelan's",
-    "magic",
-    "engage",
-    "capsicum",
-    "fan",
-    "fifteenth",
-    "letters",
-    "demus-schubert",
-    "31978",
-    "occupies",
-    "slipped",
-    "tracts",
-    "waylaid",
-    "country",
-    "whatsoever",
-    "dunkel",
-    "harmlessly",
-    "'till",
-    "boom",
-    "core",
-    "tombigbee",
-    "comet's-tail",
-    "suite's",
-    "tomorrow",
-    "saucers",
-    "concludes",
-    "time-life",
-    "union's",
-    "low-down",
-    "tilled",
-    "temperance",
-    "she's",
-    "intervening",
-    "reflects",
-    "massuh",
-    "daybed",
-    "disarm",
-    "proton",
-    "archfool",
-    "scoreboard",
-    "colloquium",
-    "slowly-mending",
-    "i.",
-    "raised",
-    "tunisia",
-    "underworld",
-    "lymphoma",
-    "ruse",
-    "briefed",
-    "lends",
-    "silvery",
-    "sessions",
-    "seller's",
-    "shabbily",
-    "shoestrings",
-    "post-independence",
-    "peculiarly",
-    "florist",
-    "punctuation",
-    "headed",
-    "pivot",
-    "luke",
-    "gilborn",
-    "distilled",
-    "longinotti",
-    "mccormick",
-    "tarpapered",
-    "contralto",
-    "woodcock's",
-    "much",
-    "monopolistic",
-    "unshakable",
-    "sunshiny",
-    "agitator",
-    "cropped",
-    "entertaining",
-    "disastrous",
-    "unneeded",
-    "concerns",
-    "fortitude",
-    "cortically",
-    "landed",
-    "gallop",
-    "electrophoresis",
-    "o'dwyers",
-    "intrapulmonary",
-    "lahk",
-    "prostrate",
-    "fowl",
-    "gang",
-    "consists",
-    "progresses",
-    "colorful",
-    "eyebrows",
-    "certified",
-    "36",
-    "primate",
-    "saul",
-    "conciliate",
-    "seven-",
-    "shrug",
-    "nope",
-    "farmer",
-    "philco-sponsored",
-    "registrants'",
-    "127-mile",
-    "gallery's",
-    "saw-horse",
-    "thickly",
-    "stochastic",
-    "clearwater",
-    "collaboration",
-    "contamination",
-    "acres",
-    "parish",
-    "7:50",
-    "nonconformists",
-    "privies",
-    "shelved",
-    "helmets",
-    "present-day",
-    "subsidize",
-    "breath",
-    "worse",
-    "webb",
-    "goose",
-    "linguist-anthropologist",
-    "grand",
-    "graduate",
-    "$125",
-    "$16.00",
-    "z-gyro",
-    "goddam",
-    "functional",
-    "club's",
-    "plume",
-    "sen.",
-    "gogol",
-    "occlusive",
-    "isaacson",
-    "downwind",
-    "comprehensively",
-    "kunkel",
-    "pedagogical",
-    "quiz",
-    "myelofibrosis",
-    "u.s.s.r.'s",
-    "buckskin's",
-    "insecure",
-    "seated",
-    "homeland",
-    "lieutenant",
-    "flier",
-    "brainy",
-    "deeds",
-    "obesity",
-    "suez-hungary",
-    "boniface's",
-    "fishers",
-    "17",
-    "hoof",
-    "self-portrait",
-    "esterases",
-    "raymond",
-    "godhead",
-    "ransy",
-    "tillotson",
-    "trees'",
-    "ascent",
-    "verses",
-    "fashion",
-    "breakup",
-    "stylized",
-    "mastodons",
-    "titans",
-    "boyce",
-    "35-mm.-wide",
-    "tantamount",
-    "stalwart",
-    "garrisonian",
-    "buccolic",
-    "generally",
-    "preview",
-    "mistaking",
-    "headdress",
-    "nasal",
-    "afghans",
-    "photograph",
-    "quote",
-    "gerry",
-    "transcribe",
-    "pandanus",
-    "flexural",
-    "intuitively",
-    "bunch",
-    "olives",
-    "entertainers",
-    "bedrooms",
-    "uniting",
-    "swathings",
-    "teachers",
-    "sizzled",
-    "arbuckle",
-    "persons",
-    "lorlyn",
-    "bare",
-    "d'",
-    "tower's",
-    "detected",
-    "titian",
-    "grading",
-    "production",
-    "disenfranchisement",
-    "browning",
-    "wisecracked",
-    "throat",
-    "diamond-studded",
-    "all-married",
-    "fired",
-    "spatter",
-    "karamazov",
-    "spatial",
-    "paula",
-    "phonic",
-    "wed",
-    "cantilevers",
-    "tristano",
-    "dark-brown",
-    "6-passenger",
-    "anouilh",
-    "madrid",
-    "woodman's",
-    "chronicle's",
-    "oatnut",
-    "long-shanked",
-    "bilked",
-    "fruits",
-    "1915",
-    "possiblities",
-    "owe",
-    "intermission",
-    "non-linear",
-    "reparation",
-    "c.a.i.p.",
-    "arduous",
-    "leapfrog",
-    "decertify",
-    "neurotic",
-    "colorado",
-    "docherty",
-    "8-4",
-    "reelected",
-    "qualification",
-    "minorities",
-    "99.1",
-    "supercilious",
-    "hourly",
-    "broil",
-    "mid-range",
-    "trailers",
-    "bridgeport",
-    "executor",
-    "3.0",
-    "0.154",
-    "fines",
-    "junta",
-    "linguistics",
-    "solely",
-    "deus",
-    "pretty",
-    "censuses",
-    "exhaustingly",
-    "lettering",
-    "redeposition",
-    "briskly",
-    "unconcern",
-    "threshing",
-    "semantic",
-    "widened",
-    "push-up",
-    "austrian",
-    "ceiling",
-    "thump",
-    "justness",
-    "scot",
-    "truncated",
-    "bouvardier",
-    "critical",
-    "aliens",
-    "rain-slick",
-    "bandaging",
-    "all-lesbian",
-    "cedric",
-    "sacral",
-    "beefore",
-    "brace",
-    "sprayed",
-    "organizers",
-    "glycols",
-    "hagerty's",
-    "millay",
-    "melange",
-    "kimbell-diamond",
-    "bruited",
-    "kayabashi",
-    "thirty-nine",
-    "trivial",
-    "work-success",
-    "comedy",
-    "mij",
-    "va.",
-    "412-413",
-    "celery",
-    "restore",
-    "rocket-bomb",
-    "retracted",
-    "thwump",
-    "gunnar",
-    "contains",
-    "stunning",
-    "obstacle",
-    "lather",
-    "currant",
-    "throwin'",
-    "unbelieving",
-    "obliged",
-    "kong",
-    "anti-secrecy",
-    "463-degrees-c",
-    "shipment",
-    "precariously",
-    "co-signers",
-    "builder-dealer",
-    "coeditors",
-    "eliot",
-    "great-nieces",
-    "tongues",
-    "crime",
-    "pursed",
-    "jackbooted",
-    "obscure",
-    "zlotys",
-    "bang",
-    "scabrous",
-    "marrow",
-    "vagabond",
-    "backside",
-    "$29,000",
-    "undergo",
-    "soiled",
-    "demoralizing",
-    "originals",
-    "scholars",
-    "april",
-    "mold",
-    "closed-circuit",
-    "supporters",
-    "consult",
-    "hotel's",
-    "notching",
-    "normalized",
-    "build",
-    "shark's",
-    "rose",
-    "sextet",
-    "coin",
-    "coopers",
-    "70th",
-    "israeli",
-    "1811-1884",
-    "transmitted",
-    "sentient",
-    "aspen",
-    "anthology",
-    "virgilia",
-    "odom",
-    "playback",
-    "grimmer",
-    "rodents",
-    "vitriolic",
-    "mateo",
-    "decries",
-    "p'lite",
-    "safest",
-    "imprisonment",
-    "armload",
-    "chromatographic",
-    "home-blend",
-    "tyrannical",
-    "progressive",
-    "mainly",
-    "galophone-prissy",
-    "hands",
-    "woolly",
-    "conceptually",
-    "vicinity",
-    "reassured",
-    "$75,000,000",
-    "abbreviation",
-    "begun",
-    "realm",
-    "protrusion",
-    "pork",
-    "ford",
-    "dairy-oh",
-    "piazzas",
-    "stared",
-    "glances",
-    "radios",
-    "threateningly",
-    "good-natured",
-    "finney",
-    "statesmanlike",
-    "currents",
-    "liberal's",
-    "transcendant",
-    "end",
-    "opportunities",
-    "bogeys",
-    "aspire",
-    "eighty-seventh",
-    "unthematic",
-    "discriminatory",
-    "daffodils",
-    "females",
-    "diverse",
-    "4.8",
-    "paree",
-    "propositioned",
-    "acquired",
-    "university-educated",
-    "orthodoxy",
-    "towardes",
-    "interlayer",
-    "extensively",
-    "victor",
-    "james's",
-    "orderly",
-    "74",
-    "sappy",
-    "soiree",
-    "katow",
-    "water",
-    "bibliophiles",
-    "methacrylate",
-    "signor",
-    "lioness'",
-    "convocations",
-    "cabdriver",
-    "confers",
-    "casualty",
-    "conducts",
-    "airports",
-    "sammy",
-    "pantomimed",
-    "companion",
-    "dividend",
-    "borates",
-    "cues",
-    "interrelationships",
-    "bangs",
-    "dean",
-    "scattergun",
-    "instrumentalities",
-    "maimed",
-    "fresh-ground",
-    "raw",
-    "spike-haired",
-    "yielding-mediterranian-woman-",
-    "manny",
-    "strongrooms",
-    "two-way",
-    "bust",
-    "speculate",
-    "culbertson",
-    "freeways",
-    "2:34-:34",
-    "weekday",
-    "military-medical",
-    "dolphins",
-    "invaders",
-    "sixteen",
-    "$28",
-    "shortsighted",
-    "deserves",
-    "beautifying",
-    "spagna",
-    "comroe",
-    "russia's",
-    "competency",
-    "thermos",
-    "epidermis",
-    "foundry",
-    "docked",
-    "first-level",
-    "hedonism",
-    "clique",
-    "screenings",
-    "fishermen",
-    "vowing",
-    "convulsively",
-    "wattenberg",
-    "carvey",
-    "george",
-    "monocite",
-    "murderer",
-    "hibernate",
-    "reply",
-    "meeker's",
-    "embassies",
-    "guises",
-    "sewn",
-    "b-58",
-    "arbitrated",
-    "sanitation",
-    "crossings",
-    "hawaiian",
-    "1500",
-    "merit",
-    "noise",
-    "paled",
-    "roquemore",
-    "notation",
-    "shooting",
-    "frangipani",
-    "scrim",
-    "pinkie",
-    "outlets",
-    "weighs",
-    "birdlike",
-    "butts",
-    "dourly",
-    "singer",
-    "usom",
-    "freighter",
-    "p-11",
-    "ullman",
-    "wangled",
-    "locomotives",
-    "indigestible",
-    "gulliver's",
-    "words",
-    "broom",
-    "curl",
-    "regiment's",
-    "sinners",
-    "thoroughness",
-    "commence",
-    "flatnesses",
-    "piepsam's",
-    "extra-thick",
-    "s.c.",
-    "carpeting",
-    "numerous",
-    "arise",
-    "shores'",
-    "heard",
-    "meterological",
-    "rheumatics",
-    "bleckley",
-    "thelma",
-    "wildcatter",
-    "flips",
-    "doors",
-    "concentration",
-    "huhmun",
-    "doubt",
-    "kempe",
-    "distorted",
-    "hindered",
-    "barth",
-    "inconceivable",
-    "myocardium",
-    "arterial",
-    "blest",
-    "ja",
-    "31st",
-    "diabetes",
-    "fortified",
-    "affecting",
-    "lieder",
-    "leafiest",
-    "jiffy-couch-a-bed",
-    "pastry-lined",
-    "1780",
-    "$300,000,000",
-    "mermaid",
-    "saudi-american",
-    "couturier",
-    "luck",
-    "swore",
-    "contadini",
-    "pardon",
-    "motorscooters",
-    "ml",
-    "bowing",
-    "respect",
-    "noranda",
-    "reader's",
-    "reputation's",
-    "1957",
-    "pansies",
-    "past-fantasy",
-    "birdies",
-    "benet's",
-    "downstream",
-    "persia",
-    "alkalis",
-    "privately",
-    "10.6",
-    "farnworth",
-    "5.5",
-    "royalty",
-    "tinkling",
-    "monkeys",
-    "spectrometer",
-    "moore's",
-    "blotted",
-    "damed",
-    "roulette",
-    "canteen",
-    "la",
-    "stinky",
-    "lees",
-    "bushnell",
-    "beautify",
-    "cardiac",
-    "eagerness",
-    "survivalist",
-    "inhabiting",
-    "bel",
-    "genres",
-    "bell",
-    "l-p",
-    "intellectuals",
-    "lengthening",
-    "1896",
-    "bishopry",
-    "anarchical",
-    "broadway's",
-    "non-time",
-    "militated",
-    "enamel",
-    "fence",
-    "ambidextrous",
-    "arside",
-    "strangulation",
-    "flirtation",
-    "seminario",
-    "uninterrupted",
-    "banjo",
-    "4-1/2%",
-    "madhouse",
-    "hackettstown",
-    "completeness",
-    "nonracial",
-    "saga",
-    "resulted",
-    "burrowed",
-    "organised",
-    "blood-filled",
-    "goa",
-    "cholesterol",
-    "observance",
-    "soft-",
-    "irredeemable",
-    "steeled",
-    "interested",
-    "uproar",
-    "canister",
-    "quarter-to-quarter",
-    "unhurt",
-    "thermopylae",
-    "bathroom",
-    "ringel",
-    "lyricist",
-    "bomb-proof",
-    "colicky",
-    "prestige",
-    "entertain",
-    "pernod",
-    "fiction-writing",
-    "monica",
-    "t'lah",
-    "masterfully",
-    "legion",
-    "hooted",
-    "spectrally",
-    "vermeersch",
-    "pesticides",
-    "sabella",
-    "others'",
-    "supercritical",
-    "karlis",
-    "scops",
-    "osborne",
-    "6934",
-    "creole",
-    "rozelle",
-    "vehicular",
-    "speaker's",
-    "tent",
-    "filibuster",
-    "unpredictable",
-    "medium-sized",
-    "executed",
-    "maintains",
-    "misunderstandings",
-    "sponsor",
-    "waspish",
-    "contour-obliterating",
-    "sniping",
-    "stupidity",
-    "wintertime",
-    "pettiness",
-    "approached",
-    "majored",
-    "peas",
-    "manu",
-    "survivors'",
-    "3's",
-    "unalterable",
-    "nova",
-    "oddly",
-    "coletta",
-    "connotation",
-    "ammunition",
-    "sarah's",
-    "melodically",
-    "microphone",
-    "patronage",
-    "sundry",
-    "purification",
-    "20-cps",
-    "astronomical",
-    "musicale",
-    "single-crystal",
-    "consisently",
-    "liens",
-    "david",
-    "hummed",
-    "sally's",
-    "carpentier",
-    "abstention",
-    "noted",
-    "quirt",
-    "forward-moving",
-    "altogether",
-    "2:04",
-    "naughty",
-    "combs",
-    "ambitions",
-    "destroy",
-    "drugstores",
-    "salesmanship",
-    "addresses",
-    "annum",
-    "spices",
-    "aqueducts",
-    "cappy's",
-    "wendell",
-    "oklahoma",
-    "templeman",
-    "newer",
-    "tightest",
-    "rend",
-    "haitian",
-    "saami's",
-    "continue",
-    "mekong",
-    "burgundies",
-    "afferent",
-    "smelt",
-    "anastomotic",
-    "overload",
-    "influent",
-    "floes",
-    "diocese",
-    "gnome",
-    "reflexly",
-    "berniece",
-    "retreating",
-    "clinked",
-    "dispense",
-    "races",
-    "sez",
-    "clocked",
-    "extensions",
-    "boun",
-    "simmons'",
-    "jenkins",
-    "majdan-tartarski",
-    "osipenko",
-    "cemal",
-    "notch",
-    "extruder",
-    "listeners",
-    "sortie",
-    "melon-like",
-    "checkup",
-    "rufus",
-    "origin",
-    "bourbon",
-    "reforming",
-    "bavaria",
-    "metering",
-    "liabilities",
-    "baptiste",
-    "installations",
-    "schumann's",
-    "shall",
-    "redwoods",
-    "reconvened",
-    "bottles",
-    "indecisive",
-    "honoring",
-    "creation",
-    "employers",
-    "switching",
-    "daly",
-    "mattie",
-    "20,000",
-    "comedie's",
-    "morale",
-    "grasslands",
-    "netherlands",
-    "porches",
-    "betsey",
-    "test-like",
-    "enterteyned",
-    "secretaries'",
-    "every",
-    "catskill",
-    "victor's",
-    "retell",
-    "stooges",
-    "steam-generation",
-    "legal",
-    "applications",
-    "cosec",
-    "berne",
-    "stanley's",
-    "fudo's",
-    "gregg",
-    "windbag",
-    "hoes",
-    "135*0c.",
-    "invent",
-    "zombie",
-    "reimburses",
-    "portable",
-    "home-grown",
-    "crossbars",
-    "**ya",
-    "rising",
-    "biggest",
-    "photofloodlights",
-    "haven",
-    "background",
-    "industriously",
-    "persistence",
-    "landlords",
-    "mutinies",
-    "ordain",
-    "associating",
-    "best-seller",
-    "exploration",
-    "illustrations",
-    "sonates",
-    "verplanck's",
-    "p.s.",
-    "kozintsev",
-    "uh",
-    "chinked",
-    "warden",
-    "guard",
-    "aldridge",
-    "incepted",
-    "pawing",
-    "very",
-    "careful",
-    "reprints",
-    "denton",
-    "digges",
-    "explosion",
-    "meek",
-    "infarct",
-    "convincingly",
-    "daggerman",
-    "accommodations",
-    "apprehension",
-    "techniques",
-    "stonily",
-    "yearn",
-    "occasional",
-    "fad",
-    "assuming",
-    "accelerometer",
-    "censors",
-    "bob",
-    "urgency",
-    "herman's",
-    "self-judging",
-    "landscaped",
-    "non-bearing",
-    "forwarding",
-    "mccloy's",
-    "approaching",
-    "hoppled",
-    "lowering",
-    "atlantes",
-    "grimm's",
-    "haughton's",
-    "wormy",
-    "farmers",
-    "stratagem",
-    "mustangs",
-    "tiers",
-    "striving",
-    "albright's",
-    "harangued",
-    "sheepskin",
-    "hoydenish",
-    "cab",
-    "budget",
-    "battlefront",
-    "reunion",
-    "seventy-four",
-    "seldom",
-    "face-lifting",
-    "s-20",
-    "sobriquet",
-    "fights",
-    "squabbling",
-    "couch",
-    "oblique",
-    "analytical",
-    "assonance",
-    "smell",
-    "burley",
-    "mending",
-    "yvette",
-    "original",
-    "cocopalm",
-    "exceeds",
-    "pettibone",
-    "cruelty",
-    "scotland",
-    "iijima",
-    "amalgamated",
-    "oceanography",
-    "markedly",
-    "practical",
-    "lutheran",
-    "irish",
-    "divers",
-    "artist-author",
-    "literatures",
-    "madam",
-    "nebulous",
-    "refresher",
-    "casey",
-    "pigpens",
-    "21/64''",
-    "dade",
-    "paba",
-    "seebohm",
-    "beside",
-    "portraiture",
-    "davenport",
-    "spell",
-    "englishy",
-    "prexy",
-    "314",
-    "coincidental",
-    "loveliest",
-    "differentiate",
-    "yes",
-    "dickey",
-    "vastly",
-    "trembled",
-    "depicting",
-    "off-color",
-    "computational",
-    "metropolitan",
-    "honored",
-    "professedly",
-    "part",
-    "diversified",
-    "alperts",
-    "cox",
-    "lumen",
-    "composer-pianist-conductor",
-    "candid",
-    "pulmonary",
-    "roamed",
-    "effie",
-    "tombstones",
-    "judiciaries",
-    "candidate-picking",
-    "central",
-    "moon's",
-    "anselmo",
-    "elusiveness",
-    "hon",
-    "horse-playing",
-    "edging",
-    "lacking",
-    "groth's",
-    "nation's",
-    "salon",
-    "minstrel",
-    "recorded",
-    "regaled",
-    "thruway",
-    "do-gooder",
-    "poise",
-    "infirmary",
-    "marquis'",
-    "lignite",
-    "lymington",
-    "open-mouthed",
-    "meditating",
-    "first-rate",
-    "sacrifice",
-    "lombard",
-    "vulgar",
-    "molinari",
-    "burne",
-    "aids",
-    "magnates",
-    "lump",
-    "pervasively",
-    "alacrity",
-    "bingles",
-    "woods",
-    "imboden",
-    "'scuse",
-    "evaded",
-    "irradiation",
-    "edison",
-    "wholesome",
-    "spending",
-    "wanderer",
-    "close-in",
-    "oilseeds",
-    "mansion",
-    "faster",
-    "unfolds",
-    "cushioning",
-    "cortico-fugal",
-    "naphta",
-    "brutalized",
-    "semi-literate",
-    "uppermost",
-    "bo'sun's",
-    "equalization",
-    "pinsk",
-    "jumping",
-    "generation",
-    "unmeritorious",
-    "unpredictability",
-    "-.10",
-    "stitches",
-    "4",
-    "dissenter",
-    "9.4",
-    "pre-han",
-    "exposure",
-    "wishful",
-    "jorda",
-    "guard's",
-    "foggy",
-    "cereal",
-    "raked",
-    "lynn",
-    "soulfully",
-    "marlene",
-    "cabinetmakers",
-    "picking",
-    "ocarina",
-    "autopsied",
-    "bites",
-    "inaccuracies",
-    "4,500",
-    "valery",
-    "undisclosed",
-    "parkhouse",
-    "l'universite",
-    "lets",
-    "4:18",
-    "sables",
-    "hexametaphosphate",
-    "vests",
-    "cabot's",
-    "key",
-    "rabbi's",
-    "stolzenbach",
-    "1855",
-    "disclaimed",
-    "low-sudsing",
-    "humanly",
-    "jarrodsville",
-    "grating",
-    "delineated",
-    "given",
-    "authentic",
-    "senders",
-    "neumann",
-    "whistling",
-    "surpassed",
-    "blur",
-    "striped",
-    "pitney-bowes",
-    "bandoleers",
-    "merits",
-    "1911",
-    "cowpony",
-    "punctuality",
-    "pipers",
-    "vehemently",
-    "vic",
-    "jas.",
-    "vulnerable",
-    "hebraic",
-    "parachutes",
-    "mikeen",
-    "quivered",
-    "diachronic",
-    "consciences",
-    "pluralistic",
-    "tho'",
-    "trailed",
-    "bertrand",
-    "1/c",
-    "loosely",
-    "yon",
-    "steamily",
-    "self-proclaimed",
-    "unitized",
-    "cross-legged",
-    "elect",
-    "petty",
-    "smallish",
-    "dated",
-    "schnabelian",
-    "look-see",
-    "ether",
-    "reharmonization",
-    "vigilant",
-    "defiance",
-    "maj.",
-    "september-october",
-    "rooftree",
-    "matters",
-    "curling",
-    "gratifying",
-    "belanger",
-    "motors",
-    "defied",
-    "cayenne",
-    "stella",
-    "saucy",
-    "neuronal",
-    "maladies",
-    "applies",
-    "borromini's",
-    "tat",
-    "summerspace",
-    "cruiser",
-    "dioxide",
-    "appointed",
-    "6-hr.",
-    "toad",
-    "scallops",
-    "avant",
-    "jumps",
-    "originality",
-    "non-church",
-    "ostinato",
-    "karns",
-    "careerism",
-    "much-craved",
-    "dubbed",
-    "lathes",
-    "satisfied",
-    "squeezed",
-    "loosely-taped",
-    "philosophy",
-    "performed",
-    "misperceives",
-    "worshippers",
-    "krogers'",
-    "snooping",
-    "glamour",
-    "midas",
-    "harbor",
-    "vascular",
-    "comest",
-    "maryland's",
-    "benefactor",
-    "bucer",
-    "good-news",
-    "investigate",
-    "elman",
-    "robards'",
-    "hyena",
-    "much-thumbed",
-    "banks's",
-    "man-hours",
-    "ventura",
-    "general-appeal",
-    "dandily",
-    "recall",
-    "category",
-    "walnut",
-    "lammed",
-    "awkwardly",
-    "13-16",
-    "sixty-eight",
-    "theatre-by-the-sea",
-    "contentions",
-    "outlook",
-    "assuaged",
-    "irradiated",
-    "bermuda",
-    "specialist",
-    "parachute",
-    "7:30",
-    "say-so",
-    "castor",
-    "harrowed",
-    "liberia",
-    "heng-shan",
-    "cerebellum",
-    "preaching",
-    "artillerist",
-    "cuban",
-    "tallyho",
-    "nikita",
-    "neatly",
-    "compiler",
-    "classify",
-    "seventies",
-    "out-migrants",
-    "facet-plane's",
-    "comment",
-    "signatures",
-    "blinds",
-    "astral",
-    "deadlock",
-    "comparative",
-    "contact",
-    "governmentally",
-    "trans-political",
-    "leveled",
-    "filigree",
-    "reflective",
-    "cheating",
-    "manor",
-    "extent",
-    "investigative",
-    "1024",
-    "pervades",
-    "extermination",
-    "ol'",
-    "degradation",
-    "undeniable",
-    "appointee",
-    "0.78",
-    "rays",
-    "horstman",
-    "brushes",
-    "johns",
-    "nonoccurrence",
-    "engines",
-    "schnabel-pro",
-    "go-go-go",
-    "couve",
-    "depressing",
-    "nose",
-    "parent's",
-    "encrusted",
-    "highway",
-    "tenspot",
-    "staggered",
-    "solemnity",
-    "queries",
-    "mangled",
-    "word-games",
-    "rooting",
-    "attilio",
-    "propriety",
-    "photo-montage",
-    "transversus",
-    "florida",
-    "retarded",
-    "three-power",
-    "eliminates",
-    "inexplicable",
-    "composite",
-    "rylie",
-    "resuspended",
-    "mourned",
-    "hostages",
-    "cosponsors",
-    "meaning",
-    "tragic",
-    "felice",
-    "upheld",
-    "cords",
-    "understatement",
-    "unmated",
-    "1,100",
-    "varviso",
-    "regrouping",
-    "evening",
-    "57%",
-    "parceled",
-    "musts",
-    "reaches",
-    "streptococcus",
-    "testifies",
-    "gavin",
-    "panorama",
-    "unborn",
-    "kwashiorkor",
-    "focus",
-    "patchen",
-    "de",
-    "consummate",
-    "fashioned",
-    "ibn",
-    "electric's",
-    "quietness",
-    "poitrine's",
-    "hereafter",
-    "undercover",
-    "protein-bound",
-    "pews",
-    "karipo's",
-    "huo-shan",
-    "lend",
-    "gonzalez",
-    "thurber's",
-    "stink",
-    "gratuitous",
-    "fake",
-    "clucked",
-    "shrinks",
-    "banners",
-    "forbid",
-    "confirms",
-    "piled",
-    "suspenders",
-    "dole",
-    "bafflers",
-    "reckonings",
-    "fastidious",
-    "jobless",
-    "definitive",
-    "connexion",
-    "luxuriance",
-    "ourselves",
-    "rorschach",
-    "compulsions",
-    "mg",
-    "unsheathe",
-    "schwartz",
-    "weddings",
-    "veining",
-    "erect",
-    "britches",
-    "mechanochemically",
-    "militarist's",
-    "five-gallon",
-    "unchallenged",
-    "loen",
-    "0.039",
-    "detach",
-    "debut",
-    "prevailed",
-    "relief",
-    "hangman's",
-    "widely",
-    "proceed",
-    "novelist's",
-    "privet",
-    "anti-soviet",
-    "subparts",
-    "$170",
-    "colorado's",
-    "breakdown",
-    "long-line",
-    "$750",
-    "hot",
-    "judge",
-    "drafty",
-    "thynke",
-    "midsts",
-    "injun",
-    "groundwave",
-    "syndic",
-    "howse",
-    "spirit",
-    "minimizes",
-    "resembled",
-    "zeal",
-    "out-of-door",
-    "interpenetrate",
-    "precincts",
-    "degeneration",
-    "indoors",
-    "0.5-mv./m.",
-    "est",
-    "eyepiece",
-    "punishing",
-    "stream-of-consciousness",
-    "salute",
-    "hong",
-    "'48",
-    "pouch",
-    "physician's",
-    "mettle",
-    "camouflaged",
-    "skolkau",
-    "inflecting",
-    "resumption",
-    "taint",
-    "herbert",
-    "diaphragmic",
-    "$172,000",
-    "anew",
-    "twelve-year",
-    "rehearse",
-    "cataclysmic",
-    "protuberance",
-    "ballast",
-    "commawnded",
-    "mubarak",
-    "sadistic",
-    "identical",
-    "flailed",
-    "freezer",
-    "riders",
-    "caresses",
-    "uselessly",
-    "forebears",
-    "canvassers",
-    "inexpressible",
-    "drumming",
-    "launch-control",
-    "rallied",
-    "three-man",
-    "peck",
-    "requisitioned",
-    "overthrown",
-    "myofibrils",
-    "trite",
-    "multipactor",
-    "philosopher",
-    "gravitation",
-    "musica",
-    "cowboy's",
-    "imbalances",
-    "hel",
-    "enter",
-    "doctorate",
-    "64-page",
-    "showy",
-    "schnabel's",
-    "depressors",
-    "composed",
-    "plundering",
-    "tr",
-    "journeyed",
-    "constable",
-    "impartial",
-    "westwood",
-    "forget",
-    "ash-blonde",
-    "excludes",
-    "planet",
-    "$1,500",
-    "arousing",
-    "device",
-    "excruciating",
-    "gear-sets",
-    "conjecture",
-    "flourish",
-    "andean",
-    "camping",
-    "10-milligram",
-    "thease",
-    "biennial",
-    "pearly",
-    "6-1",
-    "alvin",
-    "farrells",
-    "warren",
-    "sievers",
-    "polyethylene",
-    "heiress",
-    "imperilled",
-    "date",
-    "continuance",
-    "remnant",
-    "dirksen",
-    "table-tennis",
-    "dictator",
-    "hopped",
-    "questioning",
-    "achaeans",
-    "kerosene",
-    "cochran",
-    "retirement",
-    "geology",
-    "phonologic",
-    "anhydrously",
-    "aspiring",
-    "henrik",
-    "captivated",
-    "wilhelm",
-    "matchless",
-    "12-inch",
-    "punishes",
-    "beck",
-    "translation",
-    "catchup",
-    "soddies",
-    "hobby",
-    "teachings",
-    "appreciative",
-    "brown-edged",
-    "treasonous",
-    "vitro",
-    "legalized",
-    "handicraftsman",
-    "sacrificial",
-    "photo-offset",
-    "progressing",
-    "author's",
-    "sommelier",
-    "bodybuilder",
-    "diatomic",
-    "perier",
-    "spectral",
-    "patronized",
-    "fatality",
-    "brownlow",
-    "agnes",
-    "scholastics",
-    "screen",
-    "sired",
-    "maples",
-    "two-system",
-    "what-nots",
-    "nogaret",
-    "entomologist",
-    "450",
-    "tarpon",
-    "fishery",
-    "slapping",
-    "nominal",
-    "pages",
-    "lighter",
-    "kcs",
-    "economically",
-    "eire",
-    "routo-jig",
-    "endeared",
-    "biology",
-    "diario",
-    "demon's",
-    "jawaharlal",
-    "kneel",
-    "smith-colmer",
-    "artist-nature",
-    "neo-ecclesiasticism",
-    "black's",
-    "pickaxe",
-    "cultist",
-    "bikinis",
-    "acquaint",
-    "cats",
-    "hills",
-    "ears",
-    "referred",
-    "isfahan",
-    "bums",
-    "predominantly",
-    "parti",
-    "domesday",
-    "seasoned",
-    "yelps",
-    "unenthusiastic",
-    "thrombi",
-    "courtiers",
-    "capacious",
-    "unrequited",
-    "dunkirk",
-    "asw",
-    "dried",
-    "flight",
-    "effortless",
-    "provokes",
-    "unabated",
-    "14.5",
-    "intrusive",
-    "blood-thirsty",
-    "manley",
-    "younguh",
-    "blower",
-    "mayst",
-    "self-discovery",
-    "younger",
-    "poisoned",
-    "envenomed",
-    "making",
-    "pyrometer",
-    "comply",
-    "moslem",
-    "honky-tonk",
-    "nice",
-    "dances",
-    "churches",
-    "beverly",
-    "367",
-    "overlooked",
-    "cowbirds'",
-    "pliable",
-    "mig",
-    "miller's",
-    "water-line",
-    "dialogues",
-    "uncertainly",
-    "sachems'",
-    "psi",
-    "collapsible",
-    "mucilage",
-    "infernally",
-    "advertising",
-    "several",
-    "supposes",
-    "infuriate",
-    "playboy-show-biz",
-    "rejoicing",
-    "gave",
-    "koenigsberg",
-    "clamor",
-    "breeze",
-    "millidegrees",
-    "forecasters",
-    "comend",
-    "billions",
-    "dramatics",
-    "determines",
-    "gosson's",
-    "hague",
-    "regional",
-    "transpiration",
-    "scop",
-    "radiocarbon",
-    "malone",
-    "woodgraining",
-    "waste",
-    "grown",
-    "pacific",
-    "h",
-    "maneuvered",
-    "indications",
-    "rads",
-    "grin",
-    "regularity",
-    "grenoble",
-    "carreon's",
-    "solve",
-    "unified",
-    "pectoralis",
-    "departed",
-    "stravinsky's",
-    "adair's",
-    "air-conditioned",
-    "predicted",
-    "erlenmeyer",
-    "dante",
-    "cromwellian",
-    "ineptly",
-    "pronouns",
-    "speaking",
-    "antiseptic",
-    "engagements",
-    "stiffened",
-    "pembina",
-    "residence",
-    "teetotaler",
-    "hubbell",
-    "imbibed",
-    "outboards",
-    "vivo",
-    "categorizing",
-    "longitudinal",
-    "renews",
-    "chives",
-    "manumission",
-    "lana",
-    "indescribable",
-    "eugenia",
-    "rhythms",
-    "handicapped",
-    "today",
-    "hebephrenic",
-    "marring",
-    "impoverished",
-    "palm",
-    "izvestia",
-    "anti-recession",
-    "calmest",
-    "year-old",
-    "prosopopoeia",
-    "bloodstained",
-    "impacts",
-    "marcos",
-    "25-footer",
-    "municipalities",
-    "invigorating",
-    "revelation",
-    "deterrent",
-    "stat.",
-    "swanlike",
-    "gaslights",
-    "asserting",
-    "heat-denatured",
-    "embodies",
-    "brushwork",
-    "dissimulation",
-    "educator's",
-    "depersonalized",
-    "ouray",
-    "autumn-touched",
-    "dirt-catcher",
-    "inviolable",
-    "merner",
-    "doorway",
-    "carmer",
-    "crackles",
-    "reemerged",
-    "holds",
-    "auspices",
-    "pajama",
-    "hetty",
-    "clint",
-    "importance",
-    "teen-agers",
-    "repugnance",
-    "haunts",
-    "solvency",
-    "gambler-politician",
-    "missa",
-    "unrifled",
-    "deductibility",
-    "super-experiment",
-    "conditioned",
-    "abernathy",
-    "coosie's",
-    "riddance",
-    "1/20th",
-    "estes",
-    "tens",
-    "biddle",
-    "ordinary's",
-    "ginmill",
-    "beveled",
-    "apathetic",
-    "kava",
-    "eli's",
-    "nucleoli",
-    "sigh",
-    "eyelid",
-    "smelts",
-    "catchy",
-    "tim's",
-    "sana",
-    "stratification",
-    "indisposition",
-    "out-of-pocket",
-    "tenfold",
-    "hen's",
-    "70,524",
-    "force-fear",
-    "basil's",
-    "fixers",
-    "freeman",
-    "continual",
-    "supervisors'",
-    "booths",
-    "anti-rh",
-    "hubs",
-    "led",
-    "nairne",
-    "stevedore",
-    "widens",
-    "karl-birger",
-    "interfere",
-    "vanishing",
-    "needle-sharp",
-    "dumps",
-    "squeaking",
-    "dragooned",
-    "tact",
-    "81",
-    "macedon",
-    "limousines",
-    "pullen",
-    "dei",
-    "yokosuka",
-    "barbara",
-    "censored",
-    "sforzando",
-    "tribal",
-    "mirsky's",
-    "alabamans",
-    "ramsperger",
-    "7th",
-    "insignificances",
-    "blueberries",
-    "anymore",
-    "signposts",
-    "wards",
-    "jewett",
-    "gloats",
-    "assertion",
-    "excels",
-    "straight-arm",
-    "chap",
-    "vents",
-    "base",
-    "dollar-britten",
-    "$50,400,000",
-    "insane",
-    "pistol",
-    "benedick",
-    "creighton",
-    "mushr",
-    "responding",
-    "sleep",
-    "straggled",
-    "prodigall",
-    "over-all",
-    "manually",
-    "undermined",
-    "jolt",
-    "rented",
-    "received",
-    "historical",
-    "forgit",
-    "heater",
-    "dust-settling",
-    "stritch",
-    "bestial",
-    "combatants",
-    "firecracker",
-    "blown-up",
-    "plummer",
-    "sportiest",
-    "saith",
-    "connotations",
-    "pyocanea",
-    "kerrville",
-    "woolworth's",
-    "fairness",
-    "rewrites",
-    "blockhouse",
-    "cranes",
-    "columbia",
-    "dictionaries",
-    "neapolitan",
-    "wounding",
-    "shires",
-    "stumbled",
-    "unwomanly",
-    "cubists",
-    "11-5",
-    "born",
-    "episodes",
-    "flipped",
-    "necrosis",
-    "166",
-    "optimization",
-    "single",
-    "traveling",
-    "6.5",
-    "jupiter",
-    "favored",
-    "nudity",
-    "morphophonemics",
-    "surface",
-    "hackstaff",
-    "attic",
-    "irrationally",
-    "allison's",
-    "spread-out",
-    "expanded",
-    "faction",
-    "naively",
-    "waymouth",
-    "imported",
-    "athearn",
-    "kitti's",
-    "azusa",
-    "squadrons",
-    "cost-of-living",
-    "helpless",
-    "settlers",
-    "saving",
-    "rudely",
-    "southeastern",
-    "sweatband",
-    "bayed",
-    "thumb-sucking",
-    "flat-bottomed",
-    "orwellian",
-    "bannnnnng",
-    "serpent",
-    "largest",
-    "heel-miracle",
-    "equal",
-    "weakening",
-    "regarded",
-    "insulting",
-    "bumble-bee",
-    "$20,000,000,000",
-    "hope",
-    "pete's",
-    "spoil",
-    "1000",
-    "calibre",
-    "stocky",
-    "wakeful",
-    "pegged-down",
-    "540-k",
-    "1709",
-    "ball-carriers",
-    "differentiated",
-    "kapnek",
-    "taxpayer's",
-    "nw.",
-    "european",
-    "effeminate",
-    "i.r.s.",
-    "exceptions",
-    "classic",
-    "based",
-    "snow",
-    "can",
-    "charles'",
-    "impersonally",
-    "quasi-recitative",
-    "terry",
-    "340-degrees-c",
-    "frans",
-    "one-way",
-    "provocatively",
-    "ms",
-    "adopts",
-    "25th",
-    "announcers",
-    "stuck-up",
-    "adulterers",
-    "pseudo",
-    "exiling",
-    "consultations",
-    "synchronize",
-    "know-nothings",
-    "blaming",
-    "desperate",
-    "fosters",
-    "blatz",
-    "immersion",
-    "bandit",
-    "hard-fought",
-    "slow-bouncing",
-    "deer",
-    "patronize",
-    "bodyguard",
-    "trump",
-    "wardens",
-    "murmured",
-    "daddy's",
-    "homosexual",
-    "permit",
-    "quadripartite",
-    "rejecting",
-    "thickest",
-    "diminished",
-    "missiles",
-    "world-shattering",
-    "$2.00",
-    "kirkland",
-    "univalent",
-    "amongst",
-    "pleases",
-    "sparling",
-    "iota",
-    "denied",
-    "dick",
-    "heigh-ho",
-    "boarding",
-    "printing",
-    "hodosh",
-    "harrity",
-    "treble",
-    "nullity",
-    "cornstarch",
-    "lurking",
-    "embracing",
-    "debility",
-    "185,000",
-    "centrifugation",
-    "suppression",
-    "kornbluth",
-    "u.s.a.",
-    "win",
-    "111",
-    "lanin's",
-    "horse-chestnut",
-    "non-taxable",
-    "innovators",
-    "mungus",
-    "antagonists",
-    "ambiguous",
-    "villagers",
-    "survivals",
-    "comparatively",
-    "niceties",
-    "$1.26",
-    "beautifully",
-    "water-filled",
-    "often",
-    "queried",
-    "main-d'oeuvre",
-    "singular",
-    "royal",
-    "queens'",
-    "oil-field",
-    "comrade",
-    "pinch-hit",
-    "dispossession",
-    "heare",
-    "randy",
-    "genteel",
-    "randomly",
-    "moth's",
-    "fluency",
-    "coxcombs",
-    "hairy",
-    "z-axis",
-    "armament",
-    "retire",
-    "drawl",
-    "self-determination",
-    "oceana",
-    "religion",
-    "calico",
-    "lapsing",
-    "dryfoos",
-    "a.m.",
-    "mussolini",
-    "slow-moving",
-    "invites",
-    "constancy",
-    "ancestral",
-    "turn",
-    "senioritatis",
-    "currants",
-    "alison",
-    "vertebrae",
-    "momentous",
-    "organizational",
-    "d.c.",
-    "objectors",
-    "m",
-    "lobster",
-    "rejects",
-    "miraculous",
-    "sneaking",
-    "self-analysis",
-    "self-flagellation",
-    "bleed",
-    "lockies",
-    "including",
-    "hasn't",
-    "it'd",
-    "deformation",
-    "suns",
-    "corrupting",
-    "previsions",
-    "sayonara",
-    "decatur",
-    "accelerating",
-    "sentimental",
-    "sloane",
-    "byline",
-    "disbelieving",
-    "surprisingly",
-    "dominique",
-    "upson",
-    "canted",
-    "nurses",
-    "evaporation",
-    "slenderer",
-    "cab's",
-    "dessier",
-    "report",
-    "ant",
-    "researcher",
-    "blows",
-    "activities",
-    "bristle",
-    "splice",
-    "irremediable",
-    "ory",
-    "translates",
-    "era's",
-    "documentary",
-    "coleman",
-    "restorers",
-    "snug-fitting",
-    "brewery",
-    "bypassed",
-    "disturb",
-    "hormones",
-    "players",
-    "birdied",
-    "nests",
-    "bucked",
-    "burlingame",
-    "insouciance",
-    "combined",
-    "spycket",
-    "upgraded",
-    "mortgage",
-    "161",
-    "torrence",
-    "$47,101,000",
-    "toured",
-    "nip",
-    "puddingstone",
-    "seato",
-    "prevision",
-    "quadrillion",
-    "boots",
-    "ennis",
-    "death-locked",
-    "frosting",
-    "denominations",
-    "tag",
-    "guardino",
-    "rhetoric",
-    "pleas",
-    "adopted",
-    "one-leg",
-    "exploring",
-    "crosbys",
-    "negro-appeal",
-    "reiterating",
-    "cossack",
-    "captains",
-    "jockeying",
-    "sports",
-    "carneigie",
-    "mason",
-    "climaxed",
-    "dating",
-    "whimper",
-    "139",
-    "steady-state",
-    "1959-1960",
-    "roulette's",
-    "partially",
-    "attainments",
-    "commemorating",
-    "memorized",
-    "pax-ordo",
-    "$172,400",
-    "soil",
-    "read",
-    "neo-stagnationist",
-    "bertoia",
-    "invasions",
-    "influx",
-    "yard",
-    "vacuum",
-    "bestowed",
-    "tax-aided",
-    "drug's",
-    "separateness",
-    "uncooperative",
-    "2-and-2",
-    "gypsum",
-    "kearton",
-    "brownings",
-    "shantung-like",
-    "drugged",
-    "frost-debby",
-    "school's",
-    "detailed",
-    "boy-manager",
-    "1",
-    "house's",
-    "rightfully",
-    "devoted",
-    "$500,000",
-    "emanations",
-    "pump-priming",
-    "weatherford",
-    "cast-iron",
-    "cadmium",
-    "companies",
-    "catapulting",
-    "teasing",
-    "tenth",
-    "creeds",
-    "spumoni's",
-    "hastening",
-    "carved",
-    "ai",
-    "require",
-    "sidelong",
-    "paid-for",
-    "swearing-in",
-    "5-degrees-c",
-    "relinquished",
-    "sport-king",
-    "seidel",
-    "sarcasms",
-    "a-raising",
-    "offended",
-    "unfolded",
-    "hillary",
-    "bark",
-    "3-month",
-    "law-unto-itself",
-    "roofs",
-    "contrived",
-    "niggers",
-    "death's-head",
-    "ad",
-    "$1.65",
-    "$1,450,000,000",
-    "hutchins",
-    "psychically",
-    "elgin",
-    "halogens",
-    "bins",
-    "af",
-    "decorator",
-    "differential",
-    "quarterbacks",
-    "griffith's",
-    "vacuumed",
-    "snail",
-    "dubovskoi",
-    "evocative",
-    "echoing",
-    "entitled",
-    "imprisons",
-    "myofibrillae",
-    "one-act-play",
-    "javert",
-    "comus",
-    "pyorrhea",
-    "bemaddening",
-    "wwrl's",
-    "baffle",
-    "taper",
-    "carolingian",
-    "22-29",
-    "masaryk",
-    "3,325",
-    "deport",
-    "connall",
-    "remarked",
-    "1910",
-    "watches",
-    "hypothyroidism",
-    "deep",
-    "buttery",
-    "bracing",
-    "sluicing",
-    "goodness'",
-    "neesen",
-    "run-of-the-mine",
-    "deceptive",
-    "inadequately",
-    "bird",
-    "bristles",
-    "fastened",
-    "descendant",
-    "bees",
-    "tabulated",
-    "repayment",
-    "refill",
-    "shopper",
-    "communistic",
-    "stairway",
-    "long-known",
-    "rok's",
-    "operate",
-    "kindest",
-    "nigger",
-    "committeemen",
-    "financially",
-    "denny",
-    "self-interest",
-    "employee-contributed",
-    "$451,500",
-    "aged-care",
-    "harbor's",
-    "peccavi",
-    "mooed",
-    "furled",
-    "teach",
-    "whirlpool",
-    "dingy-looking",
-    "b70",
-    "challenges",
-    "forepart",
-    "instrumental",
-    "yelled",
-    "polymeric",
-    "granddaughter",
-    "fusing",
-    "distastefully",
-    "vaults",
-    "gunners",
-    "gunther",
-    "cityscapes",
-    "guardians",
-    "eligible",
-    "sacred",
-    "locks",
-    "competition",
-    "inaction",
-    "slinging",
-    "quibusdam",
-    "heyday",
-    "withdrew",
-    "long-term",
-    "in-plant",
-    "blissful",
-    "dreiser's",
-    "marvelled",
-    "coats",
-    "holden's",
-    "publishes",
-    "x-tru-coat",
-    "leap",
-    "patrician",
-    "redeemin'",
-    "acheson's",
-    "certainty",
-    "bauer-ecsy",
-    "2:32",
-    "edge",
-    "discovering",
-    "unallocable",
-    "berlioz",
-    "debonnie",
-    "sokol",
-    "cooling",
-    "puppies",
-    "fiscal",
-    "columbus",
-    "vatican",
-    "415",
-    "vacancies",
-    "salad",
-    "meyner's",
-    "demurrer",
-    "saloon",
-    "terrours",
-    "cjs",
-    "gargle",
-    "magnifies",
-    "non-newtonian",
-    "eluate",
-    "boasts",
-    "antagonistic",
-    "stoicism",
-    "ships'",
-    "bangkok",
-    "7-1",
-    "defer",
-    "extremists",
-    "scotch-and-soda",
-    "acquiescence",
-    "billboards",
-    "damage",
-    "crispin",
-    "telepathically",
-    "shirley's",
-    "precocious",
-    "employed",
-    "painter's",
-    "ribbon",
-    "systematic",
-    "closest",
-    "chiding",
-    "time-on-the-job",
-    "gross's",
-    "wisely",
-    "flats",
-    "cistern",
-    "of",
-    "scrutinized",
-    "islandia",
-    "similitude",
-    "strengthening",
-    "ranavan",
-    "malevolencies",
-    "babylonian",
-    "hating",
-    "2:30",
-    "serving",
-    "loafed",
-    "assumption",
-    "intimately",
-    "forthcoming",
-    "flickered",
-    "lucifer",
-    "tarheelia",
-    "perceptions",
-    "beatific",
-    "abreaction",
-    "mavericks",
-    "haphazard",
-    "cd",
-    "arguing",
-    "italians",
-    "wop",
-    "fin",
-    "5847",
-    "unagi",
-    "attract",
-    "1850",
-    "mississippi's",
-    "ledges",
-    "ruling-class",
-    "beforehand",
-    "consecration",
-    "sped",
-    "high-backed",
-    "funnel",
-    "inherent",
-    "tepid",
-    "racie",
-    "pathology",
-    "hush",
-    "salle",
-    "kowalski",
-    "narrow-minded",
-    "sponsorship",
-    "10-team",
-    "vocalic",
-    "styrene",
-    "dryly",
-    "otherworldly",
-    "godot",
-    "subject's",
-    "nobles",
-    "ghouls",
-    "tagged",
-    "apartment-building",
-    "jumble",
-    "dark-blue",
-    "conformity",
-    "guaranty",
-    "averaging",
-    "hungarian",
-    "congratulated",
-    "$2,412,616",
-    "bounds",
-    "puzzler",
-    "attendants",
-    "kochanek",
-    "fda",
-    "guam",
-    "beatnik",
-    "fourteen-nation",
-    "assignment",
-    "freeholder",
-    "greenwich-potowomut",
-    "constituting",
-    "instinctively",
-    "eddie",
-    "crisis-to-crisis",
-    "undying",
-    "chalked",
-    "nagle",
-    "decicco",
-    "profit",
-    "arf",
-    "picturing",
-    "bowie",
-    "favor",
-    "bottega",
-    "papa-san",
-    "voltage",
-    "humanness",
-    "clear-channel",
-    "dreaming",
-    "ocher",
-    "exothermic",
-    "blossom",
-    "unit",
-    "superintendent",
-    "grill",
-    "anthropologist",
-    "anteriors",
-    "nonstop",
-    "mistakenly",
-    "phelps",
-    "ashman",
-    "ridiculously",
-    "usefully",
-    "greville",
-    "abounded",
-    "smallness",
-    "mortification",
-    "burglars",
-    "guatemala",
-    "soil-removal",
-    "separations",
-    "art-historian",
-    "fooling",
-    "paie",
-    "lilly's",
-    "endings",
-    "stubby",
-    "weirs",
-    "televison-record",
-    "anchoring",
-    "strychnine",
-    "barrymores",
-    "economist",
-    "professions",
-    "remodeled",
-    "averting",
-    "r.l.",
-    "separators",
-    "existentialism",
-    "spurs",
-    "willem",
-    "reversal",
-    "exploited",
-    "indefinitely",
-    "andres",
-    "$2,330,000",
-    "high-ceilinged",
-    "croakin",
-    "maier",
-    "worlders",
-    "angry",
-    "sins",
-    "kinda",
-    "clemens",
-    "sheet-metal",
-    "relive",
-    "fourteen-year-old",
-    "hood's",
-    "goofed",
-    "tranquilizer",
-    "athenian",
-    "cobra",
-    "wavy-haired",
-    "0600",
-    "embodied",
-    "launcher",
-    "exchanging",
-    "menarches",
-    "silvas",
-    "bernstein",
-    "scheduled",
-    "films",
-    "nonfiction",
-    "sales-building",
-    "betting",
-    "congregationalist",
-    "cowbirds",
-    "dying",
-    "kill",
-    "still-dark",
-    "face",
-    "coleridge's",
-    "chromatics",
-    "with-but-after",
-    "0.043",
-    "welter",
-    "battery",
-    "tulip",
-    "stirs",
-    "obsession",
-    "cinch",
-    "simile",
-    "parasite",
-    "year",
-    "lottie",
-    "designation",
-    "balmy",
-    "webster's",
-    "medea",
-    "elaborated",
-    "acute",
-    "wilson's",
-    "seclusion",
-    "triangular",
-    "swished",
-    "zoology",
-    "individual-contributor",
-    "2.7",
-    "$7.00",
-    "horoscope",
-    "w.g.",
-    "neutralist",
-    "paces",
-    "cutters'",
-    "battleground",
-    "pah",
-    "verify",
-    "gagarin",
-    "concerti",
-    "low-cost",
-    "wells",
-    "chuckle",
-    "orphic",
-    "danny",
-    "incur",
-    "academy",
-    "say",
-    "arch-heretic",
-    "gravesend",
-    "p-20",
-    "waltham",
-    "harshened",
-    "fledglings",
-    "johnston",
-    "weld",
-    "stamped",
-    "-78-degrees",
-    "curtseyed",
-    "unauthorized",
-    "matting",
-    "niece",
-    "cole",
-    "ascribed",
-    "credulous",
-    "irrationality",
-    "wanta",
-    "harcourt",
-    "explored",
-    "subsequent",
-    "infliction",
-    "ein",
-    "ton",
-    "morgart",
-    "mornings",
-    "drills",
-    "breakthroughs",
-    "hemispherical",
-    "purveyors",
-    "lineage",
-    "passenger",
-    "faulted",
-    "61.2%",
-    "hysterectomy",
-    "burke's",
-    "home-office",
-    "sonorous",
-    "ex-presidents",
-    "lit",
-    "doctrines",
-    "doctor's",
-    "allemands",
-    "placed",
-    "saints",
-    "bureaucracy",
-    "integrating",
-    "amalgamation",
-    "bureaucracies",
-    "crocketed",
-    "spacecraft",
-    "stateroom",
-    "connell",
-    "two-record",
-    "facial",
-    "grady",
-    "dismissed",
-    "deae-cellulose",
-    "roos",
-    "profanity",
-    "marauders",
-    "constantine",
-    "non-profit",
-    "catcher's",
-    "authentically",
-    "cantor",
-    "removable",
-    "hyphenated",
-    "exhaustively",
-    "wholly-owned",
-    "denies",
-    "recuperating",
-    "bards",
-    "putout",
-    "distortion",
-    "basso",
-    "wuh",
-    "1864",
-    "thoroughgoing",
-    "extremely",
-    "unnumbered",
-    "11%",
-    "hollander",
-    "summary",
-    "trivia",
-    "alas",
-    "i-e",
-    "carmack",
-    "campagna",
-    "incubus",
-    "idiosyncrasies",
-    "heretofore-accepted",
-    "proletariat",
-    "gateway",
-    "documents",
-    "ys",
-    "peaceful",
-    "shak.",
-    "hallucinations",
-    "bostonians",
-    "ordering",
-    "igneous",
-    "squirrel",
-    "aeronautical",
-    "naturam",
-    "ova",
-    "reimbursements",
-    "salted",
-    "indonesia",
-    "livres",
-    "fillip",
-    "refuel",
-    "rocket",
-    "complaisant",
-    "advertiser",
-    "ligand",
-    "inhabitation",
-    "mother's",
-    "notice",
-    "bellman",
-    "loaded",
-    "emasculated",
-    "ekberg",
-    "pleats",
-    "hastily",
-    "32-degrees-f",
-    "condescension",
-    "gubernatorial",
-    "labeling",
-    "balkanizing",
-    "reimbursement",
-    "hatched",
-    "sternal",
-    "twenty-three",
-    "pfohl",
-    "intervene",
-    "knee",
-    "adjourned",
-    "immaterial",
-    "judas",
-    "highboy",
-    "cheese",
-    "quacks",
-    "flavor",
-    "bawhs",
-    "sparrow's",
-    "muggers",
-    "non-jewish",
-    "convention",
-    "y-regions",
-    "immemorial",
-    "oglethorpe",
-    "besmirched",
-    "sample",
-    "44",
-    "admirals",
-    "overseer",
-    "sleeper's",
-    "elders",
-    "palache",
-    "middle-age",
-    "amethystine",
-    "$79.89",
-    "sayin",
-    "protesting",
-    "changed",
-    "altruistically",
-    "aspires",
-    "corrections",
-    "hoy",
-    "923,076",
-    "underachievers",
-    "buell",
-    "anti-semitic",
-    "chorused",
-    "boiler-burner",
-    "13,200",
-    "thwarting",
-    "showin'",
-    "garishness",
-    "freeing",
-    "crop",
-    "non-interference",
-    "arteriosclerosis",
-    "houston",
-    "tract",
-    "abroad",
-    "arches",
-    "stalinist-corrupted",
-    "having",
-    "lucas's",
-    "rig-veda",
-    "553",
-    "half-understood",
-    "solomon's",
-    "flanders",
-    "follow",
-    "ardmore",
-    "federalist",
-    "marilyn",
-    "morning",
-    "arrives",
-    "rundfunk",
-    "suction",
-    "zhitzhakli",
-    "malcolm",
-    "lewdly",
-    "fearsome",
-    "micrometeoritic",
-    "fil",
-    "jim",
-    "honeybee",
-    "ritiuality",
-    "antibiotic",
-    "$36",
-    "cleans",
-    "instruments",
-    "outclassed",
-    "school",
-    "biracial",
-    "dry",
-    "fiber-photocathode",
-    "42,000",
-    "rampant",
-    "detect",
-    "trim-your-own-franks",
-    "lucius",
-    "lorca",
-    "accessibility",
-    "kant",
-    "gibson",
-    "users",
-    "equip",
-    "stamina",
-    "mcneil",
-    "aniline",
-    "predict",
-    "coarsely",
-    "pagoda",
-    "dominantly",
-    "enclosure",
-    "upshot",
-    "flows",
-    "stymied",
-    "stills",
-    "transit",
-    "divestiture",
-    "kazoo",
-    "undiminished",
-    "manufacturers'",
-    "signore",
-    "latin",
-    "metrazol",
-    "bilingual",
-    "schubert",
-    "mite",
-    "tonight's",
-    "participating",
-    "trials",
-    "government-owned",
-    "jacksonville",
-    "bachelor-type",
-    "split-bamboo",
-    "admit",
-    "otherwise",
-    "older",
-    "beer-cooling",
-    "externalization",
-    "paneled",
-    "mawr",
-    "herpetologists",
-    "mica",
-    "shielded",
-    "fill",
-    "optics",
-    "cut-to-a-familiar-pattern",
-    "arrive",
-    "29.2",
-    "cling",
-    "tear-soaked",
-    "proving",
-    "stature",
-    "mark-up",
-    "self-pitying",
-    "wears",
-    "non-service",
-    "conway",
-    "solitudinem",
-    "broad-brimmed",
-    "unresponsive",
-    "titche's",
-    "debt-free",
-    "bridle",
-    "lacheln",
-    "microns",
-    "politico-sociological",
-    "reeled",
-    "brotherly",
-    "evades",
-    "overtaken",
-    "truckers",
-    "nonce",
-    "time-delay",
-    "demonstrating",
-    "backbends",
-    "namely",
-    "freya",
-    "kittens",
-    "tetrameron",
-    "mailboxes",
-    "undisrupted",
-    "bravest-feathered",
-    "lanced",
-    "negativism",
-    "establishes",
-    "recherches",
-    "sitwell",
-    "mothers-in-law",
-    "overdue",
-    "29",
-    "pastors'",
-    "interfacial",
-    "metamorphose",
-    "gangplank",
-    "hum",
-    "mongolia's",
-    "9-1/2",
-    "sitter's",
-    "bother",
-    "days'",
-    "questionnaires",
-    "$581,000",
-    "brennan",
-    "tri-iodothyronine",
-    "desegregated",
-    "krumpp",
-    "burrow",
-    "sops",
-    "recollections",
-    "sauternes",
-    "shreds",
-    "straight-a",
-    "gas-fired",
-    "$14,000",
-    "murray's",
-    "68",
-    "asks",
-    "virtual",
-    "recoilless",
-    "creedal",
-    "objets",
-    "philibert",
-    "ring-labeled",
-    "bess",
-    "lante",
-    "vesole",
-    "stocks",
-    "merger",
-    "pulse-jet",
-    "bootle",
-    "prudentially",
-    "8,000",
-    "dales",
-    "champs",
-    "mot",
-    "briskness",
-    "varicolored",
-    "karl",
-    "faget's",
-    "6-3-3",
-    "381(c)(9)",
-    "examined",
-    "compeyson",
-    "bogartian",
-    "kidnappers",
-    "lasswitz's",
-    "ninetieth",
-    "tshombe",
-    "inter-relationships",
-    "eulogize",
-    "hubermann",
-    "uneven",
-    "crucified",
-    "ricco",
-    "boasting",
-    "fur-piece",
-    "priming",
-    "n.y.",
-    "4th",
-    "etruscan",
-    "trot",
-    "reichstag",
-    "acrobacy",
-    "lingo",
-    "leningrad's",
-    "reentered",
-    "listlessly",
-    "first-place",
-    "cheaply",
-    "parasitic",
-    "sentinel",
-    "mikoyan",
-    "owls",
-    "astor",
-    "dismemberment",
-    "aboveground",
-    "rabbits",
-    "lublin's",
-    "composers",
-    "talk",
-    "divinities",
-    "anachronistically",
-    "care-free",
-    "counter-moves",
-    "attending",
-    "f",
-    "deluded",
-    "budgeting",
-    "surtout",
-    "betrayed",
-    "jar",
-    "eschews",
-    "stacked",
-    "leered",
-    "celebrity",
-    "consciousness",
-    "dignified",
-    "lotus",
-    "double-crosser",
-    "implicitly",
-    "transplanting",
-    "misconceptions",
-    "beebread",
-    "nec",
-    "been",
-    "seasonally",
-    "211",
-    "slocum's",
-    "esn",
-    "un",
-    "caribbean",
-    "triphenylstibine",
-    "suffocated",
-    "myron",
-    "shopworn",
-    "poisons",
-    "specimen",
-    "paunch",
-    "valet",
-    "joplin",
-    "ill-equipped",
-    "officially",
-    "counter",
-    "slashing",
-    "unphysical",
-    "tabellen",
-    "substituting",
-    "``",
-    "sanderson",
-    "crosby",
-    "highlands",
-    "stronghold",
-    "puppet's",
-    "strain",
-    "bashir",
-    "blonde-headed",
-    "vigilance",
-    "improvements",
-    "prearranged",
-    "4.1",
-    "craftsman's",
-    "mormon",
-    "boothby",
-    "hulks",
-    "fasciculations",
-    "pueri",
-    "lubell",
-    "gospels",
-    "dubious",
-    "paraphrases",
-    "invoices",
-    "verrone",
-    "playing",
-    "exhumations",
-    "lookit",
-    "double-step",
-    "utopians",
-    "cosmo",
-    "quince",
-    "erosion",
-    "melodrama",
-    "grizzlies'",
-    "injunctions",
-    "clayton",
-    "foe",
-    "promptings",
-    "dollies",
-    "brooks's",
-    "vomiting",
-    "meir",
-    "oathe",
-    "nightingale",
-    "divide",
-    "sartre",
-    "fifty-dollar",
-    "hypocrisy",
-    "grizzly",
-    "law-breaking",
-    "erasing",
-    "kirkpatrick",
-    "deprive",
-    "groceries",
-    "body-building",
-    "1816",
-    "hides",
-    "entails",
-    "sodium",
-    "interconnected",
-    "crucially",
-    "super",
-    "joyously",
-    "dream-ridden",
-    "ruppert",
-    "preacher",
-    "patrimony",
-    "heroic",
-    "'nough",
-    "zebek",
-    "prep",
-    "uncertain",
-    "poor's",
-    "application",
-    "trespassed",
-    "gladden's",
-    "trays",
-    "etes",
-    "16",
-    "lafayette",
-    "447",
-    "limelight",
-    "jeroboam",
-    "rigs",
-    "anytime",
-    "expect",
-    "type",
-    "lamb",
-    "helpfulness",
-    "hoge's",
-    "kerchief",
-    "hoosegows",
-    "lay",
-    "arger",
-    "longitudes",
-    "diet",
-    "van",
-    "palmer",
-    "schenk",
-    "gob",
-    "frederick",
-    "pored",
-    "toobin",
-    "balsams",
-    "ultra-liberal",
-    "irreversibly",
-    "emcee",
-    "caravans",
-    "reminiscing",
-    "longshoremen",
-    "joan's",
-    "volta",
-    "caught",
-    "worriedly",
-    "awoke",
-    "whoppers",
-    "cereals",
-    "powell",
-    "snag",
-    "waterfront",
-    "purging",
-    "indulging",
-    "banking",
-    "self-conscious",
-    "colcord's",
-    "cuttings",
-    "precipice",
-    "dysplasia",
-    "restock",
-    "launches",
-    "lisping",
-    "fig",
-    "cantonment",
-    "ahmad",
-    "bluffs",
-    "sickroom",
-    "smoke-filled",
-    "seven-hit",
-    "lise",
-    "bobbsey",
-    "quarter-century",
-    "covet",
-    "unwilling",
-    "closes",
-    "titus",
-    "flags",
-    "imbalance",
-    "heavenly",
-    "taurog",
-    "spacings",
-    "pohl's",
-    "feather-like",
-    "dipping",
-    "promoter",
-    "henderson",
-    "podium",
-    "ditches",
-    "i.d.",
-    "self-exile",
-    "affaire",
-    "many-much",
-    "repay",
-    "spilled",
-    "pipe",
-    "blanket",
-    "boomtown",
-    "reminds",
-    "miscellaneous",
-    "gracias",
-    "remus",
-    "short",
-    "puzzle",
-    "reference",
-    "problems",
-    "26th",
-    "$580",
-    "distributorship",
-    "cluttered",
-    "niggertown",
-    "snatch",
-    "odd-lot",
-    "pulleys",
-    "tightest-fitting",
-    "apply",
-    "forests",
-    "refining",
-    "memorabilia",
-    "film's",
-    "acquiesce",
-    "aerospace",
-    "pools",
-    "lauritz",
-    "unleveled",
-    "indignantly",
-    "half-smile",
-    "meetings",
-    "jansen",
-    "cabin",
-    "hinkle",
-    "resourcefulness",
-    "seasoning",
-    "resist",
-    "steele's",
-    "tumours",
-    "two-to-three",
-    "rough-hewn",
-    "pinto",
-    "ghazal",
-    "ches",
-    "log",
-    "snorted",
-    "cooperation",
-    "hobart",
-    "geisha",
-    "rosabelle",
-    "slim",
-    "nobel",
-    "poplar",
-    "schmitt",
-    "constraint",
-    "sods",
-    "well-equipped",
-    "30-year",
-    "skid",
-    "sociological",
-    "scientists",
-    "armoire",
-    "distributor's",
-    "cotton's",
-    "drugstore",
-    "leni",
-    "filched",
-    "blots",
-    "sesshu",
-    "iodocompounds",
-    "christine's",
-    "sallies",
-    "salvation",
-    "welded",
-    "pencil",
-    "anthem",
-    "amazingly",
-    "severna",
-    "cortico-hypothalamic",
-    "immature",
-    "drop",
-    "outsville",
-    "oslo",
-    "pits",
-    "donning",
-    "muskegon",
-    "overlap",
-    "alleys",
-    "balafrej",
-    "lifeboat",
-    "symbolizes",
-    "gasket",
-    "steaks",
-    "rights-of-way",
-    "howell",
-    "sparked",
-    "macarthur-helen",
-    "aircraft's",
-    "odessa",
-    "violates",
-    "boost",
-    "yow",
-    "tooth-straightening",
-    "purvis",
-    "assemblages",
-    "newfoundland",
-    "4-passenger",
-    "chromatic",
-    "604,622",
-    "dilates",
-    "harder",
-    "inviting",
-    "kornbluth's",
-    "segregation",
-    "drawing-room",
-    "lugged",
-    "howsam's",
-    "boatels",
-    "utilized",
-    "egrets",
-    "bodybuilding",
-    "retrospective",
-    "awaits",
-    "vibrato",
-    "stews",
-    "calculations",
-    "hired",
-    "lagrange's",
-    "rhodes",
-    "peremptory",
-    "less-developed",
-    "esmarch",
-    "co-cola",
-    "briefer",
-    "lake",
-    "nina",
-    "angel",
-    "delegating",
-    "heartfelt",
-    "ear-muffs",
-    "trade-preparatory",
-    "albright",
-    "sokolsky",
-    "multichannel",
-    "tic-tac-toe",
-    "kilowatt",
-    "isotropic",
-    "delon",
-    "atty.",
-    "livelier",
-    "arraigning",
-    "pleads",
-    "by-the-sea",
-    "timetable",
-    "fantasy",
-    "pasadena's",
-    "jerome",
-    "pimp",
-    "elegiac",
-    "gladly",
-    "sewing",
-    "stole",
-    "felix's",
-    "whisky",
-    "brevard",
-    "creates",
-    "toadyism",
-    "ayub",
-    "barony",
-    "inclusiveness",
-    "pitching",
-    "colony's",
-    "cities",
-    "finder",
-    "half-moons",
-    "tidying",
-    "parioli",
-    "plenary",
-    "overhead",
-    "blinded",
-    "magistrates",
-    "decorativeness",
-    "succeeding",
-    "cir.",
-    "genius",
-    "kleist",
-    "1769",
-    "stealthily",
-    "hospitable",
-    "m-k",
-    "1628/29",
-    "unlimited",
-    "accountability",
-    "digby",
-    "three-dimensional",
-    "laguna",
-    "landau",
-    "unbalance",
-    "lasted",
-    "humiliated",
-    "host's",
-    "lb",
-    "guarantees",
-    "watercolors",
-    "kerry",
-    "bolet",
-    "forms",
-    "waist-high",
-    "small-car",
-    "disintegration",
-    "unrestrictedly",
-    "reclining",
-    "jack-an-apes",
-    "double-figure",
-    "undoubtedly",
-    "lp",
-    "michaelson",
-    "westwards",
-    "fusiform",
-    "standard",
-    "custer",
-    "unsalted",
-    "connoisseur",
-    "rouse",
-    "retreats",
-    "philco",
-    "simmons",
-    "fracture",
-    "mussorgsky",
-    "warp",
-    "chansons",
-    "improves",
-    "refuse-littered",
-    "soapy",
-    "spencerian",
-    "mythic",
-    "unprofitable",
-    "all-victorious",
-    "recapitulate",
-    "endgame",
-    "ever-lovin'",
-    "n.",
-    "non-volatile",
-    "hut",
-    "ballerina",
-    "indicators",
-    "slaves",
-    "bloodless",
-    "bull-necked",
-    "clotheslines",
-    "monologue",
-    "lightest",
-    "fetishize",
-    "4.4",
-    "bantering",
-    "mcnaughton",
-    "both",
-    "15.0",
-    "indecent",
-    "0.85%",
-    "cove",
-    "two-digit",
-    "week-long",
-    "almonds",
-    "parcels",
-    "driving",
-    "judaism",
-    "ambush",
-    "energies",
-    "varani",
-    "6-foot-3-inch",
-    "earmarked",
-    "mana",
-    "stickney",
-    "mistakes",
-    "hymns",
-    "qualified",
-    "frequented",
-    "whiting",
-    "coefficients",
-    "bradley",
-    "inmate",
-    "auditor",
-    "humbled",
-    "stain",
-    "bjerre's",
-    "skyros",
-    "well-armed",
-    "reinhardt",
-    "tear-filled",
-    "electronics",
-    "grigori's",
-    "piteous",
-    "guardhouse",
-    "preside",
-    "prosper",
-    "tygartis",
-    "lyin'",
-    "pendulum",
-    "founded",
-    "krystallographie",
-    "matlowsky",
-    "georgetown",
-    "shann's",
-    "hungrier",
-    "ignazio",
-    "gangs",
-    "euratom",
-    "astarte",
-    "interstage",
-    "fastenings",
-    "baubles",
-    "weissman",
-    "socio-archaeological",
-    "miami's",
-    "innocent",
-    "props",
-    "entrance",
-    "jimbo's",
-    "echelon",
-    "pre-civil",
-    "thei",
-    "pecan",
-    "intuitions",
-    "jungles",
-    "uncivil",
-    "hardwicke-etter",
-    "profits",
-    "pulsations",
-    "dispose",
-    "savor",
-    "brutality",
-    "canning",
-    "diffusers",
-    "black-and-orange",
-    "phosgene",
-    "transcendental",
-    "sardonic",
-    "code,dtf",
-    "stealin'",
-    "b's",
-    "atoms",
-    "titles",
-    "forearms",
-    "unwaveringly",
-    "tapley",
-    "stephens",
-    "wedge",
-    "/",
-    "discourage",
-    "interpreted",
-    "instrumentalists",
-    "mckellar",
-    "figger",
-    "sneered",
-    "overriding",
-    "levels",
-    "brows",
-    "talked",
-    "ketosis",
-    "spliced",
-    "sheila",
-    "german's",
-    "emphysematous",
-    "furies",
-    "legume",
-    "accounting",
-    "electives",
-    "blanching",
-    "centrality",
-    "bloke",
-    "unities",
-    "thyroxine",
-    "suicide",
-    "rexroth",
-    "playroom",
-    "ancients",
-    "hardwicke",
-    "tossing",
-    "fragmentation",
-    "dicks",
-    "matrimonial",
-    "rhythm",
-    "bonito",
-    "cuckoo-bumblebee",
-    "newly-weds",
-    "gatsby",
-    "jubilation",
-    "coercive",
-    "constructional",
-    "tiptoeing",
-    "cellist",
-    "cellars",
-    "larimer",
-    "wait",
-    "administering",
-    "place-name",
-    "carrot",
-    "uses",
-    "loon",
-    "smoked",
-    "ad-lib",
-    "urine",
-    "jeweler",
-    "forcefulness",
-    "kroger",
-    "hooray",
-    "nagging",
-    "walk-up",
-    "novosti",
-    "mud-caked",
-    "propping",
-    "beadsman",
-    "steiner",
-    "gaseous",
-    "today's",
-    "drummer's",
-    "escutcheons",
-    "arenula",
-    "channeled",
-    "band",
-    "sandals",
-    "malformed",
-    "treadmill",
-    "woolly-headed",
-    "fire's",
-    "introjected",
-    "demander",
-    "shoals",
-    "soldier-masters",
-    "hybrid",
-    "cache",
-    "ferguson",
-    "flounders",
-    "imprimatur",
-    "jurisdictions",
-    "eagerly",
-    "informs",
-    "ousted",
-    "musil's",
-    "acknowledge",
-    "incremental",
-    "game-management",
-    "poor",
-    "gaieties",
-    "nathaniel",
-    "teaspoon",
-    "proposes",
-    "real-analytic",
-    "autobiographical",
-    "miscegenation",
-    "he",
-    "trabb",
-    "$39.5",
-    "consensus",
-    "keyhole",
-    "businessman",
-    "eliminated",
-    "re-runs",
-    "equalizers",
-    "insistent",
-    "thorough",
-    "henri",
-    "loved",
-    "a-26",
-    "bedded",
-    "replacing",
-    "faith",
-    "peddle",
-    "unanimously",
-    "pendleton",
-    "nonviolent",
-    "hairs",
-    "pirogues",
-    "perry",
-    "junction",
-    "deauville",
-    "atmospheric",
-    "detective",
-    "desertion",
-    "nlrda",
-    "nibs'",
-    "unnatural",
-    "pandora's",
-    "intake",
-    "foundation-stone",
-    "prostitute",
-    "pride",
-    "flapper",
-    "barriers",
-    "connected",
-    "newport-based",
-    "dormant",
-    "chi",
-    "nuns",
-    "tasteful",
-    "whiskered",
-    "hillcrest",
-    "weighed",
-    "arrowed",
-    "anti-party",
-    "crumbly",
-    "ft",
-    "canisters",
-    "barker",
-    "air-frame",
-    "heron",
-    "askington's",
-    "sects",
-    "indication",
-    "mcconnell",
-    "traced",
-    "unemployed",
-    "complications",
-    "ambivalence",
-    "swami",
-    "cribs",
-    "prayed",
-    "co-optation",
-    "robinson's",
-    "nation-wide",
-    "riots",
-    "contenting",
-    "devise",
-    "revoked",
-    "half-gainer",
-    "rhinoceros",
-    "cordial",
-    "andy",
-    "lovers",
-    "enabled",
-    "3500",
-    "overtook",
-    "murders",
-    "self-deception",
-    "pokeneu",
-    "questionable",
-    "islam's",
-    "runaway",
-    "nuclei",
-    "jane",
-    "iodinating",
-    "campaigne",
-    "legislated",
-    "belton",
-    "conqueror",
-    "artist's",
-    "eshleman",
-    "starting",
-    "physical",
-    "unlinked",
-    "lindy",
-    "performance-capacity",
-    "biennium",
-    "miscreants",
-    "hr",
-    "arouse",
-    "140-degrees-f",
-    "dabbles",
-    "numbing",
-    "saxons",
-    "9/32''",
-    "courteously",
-    "wheeling",
-    "accompanies",
-    "confronted",
-    "mandrel",
-    "tops",
-    "prognoses",
-    "promoting",
-    "sullen",
-    "utilitarian",
-    "eruption",
-    "avocados",
-    "diagnosable",
-    "ignored",
-    "muscle-bound",
-    "bruckmann",
-    "tutor",
-    "kneeled",
-    "detract",
-    "louvre",
-    "1,571",
-    "sparling's",
-    "you's",
-    "enlarging",
-    "communicated",
-    "sink",
-    "hosaka",
-    "goad",
-    "metronome",
-    "landowners",
-    "gehrig",
-    "messina",
-    "lars",
-    "mute",
-    "6-foot-10",
-    "buckle",
-    "expository",
-    "masonic",
-    "whisked",
-    "lobes",
-    "bandaged",
-    "vindicate",
-    "patronne",
-    "restless",
-    "trunk",
-    "redirecting",
-    "breckenridge's",
-    "typical",
-    "intelligentsia",
-    "bumblebee",
-    "vilas",
-    "suggests",
-    "resident",
-    "roundness",
-    "naomi",
-    "subjugation",
-    "smugglers'",
-    "ingenious",
-    "86",
-    "entered",
-    "collages",
-    "kennan",
-    "braving",
-    "io",
-    "democratize",
-    "keyed",
-    "forebearing",
-    "near-balkanization",
-    "considering",
-    "batters",
-    "sienna",
-    "bows",
-    "sixty",
-    "origin/destination",
-    "monochromes",
-    "tannhaeuser",
-    "bouts",
-    "shifted",
-    "novel's",
-    "vaccine",
-    "settle",
-    "381(a)",
-    "dowguard",
-    "incidence",
-    "moralistic",
-    "sarcastic",
-    "sleuthing",
-    "world-ignoring",
-    "pickering",
-    "condemnation",
-    "apron",
-    "gambling",
-    "computing",
-    "noradrenalin",
-    "monkey-gland",
-    "repellent",
-    "g{t}-axis",
-    "disrepute",
-    "discriminate",
-    "twelve",
-    "conjoined",
-    "mar.",
-    "judging",
-    "indemnity",
-    "door-frame",
-    "maniacal",
-    "resolution",
-    "streeters",
-    "bernadine's",
-    "sweatshirt",
-    "ignorance",
-    "squint",
-    "froze",
-    "shakya",
-    "bake-off",
-    "willa",
-    "programing",
-    "tartar",
-    "world's",
-    "rock-steady",
-    "ancient",
-    "seed-bearing",
-    "canaveral's",
-    "cave",
-    "four-year",
-    "65-year-old",
-    "jakarta",
-    "embarrassingly",
-    "bedstraw",
-    "won-lost",
-    "heat-processing",
-    "stale",
-    "cornell",
-    "alsatians",
-    "airlines",
-    "ornaments",
-    "druggan-lake",
-    "cross-sectional",
-    "$3",
-    "capstan",
-    "topkapi",
-    "hall-mills",
-    "kenzo",
-    "allotting",
-    "stalag",
-    "1963-1972",
-    "vines",
-    "black-eyed",
-    "anarchist-adventurers",
-    "serge",
-    "sh",
-    "closed-door",
-    "penetrate",
-    "criminality",
-    "thoreau's",
-    "brain-wracking",
-    "gearing",
-    "loaned",
-    "fancy",
-    "mag",
-    "self-critical",
-    "tris",
-    "isolate",
-    "queerer",
-    "unknown",
-    "pricing",
-    "have",
-    "fuzzed",
-    "pittenger",
-    "armadillo",
-    "hayes",
-    "mean-square",
-    "mars",
-    "bodyweight",
-    "briefest",
-    "charmed",
-    "informing",
-    "burnsides",
-    "puritan",
-    "boy-meets-girl",
-    "dreams",
-    "conserves",
-    "lorrain",
-    "kyne",
-    "herzfeld",
-    "sandburg",
-    "wine's",
-    "way-out",
-    "now-famous",
-    "beebe",
-    "crucial",
-    "summit",
-    "ducts",
-    "trichieri",
-    "265",
-    "chesapeake",
-    "abuse",
-    "symposium",
-    "waterside",
-    "drifted",
-    "stretching",
-    "vertebrates",
-    "hero-worshippers",
-    "grief",
-    "fear-maddened",
-    "cloak",
-    "criss-crossing",
-    "quake",
-    "pro-castro",
-    "bluffing",
-    "2230",
-    "import",
-    "thunderclaps",
-    "ganado",
-    "questioned",
-    "provocation",
-    "wolfes",
-    "af-fold",
-    "apart",
-    "16-year-old",
-    "dichotomy",
-    "overgrown",
-    "aggressively",
-    "blow",
-    "furnace",
-    "goering",
-    "$88,000",
-    "1615",
-    "pump-action",
-    "puerile",
-    "specializes",
-    "oaken",
-    "revivals",
-    "126",
-    "clustered",
-    "joy",
-    "light-duty",
-    "beardslee",
-    "needlessly",
-    "treasure",
-    "6.6",
-    "babcock",
-    "repetitions",
-    "persistent",
-    "ham-radio",
-    "300,000",
-    "nerveless",
-    "jacketed",
-    "ahmet",
-    "cliche",
-    "upper",
-    "semi-abstractions",
-    "daily",
-    "8.6",
-    "alienus",
-    "liliputian",
-    "misinterpreters",
-    "long-range",
-    "plus",
-    "rathbone",
-    "tendencies",
-    "backstage",
-    "evolving",
-    "stinkpotters",
-    "subversives",
-    "foss",
-    "depict",
-    "toasted-nut",
-    "palo",
-    "emboldened",
-    "bugging",
-    "coolheaded",
-    "supermachine",
-    "forties",
-    "executioner's",
-    "lattice",
-    "brainwashing",
-    "abeyance",
-    "peculiarities",
-    "ventured",
-    "country's",
-    "continuo",
-    "chairman",
-    "second-story",
-    "mikhail",
-    "photographically",
-    "articulate",
-    "journeys",
-    "haunting",
-    "textures",
-    "pembroke",
-    "dennis",
-    "nourishes",
-    "retail",
-    "expel",
-    "authoritarian",
-    "campagnoli",
-    "putting",
-    "gossiping",
-    "passport",
-    "tolley",
-    "journal",
-    "gordon's",
-    "perform",
-    "mortars",
-    "hable",
-    "deeps",
-    "tidbits",
-    "longed-for",
-    "speakers",
-    "birkhead",
-    "groot",
-    "swirling",
-    "unannounced",
-    "organized",
-    "nobody",
-    "hals",
-    "hillside",
-    "arena",
-    "salvatore",
-    "mumbling",
-    "smithereens",
-    "record-high",
-    "roaring",
-    "quiney",
-    "luxuriosly-upholstered",
-    "frost-bitten",
-    "recommendations",
-    "eight-thirty",
-    "lip",
-    "boy-lady",
-    "ice",
-    "moody",
-    "synchronism",
-    "kehl",
-    "phs",
-    "september",
-    "1633",
-    "flower's",
-    "dane",
-    "photographed",
-    "+",
-    "voiced",
-    "yellowish",
-    "versatility",
-    "relieves",
-    "helm",
-    "electric",
-    "rack",
-    "healed",
-    "shrinkage",
-    "gursel",
-    "nutshell",
-    "robbers",
-    "levee",
-    "all-weather",
-    "realizing",
-    "educational",
-    "76.7",
-    "abstinence",
-    "four-jet",
-    "diving",
-    "muses",
-    "spectrophotometric",
-    "rid",
-    "ajb",
-    "acceptability",
-    "eliminate",
-    "clashed",
-    "bed-time",
-    "42",
-    "'tis",
-    "outbreak",
-    "caged",
-    "perceiving",
-    "]",
-    "lacks",
-    "experiences",
-    "masquers'",
-    "grevyles",
-    "hanford",
-    "lander",
-    "jubilantly",
-    "posterior",
-    "barrel-wide",
-    "oil-bath",
-    "initial",
-    "tails",
-    "advertising-conscious",
-    "compensates",
-    "bologna",
-    "givin'",
-    "kokoschka",
-    "par",
-    "alienate",
-    "ripples",
-    "quarrels",
-    "wechsler",
-    "serafin",
-    "whack",
-    "hypothesize",
-    "maintain",
-    "mum",
-    "loath",
-    "seismographs",
-    "dowry",
-    "unflagging",
-    "demurred",
-    "eli",
-    "conveyed",
-    "crispness",
-    "rating",
-    "well-springs",
-    "wastebasket",
-    "summate",
-    "nrl",
-    "gossiped",
-    "platted",
-    "certification",
-    "mack",
-    "outwardly",
-    "afraid",
-    "prepackaged",
-    "sompin",
-    "sawallisch",
-    "era",
-    "critic's",
-    "bombings",
-    "1020",
-    "galina",
-    "2,425",
-    "cheetah",
-    "steeper",
-    "bedroom",
-    "winners",
-    "aja",
-    "parris",
-    "hubert",
-    "name-dropper",
-    "pierre",
-    "brighter",
-    "bananas",
-    "proverbial",
-    "bowstring",
-    "pierson",
-    "cavalrymen",
-    "inferential",
-    "shensi",
-    "intra-company",
-    "anyways",
-    "hereabouts",
-    "baby",
-    "potentiality",
-    "brandeis",
-    "2:32.2",
-    "dual-ladder",
-    "reaffirm",
-    "mashing",
-    "as",
-    "internationalists",
-    "happier",
-    "preventive",
-    "dunston",
-    "invisibly",
-    "unnaturally",
-    "janus-faced",
-    "qualifications",
-    "fable",
-    "adler",
-    "chatting",
-    "narratives",
-    "nernst",
-    "$20",
-    "inscription",
-    "domitian's",
-    "discontinue",
-    "breathe",
-    "requesting",
-    "$306",
-    "one-over-par",
-    "nations'",
-    "alleged",
-    "brush-off's",
-    "individualized",
-    "prorate",
-    "bailing",
-    "hoofmarks",
-    "2-3/4",
-    "script",
-    "fellow-countryman",
-    "christiansen",
-    "garment",
-    "damned",
-    "bickering",
-    "knife-edge",
-    "incurs",
-    "longhand",
-    "d.w.",
-    "vessel",
-    "lavishing",
-    "facsimile",
-    "abstractionism",
-    "5777",
-    "exits",
-    "fast-growing",
-    "alsatian",
-    "half-man",
-    "digress",
-    "professes",
-    "689-page",
-    "360,000",
-    "thrown",
-    "74.1",
-    "theocracy",
-    "hetty's",
-    "skins",
-    "sarasota",
-    "terriers",
-    "buyers",
-    "50-percent",
-    "flattening",
-    "interchange",
-    "pipgras",
-    "pickfair",
-    "pessimism",
-    "preachers",
-    "smilin'",
-    "terrific",
-    "values",
-    "olympian",
-    "schuman's",
-    "contest",
-    "placating",
-    "land's",
-    "wharves",
-    "apprentice",
-    "sangallo's",
-    "scribing",
-    "bragged",
-    "abelson",
-    "loveless",
-    "chopper",
-    "grope",
-    "depresses",
-    "halt",
-    "glen",
-    "true",
-    "many",
-    "stopover",
-    "shocker",
-    "besides",
-    "camouflage",
-    "eckart",
-    "lew's",
-    "captivating",
-    "montmartre",
-    "mystery",
-    "trims",
-    "16-page",
-    "consumes",
-    "recession",
-    "pastures",
-    "beadles",
-    "laminated",
-    "pug-nosed",
-    "spares",
-    "revere",
-    "cheers",
-    "snort",
-    "wendells",
-    "surf",
-    "wilmette",
-    "loathed",
-    "becomes",
-    "finnish",
-    "silky",
-    "periclean",
-    "stressful",
-    "either",
-    "3-inch",
-    "five-round",
-    "blankets",
-    "across",
-    "powders",
-    "nieman",
-    "regulating",
-    "nineteenth",
-    "short's",
-    "undertook",
-    "doleful",
-    "laureate",
-    "prefuh",
-    "money-minded",
-    "maidens",
-    "timber",
-    "agricolas",
-    "y're",
-    "o",
-    "963",
-    "forsakes",
-    "arrested",
-    "repertoire",
-    "couplers",
-    "holidays",
-    "lb/day",
-    "anti-american",
-    "caravaggio",
-    "harshly",
-    "palace",
-    "onrush",
-    "1811",
-    "europeans",
-    "disrupting",
-    "leaned",
-    "vocabularies",
-    "newbery",
-    "c'est",
-    "frivolity",
-    "baldy",
-    "natives",
-    "price",
-    "over-spent",
-    "orient",
-    "successive",
-    "pauson",
-    "3.7",
-    "200",
-    "deep-eyed",
-    "imposed",
-    "excise",
-    "exploding",
-    "startling",
-    "courtroom",
-    "sportin'",
-    "outstripping",
-    "rooms",
-    "sadism",
-    "secret",
-    "subsidies",
-    "receives",
-    "6%",
-    "innings",
-    "denunciation",
-    "rodding",
-    "teahouse",
-    "patiently",
-    "vous",
-    "piraro",
-    "carbon",
-    "coahr",
-    "unmolested",
-    "conclude",
-    "hale",
-    "appointing",
-    "folsom",
-    "reimbursed",
-    "coco",
-    "idaho",
-    "persistently",
-    "mementoes",
-    "drunkenness",
-    "division's",
-    "american-trained",
-    "surmised",
-    "moon-drenched",
-    "abbe-scotch",
-    "occupations",
-    "garlanded",
-    "hue",
-    "supplant",
-    "robotism",
-    "3,399",
-    "vocation",
-    "janissaries",
-    "tongue-in-cheek",
-    "b-70",
-    "rang",
-    "pure",
-    "monstrous",
-    "inhumanities",
-    "vinson",
-    "excoriate",
-    "colloquy",
-    "performances",
-    "chauffeured",
-    "plus-one",
-    "pimples",
-    "servitors",
-    "6.4",
-    "brazilian",
-    "bill's",
-    "havilland",
-    "ex-singer",
-    "time-servers",
-    "hookups",
-    "sukarno's",
-    "2:40",
-    "stilts",
-    "freakish",
-    "grievous",
-    "mycology",
-    "dictatorial",
-    "commanding",
-    "one-room",
-    "vocational-advancement",
-    "nurse's",
-    "feuermann",
-    "logged",
-    "successfully",
-    "clause",
-    "stating",
-    "rulers",
-    "lexicon",
-    "intuitive",
-    "archaic",
-    "intriguing",
-    "rdw",
-    "business-minded",
-    "pointer",
-    "distinguishes",
-    "boxell",
-    "detoured",
-    "scribbled",
-    "passionate",
-    "forepaws",
-    "shootings",
-    "squirt",
-    "twelfth",
-    "tougas",
-    "starboard",
-    "abundant",
-    "speckles",
-    "musmanno's",
-    "paintings",
-    "trestles",
-    "publish",
-    "impending",
-    "reorganizing",
-    "ribcage",
-    "friends",
-    "keeeerist",
-    "sea-blessed",
-    "analyzing",
-    "nancy",
-    "polishes",
-    "2:31.3-:35.3",
-    "life-size",
-    "bosis'",
-    "contrivances",
-    "sovietskaya",
-    "autograph",
-    "soliciting",
-    "occipital",
-    "stomach-belly",
-    "kickbacks",
-    "grafin's",
-    "ettore",
-    "whitrow",
-    "sea",
-    "parklike",
-    "warningly",
-    "motives",
-    "minors",
-    "benesi",
-    "tweedy",
-    "diamonds",
-    "beetles",
-    "efficiency",
-    "eichmann's",
-    "clamping",
-    "deprivations",
-    "well-publicized",
-    "duffers",
-    "schilling",
-    "lopez",
-    "gutted",
-    "overreached",
-    "remoteness",
-    "grandiose",
-    "amazing",
-    "drumlin",
-    "legislature's",
-    "brice",
-    "b.b.c.",
-    "trouble",
-    "startlingly",
-    "masculine",
-    "rameau",
-    "parson",
-    "roland",
-    "interjected",
-    "operatic",
-    "consequently",
-    "shuffled",
-    "footbridge",
-    "satisfactions",
-    "mid-fifties",
-    "answer",
-    "spate",
-    "reminisces",
-    "brashness",
-    "automatic",
-    "bludgeon",
-    "herculean",
-    "croaking",
-    "nightingales",
-    "watering",
-    "verdi",
-    "sauce",
-    "self-delusion",
-    "shared",
-    "late-summer",
-    "screens",
-    "girls",
-    "quarterly",
-    "wold",
-    "leon",
-    "aprons",
-    "goggle-eyed",
-    "interpolations",
-    "commonly",
-    "well-to-do",
-    "killingsworth",
-    "guru",
-    "hartley",
-    "discs",
-    "wolverton",
-    "sluggish",
-    "flutter",
-    "virginian",
-    "mick",
-    "horsehair",
-    "achilles",
-    "procreation",
-    "blanketed",
-    "find",
-    "shores",
-    "anatomicals",
-    "hiroshima",
-    "sooner",
-    "15-hit",
-    "ballplayer",
-    "ravel-like",
-    "boy-name",
-    "reducing",
-    "impotent",
-    "shedding",
-    "frowningly",
-    "he'd",
-    "datum",
-    "childishness",
-    "slowness",
-    "yeard",
-    "sportswriter",
-    "gussets",
-    "nucleus",
-    "bathyran",
-    "injuries",
-    "preferment",
-    "dependable",
-    "salmon",
-    "390-foot",
-    "greases",
-    "following",
-    "inhibiting",
-    "monday",
-    "archeological",
-    "steers",
-    "located",
-    "entail",
-    "communion",
-    "sympathetic",
-    "purported",
-    "toast",
-    "colt",
-    "publick",
-    "broglie",
-    "legally",
-    "educators",
-    "sioux",
-    "individualist",
-    "replenish",
-    "3:00",
-    "eyeball",
-    "radius",
-    "vernacular",
-    "lolling",
-    "capably",
-    "three-building",
-    "mijbil",
-    "kahn's",
-    "roughcast",
-    "spectre",
-    "craftsmanship",
-    "campgrounds",
-    "sinfonica",
-    "cowardice",
-    "schoolchildren",
-    "armour",
-    "duress",
-    "bloat",
-    "affinities",
-    "zur",
-    "evolves",
-    "geologist",
-    "marimba",
-    "colonial",
-    "certiorari",
-    "graced",
-    "dillon",
-    "geely",
-    "1801",
-    "snuck",
-    "chemistry",
-    "grunting",
-    "bathed",
-    "title-holder",
-    "canteloube",
-    "madding",
-    "y's",
-    "seagoville",
-    "anesthetic",
-    "$1.4",
-    "eastward",
-    "homesteads",
-    "vistas",
-    "burnt",
-    "simon's",
-    "6-inch",
-    "curzon's",
-    "discriminating",
-    "sterility",
-    "ochre",
-    "stevie",
-    "suvorov's",
-    "sparkles",
-    "recurring",
-    "appropriated",
-    "shrubs",
-    "worksheet",
-    "managed",
-    "determinability",
-    "pool",
-    "smalltime",
-    "feigned",
-    "onion",
-    "display",
-    "bake",
-    "transplanted",
-    "carrots",
-    "sin",
-    "maris",
-    "venn",
-    "half-mincing",
-    "highroad",
-    "hard-won",
-    "photographer",
-    "flop",
-    "whittier's",
-    "bugatti",
-    "turnips",
-    "intact",
-    "lonsdale's",
-    "$278,877,000",
-    "lumumba's",
-    "droplets",
-    "secant",
-    "buckskin",
-    "drugging",
-    "therefrom",
-    "arabian-american",
-    "fourteen",
-    "well-made",
-    "armenian",
-    "waited",
-    "glison",
-    "shorten",
-    "permission",
-    "egg-sized",
-    "courbet",
-    "hande",
-    "cottage",
-    "meant",
-    "handsomely",
-    "hander",
-    "malta",
-    "richards'",
-    "f.s.c.",
-    "streaks",
-    "mingled",
-    "tosses",
-    "r.",
-    "endeavoring",
-    "boundaries",
-    "hotdogs",
-    "1774",
-    "fecund",
-    "aurora",
-    "forages",
-    "'38",
-    "flatulence",
-    "palely",
-    "tofu",
-    "disagreement",
-    "kedzie",
-    "72nd",
-    "enable",
-    "sultane",
-    "ignorant",
-    "darkness",
-    "assumes",
-    "147,000",
-    "d'amours",
-    "custom-design",
-    "tulip-shaped",
-    "yourselves",
-    "chord",
-    "cornfield",
-    "tab",
-    "measurably",
-    "antiredeposition",
-    "sunday's",
-    "silver-gray",
-    "inseparable",
-    "enraged",
-    "permits",
-    "collapses",
-    "grigory",
-    "modulated",
-    "bey",
-    "extinguished",
-    "hypothalamic-cortical",
-    "huai",
-    "1921",
-    "island's",
-    "drafted",
-    "y'r",
-    "baptisms",
-    "nuances",
-    "394",
-    "physiologically",
-    "eaton",
-    "eraser",
-    "may",
-    "mysterious",
-    "corralling",
-    "high-stepped",
-    "quint's",
-    "emerges",
-    "preambles",
-    "toronto",
-    "tips",
-    "drought-seared",
-    "good-bye",
-    "grayed",
-    "submits",
-    "paragraphs",
-    "solaced",
-    "cinches",
-    "19-foot",
-    "ride",
-    "again",
-    "excluding",
-    "floridians",
-    "harbert",
-    "1770's",
-    "contagious",
-    "singled",
-    "eulogized",
-    "mortality",
-    "rejoice",
-    "1,800,000",
-    "satirically",
-    "research",
-    "bulkhead",
-    "d.",
-    "denny's",
-    "pre-marital",
-    "trustee",
-    "slaked",
-    "dietetic",
-    "sophisticated",
-    "aureomycin",
-    "gallantry",
-    "robots",
-    "reaffirms",
-    "effortlessly",
-    "24-degrees",
-    "age",
-    "vary",
-    "indian's",
-    "longfellow's",
-    "kimberly",
-    "actor's",
-    "groping",
-    "laue",
-    "malleable",
-    "wichita",
-    "graciously",
-    "5612",
-    "solids",
-    "faro",
-    "seepage",
-    "2100",
-    "greatly",
-    "deductible",
-    "rotarians",
-    "chumminess",
-    "obsidian",
-    "pontifical",
-    "outweigh",
-    "emulate",
-    "protoplasm",
-    "shaw",
-    "receipt",
-    "170-degrees-c",
-    "inhibits",
-    "funneled",
-    "thinness",
-    "japs",
-    "bunkered",
-    "droves",
-    "fuels",
-    "heat's",
-    "37-1/2",
-    "rat's",
-    "lancaster",
-    "killed",
-    "teaming",
-    "commando-trained",
-    "heart-measuring",
-    "fainted",
-    "individuality",
-    "handmaiden",
-    "joel",
-    "up-jutting",
-    "unpremeditated",
-    "abra",
-    "trained",
-    "mesh",
-    "bombay",
-    "lounges",
-    "apportionment",
-    "toffee",
-    "show",
-    "roosters",
-    "pausing",
-    "courier-journal",
-    "investigating",
-    "broach",
-    "memberships",
-    "traders'",
-    "specially",
-    "sailing",
-    "veracity",
-    "cartoonists",
-    "psychiatrists",
-    "usher",
-    "six-four",
-    "subsidized",
-    "waitresses",
-    "sympathize",
-    "theories",
-    "dramatizes",
-    "aired",
-    "curving",
-    "creeks",
-    "tight",
-    "sensors",
-    "socialized",
-    "dewitt",
-    "canine",
-    "two-class",
-    "willinge",
-    "forte",
-    "musclemen",
-    "contingency",
-    "inherits",
-    "vail",
-    "limousine",
-    "rehabilitation",
-    "cadre",
-    "capacitance",
-    "fatso",
-    "glocester",
-    "haydon",
-    "concertante",
-    "capone's",
-    "buyer's",
-    "syndication",
-    "binuclear",
-    "all-woman",
-    "furthering",
-    "mcdermott",
-    "2:35",
-    "custodial",
-    "sores",
-    "slowly",
-    "square",
-    "agreeable",
-    "winsett",
-    "foibles",
-    "smashed-out",
-    "three-week",
-    "interglacial",
-    "56,000",
-    "along",
-    "catalogue",
-    "monsoon-shrouded",
-    "dissipating",
-    "drapery",
-    "thai",
-    "super-high",
-    "first",
-    "thirds",
-    "bunt",
-    "council",
-    "primal",
-    "one-inch",
-    "leonore",
-    "thirdly",
-    "402",
-    "mumford",
-    "grim",
-    "harried",
-    "bawling",
-    "affixed",
-    "100-ton",
-    "510",
-    "maltese",
-    "flamed",
-    "tray",
-    "272",
-    "freddy's",
-    "perceived",
-    "mickey's",
-    "platitudinous",
-    "adjoined",
-    "glorious",
-    "sloganeering",
-    "trains",
-    "membrane",
-    "uncritical",
-    "turnery",
-    "manipulated",
-    "hoodlums",
-    "inconsistency",
-    "dream-sweetmite",
-    "environments",
-    "probate",
-    "fancier",
-    "plain-spoken",
-    "1815",
-    "tris(hydroxymethyl)-aminometha",
-    "cut-glass",
-    "lance",
-    "dnieper",
-    "shrill",
-    "varies",
-    "start",
-    "assimilation",
-    "deranged",
-    "woodwork",
-    "functioned",
-    "procedure",
-    "63,000,000",
-    "autocratic",
-    "authorized",
-    "willowy",
-    "relegated",
-    "infertile",
-    "teacart",
-    "chronological",
-    "owl",
-    "freedom-conscious",
-    "chomp",
-    "potential",
-    "gages",
-    "non-service-connected",
-    "parentheses",
-    "enraptured",
-    "panic",
-    "play-girl",
-    "missouri",
-    "2:01.3",
-    "jean",
-    "lonesome",
-    "adult",
-    "balkiness",
-    "center-punch",
-    "noncombatant",
-    "ambrose",
-    "buxton",
-    "weekend",
-    "takeing",
-    "catalytic",
-    "melody",
-    "interment",
-    "supplies",
-    "abject",
-    "accenting",
-    "com",
-    "padlock",
-    "britain",
-    "music-making",
-    "eies",
-    "ferro",
-    "delvin",
-    "10:45",
-    "franciscans",
-    "rededicate",
-    "bomber",
-    "groove",
-    "issue",
-    "draughts",
-    "beauty",
-    "fission",
-    "non-forthcoming",
-    "buttresses",
-    "swollen-looking",
-    "nolo",
-    "itinerary",
-    "clang",
-    "gaulle",
-    "urethane",
-    "magnate",
-    "greased",
-    "relate",
-    "ex-marine",
-    "suable",
-    "footfalls",
-    "sides",
-    "hutton",
-    "rustic",
-    "boils",
-    "dancers",
-    "cury",
-    "religious",
-    "keelson",
-    "rogers",
-    "gullah",
-    "fullness",
-    "claudio",
-    "outriggers",
-    "artificer",
-    "13th",
-    "ronnie",
-    "death-trap",
-    "trappings",
-    "1930's",
-    "200-man",
-    "renunciation",
-    "offender",
-    "1863",
-    "kinsell",
-    "fergusson",
-    "relish",
-    "gorgeously",
-    "tubers",
-    "unscrupulous",
-    "bulletin'd",
-    "gallup",
-    "appraisers",
-    "gymnastic",
-    "calvinist",
-    "ecological",
-    "upon",
-    "living",
-    "team-mate",
-    "trouser",
-    "manifest",
-    "ella",
-    "steadied",
-    "diffusely",
-    "6-year",
-    "jackie's",
-    "confabulations",
-    "right-angled",
-    "mists",
-    "tularemia",
-    "spotless",
-    "1911-1912",
-    "trekked",
-    "melodious",
-    "extinct",
-    "behind",
-    "guess",
-    "ill",
-    "deployed",
-    "grapple",
-    "embezzling",
-    "kan.",
-    "non-communist",
-    "injustice",
-    "hon'ble",
-    "inadvisable",
-    "381(c)(16)",
-    "unconditionally",
-    "community",
-    "palpable",
-    "secretary-treasurer",
-    "magical",
-    "traps",
-    "32-degrees-c",
-    "feted",
-    "chewed",
-    "film",
-    "karen",
-    "rupture",
-    "aptly",
-    "incite",
-    "non-propagating",
-    "cardiomegaly",
-    "throws",
-    "frugality",
-    "jabbing",
-    "hanover's",
-    "nausea",
-    "warsaw",
-    "millennium",
-    "gardened",
-    "a-tall",
-    "hypotheses",
-    "beaux-arts",
-    "larkin's",
-    "upper-middle",
-    "form-dictionary",
-    "coupon",
-    "widespread",
-    "sporadic",
-    "pageantry",
-    "2.1",
-    "lanza",
-    "hibachi",
-    "pre-revolutionary",
-    "epaulets",
-    "thanksgiving",
-    "photorealism",
-    "prow",
-    "cumbersome",
-    "basophilic",
-    "frescoes",
-    "undone",
-    "road-crossing",
-    "marksmanship",
-    "conferees",
-    "wound-tumor",
-    "folk",
-    "mahzeer's",
-    "weirdy",
-    "business-like",
-    "boatel",
-    "inflict",
-    "machine-family",
-    "greek-born",
-    "overcoming",
-    "crease",
-    "belfry",
-    "metabolism",
-    "pre-fair",
-    "cortical",
-    "cumberland",
-    "unnoticed",
-    "relative",
-    "eidetic",
-    "wharf",
-    "wills",
-    "republicans",
-    "enjoys",
-    "unimpassioned",
-    "eligibility",
-    "discharges",
-    "competed",
-    "hitlers",
-    "weakness",
-    "expires",
-    "cherokee",
-    "polypropylene",
-    "underwood",
-    "disinclination",
-    "collaborated",
-    "distressed",
-    "bali",
-    "securely",
-    "afresh",
-    "tribes",
-    "urgently",
-    "hangovers",
-    "inventor",
-    "enemy's",
-    "fisherman",
-    "superego",
-    "arranges",
-    "volkenstein",
-    "11:30",
-    "26",
-    "curt's",
-    "energized",
-    "7,827",
-    "joe",
-    "constructed",
-    "broken",
-    "meaty",
-    "clinico-pathologic",
-    "tribe",
-    "mccluskey",
-    "hospitalized",
-    "bubbling",
-    "carvings",
-    "cellar",
-    "sofa",
-    "legitimate",
-    "uniforms",
-    "whitening",
-    "piwen",
-    "mosquito-plagued",
-    "k.",
-    "internationale",
-    "rubberized",
-    "piezoelectricity",
-    "improve",
-    "kennel",
-    "arteries",
-    "lapped",
-    "democratic-endorsed",
-    "spider",
-    "adapters",
-    "deciding",
-    "circulate",
-    "dozed",
-    "planting",
-    "newport",
-    "frog-eating",
-    "nott",
-    "veneer",
-    "london",
-    "accepted",
-    "milcote",
-    "colonel",
-    "universal",
-    "everest",
-    "istanbul",
-    "signpost",
-    "1-o",
-    "partition",
-    "viciousness",
-    "digitalization",
-    "york-mind",
-    "putt",
-    "$32,000",
-    "peasanthood",
-    "complicating",
-    "fiftieth",
-    "$700",
-    "mommy",
-    "statesman",
-    "ward",
-    "syndicate",
-    "dexter's",
-    "l'unita",
-    "gagwriters",
-    "double-stage",
-    "average",
-    "disapproval",
-    "fiddles",
-    "2:02",
-    "fortin",
-    "backed",
-    "classical",
-    "meretricious",
-    "placing",
-    "1917-18",
-    "900-calorie",
-    "arm-levitation",
-    "multidimensional",
-    "miscalculation",
-    "expressways",
-    "adventitious",
-    "posse's",
-    "vadim",
-    "re-declared",
-    "cattle",
-    "neutralism",
-    "quite",
-    "sadly",
-    "male",
-    "krogers",
-    "light-transmitting",
-    "g.b.s.",
-    "agencies",
-    "asdic",
-    "america's",
-    "lueger's",
-    "mechanical",
-    "marmara",
-    "unfair",
-    "abreast",
-    "psychoactive",
-    "smokescreen",
-    "grayer",
-    "veranda",
-    "clayton's",
-    "fielder",
-    "inalienable",
-    "cavorted",
-    "ladies'",
-    "wrongs",
-    "swung",
-    "threefold",
-    "hesitatingly",
-    "incongruities",
-    "latent",
-    "yellerish",
-    "client-service",
-    "usual",
-    "bedazzled",
-    "slump",
-    "disks",
-    "ussr",
-    "dragon",
-    "prosecutors",
-    "overwritten",
-    "9,748,000",
-    "micrometer",
-    "outpatient",
-    "bastianini",
-    "johnny",
-    "unthinkable",
-    "documentaries",
-    "ways",
-    "seaman",
-    "chaperon",
-    "uncritically",
-    "puppets",
-    "besieging",
-    "allusions",
-    "twirled",
-    "ee-faket",
-    "evangelicalism",
-    "solemn",
-    "geological",
-    "protege",
-    "rationalist",
-    "trinkets",
-    "no-back",
-    "escape",
-    "hounds",
-    "egotism",
-    "hacked",
-    "poles",
-    "charcoal-broiled",
-    "philanthropist",
-    "neuropsychiatric",
-    "orly",
-    "supplementing",
-    "petulance",
-    "742",
-    "prick",
-    "facsiport",
-    "caton's",
-    "shartzer's",
-    "grabbed",
-    "dried-up",
-    "nation-building",
-    "elks",
-    "cohen",
-    "angie",
-    "comin",
-    "commanders",
-    "aggies",
-    "waiters",
-    "splotched",
-    "panthers",
-    "pedestal",
-    "furor",
-    "recurrent",
-    "universe",
-    "hit-run",
-    "rattled",
-    "nonlinguistic",
-    "bookseller",
-    "mutilation",
-    "unprecedented",
-    "brother-in-law",
-    "outface",
-    "stickler",
-    "flute",
-    "long-run",
-    "elusive",
-    "sarpsis",
-    "nkrumah",
-    "incurring",
-    "song's",
-    "sleet",
-    "mercury",
-    "subspaces",
-    "glimmer",
-    "pseudo-questions",
-    "'54",
-    "amorist",
-    "uncourageous",
-    "helpful",
-    "marginality",
-    "gibe",
-    "base-runner",
-    "637",
-    "5:30",
-    "linen-covered",
-    "celie",
-    "umpire",
-    "fountainhead",
-    "snelling",
-    "three-sectioned",
-    "solitary",
-    "monroe",
-    "windfall",
-    "rutherford",
-    "worrying",
-    "paul-minneapolis",
-    "existent",
-    "wherefore",
-    "paddle",
-    "virtuosi",
-    "influencing",
-    "milstein",
-    "steadier",
-    "inter-tribal",
-    "dexedrine",
-    "lips",
-    "tablespoons",
-    "i've",
-    "comptroller",
-    "staggering",
-    "loc",
-    "propelled",
-    "coral-colored",
-    "tabac",
-    "upstream",
-    "westhampton",
-    "novelty",
-    "scary",
-    "fla.",
-    "reds",
-    "modernity",
-    "42-inch",
-    "bostitch",
-    "whose",
-    "remake",
-    "muzzles",
-    "eared",
-    "farce",
-    "appropriate",
-    "triol",
-    "footwear",
-    "accacia",
-    "wrinkle",
-    "ackerly",
-    "jed",
-    "match",
-    "contraction-extension",
-    "blue-eyes",
-    "break",
-    "marts",
-    "mciver",
-    "refractive",
-    "thousandth",
-    "beam",
-    "juxtaposed",
-    "copyrights",
-    "restraints",
-    "what",
-    "musing",
-    "stoked",
-    "leitmotif",
-    "euphoria",
-    "sea-horses",
-    "fiedler",
-    "prince's",
-    "untenable",
-    "beggar's",
-    "sent",
-    "gay-ess",
-    "lindemanns",
-    "jetliners",
-    "mewed",
-    "annisberg",
-    "harvested",
-    "dwindled",
-    "similarities",
-    "misled",
-    "culture-protestantism",
-    "transducers",
-    "fleischmanns",
-    "7%",
-    "ghadiali",
-    "hats",
-    "re-establish",
-    "38-7",
-    "f.supp.235",
-    "main",
-    "seagulls",
-    "yawning",
-    "sargent",
-    "polecat",
-    "poark",
-    "pityingly",
-    "arises",
-    "rozella",
-    "vexes",
-    "relativity",
-    "murphy",
-    "bergs",
-    "culture",
-    "reward",
-    "aiche",
-    "severly",
-    "ring-around-a-rosy",
-    "arrogance",
-    "ottermole",
-    "fraternized",
-    "1/8-inch",
-    "ludie",
-    "abler",
-    "emigrant",
-    "stabilization",
-    "1066",
-    "checked",
-    "skips",
-    "portion",
-    "inflicted",
-    "per-game",
-    "constantinos",
-    "arcaded",
-    "ceecee",
-    "endogenous",
-    "racking",
-    "morocco-bound",
-    "assaults",
-    "rescuing",
-    "fisherman's",
-    "wage-setter",
-    "rancorous",
-    "zinman",
-    "fir",
-    "contacts",
-    "shrink",
-    "chuck",
-    "stone-gray",
-    "orb",
-    "mentalities",
-    "feeling-state",
-    "speculators",
-    "subsumed",
-    "centimeter-",
-    "galleries",
-    "admissible",
-    "fluctuating",
-    "smallwood",
-    "interpretative",
-    "philosophical",
-    "enhances",
-    "drill",
-    "balance-of-payments",
-    "labeled",
-    "thorstein",
-    "traverse",
-    "reeling",
-    "metabolized",
-    "fatuous",
-    "federation",
-    "passages",
-    "rekindling",
-    "butane",
-    "wellsville",
-    "inherited",
-    "chappell",
-    "hand-in-glove",
-    "orations",
-    "ramp",
-    "description",
-    "1937",
-    "hoeve",
-    "marlin",
-    "post-war",
-    "$750,000",
-    "vicarious",
-    "60-1",
-    "thou",
-    "edema",
-    "sewanee",
-    "electrodynamics",
-    "borne",
-    "46th",
-    "meyerbeer's",
-    "morning's",
-    "celluloses",
-    "eradicate",
-    "tentatively",
-    "gleefully",
-    "non-com",
-    "resumed",
-    "27-in.",
-    "titanium",
-    "veterans",
-    "terribly",
-    "hubbub",
-    "solicitude",
-    "intensely",
-    "sponsors",
-    "reapportioned",
-    "buckaroos",
-    "by-passed",
-    "lane",
-    "l'activite",
-    "cinemactor",
-    "tempeh",
-    "stallard",
-    "tangible",
-    "disputes",
-    "sizes",
-    "gradients",
-    "defeated",
-    "city's",
-    "linguistic",
-    "peace-loving",
-    "winters",
-    "hopes",
-    "occupants",
-    "output",
-    "roger",
-    "farming",
-    "cope",
-    "sorcery",
-    "manuscript",
-    "scrupulous",
-    "geographically",
-    "354",
-    "deriving",
-    "freighters",
-    "orator",
-    "exorcise",
-    "briar",
-    "diplomat's",
-    "lonely",
-    "experimented",
-    "hindemith's",
-    "vista",
-    "normally",
-    "launch",
-    "wus",
-    "samos",
-    "handley",
-    "saigon",
-    "sniffing",
-    "framework",
-    "alexandre",
-    "low-pass",
-    "thy",
-    "buns",
-    "primers",
-    "bayonet",
-    "project",
-    "shipbuilding",
-    "laid",
-    "1492",
-    "162-game",
-    "relict",
-    "eject",
-    "notebooks",
-    "kiss",
-    "boors",
-    "well-wishing",
-    "mediocrities",
-    "shorelines",
-    "crux",
-    "packards",
-    "sight",
-    "directive",
-    "chowders",
-    "wincing",
-    "saba",
-    "deltas",
-    "sniffle",
-    "frame",
-    "entity",
-    "handle",
-    "admixed",
-    "midshipman",
-    "imagines",
-    "armies",
-    "dinosaur",
-    "100,000",
-    "nervousness",
-    "sea-village",
-    "flat-footed",
-    "reama",
-    "projected",
-    "down-payments",
-    "newsweek",
-    "hayward",
-    "summer's",
-    "aseptic",
-    "theatres",
-    "stipulate",
-    "extralegal",
-    "patchen's",
-    "legality",
-    "belatedly",
-    "tulsa",
-    "macmillan",
-    "ramming",
-    "purveyor",
-    "cantered",
-    "margarito",
-    "wrath",
-    "protruded",
-    "darin'",
-    "quantities",
-    "ecliptic",
-    "carefully",
-    "fridays",
-    "reputedly",
-    "cholesterol-rich",
-    "paths",
-    "revisions",
-    "madaripur",
-    "simpkins",
-    "gardens",
-    "glamor",
-    "moderately",
-    "cavernous",
-    "currently",
-    "hollow",
-    "shrieking",
-    "underwood's",
-    "embody",
-    "5-",
-    "porosity",
-    "costly",
-    "ebb",
-    "whinnied",
-    "dosages",
-    "mockingly",
-    "civil-rights",
-    "concluded",
-    "link",
-    "estella's",
-    "re-creation",
-    "occasionally",
-    "dimly-outlined",
-    "mulatto's",
-    "chemische",
-    "sources",
-    "pressed",
-    "blends",
-    "prevented",
-    "maladjustments",
-    "meritorious",
-    "synchronous",
-    "priam",
-    "perusal",
-    "fails",
-    "debacle",
-    "keno",
-    "right-wing",
-    "bulkheads",
-    "self-assertive",
-    "bartok",
-    "photoelectronic",
-    "tolerance",
-    "ingleside",
-    "subject",
-    "scrapes",
-    "sipped",
-    "waged",
-    "well-dressed",
-    "6(j)",
-    "guarding",
-    "gunman",
-    "consistently",
-    "tradition",
-    "frenchman's",
-    "marc",
-    "piling",
-    "brassy",
-    "shea's",
-    "president's",
-    "hypocrite",
-    "chastity",
-    "slower",
-    "conference",
-    "actor-crooner",
-    "drunks",
-    "geraghty's",
-    "theodor",
-    "mix",
-    "duties",
-    "files",
-    "shrine",
-    "serra",
-    "orlick's",
-    "gust",
-    "reasserting",
-    "drewe",
-    "fuchs",
-    "token",
-    "bicep",
-    "modeled",
-    "toto",
-    "men-folk",
-    "35-foot",
-    "kanin",
-    "pathetic",
-    "enlarged",
-    "sanipractor",
-    "viola",
-    "observed",
-    "$5,000,000",
-    "relented",
-    "ditties",
-    "connection",
-    "melzi",
-    "ice-cold",
-    "iocsixf",
-    "inholdings",
-    "dwarfed",
-    "defenseless",
-    "seven-thirty",
-    "two-game",
-    "ida",
-    "january's",
-    "gannon's",
-    "redhead",
-    "dearth",
-    "jellies",
-    "deceiving",
-    "bowers",
-    "one-half",
-    "wallop",
-    "preconceptions",
-    "man-made",
-    "205-pound",
-    "gardeners",
-    "microscopy",
-    "iodinated",
-    "blood-chilling",
-    "minced",
-    "inconspicuously",
-    "garcia",
-    "mother-of-pearl",
-    "varying",
-    "grant",
-    "incumbent",
-    "shirts",
-    "ten-twelve",
-    "flock's",
-    "jack",
-    "638,560",
-    "begley",
-    "riverside",
-    "broadening",
-    "pounds",
-    "642",
-    "naktong",
-    "hall",
-    "somewhere",
-    "override",
-    "twists",
-    "northland",
-    "inoculations",
-    "pack",
-    "rainfall",
-    "greedily",
-    "gloriana",
-    "organdy",
-    "consequences",
-    "hardener",
-    "thermonuclear",
-    "anti-aircraft",
-    "mugs",
-    "facto",
-    "self-deprecation",
-    "bellwood",
-    "cherries",
-    "applauded",
-    "bothering",
-    "wary",
-    "dresbachs'",
-    "liberated",
-    "pounding",
-    "brindle",
-    "grunnfeu",
-    "ton-mile",
-    "slips",
-    "drexel",
-    "parametric",
-    "priddy",
-    "radioactivity",
-    "phedre",
-    "bull-sessions",
-    "marveled",
-    "blush",
-    "sneed",
-    "601",
-    "locus",
-    "precinct",
-    "moses",
-    "playhouses",
-    "hammarskjold's",
-    "gore's",
-    "walitzee",
-    "disposed",
-    "sochi",
-    "premise",
-    "patsy",
-    "tranquility",
-    "procreativity",
-    "leave",
-    "trampled",
-    "provincetown",
-    "hinckley",
-    "burmese",
-    "asocial",
-    "sentimentalists",
-    "habsburg",
-    "timing",
-    "urbano",
-    "aggravate",
-    "roylott's",
-    "waist-length",
-    "slums",
-    "exhortations",
-    "leitmotiv",
-    "shamed",
-    "divertimento",
-    "coltsman",
-    "analyzer",
-    "shadings",
-    "depravities",
-    "fosdick",
-    "phosphor",
-    "hord",
-    "jurisprudentially",
-    "ran",
-    "crudely",
-    "car's",
-    "rensselaerwyck",
-    "vaudeville",
-    "sonatas",
-    "1746",
-    "bede",
-    "thant",
-    "flown",
-    "enright's",
-    "malmesbury",
-    "mixer",
-    "obituaries",
-    "inflection",
-    "clockwork",
-    "kindled",
-    "immovable",
-    "harbors",
-    "shrilly",
-    "hedged",
-    "follower",
-    "considers",
-    "trichrome",
-    "710",
-    "600-yard",
-    "gladdy",
-    "reshapes",
-    "non-violence",
-    "cultivates",
-    "trucker",
-    "cheering",
-    "protectorate",
-    "shylockian",
-    "reapportionment",
-    "fascination",
-    "townsmen",
-    "one-arm",
-    "standeth",
-    "histories",
-    "todd",
-    "5-1",
-    "3rd",
-    "jock",
-    "definition",
-    "parapsychology",
-    "mazowsze",
-    "registered",
-    "withdraw",
-    "minerva",
-    "byzas",
-    "boulder",
-    "wright",
-    "mexicans",
-    "degree",
-    "phosphates",
-    "inclined",
-    "voltaire",
-    "tug-o'-war",
-    "paraphrase",
-    "yeah",
-    "wholes",
-    "flip",
-    "geraghty",
-    "lumia",
-    "sandalwood",
-    "lain",
-    "drastically",
-    "allocate",
-    "trusteth",
-    "diffrunce",
-    "one-fifth",
-    "extras",
-    "flint",
-    "faded",
-    "185th",
-    "prohibitive",
-    "rodney-miss",
-    "self-rule",
-    "arranged",
-    "ti",
-    "teardrop",
-    "transients",
-    "craftsman",
-    "blue-uniformed",
-    "scriptures",
-    "improvising",
-    "myriad",
-    "renoir",
-    "thawing",
-    "moslems",
-    "persisted",
-    "godunov",
-    "inert",
-    "236",
-    "bisque",
-    "muncipal",
-    "owen",
-    "banishes",
-    "streamliner",
-    "idiot's",
-    "hero's",
-    "waking",
-    "wistful",
-    "founder-originator",
-    "beguile",
-    "hearsay",
-    "disdainful",
-    "westminster",
-    "interpeople",
-    "maid's",
-    "1928-29",
-    "harrassment",
-    "anion",
-    "$45",
-    "tauntingly",
-    "sonic",
-    "lone",
-    "negroid",
-    "cars",
-    "300",
-    "nevada",
-    "scarlet",
-    "funeral",
-    "santa",
-    "counter-drill",
-    "kingdom",
-    "hoste",
-    "ablated",
-    "mon-khmer",
-    "ornamentation",
-    "dower",
-    "proxmire",
-    "sine",
-    "sprung",
-    "out-of-mind",
-    "subversion",
-    "complimented",
-    "co-operation",
-    "refueling",
-    "pre-school",
-    "laughingly",
-    "countrey",
-    "jocular",
-    "barco",
-    "42d",
-    "skippers",
-    "desired",
-    "instancy",
-    "tagging",
-    "who",
-    "221-207",
-    "cotman",
-    "chousin'",
-    "en-lai's",
-    "wallowed",
-    "slash-mouthed",
-    "name",
-    "f-plane",
-    "creak",
-    "loadings",
-    "mckinley",
-    "de-iodinase",
-    "1667.36",
-    "5.4",
-    "hondo",
-    "twinkle",
-    "badly-needed",
-    "rear-guard",
-    "naked",
-    "corporeality",
-    "envision",
-    "unwise",
-    "constellation's",
-    "crofters",
-    "irrigation",
-    "caressed",
-    "nowadays",
-    "sind",
-    "voulez",
-    "gangling",
-    "infidels",
-    "segal's",
-    "eclipses",
-    "stuffing",
-    "coup-proof",
-    "nennius",
-    "carabao",
-    "lymph",
-    "longfellow",
-    "unfixed",
-    "gunslinger",
-    "profit-motivated",
-    "flagellation",
-    "laminating",
-    "dream-lusty",
-    "nuf",
-    "tumbles",
-    "dinsmore",
-    "foamed-in-place",
-    "deductibles",
-    "longstanding",
-    "teetering",
-    "connecticut's",
-    "overpriced",
-    "audubon",
-    "scrapped",
-    "medieval",
-    "effect",
-    "donato",
-    "provdied",
-    "concocted",
-    "brook",
-    "self-insurance",
-    "hefty",
-    "regiments",
-    "hold-back",
-    "starch",
-    "clove",
-    "resonance",
-    "cooks",
-    "mural",
-    "brainards",
-    "snatched",
-    "conclusion",
-    "severally",
-    "northeners",
-    "unenviable",
-    "phrased",
-    "quintets",
-    "toothbrush",
-    "chubby",
-    "ich",
-    "eagle",
-    "rightness",
-    "leave-taking",
-    "durwood",
-    "art-shop",
-    "pumpkin",
-    "plan",
-    "orleans",
-    "a5",
-    "threading",
-    "livelihood",
-    "fickle",
-    "valor",
-    "full-blown",
-    "bobbing",
-    "g.",
-    "disadvantages",
-    "is",
-    "prides",
-    "christianity",
-    "stardom",
-    "corresponding",
-    "takeover",
-    "effaces",
-    "curricula",
-    "pets",
-    "eyed",
-    "mexico's",
-    "feebly",
-    "soft-headed",
-    "bracken",
-    "filmdom",
-    "hairshirt",
-    "harlan-marcia",
-    "killin'",
-    "fine-point",
-    "destitute",
-    "kiang",
-    "fragmentarily",
-    "yedisan",
-    "revolting",
-    "nate's",
-    "scouts",
-    "gait",
-    "discolors",
-    "number",
-    "206",
-    "mobcaps",
-    "nicholson",
-    "cables",
-    "squealed",
-    "experiential",
-    "lace-drawn",
-    "larkin",
-    "lark",
-    "nufs",
-    "ravencroft",
-    "packers",
-    "turkeys",
-    "pertain",
-    "wobble",
-    "lumber",
-    "cemented",
-    "clutch",
-    "ohio",
-    "chased",
-    "defends",
-    "circus",
-    "six-thirty",
-    "lefty",
-    "conscript",
-    "ye're",
-    "chiggers",
-    "haase",
-    "1602",
-    "brasstown",
-    "dispelled",
-    "ordained",
-    "blacksmith",
-    "slugs",
-    "someone'll",
-    "plains",
-    "infinitesimal",
-    "transcended",
-    "gershwins",
-    "rebuilt",
-    "redundant",
-    "heilman",
-    "bade",
-    "misnamed",
-    "octahedron",
-    "uncontrollable",
-    "wiles",
-    "warlike",
-    "jew-as-enemy",
-    "terrorized",
-    "blocked",
-    "ledger",
-    "nightdress",
-    "ethnic",
-    "ideals",
-    "reined",
-    "prophetic",
-    "falters",
-    "birthcontrol",
-    "outlay",
-    "street's",
-    "birdwhistell",
-    "clocks",
-    "messages",
-    "congo's",
-    "re-introduction",
-    "corne",
-    "sweepstakes",
-    "radiates",
-    "inhuman",
-    "dadaism",
-    "persisting",
-    "clutching",
-    "acoustically",
-    "top-priority",
-    "austin",
-    "5-4",
-    "enviably",
-    "persuade",
-    "old",
-    "13-8",
-    "indulge",
-    "molds",
-    "conveniences",
-    "irresponsible",
-    "gripping",
-    "forster's",
-    "dagers",
-    "non-resistants",
-    "orienting",
-    "administer",
-    "proverbs",
-    "imagery",
-    "remarkably",
-    "next-door",
-    "inherit",
-    "hip-pocket",
-    "assertive",
-    "rector",
-    "hormone",
-    "peach",
-    "treat",
-    "violin",
-    "showdown",
-    "hovdingar",
-    "eckenfelder",
-    "drab-haired",
-    "anticipation",
-    "one-time",
-    "mennonite",
-    "cooking",
-    "removes",
-    "best-tempered",
-    "incumbents",
-    "81,000",
-    "sidewalk",
-    "garbage",
-    "honeymooners",
-    "hobbes",
-    "black-body",
-    "fanned",
-    "170",
-    "had",
-    "2,200,000",
-    "3-3/4''",
-    "aim",
-    "airily",
-    "endogamous",
-    "tax-free",
-    "extensive",
-    "hallmark",
-    "medals",
-    "piddling",
-    "sizeable",
-    "80's",
-    "softness",
-    "hinduism",
-    "blips",
-    "heredity",
-    "sulfaquinoxaline",
-    "bolingbroke's",
-    "jumpy",
-    "coerce",
-    "rig",
-    "poaches",
-    "folks'",
-    "heavy-handed",
-    "secondarily",
-    "57",
-    "c.c.b.",
-    "parlance",
-    "marsh's",
-    "smiled",
-    "solicited",
-    "flood",
-    "guardia",
-    "monel",
-    "w.m.",
-    "communisn",
-    "badrawi",
-    "pap",
-    "conveyance",
-    "buzz",
-    "knott",
-    "presses",
-    "behaving",
-    "hrothgar",
-    "zhok",
-    "primly",
-    "surrealist",
-    "delegated",
-    "harlem's",
-    "pynte",
-    "servile",
-    "bacterial",
-    "satire",
-    "pullman",
-    "solidarity",
-    "gerome",
-    "agrippa",
-    "hectic",
-    "shenanigans",
-    "attentively",
-    "hallways",
-    "distribution",
-    "uneducated",
-    "pigskin",
-    "liberal-led",
-    "hound",
-    "disposal",
-    "converge",
-    "co-ordinator",
-    "waver",
-    "individual",
-    "bucharest",
-    "hee",
-    "infections",
-    "theorize",
-    "aphrodite",
-    "hitting",
-    "o-b",
-    "ireland",
-    "shrewdly",
-    "foreigner",
-    "slim-waisted",
-    "loomed",
-    "sidle",
-    "tai",
-    "bubbly",
-    "vamp",
-    "incomparable",
-    "lizzie's",
-    "reconciles",
-    "two-by-four",
-    "poeple's",
-    "basileis",
-    "engineering",
-    "cubbyhole",
-    "lengthy",
-    "colorin'",
-    "disassembly",
-    "korngold",
-    "1579",
-    "civil",
-    "judged",
-    "strings",
-    "bryn",
-    "coca-cola",
-    "lazzeri",
-    "sweepings",
-    "bright",
-    "duren",
-    "tappets",
-    "pulaski",
-    "liquor",
-    "resource",
-    "banquet",
-    "straw-hat",
-    "equivalent-choice",
-    "king's",
-    "furhmann's",
-    "desuetude",
-    "without",
-    "curds",
-    "lock",
-    "spectra",
-    "editions",
-    "1215",
-    "bullet-riddled",
-    "350th",
-    "25-30",
-    "rake",
-    "grandfathers",
-    "pretender",
-    "singer's",
-    "flinching",
-    "arrogate",
-    "markings",
-    "assailing",
-    "protestations",
-    "gastrointestinal",
-    "compulsive",
-    "autistic",
-    "pinochle",
-    "draftee",
-    "bedground",
-    "corkers",
-    "sensor",
-    "wonder",
-    "lauritsen",
-    "dearie",
-    "lovers'",
-    "situs",
-    "cumulative",
-    "minimum",
-    "cafeterias",
-    "sobs",
-    "robertson",
-    "strung",
-    "skewer",
-    "unruffled",
-    "selfless",
-    "outlawed",
-    "1-1/2",
-    "landmark",
-    "137",
-    "lifting",
-    "soviet-western",
-    "rioted",
-    "vientiane",
-    "mercenaries",
-    "seen",
-    "till",
-    "acceptance",
-    "turne",
-    "unmotivated",
-    "subtitled",
-    "17.3",
-    "accommodates",
-    "blunt",
-    "outfielder",
-    "serum",
-    "askance",
-    "tv",
-    "becalmed",
-    "objectives",
-    "kikuyu",
-    "pre-vision",
-    "porterhouse",
-    "louisianan",
-    "bultmann's",
-    "amt",
-    "piedmont",
-    "saddened",
-    "got",
-    "ellis",
-    "moscow's",
-    "offend",
-    "extenuating",
-    "buying",
-    "nestling",
-    "crewmen",
-    "idler",
-    "dohnanyi",
-    "displays",
-    "25,000-man",
-    "sawed-off",
-    "scant",
-    "two-tail",
-    "hugged",
-    "lucifer's",
-    "altar",
-    "3.03",
-    "capers",
-    "heady",
-    "utility-cost",
-    "stallings",
-    "propped",
-    "exclaim",
-    "eighty-year-old",
-    "coated",
-    "bacon",
-    "eta",
-    "porous",
-    "splinters",
-    "dizzily",
-    "contrasting",
-    "cheyennes",
-    "preflight",
-    "falegnami",
-    "catharsis",
-    "reaffirmed",
-    "enriched",
-    "irresolute",
-    "overburdened",
-    "quickened",
-    "desire",
-    "lieutenant-governor",
-    "circumspect",
-    "deserved",
-    "self-contained",
-    "ruinous",
-    "0.3m",
-    "dullest",
-    "miller",
-    "lesson",
-    "evaluate",
-    "won",
-    "solidity",
-    "committing",
-    "submarines",
-    "agglutinins",
-    "attacking",
-    "birgit",
-    "symbolists",
-    "partakes",
-    "distraction",
-    "ceilings",
-    "encumbrances",
-    "dashed",
-    "exemptions",
-    "validity",
-    "gavottes",
-    "binder",
-    "tolstoy's",
-    "parody",
-    "dodgers",
-    "rooted",
-    "pangs",
-    "spat",
-    "1952",
-    "heavily",
-    "forage",
-    "quantum",
-    "bowman",
-    "him",
-    "leavin",
-    "bromides",
-    "pasture",
-    "madly",
-    "reserves",
-    "seamen",
-    "cantles",
-    "fireside",
-    "breakage",
-    "flaming",
-    "object",
-    "hottest",
-    "portions",
-    "delight",
-    "woolen",
-    "sanhedrin",
-    "creature",
-    "bottineau",
-    "oval",
-    "trapped",
-    "weaves",
-    "highball",
-    "miranda",
-    "bedsprings",
-    "pray",
-    "offutt",
-    "quasimodo",
-    "translucency",
-    "beauclerk",
-    "fulfills",
-    "contemptuous",
-    "60",
-    "646",
-    "aloft",
-    "illusion",
-    "462",
-    "prewar",
-    "allowable",
-    "dorado",
-    "loomis",
-    "muddleheaded",
-    "emmanuel",
-    "benefited",
-    "mises",
-    "yugoslavia",
-    "trimming",
-    "pierpont",
-    "halides",
-    "shut",
-    "mahler",
-    "fritz",
-    "produce",
-    "pounded",
-    "concerts",
-    "uncousinly",
-    "reserpine",
-    "sudden-end",
-    "basements",
-    "langsdorf",
-    "frail",
-    "remained",
-    "stake",
-    "copiously",
-    "hultberg",
-    "chi-chi",
-    "boycotted",
-    "attach",
-    "ending",
-    "asymptotically",
-    "silhouetted",
-    "disperse",
-    "doubtingly",
-    "portico",
-    "fermentations",
-    "lear",
-    "jonquieres",
-    "puzzles",
-    "routinely",
-    "feedings",
-    "wondering",
-    "grata",
-    "resisting",
-    "cesium-137",
-    "outfielders",
-    "concession",
-    "redistricting",
-    "sloop",
-    "speared",
-    "soirees",
-    "endogamy",
-    "homes",
-    "co-author",
-    "arigato",
-    "92",
-    "39,000",
-    "mercurial",
-    "buttons",
-    "misbehavior",
-    "gurion",
-    "woodruff's",
-    "griffin",
-    "overcomes",
-    "housekeeping",
-    "snapping",
-    "starlet",
-    "dilution",
-    "violinist",
-    "associates",
-    "anti-nazi",
-    "naive",
-    "curriculum",
-    "gloss",
-    "gaudy",
-    "corrupted",
-    "hopelessness",
-    "adequate",
-    "targets",
-    "barrels",
-    "facet",
-    "alley",
-    "turtles",
-    "raymont",
-    "pmr",
-    "oracles",
-    "mv",
-    "reclaim",
-    "novice",
-    "laramie",
-    "inexact",
-    "tempt",
-    "posts",
-    "proportional",
-    "refreshment",
-    "gusty",
-    "cap'n",
-    "seaports",
-    "incorruptible",
-    "intrusion",
-    "safekeeping",
-    "gunfighter",
-    "ballistic",
-    "anybody'd",
-    "ally",
-    "drib-drool",
-    "spirits",
-    "omega",
-    "do-it-yourself",
-    "yrs.",
-    "mallory",
-    "fundamentally",
-    "george's",
-    "opaque",
-    "dividends",
-    "abilities",
-    "solstice",
-    "travel",
-    "165",
-    "skirting",
-    "pitched",
-    "cubist",
-    "camps",
-    "snubbing",
-    "disinterred",
-    "peasant",
-    "columnist",
-    "peiping",
-    "instalments",
-    "pedestrians",
-    "postage-prepaid",
-    "censured",
-    "city-owned",
-    "pillared",
-    "rascal",
-    "monastery",
-    "amid",
-    "paternally",
-    "loosens",
-    "sinewy",
-    "prettiest",
-    "lobar",
-    "ervin",
-    "wesley's",
-    "evolve",
-    "suitcase",
-    "hidden",
-    "cooch",
-    "proselytizing",
-    "troy",
-    "solemnly",
-    "nob",
-    "arata",
-    "105-degrees",
-    "embassy",
-    "epicyclical",
-    "pedals",
-    "jocularly",
-    "agonizing",
-    "ebullient",
-    "fn",
-    "unlocking",
-    "las",
-    "byzantine",
-    "prepayment",
-    "cows",
-    "rock'n'roll",
-    "beef-fat",
-    "girl-friend",
-    "loosest",
-    "white-topped",
-    "engine",
-    "combatant",
-    "embroidered",
-    "southampton",
-    "dessert",
-    "wellesley",
-    "meanings",
-    "item",
-    "obscenities",
-    "poly-unsaturated",
-    "suspected",
-    "kissin'",
-    "imperfect",
-    "dresser",
-    "y.m.h.a.",
-    "nonsingular",
-    "displeasure",
-    "patil",
-    "bricklayers",
-    "black-balled",
-    "dockside",
-    "round",
-    "365",
-    "sidelight",
-    "countriman",
-    "householder",
-    "thermocouples",
-    "12-passenger",
-    "glacier",
-    "improvisations",
-    "epicure",
-    "760",
-    "overemphasized",
-    "side's",
-    "respectively",
-    "ceased",
-    "yellowing",
-    "tabulate",
-    "scenics",
-    "decided",
-    "habit",
-    "conversely",
-    "luncheon",
-    "crashed",
-    "outfox",
-    "boatmen",
-    "thirteenth-century",
-    "reopening",
-    "opportunity",
-    "hurley",
-    "flicker",
-    "aquam",
-    "sparrow-size",
-    "crombie",
-    "waggin",
-    "six",
-    "tudor-style",
-    "lappenburg-kemble",
-    "tracings",
-    "jannequin's",
-    "fascio-communist",
-    "capped",
-    "2:30-:33.2",
-    "terraces",
-    "kepler",
-    "tepees",
-    "nicest",
-    "garner",
-    "supported",
-    "cheat",
-    "prevaile",
-    "estimation",
-    "tadpoles",
-    "weaponry",
-    "ruptured",
-    "della",
-    "strictures",
-    "route",
-    "unauthentic",
-    "appendix",
-    "mg/lbod",
-    "flared",
-    "ministers",
-    "imbecile",
-    "ensure",
-    "geocentricism",
-    "petit",
-    "compassionate",
-    "homing",
-    "blackened",
-    "upsets",
-    "shuttered",
-    "carted",
-    "nepal",
-    "imperturbable",
-    "predominating",
-    "divergence",
-    "place-names",
-    "hemosiderin",
-    "fide",
-    "unlocks",
-    "napoleon",
-    "handful",
-    "ignoramus",
-    "marin",
-    "cassiopeia",
-    "iuvabit",
-    "greeting",
-    "theologian-philosophers",
-    "murderer's",
-    "askington",
-    "anaprapath",
-    "keyboard",
-    "116",
-    "overcerebral",
-    "armide",
-    "epicurean",
-    "roberts'",
-    "stone",
-    "mexico",
-    "mass-distribution",
-    "pablo",
-    "appropriateness",
-    "skirmishing",
-    "chatter",
-    "clyde",
-    "enslaved",
-    "metal",
-    "actinometer",
-    "heat-absorbing",
-    "thinkin",
-    "by-pass",
-    "understandably",
-    "exertion",
-    "sulfur",
-    "jacky",
-    "60-80",
-    "honest-to-betsy",
-    "gallows",
-    "dilatation",
-    "time-span",
-    "hobbing",
-    "methodological",
-    "deadlines",
-    "strayed",
-    "coughlin's",
-    "yields",
-    "christy",
-    "debts",
-    "revenue",
-    "connecticut",
-    "oceans",
-    "moonan",
-    "blumberg",
-    "unfelt",
-    "lassus",
-    "tenuous",
-    "gardner",
-    "revelatory",
-    "pumped-up",
-    "notions",
-    "protocol",
-    "73",
-    "neo-classicists",
-    "decreases",
-    "deprecatory",
-    "colmer's",
-    "protestant",
-    "czarship",
-    "2500",
-    "meal-to-meal",
-    "3.190",
-    "twenty-second",
-    "integer",
-    "dixiecrats",
-    "chion",
-    "runes",
-    "crops",
-    "manual",
-    "envelope",
-    "unspecified",
-    "decimals",
-    "terrorizing",
-    "axiomatic",
-    "footballer's",
-    "collided",
-    "$9",
-    "footing",
-    "compare",
-    "discharging",
-    "avidity",
-    "tucker's",
-    "incorporated",
-    "udall's",
-    "droop",
-    "512",
-    "goggles",
-    "easter",
-    "represented",
-    "assailed",
-    "sachems",
-    "slave",
-    "crackers",
-    "6-7",
-    "bargain",
-    "prefer",
-    "cupful",
-    "berlin",
-    "drier",
-    "treatise",
-    "palsy",
-    "etched",
-    "consented",
-    "coveting",
-    "tapes",
-    "anhydrous",
-    "hinted",
-    "confrontations",
-    "ranyard",
-    "wretchedness",
-    "endeavour",
-    "torpid",
-    "getz",
-    "-ism",
-    "curt",
-    "kick-offs",
-    "attachments",
-    "host-specific",
-    "glennon",
-    "regulator",
-    "ravines",
-    "snippy",
-    "functionary",
-    "county",
-    "yyyy",
-    "bratwurst",
-    "massaging",
-    "anthony",
-    "understandable",
-    "blisters",
-    "wicker",
-    "knot-tying",
-    "spleen-crushing",
-    "long-hair",
-    "examines",
-    "interpretation",
-    "re-enacting",
-    "elegance",
-    "unglamorous",
-    "homogenate",
-    "standing",
-    "peed",
-    "suggestion",
-    "garrulous",
-    "kemm",
-    "odds-on",
-    "georgia",
-    "telescopes",
-    "battlefield",
-    "finders",
-    "exterminate",
-    "godliness",
-    "m-4",
-    "blurred",
-    "scandalizing",
-    "electronic",
-    "sweaters",
-    "sounding",
-    "nichols",
-    "five-year",
-    "mulligan's",
-    "orthodontist's",
-    "didi",
-    "pro-u.n.f.p.",
-    "pectoral-front",
-    "swollen",
-    "unlaundered",
-    "sleek-headed",
-    "intersecting",
-    "build-up",
-    "romano",
-    "foreigners",
-    "lengthened",
-    "solidifies",
-    "onus",
-    "cocked",
-    "proprietorships",
-    "between",
-    "hatchet-faced",
-    "won't",
-    "states'",
-    "digest",
-    "job-",
-    "factories",
-    "recent",
-    "oozed",
-    "resisted",
-    "nat",
-    "lullaby",
-    "sunday-school",
-    "renderings",
-    "hilarity",
-    "mclemore",
-    "joaquin",
-    "corrected",
-    "oneida",
-    "34220",
-    "brownapopolus",
-    "holstered",
-    "resurrecting",
-    "mackinaw",
-    "soles",
-    "wednesday's",
-    "question-and-answer",
-    "pursuing",
-    "pub",
-    "stables",
-    "cognate",
-    "masterpieces",
-    "positivism",
-    "exclaimed",
-    "engagement",
-    "divorced",
-    "retching",
-    "self-deluded",
-    "ridge",
-    "greenly",
-    "launching",
-    "imperative",
-    "preschool",
-    "fewer",
-    "numeral",
-    "lefthander",
-    "suburban",
-    "wildenstein",
-    "ancestor",
-    "meditative",
-    "shifting",
-    "indicted",
-    "booty",
-    "p.",
-    "run/chamber",
-    "1884",
-    "kiz",
-    "accumulate",
-    "magnetism",
-    "kaster's",
-    "sophocles",
-    "instruction",
-    "bench",
-    "serenely",
-    "shim",
-    "undetermined",
-    "finances",
-    "chances",
-    "graduates",
-    "steinbeck's",
-    "flannagan",
-    "schaeffer",
-    "small-arms",
-    "sharpe",
-    "foxholes",
-    "over-simplification",
-    "dodd",
-    "mcgehee",
-    "interpenetrates",
-    "ccc",
-    "grudge",
-    "fenugreek",
-    "infamous",
-    "democratic-sponsored",
-    "p'",
-    "coolidge",
-    "lays",
-    "liberating",
-    "planning",
-    "summation",
-    "extract",
-    "boat's",
-    "rosettes",
-    "organisms",
-    "clanking",
-    "dissenting",
-    "tourist",
-    "coventry",
-    "underdog",
-    "breast",
-    "picture-images",
-    "guideposts",
-    "crosby's",
-    "contender",
-    "dishwashers",
-    "repose",
-    "heather",
-    "ligands",
-    "all-something-or-the-other",
-    "urbana",
-    "terminal",
-    "gisele",
-    "frescos",
-    "epicurus",
-    "hinges",
-    "barbudos",
-    "sheer",
-    "axe",
-    "besiege",
-    "defective",
-    "ehlers",
-    "bottomless",
-    "gastronomy",
-    "carbohydrate",
-    "christmas",
-    "slapstick",
-    "andrus",
-    "marsden",
-    "wailing",
-    "damaged",
-    "hungary-suez",
-    "ball",
-    "wind-and-water",
-    "writs",
-    "offersey",
-    "boy's",
-    "cost-billing",
-    "ever-existent",
-    "impersonalized",
-    "standard-weight",
-    "astounded",
-    "jaguar",
-    "reading-rooms",
-    "beady",
-    "brightly",
-    "alchemy",
-    "shortstop",
-    "gaskets",
-    "soloist",
-    "self-criticism",
-    "strategically",
-    "looted",
-    "fictional",
-    "4-",
-    "paratroopers",
-    "yogi",
-    "morgenthau",
-    "fay",
-    "reiterates",
-    "crest",
-    "verges",
-    "philippi",
-    "pheasant",
-    "propositions",
-    "bile",
-    "seismograph",
-    "upswing",
-    "dispatching",
-    "peaky",
-    "overnight",
-    "acknowledged",
-    "seller",
-    "midge",
-    "2-56",
-    "swao",
-    "trudged",
-    "605",
-    "straightened",
-    "honestly",
-    "peeling",
-    "valuable",
-    "hostilities",
-    "expertise",
-    "scapegoat",
-    "t-tau",
-    "walkover",
-    "ku",
-    "feature",
-    "gala",
-    "family-welfare",
-    "boot",
-    "intentions",
-    "pinched",
-    "proteolysis",
-    "incompatibility",
-    "lockheed's",
-    "relatively",
-    "firearms",
-    "supernormal",
-    "packaged",
-    "emphasizes",
-    "drowning",
-    "back",
-    "incentives",
-    "high-voltage",
-    "trout",
-    "month-long",
-    "economies",
-    "company",
-    "bullfinch",
-    "dunbar",
-    "obtaine",
-    "peters",
-    "citing",
-    "sunlight",
-    "speeding",
-    "hole",
-    "devotional",
-    "vachell",
-    "step-cone",
-    "$17",
-    "3646",
-    "treadwell",
-    "1834",
-    "scout",
-    "labor's",
-    "tassels",
-    "forever",
-    "poughkeepsie",
-    "deplorable",
-    "leo",
-    "jazzmen",
-    "hacking",
-    "dictating",
-    "recommending",
-    "camera",
-    "aerosolized",
-    "molded",
-    "camera's",
-    "approval",
-    "cody",
-    "rapport",
-    "packet",
-    "soba",
-    "cantonese",
-    "orthodontic",
-    "universities",
-    "scots",
-    "anson",
-    "gas-glass",
-    "crooned",
-    "vise",
-    "grandmothers'",
-    "dienbienphu",
-    "lapel",
-    "premium",
-    "indomitable",
-    "now-historic",
-    "curtain-raiser",
-    "bankruptcy",
-    "sea-food",
-    "crises",
-    "vecchio",
-    "practicability",
-    "cancer-ridden",
-    "featured",
-    "concord",
-    "baffled",
-    "doubting",
-    "set's",
-    "fling",
-    "director's",
-    "redbirds",
-    "sweating",
-    "nunes",
-    "1,343",
-    "dodge's",
-    "undedicated",
-    "witty",
-    "unproved",
-    "3/16''",
-    "striven",
-    "!",
-    "neurenschatz",
-    "befuddles",
-    "democratique",
-    "braddock-against-the-indians",
-    "big-large",
-    "crushing",
-    "fall-in",
-    "$4/mbf",
-    "stringing",
-    "1925",
-    "constrained",
-    "venomous",
-    "daunt",
-    "prejudged",
-    "underwear",
-    "spine-chilling",
-    "dud",
-    "thumping",
-    "diabolical",
-    "plunkers",
-    "eroded",
-    "25-foot",
-    "rafael",
-    "slopping",
-    "museum",
-    "me",
-    "superfluous",
-    "forward",
-    "arm-elevation",
-    "expectedly",
-    "fat-soluble",
-    "harvesting",
-    "horrors",
-    "housebroken",
-    "entering",
-    "leans",
-    "pretrial",
-    "mincing",
-    "flares",
-    "aerate",
-    "viscount",
-    "function",
-    "examinin'",
-    "torpedo",
-    "rollie",
-    "chrysler's",
-    "mines",
-    "din",
-    "vivacious",
-    "paget",
-    "defray",
-    "nigh",
-    "overhauling",
-    "outdoor",
-    "cut-and-dried",
-    "teacher",
-    "percentage",
-    "sweet-smelling",
-    "strains",
-    "pastilles",
-    "chatham",
-    "ponies",
-    "rail-mobile",
-    "slovenly",
-    "location",
-    "harlem",
-    "wwrl",
-    "well-administered",
-    "acetonemia",
-    "envy",
-    "munoz",
-    "delicacy",
-    "scions",
-    "beheading",
-    "virile",
-    "irritably",
-    "giants",
-    "reappeared",
-    "fetid",
-    "laura",
-    "finalists",
-    "professor's",
-    "slaughtered",
-    "notwithstanding",
-    "totted",
-    "centering",
-    "evaluating",
-    "berman's",
-    "wyn",
-    "fulke",
-    "close",
-    "kezziah",
-    "proxy",
-    "shouldda",
-    "corn",
-    "customarily",
-    "brahmaputra",
-    "anxiously",
-    "handspikes",
-    "resurgence",
-    "twenty-four",
-    "treasury",
-    "blood-soaked",
-    "lied",
-    "bathyrans",
-    "nightclub's",
-    "take-up",
-    "1920s",
-    "baleful",
-    "terror-stricken",
-    "unavoidably",
-    "no-cal",
-    "interrelationship",
-    "hawks",
-    "hand-covered",
-    "referee",
-    "wail",
-    "churchillian",
-    "pert",
-    "basie",
-    "arabian",
-    "colored",
-    "inhibited",
-    "soprano",
-    "profit-sharing",
-    "dwarfs",
-    "greylag",
-    "lavender",
-    "warning",
-    "ferromagnetic",
-    "sledding",
-    "inborn",
-    "i.b.m.",
-    "planet's",
-    "aconte",
-    "slug",
-    "physicist",
-    "transverse",
-    "searing",
-    "razorback",
-    "abhorrent",
-    "george-barden",
-    "institutionalization",
-    "stopping",
-    "red-tailed",
-    "nicklaus",
-    "grand-daughter",
-    "machine-masters",
-    "groggy",
-    "alveolus",
-    "hanover",
-    "sleep-wakefulness",
-    "marinated",
-    "semi-public",
-    "casting",
-    "interval",
-    "hospice",
-    "moscow-allied",
-    "secondary",
-    "lithe",
-    "prevalent",
-    "necklace",
-    "readily",
-    "undifferentiated",
-    "diodati",
-    "season",
-    "rousing",
-    "trimble",
-    "productivity",
-    "waterway",
-    "tilghman's",
-    "plainclothes",
-    "undrinkable",
-    "radar-type",
-    "directrices",
-    "apt",
-    "kidneys",
-    "recreation",
-    "rheum",
-    "disgust",
-    "open-flame",
-    "saying",
-    "tremendously",
-    "fortunately",
-    "369",
-    "cheekbones",
-    "overcoats",
-    "undefined",
-    "all-night",
-    "tooth-paste",
-    "material's",
-    "hoosier",
-    "shatterproof",
-    "blatant",
-    "whipple",
-    "reddish",
-    "strickland",
-    "schiele's",
-    "non-identity",
-    "cell-free",
-    "crowned",
-    "oranges",
-    "worshipped",
-    "supplanted",
-    "snakestrike",
-    "marietta",
-    "chiefs",
-    "gilroy",
-    "orate",
-    "educations",
-    "whaling",
-    "beeps",
-    "plant-location",
-    "paleoexplosion",
-    "delicately-textured",
-    "serif",
-    "theare",
-    "niebuhr",
-    "not-a",
-    "myers",
-    "63-64",
-    "evasive",
-    "$15,000",
-    "ga",
-    "mechanized",
-    "sediments",
-    "sunder",
-    "worthlessness",
-    "serpentine",
-    "2/c",
-    "quicksilver",
-    "1901",
-    "confessionals",
-    "waxy",
-    "cutting",
-    "what's",
-    "procrastinate",
-    "reexamine",
-    "reviews",
-    "jacoby",
-    "infantryman",
-    "embouchure",
-    "1950-1953",
-    "stravinsky",
-    "bonding",
-    "blindfolded",
-    "algebraic",
-    "natch",
-    "hwa-shan",
-    "haberdashery",
-    "microwaves",
-    "incompetence",
-    "seep",
-    "unequal",
-    "refinement",
-    "appendixes",
-    "insubordination",
-    "overpressure",
-    "maiestie",
-    "underway",
-    "paralinguistic",
-    "manufactured",
-    "person's",
-    "saltonstall",
-    "certainly",
-    "vince",
-    "well-nigh",
-    "catalyst",
-    "acceded",
-    "trample",
-    "cooperatives",
-    "joiners",
-    "shipments",
-    "springs",
-    "greet",
-    "living-room",
-    "admonishing",
-    "tongue-tied",
-    "national",
-    "taxi-ways",
-    "campers",
-    "sidney",
-    "joanne",
-    "copp",
-    "aftermath",
-    "profili",
-    "emperor",
-    "paced",
-    "reuniting",
-    "uncoiling",
-    "wadded",
-    "missy",
-    "davis",
-    "awe",
-    "imponderable",
-    "stiletto",
-    "overdriving",
-    "discount",
-    "needle",
-    "peltry",
-    "forbes's",
-    "half-drunk",
-    "reverberations",
-    "music-hall",
-    "fluff",
-    "pulsed",
-    "idolize",
-    "embodying",
-    "arcades",
-    "takin",
-    "survive",
-    "jinx",
-    "evadna",
-    "rolls-royces",
-    "catalysts",
-    "objectively",
-    "unwittingly",
-    "linebackers",
-    "mechanisms",
-    "wesson",
-    "$5.4",
-    "teatro",
-    "bandwagon",
-    "roadhouse",
-    "birmingham",
-    "wearied",
-    "thyrotrophic",
-    "implement",
-    "reyes",
-    "earl",
-    "remotely",
-    "cue-phrase",
-    "treece",
-    "witter",
-    "reformulated",
-    "snowstorm",
-    "unclasping",
-    "diluted",
-    "tightening",
-    "$52,500",
-    "delray",
-    "allowed",
-    "mcroberts",
-    "indoor",
-    "carletonian",
-    "exposures",
-    "hiss",
-    "nikolais",
-    "four-o'clock",
-    "hock's",
-    "three-axis",
-    "liquor-crazed",
-    "questioner",
-    "edition",
-    "bakes",
-    "blushed",
-    "booklists",
-    "bitterly",
-    "germanic",
-    "directness",
-    "katharine",
-    "bumped",
-    "peden",
-    "explorers",
-    "henri's",
-    "mountain",
-    "manager",
-    "packard",
-    "suave",
-    "skyscraper",
-    "descendants",
-    "dramatical",
-    "haughty",
-    "saturdays",
-    "mythological",
-    "starlight",
-    "jesuit",
-    "outlanders",
-    "troughs",
-    "predominance",
-    "sun-suit",
-    "manuals",
-    "u",
-    "backwater",
-    "knackwurst",
-    "oil-well",
-    "silvio",
-    "explained",
-    "thugs",
-    "florentine",
-    "declared",
-    "juleps",
-    "catalog",
-    "sensitive-area",
-    "paradise",
-    "216",
-    "humiliating",
-    "subdivision",
-    "securing",
-    "ex-mrs.",
-    "dealerships",
-    "1872",
-    "obliteration",
-    "sobering",
-    "herpetologist",
-    "thrive",
-    "decisive",
-    "thyroxine-binding",
-    "regulars",
-    "tangent",
-    "poked",
-    "sick",
-    "un-american",
-    "brother",
-    "gratings",
-    "discrete",
-    "caliper",
-    "connie",
-    "orderings",
-    "fiction-writer's",
-    "stuart",
-    "ome",
-    "nuisance",
-    "implemented",
-    "bundy",
-    "itemization",
-    "madison",
-    "briefs",
-    "possum",
-    "southerners",
-    "mournful",
-    "stanton",
-    "cyclorama",
-    "motherland",
-    "whitened",
-    "neo-jazz",
-    "mcnair",
-    "drip",
-    "squire",
-    "monomers",
-    "sur",
-    "bismarck",
-    "income",
-    "breathing",
-    "kerr's",
-    "573",
-    "misplacing",
-    "tnt",
-    "monographs",
-    "partitions",
-    "terrier",
-    "reproducing",
-    "sorption",
-    "5-passenger",
-    "well-stuffed",
-    "straighten",
-    "different",
-    "riverboat",
-    "tilt-top",
-    "stirringly",
-    "imperceptible",
-    "epoch-making",
-    "perish",
-    "1851",
-    "marx's",
-    "poignant",
-    "feminist",
-    "taped",
-    "august",
-    "erudite",
-    "titanic",
-    "interpretor",
-    "lay-up",
-    "oratorical",
-    "belletch",
-    "endosperm",
-    "tissues",
-    "mouthed",
-    "sparse",
-    "anania",
-    "overhaul",
-    "coyote",
-    "dicendi",
-    "zemlya",
-    "simmonsville",
-    "polyelectrolytes",
-    "implied",
-    "skyway",
-    "affording",
-    "hexameter",
-    "numinous",
-    "unloads",
-    "lover's",
-    "gist",
-    "grouping",
-    "null",
-    "herring",
-    "monolithically",
-    "favoritism",
-    "slam",
-    "mid-flight",
-    "sabine",
-    "first-degree",
-    "nazis",
-    "zend-avesta",
-    "blond",
-    "double-meaning",
-    "morning-glory",
-    "mobs",
-    "married",
-    "$1020",
-    "airmail",
-    "kiloton",
-    "parisology",
-    "veneration",
-    "necktie",
-    "designing",
-    "disappear",
-    "continental",
-    "spearhead",
-    "constellations",
-    "prizes",
-    "relation",
-    "root",
-    "historic",
-    "obliterans",
-    "hilton",
-    "moodily",
-    "borrows",
-    "pummeled",
-    "six-month",
-    "tally",
-    "lisa",
-    "squashed",
-    "horsemanship",
-    "propagated",
-    "fairway",
-    "nicely",
-    "1-degree-c",
-    "properties",
-    "unsuccessfully",
-    "anglophobia",
-    "audition",
-    "disciplined",
-    "occasions",
-    "n'",
-    "burgess",
-    "cowhands",
-    "minot",
-    "indictments",
-    "demographiques",
-    "elephantine",
-    "pressure-cooker",
-    "heusen",
-    "drowsing",
-    "rapprochement",
-    "collage",
-    "lineup",
-    "milanoff",
-    "280-yard",
-    "independent",
-    "painstaking",
-    "advise",
-    "standstill",
-    "biconcave",
-    "low-water",
-    "priceless",
-    "equate",
-    "universalistic",
-    "large-enough",
-    "whether",
-    "melee",
-    "thoughtlessly",
-    "reinterpret",
-    "observes",
-    "reinstated",
-    "dabhumaksanigalu'ahai",
-    "story",
-    "instructs",
-    "ridgefield",
-    "fiery",
-    "outcomes",
-    "pocketbooks",
-    "prodigally",
-    "shine",
-    "sympathique",
-    "speech",
-    "invalidism",
-    "deaths",
-    "constituted",
-    "joined",
-    "sup",
-    "drawer",
-    "philippians",
-    "veterinarians",
-    "eisenhower",
-    "sorption-desorption",
-    "scanty",
-    "cipolla",
-    "quixote",
-    "monitor",
-    "caskets",
-    "pilgrimage",
-    "500's",
-    "self-government",
-    "domestically",
-    "122,158",
-    "slave-owners",
-    "novelists",
-    "grandfather-father-to-son",
-    "york-born",
-    "1806",
-    "curtis",
-    "taught",
-    "answerable",
-    "pension",
-    "forceful",
-    "wingman",
-    "newport's",
-    "signify",
-    "artery",
-    "cooperate",
-    "forty-six",
-    "throbbed",
-    "asynchrony",
-    "random-storage",
-    "sect",
-    "sunny",
-    "cheeks",
-    "preening",
-    "allegiances",
-    "po'k",
-    "gooey",
-    "wonderfully",
-    "11-7",
-    "beethoven's",
-    "thamnophis",
-    "finns",
-    "mercenary",
-    "1927",
-    "$10.1",
-    "paints",
-    "rotc",
-    "achievements",
-    "breakwaters",
-    "sun-baked",
-    "volksgeist",
-    "crunched",
-    "remembering",
-    "sleeping",
-    "eisler",
-    "multi-colored",
-    "attainment",
-    "atrociously",
-    "shelby",
-    "olden",
-    "chaps",
-    "displacement",
-    "lazybones",
-    "vernier",
-    "complex-valued",
-    "knowingly",
-    "flugel",
-    "overestimates",
-    "blood",
-    "kimono",
-    "anxieties",
-    "prodded",
-    "seduced",
-    "10-degrees-c",
-    "tappan",
-    "deterrence",
-    "liar",
-    "serenissimus",
-    "commuted",
-    "even-handed",
-    "4,122,354",
-    "plaintiff's",
-    "underpaid",
-    "rescue",
-    "praising",
-    "accords",
-    "steelers",
-    "muck",
-    "mudguard",
-    "astronomy",
-    "washizu",
-    "gaze",
-    "a-la-aristotle",
-    "nudes",
-    "cate's",
-    "fellers",
-    "greeks",
-    "parichy",
-    "chow",
-    "fadeout",
-    "lewisohn",
-    "chinese",
-    "desperation",
-    "flocks",
-    "bulged",
-    "sokolev",
-    "kajar",
-    "wakened",
-    "stennis",
-    "gauntlet",
-    "phosphors",
-    "co-operative",
-    "malevolence",
-    "splinter",
-    "kodama",
-    "22-1/2",
-    "unpaired",
-    "fog-enshrouded",
-    "hough",
-    "french-canadian",
-    "fjords",
-    "vieux",
-    "good-living",
-    "homicide",
-    "unalienable",
-    "florican-inverness",
-    "fee",
-    "barbed",
-    "voltaire's",
-    "dismounted",
-    "coral",
-    "reappearing",
-    "burden",
-    "wednesday",
-    "hookup",
-    "/l/",
-    "academic",
-    "piers",
-    "2731",
-    "shriek",
-    "careening",
-    "arlington",
-    "hex",
-    "felicity",
-    "restudy",
-    "refuses",
-    "interruptions",
-    "toe",
-    "beer-running",
-    "$128",
-    "alton",
-    "paganini",
-    "coupal",
-    "slopes",
-    "governmental",
-    "jorda's",
-    "dickey's",
-    "effectinge",
-    "jittery",
-    "1847",
-    "triservice",
-    "cloudburst",
-    "logistics",
-    "small-boat",
-    "cartoon",
-    "repayable",
-    "7,000",
-    "long-established",
-    "orso",
-    "litle",
-    "pantheon",
-    "jubal's",
-    "grade-constructed",
-    "finger-sucking",
-    "viewers",
-    "penicillin",
-    "ageless",
-    "thermometry",
-    "sophistication",
-    "formations",
-    "parings",
-    "sittings",
-    "mapped",
-    "finley",
-    "deposition",
-    "downtown",
-    "commutes",
-    "loft",
-    "drawing",
-    "interstellar",
-    "billowed",
-    "concealed",
-    "myne",
-    "spring-back",
-    "herald-examiner",
-    "specificity",
-    "verb",
-    "dumpty",
-    "beech",
-    "robby's",
-    "shredding",
-    "bespeak",
-    "horse-blanket",
-    "eromonga",
-    "seminary",
-    "thimble",
-    "restoration",
-    "mystique",
-    "parents",
-    "astride",
-    "20-mm",
-    "heel-lotus",
-    "gravestone",
-    "shea",
-    "groveling",
-    "grower",
-    "hewlett-woodmere",
-    "snuffboxes",
-    "li'l",
-    "thaxter",
-    "d.o.a.",
-    "concerted",
-    "11,744",
-    "revolutionized",
-    "casassa",
-    "prefecture",
-    "change",
-    "tien",
-    "cohesion",
-    "rotundity",
-    "farmer's",
-    "foiles",
-    "yellow-brown",
-    "ani",
-    "hume's",
-    "stealing",
-    "flatland",
-    "resourceful",
-    "tarantara",
-    "melbourne",
-    "apparency",
-    "o's",
-    "impetuous",
-    "classified",
-    "deeming",
-    "conspire",
-    "single-minded",
-    "mcglynn",
-    "strangeness",
-    "abolitionists",
-    "revolutionists",
-    "full-clad",
-    "peptizing",
-    "physiotherapist",
-    "ilka",
-    "titters",
-    "dan's",
-    "pros",
-    "mai'teipa",
-    "concerto",
-    "medium",
-    "attentions",
-    "single-shot",
-    "great's",
-    "erikson",
-    "bake-offs",
-    "dsw",
-    "magnetically",
-    "shaped",
-    "cookie",
-    "unearth",
-    "heightened",
-    "camilo",
-    "awake",
-    "stopper",
-    "half-witted",
-    "piece",
-    "methodism",
-    "polynomial",
-    "arm",
-    "rectilinear",
-    "mucosa",
-    "teenager",
-    "undo",
-    "earned-run",
-    "heaps",
-    "ground-truck",
-    "shriveled",
-    "drunken",
-    "ziegfeld",
-    "spectrophotometer",
-    "antennas",
-    "presuppositions",
-    "jockey",
-    "craft-industrial",
-    "launderings",
-    "tale",
-    "majors",
-    "failure",
-    "konstantin",
-    "unwinding",
-    "conception",
-    "conquering",
-    "forty-eight",
-    "counterfeit",
-    "architect's",
-    "relational",
-    "centralia",
-    "switzerland",
-    "captive",
-    "clannishness",
-    "smoothest",
-    "66th",
-    "lubbock",
-    "weather",
-    "buckling",
-    "soviet's",
-    "expects",
-    "embarrassing",
-    "miscellany",
-    "cheaper",
-    "courtney",
-    "debonair",
-    "ml.",
-    "wilfrid",
-    "thirty-fourth",
-    "humpty",
-    "served",
-    "russia",
-    "long",
-    "beebe's",
-    "gottingen",
-    "france-germany",
-    "hurting",
-    "maneuvering",
-    "burglary",
-    "typewriters",
-    "traversing",
-    "earth-bound",
-    "integral",
-    "formulaic",
-    "demon-ridden",
-    "tended",
-    "learn",
-    "thwarted",
-    "crone",
-    "beaded",
-    "alloted",
-    "bagged",
-    "ballerinas",
-    "hercules",
-    "14-1/2",
-    "connivance",
-    "postmasters",
-    "theater-going",
-    "rightfield",
-    "maturities",
-    "nonliterary",
-    "roleplayed",
-    "margenau",
-    "450,000",
-    "existentialists",
-    "impressionistic",
-    "apologetic",
-    "springing",
-    "inspired",
-    "nails",
-    "petrarchan",
-    "southbound",
-    "geneticist",
-    "25.1%",
-    "themselves",
-    "octagonal",
-    "patton",
-    "comprise",
-    "wrongdoer",
-    "trujillos",
-    "advisability",
-    "professionalism",
-    "mystery-story",
-    "irritating",
-    "mineralized",
-    "nerve-ends",
-    "700-mile",
-    "aggie",
-    "crossed",
-    "fargo",
-    "drums",
-    "4'",
-    "indianapolis",
-    "councilwoman",
-    "regretfully",
-    "hinton",
-    "elephants",
-    "pre-attack",
-    "extractors",
-    "threshold",
-    "scrimmaged",
-    "570",
-    "dian's",
-    "action-oriented",
-    "aloud",
-    "do-good",
-    "reliving",
-    "acclaim",
-    "mechanistic",
-    "airlock",
-    "up-to-date",
-    "anglo-jewish",
-    "armstrong",
-    "world-at-large",
-    "wavelengths",
-    "that's",
-    "levitation",
-    "one-third",
-    "disguised",
-    "spiraled",
-    "airways",
-    "wanderers",
-    "moloch",
-    "impart",
-    "interferes",
-    "lumps",
-    "amateurs",
-    "byword",
-    "rocky",
-    "favorably",
-    "heidenstam",
-    "2:20",
-    "eisenhower's",
-    "abstaining",
-    "unadorned",
-    "aid",
-    "cezannes",
-    "bales",
-    "confederate",
-    "sceptical",
-    "undid",
-    "procedural",
-    "modifier",
-    "wobbling",
-    "fogy",
-    "wherever",
-    "qualitatively",
-    "chronicle",
-    "claude",
-    "frank",
-    "wednesdays",
-    "half-life",
-    "erupt",
-    "flory",
-    "jerks",
-    "expelled",
-    "consistence",
-    "kansas",
-    "policies",
-    "commissioner",
-    "nick's",
-    "foreseen",
-    "virulence",
-    "78",
-    "millstone",
-    "above-water",
-    "understands",
-    "marred",
-    "scheme",
-    "advising",
-    "valiantly",
-    "helium-4",
-    "seminarians",
-    "knockdown",
-    "practice",
-    "positions",
-    "babylon",
-    "m**ym",
-    "crumbled",
-    "5,500",
-    "alsop",
-    "chaplain",
-    "feare",
-    "hirsch",
-    "zubkovskaya",
-    "af-stage",
-    "despite",
-    "slackened",
-    "lippmann",
-    "readjust",
-    "quintana",
-    "unmanageable",
-    "closed",
-    "shipshape",
-    "mules",
-    "67-year-old",
-    "increases",
-    "asked",
-    "jouvet",
-    "skills",
-    "60-city",
-    "carwood's",
-    "whispered",
-    "listing",
-    "gardner's",
-    "epitome",
-    "skis",
-    "lamentations",
-    "imprecisely",
-    "inculcated",
-    "caruso",
-    "localization",
-    "adjacent",
-    "vandervoort",
-    "hinterlands",
-    "sleeves",
-    "proclaim",
-    "posted",
-    "bock",
-    "dryin'",
-    "suey",
-    "unceasing",
-    "complicate",
-    "james'",
-    "pick",
-    "nazi",
-    "water-cooled",
-    "data-processing",
-    "gains",
-    "flyer-castle",
-    "thor's",
-    "stowe",
-    "helva's",
-    "cu.",
-    "infinitum",
-    "forsaken",
-    "gold-filled",
-    "account",
-    "taraday",
-    "co.",
-    "struck",
-    "$19.3",
-    "tektites",
-    "10-year-old",
-    "irresolvable",
-    "loose-jointed",
-    "misrepresenting",
-    "tartuffe",
-    "zest",
-    "superiority",
-    "transformers",
-    "gut-flattening",
-    "al.",
-    "theresa",
-    "statistically",
-    "nosing",
-    "topeka",
-    "gentry",
-    "outplayed",
-    "clincher",
-    "provost",
-    "gruesome",
-    "southern",
-    "loquacious",
-    "ziffren",
-    "count",
-    "whistle",
-    "graduated",
-    "impact",
-    "salish",
-    "maintenance",
-    "manufacture",
-    "$7,000,000",
-    "foreclosing",
-    "thin-soled",
-    "215",
-    "actuarially",
-    "899",
-    "sixties",
-    "rosa",
-    "skating",
-    "gerosa's",
-    "blocks",
-    "$.90",
-    "cumhuriyet",
-    "stammering",
-    "13.9",
-    "oppressive",
-    "creases",
-    "sergei",
-    "pentagon's",
-    "poetry's",
-    "plodding",
-    "1897",
-    "provinces",
-    "vattern",
-    "alkaloids",
-    "melamine",
-    "oyajima",
-    "a-wing",
-    "who's",
-    "bronchiolitis",
-    "cortlandt",
-    "shylock",
-    "busied",
-    "penutian",
-    "woollcott",
-    "quaker",
-    "busiest",
-    "discomfort",
-    "playmate",
-    "accomplishes",
-    "unhappiness",
-    "peale",
-    "discharge",
-    "unsupported",
-    "workshops",
-    "nursery",
-    "indecision",
-    "grunted",
-    "cloying",
-    "dequindre",
-    "250",
-    "blaring",
-    "gyp",
-    "suitor",
-    "screwball",
-    "pabor",
-    "college-educated",
-    "heartless",
-    "hall's",
-    "foreground",
-    "westphalia",
-    "ringler's",
-    "consorting",
-    "mann's",
-    "home-comings",
-    "agriculture",
-    "puffy",
-    "lope",
-    "own",
-    "grimace",
-    "therapists",
-    "espagnol",
-    "rouben",
-    "cohesiveness",
-    "alusik's",
-    "work",
-    "underbracing",
-    "589",
-    "circumscriptions",
-    "firecrackers",
-    "krakowiak",
-    "o.",
-    "politico",
-    "koch",
-    "nostalgically",
-    "spindle",
-    "photographers",
-    "electric-sewer-water",
-    "snips",
-    "6:35",
-    "0.6",
-    "canneries",
-    "cartels",
-    "379,900",
-    "trevelyan's",
-    "plush",
-    "chivying",
-    "rheims",
-    "interposition",
-    "highways",
-    "habib",
-    "convalescing",
-    "oblong",
-    "1818",
-    "alerts",
-    "triomphe",
-    "kola",
-    "awed",
-    "expressionists",
-    "makers",
-    "eminently",
-    "deploying",
-    "sneering",
-    "injunctive",
-    "unwillingly",
-    "format",
-    "sawtimber",
-    "excellently",
-    "snobbish",
-    "angelico",
-    "m.'s",
-    "tailin's",
-    "chestnuts",
-    "competence",
-    "o'connor's",
-    "difficile",
-    "halted",
-    "value-orientations",
-    "sanding",
-    "cavity",
-    "panicked",
-    "hovering",
-    "behavior",
-    "signed",
-    "manthey",
-    "khrushchevs",
-    "compromising",
-    "worshipping",
-    "hampers",
-    "babbled",
-    "taoist",
-    "tenda",
-    "scavenging",
-    "callas",
-    "undaunted",
-    "newsstand",
-    "shuddering",
-    "mince",
-    "natalie",
-    "quickie",
-    "huzzahs",
-    "holman",
-    "en",
-    "experimentalism",
-    "scoundrel",
-    "floated",
-    "waves",
-    "composing",
-    "identifying",
-    "epithet",
-    "furious",
-    "isotopic",
-    "illusory",
-    "corked",
-    "ottauquechee",
-    "trial-book",
-    "mudugno",
-    "hopei",
-    "reposed",
-    "lows",
-    "taverns",
-    "unwarranted",
-    "gloomily",
-    "raising",
-    "betraying",
-    "$60,000",
-    "hutment",
-    "tintoretto",
-    "hoag",
-    "shoes",
-    "slick-headed",
-    "installed",
-    "subtracting",
-    "consisting",
-    "gaylor",
-    "stab",
-    "carlson",
-    "hartwell",
-    "extra-sensory",
-    "postulated",
-    "short-cut",
-    "suggest",
-    "reinstall",
-    "nugent",
-    "cimoli",
-    "glided",
-    "canadian",
-    "buck's",
-    "francs",
-    "interrupt",
-    "authenticate",
-    "lawyers'",
-    "analogies",
-    "orbits",
-    "cost-plus",
-    "rumen",
-    "dreamless",
-    "symbolic-sounding",
-    "albums",
-    "palfrey's",
-    "mediumistic",
-    "scratching",
-    "schockler",
-    "daylights",
-    "ribonucleic",
-    "interruption",
-    "gospel-singer",
-    "80th",
-    "hirschey",
-    "rejoices",
-    "vacated",
-    "tcu",
-    "weeks'",
-    "ozzie",
-    "stream",
-    "infancy",
-    "volume",
-    "candor",
-    "combating",
-    "pre-primary",
-    "abilene",
-    "horribly",
-    "tack-solder",
-    "619,000",
-    "barflies",
-    "zingggg-o",
-    "mostly",
-    "custom",
-    "families",
-    "proto-yokuts",
-    "agglutinating",
-    "tieck",
-    "fairly",
-    "wisdom",
-    "incriminating",
-    "emperors",
-    "burnsides'",
-    "permeate",
-    "vom",
-    "kaboom",
-    "pegboards",
-    "ghetto",
-    "ptolemaists",
-    "wholly",
-    "quick",
-    "medfield's",
-    "worded",
-    "1625",
-    "gazed",
-    "walks",
-    "contaminate",
-    "heartbeat",
-    "windowless",
-    "clouded",
-    "ours",
-    "bio-medicine",
-    "lehman",
-    "hazardous",
-    "chemical",
-    "heidenstam's",
-    "anemia",
-    "alamo",
-    "cranston",
-    "salads",
-    "bietnar",
-    "hadn't",
-    "all-important",
-    "dad",
-    "thirty-three",
-    "fiddle",
-    "absurdity",
-    "slope's",
-    "commits",
-    "05",
-    "willows",
-    "distributing",
-    "comradeship",
-    "augustan",
-    "botanists",
-    "oversimplification",
-    "fragile",
-    "prisoners",
-    "disorder",
-    "case-to-case",
-    "picture",
-    "two-season",
-    "shoving",
-    "primitivism",
-    "river's",
-    "fredrico",
-    "player",
-    "bacteria",
-    "capone",
-    "leonato",
-    "coupler",
-    "deals",
-    "unrelieved",
-    "we'd",
-    "redundancy",
-    "romeo",
-    "good-will",
-    "seize",
-    "clothes",
-    "deities",
-    "receptions",
-    "yesterday",
-    "ships",
-    "assessor",
-    "drawn",
-    "talmud",
-    "dwight",
-    "polyunsaturated",
-    "presaged",
-    "cabanas",
-    "lewellyn",
-    "expediting",
-    "unlocked",
-    "wreath",
-    "urinary",
-    "tabula",
-    "golf's",
-    "commotion",
-    "crutch",
-    "groaned",
-    "purport",
-    "immigrant",
-    "salesgirl",
-    "tropics",
-    "characteristically",
-    "probe",
-    "teats",
-    "swiftest",
-    "bulb",
-    "carloading",
-    "cuk**ya",
-    "nowhere",
-    "interstitial",
-    "glisten",
-    "american",
-    "nozzles",
-    "falcon",
-    "stay",
-    "gesualdo",
-    "trade-mark",
-    "central's",
-    "contrasted",
-    "syracuse",
-    "wac",
-    "damascus",
-    "calfskin",
-    "musta",
-    "sub-assembly",
-    "gashes",
-    "mid",
-    "inauguration",
-    "slacks",
-    "protrude",
-    "swimmers'",
-    "finals",
-    "one-man",
-    "banish",
-    "thermometric",
-    "quiescent",
-    "halos",
-    "equipment",
-    "decompression",
-    "marines",
-    "vocals",
-    "adherents",
-    "methodical",
-    "disconnected",
-    "suspect",
-    "radiosterilized",
-    "dazzling",
-    "bend",
-    "franks-in-buns",
-    "dominant",
-    "saturday's",
-    "benched",
-    "orthographic",
-    "depress",
-    "partner",
-    "uncle's",
-    "piping",
-    "channing",
-    "calimala",
-    "tiresome",
-    "contrive",
-    "brendan",
-    "kindnesses",
-    "choreographers",
-    "somewheres",
-    "hurled",
-    "dynasty",
-    "gimbaled",
-    "soda",
-    "butlers",
-    "seals",
-    "plunking",
-    "kohnstamm",
-    "milan",
-    "compete",
-    "employes",
-    "bottle",
-    "counselor",
-    "messengers",
-    "handless",
-    "firmness",
-    "personal",
-    "ellsworth",
-    "shaker",
-    "puddings",
-    "shu-tt",
-    "dimethylglyoxime",
-    "uprooted",
-    "dedifferentiated",
-    "single-dose",
-    "bureaucratization",
-    "tardiness",
-    "physicists",
-    "timon",
-    "fortunes",
-    "out-of-doors",
-    "dynamited",
-    "baklava",
-    "eighteen-year-old",
-    "strapping",
-    "sneaker",
-    "undulated",
-    "university-wide",
-    "ranges",
-    "departs",
-    "inapplicable",
-    "it-wit",
-    "overprotection",
-    "galahad",
-    "hudson",
-    "littlepage's",
-    "polk's",
-    "downpayment",
-    "bliss",
-    "celebrate",
-    "softest",
-    "militarily",
-    "intoxicated",
-    "americana",
-    "manhattan",
-    "theater",
-    "prague",
-    "administrators",
-    "wheelock's",
-    "ruled",
-    "huts",
-    "provocateurs",
-    "selma",
-    "broadcast",
-    "domain",
-    "primeval",
-    "buddy",
-    "unambiguously",
-    "lyon",
-    "stowe's",
-    "maggie's",
-    "hitler's",
-    "digiorgio",
-    "amadee's",
-    "semi-special",
-    "actuarial",
-    "sporting",
-    "repertory",
-    "thousandths",
-    "refashion",
-    "residentially",
-    "bibliographical",
-    "dislocation",
-    "rewrite",
-    "circa",
-    "snake-rail",
-    "clearness",
-    "emphasizing",
-    "livers",
-    "by-passing",
-    "grammarians",
-    "romanticize",
-    "boosts",
-    "toscanini's",
-    "26-year-old",
-    "feathery",
-    "barbital",
-    "hunter",
-    "37-degrees-c",
-    "imbued",
-    "lillian's",
-    "mankowski",
-    "reilly",
-    "arshinkoff",
-    "sloshed",
-    "locales",
-    "bring",
-    "tripartite",
-    "woefully",
-    "krasnik",
-    "suit",
-    "lessens",
-    "anecdotes",
-    "culturally",
-    "76-per-cent",
-    "vocalize",
-    "overreaches",
-    "engineer",
-    "pastness",
-    "dave",
-    "re-evaluate",
-    "physiologist",
-    "populate",
-    "left-handed",
-    "chair",
-    "jacquelyn's",
-    "frothy",
-    "three-fourths",
-    "flagrantly",
-    "justly",
-    "savored",
-    "lashing",
-    "oblivion",
-    "training",
-    "enemy-jew",
-    "constricting",
-    "faneuil",
-    "flailing",
-    "sclerotic",
-    "5.6",
-    "candidates",
-    "allotted",
-    "counterbalanced",
-    "telescoped",
-    "ill.",
-    "benzene",
-    "rivaled",
-    "downhill",
-    "pass",
-    "punishable",
-    "tribesmen",
-    "came",
-    "consderations",
-    "multi-purpose",
-    "2.58",
-    "georgia's",
-    "guarded",
-    "baku",
-    "digesting",
-    "mansion's",
-    "flat",
-    "one-sided",
-    "restaurants",
-    "etc.",
-    "style",
-    "inane",
-    "organizes",
-    "pride-venus",
-    "enjoin",
-    "aerator",
-    "handler",
-    "unmistakably",
-    "maximized",
-    "panicky",
-    "five-and-a-half",
-    "metal-tasting",
-    "kaddish",
-    "impairment",
-    "donating",
-    "incidental",
-    "could've",
-    "tripe",
-    "icing",
-    "dank",
-    "s-11",
-    "gestured",
-    "habitat",
-    "uto-aztecan",
-    "appareled",
-    "quavered",
-    "peaks",
-    "towboats",
-    "vanished",
-    "facet-planes",
-    "deathbed",
-    "teahouses",
-    "lags",
-    "modicum",
-    "29th",
-    "optimistic",
-    "arroyo",
-    "ramblings",
-    "interspecies",
-    "beismortier",
-    "blue-green",
-    "'52",
-    "damnation",
-    "freight",
-    "businesses",
-    "catapulted",
-    "romances",
-    "predigested",
-    "cranky",
-    "poorly",
-    "biplane",
-    "crimea",
-    "nicotine-choked",
-    "fluttering",
-    "cherry",
-    "swoop",
-    "undecorated",
-    "somay",
-    "rourke's",
-    "brassiere",
-    "sander",
-    "orientation",
-    "durer",
-    "nakamura",
-    "kindred",
-    "garbed",
-    "feis",
-    "incarnation",
-    "probation",
-    "irritability",
-    "goulding",
-    "t'hi-im",
-    "ewc",
-    "misrepresentations",
-    "kindergarten",
-    "colonnaded",
-    "respiration",
-    "fascist",
-    "artifacts",
-    "round-eyed",
-    "churchill's",
-    "stigmata",
-    "triumph",
-    "see-lective",
-    "interlocutor",
-    "dingy",
-    "shoulder-high",
-    "schooled",
-    "centrale",
-    "brussels",
-    "self-will",
-    "distribute",
-    "easier",
-    "unservile",
-    "intrude",
-    "nasaled",
-    "verloop",
-    "geared",
-    "gimbel",
-    "tycoon",
-    "flamboyant",
-    "wakening",
-    "orchestration",
-    "praises",
-    "squaresville",
-    "conflicting",
-    "viceroy",
-    "you're",
-    "amounting",
-    "dodington",
-    "federal",
-    "consul",
-    "blizzards",
-    "secessionists",
-    "buffered",
-    "mildew",
-    "admiring",
-    "reed",
-    "bathar-on-walli",
-    "liaisons",
-    "amusedly",
-    "raimu",
-    "aderholds",
-    "sable",
-    "case",
-    "illinois",
-    "rumdum",
-    "jimenez",
-    "suffers",
-    "temper",
-    "sherry",
-    "busts",
-    "mustard",
-    "score",
-    "barbiturate",
-    "$15",
-    "commandant",
-    "snail's",
-    "somers",
-    "secularized",
-    "drummers",
-    "offset",
-    "ponoluu",
-    "rapes",
-    "finding",
-    "galata",
-    "roll",
-    "newsboy",
-    "mullerin",
-    "requesters",
-    "cynthia",
-    "caused",
-    "$16.80",
-    "wide-shouldered",
-    "zooms",
-    "proclivities",
-    "birch",
-    "luke's",
-    "sweet-clover",
-    "meaningful",
-    "prieur",
-    "fine-tooth",
-    "camp's",
-    "adorned",
-    "tincture",
-    "evasion",
-    "fervent",
-    "homeowners",
-    "massive",
-    "125",
-    "missouri's",
-    "improviser",
-    "unaffected",
-    "7034",
-    "taxis",
-    "ratification",
-    "comported",
-    "shout",
-    "philadelphia",
-    "exemplify",
-    "hector",
-    "bougie",
-    "conflict",
-    "ups",
-    "$25",
-    "sylvan",
-    "stalled",
-    "jubal",
-    "ld060",
-    "mayor",
-    "starts",
-    "succeeded",
-    "accented",
-    "patrol",
-    "never-predictable",
-    "alex's",
-    "manifestations",
-    "3-hp.",
-    "fran's",
-    "terrain",
-    "tankers",
-    "suppose",
-    "pont's",
-    "unproblematic",
-    "spoof",
-    "1889",
-    "institutions",
-    "partly",
-    "negroes'",
-    "decades",
-    "needy",
-    "220-yard",
-    "unfired",
-    "beiderbecke",
-    "paterson",
-    "sighting",
-    "androfski",
-    "narbonne",
-    "1450",
-    "caracas",
-    "delicate",
-    "cohere",
-    "confront",
-    "revised",
-    "wings",
-    "ferocious",
-    "mankind's",
-    "implantation",
-    "wolfgang",
-    "colles",
-    "cutback",
-    "fares",
-    "newcomers",
-    "bookshelves",
-    "dinners",
-    "hygiene",
-    "loaves",
-    "courtly",
-    "auditing",
-    "feeling",
-    "coiffure",
-    "text",
-    "befell",
-    "skindive",
-    "maryinsky",
-    "prentice-hall",
-    "liniment",
-    "gash",
-    "siesta",
-    "presides",
-    "light-hearted",
-    "tangibly",
-    "sauces",
-    "bet",
-    "diocesan",
-    "brewed",
-    "underwent",
-    "asset",
-    "shit",
-    "unmethodical",
-    "hindering",
-    "apex",
-    "mole",
-    "surfeit",
-    "bentleys",
-    "click",
-    "humanities",
-    "marylanders",
-    "dollars'",
-    "unredeemed",
-    "dines",
-    "vermouth",
-    "philippe",
-    "transcripts",
-    "usage",
-    "$157,460",
-    "truck's",
-    "extra",
-    "identify",
-    "churns",
-    "knew",
-    "stuck",
-    "run-scoring",
-    "informational",
-    "hordes",
-    "overlay",
-    "re-arguing",
-    "industry's",
-    "erik",
-    "signature",
-    "purchases",
-    "purity",
-    "adolf",
-    "incurable",
-    "blasts",
-    "unexpectedly",
-    "400",
-    "5-foot",
-    "scot-free",
-    "b'dikkat's",
-    "diron",
-    "markovitz",
-    "michelangelo's",
-    "3.3",
-    "think",
-    "sol",
-    "five-elements",
-    "battalions",
-    "decorum",
-    "shafer",
-    "imperialist",
-    "amonasro",
-    "abstraction",
-    "reforms",
-    "periodically",
-    "gov.",
-    "ultramarine",
-    "consorted",
-    "eggs",
-    "tolylene",
-    "distinction",
-    "yin",
-    "transcultural",
-    "multimillionaire",
-    "non-supervisory",
-    "fixed",
-    "districts",
-    "escaping",
-    "cannery",
-    "spahn's",
-    "1622",
-    "absent",
-    "kittredge",
-    "then",
-    "favorites",
-    "advantages",
-    "puzzled",
-    "many-faced",
-    "colloquial",
-    "labors",
-    "1917",
-    "patron",
-    "unadjusted",
-    "reiterate",
-    "toadies",
-    "missions",
-    "climactic",
-    "tradesmen",
-    "300-450",
-    "happens",
-    "walle",
-    "perpetual",
-    "buy",
-    "automation",
-    "shapely",
-    "maroc",
-    "occlusion",
-    "675",
-    "schultz",
-    "second-hand",
-    "imbibe",
-    "guidance",
-    "lived",
-    "overshadowed",
-    "colo.",
-    "shimmy",
-    "scrawny",
-    "debuts",
-    "subfigures",
-    "nugent's",
-    "kruger's",
-    "impression",
-    "pervading",
-    "snake",
-    "impassive",
-    "government-controlled",
-    "destined",
-    "idlers",
-    "savannah",
-    "perrin's",
-    "hans",
-    "exacted",
-    "smoothed",
-    "p.m.",
-    "with",
-    "lesser",
-    "truman's",
-    "captures",
-    "tyrosine",
-    "bricktop",
-    "rudeness",
-    "altruism",
-    "nnuolapertar-it-vuh-karti-birifw-",
-    "no-o-o",
-    "untie",
-    "best-looking",
-    "stony",
-    "depiction",
-    "amos",
-    "devices",
-    "concerto's",
-    "draftees",
-    "starlings",
-    "unspeakable",
-    "awakens",
-    "appreciate",
-    "flock",
-    "1904",
-    "hendry",
-    "heckman",
-    "10-year",
-    "dickson",
-    "johannesburg",
-    "potomac",
-    "twenty",
-    "bohlen",
-    "villager",
-    "livid",
-    "fret",
-    "shore",
-    "backlog",
-    "hamm's",
-    "attired",
-    "princess",
-    "attendance",
-    "fing",
-    "garland",
-    "rotations",
-    "amra",
-    "foes",
-    "touching",
-    "klaus",
-    "arcus",
-    "cod",
-    "reproducible",
-    "medfield",
-    "insolently",
-    "familism",
-    "pollution",
-    "rasps",
-    "commend",
-    "ballfields",
-    "castro-held",
-    "piss",
-    "paray",
-    "perfectability",
-    "self-aggrandisement",
-    "andersen",
-    "thrice",
-    "undertake",
-    "sorts",
-    "wee",
-    "righteous",
-    "1-1/2-story",
-    "elliptical",
-    "cardiovascular",
-    "hoss",
-    "gyrocompass",
-    "cross-section",
-    "sad",
-    "repugnant",
-    "django",
-    "colonists'",
-    "esoteric",
-    "rhine",
-    "overhand",
-    "gratify",
-    "50-inch",
-    "tombstone",
-    "clerking",
-    "scar",
-    "he'll",
-    "takin'",
-    "akita",
-    "southeast",
-    "paradoxical",
-    "incomes",
-    "remind",
-    "geatish",
-    "stamford",
-    "adorn",
-    "stockynges",
-    "papier-mache",
-    "affix",
-    "semi-private",
-    "infant",
-    "mystified",
-    "slots",
-    "dribbled",
-    "wheezed",
-    "fourteenth",
-    "hydroxylation",
-    "unintelligible",
-    "griffin's",
-    "russo-american",
-    "6a",
-    "mourning",
-    "bin",
-    "preach",
-    "andrenas",
-    "reorganizations",
-    "subsequently",
-    "mediumship",
-    "homebound",
-    "louvers",
-    "jansenist",
-    "vigor",
-    "burke-rostagno",
-    "galaxy",
-    "gregorius",
-    "$27.50",
-    "royaux",
-    "harrison",
-    "woburn",
-    "proficient",
-    "ached",
-    "dispenser",
-    "wilsonian",
-    "eine",
-    "columnists",
-    "toomey",
-    "magi",
-    "transmutation",
-    "interpersonal",
-    "pterygia",
-    "grapefruit",
-    "trohan",
-    "betterment",
-    "swiped",
-    "destiny",
-    "numerology",
-    "okada",
-    "scandal",
-    "they",
-    "blazon",
-    "twenty-one-year-old",
-    "waxed",
-    "outworn",
-    "rifle's",
-    "sallow",
-    "krims",
-    "voluntary-control",
-    "republican",
-    "vibrating",
-    "tenancy",
-    "detergents",
-    "reactionaries",
-    "jahr",
-    "accretions",
-    "a",
-    "y.m.c.a.",
-    "ashes",
-    "pledge",
-    "chaffing",
-    "yell",
-    "gerald",
-    "portraying",
-    "821,220",
-    "expected",
-    "showcase",
-    "prosperity",
-    "vacationing",
-    "typhoon",
-    "exposes",
-    "foreign",
-    "vine-embowered",
-    "geysering",
-    "condliffe",
-    "calves",
-    "rearing",
-    "spacesuit",
-    "ores",
-    "clothesbrush",
-    "unworn",
-    "spalding",
-    "conseil",
-    "unmasked",
-    "blackjack",
-    "retentive",
-    "yongst",
-    "pothole",
-    "murderous",
-    "existential",
-    "in",
-    "steely",
-    ")",
-    "stays",
-    "equipped",
-    "enquetes",
-    "sewage",
-    "cited",
-    "waits",
-    "meister",
-    "salesman",
-    "hesperus'",
-    "entwined",
-    "infuriated",
-    "northerner",
-    "tend",
-    "blue-eyed",
-    "rejection",
-    "undersize",
-    "airline's",
-    "warring",
-    "shooing",
-    "sistine",
-    "easy-to-operate",
-    "hammett",
-    "counterproposal",
-    "sues",
-    "friday",
-    "39",
-    "feathertop",
-    "mutters",
-    "aerodynamic",
-    "signboard",
-    "adage",
-    "steal",
-    "accept",
-    "k.g.",
-    "micrometeorites",
-    "once-a-month",
-    "whites",
-    "one-digit",
-    "councilman",
-    "falla's",
-    "jai",
-    "somatic",
-    "vivier",
-    "popular",
-    "bal",
-    "book-selection",
-    "sharp",
-    "denoted",
-    "john's",
-    "aye",
-    "schoolboy",
-    "10-degrees",
-    "stations'",
-    "occupancy",
-    "undependable",
-    "giants'",
-    "hegel",
-    "cokes",
-    "tucson",
-    "sprained",
-    "off-road",
-    "reactionary",
-    "elisabeth",
-    "strata",
-    "gets",
-    "demure",
-    "kid",
-    "bod/day/1,000",
-    "blunderings",
-    "ejected",
-    "162,400",
-    "beardown",
-    "shocked",
-    "hasseltine",
-    "commonplace",
-    "bugged",
-    "persuaders",
-    "oldenburg",
-    "seersucker",
-    "castle",
-    "y-cells",
-    "heretic",
-    "motorist",
-    "basking",
-    "spatially",
-    "410-degrees-c",
-    "katangans",
-    "forsyth",
-    "music",
-    "scorcher",
-    "terra-cotta-colored",
-    "concentrates",
-    "jasper",
-    "midnight",
-    "orthodox",
-    "stains",
-    "pm",
-    "panelized",
-    "irvin",
-    "newly-plowed",
-    "shep",
-    "depressingly",
-    "toot",
-    "elvis",
-    "remedy",
-    "vielleicht",
-    "flotilla",
-    "$9,841,000",
-    "waal's",
-    "non-books",
-    "cardiovasculatory",
-    "stratton",
-    "mundt's",
-    "mullins",
-    "starre",
-    "hooked",
-    "lurcat",
-    "woodin",
-    "backdrop",
-    "rod's",
-    "reacquainted",
-    "endearments",
-    "dred",
-    "johnson",
-    "haijac",
-    "harvester",
-    "jeweler's",
-    "gallant",
-    "freethinkers",
-    "unrealistically",
-    "admittance",
-    "ximenez-vargas",
-    "lilac",
-    "yok.",
-    "moreover",
-    "multitudes",
-    "ironical",
-    "whah",
-    "obey",
-    "rub",
-    "power's",
-    "requested",
-    "tredding",
-    "colosseum",
-    "darrell",
-    "humanists",
-    "against",
-    "slavery",
-    "ingenuity",
-    "plumpness",
-    "7,000,000",
-    "stupid",
-    "harro",
-    "maliciously",
-    "international",
-    "vagina",
-    "tigers",
-    "buzzing",
-    "servant",
-    "smells",
-    "show-offy",
-    "pappas",
-    "anode",
-    "adulterated",
-    "yonkers",
-    "breaking",
-    "confidences",
-    "visualization",
-    "spontaneously",
-    "alliances",
-    "gritty",
-    "ungava",
-    "antenna",
-    "5:00",
-    "tenants",
-    "full-time",
-    "last",
-    "myocardial",
-    "gross",
-    "toscanini",
-    "blacked-in",
-    "untidy",
-    "consolidation",
-    "litterbug",
-    "overshoes",
-    "critical-intellectual",
-    "searches",
-    "pouilly-fuisse",
-    "disoriented",
-    "postmark",
-    "non-code",
-    "stair-step",
-    "investing",
-    "benson's",
-    "celso",
-    "forehead",
-    "katie's",
-    "garaged",
-    "burman",
-    "hillbilly",
-    "compensations",
-    "appealed",
-    "bastion",
-    "bled",
-    "gill",
-    "paynes",
-    "barnsful",
-    "jenny",
-    "ahah",
-    "chipper",
-    "roughest",
-    "launder-ometer",
-    "guignol",
-    "juror",
-    "synthesizes",
-    "parroting",
-    "dedicates",
-    "whimpering",
-    "hammer",
-    "washington-alexandria",
-    "retina",
-    "survived",
-    "totalitarian",
-    "stewardess",
-    "soldiery",
-    "accusation",
-    "pre-packed",
-    "3-by-6-ft.",
-    "banfield",
-    "nab",
-    "pietro's",
-    "ardent",
-    "listens",
-    "remuneration",
-    "scribe",
-    "pavilion",
-    "5000",
-    "re-examined",
-    "marinating",
-    "maguires",
-    "plexiglas",
-    "populace",
-    "theologians",
-    "household",
-    "pasley",
-    "knowledge",
-    "seniors",
-    "warm-up",
-    "frothingham",
-    "exclamations",
-    "centennial",
-    "eminent",
-    "hostaria",
-    "displacing",
-    "casbah",
-    "hebrews",
-    "taboos",
-    "excesses",
-    "troop",
-    "battery-powered",
-    "tiger",
-    "professors",
-    "tenderfoot",
-    "clurman",
-    "fined",
-    "harem",
-    "form",
-    "ensuing",
-    "ought",
-    "1869",
-    "paleness",
-    "compress",
-    "solid-fueled",
-    "glancing",
-    "universalize",
-    "loaders",
-    "half-brothers",
-    "dolce",
-    "obsoleting",
-    "sundials",
-    "commends",
-    "edgewise",
-    "poesy",
-    "barney",
-    "unclean",
-    "tourists'",
-    "volition",
-    "self-destruction",
-    "1909-10",
-    "frenchman",
-    "ascertained",
-    "post-reapportionment",
-    "thailand",
-    "weaving",
-    "decays",
-    "fashionable",
-    "evil",
-    "swerving",
-    "extrema",
-    "hunches",
-    "12%",
-    "premieres",
-    "series",
-    "postgraduate",
-    "sunnyvale",
-    "tossed",
-    "pinhead",
-    "ierulli",
-    "bein'",
-    "bony",
-    "game's",
-    "sanity",
-    "fonta",
-    "sloan's",
-    "4,585",
-    "bogeyed",
-    "pre-history",
-    "neocortical-hypothalamic",
-    "196",
-    "11-3",
-    "noontime",
-    "enjoinder",
-    "apollo's",
-    "alec",
-    "gonzales",
-    "nam's",
-    "novel",
-    "withheld",
-    "terry-cloth",
-    "shag",
-    "hungarian-born",
-    "forgave",
-    "pitiless",
-    "fletcher",
-    "rhododendron",
-    "wartime",
-    "field-hands'",
-    "considerable",
-    "troops",
-    "well-bound",
-    "advancements",
-    "subtype",
-    "privy",
-    "orcutt",
-    "palasts",
-    "booze",
-    "thermocouple",
-    "broadside",
-    "mocked",
-    "ponder",
-    "meteorological",
-    "2:43.1--:38",
-    "horror",
-    "examples",
-    "seven",
-    "sewer",
-    "symptom",
-    "exact-size",
-    "2:06.3",
-    "m.d.",
-    "messy",
-    "courageously",
-    "mastic",
-    "sarason",
-    "knauer",
-    "wesker",
-    "wheeled",
-    "9-7",
-    "unpopular",
-    "gratitude",
-    "easel",
-    "roommate",
-    "denials",
-    "revolutionaries",
-    "allegro",
-    "outfield",
-    "12-gauge",
-    "rafter",
-    "presented",
-    "whimsey",
-    "drilled",
-    "caetani",
-    "carwood",
-    "hydrides",
-    "philanthropic",
-    "ben-hadad",
-    "illustrator",
-    "colloidal",
-    "seconds",
-    "attested",
-    "propaganda",
-    "burdensome",
-    "elbows",
-    "stoutly",
-    "pile",
-    "french-polished",
-    "rotation",
-    "sedans",
-    "syringa",
-    "bayleefe",
-    "urinals",
-    "rounding",
-    "belly",
-    "marcello",
-    "arbuckle's",
-    "proust",
-    "walton",
-    "far-out",
-    "nonmetallic",
-    "pestle",
-    "variations",
-    "warmly",
-    "kidnaped",
-    "toonker",
-    "outback",
-    "frowzy",
-    "kayabashi's",
-    "more's",
-    "gritty-eyed",
-    "insured",
-    "contradictions",
-    "prompted",
-    "four-hour",
-    "dickens'",
-    "trapp",
-    "nondrying",
-    "biwa",
-    "muller's",
-    "heuvelmans",
-    "hyannis",
-    "mortaring",
-    "kalonji",
-    "somewhat",
-    "candidacy",
-    "championship",
-    "weidman",
-    "creaking",
-    "senor",
-    "erotica",
-    "panders",
-    "inhomogeneous",
-    "casually",
-    "laundry",
-    "satisfactory",
-    "mcclellan's",
-    "littleton's",
-    "magwitch",
-    "$28.00",
-    "eloquent",
-    "sandburg's",
-    "appropriations",
-    "goddamit",
-    "snopes",
-    "wart",
-    "nights",
-    "3-hitter",
-    "anhalt-bernburg",
-    "silliest",
-    "rewriting",
-    "hamper",
-    "inferior",
-    "milbankes",
-    "articulations",
-    "cones",
-    "sisters'",
-    "cantaloupe",
-    "excerpt",
-    "two-day",
-    "yearbook",
-    "springboard",
-    "renaissance",
-    "glue",
-    "complimenting",
-    "flag",
-    "augen",
-    "gaiters",
-    "svenskarna",
-    "compliance",
-    "2:28-:33",
-    "meeker",
-    "l'identite",
-    "juniors",
-    "awkward",
-    "minnie",
-    "sixteen-year-old",
-    "adamson",
-    "gangland",
-    "follow-up",
-    "unfit",
-    "illiterate",
-    "glasses",
-    "ethereal",
-    "escapade",
-    "gay",
-    "fruitlessly",
-    "sanford's",
-    "indignant",
-    "recooned",
-    "balcolm",
-    "cider",
-    "upside",
-    "melted",
-    "$1.6",
-    "aboard",
-    "heights",
-    "dreisers",
-    "stations",
-    "hesitated",
-    "flotte",
-    "population",
-    "bellamy's",
-    "acquittal",
-    "bucs'",
-    "hypothesis",
-    "gyroscopes",
-    "substantiate",
-    "organist",
-    "resigning",
-    "market",
-    "diagnostic",
-    "upcoming",
-    "unwrinkled",
-    "hedge",
-    "bluntness",
-    "censures",
-    "wagon",
-    "pine-knot",
-    "confucianism",
-    "hoo-pig",
-    "squeaky",
-    "adam",
-    "closet",
-    "sometimes",
-    "arrows",
-    "atp",
-    "obliterate",
-    "1692",
-    "sneak",
-    "pfc.",
-    "dickinson",
-    "souffle",
-    "darkest",
-    "portrayed",
-    "lopsidedly",
-    "exploit",
-    "interlocking",
-    "notre-dame",
-    "slumped",
-    "synonymous",
-    "limerick",
-    "larkins",
-    "thieving",
-    "wally",
-    "unscientific",
-    "doyle",
-    "reconverting",
-    "self-completion",
-    "duplicate",
-    "chroniclers",
-    "borromini",
-    "low-grade",
-    "toot-toot",
-    "rayburn's",
-    "marooned",
-    "angleterre",
-    "burgundian",
-    "bulk",
-    "sophia",
-    "topmost",
-    "harper's",
-    "phouma",
-    "supporter",
-    "probes",
-    "spouted",
-    "banker-editor",
-    "buggers",
-    "harm",
-    "kate",
-    "ozagenians",
-    "started",
-    "squares",
-    "issues",
-    "suntan",
-    "audacity",
-    "murmuring",
-    "millions",
-    "mandatory",
-    "warped",
-    "heaped",
-    "mind",
-    "half-off",
-    "denounced",
-    "ironside",
-    "intrinsically",
-    "beginners'",
-    "entries",
-    "idioms",
-    "gunny",
-    "specie",
-    "polarize",
-    "mechanically",
-    "lazarus",
-    "off-key",
-    "derogatory",
-    "kans.",
-    "postmaster's",
-    "upsurge",
-    "martingale",
-    "1807-1892",
-    "magicians",
-    "handicap",
-    "long-distance",
-    "showerhead",
-    "vignette",
-    "cascades",
-    "surrendering",
-    "currency",
-    "miscount",
-    "astray",
-    "saxton",
-    "gannett",
-    "electrifying",
-    "booking",
-    "tends",
-    "offbeat",
-    "surrealists",
-    "antagonize",
-    "fastest",
-    "salt",
-    "helmsman",
-    "lightfoot",
-    "aggregations",
-    "l's",
-    "pawtucket's",
-    "dishonesty",
-    "perpetrated",
-    "comma",
-    "advantageous",
-    "despues",
-    "orderliness",
-    "rivers",
-    "bayreuth",
-    "fellow-craftsmen",
-    "chided",
-    "convocation",
-    "self-serve",
-    "je",
-    "found",
-    "compulsivity",
-    "injun's",
-    "limitations",
-    "locke's",
-    "37,081",
-    "exerting",
-    "soapsuds",
-    "resonable",
-    "thayer's",
-    "full-sisters",
-    "renew",
-    "dramas",
-    "oso",
-    "clubbed",
-    "perceptive",
-    "monomer",
-    "features",
-    "secretary-designate",
-    "suffice",
-    "bolger",
-    "delving",
-    "dingo",
-    "neurosis",
-    "driftin'",
-    "dresbach's",
-    "unasterisked",
-    "granville",
-    "hanover-ceyway",
-    "prussian",
-    "struggled",
-    "perceive",
-    "roosevelt's",
-    "pontchartrain",
-    "free-for-all",
-    "castro",
-    "republics",
-    "unsaturated",
-    "kate's",
-    "well-established",
-    "presente",
-    "reinforce",
-    "coupled",
-    "britannica",
-    "shunted",
-    "bloods",
-    "magnanimity",
-    "tribute",
-    "versed",
-    "office's",
-    "theatrically",
-    "oyster",
-    "hypnosis",
-    "framer",
-    "rut",
-    "$2,490",
-    "fouling",
-    "optical",
-    "notarized",
-    "dinner",
-    "ishtar",
-    "yoke",
-    "transient",
-    "tableland",
-    "fastening",
-    "wheelock",
-    "cut-off",
-    "obviously",
-    "boy-furiendo",
-    "weston",
-    "adjudging",
-    "vermilion",
-    "cecil",
-    "heenan",
-    "or",
-    "mrad",
-    "love's",
-    "transformed",
-    "3,000",
-    "consitutional",
-    "cta",
-    "scarface",
-    "self-realized",
-    "blowers",
-    "gynecological",
-    "tollgate",
-    "whetted",
-    "cervelat",
-    "rackets",
-    "physiology",
-    "peg",
-    "remarrying",
-    "lola",
-    "pakistani",
-    "catholics",
-    "d",
-    "tribunals",
-    "blackman",
-    "commies",
-    "interdepartmental",
-    "station",
-    "manitoba",
-    "moller",
-    "dotting",
-    "fissured",
-    "eve",
-    "spillane's",
-    "poussin's",
-    "package",
-    "reason",
-    "rauschenbusch",
-    "ideal",
-    "limber",
-    "antoine",
-    "tactlessness",
-    "petted",
-    "overlooks",
-    "kreisler",
-    "suzerainty",
-    "tone",
-    "all-out",
-    "paul's",
-    "feast",
-    "staunch",
-    "congregation",
-    "swanky",
-    "separately",
-    "focused",
-    "texture",
-    "menace",
-    "bundled",
-    "34,000",
-    "vocational",
-    "longue",
-    "jeremiah",
-    "ten-year-old",
-    "enlargements",
-    "everglades",
-    "inheres",
-    "christians'",
-    "pontius",
-    "impracticable",
-    "silver-painted",
-    "millay's",
-    "tan",
-    "eyesight",
-    "jesus",
-    "delano",
-    "extrapolates",
-    "wore",
-    "bellies",
-    "counter-successes",
-    "rearmed",
-    "policemen's",
-    "awnings",
-    "waldensian",
-    "frogs",
-    "succession",
-    "instrument-jammed",
-    "fritters",
-    "australian",
-    "held",
-    "sowbelly",
-    "known",
-    "badge",
-    "union",
-    "buckboard",
-    "bridegroom",
-    "tinsel",
-    "hypercellularity",
-    "lateral",
-    "renewable",
-    "uprisings",
-    "ex",
-    "neglects",
-    "recond",
-    "deterioration",
-    "absorb",
-    "negroes",
-    "lava-rocks",
-    "worthwhile",
-    "retraced",
-    "fats",
-    "neutralize",
-    "blois",
-    "wells's",
-    "strenuously",
-    "fan's",
-    "adelos",
-    "hannibal",
-    "statistical",
-    "concierge",
-    "22",
-    "750",
-    "pa's",
-    "print",
-    "eskimo",
-    "wool",
-    "grad",
-    "sized",
-    "600",
-    "erotically",
-    "onlooker",
-    "atkinson",
-    "xylophones",
-    "alignment",
-    "czarina",
-    "singing",
-    "thornburg",
-    "militarist",
-    "tchalo",
-    "committment",
-    "kurigalzu",
-    "customer-cost",
-    "nonionic",
-    "blue-draped",
-    "slow-acting",
-    "rudimentary",
-    "shaved",
-    "minh",
-    "flour",
-    "paste",
-    "wollman",
-    "legend",
-    "novo",
-    "acrylic",
-    "ape",
-    "songful",
-    "vineyard",
-    "matchmaker",
-    "studying",
-    "neighborhoods",
-    "wander-years",
-    "electrostatic",
-    "eats",
-    "sloanaker",
-    "incompatible",
-    "steamed",
-    "francisco",
-    "populous",
-    "perspiration",
-    "photocathode",
-    "phosphorescent",
-    "introductory",
-    "clemency",
-    "disclosed",
-    "reality",
-    "upholds",
-    "veil",
-    "squeaked",
-    "burlesques",
-    "marginal",
-    "drafting",
-    "squadroom",
-    "we'll",
-    "directivity",
-    "absentia",
-    "pettigrew",
-    "craftsmen",
-    "cavin",
-    "goodman",
-    "horrible",
-    "1961's",
-    "aah",
-    "belmont",
-    "maestro",
-    "jehovah's",
-    "12,500",
-    "billings",
-    "harp",
-    "dipole",
-    "fascicles",
-    "rankin's",
-    "glean",
-    "gods",
-    "liber",
-    "pacer",
-    "ineffectively",
-    "canceling",
-    "bryce",
-    "red-rimmed",
-    "ajar",
-    "obsequious",
-    "muscle-shaping",
-    "outlined",
-    "lineman",
-    "fulbright",
-    "ripped",
-    "utilize",
-    "distilling",
-    "relatives",
-    "despina",
-    "2.16",
-    "stylization",
-    "fathom",
-    "tormenters",
-    "chapman",
-    "stoic",
-    "agonies",
-    "reassign",
-    "heroine",
-    "clearly",
-    "pelvis",
-    "circle",
-    "gasket's",
-    "chewing",
-    "coaxing",
-    "mist-like",
-    "hospital",
-    "s'accuse",
-    "av.",
-    "motifs",
-    "imprisoned",
-    "multiple",
-    "rectifier",
-    "five-coordinate",
-    "rachel",
-    "berche",
-    "henry's",
-    "1913",
-    "prodigy",
-    "reliability",
-    "indelible",
-    "teeth",
-    "premonition",
-    "dickens",
-    "doolin's",
-    "chapelles",
-    "20-to-1",
-    "screechy",
-    "castigation",
-    "slices",
-    "ripping",
-    "damp",
-    "nabbed",
-    "aspirations",
-    "pneumonia",
-    "scampini",
-    "apropos",
-    "ex-bandits",
-    "lucian",
-    "coloreds",
-    "rugs",
-    "cb",
-    "lutte",
-    "protozoa",
-    "parella",
-    "hopkins'",
-    "indeed",
-    "halcyon",
-    "conceptual",
-    "plant's",
-    "accosting",
-    "nakayasu",
-    "antennae",
-    "fleetest",
-    "3-5",
-    "deteriorate",
-    "thence",
-    "run-up",
-    "danger",
-    "tudor",
-    "flew",
-    "polyisobutylene",
-    "therapy",
-    "enormously",
-    "sisk",
-    "warm",
-    "hysteron-proteron",
-    "wintering",
-    "accouterments",
-    "alexis",
-    "larvae",
-    "csf",
-    "bits",
-    "hard-bitten",
-    "vagabonds",
-    "fetch",
-    "draws",
-    "$2,300",
-    "dexter",
-    "exhaustion",
-    "home-made",
-    "capitalistic",
-    "poppy",
-    "12,000",
-    "huitotoes",
-    "jaws",
-    "ref.",
-    "djangology",
-    "substitute",
-    "by-product",
-    "hand-me-down",
-    "extruded",
-    "menilmontant",
-    "selects",
-    "glenda",
-    "implementing",
-    "hardy's",
-    "filming",
-    "alfonso",
-    "unlucky",
-    "squalls",
-    "hellfire",
-    "absorbs",
-    "vesuvio's",
-    "stance",
-    "rangoni",
-    "orthodontics",
-    "redbirds'",
-    "stevenses'",
-    "aubr.",
-    "refuge",
-    "carlyle's",
-    "navigator",
-    "courtrai",
-    "dispatched",
-    "semi-catatonic",
-    "luzon",
-    "chicanery",
-    "nudging",
-    "emigrated",
-    "busyness",
-    "flame-throwers",
-    "women",
-    "lens",
-    "masculinity",
-    "pieta",
-    "depravity",
-    "storyteller's",
-    "time-honored",
-    "milton's",
-    "ca.",
-    "abruptly",
-    "md.",
-    "nipped",
-    "knickerbocker",
-    "well-being",
-    "zeitgeist",
-    "petered",
-    "wires",
-    "roundhouse",
-    "broods",
-    "ice-filled",
-    "plumed",
-    "merrily",
-    "yanked",
-    "chariot",
-    "characterize",
-    "regimes",
-    "crafter",
-    "pre-planning",
-    "discussions",
-    "russell",
-    "equally",
-    "housewife",
-    "pedestrian",
-    "idiot",
-    "proteolytic",
-    "ruh",
-    "blonde's",
-    "journal-american",
-    "biologically",
-    "distil",
-    "three-way",
-    "be",
-    "larson's",
-    "svelte",
-    "vere",
-    "clinch",
-    "befall",
-    "shaefer's",
-    "periwinkles",
-    "listening",
-    "bicameral",
-    "abortions",
-    "salvaging",
-    "slant-wise",
-    "budlong",
-    "balkans",
-    "bookcases",
-    "transmissible",
-    "brazen",
-    "nonverbal",
-    "tricks",
-    "betancourt",
-    "absorbed",
-    "cambridge",
-    "in-group",
-    "sound-truck",
-    "mild",
-    "span",
-    "long-chain",
-    "actresses",
-    "more",
-    "widsith",
-    "6.9",
-    "irishman",
-    "aircraft",
-    "lament",
-    "brushing",
-    "polyether",
-    "intensities",
-    "stenography",
-    "1624",
-    "immediacies",
-    "prerogative",
-    "outlawry",
-    "greenhouses",
-    "pitchfork",
-    "1,338,000",
-    "deductable",
-    "publishers",
-    "combing",
-    "adagio",
-    "farmington",
-    "container",
-    "houdini",
-    "loeb",
-    "handicaps",
-    "long-acting",
-    "handfuls",
-    "legions",
-    "ath.",
-    "carver",
-    "rhinestones",
-    "36th",
-    "storied",
-    "trucked",
-    "courtesan",
-    "fortier",
-    "hoffman",
-    "trill",
-    "introduction",
-    "flex",
-    "5835",
-    "buses",
-    "seven-concert",
-    "reaffirmation",
-    "overloaded",
-    "treating",
-    "guaranteed-neutral",
-    "rakishly",
-    "fifty-two",
-    "wild-sounding",
-    "leverage",
-    "decorate",
-    "absolutes",
-    "paperbacks",
-    "appalled",
-    "ended",
-    "rendered",
-    "durations",
-    "overcame",
-    "rat",
-    "secreted",
-    "erasmus's",
-    "hafta",
-    "replica",
-    "surgeon",
-    "ricci",
-    "bateau",
-    "pins",
-    "caneli",
-    "rediscovering",
-    "yiddish",
-    "amplifier",
-    "salvos",
-    "arp",
-    "bod's",
-    "reservations",
-    "espousing",
-    "octet",
-    "mylar",
-    "btu",
-    "1-0",
-    "subtract",
-    "'53",
-    "corticosteroids",
-    "swc",
-    "25-minute",
-    "filberts",
-    "substances",
-    "horseman",
-    "stated",
-    "counteracting",
-    "senator's",
-    "jiffy",
-    "rosen",
-    "peripheral",
-    "yamabe",
-    "ohmic",
-    "catholic",
-    "repudiate",
-    "crescent",
-    "navona",
-    "underestimate",
-    "unreasonably",
-    "rammin'",
-    "sweet-faced",
-    "fine-grained",
-    "aerated",
-    "1453",
-    "cruises",
-    "rain's",
-    "unfavorable",
-    "orleans'",
-    "dairy",
-    "accountable",
-    "story-book",
-    "finnsburg",
-    "includes",
-    "weber",
-    "overstraining",
-    "knuckled",
-    "nationalist",
-    "trilled",
-    "lodging",
-    "immensity",
-    "grandchildren",
-    "where're",
-    "alight",
-    "portugal",
-    "bouquets",
-    "schmidt",
-    "swindled",
-    "officielle",
-    "muttered",
-    "infected",
-    "sage",
-    "amusing",
-    "consign",
-    "enclosed",
-    "1700",
-    "exemplified",
-    "semitrance",
-    "customhouse",
-    "frankie",
-    "bam",
-    "nightmarish",
-    "accosted",
-    "complexion",
-    "adcock",
-    "entities",
-    "pulsating",
-    "periodicals",
-    "perennially",
-    "baser",
-    "6-4-2",
-    "congress'",
-    "earnest",
-    "cicero",
-    "half-filled",
-    "rotten",
-    "kc",
-    "princes",
-    "lovejoy",
-    "predispositions",
-    "tigris",
-    "outboard",
-    "scandals",
-    "behan",
-    "expeditions",
-    "memorialized",
-    "thereupon",
-    "9.3",
-    "livery",
-    "noises",
-    "nightmares",
-    "likes",
-    "64-66",
-    "denominationally",
-    "$110",
-    "shrub",
-    "perilla",
-    "half-aloud",
-    "splash",
-    "figures",
-    "orchids",
-    "pre-decoration",
-    "proclaims",
-    "hazelnuts",
-    "werner",
-    "tailor",
-    "frock",
-    "paranormal",
-    "grindlay",
-    "everyone's",
-    "1850's",
-    "practicable",
-    "long-familiar",
-    "hickory",
-    "cheek",
-    "melt",
-    "transmits",
-    "imperialists",
-    "warmer",
-    "ungainly",
-    "dang",
-    "immorality",
-    "maltreat",
-    "atrocities",
-    "jenks",
-    "22%",
-    "spring",
-    "manages",
-    "tidewater",
-    "where",
-    "ferries",
-    "transmittable",
-    "1852",
-    "principal",
-    "'51",
-    "survey",
-    "free-lance",
-    "there's",
-    "admiringly",
-    "worries",
-    "yoneda",
-    "derriere",
-    "nursing",
-    "item-categories",
-    "maple",
-    "child-bearing",
-    "developing",
-    "dented",
-    "corded",
-    "overfall",
-    "jeannie",
-    "tendered",
-    "disinterest",
-    "expansion",
-    "overtly",
-    "commercants",
-    "okay",
-    "regain",
-    "stashed",
-    "luminaries",
-    "ganges",
-    "alloy",
-    "continuously",
-    "collared",
-    "belched",
-    "hinders",
-    "fogg",
-    "pittsburghers",
-    "serious",
-    "transcend",
-    "545-yard",
-    "house",
-    "testily",
-    "stinging",
-    "knightly",
-    "precluded",
-    "architectures",
-    "moliere",
-    "soft-looking",
-    "auto-europe",
-    "slitter",
-    "robed",
-    "hopeful",
-    "serenity",
-    "bolt-action",
-    "verbally",
-    "lottery",
-    "boundless",
-    "immaturity",
-    "detained",
-    "talents",
-    "recur",
-    "beings",
-    "tall",
-    "grandstand",
-    "pre-war",
-    "1787",
-    "bumpin",
-    "283",
-    "lauder",
-    "arithmetical",
-    "remarque",
-    "so",
-    "tin",
-    "apiece",
-    "shoddy",
-    "rumor",
-    "ga.",
-    "shevchenko",
-    "reviewed",
-    "resolves",
-    "cold-war",
-    "artistry",
-    "finnegan",
-    "biopsy",
-    "salaried",
-    "antonini",
-    "50'",
-    "artillery",
-    "seizure",
-    "evangelism",
-    "non-discrimination",
-    "passer-by",
-    "music-loving",
-    "sylvie",
-    "newton's",
-    "scatterbrained",
-    "recounting",
-    "beard",
-    "prepare",
-    "appeals",
-    "tibet",
-    "hypocrisies",
-    "forced",
-    "unload",
-    "tokens",
-    "sighed",
-    "formalism",
-    "youths",
-    "dunn",
-    "five-cent",
-    "presently",
-    "being",
-    "rafters",
-    "tread",
-    "lamar",
-    "senseless",
-    "catherine's",
-    "problematic",
-    "9'",
-    "locally",
-    "trippin'",
-    "x-region",
-    "party",
-    "howe's",
-    "gianicolo",
-    "ballards",
-    "cathedrals",
-    "toil",
-    "freddie",
-    "stair",
-    "planeten",
-    "hatred",
-    "21-inch",
-    "durante",
-    "han'",
-    "exacerbates",
-    "timbered",
-    "mgm",
-    "actor",
-    "predictability",
-    "doubte",
-    "fail",
-    "commissary",
-    "tightened",
-    "airstrips",
-    "bio-",
-    "fitting",
-    "wm.",
-    "paramilitary",
-    "wastrel",
-    "sling",
-    "disquietude",
-    "encyclopedias",
-    "defects",
-    "lamps",
-    "teddy",
-    "grip",
-    "06-05",
-    "mechanic",
-    "crags",
-    "assessing",
-    "cultured",
-    "camped",
-    "regal",
-    "numenous",
-    "demographie",
-    "3211",
-    "cafritz",
-    "flannagans",
-    "burford",
-    "respects",
-    "white",
-    "snuggled",
-    "viewer",
-    "berry's",
-    "90,000",
-    "misinformation",
-    "earns",
-    "restrictive",
-    "'nother",
-    "immutable",
-    "trumpet",
-    "seeped",
-    "lever-action",
-    "terg-o-tometer",
-    "unreality",
-    "cyril",
-    "nine-to-five",
-    "haute",
-    "150,000,000",
-    "16.7",
-    "insubstantial",
-    "acoustical",
-    "10:50",
-    "assortment",
-    "rolette",
-    "clonic",
-    "pollen",
-    "$2,000",
-    "runt",
-    "skinnin'",
-    "malignancies",
-    "swearing",
-    "turn-out",
-    "u.m.t.",
-    "aisle",
-    "handsome",
-    "galindez",
-    "respecting",
-    "52-year",
-    "accademia",
-    "bridge",
-    "evergreen",
-    "hoof-and-mouth",
-    "macpherson",
-    "scarf",
-    "seats",
-    "one's",
-    "watson-watt's",
-    "slumbered",
-    "edgardo",
-    "erratic",
-    "new-england",
-    "overflowing",
-    "crumb",
-    "catapults",
-    "sopranos",
-    "gentle",
-    "enforceable",
-    "binoculars",
-    "power",
-    "toner",
-    "clasping",
-    "stony-meteorite",
-    "pam's",
-    "shuffling",
-    "guevara",
-    "blot-appearance",
-    "bloomed",
-    "nutritive",
-    "mah-jongg",
-    "mccay",
-    "cases",
-    "2454",
-    "archuleta",
-    "1213",
-    "periodicity",
-    "sorbed",
-    "detonation",
-    "hanged",
-    "exterminating",
-    "verandah",
-    "maurice",
-    "spell-binding",
-    "poppyseed",
-    "archaism",
-    "tropic",
-    "middle-school",
-    "siebern",
-    "subordinated",
-    "acted",
-    "hamrick",
-    "brumidi",
-    "slippage",
-    "shoe",
-    "40-year-old",
-    "threshed",
-    "dulles",
-    "piepsam",
-    "cyrus",
-    "pinioned",
-    "-.50",
-    "prepositional",
-    "affirms",
-    "wanted",
-    "trifling",
-    "ignores",
-    "readiness",
-    "3/8-inch-thick",
-    "infantry",
-    "happiest",
-    "gallery",
-    "franks",
-    "plain-clothesmen",
-    "autos",
-    "reappraisals",
-    "bashful",
-    "smart",
-    "scaled",
-    "wiggle",
-    "miliaris",
-    "wangemans",
-    "single-seeded",
-    "quod",
-    "collingwood",
-    "overweight",
-    "money-maker",
-    "coatings",
-    "glacier-like",
-    "chaulmoogra",
-    "gainful",
-    "labor-saving",
-    "nods",
-    "drifts",
-    "seabrook",
-    "pernicious",
-    "backbone",
-    "physician",
-    "enunciate",
-    "coincidences",
-    "multi-millionaire",
-    "sarsaparilla",
-    "partners",
-    "afternoon's",
-    "moods",
-    "holier-than-thou",
-    "earnings",
-    "sheds",
-    "blenheim",
-    "rangers",
-    "boone",
-    "those",
-    "material/hr./*0f./in.",
-    "bad-fitting",
-    "soviet",
-    "pati",
-    "sacredness",
-    "reform",
-    "quivers",
-    "heir",
-    "dak.",
-    "unmalicious",
-    "double-breasted",
-    "moriarty's",
-    "citizenry",
-    "reassuring",
-    "technical-ladder",
-    "patriarchal",
-    "knoll",
-    "laissez-faire",
-    "vp",
-    "schiele",
-    "feyer's",
-    "trilogy",
-    "stomping",
-    "residue",
-    "fives",
-    "let's-make-your-house-our-club",
-    "killable",
-    "one-act",
-    "flouting",
-    "1821",
-    "zip",
-    "walbridge",
-    "glycerol",
-    "scabbed",
-    "chief's",
-    "donor",
-    "redding",
-    "$8,555",
-    "decentralizing",
-    "7,500",
-    "loose-loaded",
-    "seventy-eight",
-    "non-wage",
-    "gums",
-    "amiable",
-    "saxton's",
-    "outgeneraled",
-    "cetera",
-    "subliterary",
-    "orwell's",
-    "purifying",
-    "tanganika",
-    "epsom",
-    "bennington",
-    "substitutionary",
-    "intelligible",
-    "enthralled",
-    "jammed",
-    "freed",
-    "somerville",
-    "crowder",
-    "cautions",
-    "speculations",
-    "instructions",
-    "mystic",
-    "slight",
-    "therefores",
-    "ruiz",
-    "korman",
-    "industrialization",
-    "orville",
-    "haggle",
-    "shacks",
-    "expandable",
-    "skimming",
-    "imploring",
-    "racketeers",
-    "foremost",
-    "swarming",
-    "work-outs",
-    "babies",
-    "tara",
-    "plump",
-    "neptune",
-    "merchants",
-    "rationalizations",
-    "pushes",
-    "calculable",
-    "horseflesh",
-    "vociferous",
-    "pinks",
-    "brig.",
-    "hydrocarbons",
-    "sweat",
-    "byrnes",
-    "crouched",
-    "impurity-doped",
-    "slater",
-    "unjustified",
-    "antibodies",
-    "respondent's",
-    "sawnders",
-    "perkins",
-    "lizard's",
-    "chieti",
-    "emerging",
-    "stratosphere",
-    "inboards",
-    "brutalities",
-    "recital",
-    "oceania",
-    "nursery-",
-    "egotist's",
-    "ping-pong",
-    "psychologists",
-    "yours",
-    "massey-ferguson",
-    "floradora",
-    "pad",
-    "unaware",
-    "never-to-be-forgotten",
-    "fiddling",
-    "attaining",
-    "chandelier",
-    "end-use",
-    "friendliness",
-    "gyrations",
-    "haynes",
-    "theatergoers",
-    "premier",
-    "sociology",
-    "intermediates",
-    "left",
-    "milman",
-    "sprite",
-    "dystrophy",
-    "drainage",
-    "monstrosity",
-    "payroll",
-    "aimlessly",
-    "value-judgments",
-    "ram",
-    "irene",
-    "purges",
-    "staged",
-    "tartly",
-    "ruthlessly",
-    "papery",
-    "monarch",
-    "derision",
-    "straightening",
-    "altho",
-    "banshee",
-    "friendships",
-    "waitress",
-    "collections",
-    "hairdos",
-    "sierras",
-    "vet",
-    "cipriani's",
-    "elijah",
-    "impute",
-    "romantick",
-    "arrangers",
-    "ounce",
-    "vied",
-    "overcast",
-    "giustiniani",
-    "predisposed",
-    "concurred",
-    "pervaporation",
-    "idled",
-    "inexorably",
-    "beatniks",
-    "grey's",
-    "rioters",
-    "bar-buddy",
-    "congregationalists",
-    "however",
-    "densest",
-    "mocking",
-    "traffic",
-    "militarism",
-    "neisse",
-    "god-like",
-    "thyroid-stimulating",
-    "attacker",
-    "dismal",
-    "dates",
-    "furlough",
-    "ostensible",
-    "no-goal",
-    "striptease",
-    "ymca",
-    "communism",
-    "beep",
-    "vandals",
-    "britons",
-    "nation-state",
-    "supra-personal",
-    "swelled",
-    "cockier",
-    "photek",
-    "follows",
-    "pacemaker",
-    "pagan",
-    "exporters",
-    "dipped",
-    "monkey",
-    "frequency-modulation",
-    "tucker",
-    "neonatal",
-    "castroism",
-    "inveterate",
-    "mooncursers",
-    "coat",
-    "ruffles",
-    "finisher",
-    "chaw",
-    "eleventh-floor",
-    "realigning",
-    "forty-niners",
-    "gasping",
-    "aberrant",
-    "spats",
-    "raises",
-    "midwesterners",
-    "assisted",
-    "metamorphosed",
-    "blunder",
-    "event",
-    "cahill",
-    "apocryphal",
-    "milhaud",
-    "romantics",
-    "differing",
-    "littlest",
-    "risks",
-    "figuring",
-    "grounded",
-    "petersburg",
-    "contempt",
-    "cashmere",
-    "loom",
-    "filmstrips",
-    "prunes",
-    "montevideo",
-    "early",
-    "makings",
-    "tims",
-    "precociously",
-    "fibrosis",
-    "kkk",
-    "19th",
-    "swine",
-    "rats",
-    "cost",
-    "probly",
-    "tells",
-    "pots",
-    "veering",
-    "uncommonly",
-    "microscopically",
-    "two-dimensional",
-    "reticulate",
-    "attempting",
-    "hallelujah",
-    "ex-gambler",
-    "stepped-up",
-    "survival",
-    "waffles",
-    "harper",
-    "codification",
-    "milling",
-    "b-52's",
-    "stead",
-    "scraggly",
-    "rehearing",
-    "assayed",
-    "pleading",
-    "voyage",
-    "turkish",
-    "robot",
-    "20-year-old",
-    "2'",
-    "initiating",
-    "mijbil's",
-    "anselm's",
-    "boy-marquita",
-    "ocean-going",
-    "michilimackinac",
-    "prospects",
-    "mid-1948",
-    "fawn-colored",
-    "free-wheeling",
-    "relationship-building",
-    "time",
-    "camaret",
-    "bivouac",
-    "artists'",
-    "ten-month",
-    "grovers",
-    "meminisse",
-    "drained",
-    "bizet's",
-    "duller",
-    "officiate",
-    "slaying",
-    "spear",
-    "mild-voiced",
-    "arousal",
-    "battalion",
-    "mechanism",
-    "adirondacks",
-    "candidates'",
-    "planoconcave",
-    "940y",
-    "sixth",
-    "cherkasov",
-    "growth",
-    "cubism",
-    "tireless",
-    "smear",
-    "espoused",
-    "stacey",
-    "stultifying",
-    "minutemen",
-    "folder",
-    "bimonthly",
-    "manning's",
-    "kirkwood",
-    "lactating",
-    "improved",
-    "shampoo",
-    "autumnal",
-    "protogeometric",
-    "unconcernedly",
-    "unshelled",
-    "expectations",
-    "domestic",
-    "chevaux",
-    "hunched-up",
-    "flynn",
-    "boyish",
-    "instructional",
-    "polybutene",
-    "leavening",
-    "foolish",
-    "socialization",
-    "germany's",
-    "endurable",
-    "transition",
-    "puttering",
-    "bustlin'",
-    "eldon",
-    "armhole",
-    "buzzes",
-    "airless",
-    "sovereign",
-    "allen's",
-    "worsens",
-    "shinbone",
-    "1.1",
-    "flocking",
-    "furthered",
-    "fanaticism",
-    "frequencies",
-    "ike's",
-    "adduce",
-    "amanuensis",
-    "lester's",
-    "dollar-de",
-    "1-ml",
-    "motioned",
-    "legers",
-    "sellers'",
-    "dispassionately",
-    "shakespeare",
-    "vote",
-    "gladius",
-    "weeds",
-    "tranquil",
-    "unreasonable",
-    "gagged",
-    "cockeyed",
-    "y.",
-    "pengally",
-    "4:05",
-    "grinned",
-    "rae",
-    "1984",
-    "starve",
-    "martyr",
-    "microorganism",
-    "moosilauke",
-    "buries",
-    "7-9",
-    "execute",
-    "steele",
-    "easygoing",
-    "policeman",
-    "1880s",
-    "pogroms",
-    "propel",
-    "resent",
-    "move",
-    "2.5%",
-    "bronzed",
-    "addicted",
-    "edmov",
-    "inserted",
-    "marmalade",
-    "margaret",
-    "lending",
-    "restraint",
-    "shot",
-    "taussig",
-    "koshare",
-    "reunite",
-    "satiate",
-    "hughes'",
-    "taunts",
-    "lacerate",
-    "inventing",
-    "machine-gun",
-    "congeniality",
-    "frolics",
-    "porta",
-    "imperceptibly",
-    "arouses",
-    "nikko",
-    "q3",
-    "hoaps",
-    "rattail",
-    "self-satisfaction",
-    "contribution",
-    "limited-time",
-    "icbms",
-    "celebrated",
-    "resistant",
-    "lowers",
-    "dark",
-    "begrudge",
-    "additional",
-    "half-hour",
-    "propylthiouracil",
-    "barbour",
-    "lawman",
-    "trouble-free",
-    "coffers",
-    "runs",
-    "approximated",
-    "balks",
-    "milestones",
-    "stripes",
-    "schley",
-    "607",
-    "pregnant",
-    "loss",
-    "espionage",
-    "hop",
-    "dutchess",
-    "mike's",
-    "flopped",
-    "direct",
-    "lax",
-    "fifty-nine",
-    "divinity",
-    "superlunary",
-    "pohly",
-    "garnet",
-    "eric",
-    "fennel",
-    "episode",
-    "beggar",
-    "1/4-inch",
-    "overtake",
-    "cowbird",
-    "woodcarver",
-    "mausoleum",
-    "unemotional",
-    "worshiping",
-    "gallon",
-    "metaphysics",
-    "ballestre",
-    "fecundity",
-    "sh-ts",
-    "ideologies",
-    "burr-headed",
-    "vanities",
-    "mission",
-    "parade",
-    "hutchinson",
-    "bartha",
-    "inundated",
-    "subroutines",
-    "chain-reaction",
-    "closely-packed",
-    "whole-word",
-    "cf.",
-    "jaggedly",
-    "brethren",
-    "radiating",
-    "chisels",
-    "lucked",
-    "comin'",
-    "comico-romantico",
-    "christians",
-    "driver",
-    "short-changing",
-    "spectroscopy",
-    "felon",
-    "stability",
-    "reik",
-    "stockbroker",
-    "omnipotence",
-    "rustlin'",
-    "gar-dene",
-    "metamorphosis",
-    "edmund",
-    "bogey",
-    "2:30.3-:35.3",
-    "wetlands",
-    "rivets",
-    "decrease",
-    "beowulf's",
-    "mammoth",
-    "enlargement",
-    "clammy",
-    "pop",
-    "hatching",
-    "upgrading",
-    "reject",
-    "moves",
-    "re-establishing",
-    "torn",
-    "formosa",
-    "traditionally",
-    "synagogues",
-    "goldwater",
-    "sixty-five-mile",
-    "specifically",
-    "selkirk's",
-    "over-hand",
-    "sloe",
-    "chooses",
-    "fortunate",
-    "tsvetkov",
-    "peepy",
-    "ankle-deep",
-    "french",
-    "putty-like",
-    "nutritious",
-    "filler",
-    "triandos",
-    "deja",
-    "spouting",
-    "growth-stunting",
-    "socal",
-    "hoijer",
-    "lazy",
-    "performs",
-    "straws",
-    "maids",
-    "darting",
-    "cerebrated",
-    "approximations",
-    "pencil-pusher",
-    "misogynist",
-    "graveyards",
-    "shearing's",
-    "thay",
-    "engrossing",
-    "apses",
-    "compassionately",
-    "food",
-    "sensuality",
-    "taste",
-    "bunk",
-    "primes",
-    "lucidity",
-    "surfaceness",
-    "power-seek",
-    "terminiello",
-    "ailments",
-    "chorines",
-    "meantime",
-    "irrigating",
-    "accomplices",
-    "radioclast",
-    "heavens",
-    "landlord's",
-    "penny",
-    "crimean",
-    "strumming",
-    "1914-1918",
-    "wavers",
-    "insulator",
-    "racists",
-    "sallying",
-    "2.6",
-    "anyhow",
-    "sterilization",
-    "involutions",
-    "dragnet",
-    "substantively",
-    "transoceanic",
-    "ceartaine",
-    "guiltless",
-    "newspapers",
-    "purism",
-    "coincide",
-    "unreeling",
-    "prosecuted",
-    "rdws",
-    "proponents",
-    "counterman",
-    "junior-philosophical",
-    "topsy-turvy",
-    "bruhn",
-    "axiological",
-    "well-prepared",
-    "westinghouse",
-    "imposing",
-    "boast",
-    "uglier",
-    "spruce",
-    "rockets",
-    "weltanschauung",
-    "submucosa",
-    "yahwe",
-    "fifty-three",
-    "'?'",
-    "kohi",
-    "trig's",
-    "crumble",
-    "barataria",
-    "rationed",
-    "dutchman",
-    "madeleine",
-    "thursday's",
-    "crockett",
-    "storage",
-    "rabat",
-    "venus",
-    "burial",
-    "recanted",
-    "syndicated",
-    "refugee",
-    "fertilizers",
-    "out-of-town",
-    "taurida",
-    "morals",
-    "badminton",
-    "$17,000,000",
-    "journalist",
-    "boris'",
-    "1953",
-    "hyndman",
-    "sherbet-colored",
-    "bank",
-    "scairt",
-    "cowman",
-    "u-2",
-    "groat",
-    "ass'n",
-    "redeemed",
-    "stunt",
-    "graybeard",
-    "cliques",
-    "friend's",
-    "fragonard",
-    "explosively",
-    "56",
-    "congressmen",
-    "alternation",
-    "self-awareness",
-    "sara",
-    "seoul",
-    "vesicular",
-    "irina",
-    "buttonholes",
-    "low-pitched",
-    "great-grandmother",
-    "haney",
-    "nomias",
-    "near-misses",
-    "whitewashed",
-    "3.4",
-    "bluebonnets",
-    "men-of-war",
-    "demage",
-    "grinding",
-    "jump",
-    "purple",
-    "policy",
-    "hurler",
-    "cognitive",
-    "areosol",
-    "idly",
-    "super-charged",
-    "synthesizine",
-    "crystallographers",
-    "dapper",
-    "sickness",
-    "translated",
-    "scanners",
-    "communicate",
-    "cornerstone",
-    "transience",
-    "neglect",
-    "tidings",
-    "squatting",
-    "catinari",
-    "snags",
-    "rinascimento",
-    "space",
-    "minn.",
-    "least",
-    "magistrate",
-    "immensely",
-    "taking",
-    "contraceptives",
-    "debating",
-    "capitoline",
-    "frolic",
-    "germantown",
-    "duclos",
-    "stories",
-    "transfusions",
-    "bringing",
-    "archenemy",
-    "bushel",
-    "remedial",
-    "160-degrees-f",
-    "$250",
-    "input",
-    "oskar",
-    "centum",
-    "collect",
-    "dependent",
-    "presentational",
-    "quitting",
-    "cordier's",
-    "tulips",
-    "ewen",
-    "aide-de-camp",
-    "monsters",
-    "fumes",
-    "8-year-old",
-    "ensconced",
-    "harmful",
-    "nominated",
-    "consultative",
-    "math",
-    "ed.",
-    "instructive",
-    "woolgather",
-    "zigzagging",
-    "champ",
-    "contradicted",
-    "nlrb",
-    "unchristian",
-    "gus",
-    "$7,000",
-    "co-workers",
-    "helmet",
-    "verdant",
-    "terrifies",
-    "clemence",
-    "stuffy",
-    "down-to-earth",
-    "avoids",
-    "kolb",
-    "'im",
-    "ramey's",
-    "yoshimoto's",
-    "tipping",
-    "fulminate",
-    "jarvis",
-    "542,250",
-    "antiquarians",
-    "sentimentality",
-    "incidentals",
-    "red",
-    "antique",
-    "coinciding",
-    "dramatizing",
-    "medecine",
-    "thickets",
-    "1819",
-    "geologists",
-    "flor",
-    "officer's",
-    "invasion-theory",
-    "dynamo",
-    "non-greek",
-    "unlamented",
-    "ever-present",
-    "herold",
-    "observances",
-    "specifications",
-    "poisoning",
-    "roberta",
-    "retains",
-    "communicative",
-    "parsley",
-    "diehard",
-    "emulsified",
-    "pinnacle",
-    "despair",
-    "substratum",
-    "plaques",
-    "occurrences",
-    "material-formal",
-    "quickness",
-    "jellinek's",
-    "forked",
-    "dandelion",
-    "scuttled",
-    "leamington",
-    "persian",
-    "elder",
-    "precisely",
-    "feat",
-    "hesiometer",
-    "burnham",
-    "hesitantly",
-    "charles's",
-    "olympic",
-    "turnover",
-    "highpoint",
-    "redneck",
-    "marcius",
-    "sp-44005",
-    "herrington",
-    "hino's",
-    "slaughter",
-    "ephemeral",
-    "woolworkers",
-    "collar",
-    "cushions",
-    "inter",
-    "asparagus",
-    "pegler",
-    "nogol",
-    "super-empirical",
-    "sniffed",
-    "tickets",
-    "pigeons",
-    "pharmacological",
-    "61",
-    "dehumidified",
-    "renowned",
-    "open-handed",
-    "prettily",
-    "fancying",
-    "employe",
-    "fruitfully",
-    "perfectionism",
-    "92.5",
-    "choctaw",
-    "liberal-conservative",
-    "single-valued",
-    "tonio",
-    "decelerate",
-    "feasts",
-    "diplomat",
-    "hydrido",
-    "grecian",
-    "270",
-    "corroborated",
-    "tousled",
-    "sticking",
-    "proscribe",
-    "graphs",
-    "bitten",
-    "ch'in",
-    "8-1/2-foot",
-    "martha",
-    "longevity",
-    "humanistic",
-    "yuba",
-    "wry-faced",
-    "louchheim",
-    "virtue",
-    "feudalistic",
-    "staff's",
-    "lobbies",
-    "turnpike",
-    "shirt",
-    "commendation",
-    "wellman",
-    "mannerisms",
-    "auerbach's",
-    "miranda's",
-    "pa.",
-    "testified",
-    "pseudo-anthropological",
-    "afforded",
-    "adjudged",
-    "chapel",
-    "self-locking",
-    "min",
-    "postmen",
-    "reference-points",
-    "adverbial",
-    "kitty's",
-    "buffalo",
-    "parasympathetic",
-    "jaycee",
-    "nagel",
-    "ramps",
-    "boland",
-    "assuring",
-    "indies",
-    "apprenticed",
-    "anti-b",
-    "o'banion's",
-    "adagios",
-    "mando",
-    "earthmen",
-    "overland",
-    "brick",
-    "recourse",
-    "asterisks",
-    "dog",
-    "professing",
-    "apogee",
-    "quoted",
-    "sideboards",
-    "culpas",
-    "bureaucratic",
-    "esquire",
-    "2a",
-    "dominican",
-    "telegraphy",
-    "flashing",
-    "bond",
-    "studded",
-    "ranchers",
-    "1950",
-    "neither",
-    "lagers",
-    "arts",
-    "ten-minute",
-    "centrifuge",
-    "threes",
-    "thoughtful",
-    "apocalyptic",
-    "pacem",
-    "shaffner",
-    "stake-out",
-    "abner",
-    "intimated",
-    "manila",
-    "madama",
-    "heralded",
-    "canopy",
-    "philosophers",
-    "concussion",
-    "tallahoosa",
-    "sincerity",
-    "cuisine",
-    "paide",
-    "pettinesses",
-    "taffy",
-    "outer",
-    "magazine",
-    "singed",
-    "profess",
-    "egotist",
-    "stansbery",
-    "1558",
-    "librettists",
-    "sinatra",
-    "robberies",
-    "bravery",
-    "fuck",
-    "togetherness",
-    "point",
-    "sheriff's",
-    "unimpressive",
-    "mergers",
-    "113",
-    "spinrad",
-    "staircase",
-    "outposts",
-    "godsend",
-    "duplication",
-    "spilling",
-    "demoted",
-    "tints",
-    "division",
-    "kitty",
-    "would",
-    "chocolate",
-    "unaided",
-    "st.",
-    "peasants",
-    "curie",
-    "vivian's",
-    "dabbler",
-    "storyteller",
-    "ceil",
-    "convert",
-    "racetrack",
-    "housekeeper",
-    "red-faced",
-    "disillusionment",
-    "twined",
-    "simplistic",
-    "dandy",
-    "fill-in",
-    "forego",
-    "incisiveness",
-    "retrogradations",
-    "ascribes",
-    "influential",
-    "tea",
-    "cave-like",
-    "utter",
-    "untreated",
-    "4.77",
-    "abolitionist",
-    "black-crowned",
-    "tersely",
-    "midwife",
-    "qui",
-    "pastoral",
-    "berthelier",
-    "egg",
-    "universals",
-    "scan",
-    "'58",
-    "pre-set",
-    "letch's",
-    "park",
-    "y",
-    "tents",
-    "thermometer",
-    "ill-fated",
-    "ultraviolet",
-    "urgings",
-    "steelmaker",
-    "breuer",
-    "riggers",
-    "9-11",
-    "mcnear",
-    "appestat",
-    "mills's",
-    "mouth",
-    "hearts",
-    "0",
-    "goddamn",
-    "mightily",
-    "noire",
-    "minuet",
-    "fitzgerald",
-    "conceals",
-    "diametric",
-    "jones'",
-    "operands",
-    "descendents",
-    "forecast",
-    "jutish",
-    "renders",
-    "undismayed",
-    "an",
-    "resented",
-    "disapprove",
-    "aurally",
-    "predilections",
-    "lieutenant-colonel",
-    "st-story",
-    "externally",
-    "thief",
-    "caravan's",
-    "oiticica",
-    "pact",
-    "prophets",
-    "yale-army",
-    "23-36",
-    "spoilage",
-    "scoured",
-    "shredded",
-    "repetition",
-    "negligible",
-    "boredom",
-    "claus",
-    "criss-crossed",
-    "varmint",
-    "flannagans'",
-    "obeys",
-    "bogey-symbol",
-    "compson",
-    "hathaway",
-    "stoppage",
-    "corbin",
-    "affable",
-    "synagogue",
-    "1597",
-    "tarrant",
-    "algol",
-    "intolerance",
-    "employment",
-    "24-hour",
-    "o'hare",
-    "sheathing",
-    "disparities",
-    "uniform",
-    "self-pity",
-    "obliterated",
-    "redemption",
-    "doolittle",
-    "paranoiac",
-    "disciple",
-    "abrogated",
-    "twenty-dollar",
-    "recapture",
-    "anecdote",
-    "topic",
-    "flatly",
-    "adultery",
-    "benet",
-    "shrove",
-    "turquoise",
-    "heathenish",
-    "boards",
-    "sarkees",
-    "singers",
-    "classifications",
-    "1935-1955",
-    "whee",
-    "tumbler",
-    "diversions",
-    "bhoy",
-    "hartselle",
-    "entanglement",
-    "welcoming",
-    "cathy's",
-    "rehabilitations",
-    "begin",
-    "alexei",
-    "railroader",
-    "snazzy",
-    "govern",
-    "chadroe",
-    "inheritance",
-    "epigraph",
-    "sockdologizing",
-    "heretofore",
-    "krishnaists",
-    "weighted",
-    "unwholesome",
-    "radiance",
-    "inflow",
-    "wily",
-    "thinned",
-    "paul",
-    "chases",
-    "cardinal",
-    "predominant",
-    "jovian",
-    "images",
-    "builders",
-    "lethargies",
-    "congestive",
-    "champassak",
-    "desks",
-    "ineffable",
-    "701",
-    "flask",
-    "minnesota's",
-    "rained",
-    "sustaining",
-    "9:00",
-    "daybreak",
-    "norman",
-    "caller",
-    "signal-intensity",
-    "ione",
-    "infuriating",
-    "appanage",
-    "flaky",
-    "37-year-old",
-    "reactor",
-    "paschall",
-    "anti-organization",
-    "multiple-purpose",
-    "arched",
-    "chasing",
-    "ziminska-sygietynska",
-    "judson",
-    "7:00",
-    "gravest",
-    "shorthand",
-    "regulations",
-    "father's",
-    "alarm",
-    "1,512",
-    "oakwood",
-    "fifty-four",
-    "market-place",
-    "king",
-    "family's",
-    "max",
-    "pronouncements",
-    "multiplying",
-    "simpleton",
-    "5",
-    "1955",
-    "eight",
-    "yesiree",
-    "subsidy",
-    "fixtures",
-    "enamelled",
-    "headquarter",
-    "dogmas",
-    "recipients",
-    "hymens",
-    "dominic",
-    "gravity",
-    "hand-to-hand",
-    "resonances",
-    "variance",
-    "possibly",
-    "voiture",
-    "accrues",
-    "495",
-    "handmade",
-    "straining",
-    "people-oriented",
-    "simply",
-    "mustered",
-    "poems-in-drawing-and-type",
-    "scenic",
-    "straight-armed",
-    "player's",
-    "well-molded",
-    "dejectedly",
-    "tests",
-    "y-teen",
-    "carpathians",
-    "fairest",
-    "wappinger",
-    "replenished",
-    "parolees",
-    "swerve",
-    "regency",
-    "london-based",
-    "thunder-purple",
-    "ah6",
-    "$8,313,514",
-    "boies",
-    "flintless",
-    "trophies",
-    "rims",
-    "super-herculean",
-    "sycophantic",
-    "conjure",
-    "caroline",
-    "unerring",
-    "hannah",
-    "mere",
-    "nightshirt",
-    "needled",
-    "confederacy",
-    "symmetrical",
-    "places",
-    "nether",
-    "gallivantin'",
-    "racially",
-    "tonight",
-    "square-mile",
-    "tarpaulins",
-    "polymer",
-    "litigation",
-    "directly",
-    "specious",
-    "non-instinctive",
-    "alessio",
-    "interferometer",
-    "forgery",
-    "70",
-    "rivalled",
-    "categorically",
-    "packets",
-    "predetermined",
-    "bobbins",
-    "champlain",
-    "theodosius",
-    "ministering",
-    "bone-deep",
-    "beards",
-    "cervetto",
-    "sketching",
-    "timeless",
-    "325",
-    "conceal",
-    "johann",
-    "incapacitated",
-    "sacks",
-    "kaganovich",
-    "remounting",
-    "two-inches",
-    "woo",
-    "coste",
-    "schematic",
-    "cathy",
-    "kramer's",
-    "lendrum",
-    "lifeblood",
-    "campsites",
-    "internally",
-    "escadrille",
-    "annee",
-    "collosal",
-    "magnificently",
-    "wordsworth",
-    "seedlings",
-    "desperately",
-    "q",
-    "gynecologist",
-    "10-foot",
-    "selden",
-    "red-bellied",
-    "adulterous",
-    "woodcock",
-    "identically",
-    "mailed-fist-in-velvet-glove",
-    "nullifiers",
-    "10",
-    "at-bats",
-    "fuchsia",
-    "355",
-    "andromache",
-    "moralities",
-    "interviewees",
-    "footballs",
-    "$4,753",
-    "jacques",
-    "recontamination",
-    "gnomes",
-    "hub",
-    "worsted",
-    "seedless",
-    "riflemen",
-    "poupin",
-    "just",
-    "memorandum",
-    "cutoff",
-    "watery",
-    "epilogue",
-    "injunction",
-    "boastfully",
-    "lemonade",
-    "folded",
-    "0.28",
-    "stick",
-    "fairchild",
-    "dust",
-    "ferris",
-    "untracked",
-    "comfort",
-    "haystack",
-    "solace",
-    "elementary-school",
-    "indivisible",
-    "deployment",
-    "poetry",
-    "stickman",
-    "demoralization",
-    "litigant",
-    "dusty-slippered",
-    "calamities",
-    "draft",
-    "memory-picture",
-    "sleepers",
-    "rug",
-    "well-grooved",
-    "work's",
-    "wobbled",
-    "lopped",
-    "futility",
-    "capable",
-    "bride",
-    "half-transparent",
-    "townsman",
-    "snob-clannish",
-    "company's",
-    "intervenes",
-    "y'know",
-    "poor-mouth",
-    "grandparents",
-    "2,090",
-    "avec",
-    "insignificant",
-    "defendants",
-    "prescriptions",
-    "1,230",
-    "reground",
-    "yamata",
-    "blonde",
-    "remunerative",
-    "cast",
-    "capering",
-    "knocking",
-    "sever",
-    "hob",
-    "spattered",
-    "instantaneously",
-    "platinum",
-    "czarina's",
-    "transact",
-    "floorshow",
-    "irelands'",
-    "strikebreakers",
-    "social-political-economical",
-    "holland",
-    "acapulco",
-    "redressed",
-    "shaky",
-    "afternoons",
-    "prospering",
-    "hay",
-    "livable",
-    "9",
-    "noll",
-    "texoma",
-    "extraordinarily",
-    "their's",
-    "odd",
-    "undemocratic",
-    "shacked",
-    "predominates",
-    "mammal",
-    "mineralogy",
-    "attorney",
-    "keystone",
-    "gracefully",
-    "sukarno",
-    "railroad's",
-    "exemplar",
-    "ego",
-    "clusters",
-    "toy",
-    "disrupted",
-    "offer",
-    "rigidity",
-    "mich.",
-    "confidential",
-    "consummation",
-    "bellowed",
-    "vertebral",
-    "upbeat",
-    "sassafras",
-    "positive",
-    "inhibitor",
-    "clergyman's",
-    "economic",
-    "shouders",
-    "sojourners",
-    "mono-unsaturated",
-    "jonathan's",
-    "cloudcroft",
-    "ballyhoo",
-    "allegretti",
-    "1956",
-    "symbolical",
-    "formidably",
-    "seafood",
-    "istvan",
-    "kind",
-    "entirely",
-    "hesitance",
-    "outmatched",
-    "silent",
-    "sinai",
-    "clicking",
-    "american-jewish",
-    "13-5",
-    "rangelands",
-    "uncles",
-    "allegory",
-    "erratically",
-    "diversion",
-    "negotiation",
-    "adjusts",
-    "developments",
-    "getz's",
-    "spying",
-    "boiled",
-    "0.4",
-    "rockers",
-    "saud's",
-    "substantial",
-    "hydride",
-    "wearin'",
-    "innocents",
-    "temptations",
-    "brandel",
-    "midday",
-    "motor",
-    "aboriginal",
-    "federals",
-    "manure",
-    "encumbered",
-    "scornfully",
-    "uninterested",
-    "no.",
-    "council's",
-    "chills",
-    "receptacle",
-    "29-oct.",
-    "genera",
-    "downgrade",
-    "dec.",
-    "devastating",
-    "californians",
-    "dreiser",
-    "two-weeks",
-    "enlivened",
-    "doorbell",
-    "version",
-    "belting",
-    "dogma",
-    "materiel",
-    "comedians",
-    "fur",
-    "attactive",
-    "$.07",
-    "no-one",
-    "groundless",
-    "crocodile",
-    "epidemiological",
-    "outnumbered",
-    "globocnik's",
-    "soberly",
-    "petermann",
-    "1965",
-    "citywide",
-    "bungled",
-    "salfininistas",
-    "double-strength",
-    "gioconda",
-    "declarative",
-    "phis",
-    "monopolists",
-    "maudlin",
-    "journey",
-    "triamcinolone",
-    "thread",
-    "1750",
-    "merciless",
-    "borrower",
-    "contradiction",
-    "kraut",
-    "precut",
-    "olive-flushed",
-    "electromagnet",
-    "charlotte",
-    "pales",
-    "rucellai",
-    "hypertrophy",
-    "linen",
-    "gradually",
-    "stray",
-    "galling",
-    "driveways",
-    "thyratron",
-    "blake",
-    "moth",
-    "textile's",
-    "austin's",
-    "penetration",
-    "bounding",
-    "nishimo",
-    "equivalent",
-    "daniel",
-    "levied",
-    "acorns",
-    "depends",
-    "rodney-honor",
-    "barnumville",
-    "dweller",
-    "anti-castro",
-    "tizard",
-    "darn",
-    "1958",
-    "180-degrees",
-    "slippery",
-    "creamy",
-    "neon-lit",
-    "louisiane",
-    "harrumphing",
-    "caterpillar",
-    "splashes",
-    "digging",
-    "boot-wearer",
-    "spectacular",
-    "overly",
-    "redheaded",
-    "submissive",
-    "postmaster",
-    "augmented",
-    "maryland",
-    "everybody's",
-    "badura-skoda-vienna",
-    "1639-40",
-    "bailiff",
-    "savoy",
-    "phillip",
-    "overblown",
-    "chloride",
-    "strafe",
-    "powdery",
-    "5.7",
-    "determined",
-    "piously",
-    "reorganized",
-    "1a",
-    "cotter's",
-    "parameter",
-    "tuxedoed",
-    "groggins",
-    "memory-pictures",
-    "rat-holes",
-    "encyclopedia",
-    "reveled",
-    "father-and-son",
-    "cadaverous",
-    "antagonisms",
-    "objects",
-    "coccidioidomycosis",
-    "war",
-    "equine",
-    "nationwide",
-    "berlin's",
-    "data-handling",
-    "customers'",
-    "rasped",
-    "corinthian",
-    "catered",
-    "society",
-    "nordmann",
-    "upheaval",
-    "scientifique",
-    "mid-victorian",
-    "rationing",
-    "squabbles",
-    "detente",
-    "$60",
-    "consonance",
-    "urethanes",
-    "sector",
-    "speer",
-    "pl.",
-    "birth",
-    "corners",
-    "ointment",
-    "buried",
-    "fledermaus",
-    "parkersburg",
-    "bicarbonate",
-    "kasavubu",
-    "magnetic",
-    "chicks",
-    "flattering",
-    "bitter",
-    "selkirk",
-    "inquiring",
-    "battlements",
-    "giulietta",
-    "treats",
-    "tree",
-    "scowled",
-    "boosted",
-    "affinity",
-    "melies",
-    "everything",
-    "challenged",
-    "hatfield",
-    "chafe",
-    "satis",
-    "madeira",
-    "relieving",
-    "firm",
-    "cherubim",
-    "therewith",
-    "preoccupies",
-    "diaphanous",
-    "komurasaki",
-    "wheel",
-    "chancel",
-    "conformists",
-    "liberty's",
-    "welled",
-    "perilous",
-    "donate",
-    "carrara",
-    "pulling",
-    "durkheim",
-    "climbing",
-    "strikes",
-    "blubber",
-    "giovanni",
-    "began",
-    "woven",
-    "guidebook",
-    "handlers",
-    "knife-grinder",
-    "liner",
-    "7a",
-    "circulated",
-    "anhwei",
-    "ponce",
-    "townships",
-    "rages",
-    "interviewer",
-    "seeing",
-    "2.8",
-    "belowground",
-    "railway-based",
-    "rogues",
-    "decks",
-    "colleague",
-    "mobility",
-    "revolve",
-    "sentence",
-    "$.105",
-    "54th",
-    "cancellation",
-    "prescription",
-    "upset",
-    "introverted",
-    "increased",
-    "reviewer",
-    "upraised",
-    "one-two-three",
-    "there'll",
-    "tired",
-    "woodsmoke",
-    "cosmology",
-    "psychiatric",
-    "three-men-and-a-helper",
-    "ankle",
-    "cross",
-    "chalidale",
-    "mid-century",
-    "rejected",
-    "rude",
-    "wash-outs",
-    "seven-o'clock",
-    "lumpy",
-    "stoned",
-    "imitators",
-    "besieged",
-    "adaptaplex",
-    "prodding",
-    "schoolgirlish",
-    "chabrier",
-    "ninety-six",
-    "unsettled",
-    "cunard",
-    "guessed",
-    "shown",
-    "gigenza",
-    "fighting",
-    "unattached",
-    "sunk",
-    "attends",
-    "one-armed",
-    "manye",
-    "1731",
-    "final",
-    "pamela",
-    "discredited",
-    "cal.",
-    "scratchiness",
-    "151",
-    "styling",
-    "interstices",
-    "confesses",
-    "richer",
-    "abstractedness",
-    "metropolian",
-    "unbelievably",
-    "$57,500",
-    "mononuclear",
-    "haliburton",
-    "worktable",
-    "thunderous",
-    "inaugural",
-    "illicit",
-    "self-plagiarisms",
-    "brig",
-    "disgraced",
-    "intertwined",
-    "revetments",
-    "absurd",
-    "pipes",
-    "hopelessly",
-    "dumont",
-    "outputting",
-    "erwin",
-    "temporary",
-    "bends",
-    "aeternitatis",
-    "gesticulated",
-    "schopenhauer",
-    "remembrances",
-    "clattered",
-    "cr",
-    "interposing",
-    "canvassing",
-    "wpa",
-    "tax-freedom",
-    "firepower",
-    "preconceived",
-    "agatha",
-    "bolshoi",
-    "stylish",
-    "ginger",
-    "hagner",
-    "fanshawe",
-    "capercailzie",
-    "gardenias",
-    "munch",
-    "ruth's",
-    "sinking",
-    "rangy",
-    "important-looking",
-    "millidegree",
-    "little-girl",
-    "shrouded",
-    "puppet",
-    "ghent",
-    "glottal",
-    "cabs",
-    "gainers",
-    "hiked",
-    "lowell",
-    "wherein",
-    "addressees",
-    "ferment",
-    "wrestlings",
-    "polls",
-    "sweat-suits",
-    "ideally",
-    "approachable",
-    "swedes",
-    "rite",
-    "gun-shot",
-    "unuttered",
-    "interplanetary",
-    "ptolemy",
-    "bordered",
-    "metropolis",
-    "terpers",
-    "speeded",
-    "unity",
-    "gagging",
-    "kodyke",
-    "scowling",
-    "winnow",
-    "duds'd",
-    "drug",
-    "poems",
-    "sultan",
-    "schubert's",
-    "sonny",
-    "shocking",
-    "quebec",
-    "rogues'",
-    "surprising",
-    "bloodstream",
-    "paper's",
-    "rapunzel",
-    "chips",
-    "danbury",
-    "260",
-    "orchesis",
-    "milenoff",
-    "microphones",
-    "schweitzers",
-    "two-by-fours",
-    "neo-dadaist",
-    "underclassman",
-    "mlle",
-    "monitors",
-    "childe",
-    "shepherd's",
-    "mystics",
-    "trustfully",
-    "moniuszko's",
-    "mossberg",
-    "wide-winged",
-    "miltonic",
-    "lorraine",
-    "unleashing",
-    "dieters",
-    "o.e.c.d.",
-    "inhibitors",
-    "texts",
-    "wade-evans",
-    "dueling",
-    "thorny",
-    "corkscrew",
-    "descended",
-    "melodramatic",
-    "teacher-employee",
-    "preconditioned",
-    "acknowledging",
-    "chart",
-    "horowitz",
-    "venturi",
-    "bramante's",
-    "choppy",
-    "matriculated",
-    "hell",
-    "two-line",
-    "lumiere",
-    "vagaries",
-    "defection",
-    "cake",
-    "88",
-    "scolatti",
-    "roadster",
-    "overpayment",
-    "havens",
-    "variable",
-    "impossible",
-    "france",
-    "kitchen",
-    "disseminated",
-    "goldberg",
-    "flapped",
-    "uranyl",
-    "here's",
-    "abstracts",
-    "maladjustment",
-    "greek-speaking",
-    "dullness",
-    "forefinger",
-    "gruff",
-    "environment",
-    "section",
-    "exhaustible",
-    "natural-law",
-    "inward",
-    "lindemann",
-    "rizzuto",
-    "superstitions",
-    "bourgeois",
-    "iodine",
-    "bloops",
-    "gerundial",
-    "janitor's",
-    "diffuses",
-    "oaks",
-    "inorganic",
-    "passers-by",
-    "brothers'",
-    "moustache",
-    "storing",
-    "chico",
-    "mccloy",
-    "solves",
-    "disable",
-    "lizzy",
-    "precautions",
-    "image",
-    "sitters",
-    "inwardly",
-    "midshipmen",
-    "marie",
-    "self-protection",
-    "$56",
-    "11:00",
-    "shiftless",
-    "latter-day",
-    "cloture",
-    "villains",
-    "carsten",
-    "epicycle",
-    "affidavits",
-    "vibrancy",
-    "phi",
-    "travelogue",
-    "rotates",
-    "mother-introject",
-    "physiologic",
-    "now",
-    "anti-negro",
-    "flautist",
-    "lichtenstein",
-    "frankest",
-    "harnack",
-    "edematous",
-    "fairfax",
-    "me-210",
-    "plugugly",
-    "rigids",
-    "ratified",
-    "singleness",
-    "morgue",
-    "knill's",
-    "carpenters'",
-    "halvah",
-    "2-5",
-    "pixies",
-    "164",
-    "attica",
-    "champions",
-    "rattlers",
-    "chou",
-    "tranquillity",
-    "mid-watch",
-    "behavioral",
-    "pharmaceutical",
-    "unclenched",
-    "manikins",
-    "paralleled",
-    "untold",
-    "omissions",
-    "catalogs",
-    "newly-created",
-    "nov.",
-    "tree-clumps",
-    "parry",
-    "justice",
-    "retranslated",
-    "katie",
-    "invade",
-    "cookies",
-    "implements",
-    "boats",
-    "4.2",
-    "manhattan's",
-    "jocund",
-    "iodination",
-    "thirties",
-    "bluebird",
-    "insubordinate",
-    "bluing",
-    "splenomegaly",
-    "malenkov",
-    "doubleheader",
-    "obedience-trained",
-    "junior's",
-    "1,500",
-    "greatcoated",
-    "hartes",
-    "fill-ins",
-    "virginia",
-    "wouldn't",
-    "quick-drying",
-    "athens",
-    "deodorant",
-    "shutter",
-    "internal",
-    "outscoring",
-    "confirm",
-    "2-score-year",
-    "fading",
-    "environmental",
-    "physically",
-    "tube",
-    "pantomimic",
-    "10,000,000",
-    "afrique",
-    "dangerously",
-    "pillaged",
-    "aides",
-    "vellum",
-    "t's",
-    "suck",
-    "truth-packed",
-    "guthrie",
-    "ceremony",
-    "wansley",
-    "willis'",
-    "contentedly",
-    "gnaw",
-    "apologetically",
-    "swamping",
-    "noting",
-    "catalogues",
-    "highness",
-    "hough's",
-    "dedicated",
-    "suspense",
-    "practices",
-    "so-so",
-    "withering",
-    "subsedies",
-    "taboo",
-    "liable",
-    "stockroom",
-    "persists",
-    "ash",
-    "mont",
-    "total-cost",
-    "jeans",
-    "adrenal",
-    "frog",
-    "niagara",
-    "explanations",
-    "analogue",
-    "vector",
-    "extrapolate",
-    "figs.",
-    "secondly",
-    "sweep",
-    "delegations",
-    "beginners",
-    "diapiace",
-    "stabilize",
-    "messrs.",
-    "$81",
-    "athenians",
-    "flaxseed",
-    "backyard",
-    "period",
-    "opinionated",
-    "transitions",
-    "halloween",
-    "nicodemus",
-    "daer",
-    "kilometers",
-    "che",
-    "idiot-grin",
-    "ld",
-    "whitens",
-    "p-aminobenzoic",
-    "newspaper",
-    "eighty",
-    "colt's",
-    "1/4",
-    "rooseveltian",
-    "metro",
-    "indiana",
-    "treatments",
-    "meticulous",
-    "bugle",
-    "wrack",
-    "tensing",
-    "hindmost",
-    "arson",
-    "oopsie-cola",
-    "semi-abstract",
-    "protruding",
-    "1597/8",
-    "dogtrot",
-    "appreciatively",
-    "burmans",
-    "puberty",
-    "sidesteps",
-    "sibylla's",
-    "sneers",
-    "pollock's",
-    "noncommittal",
-    "aristocratically",
-    "underwater",
-    "fraud's",
-    "space-time",
-    "defensiveness",
-    "anchoritism",
-    "schemata",
-    "pedro",
-    "acceptable",
-    "withhold",
-    "prosecution's",
-    "tempered",
-    "fellowships",
-    "occupying",
-    "bestseller",
-    "human",
-    "litters",
-    "lower-middle-class",
-    "vaquero",
-    "amicam",
-    "deducted",
-    "statuses",
-    "operetta",
-    "hearst",
-    "pacifier",
-    "enduring",
-    "war-dirty",
-    "inquest",
-    "tertian",
-    "monks",
-    "advisedly",
-    "nearsighted",
-    "factor",
-    "o'banion",
-    "mollify",
-    "steward",
-    "agglomeration",
-    "humaine",
-    "ultimatum",
-    "2nd",
-    "christ",
-    "impossibly",
-    "lazily",
-    "grandeur",
-    "hrothgar's",
-    "trick",
-    "prefab",
-    "schooldays",
-    "intervened",
-    "lad's",
-    "casts",
-    "softener",
-    "outs",
-    "tarred",
-    "patter",
-    "gaggle",
-    "broadway",
-    "unshaved",
-    "supervised",
-    "accentual",
-    "printed",
-    "sounds",
-    "domesticity",
-    "lactate",
-    "humiliatingly",
-    "alternatives",
-    "detractors",
-    "primaries",
-    "preisolated",
-    "wreckage",
-    "pursuits",
-    "plunging",
-    "hemenway's",
-    "estranged",
-    "equator",
-    "platonica",
-    "anti-authoritarian",
-    "sago",
-    "predicament",
-    "influenza",
-    "colts",
-    "baldwin",
-    "oyabun",
-    "jason",
-    "physicochemical",
-    "antithetical",
-    "descartes",
-    "beams",
-    "yankee",
-    "respectability",
-    "kanto",
-    "schubert-beethoven-mozart",
-    "conjured",
-    "eras",
-    "rca-victor's",
-    "self-confidence",
-    "skolman's",
-    "kidney",
-    "straddling",
-    "impinging",
-    "lowliest",
-    "multi-family",
-    "coasted",
-    "volumetrically",
-    "trigger-happy",
-    "executives",
-    "concentration-camp",
-    "1905",
-    "marlin's",
-    "garryowen",
-    "masquerade",
-    "protection",
-    "thither",
-    "seams",
-    "reasons",
-    "jewelled",
-    "synergistic",
-    "indirection",
-    "wand",
-    "'nuff",
-    "blatancy",
-    "immunity",
-    "exaltation",
-    "illustrate",
-    "gambles",
-    "waldorf-astoria",
-    "snp",
-    "intereference",
-    "villainous",
-    "belafonte",
-    "netted",
-    "crackled",
-    "claudia's",
-    "formalized",
-    "votive",
-    "disposition",
-    "mirthless",
-    "doin'",
-    "cloud",
-    "stadtisches",
-    "grillwork",
-    "manzanola",
-    "strove",
-    "co-occurring",
-    "parisian",
-    "liss",
-    "newsom",
-    "abjectly",
-    "choctaws",
-    "folks",
-    "beneficient",
-    "restricts",
-    "element",
-    "imposes",
-    "lighting",
-    "slovenliness",
-    "five-fold",
-    "contributing",
-    "inceptor",
-    "petite",
-    "marty's",
-    "allusion",
-    "inroads",
-    "carrie",
-    "bale",
-    "cv",
-    "chop",
-    "governor's",
-    "childhood",
-    "unavailable",
-    "maxim's",
-    "pie",
-    "producing",
-    "pearls",
-    "streetcar",
-    "integrates",
-    "sickening",
-    "bourgeoisie",
-    "condemnatory",
-    "husband-wife",
-    "down",
-    "percentages",
-    "freeman's",
-    "doolin",
-    "implementation",
-    "inscrutability",
-    "overflow",
-    "rickenbaugh",
-    "deferring",
-    "gravel",
-    "lucia",
-    "tibetan",
-    "pyknotic",
-    "students'",
-    "sunshield",
-    "mcelyee",
-    "overeating",
-    "robbed",
-    "lagoons",
-    "doghouse",
-    "warmongering",
-    "philmont",
-    "donald",
-    "willful",
-    "squat",
-    "igor",
-    "arleigh",
-    "penultimate",
-    "tunneled",
-    "nareb's",
-    "diorah",
-    "hypothalamic",
-    "shriver",
-    "quack",
-    "doggedly",
-    "validate",
-    "mail",
-    "bruised",
-    "cruisers",
-    "matt",
-    "dashboard",
-    "exceptional",
-    "lilt",
-    "jointly",
-    "light-colored",
-    "vegetables",
-    "documentation",
-    "selective",
-    "hinsdale",
-    "insincere",
-    "monumentally",
-    "abstractive",
-    "aqueous",
-    "skyline",
-    "teller",
-    "deposits",
-    "broiler",
-    "portage",
-    "friction-free",
-    "cowhand",
-    "celebes",
-    "carcasses",
-    "flaring",
-    "inexpert",
-    "globigii",
-    "mecholyl",
-    "downgraded",
-    "suffering",
-    "brandywine",
-    "checkit",
-    "tecum",
-    "retrenching",
-    "digital",
-    "sorted",
-    "kakutani",
-    "fiat",
-    "2269",
-    "discipline",
-    "longtime",
-    "wisconsin",
-    "blaustein",
-    "stakes",
-    "shredder",
-    "glaucoma",
-    "daughters",
-    "troubleshooter",
-    "mi",
-    "half-million",
-    "taxes",
-    "visit",
-    "place-kicking",
-    "depaul",
-    "cools",
-    "b-52h",
-    "josephus",
-    "womb-to-tomb",
-    "arranging",
-    "tablespoonful",
-    "tries",
-    "vocalists",
-    "santayana",
-    "torch",
-    "woodyard",
-    "stumping",
-    "greenness",
-    "juncture",
-    "f.d.r.",
-    "procaine",
-    "hewlitt",
-    "pulsing",
-    "railroads",
-    "monogamous",
-    "snow-covered",
-    "excursus",
-    "jist",
-    "thout",
-    "mitropoulos",
-    "sharers",
-    "airman's",
-    "basses",
-    "collectively",
-    "mobile",
-    "bloodstains",
-    "pallavicini",
-    "250-275",
-    "embark",
-    "admittedly",
-    "fifth-century",
-    "frowned",
-    "gyro",
-    "diisocyanate",
-    "baullari",
-    "vanish",
-    "flashlight-type",
-    "aricaras",
-    "morsels",
-    "treated",
-    "albanians",
-    "ginsberg's",
-    "firehouses",
-    "undamaged",
-    "protracted",
-    "lightyears",
-    "englishmen",
-    "unplumbed",
-    "willingness",
-    "governs",
-    "leafed",
-    "freedom-loving",
-    "motley",
-    "berkman",
-    "lindskog",
-    "dash",
-    "ecole",
-    "thirty-mile",
-    "jade",
-    "scented",
-    "purchasers",
-    "capital-gains",
-    "rounds",
-    "galveston",
-    "amorphously",
-    "dynamically",
-    "tiled",
-    "volcano",
-    "slitters",
-    "one-shot",
-    "$344,000",
-    "squeals",
-    "hollering",
-    "realization",
-    "productive",
-    "deterministic",
-    "retied",
-    "non-police",
-    "kilowatt-hour",
-    "blindness",
-    "shelled",
-    "1932",
-    "ever'",
-    "evenings",
-    "ambulance",
-    "molar",
-    "wretched",
-    "arpeggios",
-    "luechtefeld",
-    "stormbound",
-    "unfrocking",
-    "ecumenist",
-    "iodoprotein",
-    "nouvelle-heloise",
-    "load",
-    "25.3",
-    "chamois",
-    "flotillas",
-    "priest's",
-    "amorous",
-    "crucifying",
-    "shrinking",
-    "primping",
-    "profit-maximizing",
-    "indiscriminate",
-    "5.1",
-    "protecting",
-    "by-ways",
-    "bleeker",
-    "laurels",
-    "satiety",
-    "brassbound's",
-    "enlists",
-    "anionic",
-    "newspapers'",
-    "canadians",
-    "scalar",
-    "intent",
-    "accompaniment",
-    "supremacy",
-    "incompetent",
-    "boxer",
-    "tea-drinking",
-    "chattered",
-    "invades",
-    "sentence-structure",
-    "containment",
-    "temperate",
-    "transferor",
-    "carving",
-    "collegiate",
-    "necessaries",
-    "saluted",
-    "marble",
-    "sister's",
-    "meanes",
-    "right-angle",
-    "macaulay",
-    "sputnik",
-    "anatomy",
-    "environing",
-    "festival",
-    "uno's",
-    "atwells",
-    "formal",
-    "sky-carving",
-    "nationalisms",
-    "sociality",
-    "phenomenon",
-    "transfers",
-    "orthographies",
-    "escorted",
-    "shock",
-    "increasingly",
-    "promises",
-    "beg",
-    "relic",
-    "taylor's",
-    "proprietorship",
-    "foreign-entry-limit",
-    "bored",
-    "northerners",
-    "holley",
-    "providential",
-    "heine",
-    "sponsoring",
-    "erred",
-    "u.n.'s",
-    "fragmentary",
-    "trapdoor",
-    "matsyendra",
-    "unstilted",
-    "commission",
-    "anchorage",
-    "progeny",
-    "hydroxazine",
-    "colefax",
-    "olvey",
-    "rankin",
-    "banked",
-    "uniconer",
-    "professor",
-    "malabar",
-    "rarer",
-    "tentacles",
-    "lasts",
-    "huskiness",
-    "childlike",
-    "table's",
-    "suppositions",
-    "evokes",
-    "allegedly",
-    "transformation",
-    "g-p",
-    "ruark's",
-    "gable",
-    "falls",
-    "angle",
-    "half-bottles",
-    "septum",
-    "patrick's",
-    "purporting",
-    "leighton",
-    "preliminaries",
-    "lambeth",
-    "1,418,000",
-    "conservatively-cravated",
-    "compactly",
-    "intercrisis",
-    "precedents",
-    "queerest",
-    "notitia",
-    "pests",
-    "anodes",
-    "fedora",
-    "olson",
-    "pompons",
-    "adhered",
-    "smarter",
-    "growers'",
-    "doped",
-    "sanguineous",
-    "glib",
-    "attu",
-    "boxford",
-    "distractedly",
-    "evening's",
-    "lorelei",
-    "trunks",
-    "washington",
-    "peal",
-    "babe",
-    "15.5",
-    "records",
-    "140,000",
-    "suspicion",
-    "linger",
-    "alden",
-    "tattle-tale",
-    "emphatic",
-    "1865",
-    "butler",
-    "cavalcades",
-    "upi",
-    "vitally",
-    "lambarene",
-    "hoot",
-    "co-ordinates",
-    "blackest",
-    "po",
-    "government-blessed",
-    "circuitry",
-    "shipboard",
-    "embedded",
-    "phoned",
-    "rectlinearly",
-    "vouchsafes",
-    "picturesque",
-    "zu",
-    "embankment",
-    "13",
-    "botulinal",
-    "quarter",
-    "grander",
-    "pattered",
-    "fistoulari's",
-    "grub",
-    "make",
-    "43",
-    "tambourine",
-    "advancing",
-    "moisten",
-    "engineers",
-    "all-time",
-    "diagnometer",
-    "metrical",
-    "tensioning",
-    "notte",
-    "baseline",
-    "tall-masted",
-    "alf",
-    "disruptions",
-    "galvanic",
-    "marshalled",
-    "commenting",
-    "sufferer",
-    "haw",
-    "bidder",
-    "sassing",
-    "meek-mannered",
-    "placement",
-    "plainfield",
-    "10.4",
-    "monasteries",
-    "hundred",
-    "wingback",
-    "dishonouring",
-    "crested",
-    "fraternize",
-    "whereabouts",
-    "fucken",
-    "marr's",
-    "settlements",
-    "sudsing",
-    "intruders",
-    "fra",
-    "eight-foot",
-    "adapting",
-    "straightforward",
-    "americans",
-    "reich",
-    "interdenominational",
-    "buckles",
-    "bo",
-    "sleepless",
-    "stram's",
-    "sniggered",
-    "fatal",
-    "b.d.",
-    "lucille's",
-    "long-bodied",
-    "macroscopically",
-    "fee-per-case",
-    "female",
-    "chiang",
-    "sloan",
-    "pirate",
-    "width",
-    "lasalle",
-    "second-rate",
-    "bird's",
-    "clarets",
-    "winders",
-    "debunking",
-    "stavropoulos'",
-    "contiguous",
-    "whitehall",
-    "transcribed",
-    "wackers'",
-    "fumio's",
-    "catherine",
-    "commissioner's",
-    "unanalyzed",
-    "gaul",
-    "storeria",
-    "analeptic",
-    "dilettante",
-    "dilating",
-    "jerez",
-    "workout",
-    "parading",
-    "ruined",
-    "unpretentious",
-    "playa",
-    "semitropical",
-    "farmers'",
-    "molasses",
-    "probability",
-    "live",
-    "team's",
-    "die",
-    "migrants",
-    "cat's",
-    "rime",
-    "lasso",
-    "prowled",
-    "abbreviations",
-    "trobles",
-    "europe",
-    "bod",
-    "alcoholism",
-    "cups",
-    "flavus",
-    "belching",
-    "cigaret",
-    "83rd",
-    "reipublicae",
-    "augmenting",
-    "cartwheels",
-    "lanesville",
-    "objectification",
-    "hearth",
-    "mountainsides",
-    "apartments",
-    "throughout",
-    "subtlety",
-    "70-year-old",
-    "2.55",
-    "rushall",
-    "poured-in-place",
-    "slightly-smoking",
-    "devey's",
-    "prune",
-    "inject",
-    "brocaded",
-    "furtive",
-    "exhibited",
-    "yaks",
-    "argumentation",
-    "construction",
-    "carborundum",
-    "desires",
-    "courts",
-    "ankles",
-    "pester",
-    "secesh",
-    "didn",
-    "perpetuate",
-    "defensible",
-    "casanova",
-    "poison",
-    "clucking",
-    "millie",
-    "velocities",
-    "raced",
-    "smelled",
-    "i'll",
-    "bronc",
-    "nauseated",
-    "elfin",
-    "irregular",
-    "nasty",
-    "custom-make",
-    "erects",
-    "eat",
-    "delinquents",
-    "siecles",
-    "litter",
-    "three-fifths",
-    "mark's",
-    "tyrannize",
-    "columbines",
-    "frequency",
-    "clubrooms",
-    "eventual",
-    "hires",
-    "resonant",
-    "viareggio",
-    "chartists",
-    "goooolick",
-    "foreheads",
-    "withstands",
-    "invariable",
-    "sacrificed",
-    "confessions",
-    "fieldstone",
-    "home-bred",
-    "undetectable",
-    "deputy's",
-    "aristotle's",
-    "sepia",
-    "anaplasmosis",
-    "beverages",
-    "wansee",
-    "spandrels",
-    "candies",
-    "rationalized",
-    "stimulating",
-    "labor-based",
-    "nurses'",
-    "kimball",
-    "heavy-framed",
-    "weatherstrip",
-    "wallingford",
-    "$100,000",
-    "air-to-surface",
-    "stalling",
-    "bancroft's",
-    "kolkhozes",
-    "impresario",
-    "gunk",
-    "christmastime",
-    "half-clad",
-    "sanctimonious",
-    "contraband",
-    "communications",
-    "misunderstand",
-    "isolation",
-    "foot-high",
-    "right",
-    "reacted",
-    "home-owners",
-    "squaw",
-    "upper-middle-class",
-    "frequent",
-    "greenware",
-    "preponderantly",
-    "high-value",
-    "metalsmiths",
-    "conquete",
-    "concrete",
-    "hypocrites",
-    "guthrie's",
-    "bluish",
-    "staying",
-    "sibly",
-    "cockpit",
-    "orphan",
-    "myra",
-    "thinning",
-    "basic",
-    "surfactants",
-    "crotchety",
-    "boatman",
-    "standpoint",
-    "utensils",
-    "haestier",
-    "calinda",
-    "pawn",
-    "n.j.",
-    "kimbolton",
-    "dollar-and-cents",
-    "harpsichordist",
-    "nourishing",
-    "borrioboola-gha",
-    "bedpost",
-    "front-back",
-    "arbiter",
-    "pampered",
-    "signified",
-    "$22",
-    "methodology",
-    "queen's",
-    "overemphasis",
-    "somehow",
-    "book-burning",
-    "cylinders",
-    "rodeph",
-    "anguished",
-    "crafts",
-    "admirably",
-    "2:30-:34.3",
-    "loader",
-    "subdues",
-    "two-term",
-    "review",
-    "applicants",
-    "interceptor",
-    "retrogressive",
-    "processor",
-    "at",
-    "pulse",
-    "mutuality",
-    "lilacs",
-    "ph",
-    "ungrateful",
-    "cascade",
-    "roasts",
-    "assassin",
-    "insuperably",
-    "krapp's",
-    "afflictions",
-    "cramer",
-    "mailings",
-    "speechless",
-    "acquiesence",
-    "supremely",
-    "skilfully",
-    "selection-rejection",
-    "europeanish",
-    "wheedled",
-    "battle-shattered",
-    "sp-44001",
-    "opelika",
-    "fund-raisers",
-    "hive",
-    "unimportant",
-    "modern-dance",
-    "sore",
-    "rely",
-    "diagrammed",
-    "kalentiev",
-    "opportunistic",
-    "crusader",
-    "nectareous",
-    "freida",
-    "algeria",
-    "weasel",
-    "marginally",
-    "disciples",
-    "habits",
-    "prevents",
-    "special",
-    "controversies",
-    "pre-historic",
-    "cultivate",
-    "architectonic",
-    "crossover",
-    "opened",
-    "unlock",
-    "ceteras",
-    "wife's",
-    "incorrigible",
-    "wash-up",
-    "titration",
-    "revellers",
-    "combo",
-    "honesty",
-    "donovan",
-    "defocusing",
-    "baraclough",
-    "accidental",
-    "cinematic",
-    "maser",
-    "psyllium",
-    "sun-warmed",
-    "unfettered",
-    "instrumental-reward",
-    "mankind",
-    "ferraros",
-    "executors",
-    "harden",
-    "two-fisted",
-    "effluvium",
-    "downpour",
-    "aggressiveness",
-    "highest-paid",
-    "blame",
-    "unsloped",
-    "21%",
-    "dolmabahce",
-    "skirmished",
-    "negative",
-    "platforms",
-    "non-enzymatic",
-    "marty",
-    "calderone",
-    "struggles",
-    "world-oriented",
-    "traits",
-    "consultants",
-    "parodies",
-    "impudently",
-    "camper",
-    "gardening",
-    "seekonk",
-    "watchmen",
-    "old-grad-type",
-    "comforting",
-    "blight",
-    "pfaff",
-    "diathesis",
-    "drastic",
-    "ringlets",
-    "majestic",
-    "detector",
-    "ross",
-    "steeples",
-    "bottom",
-    "tonal",
-    "reminiscence",
-    "seismological",
-    "poker",
-    "secularists",
-    "decaying",
-    "cezanne",
-    "bert",
-    "precision",
-    "performance",
-    "warriors",
-    "untenanted",
-    "duets",
-    "consistent",
-    "cluck",
-    "decorations",
-    "uptrend",
-    "rationalize",
-    "stitched",
-    "counted",
-    "burns's",
-    "weren't",
-    "coffee-house",
-    "hilprecht's",
-    "fresh",
-    "boron",
-    "accruing",
-    "trombonist",
-    "dispersion",
-    "pause",
-    "cynical",
-    "hiding",
-    "deadness",
-    "millinery",
-    "audio-visual",
-    "revising",
-    "discordantly",
-    "forty-four",
-    "nirvana",
-    "22,000",
-    "illegal",
-    "lady",
-    "mitigates",
-    "jawbone",
-    "coals",
-    "2:46",
-    "comics",
-    "grease-removal",
-    "hypoadrenocorticism",
-    "ugf",
-    "$10.8",
-    "recruiter",
-    "high-class",
-    "aims",
-    "undertow",
-    "8",
-    "medicines",
-    "spouse",
-    "unattractive",
-    "genders",
-    "rooming",
-    "gunmen",
-    "huddle",
-    "appease",
-    "south-asian",
-    "devious",
-    "births",
-    "analytrol",
-    "rustle",
-    "forrest",
-    "mm",
-    "diane",
-    "appraisal",
-    "raynal",
-    "fair-sized",
-    "53",
-    "peppermints",
-    "dissembling",
-    "pressing",
-    "heaven",
-    "ice-chest",
-    "desolate",
-    "acreage",
-    "headlands",
-    "multimegaton",
-    "disgraceful",
-    "contends",
-    "n'th",
-    "byronic",
-    "mid-atlantic",
-    "tool",
-    "tillie",
-    "$37",
-    "balkan",
-    "tallahassee",
-    "husband",
-    "well-stocked",
-    "4,441",
-    "mcauliffe",
-    "paula's",
-    "friendlily",
-    "kestner",
-    "steoreotyped",
-    "frightful",
-    "chinese-soviet",
-    "skinfolds",
-    "scandinavia",
-    "disquiet",
-    "gratingly",
-    "alarms",
-    "circuitous",
-    "irregularity",
-    "non-freezing",
-    "bear-like",
-    "foully",
-    "high-resolution",
-    "chen",
-    "reprinted",
-    "vos",
-    "superimposed",
-    "certitudes",
-    "ridges",
-    "pomerania",
-    "emptied",
-    "man-to-man",
-    "antony",
-    "crate",
-    "day-after-day",
-    "untied",
-    "alcohols",
-    "registering",
-    "lieberman",
-    "mistress",
-    "instability",
-    "phones",
-    "hire",
-    "keating's",
-    "healthful",
-    "personnel",
-    "beloved",
-    "astute",
-    "lunch",
-    "wops",
-    "included",
-    "bix",
-    "inset",
-    "insert",
-    "leafhopper",
-    "hamburgers",
-    "gourmet's",
-    "ribbing",
-    "brutal",
-    "fleas",
-    "unsigned",
-    "liberate",
-    "assures",
-    "quadriceps",
-    "colonna",
-    "dignitaries",
-    "third-dimensionality",
-    "vittorio",
-    "involvement",
-    "sommers",
-    "detested",
-    "excommunicated",
-    "negro",
-    "bloodshot",
-    "love-in-action",
-    "goddammit",
-    "shoveled",
-    "helicopter",
-    "wave-particle",
-    "calculate",
-    "sinful",
-    "ministry",
-    "monilia",
-    "temperament",
-    "steelmakers'",
-    "plentiful",
-    "unlacing",
-    "stands",
-    "cdc",
-    "beavertail",
-    "peals",
-    "mailbox",
-    "revolves",
-    "sambur",
-    "anthea",
-    "incitement",
-    "verbal",
-    "information-cell",
-    "mf",
-    "three-bedroom",
-    "vera",
-    "japan",
-    "nathanael",
-    "hovered",
-    "mettlesome",
-    "crypt",
-    "spellbound",
-    "fits",
-    "plutarch",
-    "62",
-    "hydrogens",
-    "toss",
-    "straggle",
-    "submerged",
-    "asimov's",
-    "bolstered",
-    "inevitabilities",
-    "unsealed",
-    "babbitt",
-    "wheeler",
-    "fuhrmann's",
-    "fabricate",
-    "midair",
-    "adirondack",
-    "hodgkin",
-    "detours",
-    "semi-processed",
-    "rheinholdt's",
-    "dormitories",
-    "murrin",
-    "england",
-    "upholstery",
-    "chairing",
-    "arteriolosclerosis",
-    "dentists",
-    "turnkey",
-    "prayer",
-    "sorrow",
-    "39-year-old",
-    "gautier",
-    "moriarty",
-    "ale",
-    "imaginings",
-    "aching",
-    "$.03",
-    "feds",
-    "ellipsis",
-    "lien",
-    "refrigerators",
-    "shrapnel",
-    "rhetoricians",
-    "humor",
-    "eventualities",
-    "hopscotch",
-    "secrecy",
-    "monacle",
-    "highwayman",
-    "foreknowledge",
-    "moineau",
-    "shift",
-    "heliotrope",
-    "guilt",
-    "aggregate",
-    "portly",
-    "granny's",
-    "iglehart",
-    "pacing",
-    "f-major",
-    "vacuum-formed",
-    "sphynxes",
-    "social-class",
-    "flatness",
-    "announce",
-    "emergencies",
-    "richest",
-    "culver",
-    "snellville",
-    "perfecting",
-    "lovejoy's",
-    "counsel",
-    "brackish",
-    "homesick",
-    "nest",
-    "boobify",
-    "ellwood",
-    "101",
-    "recess",
-    "prednisone",
-    "vonnegut's",
-    "dish",
-    "fifty-year",
-    "mention",
-    "thyronine",
-    "evans",
-    "leisurely",
-    "finishes",
-    "mudwagon",
-    "wiligis",
-    "65%",
-    "micro-microcurie",
-    "crinkles",
-    "incessantly",
-    "613",
-    "demonstrators",
-    "$300,000",
-    "sing-song",
-    "belonged",
-    "williamsburg",
-    "mackintosh",
-    "satirist",
-    "winless",
-    "spades",
-    "phoenix",
-    "sub-group",
-    "spic",
-    "shack-up",
-    "manage",
-    "sherwood",
-    "eyeballs",
-    "ontario's",
-    "haggardly",
-    "gale",
-    "motion-picture",
-    "species",
-    "bravado",
-    "added",
-    "wailed",
-    "seedbed",
-    "desirable",
-    "collusion",
-    "virgil",
-    "diehards",
-    "employ",
-    "recherche",
-    "unlined",
-    "minneapolis",
-    "screech",
-    "knoxville",
-    "100",
-    "ambassador's",
-    "off-broadway",
-    "covers",
-    "integrity",
-    "shirtsleeve",
-    "enduringly",
-    "361",
-    "semenov",
-    "paternalistic",
-    "serbantian",
-    "microorganisms",
-    "napping",
-    "observe",
-    "pony's",
-    "fraud",
-    "adhesion",
-    "lunge",
-    "disconcerting",
-    "gossip",
-    "a.b.",
-    "alpha-beta-gammas",
-    "jargon",
-    "hyperemia",
-    "offensively",
-    "doorstep",
-    "hydrophilic",
-    "jeffersonian",
-    "admiralty",
-    "routes",
-    "equivalents",
-    "trip-hammer",
-    "vicelike",
-    "embalmers'",
-    "jessy",
-    "floods",
-    "47.1%",
-    "discerning",
-    "buckhead",
-    "hollywood's",
-    "double",
-    "proposals",
-    "nary",
-    "optimality",
-    "381(c)(4)",
-    "wave-length",
-    "kirov",
-    "33-1/2",
-    "undesirable",
-    "deduce",
-    "catskills",
-    "leaders",
-    "involving",
-    "$800",
-    "husband's",
-    "decadence",
-    "jennifer",
-    "toddlers",
-    "ovals",
-    "ransacking",
-    "extirpated",
-    "hawk",
-    "codetermines",
-    "ann's",
-    "gilels",
-    "medicis",
-    "post-world",
-    "quintus",
-    "gaining",
-    "by",
-    "mor",
-    "edges",
-    "complexity",
-    "franchise",
-    "elaborates",
-    "saviour",
-    "1931",
-    "open-air",
-    "demise",
-    "bas-reliefs",
-    "affirmed",
-    "disaffiliated",
-    "assaying",
-    "courtliness",
-    "perjury",
-    "frenetic",
-    "fast-closing",
-    "decencies",
-    "bucks",
-    "children's",
-    "align",
-    "economist's",
-    "preclude",
-    "swooping",
-    "climbed",
-    "jyj",
-    "soreness",
-    "armaments",
-    "installation",
-    "re-used",
-    "but",
-    "nara",
-    "infield",
-    "dakota",
-    "else's",
-    "signs",
-    "inviolate",
-    "jessica's",
-    "harmon",
-    "irresolution",
-    "fast-opening",
-    "laughs",
-    "daisies",
-    "germano-slavic",
-    "extirpating",
-    "expectancy",
-    "herons",
-    "dipylon",
-    "german",
-    "drawn-back",
-    "ascertain",
-    "settlement",
-    "rookie",
-    "incertain",
-    "principles",
-    "tide",
-    "oscar",
-    "carbons",
-    "schopenhauer's",
-    "meeting",
-    "abel's",
-    "newsletters",
-    "feigning",
-    "accardo",
-    "incomprehension",
-    "entranced",
-    "self-served",
-    "floors",
-    "compensating",
-    "commodity",
-    "freeport",
-    "ya",
-    "appendages",
-    "unloading",
-    "reception",
-    "nihilism",
-    "fitted",
-    "megarians",
-    "tablecloths",
-    "ticker",
-    "avowed",
-    "contrarieties",
-    "bare-armed",
-    "complaisance",
-    "fascinate",
-    "disarray",
-    "cause-and-effect",
-    "overridden",
-    "figural",
-    "heel-beryl",
-    "penurious",
-    "recit",
-    "aorta",
-    "toppers",
-    "rabbi",
-    "inscribed",
-    "2:30.3-35.3",
-    "colleagues",
-    "rolled-up",
-    "unilaterally",
-    "chambre's",
-    "mob",
-    "undiluted",
-    "337-degrees-c",
-    "former",
-    "1813",
-    "plaster-of-paris",
-    "wives",
-    "tomkins",
-    "wing",
-    "pre-1960",
-    "rooftops",
-    "bud",
-    "detectors",
-    "normalize",
-    "b.a.",
-    "1825",
-    "ne",
-    "sexuality",
-    "mounting",
-    "wilkes",
-    "urbanism",
-    "dextrous",
-    "hemorrhoids",
-    "feller",
-    "conspired",
-    "what's-his-name",
-    "hooker's",
-    "real-life",
-    "cultivating",
-    "mcenroe's",
-    "swadesh",
-    "responsively",
-    "miriam's",
-    "operas",
-    "candy",
-    "slotted",
-    "trousers",
-    "cradles",
-    "pinch",
-    "brief",
-    "causative",
-    "slugged",
-    "arlene's",
-    "previous",
-    "auspicious",
-    "elsinore",
-    "sanatorium",
-    "simpler",
-    "finance",
-    "narcotizes",
-    "muggy",
-    "blustery",
-    "lifson",
-    "greetings",
-    "boroughs",
-    "depend",
-    "acquainted",
-    "thames",
-    "rage",
-    "operating",
-    "plank",
-    "dreamy",
-    "script's",
-    "affirmatively",
-    "request",
-    "shame",
-    "train",
-    "regionalism",
-    "who'd",
-    "canyons",
-    "affluent",
-    "waitin",
-    "mt.",
-    "deans",
-    "mobilized",
-    "intellectus",
-    "quietist",
-    "psychical",
-    "phouma's",
-    "nassau's",
-    "appreciable",
-    "trough",
-    "alcott's",
-    "uno",
-    "mammals",
-    "narration",
-    "rafts",
-    "reel",
-    "jersey",
-    "paperback",
-    "jimmy",
-    "fowler",
-    "waggled",
-    "hurriedly",
-    "tumbled",
-    "s'excuse",
-    "melvin",
-    "predictably",
-    "rapidly",
-    "patience",
-    "preponderating",
-    "modes",
-    "flatteringly",
-    "tones",
-    "womanly",
-    "performers",
-    "brave",
-    "mockery",
-    "bridgewater",
-    "inversion",
-    "faires",
-    "rembrandt",
-    "plunge",
-    "jervis",
-    "defending",
-    "curricular",
-    "swift-footed",
-    "layton",
-    "sensible",
-    "noir",
-    "column-shaped",
-    "b{t}",
-    "dispassionate",
-    "until",
-    "silver",
-    "males",
-    "danubian",
-    "beckworth",
-    "whoe",
-    "handyman",
-    "unearned",
-    "widowed",
-    "fairways",
-    "cryptographic",
-    "edw",
-    "toiled",
-    "victuals",
-    "monopoly",
-    "destinies",
-    "crawling",
-    "re-vision",
-    "bossman",
-    "dammit",
-    "coyly",
-    "mountings",
-    "harrington's",
-    "location-minded",
-    "tempts",
-    "compass",
-    "distillers",
-    "dilemma",
-    "hillsboro",
-    "positioned",
-    "piezoelectric",
-    "befitting",
-    "posthumous",
-    "take",
-    "xydis",
-    "typewriting",
-    "retainers",
-    "dutton",
-    "leftfield",
-    "tilting",
-    "slung",
-    "lavoisier",
-    "purely",
-    "stiffly",
-    "cartilage",
-    "dauphine",
-    "carbon-halogen",
-    "finishing",
-    "adrianople",
-    "lucrative",
-    "sluice",
-    "one-fourth",
-    "hardy",
-    "conceivably",
-    "accommodating",
-    "fiats",
-    "sweden",
-    "pink-petticoated",
-    "participated",
-    "ten-foot",
-    "wrote",
-    "toweling",
-    "ambassadors",
-    "indians'",
-    "attractive",
-    "wilbur",
-    "12:50",
-    "acquiring",
-    "ellamae",
-    "veterans'",
-    "172nd",
-    "sightseers",
-    "vs",
-    "unwed",
-    "deor",
-    "mudslinging",
-    "sunt",
-    "yeasts",
-    "dispatch",
-    "eustis",
-    "puddles",
-    "princes'",
-    "subtracted",
-    "mac",
-    "high-temperature",
-    "welch",
-    "eummelihs",
-    "mulch",
-    "1610",
-    "3/8-inch",
-    "locate",
-    "tolerate",
-    "o'neill",
-    "bluster",
-    "bassis",
-    "annapolis",
-    "liveliness",
-    "pickoffs",
-    "crucible",
-    "bully",
-    "despised",
-    "alike",
-    "satellite",
-    "calypso",
-    "intimations",
-    "slants",
-    "fullest",
-    "meditate",
-    "enticing",
-    "ritchie",
-    "machiavelli",
-    "floyd",
-    "delimits",
-    "thinks",
-    "southern-republican",
-    "thrusts",
-    "foolhardy",
-    "bombarding",
-    "ulcer",
-    "fritzie's",
-    "pink",
-    "troublesome",
-    "glossy",
-    "amphetamines",
-    "electing",
-    "ratcliff",
-    "anti-semites",
-    "observer",
-    "toilets",
-    "speculating",
-    "kingdom-wide",
-    "come",
-    "layer",
-    "promotes",
-    "curbing",
-    "unenunciated",
-    "retailers",
-    "artkino",
-    "arlen's",
-    "orchestrations",
-    "workpiece",
-    "derelicts",
-    "esteemed",
-    "diman",
-    "matsuo",
-    "pungently",
-    "preprinting",
-    "filled",
-    "psychotherapists",
-    "lap",
-    "diaphragm",
-    "accusingly",
-    "school-leaving",
-    "severs",
-    "mutations",
-    "attended",
-    "leggings",
-    "nodding",
-    "2.21.6",
-    "vrai",
-    "draining",
-    "favoring",
-    "ware",
-    "thirty-two",
-    "homebuilding",
-    "blared",
-    "compel",
-    "sum",
-    "left-justified",
-    "zhitkov",
-    "bayanihan",
-    "newsreel",
-    "foreseeable",
-    "lightness",
-    "doggone",
-    "mccracken",
-    "synce",
-    "russian-dominated",
-    "high-tailed",
-    "devastated",
-    "shayne's",
-    "veins",
-    "liter",
-    "leeway",
-    "pierce",
-    "waning",
-    "backs",
-    "fender",
-    "chide",
-    "slo-flo",
-    "russet-colored",
-    "barbarian",
-    "social-register",
-    "haying",
-    "misnomer",
-    "bawh",
-    "engrg",
-    "oxcart",
-    "proscribed",
-    "two-component",
-    "unfamiliar",
-    "inertial",
-    "snowball",
-    "fictive",
-    "bentham",
-    "densities",
-    "aviator",
-    "fretting",
-    "huckster's",
-    "waive",
-    "plympton",
-    "replied",
-    "writer's",
-    "easy-to-spot",
-    "contrition",
-    "cecilia",
-    "communities",
-    "intended",
-    "extension",
-    "strode",
-    "guy's",
-    "when",
-    "lyophilized",
-    "photocathodes",
-    "pathologic",
-    "fed.",
-    "agreed-upon",
-    "12-17",
-    "pickup",
-    "moderation",
-    "kapok-filled",
-    "ridden",
-    "glaringly",
-    "renovation",
-    "proto-athabascan",
-    "dulls",
-    "excellence",
-    "chords",
-    "looking",
-    "legislative",
-    "valuations",
-    "sac",
-    "storm",
-    "atlantica",
-    "disproportionate",
-    "hardtack-box",
-    "embossed",
-    "nuit",
-    "wyndham's",
-    "bathos",
-    "about",
-    "herdin'",
-    "atlee",
-    "casein",
-    "dispatches",
-    "unsuspecting",
-    "dollar",
-    "asbestos",
-    "pre-emption",
-    "sobibor",
-    "pakistan",
-    "odell",
-    "wind",
-    "deep-sea",
-    "salve",
-    "ethers",
-    "secants",
-    "lawyer's",
-    "deceit",
-    "colon",
-    "swift",
-    "jack-of-all-trades",
-    "jiggling",
-    "petulant",
-    "hisself",
-    "687.87",
-    "eldest",
-    "flooding",
-    "loses",
-    "wagging",
-    "countian",
-    "grapevines",
-    "nettlesome",
-    "face-to-face",
-    "catching",
-    "508-yard",
-    "janssen",
-    "propulsions",
-    "dissension",
-    "eighth",
-    "mosque",
-    "summers",
-    "zara",
-    "mulling",
-    "pebble",
-    "inwardness",
-    "politicking",
-    "procreative",
-    "storehouses",
-    "saran",
-    "galaxies",
-    "threes-fulfilled",
-    "cheap",
-    "tug",
-    "pound",
-    "instructing",
-    "greentree",
-    "colmans",
-    "nakedness",
-    "developed",
-    "sensitively",
-    "sale",
-    "geiger",
-    "caves",
-    "sculptures",
-    "lubricated",
-    "yachters",
-    "jennings",
-    "epithets",
-    "fronting",
-    "chlorine-carbon",
-    "dispute",
-    "individual's",
-    "pretext",
-    "saami",
-    "longed",
-    "twitching",
-    "spigots",
-    "geometry",
-    "marlborough",
-    "4-7/8",
-    "bread",
-    "blanched",
-    "bonheur",
-    "mccullough",
-    "febrile",
-    "prams",
-    "astonishing",
-    "previously",
-    "**ym",
-    "later",
-    "embroideries",
-    "chin-up",
-    "stationmaster",
-    "convening",
-    "obscures",
-    "drain",
-    "rebirth",
-    "borer",
-    "authoritarianism",
-    "glanders",
-    "pillows",
-    "ramillies",
-    "above-noted",
-    "assigned",
-    "objectionable",
-    "trance",
-    "taut-nerved",
-    "104",
-    "wick",
-    "leukemia",
-    "recoiled",
-    "hemorrhaging",
-    "intercontinental",
-    "pilfering",
-    "farfetched",
-    "hardboiled",
-    "screws",
-    "2:19",
-    "glimpses",
-    "deem",
-    "peril",
-    "psyches",
-    "molal",
-    "1960's",
-    "half-city",
-    "aesthetics",
-    "emptying",
-    "valente",
-    "franco",
-    "guglielmo",
-    "educated",
-    "coiled",
-    "expiating",
-    "tiles",
-    "suffix",
-    "cooled",
-    "activation",
-    "checks",
-    "children",
-    "guiana",
-    "belittling",
-    "adamant",
-    "gene-princess",
-    "mustang",
-    "teratologies",
-    "rent",
-    "stretches",
-    "nonshifters",
-    "soccer",
-    "tangential",
-    "endangering",
-    "monosyllables",
-    "nine",
-    "nitrate",
-    "braiding",
-    "textbook",
-    "patagonians",
-    "holies",
-    "setting",
-    "suds",
-    "sleeplessly",
-    "curriculums",
-    "soundly",
-    "adolescent's",
-    "senselessly",
-    "enclaves",
-    "wake",
-    "il",
-    "corinth",
-    "fraternity",
-    "looped",
-    "huggins",
-    "viator",
-    "plea",
-    "fertility",
-    "last-named",
-    "24-hr.",
-    "cursed",
-    "remove",
-    "feringa",
-    "98",
-    "workers",
-    "caricature",
-    "2:03",
-    "tass",
-    "dazzle",
-    "copper",
-    "ceremoniously",
-    "duverger",
-    "dispensing",
-    "photographing",
-    "single-handed",
-    "burgomaster's",
-    "unexpended",
-    "jennie",
-    "four-wheel-drive",
-    "grown-up",
-    "high-positive",
-    "debated",
-    "meq.",
-    "most",
-    "transshipment",
-    "conspires",
-    "tyrant",
-    "father-brother",
-    "huxley",
-    "storylines",
-    "jets",
-    "palladio",
-    "126,000",
-    "nostalgic",
-    "present",
-    "ward's",
-    "warehouses",
-    "heavenward",
-    "blundered",
-    "semidrying",
-    "full-fledged",
-    "assembled",
-    "bugs",
-    "deserts",
-    "remoter",
-    "interpreting",
-    "slings",
-    "frustrated",
-    "spinley's",
-    "cotty",
-    "traveled",
-    "tile",
-    "transplantable",
-    "chopping",
-    "roses",
-    "sssshoo",
-    "winnings",
-    "church's",
-    "thees",
-    "roadbed",
-    "buyers'",
-    "frizzling",
-    "corollary",
-    "oriole",
-    "caterpillars",
-    "coordination",
-    "anthropology",
-    "finds",
-    "shoelaces",
-    "guise",
-    "democrats'",
-    "swirled",
-    "discover",
-    "fancies",
-    "practising",
-    "approve",
-    "distress",
-    "raping",
-    "woodland",
-    "$395,000",
-    "hindsight",
-    "cycle",
-    "alemagna",
-    "scenarios",
-    "smooth",
-    "nonwhite",
-    "itoiz",
-    "misdirectors",
-    "residues",
-    "sorely",
-    "10:05",
-    "valle",
-    "bekkai",
-    "schematically",
-    "arkansas'",
-    "shun",
-    "dehaviland",
-    "pulova",
-    ",",
-    "bicycle",
-    "prove",
-    "unforgettable",
-    "networks",
-    "sedan",
-    "proclaiming",
-    "self-content",
-    "amputated",
-    "tito",
-    "ask",
-    "lantern",
-    "malt",
-    "disqualify",
-    "simmel",
-    "fishkill",
-    "berto's",
-    "nineteen-sixty",
-    "burch",
-    "tart",
-    "stengel's",
-    "kassem",
-    "janitsch",
-    "sold",
-    "streamed",
-    "acid-fast",
-    "telemann",
-    "breakables",
-    "excretion",
-    "four-syllable",
-    "munger",
-    "animosity",
-    "ventricle",
-    "11-shot",
-    "dodging",
-    "nonchurchgoing",
-    "excited",
-    "precedent-based",
-    "livestock",
-    "putty",
-    "emotions",
-    "bascom",
-    "meyle",
-    "unimpeachable",
-    "morrison",
-    "people's",
-    "civic",
-    "tremendous",
-    "couched",
-    "chauncey",
-    "meditations",
-    "higher-density",
-    "darkling",
-    "benedictine",
-    "marbleized",
-    "grazie",
-    "woods's",
-    "walkout",
-    "sarti",
-    "labothe",
-    "groomsmen",
-    "$3.50",
-    "ancillary",
-    "pena",
-    "beaches",
-    "serenaded",
-    "lifeless",
-    "signifies",
-    "scorn",
-    "603",
-    "approximate",
-    "exquisiteness",
-    "equipping",
-    "stock-market",
-    "competent",
-    "nazarova",
-    "thoughtfully",
-    "pius",
-    "icicle",
-    "painted-in",
-    "discontent",
-    "harassed",
-    "invention",
-    "self-dictate",
-    "evils",
-    "whence",
-    "overcrowded",
-    "stereotyped",
-    "first-run",
-    "cashews",
-    "deplores",
-    "numbness",
-    "polysiloxanes",
-    "intensifiers",
-    "denverite",
-    "uhles",
-    "sewer's",
-    "clicks",
-    "magnitude",
-    "atonally",
-    "suspects",
-    "hops",
-    "re",
-    "carefree",
-    "blaine",
-    "effects",
-    "wood-oil",
-    "pervasive",
-    "delays",
-    "winooski",
-    "plagued",
-    "coronation",
-    "snatches",
-    "thick",
-    "abounds",
-    "percolator",
-    "rival",
-    "upper-middle-",
-    "pornographic",
-    "emphysema",
-    "keen",
-    "cardamom",
-    "nero",
-    "bull's-eyes",
-    "non-algebraically",
-    "implying",
-    "plaster",
-    "curtailed",
-    "travelogues",
-    "fronts",
-    "ivory",
-    "allegiance",
-    "hawaiian-americans",
-    "became",
-    "glorified",
-    "smile",
-    "errol",
-    "god-curst",
-    "repudiation",
-    "eugene's",
-    "behahn",
-    "ginghams",
-    "dilated",
-    "inundating",
-    "fealty",
-    "illegitimate",
-    "work-out",
-    "informants",
-    "politburo",
-    "viet",
-    "squashed-looking",
-    "mercer's",
-    "continuity",
-    "accomplish",
-    "bath",
-    "washer",
-    "charted",
-    "christened",
-    "doubling",
-    "curiae",
-    "forgetfulness",
-    "alec's",
-    "kohnstamm-positive",
-    "immoderate",
-    "poshest",
-    "distort",
-    "hill",
-    "sucker-rolling",
-    "tongue-twister",
-    "pseudomonas",
-    "turk",
-    "radiopasteurization",
-    "unconcerned",
-    "booby",
-    "lil",
-    "speculatively",
-    "dispersing",
-    "dug",
-    "persist",
-    "reassuringly",
-    "baker",
-    "congratulate",
-    "ounces",
-    "isocyanate-labeled",
-    "hyde's",
-    "agreeing",
-    "leveling",
-    "modeling",
-    "gifts",
-    "ergotropic",
-    "deslonde",
-    "state's-responsibility",
-    "well-wedged",
-    "remarry",
-    "figaro",
-    "jokes",
-    "first-aid",
-    "hopper",
-    "1823",
-    "curie-weiss",
-    "seamless",
-    "multiple-choice",
-    "ninety-nine",
-    "woodwind",
-    "kloman",
-    "grotesque",
-    "skinny",
-    "wolstenholme",
-    "hackett",
-    "chiaromonte",
-    "prop.",
-    "150-milliampere",
-    "shoulders",
-    "salt-crusted",
-    "opalescent",
-    "aysshom",
-    "sante",
-    "wave-travel",
-    "locations",
-    "lobe",
-    "pranks",
-    "he's",
-    "baton",
-    "aspect",
-    "idje",
-    "aa",
-    "lower-paid",
-    "chat",
-    "profet",
-    "pennant",
-    "romanza",
-    "replies",
-    "fenster",
-    "entrepreneur",
-    "assertiveness",
-    "ever'body",
-    "obligingly",
-    "12th",
-    "parsimony",
-    "angered",
-    "folksongs",
-    "coahse",
-    "three-panel",
-    "brookfield",
-    "latter's",
-    "lastly",
-    "reorganize",
-    "slivery",
-    "prophecies",
-    "skates",
-    "asceticism",
-    "denver",
-    "attain",
-    "imaginary",
-    "trichloroacetic",
-    "longest",
-    "steam",
-    "mud-beplastered",
-    "costumes",
-    "bd/ft",
-    "poussin",
-    "dissemination",
-    "summarizes",
-    "freeholders",
-    "breakin",
-    "idyll",
-    "appointees",
-    "glycerine",
-    "non-pathogenic",
-    "scrutin",
-    "disappeared",
-    "pre-cooled",
-    "matsu",
-    "timed",
-    "statistique",
-    "womanhood",
-    "abruptness",
-    "inquirer",
-    "distortable",
-    "connections",
-    "orgasms",
-    "processed",
-    "whirled",
-    "apollo",
-    "scattering",
-    "jeep",
-    "2-over-par",
-    "temporally",
-    "arnica",
-    "vrilium",
-    "vouillemont",
-    "edible",
-    "ousting",
-    "wolfe",
-    "fertile",
-    "inflicting",
-    "azerbaijan",
-    "edit",
-    "hikes",
-    "purgation",
-    "silo",
-    "erich",
-    "orlick",
-    "creeping",
-    "briefing",
-    "carolinians",
-    "alpha",
-    "rechartering",
-    "subrogation",
-    "regina",
-    "emission",
-    "difficulties",
-    "foams",
-    "torrid-mighty",
-    "funerals",
-    "2-year-olds",
-    "gertrude",
-    "thyroglobulin",
-    "fragment",
-    "chants",
-    "flitting",
-    "spreads",
-    "admires",
-    "confederations",
-    "0.70",
-    "memorials",
-    "baffin",
-    "gram-negative",
-    "pilot",
-    "fuel",
-    "wetter",
-    "dextrous-fingered",
-    "swimsuit",
-    "helicopter-borne",
-    "30''",
-    "a's",
-    "raped",
-    "nymphomaniacs",
-    "tractor",
-    "red-and-yellow",
-    "tasks",
-    "tenements",
-    "sidney's",
-    "recount",
-    "sectarian",
-    "provides",
-    "awareness",
-    "birth-prevention",
-    "labored",
-    "intramural",
-    "attempt",
-    "sororities",
-    "inquired",
-    "autocollimator",
-    "humour",
-    "ambler",
-    "leet",
-    "frankfort",
-    "lie",
-    "vaccinating",
-    "frog-haiku",
-    "buys",
-    "listen",
-    "marketwise",
-    "reconstructs",
-    "pound-of-flesh",
-    "2:37",
-    "sunman",
-    "soul",
-    "bible-loving",
-    "lemme",
-    "robertsons",
-    "opposes",
-    "over-",
-    "crouch",
-    "adore",
-    "combine",
-    "deputies",
-    "tables",
-    "brightens",
-    "pulp",
-    "advisors",
-    "winslow's",
-    "unprocurable",
-    "thynnes",
-    "chagrin",
-    "pumping",
-    "jean-honore",
-    "folkston",
-    "polish",
-    "statewide",
-    "mcintyre",
-    "cattaloe",
-    "retorted",
-    "sworn",
-    "teammates'",
-    "homeward",
-    "single-lane",
-    "toothpaste",
-    "braves",
-    "packed",
-    "cottonseed",
-    "blending",
-    "chiefdoms",
-    "shimming",
-    "mrads",
-    "jerry",
-    "fit",
-    "teenagers",
-    "pels",
-    "harold",
-    "boarding-home",
-    "associated",
-    "thereto",
-    "beckons",
-    "pace-setter",
-    "nate",
-    "crabapple",
-    "amount",
-    "exodus",
-    "money-handling",
-    "transferor's",
-    "bandish",
-    "solar-electromagnetic-",
-    "channing's",
-    "mclendon",
-    "restrict",
-    "robbins",
-    "isolating",
-    "brownell",
-    "tang",
-    "nicholas",
-    "beveling",
-    "boorish",
-    "anesthetically",
-    "amorality",
-    "brassnose",
-    "narrator",
-    "interim",
-    "7-3",
-    "horseback",
-    "primed",
-    "thesaurus",
-    "invictus",
-    "ball-hawking",
-    "gleeful",
-    "18-1/2-inch",
-    "frontage",
-    "captious",
-    "straight",
-    "abutments",
-    "laguardia",
-    "palletized",
-    "oppenheim",
-    "bureaucrat",
-    "tines",
-    "kurt",
-    "thick-skulled",
-    "medicale",
-    "swart",
-    "blades",
-    "corroborate",
-    "surmise",
-    "tory",
-    "gouging",
-    "eclectic",
-    "coal-like",
-    "yankton",
-    "2-2",
-    "altered",
-    "massifs",
-    "convened",
-    "agriculturally",
-    "rakish",
-    "bailey",
-    "tender",
-    "multi-million-dollar",
-    "samuels",
-    "usga",
-    "crap",
-    "analysed",
-    "xavier's",
-    "humly",
-    "clings",
-    "antonio",
-    "sandwich",
-    "greens",
-    "shards",
-    "rat-face",
-    "decanting",
-    "shingles",
-    "literally",
-    "flung",
-    "acknowledges",
-    "eighty-three",
-    "lobscouse",
-    "paintbrush",
-    "calhoun",
-    "georgetown's",
-    "wales",
-    "restive",
-    "$10,000,000",
-    "taxing",
-    "cathode",
-    "philologists",
-    "alphabetized",
-    "escapades",
-    "imaging",
-    "convent",
-    "farnese",
-    "correctly",
-    "ugly",
-    "machinist",
-    "hearing",
-    "rippled",
-    "1''",
-    "smoothness",
-    "palazzi",
-    "catalogued",
-    "artisans",
-    "subsidiary",
-    "wrathful",
-    "theretofore",
-    "pan",
-    "mckenna",
-    "copley",
-    "mysticisms",
-    "smog",
-    "aforesaid",
-    "high-end",
-    "know",
-    "wide-sweeping",
-    "strong-made",
-    "hillyer",
-    "ernie's",
-    "adults",
-    "skipjack's",
-    "prized",
-    "bambi",
-    "mimi",
-    "delphine's",
-    "gherkins",
-    "simplifies",
-    "customer",
-    "114",
-    "stirring",
-    "braque",
-    "brinsley",
-    "neighboring",
-    "kellum",
-    "spurred",
-    "platform",
-    "calendar",
-    "scherzo",
-    "chunks",
-    "plod",
-    "greatness",
-    "floyd's",
-    "build-better-for-less",
-    "postures",
-    "j.",
-    "$634,517,000",
-    "spouses",
-    "boatswain",
-    "protitch",
-    "rumpled",
-    "ringings",
-    "killer",
-    "countrywide",
-    "emma",
-    "theodore",
-    "transaction",
-    "hankered",
-    "chapel-like",
-    "499-520",
-    "gaming-card",
-    "davy's",
-    "ate",
-    "alienated",
-    "stopping-point",
-    "smelling",
-    "splinting",
-    "artificially",
-    "vagueness",
-    "petipa-tschaikowsky",
-    "garibaldi's",
-    "singularity",
-    "gout",
-    "halfhearted",
-    "birgitta",
-    "kofanes",
-    "shawl",
-    "unselfish",
-    "tribune's",
-    "frelinghuysen",
-    "new-house",
-    "bobbed",
-    "nineties",
-    "splendide",
-    "polarizing",
-    "frazzled",
-    "elevator",
-    "520",
-    "pulpit",
-    "umber",
-    "forefingers",
-    "grandmother",
-    "centrifuging",
-    "misted",
-    "models",
-    "reputable",
-    "129%",
-    "grumbling",
-    "cocky",
-    "blumenthal",
-    "ingestion",
-    "white-dominated",
-    "stumpage",
-    "drawn-out",
-    "wicked",
-    "palest",
-    "breakdowns",
-    "houtz",
-    "225/hp",
-    "flog",
-    "separating",
-    "reducer",
-    "sorrentine",
-    "l'imperiale",
-    "coconut",
-    "15-1",
-    "bantered",
-    "punches",
-    "baseballight",
-    "heritages",
-    "concert",
-    "l'independance",
-    "selecting",
-    "contemplates",
-    "fork",
-    "n",
-    "underhanded",
-    "sauterne",
-    "accumulates",
-    "dashiell",
-    "marvelously",
-    "ratable",
-    "bulba",
-    "artistic",
-    "mentality",
-    "ace",
-    "ferried",
-    "frees",
-    "limped",
-    "eventuality",
-    "banditos",
-    "brest-silevniov",
-    "108",
-    "parapets",
-    "cotter",
-    "herford's",
-    "kenilworth",
-    "remote",
-    "flatiron",
-    "noble",
-    "illusive",
-    "wheaton",
-    "sicily",
-    "peninsula",
-    "jennie's",
-    "martinique",
-    "cologne",
-    "troeltsch",
-    "shute",
-    "timbre",
-    "frailest",
-    "live-oak",
-    "dept.",
-    "onward-driving",
-    "diane's",
-    "ringing",
-    "newborn",
-    "lenobel's",
-    "healthier",
-    "wright's",
-    "flaxen",
-    "atone",
-    "russ",
-    "iraq",
-    "re-use",
-    "26-2",
-    "drowsy",
-    "dishes",
-    "shewe",
-    "plainest",
-    "steroid-induced",
-    "holes",
-    "ouzo",
-    "fell",
-    "bishop",
-    "egils",
-    "muzak",
-    "redemptive",
-    "sahjunt",
-    "jobs-tears",
-    "remotest",
-    "hesitancy",
-    "crip",
-    "sheered",
-    "blitzes",
-    "lauren",
-    "woodpecker",
-    "connor",
-    "pyre",
-    "non-political",
-    "hydrophobic",
-    "battering",
-    "masts",
-    "miner",
-    "swamp",
-    "persianesque",
-    "hefted",
-    "junkies",
-    "foamed",
-    "planed",
-    "disordered",
-    "disability",
-    "force-rate",
-    "immensities",
-    "regents",
-    "seizin'",
-    "happening",
-    "crudities",
-    "computers",
-    "crombie's",
-    "three-part",
-    "electromyography",
-    "rathbones",
-    "equilibrated",
-    "whole",
-    "tenn.",
-    "kira",
-    "bustle",
-    "seven-word",
-    "assist",
-    "suitably",
-    "replanted",
-    "$2500",
-    "7",
-    "audit",
-    "hetman's",
-    "public",
-    "zennist",
-    "accelerators",
-    "desserts",
-    "talbott's",
-    "colonies",
-    "3-year-old",
-    "bierce",
-    "chemistries",
-    "yaws",
-    "appreciations",
-    "confronts",
-    "aegis",
-    "hands-off",
-    "converged",
-    "moored",
-    "cruising",
-    "doting",
-    "mutterers",
-    "cancels",
-    "berra",
-    "diffraction",
-    "non-jew",
-    "punished",
-    "interwoven",
-    "clamps",
-    "positivist",
-    "padlocked",
-    "gm.",
-    "disturbed",
-    "attribute",
-    "dwarf",
-    "keenest",
-    "imitated",
-    "through",
-    "although",
-    "posed",
-    "limitation",
-    "consumptive",
-    "complain",
-    "demonstration",
-    "clergymen",
-    "aloneness",
-    "r-bergen",
-    "parboiled",
-    "steinbecks",
-    "widower",
-    "jowl",
-    "phloem",
-    "eventfully",
-    "printer",
-    "grappling",
-    "7.2",
-    "spice-nice",
-    "half-crazy",
-    "daddy",
-    "sipping",
-    "everyday",
-    "10''",
-    "walkers",
-    "sunspot",
-    "redstone",
-    "2:33.3",
-    "ornate",
-    "farneses",
-    "unreason",
-    "uninteresting",
-    "perforce",
-    "indispensable",
-    "conquered",
-    "incidents",
-    "gamut",
-    "indium",
-    "after-effects",
-    "murdering",
-    "shrugs",
-    "ex-truck",
-    "6-5",
-    "6:00",
-    "scott",
-    "relayed",
-    "oz.",
-    "martin's",
-    "personage",
-    "curry",
-    "budget-making",
-    "napkins",
-    "slapped",
-    "hot-water",
-    "$18.2",
-    "annihilation",
-    "accuse",
-    "galtier",
-    "clatter",
-    "honkytonks",
-    "carleton",
-    "after-school",
-    "maye",
-    "vitamin-and-iron",
-    "sap",
-    "kitchens",
-    "persuading",
-    "low-level",
-    "norristown",
-    "cotton-growing",
-    "gyro-platform-servo",
-    "life-contracts",
-    "salvage",
-    "fairy-tale",
-    "copra",
-    "trickle",
-    "huntley",
-    "virtually",
-    "azaleas",
-    "brooklyn",
-    "greening",
-    "synthetics",
-    "triad",
-    "creeps",
-    "post-inaugural",
-    "emptiness",
-    "sp",
-    "falsifying",
-    "o'brien",
-    "asleep",
-    "cathodoluminescent",
-    "12-month",
-    "certifies",
-    "flag-wavers",
-    "expeditious",
-    "1,000",
-    "pamasu",
-    "welling",
-    "disturbing",
-    "renaults",
-    "coughlin",
-    "too-simple-to-be-true",
-    "twisted",
-    "30-piece",
-    "stationed",
-    "beats",
-    "$31,179,816",
-    "glaciers",
-    "best's",
-    "30%",
-    "out-dated",
-    "fabricated",
-    "bilateral",
-    "whir",
-    "hilltops",
-    "pacifist",
-    "co-star",
-    "intangible",
-    "foreshortening",
-    "sensitized",
-    "sinned",
-    "dragger",
-    "irishmen",
-    "broker",
-    "400-401",
-    "northers",
-    "conclusions",
-    "folksy",
-    "recipient",
-    "chimes",
-    "hundred-leaf",
-    "gore",
-    "conscience",
-    "bengali",
-    "softening",
-    "over-emphasized",
-    "si",
-    "chili",
-    "assimilate",
-    "unending",
-    "prescribe",
-    "kegful",
-    "better-than-average",
-    "bronchial",
-    "sprague's",
-    "tug-of-war",
-    "gaging",
-    "too-shiny",
-    "behynde",
-    "bastard",
-    "breather",
-    "158",
-    "special-interest",
-    "pointers",
-    "classifiers",
-    "roundabout",
-    "prominent",
-    "financed",
-    "mao",
-    "adolescence",
-    "roughneck",
-    "grooves",
-    "plantings",
-    "collision",
-    "kooks",
-    "scatter",
-    "agrobacterium",
-    "dismaying",
-    "forgive",
-    "mommor",
-    "1888",
-    "contracting",
-    "mmes.",
-    "romping",
-    "created",
-    "feasting",
-    "work-paralysis",
-    "laurents'",
-    "tektite",
-    "ambrosial",
-    "enlistment",
-    "peak",
-    "vandringsar",
-    "plateau",
-    "dostoevsky",
-    "lemon",
-    "swam",
-    "grisly",
-    "discreetly",
-    "hilum",
-    "1920's",
-    "niobe",
-    "dissect",
-    "marketed",
-    "youngster",
-    "heiser",
-    "poses",
-    "oersted's",
-    "fonder",
-    "graphical",
-    "spit",
-    "forty-fifth",
-    "mailed",
-    "revelling",
-    "somersaulting",
-    "gauguin",
-    "sax",
-    "cutlets",
-    "appleton",
-    "yurochka",
-    "cleavage",
-    "pbs",
-    "trichinella",
-    "state-owned",
-    "infectious",
-    "creep",
-    "unites",
-    "axis",
-    "menstruation",
-    "beckett",
-    "spanish-american",
-    "industry-wide",
-    "pensioner",
-    "lust",
-    "narrows",
-    "38*0",
-    "swing",
-    "inlaid",
-    "land-locked",
-    "somber",
-    "racine's",
-    "confederation",
-    "flyaway",
-    "spectrometric",
-    "malesherbes",
-    "parkinson's",
-    "wayward",
-    "lingered",
-    "liberation",
-    "fittings",
-    "pauses",
-    "paginated",
-    "productions",
-    "photon-counting",
-    "intellect",
-    "presiding",
-    "undulating",
-    "recruitment",
-    "firsthand",
-    "notched-stick",
-    "over-corrected",
-    "limbs",
-    "loveliness",
-    "turkey",
-    "parrot-like",
-    "purdew",
-    "self-acceptance",
-    "parcel",
-    "diary",
-    "stucco",
-    "callous",
-    "jurors",
-    "burners",
-    "long-time",
-    "flocked",
-    "mistook",
-    "investments",
-    "80-degrees-c",
-    "bishops",
-    "larger",
-    "hawkers",
-    "catt",
-    "inadvertently",
-    "fifty-odd",
-    "bequests",
-    "meteorites",
-    "lawyers",
-    "maynor",
-    "bowl",
-    "presence",
-    "mash",
-    "ritter",
-    "cockpits",
-    "listener's",
-    "1967",
-    "simak's",
-    "splashing",
-    "disturbances",
-    "islanders",
-    "half-way",
-    "advertise",
-    "evansville",
-    "accident",
-    "weave",
-    "bee's",
-    "3-1/2''",
-    "63",
-    "breaching",
-    "dyerear",
-    "them's",
-    "1840",
-    "sihanouk",
-    "pocketbook",
-    "121",
-    "woeful",
-    "bach",
-    "blyth",
-    "concetta's",
-    "dwellers",
-    "crudity",
-    "sarcolemmal",
-    "fife",
-    "detail",
-    "lee's",
-    "verbatim",
-    "coverings",
-    "multifigure",
-    "droppings",
-    "moderator",
-    "aforementioned",
-    "massachusetts",
-    "lunatic-fringe",
-    "vaudois",
-    "martin",
-    "appliance",
-    "value-problems",
-    "foray",
-    "l'assistance",
-    "tristan",
-    "conduct",
-    "hard-come-by",
-    "cell",
-    "tawny",
-    "disfavor",
-    "delicti",
-    "dugout",
-    "takeoff",
-    "quick-frozen",
-    "281",
-    "coppery",
-    "nicknamed",
-    "calcified",
-    "reformism",
-    "swift-striding",
-    "two-valued",
-    "disappointed",
-    "stupidest",
-    "photography",
-    "levelled",
-    "verloop's",
-    "formula",
-    "navigate",
-    "divorce",
-    "colossians",
-    "falstaff",
-    "overlaid",
-    "big",
-    "religiosity",
-    "4.7",
-    "boilers",
-    "endurance",
-    "tidied",
-    "parishes",
-    "teachers'",
-    "nevah",
-    "lymphocytes",
-    "hearst's",
-    "$297",
-    "prettyman",
-    "incredulously",
-    "axle",
-    "1909",
-    "a.d.",
-    "deegan",
-    "acknowledgment",
-    "dora",
-    "rutstein",
-    "second",
-    "upshots",
-    "organically",
-    "delivre",
-    "beets",
-    "china",
-    "appreciated",
-    "cupboards",
-    "officiating",
-    "halfways",
-    "changes",
-    "accumulation",
-    "compute",
-    "nahb",
-    "ambition",
-    "moon-faced",
-    "trapper's",
-    "triplet",
-    "bursitis",
-    "douglass",
-    "stevenson",
-    "gloved",
-    "quakeress",
-    "memories",
-    "indicated",
-    "air-conditioning",
-    "fruition",
-    "hustling",
-    "short-skirted",
-    "stubbed",
-    "advertises",
-    "album",
-    "unsuitable",
-    "crabbed",
-    "aided",
-    "liaison",
-    "outstanding",
-    "paramount",
-    "combatted",
-    "potted",
-    "emitting",
-    "delle",
-    "freezers",
-    "amend",
-    "visually",
-    "ultimately",
-    "batavia",
-    "harburg's",
-    "determinant",
-    "unaccountable",
-    "target-hunting",
-    "traces",
-    "incense",
-    "50-degrees",
-    "lances",
-    "1515",
-    "emile's",
-    "nonspecifically",
-    "bound",
-    "silence",
-    "employee",
-    "seldes",
-    "well-trained",
-    "elisha",
-    "electron",
-    "hymn",
-    "globe",
-    "200,000",
-    "indoctrination",
-    "bake-oven",
-    "run-ups",
-    "sock",
-    "imitative",
-    "appropriately",
-    "editor's",
-    "demontez",
-    "logically",
-    "unfailing",
-    "drown",
-    "goitrogens",
-    "harness",
-    "benchmarks",
-    "fain",
-    "prohibited",
-    "381(c)",
-    "augurs",
-    "friedrich",
-    "far-ranging",
-    "ascendancy",
-    "knots",
-    "511",
-    "militia",
-    "wangenheim",
-    "gushed",
-    "courcy",
-    "mercy",
-    "210",
-    "free-blown",
-    "hours'",
-    "intermissions",
-    "transporting",
-    "bancroft",
-    "apostolic",
-    "gallet",
-    "beige",
-    "loosened",
-    "favorite",
-    "typed",
-    "hind",
-    "camaraderie",
-    "sou",
-    "12-1/2-inch",
-    "earthly",
-    "initiated",
-    "re-moralizing",
-    "capitulation",
-    "lawmakers",
-    "invitees",
-    "kandinsky",
-    "towed",
-    "scoffed",
-    "intimidation",
-    "cypress-like",
-    "1200-square-foot",
-    "tint",
-    "learning",
-    "fauntleroy",
-    "possessor",
-    "inc.",
-    "19-23",
-    "rhenish",
-    "mccauley",
-    "ostensibly",
-    "inter-town",
-    "alix",
-    "dylan",
-    "self-assertion",
-    "impersonates",
-    "gamble",
-    "bates'",
-    "virtuosity",
-    "muslim",
-    "demoralizes",
-    "wild",
-    "vida",
-    "prospective",
-    "producer",
-    "not-so-pale",
-    "face-to-wall",
-    "becometh",
-    "well-rounded",
-    "fluorescence",
-    "farmhouse",
-    "ideologist",
-    "management",
-    "ex-oriole",
-    "justice's",
-    "opus",
-    "supranational",
-    "non-intellectual",
-    "re-enactments",
-    "hostelries",
-    "amines",
-    "late-comers",
-    "creaks",
-    "jolla",
-    "carriage",
-    "continence",
-    "hung",
-    "knightfall",
-    "blotting",
-    "nodular",
-    "multilateral",
-    "mask",
-    "undisciplined",
-    "frenzy-free",
-    "frontiersmen",
-    "puccini's",
-    "'20s",
-    "jury",
-    "random",
-    "reevaluation",
-    "altairians",
-    "racks",
-    "worst",
-    "rotor",
-    "either-or",
-    "library",
-    "modernizing",
-    "pilgrimages",
-    "underfoot",
-    "map",
-    "tonic",
-    "molten",
-    "vividly",
-    "walk-way",
-    "clippings",
-    "himself",
-    "parsympathetic",
-    "slenczynka",
-    "apology",
-    "aquacutie",
-    "grandly",
-    "stettin",
-    "civilian-groups",
-    "penthouse",
-    "morgenthau's",
-    "gordon",
-    "stimulatory",
-    "crowd",
-    "salaries",
-    "cloudy",
-    "progressively",
-    "danube",
-    "overexpose",
-    "hodgepodge",
-    "generation's",
-    "stanislas'",
-    "orthophosphates",
-    "thunk",
-    "suspecting",
-    "clarifies",
-    "electroshock",
-    "hump",
-    "khan",
-    "heads",
-    "judgement",
-    "kalamazoo",
-    "alkaline",
-    "bio-dynamic",
-    "revel",
-    "collapse",
-    "stupefying",
-    "jotted",
-    "chromium-substituted",
-    "immortalized",
-    "cal",
-    "simpson's",
-    "wasp",
-    "driver's",
-    "recessed",
-    "cruel",
-    "debatable",
-    "chargin'",
-    "sparky",
-    "realer",
-    "blood-lust",
-    "scoring",
-    "warehousing",
-    "adjunct",
-    "aylesbury",
-    "unreflective",
-    "wiggled",
-    "reductions",
-    "soldier's",
-    "yehudi",
-    "refectories",
-    "15,500-lb.",
-    "pointed",
-    "impeded",
-    "capsules",
-    "manufacturers",
-    "siddo",
-    "luckier",
-    "coning",
-    "immersed",
-    "mem",
-    "smithy",
-    "rivulets",
-    "saturday-night",
-    "confidently",
-    "deceives",
-    "unconditional",
-    "castillo",
-    "kingan",
-    "putter",
-    "credible",
-    "cerulean",
-    "straits",
-    "institution",
-    "springfield's",
-    "guests'",
-    "let's",
-    "headlining",
-    "implant",
-    "candlelight",
-    "montgomery",
-    "boar",
-    "1637",
-    "exclamation",
-    "sag",
-    "mid-19th",
-    "crimsoning",
-    "linking",
-    "henrietta",
-    "querulously",
-    "homo",
-    "ordeal",
-    "brazenness",
-    "parochial",
-    "faim",
-    "platonic",
-    "panoramas",
-    "adobe",
-    "inaugurated",
-    "pegging",
-    "people",
-    "bartleby",
-    "institute's",
-    "holdovers",
-    "dressy",
-    "price-consciousness",
-    "polished",
-    "superintendent's",
-    "american-negro",
-    "pruned",
-    "staccatos",
-    "styryl-lithium",
-    "poling",
-    "finger-paint",
-    "andrea",
-    "bellboys",
-    "isothermally",
-    "california's",
-    "fifteen",
-    "nut-house",
-    "owens",
-    "yassuhs",
-    "loves",
-    "translucent",
-    "tallies",
-    "suability",
-    "castros",
-    "75",
-    "juet's",
-    "$120",
-    "erhart",
-    "animal-like",
-    "procession",
-    "hairtonic",
-    "straight-out",
-    "admassy's",
-    "mans",
-    "unexpected",
-    "branch",
-    "limits",
-    "disdaining",
-    "doom",
-    "accounted",
-    "miswritten",
-    "enthusiasms",
-    "behooves",
-    "espousal",
-    "rescued",
-    "pitfalls",
-    "noctiluca",
-    "idealistic",
-    "libraries",
-    "instigate",
-    "pain",
-    "someone",
-    "drag",
-    "things",
-    "trimmer",
-    "staffed",
-    "judiciary",
-    "asymmetrically",
-    "passageway",
-    "kauffmann",
-    "nor",
-    "retreat",
-    "dangle",
-    "discerned",
-    "hogs",
-    "375-degrees-c",
-    "crasher",
-    "arsenal",
-    "runway",
-    "funding",
-    "blunter",
-    "kas.",
-    "brink",
-    "obstructed",
-    "curved",
-    "term",
-    "plainview",
-    "pratakku",
-    "merged",
-    "adoniram",
-    "adapter",
-    "871",
-    "admirer",
-    "itches",
-    "awakening",
-    "lured",
-    "correlatively",
-    "aggressor",
-    "transport",
-    "overdoing",
-    "vis-a-vis",
-    "erase",
-    "cav's",
-    "newcastle",
-    "passionately",
-    "necessity",
-    "heaviest",
-    "zoooop",
-    "femininity",
-    "hangin'",
-    "major-league",
-    "ski-joring",
-    "ungratified",
-    "director-general",
-    "47",
-    "last-mentioned",
-    "understand",
-    "sternum",
-    "vestibule",
-    "uncertified",
-    "multi-valued",
-    "charles",
-    "olivefaced",
-    "whelan",
-    "quadrennial",
-    "3.5%",
-    "multicolor",
-    "645-acre",
-    "chalky",
-    "non-fiction",
-    "articulated",
-    "freshness",
-    "tagua",
-    "ruefulness",
-    "moscone",
-    "alarmist",
-    "pompously",
-    "lamentation",
-    "bursting",
-    "senator",
-    "inimical",
-    "jammed-together",
-    "barred",
-    "loyalty",
-    "steffens",
-    "mee",
-    "barely",
-    "2-3",
-    "guaranteed",
-    "propionate",
-    "sun-tanned",
-    "stump",
-    "depew",
-    "fitfully",
-    "albacore",
-    "flowering",
-    "friend",
-    "summed",
-    "flange",
-    "pathos",
-    "concur",
-    "rolling",
-    "culminating",
-    "hurrays",
-    "daydreaming",
-    "chill",
-    "stabled",
-    "mattei",
-    "burlington's",
-    "woodbury",
-    "bride's",
-    "comprehension",
-    "rubies",
-    "transcendent",
-    "cadenza",
-    "relaxing",
-    "nerve-shattering",
-    "odious",
-    "lexicostatistic",
-    "unperceived",
-    "exhaust",
-    "martian",
-    "substitutions",
-    "pedimented",
-    "create",
-    "asser",
-    "wishes",
-    "atta",
-    "wieners'",
-    "native",
-    "forma",
-    "dabbling",
-    "hand-hewn",
-    "killing",
-    "officio",
-    "stonehenge",
-    "tieken",
-    "projection",
-    "l'ange",
-    "integrate",
-    "340-blast",
-    "starkly",
-    "vocally",
-    "1223",
-    "contributed",
-    "bod/day",
-    "infrequently",
-    "767",
-    "aj",
-    "allstates",
-    "bible-emancipated",
-    "unequaled",
-    "aurelius",
-    "glows",
-    "water-soluble",
-    "lippi",
-    "caste",
-    "clothier",
-    "hargett",
-    "ascribe",
-    "affectingly",
-    "knife",
-    "chuckled",
-    "infantrymen",
-    "pseudynom",
-    "1871",
-    "marked",
-    "phonemics",
-    "enveloping",
-    "indigation",
-    "thespians",
-    "pee-wee",
-    "autonomy",
-    "ivory-inlay",
-    "extends",
-    "ache",
-    "hedges",
-    "balance",
-    "bottom-living",
-    "12:00",
-    "times-picayune",
-    "phillies",
-    "fighters",
-    "sleepy",
-    "fuji",
-    "recollection",
-    "conserve",
-    "rudder",
-    "emmert",
-    "mopped",
-    "pretended",
-    "select",
-    "peridontal",
-    "wrist",
-    "hearse",
-    "grenade",
-    "windsor",
-    "110-degrees",
-    "syntactical",
-    "opted",
-    "rebuff",
-    "ensued",
-    "appearances",
-    "sensitivities",
-    "mid-1890's",
-    "lever",
-    "pardons",
-    "jet",
-    "rigging",
-    "barrel",
-    "headstands",
-    "unlike",
-    "atlantic",
-    "palomar",
-    "fall's",
-    "she'd",
-    "griffin-byrd",
-    "bookwalter",
-    "remonstrated",
-    "socialist",
-    "glitter",
-    "three-family",
-    "wickedly",
-    "grimed",
-    "rotate",
-    "12''",
-    "interrelated",
-    "coerced",
-    "leftist",
-    "cloth-of-gold",
-    "pseudo-thinking",
-    "ventilator",
-    "impolitic",
-    "poverty-stricken",
-    "femmes",
-    "canvases",
-    "sneaked",
-    "nibblers",
-    "traditionalized",
-    "clattering",
-    "raccoon",
-    "tunelessly",
-    "coyotes",
-    "self-congratulation",
-    "computer",
-    "acetate",
-    "insures",
-    "curbside",
-    "experimenters",
-    "4.00",
-    "crater",
-    "reprieve",
-    "furnishes",
-    "sloppily",
-    "abstract",
-    "old-time",
-    "knox",
-    "maeterlinck",
-    "dominates",
-    "cleric",
-    "candles",
-    "bill",
-    "case-hardened",
-    "sixty-eighth",
-    "intersect",
-    "magarrell",
-    "proves",
-    "1724",
-    "belge",
-    "morphophonemic",
-    "pololu",
-    "rapid",
-    "plath",
-    "experiment",
-    "einstein",
-    "convair",
-    "enrollments",
-    "adroit",
-    "balling",
-    "spinco",
-    "boughs",
-    "egged",
-    "anomaly",
-    "john-henry",
-    "experimentally",
-    "mg/l/hr",
-    "brandt",
-    "bustin'",
-    "cherry-flavored",
-    "avis",
-    "oleophilic",
-    "effluent",
-    "receiver",
-    "evoke",
-    "car",
-    "sienkiewicz",
-    "supervisor",
-    "bumps",
-    "propelling",
-    "piety",
-    "247",
-    "territoire",
-    "biscuit",
-    "newly-scrubbed",
-    "delivered",
-    "plymouth",
-    "jig",
-    "pyramids",
-    "stonestown",
-    "malted",
-    "oviform",
-    "witness",
-    "genes",
-    "unoccupied",
-    "thermogravimetric",
-    "idle",
-    "brothers",
-    "sicilian",
-    "adventists",
-    "restively",
-    "acey",
-    "oxen",
-    "yalagaloo",
-    "declined",
-    "organization-position",
-    "oxalate",
-    "hemmed",
-    "teleology",
-    "perverse",
-    "ronnel",
-    "different-color",
-    "web",
-    "polo",
-    "evolved",
-    "clawing",
-    "sixty-seven",
-    "testimonial",
-    "collection",
-    "shipped",
-    "stars",
-    "unambiguous",
-    "sedition",
-    "remains",
-    "paralanguage",
-    "baptism",
-    "incomplete",
-    "poetic",
-    "gunfights",
-    "skindiving",
-    "scholar",
-    "schnabel",
-    "definition-specialization",
-    "sweetish",
-    "consolation",
-    "personifies",
-    "profitably",
-    "seedcoat",
-    "penrose",
-    "proprietory",
-    "burn",
-    "capitol",
-    "adds",
-    "towsley",
-    "slot",
-    "corinthians",
-    "contending",
-    "powered",
-    "scorecard",
-    "offsetting",
-    "unpatronizing",
-    "ladder",
-    "saxophone",
-    "gradations",
-    "blanks",
-    "ensembles",
-    "latches",
-    "cloves",
-    "betray",
-    "maw",
-    "mollie",
-    "ripened",
-    "murmur",
-    "fairview",
-    "cuts",
-    "macromolecules",
-    "wanna",
-    "chilled",
-    "two-step",
-    "rumbles",
-    "interscience",
-    "syntax",
-    "nets",
-    "welding",
-    "trainman",
-    "granite's",
-    "summarization",
-    "christi",
-    "deceased",
-    "assumed",
-    "identity",
-    "dogmatism",
-    "superior",
-    "badges",
-    "sociologists",
-    "fallacious",
-    "0.5''",
-    "clarke's",
-    "rock",
-    "baringer",
-    "lifts",
-    "petitions",
-    "hun",
-    "la.",
-    "socially-oriented",
-    "ministered",
-    "gasps",
-    "rittenhouse",
-    "thoroughbred",
-    "hattiesburg",
-    "curio",
-    "uninvolved",
-    "maggie",
-    "rove",
-    "attracting",
-    "angola",
-    "damaging",
-    "stiffening",
-    "yaddo",
-    "slept",
-    "prokofieff's",
-    "meisenheimer",
-    "policeman-murderer",
-    "negotiated",
-    "septa",
-    "reasonable",
-    "antiques",
-    "brinkley",
-    "handstand",
-    "collective",
-    "mussolini's",
-    "soe",
-    "kneels",
-    "runnin'",
-    "saponins",
-    "mare's",
-    "tuscany",
-    "darker",
-    "mayor-elect",
-    "organism",
-    "entrusting",
-    "glistened",
-    "ecumenical",
-    "kin",
-    "hot-slough",
-    "60*0c.",
-    "80-hp",
-    "chemicals",
-    "preceding",
-    "nonpartisan",
-    "stubs",
-    "penalties",
-    "terminals",
-    "symbolized",
-    "autofluorescence",
-    "gregory's",
-    "babatunde",
-    "flick",
-    "wasson",
-    "reflector",
-    "leafmold",
-    "hazes",
-    "armed",
-    "irredentism",
-    "polytonal",
-    "brilliantly",
-    "emphases",
-    "programmed",
-    "relatedness",
-    "appraised",
-    "specification",
-    "sorrentine's",
-    "freshborn",
-    "recognised",
-    "emphasis",
-    "consist",
-    "n.d.",
-    "conferences",
-    "spasm",
-    "well-balanced",
-    "szolds'",
-    "dioxalate",
-    "talleyrand",
-    "wished",
-    "leopold's",
-    "25-cents",
-    "vintner",
-    "3.9",
-    "three-inch-wide",
-    "discouragement",
-    "sq.",
-    "badgering",
-    "marine",
-    "carob",
-    "poe",
-    "regionally",
-    "stride",
-    "$185",
-    "7070",
-    "alcohol",
-    "drowsed",
-    "felons",
-    "disquieting",
-    "unreliability",
-    "exclaiming",
-    "hand-blower",
-    "breakthrough",
-    "teheran",
-    "sorting",
-    "faculty",
-    "beame",
-    "countless",
-    "1582",
-    "kowalski's",
-    "decorous",
-    "len",
-    "professionally",
-    "massimo",
-    "squirting",
-    "recitative",
-    "doubts",
-    "nitrogen",
-    "cannibals",
-    "ferocity",
-    "claimants",
-    "tsar",
-    "1803-1895",
-    "top-quality",
-    "large-package",
-    "rosella",
-    "desolations",
-    "front-line",
-    "carping",
-    "phil",
-    "puritanical",
-    "raiders'",
-    "deceive",
-    "ants",
-    "gym",
-    "-20-degrees-c",
-    "returns",
-    "bogy",
-    "vowed",
-    "abhorred",
-    "presentness",
-    "repositories",
-    "balance-wise",
-    "thumbnail",
-    "hanover-pebble",
-    "gripes",
-    "void",
-    "epidemics",
-    "shack",
-    "princesse",
-    "evanston",
-    "betrothal",
-    "transform",
-    "months'",
-    "finale",
-    "imitations",
-    "tugged",
-    "scion",
-    "jostle",
-    "servants",
-    "tip-toe",
-    "busier",
-    "songau",
-    "albrights'",
-    "knight-errantry",
-    "bounce",
-    "spill",
-    "pettit",
-    "unsympathetic",
-    "limitless",
-    "miracle",
-    "bayou",
-    "impeccable",
-    "slopped",
-    "qualifying",
-    "envisioned",
-    "re-run",
-    "electrotherapist",
-    "foul",
-    "engh",
-    "warsaw's",
-    "agayne",
-    "congealed",
-    "transcription",
-    "announcement",
-    "karolinerna",
-    "penniless",
-    "waved",
-    "ward-personnel",
-    "gland",
-    "upland",
-    "presbyterian-st.",
-    "feeble",
-    "torture",
-    "gerhard",
-    "chores",
-    "formation",
-    "giggled",
-    "mineralogies",
-    "demonstrable",
-    "modal",
-    "lawsuits",
-    "oboist",
-    "encamped",
-    "attackers",
-    "homers",
-    "pickoff",
-    "meddling",
-    "quits",
-    "re-sharpening",
-    "skirmish",
-    "professed",
-    "consolidating",
-    "scalp",
-    "miguel",
-    "lines",
-    "49ers",
-    "vieth",
-    "overaggressive",
-    "fumed",
-    "ryne",
-    "one-eighth",
-    "n.l.",
-    "rehearsals",
-    "law-governed",
-    "clumps",
-    "eastman",
-    "pleasance",
-    "slit",
-    "insist",
-    "waistcoat",
-    "presentable",
-    "glorying",
-    "suddenly",
-    "1912",
-    "purports",
-    "halfbacks",
-    "coalition",
-    "charge-a-plate",
-    "circonscriptions",
-    "430,000",
-    "reinterpreted",
-    "fractions",
-    "haunted",
-    "thorpe",
-    "ewe",
-    "egerton",
-    "pardonable",
-    "conscious",
-    "oliver",
-    "maligned",
-    "disengage",
-    "bylot",
-    "everlasting",
-    "puckish",
-    "plants",
-    "louisville",
-    "eloquence",
-    "rabaul",
-    "jeunes",
-    "covering",
-    "solution-type",
-    "mathematics",
-    "free-drink",
-    "antagonist",
-    "quincy",
-    "27%",
-    "bong",
-    "coronado",
-    "assessed",
-    "touchy",
-    "vulturidae",
-    "dysentery",
-    "delighted",
-    "loser",
-    "aerial",
-    "lady's",
-    "confused",
-    "granary",
-    "windbreaks",
-    "$23,000,000",
-    "personalities",
-    "throw-rug",
-    "eaters",
-    "1.25-cm",
-    "fins",
-    "examiners",
-    "matron",
-    "machinists",
-    "potting",
-    "native-born",
-    "spiraling",
-    "interregnum",
-    "1876",
-    "5-percent",
-    "prohibiton",
-    "runyon's",
-    "presupposed",
-    "middle-",
-    "compelling",
-    "strindberg",
-    "heptachlor",
-    "wither",
-    "truculence",
-    "prattville",
-    "seventeen",
-    "garrett",
-    "/r/",
-    "assists",
-    "advocates",
-    "afflicted",
-    "diminish",
-    "presumptions",
-    "astronomically",
-    "fifty-cent",
-    "distances",
-    "counterbalancing",
-    "willings",
-    "wagons",
-    "pitt-rivers",
-    "gibby",
-    "migration",
-    "napkin",
-    "jesuits",
-    "determinative",
-    "braved",
-    "ever-expanding",
-    "infrequent",
-    "chicago's",
-    "frankfurters",
-    "clay",
-    "callin'",
-    "tongue",
-    "resilience",
-    "jacqueline",
-    "team",
-    "pickett's",
-    "signal-to-noise",
-    "resignation",
-    "names",
-    "oystchers",
-    "depending",
-    "metal-working",
-    "rearrange",
-    "reconsider",
-    "rattles",
-    "distracting",
-    "1,018,000",
-    "fibers",
-    "unreassuringly",
-    "bakersfield",
-    "once-over-lightly",
-    "houseboats",
-    "grandsons",
-    "mobilize",
-    "oriental",
-    "tributes",
-    "perfunctorily",
-    "countryside",
-    "lagoon",
-    "trembles",
-    "coney",
-    "periodical",
-    "egregiously",
-    "eye-beamings",
-    "muffins",
-    "negociant",
-    "zeros",
-    "dwelt",
-    "rap",
-    "motorists'",
-    "bristling",
-    "baum",
-    "globulins",
-    "ligne",
-    "inclinations",
-    "augustus",
-    "cervantes'",
-    "witt",
-    "province",
-    "mercedes",
-    "blink",
-    "0.2",
-    "milt",
-    "reformatory",
-    "fenders",
-    "hour's",
-    "tilt",
-    "secondhand",
-    "fresco",
-    "belt",
-    "tomes",
-    "smithsonian",
-    "non-repetitious",
-    "adjoins",
-    "1940",
-    "maroon",
-    "re-elected",
-    "1.10.4",
-    "g",
-    "befouled",
-    "investigated",
-    "castaneda",
-    "cute",
-    "landrum-griffin",
-    "separable",
-    "significant",
-    "dyed",
-    "breach",
-    "jitterbug",
-    "hypertrophied",
-    "vtol",
-    "thermodynamic",
-    "under",
-    "transcript",
-    "0.10",
-    "birefringence",
-    "signal",
-    "hates",
-    "book",
-    "extinction",
-    "notification",
-    "best-preserved",
-    "sheltered",
-    "decisively",
-    "poultry-loving",
-    "conduit",
-    "housepaint",
-    "agency",
-    "statu",
-    "noun",
-    "laboratories",
-    "famous",
-    "clinically",
-    "jody",
-    "1805-1879",
-    "schulz",
-    "suitcases",
-    "shy",
-    "premix",
-    "harsher",
-    "bathers",
-    "hypothesized",
-    "half-murmured",
-    "oooo",
-    "pool-equipment",
-    "draco",
-    "invincible",
-    "madden's",
-    "lauri",
-    "materials-handling",
-    "stabat",
-    "excavation",
-    "glow",
-    "definite",
-    "vilifying",
-    "pimpled",
-    "russian",
-    "literalness",
-    "incoherent",
-    "appeasement",
-    "neurasthenic",
-    "gouvernement",
-    "folklore",
-    "supranationalism",
-    "cholelithiasis",
-    "ailing",
-    "$2.82",
-    "newsmen",
-    "reinhard",
-    "unabashed",
-    "forty-five",
-    "nicolas's",
-    "taxied",
-    "hang",
-    "amelia's",
-    "basting",
-    "spitting",
-    "salyer's",
-    "admassy",
-    "817",
-    "14-1",
-    "compensatory",
-    "satirizes",
-    "upholstered",
-    "broncos",
-    "condolences",
-    "zodiacal",
-    "ornraier",
-    "ferrell",
-    "ap",
-    "alerting",
-    "modifying",
-    "tracing",
-    "crazy-wonderful",
-    "podgers",
-    "twain",
-    "flem",
-    "allegheny",
-    "menuhin",
-    "powerful",
-    "adulation",
-    "civilizations",
-    "drilling",
-    "sudanese",
-    "inhalation",
-    "philantropists",
-    "referrin'",
-    "purdue's",
-    "alcibiades",
-    "signing",
-    "poignantly",
-    "cobblestones",
-    "resignedly",
-    "carpeted",
-    "optimum",
-    "$590,000",
-    "taruffi",
-    "adheres",
-    "skouting",
-    "poetizing",
-    "wholesalers",
-    "moist",
-    "excuse",
-    "10-hour",
-    "vacuum-",
-    "chive",
-    "de-kooning",
-    "longhorn",
-    "fairmount",
-    "three-wood",
-    "ankara",
-    "representational",
-    "compressed",
-    "jorge",
-    "hike",
-    "middle",
-    "shuttling",
-    "paternalism",
-    "bowden",
-    "gloucester",
-    "musmanno",
-    "770",
-    "glaring",
-    "guggenheim",
-    "jabbed",
-    "shields",
-    "old-age",
-    "metaphorical",
-    "beach",
-    "upper-level",
-    "leakage",
-    "tailor-made",
-    "limping",
-    "sweet-shrub",
-    "po'",
-    "manchester's",
-    "self-ordained",
-    "house-building",
-    "lapping",
-    "roved",
-    "330",
-    "adjudicate",
-    "naturalist",
-    "validating",
-    "five-foot",
-    "manners",
-    "augustine's",
-    "1001",
-    "duhagon",
-    "sammartini",
-    "lodged",
-    "symbolizing",
-    "wronged",
-    "powicke",
-    "easement",
-    "kodiak",
-    "heydrich",
-    "synergism",
-    "snug-grip",
-    "solvent",
-    "visitation",
-    "pen-and-ink",
-    "quadratic",
-    "wrest",
-    "rilly",
-    "finn",
-    "oxyhydroxides",
-    "tijuana",
-    "phosphor-screen",
-    "poland",
-    "arch-opponent",
-    "seditious",
-    "drunker",
-    "privately-owned",
-    "portraits",
-    "bluefish",
-    "inhospitable",
-    "doyle's",
-    "high-gain",
-    "toying",
-    "witnessed",
-    "bates",
-    "mlss",
-    "e.t.",
-    "anglo-american",
-    "plain-out",
-    "bifutek-san",
-    "$70,000",
-    "secluded",
-    "cracker-box",
-    "folds",
-    "exterminatin'",
-    "inequality",
-    "rejoin",
-    "rival's",
-    "western-style",
-    "questioningly",
-    "todman's",
-    "pathogenesis",
-    "conventional",
-    "reagent",
-    "rosie",
-    "ownerships",
-    "disappointment",
-    "revise",
-    "givenness",
-    "divan",
-    "innocently",
-    "eyeing",
-    "groundwork",
-    "high-density",
-    "blushing",
-    "carousing",
-    "occident",
-    "slouches",
-    "incompetents",
-    "twentieth",
-    "amusingly",
-    "novelties",
-    "hunters",
-    "starkey",
-    "plugging",
-    "cure-all",
-    "felice's",
-    "excitability",
-    "episcopal",
-    "compressing",
-    "7074",
-    "decanted",
-    "reinvigoration",
-    "boosting",
-    "platoon",
-    "regimentation",
-    "philistines",
-    "mused",
-    "establish",
-    "fussing",
-    "oftentimes",
-    "syllabification",
-    "brightness",
-    "sinning",
-    "responded",
-    "woodrow",
-    "save",
-    "gret",
-    "raymondville",
-    "righthander",
-    "amiss",
-    "golda",
-    "dynamical",
-    "wails",
-    "overturned",
-    "put-upon",
-    "long-",
-    "frantically",
-    "insurrections",
-    "encouraged",
-    "breezy",
-    "high-current",
-    "rodney",
-    "bicycle-auto",
-    "artificiality",
-    "cowardly",
-    "d'hotel",
-    "seeming",
-    "fermented",
-    "avalanche",
-    "godamit",
-    "6-2/3",
-    "se",
-    "copolymers",
-    "grossly",
-    "arraigned",
-    "hells",
-    "aterman",
-    "unfortunates",
-    "lag",
-    "jumbled",
-    "airplanes",
-    "sullivan",
-    "intricate",
-    "underling",
-    "theorists",
-    "founders",
-    "cough",
-    "49%",
-    "konga",
-    "suez",
-    "newbold",
-    "encouragement",
-    "schoolboys",
-    "bunyan",
-    "opiates",
-    "investor",
-    "inevitable",
-    "interconnectedness",
-    "belongs",
-    "flushing",
-    "troubled",
-    "th'",
-    "triple-checked",
-    "patentees",
-    "convenient-type",
-    "whipple's",
-    "1882",
-    "nailed",
-    "belch",
-    "gargery's",
-    "t.b.",
-    "shrubbery-lined",
-    "engages",
-    "12'",
-    "bouvier",
-    "woodruff",
-    "unharmonious",
-    "gun's",
-    "life-supporting",
-    "ransom",
-    "post's",
-    "modernize",
-    "exaggerations",
-    "chamber",
-    "eternal",
-    "ambassador-at-large",
-    "twenty-nine",
-    "1838",
-    "drugs",
-    "joints",
-    "tear",
-    "tuning",
-    "helpers",
-    "suggesting",
-    "unfrosted",
-    "helion's",
-    "nakoma",
-    "hurrah",
-    "frito",
-    "jury-tampering",
-    "diffusion",
-    "livingston",
-    "doubted",
-    "arnold's",
-    "morehouse",
-    "totalled",
-    "runways",
-    "lass",
-    "pemmican",
-    "captions",
-    "misplaced",
-    "byproduct",
-    "extraneous",
-    "1598",
-    "macabre",
-    "barbecue",
-    "sentencing",
-    "casters",
-    "snapback",
-    "tailgate",
-    "ferguson's",
-    "prolific",
-    "bribes",
-    "to-morrow",
-    "psychotherapeutic",
-    "englishman",
-    "tenable",
-    "cross-examination",
-    "incandescent",
-    "endeavours",
-    "barre-montpelier",
-    "padding",
-    "ulyate",
-    "26-28",
-    "bicycles",
-    "swept",
-    "agricultural",
-    "honorary",
-    "staining",
-    "arundel",
-    "thyroidal",
-    "1.07",
-    "enter'd",
-    "budget-wise",
-    "assurance",
-    "climb",
-    "mckinley's",
-    "pianism",
-    "ramifications",
-    "toodle",
-    "peering",
-    "ducked",
-    "trisodium",
-    "hubay",
-    "unmarked",
-    "71*&0c.",
-    "streams",
-    "adolphus",
-    "underwrite",
-    "proposing",
-    "athalie",
-    "walrus",
-    "rhu-beb-ni-ice",
-    "tanny",
-    "flattest",
-    "lonelier",
-    "gingham",
-    "inculcation",
-    "urbanization",
-    "passiveness",
-    "inappropriate",
-    "ticked",
-    "simplicity",
-    "plastered",
-    "inserts",
-    "triplication",
-    "insulin",
-    "christening",
-    "guffaws",
-    "early-morning",
-    "blowfish",
-    "wildcat",
-    "ozon",
-    "reiss",
-    "outrigger",
-    "1595",
-    "$639",
-    "wonders",
-    "alastor",
-    "self",
-    "antone",
-    "claim",
-    "engender",
-    "hosses",
-    "hym",
-    "no-driving",
-    "ridpath",
-    "slightest",
-    "whit",
-    "clerk",
-    "rf",
-    "recheck",
-    "goal",
-    "bagpipe",
-    "valley's",
-    "fragrance",
-    "sacrilege",
-    "insulated",
-    "ferber",
-    "munched",
-    "contrast",
-    "sweaty",
-    "fightin'",
-    "milestone",
-    "hard-hearted",
-    "seventy-odd",
-    "over-chilling",
-    "travelin'",
-    "walker",
-    "diversity",
-    "battles",
-    "mceachern",
-    "cochannel",
-    "$73.50",
-    "sparkled",
-    "pagans",
-    "withdrawn",
-    "autocoder",
-    "exhausting",
-    "junk",
-    "so-called",
-    "valois",
-    "leg-split",
-    "ire",
-    "adjust",
-    "illuminate",
-    "liners",
-    "facilitated",
-    "disappointing",
-    "pivotal",
-    "lord",
-    "divinely",
-    "ionizing",
-    "lawman's",
-    "oversimplified",
-    "favorable",
-    "tarpaulin",
-    "$30",
-    "layout",
-    "license",
-    "indiscriminating",
-    "lodley",
-    "ogress",
-    "oddities",
-    "dynodes",
-    "waging",
-    "nilsson",
-    "wakes",
-    "cottonmouth",
-    "dissolving",
-    "laurance",
-    "calibrating",
-    "sycophantically",
-    "grandiloquent",
-    "harmless",
-    "physiochemical",
-    "a.k.c.",
-    "cross-eyed",
-    "roasted",
-    "instigator",
-    "sit-ins",
-    "crowbait",
-    "skylarking",
-    "prepubescent",
-    "pseudo-capitalism",
-    "drip-",
-    "50",
-    "foster's",
-    "will-to-power",
-    "bobbie's",
-    "reverence",
-    "8-oz.",
-    "nc",
-    "elios",
-    "three-dice",
-    "haunches",
-    "precondition",
-    "tidiness",
-    "rough-and-tumble",
-    "oakmont",
-    "rockfork",
-    "shapeless",
-    "humility",
-    "supervise",
-    "invasion",
-    "emanation",
-    "florida's",
-    "fredericksburg",
-    "substance",
-    "horsedom",
-    "trianon",
-    "moved",
-    "idiosyncratic",
-    "commented",
-    "extracting",
-    "italo-american",
-    "boys",
-    "resin-saturated",
-    "lolly",
-    "triangles",
-    "ambling",
-    "hearest",
-    "pupated",
-    "[",
-    "glover",
-    "quaint",
-    "unravel",
-    "stammered",
-    "necessitating",
-    "stimulus",
-    "mummified",
-    "obtrudes",
-    "howls",
-    "weighting",
-    "nischwitz",
-    "services",
-    "beer-runner",
-    "tornadoes",
-    "haddix",
-    "dissuade",
-    "defeats",
-    "broadcasts",
-    "generous",
-    "2,887,671",
-    "yank",
-    "craze",
-    "meter",
-    "mollusks",
-    "atomisation",
-    "keizer",
-    "ads",
-    "philippine",
-    "clucks",
-    "creaked",
-    "rewarding",
-    "slightly",
-    "shoe-string",
-    "rev",
-    "snowfall",
-    "baptistery",
-    "sibyls",
-    "fantods",
-    "transportation",
-    "883,000",
-    "lebensraum",
-    "uncertainties",
-    "avocation",
-    "cairo",
-    "meynell's",
-    "dc",
-    "constructing",
-    "njust",
-    "privileged",
-    "parallels",
-    "pampa",
-    "anders",
-    "welsh",
-    "amass",
-    "northampton",
-    "success",
-    "chasm",
-    "americas",
-    "prolongs",
-    "floodlight",
-    "pike",
-    "managua",
-    "diana",
-    "kidnapper",
-    "prevayle",
-    "collated",
-    "discours",
-    "testimony",
-    "chlortetracycline",
-    "4.21",
-    "k's",
-    "caligula",
-    "cumbancheros",
-    "distaste",
-    "grokked",
-    "oral",
-    "chopin",
-    "concerning",
-    "geely's",
-    "high-quality",
-    "evangelists",
-    "playwrights",
-    "spaciousness",
-    "forces",
-    "1835",
-    "slicker",
-    "psychoanalyst",
-    "pavilions",
-    "consenting",
-    "5000-word",
-    "229",
-    "ascended",
-    "cards",
-    "hez",
-    "formulations",
-    "lawn",
-    "unshielded",
-    "four",
-    "faulty",
-    "solar",
-    "gospelers",
-    "leadership",
-    "savoring",
-    "spinnability",
-    "jacobite",
-    "3.98",
-    "damages",
-    "hydrochemistry",
-    "chains",
-    "disputable",
-    "groom",
-    "chief",
-    "and",
-    "societe",
-    "soon",
-    "exerted",
-    "witches",
-    "burnside",
-    "top-notch",
-    "liqueur",
-    "ranger",
-    "hoag's",
-    "third-dimensional",
-    "assault",
-    "salient",
-    "desiring",
-    "puppyish",
-    "auxiliary",
-    "conditioning",
-    "sleeve",
-    "alloys",
-    "proper",
-    "trek",
-    "gargery",
-    "french-canadians",
-    "folders",
-    "rattle",
-    "corroborees",
-    "grapevine",
-    "truly",
-    "shopkeepers",
-    "fabricating",
-    "defiantly",
-    "weakest",
-    "promazine",
-    "entertained",
-    "oresteia",
-    "psalmist",
-    "sensitives",
-    "william",
-    "abbreviated",
-    "sociologically",
-    "translate",
-    "kicking",
-    "divisions",
-    "caius",
-    "citroen",
-    "histrionics",
-    "hard-boiled",
-    "demonstrations",
-    "pornographer",
-    "side-conclusions",
-    "jewish-gentile",
-    "busboy",
-    "penchant",
-    "list",
-    "obsolescent",
-    "grove",
-    "primarily",
-    "recruit",
-    "wilde",
-    "enticements",
-    "lodgings",
-    "socinianism",
-    "agee",
-    "urges",
-    "58th",
-    "ingredients",
-    "kwhr",
-    "tottering",
-    "motherwell",
-    "producin'",
-    "mama's",
-    "beaverton",
-    "subside",
-    "barbarians",
-    "ambivalent",
-    "condoned",
-    "disruption",
-    "determinable",
-    "flair",
-    "loesser's",
-    "discussing",
-    "rexroth's",
-    "rudkoebing",
-    "fagan",
-    "much-discussed",
-    "chrysanthemums",
-    "howser",
-    "reclassified",
-    "slowest",
-    "unquiet",
-    "cherished",
-    "sewed",
-    "segment",
-    "genetic",
-    "chambre",
-    "indelicate",
-    "flavorings",
-    "dells",
-    "lindsey's",
-    "unduly",
-    "pp.",
-    "stingy",
-    "diarrhoea",
-    "mccarthy",
-    "$842,617",
-    "kennings",
-    "double-entendre",
-    "similarly",
-    "swelling",
-    "movable",
-    "determinate",
-    "another's",
-    "barton's",
-    "spelman",
-    "ferns",
-    "speculator",
-    "walsh",
-    "paraphernalia",
-    "synchronizers",
-    "highs",
-    "bandits",
-    "hideout",
-    "veto",
-    "lanesmanship",
-    "trafton's",
-    "staccato",
-    "beatitudes",
-    "hark",
-    "planar",
-    "bertorelli",
-    "satin",
-    "060",
-    "speeches",
-    "chancellor",
-    "orthopedic",
-    "schraffts",
-    "12-to-one",
-    "floor",
-    "courtship",
-    "related",
-    "forty-three",
-    "evading",
-    "free-world",
-    "flesh",
-    "ricans",
-    "1880-1900",
-    "lavatory",
-    "indians",
-    "mcdonnell",
-    "eyes",
-    "nosebleed",
-    "homemakers",
-    "ballyhooey",
-    "base-stealing",
-    "maritime",
-    "acquisitions",
-    "piranesi",
-    "riotous",
-    "requires",
-    "guilty",
-    "4-for-5",
-    "lloyd",
-    "colleges",
-    "cathedral",
-    "grant's",
-    "plead",
-    "bottled",
-    "cc.",
-    "ol",
-    "nori",
-    "beggars",
-    "blood-stained",
-    "purportedly",
-    "mean",
-    "attains",
-    "contraception",
-    "highschool",
-    "oiled",
-    "conducting",
-    "deliver",
-    "heterogeneous",
-    "tactical",
-    "slob",
-    "julie",
-    "joint",
-    "hospital-care",
-    "sections",
-    "paschal",
-    "publicized",
-    "tendency",
-    "erecting",
-    "lionized",
-    "concertina",
-    "instrumentation",
-    "wrongdoing",
-    "sarah",
-    "cheyenne",
-    "stabilities",
-    "wide-door",
-    "ludwig",
-    "smerdyakov",
-    "glazes",
-    "playtime",
-    "tripped",
-    "howard",
-    "vandalism",
-    "baron",
-    "dangers",
-    "accessory",
-    "urielites",
-    "cannibalistic",
-    "stalking",
-    "fast-frozen",
-    "stand-ins",
-    "acclaimed"
-  ]
+STOPWORDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stopwords')
+
+
+def _read_words(filename):
+    with open(os.path.join(STOPWORDS_DIR, filename), encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f if line.rstrip('\n')]
+
+
+_loaders = {
+    'DOMAIN_STOP_WORDS': lambda: _read_words('domain_stop_words.txt'),
+    'COMMON_WORDS_CORPUS': lambda: {'brown_corpus': _read_words('brown_corpus.txt')},
+    'COMMON_DISEASE_TERMS': lambda: [set(_read_words('common_disease_terms.txt'))],
 }
 
-COMMON_DISEASE_TERMS = [set(['abortion',
-     'addiction',
-     'adenomas',
-     'age',
-     'aggression',
-     'aging',
-     'alcoholism',
-     'allergy',
-     'anemia',
-     'antibodies',
-     'antibody',
-     'anxiety',
-     'arteriolosclerosis',
-     'arthritis',
-     'autism',
-     'behavior',
-     'behaviour',
-     'beriberi',
-     'bleeding',
-     'brucellosis',
-     'calcification',
-     'cancer',
-     'carcinoma',
-     'cardiomegaly',
-     'cholelithiasis',
-     'coccidioidomycosis',
-     'coccidiosis',
-     'diarrhea',
-     'diarrhoea',
-     'dose',
-     'duration',
-     'dysentery',
-     'electrocardiogram',
-     'emphysema',
-     'encephalitis',
-     'enterotoxemia',
-     'erysipelas',
-     'excretion',
-     'exercise',
-     'fever',
-     'fibrosis',
-     'flu',
-     'frambesia',
-     'freckles',
-     'function',
-     'gallstones',
-     'gambling',
-     'glanders',
-     'glaucoma',
-     'gout',
-     'headaches',
-     'hearing',
-     'height',
-     'hemorrhage',
-     'hepatitis',
-     'hyperemia',
-     'hyperplasia',
-     'hypertrophy',
-     'hypothyroidism',
-     'impotence',
-     'infect',
-     'infection',
-     'inflammation',
-     'influenza',
-     'injury',
-     'insomnia',
-     'intelligence',
-     'intuition',
-     'kwashiorkor',
-     'latitude',
-     'leprosy',
-     'leukemia',
-     'longevity',
-     'longitude',
-     'lymphoma',
-     'malaria',
-     'measurement',
-     'menarche',
-     'metabolism',
-     'mortality',
-     'neuroses',
-     'obesity',
-     'osteoporosis',
-     'pain',
-     'palsy',
-     'pneumonia',
-     'polymyositis',
-     'pregnancy',
-     'puberty',
-     'reading',
-     'reasoning',
-     'rheumatism',
-     'scurvy',
-     'seizure',
-     'sensation',
-     'sight',
-     'singles',
-     'sleep',
-     'smoking',
-     'sneezing',
-     'sterile',
-     'stroke',
-     'suicide',
-     'sunburn',
-     'suntan',
-     'survival',
-     'tetanus',
-     'thrush',
-     'time',
-     'transport',
-     'tumours',
-     'typhoid',
-     'uremia',
-     'vision',
-     'weight',
-     'yaws'])]
\ No newline at end of file
+__all__ = list(_loaders)
+
+
+def __getattr__(name):
+    try:
+        loader = _loaders[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = globals()[name] = loader()
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,190 +1,693 @@
 import ahocorasick
+import functools
+import hashlib
+import itertools
 import logging
+import multiprocessing
 import string
 import sys
+import threading
+import time
 import unicodedata
 import json
 import os
+import re
+from array import array
+from operator import attrgetter
 
-from fuzzywuzzy import fuzz
-from rope.base.codeanalyze import ChangeCollector
-
-from .BioStopWords import DOMAIN_STOP_WORDS
+from . import automaton_cache
+from .alternative_forms import alternative_forms_cache
+from .fuzzy_verifier import FuzzyVerifier
+from .intervals import remove_nested
+from .markup import entity_markup
+from .payloads import PayloadTable
+from .stopword_index import StopWordIndex
+from .tag_index import TagIndex
+from .tagger_stats import merge_stats, new_stats, snapshot
+from .variants import resolve_generators
+from .vocabulary_loader import iter_vocabulary_records, vocabulary_source
 from NER.vocabulary import vocabulary_urls
 
-unicode_punctation_table = dict.fromkeys(i for i in range(sys.maxunicode)
-                                         if unicodedata.category(chr(i)).startswith('P'))
+
+@functools.lru_cache(maxsize=None)
+def unicode_punctation_table():
+    '''
+    built on first use rather than at import, scanning the whole unicode range takes a noticeable
+    part of a second
+    :return: str.translate table deleting the unicode punctuation characters
+    '''
+    return dict.fromkeys(i for i in range(sys.maxunicode)
+                         if unicodedata.category(chr(i)).startswith('P'))
+
+
+# tagger used by the worker processes of BioEntityTagger.tag_many. With the fork start method
+# it is set in the parent right before the pool is created, so the children share its automaton
+# copy-on-write instead of receiving a pickled copy.
+_worker_tagger = None
+
+
+def _init_worker(tagger):
+    global _worker_tagger
+    _worker_tagger = tagger
+
+
+def _tag_in_worker(indexed_text, categories=None):
+    '''
+    :return: (index, tags, stats), stats being the counters of this text when the tagger collects them
+    '''
+    i, text = indexed_text
+    if _worker_tagger.stats is None:
+        return i, _worker_tagger.tag(text, categories), None
+    _worker_tagger.stats = new_stats()
+    return i, _worker_tagger.tag(text, categories), _worker_tagger.stats
+
+
+def separator_regex(separators):
+    '''
+    :param separators: characters that delimit tokens
+    :return: compiled regex matching any one of the separators
+    '''
+    return re.compile('[' + re.escape(''.join(separators)) + ']')
+
+
+def boundary_map(text, separators_regex):
+    '''
+    computes once per text where a tag may start or end. Position i + 1 of the result is set when
+    text[i] is a separator, and both ends are padded, so a hit spanning text[start:end] lies on token
+    boundaries iff boundaries[start] and boundaries[end + 1] are both set.
+    :param text: text to tag
+    :param separators_regex: regex matching one separator, see separator_regex
+    :return: bytearray of length len(text) + 2
+    '''
+    boundaries = bytearray(len(text) + 2)
+    boundaries[0] = boundaries[-1] = 1
+    for m in separators_regex.finditer(text):
+        boundaries[m.start() + 1] = 1
+    return boundaries
+
+
+def fold_case(text):
+    '''
+    lowercases a text once. A few characters (e.g. U+0130) lowercase to more than one character, which
+    shifts the offsets of what follows them: only then is a map back to the original offsets built.
+    :param text: text to lowercase
+    :return: (lowercased text, offsets) where offsets is None if both texts have the same length, else a
+             list giving for each character of the lowercased text the offset of the character of text it
+             comes from, plus len(text)
+    '''
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered, None
+    offsets = array('I')
+    for i, c in enumerate(text):
+        offsets.extend([i] * len(c.lower()))
+    offsets.append(len(text))
+    return lowered, offsets
 
 
 class BioEntityTagger(object):
     separators_all = [' ', '.', ',', ';', ':', ')', ']', '(', '[', '{', '}', '/', '\\', '"', "'", '?', '!', '<', '>', '+', '-']
+    separators_regex = separator_regex(separators_all)
 
     def __init__(self,
                  partial_match=False,
                  ignorecase=True,
-                 stopwords=None):
+                 stopwords=None,
+                 use_cache=True,
+                 separators=None,
+                 collect_stats=False,
+                 vocabulary_files=None,
+                 categories=None,
+                 build_processes=None,
+                 variants=None):
         '''
         :param partial_match:  allow for matching a non clomplete word
         :param ignorecase: case sensitive or not
-        :param stopwords: stopwords to skip, defaults to a very broad list
+        :param stopwords: stopwords to skip, as a StopWordIndex or any iterable of words,
+                          defaults to a very broad list
+        :param use_cache: load the compiled automaton from the on-disk cache when the
+                          vocabularies, stopwords and options are unchanged, and store it there otherwise
+        :param separators: characters delimiting tokens, a tag must start and end next to one of them
+                           (or at an end of the text). Defaults to separators_all
+        :param collect_stats: count, in self.stats, the hits going through each phase of tagging and the
+                              time spent in each phase, see NER.tagger_stats and stats_snapshot
+        :param vocabulary_files: paths of the vocabulary files to load, named CATEGORY-REFERENCEDB.json,
+                                 defaults to the files listed in vocabulary_urls
+        :param categories: if given, only the vocabulary files of these categories are loaded
+        :param build_processes: number of processes parsing the vocabulary files when the automaton is built,
+                                defaults to the number of CPUs. The files are parsed in this process when other
+                                threads are running, see NER.vocabulary_loader
+        :param variants: surface variants of the vocabulary terms to match too, as names of generators registered
+                         in NER.variants.VARIANT_GENERATORS or generator functions. Defaults to the dash-less
+                         forms, NER.variants.ALL_VARIANTS adds greek letters, hyphen/space swaps, plurals and numerals
         '''
-        self.A = ahocorasick.Automaton()
         self.partial_match = partial_match
         self.ignorecase = ignorecase
-        if stopwords is None:
-            stopwords = DOMAIN_STOP_WORDS
-        idx = 0
-        '''get the dictionaries from remote files'''
+        self.use_cache = use_cache
+        self.build_processes = build_processes
+        self.variant_generators = resolve_generators(variants)
+        self.stopwords = StopWordIndex.from_stopwords(stopwords)
+        if vocabulary_files is None:
+            vocabulary_files = self.default_vocabulary_files()
+        if categories is not None:
+            vocabulary_files = [f for f in vocabulary_files if self.vocabulary_source(f)[0] in categories]
+        self.vocabulary_files = list(vocabulary_files)
+        # terms added or removed on top of the vocabulary files, see add_terms and remove_terms. They, and
+        # the list of vocabulary files, are only changed or copied for a rebuild while holding _terms_lock
+        self.extra_terms = {}
+        self.removed_terms = set()
+        self._terms_lock = threading.Lock()
+        if separators is None:
+            self.separators_regex = BioEntityTagger.separators_regex
+        else:
+            self.separators_regex = separator_regex(separators)
+        self.stats = new_stats() if collect_stats else None
+
+        # the automaton and its side tables are only ever replaced as a whole, by assigning a new dict:
+        # a tagging call reads self._state once and keeps using the same state until it returns
+        self._rebuild_lock = threading.Lock()
+        self._state = self._build_state(self.vocabulary_files, self.extra_terms, self.removed_terms)
+        # incremented each time a rebuilt automaton is swapped in, so that results computed with a
+        # previous automaton can be told apart (see NER.result_cache)
+        self.version = 0
+
+    @property
+    def A(self):
+        return self._state['automaton']
+
+    @property
+    def payloads(self):
+        return self._state['payloads']
+
+    @property
+    def fuzzy_verifier(self):
+        return self._state['fuzzy_verifier']
+
+    def stats_snapshot(self):
+        '''
+        :return: copy of the counters collected since the tagger was created or reset_stats was called,
+                 with the derived rates, None if the tagger does not collect them
+        '''
+        if self.stats is None:
+            return None
+        return snapshot(self.stats)
+
+    def reset_stats(self):
+        if self.stats is not None:
+            self.stats = new_stats()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_rebuild_lock']
+        del state['_terms_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rebuild_lock = threading.Lock()
+        self._terms_lock = threading.Lock()
+
+    @staticmethod
+    def default_vocabulary_files():
+        '''
+        :return: local paths of the vocabulary files listed in vocabulary_urls
+        '''
         vocabpath = os.path.dirname(os.path.abspath(__file__)) + "/vocabulary/"
-        for dictionary_url in vocabulary_urls:
-            filename = dictionary_url.split('/')[-1]
-            category, reference_db = filename.split('.')[0].split('_')[0].split('-')
-            with open(vocabpath + filename) as f:
-                dictionary = json.load(f)
-            '''load the elements in the Automation if they are not too short or are stopwords'''
-            for element, element_data in list(dictionary.items()):
-                ids = element_data['ids']
-                pref_name = element_data['pref_name']
-                if len(element) > 2:
-                    element_str = element
-                    if ((len(element_str) < 5) and (element_str not in stopwords) or
-                            (len(element_str) >= 5) and (element_str.lower() not in stopwords)):
-                        idx += 1
-                        if self.ignorecase:
-                            element_match = element_str.lower()
-                        else:
-                            element_match = element_str
-                        try:
-                            self.add_tag(element_match,
-                                         idx,
-                                         category,
-                                         reference_db,
-                                         [i for i in ids],
-                                         element,
-                                         element_match,
-                                         pref_name)
-                        except TypeError as e:
-                            print(element_match)
-                            print(type(element_match))
-                            raise e
-                        '''handle elements with dashes by also creating a copy without'''
-                        if '-' in element_match:
-                            element_match_without_dash = element_match.replace('-', '')
-                            if len(element_match_without_dash) > 2:
-                                self.add_tag(element_match_without_dash,
-                                             idx,
-                                             category,
-                                             reference_db,
-                                             [i for i in ids],
-                                             element,
-                                             element_match_without_dash,
-                                             pref_name)
-                        '''if supporting partial match'''
-                        if self.partial_match:
-                            for longest_token in element.split():
-                                if longest_token != element and \
-                                   len(longest_token) > 5 and \
-                                   longest_token.lower() not in stopwords:
-                                    self.add_tag(longest_token,
-                                                 idx,
-                                                 category + '-TOKEN',
-                                                 reference_db,
-                                                 [i for i in ids],
-                                                 element,
-                                                 longest_token,
-                                                 pref_name)
-
-        self.A.make_automaton()
-
-    def add_tag(self, element_text, idx, category, reference_db, ids, element, match, pref_name):
-        unique_resource_key = category + '|' + reference_db
-        category_insert = [category]
-        reference_db_insert = [reference_db]
+        return [vocabpath + dictionary_url.split('/')[-1] for dictionary_url in vocabulary_urls]
+
+    @staticmethod
+    def vocabulary_source(vocabulary_file):
+        '''
+        :param vocabulary_file: path of a vocabulary file, named CATEGORY-REFERENCEDB.json
+        :return: (category, reference_db) of the vocabulary
+        '''
+        return vocabulary_source(vocabulary_file)
+
+    def _fingerprint(self, vocabulary_files, extra_terms, removed_terms):
+        terms_digest = hashlib.sha1(json.dumps([sorted(('|'.join(k), v) for k, v in extra_terms.items()),
+                                                sorted(removed_terms)],
+                                               sort_keys=True).encode('utf-8')).hexdigest()
+        return automaton_cache.fingerprint(vocabulary_files,
+                                           self.stopwords,
+                                           partial_match=self.partial_match,
+                                           ignorecase=self.ignorecase,
+                                           variants=[name for name, generator in self.variant_generators],
+                                           terms=terms_digest)
+
+    def fingerprint(self):
+        '''
+        :return: hex digest of everything the automaton is built from (vocabulary file contents, added and
+                 removed terms, stopwords and options): taggers with the same fingerprint find the same tags
+        '''
+        with self._terms_lock:
+            vocabulary_files = list(self.vocabulary_files)
+            extra_terms = {k: dict(v) for k, v in self.extra_terms.items()}
+            removed_terms = set(self.removed_terms)
+        return self._fingerprint(vocabulary_files, extra_terms, removed_terms)
+
+    def _build_state(self, vocabulary_files, extra_terms, removed_terms):
+        '''
+        loads the automaton and its side tables from the cache, or builds them
+        :param vocabulary_files: paths of the vocabulary files to load
+        :param extra_terms: dict (category, reference_db) -> dictionary of terms added to the vocabularies
+        :param removed_terms: set of (category, reference_db, element) to skip
+        :return: dict holding the automaton, its PayloadTable and its FuzzyVerifier
+        '''
+        # the terms added or removed at runtime are not kept from one process to the next: caching the
+        # automata built with them would only leave a new, never reused, file behind at each change
+        use_cache = self.use_cache and not extra_terms and not removed_terms
+        if use_cache:
+            cache_key = self._fingerprint(vocabulary_files, extra_terms, removed_terms)
+            cached_state = automaton_cache.load(cache_key)
+            if cached_state is not None:
+                return cached_state
+        # built in two phases: the entries of all the vocabularies are first aggregated in a plain dict
+        # key -> entry, then each key is inserted in the automaton exactly once
+        state = {'automaton': ahocorasick.Automaton(ahocorasick.STORE_INTS),
+                 'payloads': PayloadTable(),
+                 'fuzzy_verifier': FuzzyVerifier(),
+                 'keys': {}}
+        self._load_vocabularies(state, self.stopwords, vocabulary_files, extra_terms, removed_terms)
+        self._insert_keys(state)
+        state['automaton'].make_automaton()
+        state['payloads'].freeze()
+        if use_cache:
+            automaton_cache.save(cache_key, state)
+        return state
+
+    def _load_vocabularies(self, state, stopwords, vocabulary_files, extra_terms, removed_terms):
+        '''
+        adds every entry of the vocabularies to the automaton. The vocabulary files are parsed and filtered
+        in parallel, see NER.vocabulary_loader
+        :param state: state being built, see _build_state
+        :param stopwords: StopWordIndex of the stopwords to skip
+        :param vocabulary_files: paths of the vocabulary files to load
+        :param extra_terms: dict (category, reference_db) -> dictionary of terms added to the vocabularies
+        :param removed_terms: set of (category, reference_db, element) to skip
+        '''
+        idx = 0
+        for category, reference_db, records in iter_vocabulary_records(vocabulary_files, extra_terms, stopwords,
+                                                                       self.ignorecase, self.partial_match,
+                                                                       removed_terms, self.build_processes,
+                                                                       self.variant_generators):
+            token_category = category + '-TOKEN'
+            for key, is_token, variant, element, ids, pref_name in records:
+                idx += 1
+                self.add_tag(key,
+                             idx,
+                             token_category if is_token else category,
+                             reference_db,
+                             ids,
+                             element,
+                             key,
+                             pref_name,
+                             state,
+                             variant)
+                if is_token:
+                    state['fuzzy_verifier'].add_entry(element, key)
+
+    def add_tag(self, element_text, idx, category, reference_db, ids, element, match, pref_name, state,
+                variant=None):
+        '''
+        adds a dictionary element to the keys of the automaton being built. If the key is already there, the
+        element is merged in its entry unless the entry already has an element of the same category and
+        reference db. The keys are only inserted in the automaton once all of them are known, see _insert_keys
+        :param element_text: key to match in the texts
+        :param idx: insertion order of the element, unused
+        :param category: category of the vocabulary, with a -TOKEN suffix for partial match entries
+        :param reference_db: reference db of the vocabulary
+        :param ids: ids of the element in the reference db
+        :param element: original value of the element
+        :param match: text matched, same as element_text
+        :param pref_name: preferred name of the element
+        :param state: state being built, see _build_state
+        :param variant: name of the variant generator of element_text, None if it is the element itself
+        '''
+        keys = state['keys']
+        payloads = state['payloads']
+        entry_id = keys.get(element_text)
+        if entry_id is None:
+            concept_id = payloads.add_concept(category, reference_db, ids, element, pref_name, variant)
+            keys[element_text] = payloads.add_entry(len(match), concept_id)
+        else:
+            payloads.merge_concept(entry_id, category, reference_db, ids, element, pref_name, variant)
+
+    @staticmethod
+    def _insert_keys(state):
+        '''
+        inserts each key aggregated by add_tag in the automaton, with its entry as value
+        :param state: state being built, see _build_state. Its keys are dropped once inserted
+        '''
+        add_word = state['automaton'].add_word
+        for key, entry_id in state.pop('keys').items():
+            add_word(key, entry_id)
+
+    def rebuild(self, background=True):
+        '''
+        rebuilds the automaton from the current vocabulary files and terms, then swaps it in atomically.
+        Tagging calls started before the swap finish with the previous automaton. If the rebuild fails,
+        the previous automaton is kept.
+        :param background: rebuild in a daemon thread and return immediately
+        :return: the thread running the rebuild if background is True, else None
+        '''
+        if background:
+            thread = threading.Thread(target=self._rebuild_in_background, name='BioEntityTagger rebuild')
+            thread.daemon = True
+            thread.start()
+            return thread
+        self._rebuild()
+
+    def _rebuild(self):
+        with self._rebuild_lock:
+            with self._terms_lock:
+                vocabulary_files = list(self.vocabulary_files)
+                extra_terms = {k: dict(v) for k, v in self.extra_terms.items()}
+                removed_terms = set(self.removed_terms)
+            state = self._build_state(vocabulary_files, extra_terms, removed_terms)
+            self._state = state
+            self.version += 1
+
+    def _rebuild_in_background(self):
         try:
-            ids_insert = [[i for i in ids]]
-        except AttributeError:
-            ids_insert = [[i for i in ids]]
-
-        previous_annotation = self.A.get(element_text, None)
-
-        if previous_annotation is None:
-            annotation = [idx,
-                          category_insert,
-                          reference_db_insert,
-                          ids_insert,
-                          element,
-                          match,
-                          pref_name]
-
-            self.A.add_word(element_text,
-                            annotation)
+            self._rebuild()
+        except Exception:
+            logging.exception('vocabulary rebuild failed, keeping the previous automaton')
+
+    def add_vocabulary(self, vocabulary_file, background=True):
+        '''
+        :param vocabulary_file: path of a vocabulary file to load, named CATEGORY-REFERENCEDB.json
+        :param background: see rebuild
+        '''
+        with self._terms_lock:
+            if vocabulary_file not in self.vocabulary_files:
+                self.vocabulary_files.append(vocabulary_file)
+        return self.rebuild(background)
+
+    def remove_vocabulary(self, vocabulary_file, background=True):
+        '''
+        :param vocabulary_file: path or file name of a loaded vocabulary file
+        :param background: see rebuild
+        '''
+        filename = os.path.basename(vocabulary_file)
+        with self._terms_lock:
+            self.vocabulary_files = [f for f in self.vocabulary_files if os.path.basename(f) != filename]
+        return self.rebuild(background)
+
+    def add_terms(self, category, reference_db, terms, background=True):
+        '''
+        :param category: category of the terms, e.g. 'DISEASE'
+        :param reference_db: reference db of the terms, e.g. 'OPENTARGETS'
+        :param terms: dict element -> {'ids': [...], 'pref_name': ...}, the format of the vocabulary files
+        :param background: see rebuild
+        '''
+        with self._terms_lock:
+            self.extra_terms.setdefault((category, reference_db), {}).update(terms)
+            self.removed_terms.difference_update((category, reference_db, element) for element in terms)
+        return self.rebuild(background)
+
+    def remove_terms(self, category, reference_db, elements, background=True):
+        '''
+        :param category: category of the terms
+        :param reference_db: reference db of the terms
+        :param elements: elements to stop matching, as they appear in the vocabularies
+        :param background: see rebuild
+        '''
+        with self._terms_lock:
+            added = self.extra_terms.get((category, reference_db), {})
+            for element in elements:
+                added.pop(element, None)
+                self.removed_terms.add((category, reference_db, element))
+        return self.rebuild(background)
+
+    def tag(self, text, categories=None):
+        '''
+        :param text: text to tag
+        :param categories: if given, only tags of these categories are looked for. The hits of the other
+                           categories are skipped before being validated, verified or de-nested
+        :return: list of tags as dicts
+        '''
+        state = self._state
+        category_mask = None if categories is None else state['payloads'].category_mask(categories)
+        return self._tag(text, state['automaton'], state['payloads'], self.ignorecase, self.separators_regex,
+                         self.stats, state['fuzzy_verifier'], category_mask)
+
+    @staticmethod
+    def _window_overlap(state):
+        '''
+        :return: number of characters each tagging window of iter_tag must share with its neighbours,
+                 enough for any tag starting in a window to be found, validated and de-nested in it
+        '''
+        overlap = state.get('window_overlap')
+        if overlap is None:
+            # a tag spans at most the longest key, its partial match verification looks at most at the
+            # longest suffix of an entry beyond it, and its boundaries at one character on each side
+            overlap = state['window_overlap'] = (max(state['payloads'].entry_length, default=0) +
+                                                 max(state['fuzzy_verifier'].suffix_lengths.values(), default=0) +
+                                                 2)
+        return overlap
+
+    def iter_tag(self, text, window=1 << 16, categories=None):
+        '''
+        tags a very long text window by window, keeping memory flat whatever the size of the text. Each
+        window is tagged along with enough text on both sides for the tags starting in it to be the same as
+        those tag would find in the whole text
+        :param text: text to tag, or file-like object or iterable of consecutive chunks of the text
+        :param window: number of characters of text tagged at once, not counting the overlap
+        :param categories: see tag
+        :return: generator of the tags as dicts, with offsets in the whole text, in increasing start order.
+                 The counters of self.stats count each window, overlap included, as a text
+        '''
+        state = self._state
+        category_mask = None if categories is None else state['payloads'].category_mask(categories)
+        overlap = self._window_overlap(state)
+        if isinstance(text, str):
+            chunks = (text[i:i + window] for i in range(0, len(text), window))
+        elif hasattr(text, 'read'):
+            chunks = iter(lambda: text.read(window), '')
+        else:
+            chunks = iter(text)
+        # buffer holds the text from buffer_start on, window_start is the start of the next window
+        buffer = ''
+        buffer_start = 0
+        window_start = 0
+        exhausted = False
+        while True:
+            while not exhausted and buffer_start + len(buffer) < window_start + window + overlap:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    buffer += chunk
+            window_end = min(window_start + window, buffer_start + len(buffer))
+            if window_end <= window_start and exhausted:
+                return
+            segment_start = max(buffer_start, window_start - overlap)
+            segment = buffer[segment_start - buffer_start:window_end + overlap - buffer_start]
+            tags = self._tag_records(segment, state['automaton'], state['payloads'], self.ignorecase,
+                                     self.separators_regex, self.stats, state['fuzzy_verifier'], category_mask)
+            # each tag is kept by the window it starts in only
+            tags = [tag for tag in tags if window_start <= tag.start + segment_start < window_end]
+            for tag in sorted(tags, key=attrgetter('start', 'end')):
+                tag.start += segment_start
+                tag.end += segment_start
+                yield tag.to_dict()
+            window_start = window_end
+            kept_start = max(buffer_start, window_start - overlap)
+            buffer = buffer[kept_start - buffer_start:]
+            buffer_start = kept_start
+
+    def tag_many(self, texts, processes=None, chunksize=16, categories=None):
+        '''
+        tags several texts using a pool of worker processes
+        :param texts: iterable of texts to tag
+        :param processes: number of worker processes, defaults to the number of CPUs
+        :param chunksize: number of texts sent to a worker at once
+        :param categories: see tag
+        :return: list with the tags of each text, in input order
+        '''
+        return list(self.iter_tag_many(texts, processes=processes, chunksize=chunksize, categories=categories))
+
+    def iter_tag_many(self, texts, processes=None, chunksize=16, ordered=True, categories=None):
+        '''
+        streaming version of tag_many, suited to whole corpora: texts are consumed lazily
+        and results are yielded as soon as they are available
+        :param texts: iterable of texts to tag
+        :param processes: number of worker processes, defaults to the number of CPUs
+        :param chunksize: number of texts sent to a worker at once
+        :param ordered: if True, yields the tags of each text in input order. If False, yields
+                        (index, tags) pairs in completion order, which keeps workers busy
+                        when text lengths vary a lot
+        :param categories: see tag
+        '''
+        # Pool.imap reads its whole input up front, so texts are submitted in bounded batches
+        # to keep memory flat on corpora that do not fit in RAM
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes <= 1:
+            for i, text in enumerate(texts):
+                yield self.tag(text, categories) if ordered else (i, self.tag(text, categories))
+            return
+
+        global _worker_tagger
+        if 'fork' in multiprocessing.get_all_start_methods():
+            _worker_tagger = self
+            try:
+                pool = multiprocessing.get_context('fork').Pool(processes)
+            finally:
+                _worker_tagger = None
         else:
-            previous_keys = []
-            for j in range(len(previous_annotation[1])):
-                previous_keys.append(previous_annotation[1][j] + '|' + previous_annotation[2][j])
-            if unique_resource_key not in previous_keys:
-                previous_annotation[1].extend(category_insert)
-                previous_annotation[2].extend(reference_db_insert)
-                previous_annotation[3].extend(ids_insert)  # TODO: might need to merge addidional ids if the
-                # uniquekey is passed before
-                self.A.add_word(element_text, previous_annotation)
-
-    def tag(self, text):
-        return self._tag(text, self.A, self.ignorecase)
+            pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(self,))
+        tag_in_worker = functools.partial(_tag_in_worker, categories=categories)
+        indexed_texts = enumerate(texts)
+        batch_size = processes * chunksize * 4
+        try:
+            while True:
+                batch = list(itertools.islice(indexed_texts, batch_size))
+                if not batch:
+                    break
+                if ordered:
+                    results = pool.imap(tag_in_worker, batch, chunksize)
+                else:
+                    results = pool.imap_unordered(tag_in_worker, batch, chunksize)
+                for i, tags, stats in results:
+                    if stats is not None and self.stats is not None:
+                        merge_stats(self.stats, stats)
+                    yield tags if ordered else (i, tags)
+        finally:
+            pool.terminate()
+            pool.join()
 
     @staticmethod
-    def _tag(text, automation, ignorecase=True):
+    def _tag(text, automation, payloads, ignorecase=True, separators_regex=None, stats=None, fuzzy_verifier=None,
+             category_mask=None):
         '''
         finds tags in a text
         :param text: text to tag
         :param automation: automation to use
+        :param payloads: PayloadTable resolving the values stored in the automation
         :param ignorecase: deafault to True
-        :return:
+        :param separators_regex: regex matching the token separators, defaults to separators_all
+        :param stats: optional dict of counters to add to, see NER.tagger_stats
+        :param fuzzy_verifier: FuzzyVerifier checking partial matches
+        :param category_mask: if given, only the categories of this mask are tagged, see PayloadTable.category_mask
+        :return: list of tags as dicts
         '''
-        if isinstance(text, str):
-            text_to_tag = text
-        else:
-            text_to_tag = text
-        if ignorecase:
-            text_to_tag = text_to_tag.lower()
-        matches = []
-        for i in automation.iter(text_to_tag.lower()):
-            if len(i[1]) < 7:
-                print(i)
-        for end_index, (insert_order, category_list, reference_db_list, entity_id_list, original_value, match,
-                        pref_name) in automation.iter(text_to_tag.lower()):
-            start_index = end_index - len(match) + 1
+        return [tag.to_dict() for tag in
+                BioEntityTagger._tag_records(text, automation, payloads, ignorecase, separators_regex, stats,
+                                             fuzzy_verifier, category_mask)]
+
+    @staticmethod
+    def _tag_records(text, automation, payloads, ignorecase=True, separators_regex=None, stats=None,
+                     fuzzy_verifier=None, category_mask=None):
+        '''
+        tagging core: a single pass of the automaton over the text, keeping the tags as MatchedTag
+        records. Use _tag to get them as dicts.
+        :param text: text to tag
+        :param automation: automation to use
+        :param payloads: PayloadTable resolving the values stored in the automation
+        :param ignorecase: deafault to True
+        :param separators_regex: regex matching the token separators, defaults to separators_all
+        :param stats: optional dict of counters to add to, see NER.tagger_stats. The clock is only read
+                      when it is given
+        :param fuzzy_verifier: FuzzyVerifier checking partial matches, the hits of tokens of
+                               longer dictionary entries. All of them are verified in one batch
+        :param category_mask: if given, only the categories of this mask are tagged, see PayloadTable.category_mask
+        :return: list of non nested MatchedTag, grouped by category and reference db
+        '''
+        if category_mask == 0:
+            return []
+        if stats is not None:
+            phase_start = time.perf_counter()
+        text_to_tag, offsets = fold_case(text) if ignorecase else (text, None)
+        if separators_regex is None:
+            separators_regex = BioEntityTagger.separators_regex
+        boundaries = boundary_map(text_to_tag, separators_regex)
+        if stats is not None:
+            phase_seconds = stats['phase_seconds']
+            phase_end = time.perf_counter()
+            phase_seconds['preprocessing'] += phase_end - phase_start
+            phase_start = phase_end
+        raw_hits = 0
+        rejected_hits = 0
+        grouped_matches = {}
+        token_candidates = []
+        entry_length = payloads.entry_length
+        entry_concepts_offsets = payloads.entry_concepts_offsets
+        entry_concepts = payloads.entry_concepts
+        resolve = payloads.resolve
+        entry_category_mask = payloads.entry_category_mask
+        concept_source = payloads.concept_source
+        source_mask = payloads.source_mask
+        concept_variant = payloads.concept_variant
+        variant_names = payloads.variant_names
+        for end_index, entry_id in automation.iter(text_to_tag):
+            if category_mask is not None and not entry_category_mask[entry_id] & category_mask:
+                continue
+            start_index = end_index - entry_length[entry_id] + 1
             end_index += 1
+            raw_hits += 1
+
+            if not (boundaries[start_index] and boundaries[end_index + 1]):
+                rejected_hits += 1
+                continue
+            match = text_to_tag[start_index:end_index]
+            for k in range(entry_concepts_offsets[entry_id], entry_concepts_offsets[entry_id + 1]):
+                concept_id = entry_concepts[k]
+                if category_mask is not None and not source_mask[concept_source[concept_id]] & category_mask:
+                    continue
+                category, reference_db, is_token, entity_id, original_value, pref_name = resolve(concept_id)
+                tag = MatchedTag(match, start_index, end_index, category, reference_db, entity_id,
+                                 original_value, pref_name, variant=variant_names[concept_variant[concept_id]])
+                if is_token:
+                    token_candidates.append(tag)
+                else:
+                    grouped_matches.setdefault((category, reference_db), []).append(tag)
+
+        if stats is not None:
+            phase_end = time.perf_counter()
+            phase_seconds['scan'] += phase_end - phase_start
+            phase_start = phase_end
+
+        fuzzy_rejections = 0
+        if token_candidates:
+            if fuzzy_verifier is None:
+                fuzzy_verifier = FuzzyVerifier()
+            surfaces = [(tag.original_value,
+                         text_to_tag[tag.start:fuzzy_verifier.candidate_end(tag.original_value, tag.match, tag.end)])
+                        for tag in token_candidates]
+            for tag, accepted in zip(token_candidates, fuzzy_verifier.verify_many(surfaces)):
+                if accepted:
+                    grouped_matches.setdefault((tag.category, tag.reference_db), []).append(tag)
+                else:
+                    fuzzy_rejections += 1
+            if stats is not None:
+                phase_end = time.perf_counter()
+                phase_seconds['fuzzy'] += phase_end - phase_start
+                phase_start = phase_end
 
-            if (start_index == 0 or text_to_tag[start_index - 1] in BioEntityTagger.separators_all) and \
-               (end_index == len(text_to_tag) or text_to_tag[end_index] in BioEntityTagger.separators_all):
-                for j in range(len(category_list)):
-                    category = category_list[j]
-                    reference_db = reference_db_list[j]
-                    entity_id = entity_id_list[j]
-                    if isinstance(entity_id, list):
-                        entity_id = entity_id[0]
-                    if category.endswith('-TOKEN'):
-                        pre, post = original_value.split(match)[:2]
-                        potential_match = text_to_tag[start_index:end_index + len(post)]
-                        score = fuzz.token_sort_ratio(original_value, potential_match)
-                        if score > 90:
-                            tag = MatchedTag(match, start_index, end_index, category.replace('-TOKEN', ''),
-                                             reference_db,
-                                             entity_id, original_value, pref_name)
-                            matches.append(tag.__dict__)
-                    else:
-                        tag = MatchedTag(match, start_index, end_index, category, reference_db, entity_id,
-                                         original_value, pref_name)
-                        matches.append(tag.__dict__)
-            else:
-                pass
-
-        grouped_matches = BioEntityTagger.group_matches_by_category_and_reference(matches)
         filtered_matches = []
-        for group, matches_in_group in list(grouped_matches.items()):
-            non_nested_matches = BioEntityTagger.remove_nested_matches(matches_in_group)
-            filtered_matches.extend(non_nested_matches)
+        for matches_in_group in grouped_matches.values():
+            filtered_matches.extend(remove_nested(matches_in_group, attrgetter('start'), attrgetter('end')))
+
+        if stats is not None:
+            phase_seconds['nesting'] += time.perf_counter() - phase_start
+            stats['documents'] += 1
+            stats['raw_hits'] += raw_hits
+            stats['boundary_rejections'] += rejected_hits
+            stats['fuzzy_checks'] += len(token_candidates)
+            stats['fuzzy_rejections'] += fuzzy_rejections
+            stats['nested_removed'] += sum(len(group) for group in grouped_matches.values()) - len(filtered_matches)
+            stats['tags'] += len(filtered_matches)
+            tags_per_category = stats['tags_per_category']
+            for tag in filtered_matches:
+                tags_per_category[tag.category] = tags_per_category.get(tag.category, 0) + 1
+
+        if offsets is not None:
+            # back to offsets in the original text. The lowercasing of a character is either entirely in
+            # a tag or not at all, unless the tag ends in the middle of it, and then includes all of it
+            for tag in filtered_matches:
+                tag.start = offsets[tag.start]
+                tag.end = offsets[tag.end - 1] + 1 if tag.end > 0 else 0
 
         return filtered_matches
 
@@ -201,23 +704,11 @@ class BioEntityTagger(object):
 
     @staticmethod
     def remove_nested_matches(matches):
-        filtered_matches = []
-        sorted_matches = sorted(matches, key=lambda x: (x['start'], -x['end']))
-        for i, tag_i in enumerate(sorted_matches):
-            keep = True
-            for j, tag_j in enumerate(sorted_matches):
-                if i != j:
-                    if tag_j['start'] <= tag_i['start'] <= tag_j['end'] and \
-                            tag_j['start'] <= tag_i['end'] <= tag_j['end']:
-                        keep = False
-                        break
-                    elif tag_j['start'] > tag_i['start']:
-                        break
-                    else:
-                        pass
-            if keep:
-                filtered_matches.append(tag_i)
-        return filtered_matches
+        '''
+        :param matches: tags as dicts
+        :return: the tags that are not contained in a longer tag, sorted by (start, -end)
+        '''
+        return remove_nested(matches)
 
     @staticmethod
     def mark_tags_in_text(text, matches):
@@ -227,38 +718,19 @@ class BioEntityTagger(object):
         :param matches: tags to encode
         :return:
         '''
-        text_to_tag = text
-        tagged_abstract = ''
-        if isinstance(text, str):
-            text_to_tag = text
-        try:
-            tagged_abstract = ChangeCollector(text_to_tag)
-            for i, tag in enumerate(
-                    sorted(matches, key=lambda x: (x['start'], -x['end']))):
-                if isinstance(tag['reference'], (list, tuple)):
-                    tag_reference = '|'.join(tag['reference'])
-                else:
-                    tag_reference = tag['reference']
-                tagged_abstract.add_change(tag['start'], tag['start'],
-                                           '<mark-%s data-entity="%s" reference-db="%s"  reference="%s">' % (
-                                               str(i), tag['category'], tag['reference_db'], tag_reference))
-                tagged_abstract.add_change(tag['end'], tag['end'], '</mark-%s>' % str(i))
-            tagged_abstract = '<div  class="entities">%s</div></br>' % tagged_abstract.get_changed()
-        except UnicodeDecodeError:
-            logging.error('cannot generate maked text for unicode decode error')
-        return tagged_abstract
+        return '<div  class="entities">%s</div></br>' % entity_markup(text, matches)
 
     @staticmethod
     def get_tags_in_range(matches, start, end):
-        filtered_tag = []
-        for t in matches:
-            if start <= t['start'] <= end and \
-                    start <= t['end'] <= end:
-                filtered_tag.append(t)
-            elif t['end'] > end:
-                break
-
-        return filtered_tag
+        '''
+        :param matches: tags of a document, or better their TagIndex when several ranges are queried
+        :param start: start offset of the range
+        :param end: end offset of the range
+        :return: the tags lying within [start, end], in (start, end) order
+        '''
+        if not isinstance(matches, TagIndex):
+            matches = TagIndex(matches)
+        return matches.in_range(start, end)
 
     @staticmethod
     def get_tag_by_match(tags, match):
@@ -270,18 +742,33 @@ class BioEntityTagger(object):
 
     @staticmethod
     def extend_tags_to_alternative_forms(text, extended_forms):
-        A = ahocorasick.Automaton()
-        for text_to_match, payload in list(extended_forms.items()):
-            A.add_word(text_to_match.lower(),
-                       [0, [payload['category']], [payload['reference_db']], [payload['reference']],
-                        payload['original_value'],
-                        text_to_match.lower(), payload['label']])
-        A.make_automaton()
+        '''
+        tags the alternative forms of entities (e.g. abbreviations) in a text. The automaton of
+        extended_forms is compiled once and cached, see NER.alternative_forms
+        :param text: text to tag
+        :param extended_forms: dict text to match -> payload, a payload being a dict with the category,
+                               reference_db, reference, original_value and label of the tags to emit
+        :return: list of tags as dicts
+        '''
+        A, payloads = alternative_forms_cache.get(extended_forms)
+        return BioEntityTagger._tag(text, A, payloads)
 
-        return BioEntityTagger._tag(text, A, )
+    @staticmethod
+    def extend_tags_to_alternative_forms_many(texts, extended_forms):
+        '''
+        applies the same alternative forms to many texts
+        :param texts: iterable of texts to tag
+        :param extended_forms: see extend_tags_to_alternative_forms
+        :return: list with the tags of each text
+        '''
+        A, payloads = alternative_forms_cache.get(extended_forms)
+        return [BioEntityTagger._tag(text, A, payloads) for text in texts]
 
 
 class MatchedTag(object):
+    __slots__ = ('match', 'start', 'end', 'category', 'reference_db', 'reference', 'original_value', 'label',
+                 'sentence', 'variant')
+
     def __init__(self,
                  match,
                  start,
@@ -291,7 +778,8 @@ class MatchedTag(object):
                  reference,
                  original_value,
                  label,
-                 sentence=None
+                 sentence=None,
+                 variant=None
                  ):
         self.match = match
         self.start = start
@@ -302,11 +790,25 @@ class MatchedTag(object):
         self.original_value = original_value
         self.label = label
         self.sentence = sentence
+        # name of the variant generator whose key matched, None if a vocabulary term matched
+        self.variant = variant
+
+    def to_dict(self):
+        return {'match': self.match,
+                'start': self.start,
+                'end': self.end,
+                'category': self.category,
+                'reference_db': self.reference_db,
+                'reference': self.reference,
+                'original_value': self.original_value,
+                'label': self.label,
+                'sentence': self.sentence,
+                'variant': self.variant}
 
     @staticmethod
     def sanitize_string(s):
         if isinstance(s, str):
-            return s.translate(unicode_punctation_table)
+            return s.translate(unicode_punctation_table())
         elif isinstance(s, str):
             return str(s.translate(string.maketrans(' ', '_'), string.punctuation))
         else:
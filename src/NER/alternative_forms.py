@@ -0,0 +1,110 @@
+'''
+Compiled automata for BioEntityTagger.extend_tags_to_alternative_forms.
+
+The same alternative forms (e.g. the abbreviations found in a corpus) are usually applied to many
+texts, so their automata are compiled once and kept in an LRU cache keyed by a fingerprint of the
+alternative forms, bounded both in number of automata and in memory.
+'''
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import ahocorasick
+
+from .payloads import PayloadTable
+
+
+def fingerprint(extended_forms):
+    '''
+    :param extended_forms: dict text to match -> payload, see compile_alternative_forms
+    :return: hex digest of the content of extended_forms
+    '''
+    return hashlib.sha1(json.dumps(extended_forms, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def compile_alternative_forms(extended_forms):
+    '''
+    :param extended_forms: dict text to match -> payload, a payload being a dict with the category, reference_db,
+                           reference, original_value and label of the tags to emit
+    :return: (automaton, payloads) to pass to BioEntityTagger._tag
+    '''
+    A = ahocorasick.Automaton(ahocorasick.STORE_INTS)
+    payloads = PayloadTable()
+    for text_to_match, payload in list(extended_forms.items()):
+        reference = payload['reference']
+        concept_id = payloads.add_concept(payload['category'],
+                                          payload['reference_db'],
+                                          reference if isinstance(reference, list) else [reference],
+                                          payload['original_value'],
+                                          payload['label'])
+        key = text_to_match.lower()
+        A.add_word(key, payloads.add_entry(len(key), concept_id))
+    A.make_automaton()
+    payloads.freeze()
+    return A, payloads
+
+
+def estimated_size(compiled):
+    '''
+    :param compiled: (automaton, payloads) as returned by compile_alternative_forms
+    :return: rough size in bytes of the automaton and its string pool
+    '''
+    A, payloads = compiled
+    return A.get_stats()['total_size'] + sum(len(s) + 50 for s in payloads.strings)
+
+
+class AlternativeFormsCache(object):
+    def __init__(self, max_entries=32, max_bytes=256 << 20):
+        '''
+        :param max_entries: maximum number of compiled automata kept
+        :param max_bytes: maximum estimated memory used by the compiled automata kept
+        '''
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, extended_forms):
+        '''
+        :param extended_forms: dict text to match -> payload, see compile_alternative_forms
+        :return: (automaton, payloads) compiled from extended_forms
+        '''
+        key = fingerprint(extended_forms)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        compiled = compile_alternative_forms(extended_forms)
+        size = estimated_size(compiled)
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (compiled, size)
+                self._size += size
+                while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                    evicted_key, (evicted, evicted_size) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def info(self):
+        '''
+        :return: dict with the hits, misses, number of entries and estimated size of the cache
+        '''
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'entries': len(self._entries),
+                    'bytes': self._size}
+
+
+alternative_forms_cache = AlternativeFormsCache()
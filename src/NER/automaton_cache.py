@@ -0,0 +1,122 @@
+'''
+On-disk cache for the compiled Aho-Corasick automaton of BioEntityTagger and its side tables.
+
+Building the automaton means parsing every vocabulary file and inserting each entry,
+which is by far the slowest part of creating a tagger. The finished automaton is
+pickled, along with the side tables built at the same time, under a key derived from
+everything that went into building it (vocabulary file contents, stopwords and tagger
+options), so any change to an input produces a new key and the stale entry is simply
+never read again. Only the MAX_ENTRIES most recently used entries are kept, each of
+them weighing a hundred megabytes or more.
+'''
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+CACHE_DIR = os.path.dirname(os.path.abspath(__file__)) + "/cache/"
+# bump whenever the layout of the automaton payloads or of the cached state changes
+CACHE_FORMAT_VERSION = 5
+CACHE_FILE_PREFIX = 'automaton-'
+# number of cached automata kept, the least recently used ones are removed when a new one is saved
+MAX_ENTRIES = 3
+
+
+def fingerprint(vocabulary_files, stopwords, **options):
+    '''
+    computes the cache key for an automaton
+    :param vocabulary_files: paths of the vocabulary files loaded in the automaton
+    :param stopwords: StopWordIndex of the stopwords skipped while building
+    :param options: any other setting that changes the automaton (partial_match, ignorecase...)
+    :return: hex digest identifying the automaton
+    '''
+    h = hashlib.sha1()
+    h.update(('format=%d\n' % CACHE_FORMAT_VERSION).encode('utf-8'))
+    for path in vocabulary_files:
+        h.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    h.update(stopwords.fingerprint().encode('utf-8'))
+    for name in sorted(options):
+        h.update(('\n%s=%r' % (name, options[name])).encode('utf-8'))
+    return h.hexdigest()
+
+
+def cache_path(key, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, CACHE_FILE_PREFIX + key + '.pkl')
+
+
+def load(key, cache_dir=CACHE_DIR):
+    '''
+    :param key: fingerprint of the automaton
+    :param cache_dir: directory holding the cached automata
+    :return: the cached tagger state, or None if there is no usable entry for this key
+    '''
+    path = cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except Exception:
+        logging.warning('ignoring unreadable automaton cache file %s', path)
+        return None
+    try:
+        # the modification time of the entries orders them by last use, see prune
+        os.utime(path)
+    except OSError:
+        # read-only cache, e.g. built at deploy time by another user
+        pass
+    return state
+
+
+def save(key, state, cache_dir=CACHE_DIR, max_entries=MAX_ENTRIES):
+    '''
+    writes a tagger state to the cache. The file is written under a temporary name and
+    renamed, so concurrent taggers never read a partially written entry.
+    :param key: fingerprint of the automaton
+    :param state: picklable tagger state: the compiled ahocorasick.Automaton and its side tables
+    :param cache_dir: directory holding the cached automata
+    :param max_entries: number of entries left in the cache, this one included, see prune
+    '''
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path(key, cache_dir))
+    except OSError:
+        logging.warning('could not write automaton cache in %s', cache_dir)
+        return
+    prune(max_entries, cache_dir)
+
+
+def prune(max_entries=MAX_ENTRIES, cache_dir=CACHE_DIR):
+    '''
+    removes the least recently used cached automata beyond the max_entries most recent ones
+    '''
+    entries = []
+    for filename in os.listdir(cache_dir):
+        if filename.startswith(CACHE_FILE_PREFIX):
+            path = os.path.join(cache_dir, filename)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                # removed by another tagger in the meantime
+                pass
+    for mtime, path in sorted(entries, reverse=True)[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def clear(cache_dir=CACHE_DIR):
+    '''removes every cached automaton'''
+    if not os.path.isdir(cache_dir):
+        return
+    for filename in os.listdir(cache_dir):
+        if filename.startswith(CACHE_FILE_PREFIX):
+            os.remove(os.path.join(cache_dir, filename))
@@ -0,0 +1,432 @@
+'''
+Benchmarks for the NER package.
+
+Run from the src directory, e.g.:
+    python -m NER.benchmark stopwords
+    python -m NER.benchmark tagging
+    python -m NER.benchmark nesting
+    python -m NER.benchmark importtime
+    python -m NER.benchmark build
+    python -m NER.benchmark suite --output ner-benchmark.json [--baseline previous.json]
+'''
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import random
+import re
+import resource
+import subprocess
+import sys
+import time
+
+from constants import TEST1_JSON_DS, TEST_DATA_DIR
+from NER.BioentityTagger import BioEntityTagger
+from NER.BioStopWords import DOMAIN_STOP_WORDS
+from NER.intervals import remove_nested
+from NER.markup import highlight_tags
+from NER.stopword_index import StopWordIndex
+from NER.variants import ALL_VARIANTS
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _vocabulary_entries(vocabulary_files):
+    for vocabulary_file in vocabulary_files:
+        category = os.path.basename(vocabulary_file).split('.')[0].split('-')[0]
+        with open(vocabulary_file) as f:
+            for element in json.load(f):
+                yield element, category
+
+
+def _filter_entries(entries, is_stopword):
+    '''applies the stopword test of BioEntityTagger._load_vocabularies to every entry'''
+    kept = 0
+    for element, category in entries:
+        if len(element) > 2:
+            if ((len(element) < 5) and not is_stopword(element, category) or
+                    (len(element) >= 5) and not is_stopword(element.lower(), category)):
+                kept += 1
+    return kept
+
+
+def bench_stopwords(args):
+    '''
+    compares the vocabulary stopword filtering against the former plain list with the StopWordIndex,
+    then times a full automaton construction (bypassing the on-disk cache)
+    '''
+    vocabulary_files = BioEntityTagger.default_vocabulary_files()
+    entries = list(_vocabulary_entries(vocabulary_files))
+    index = StopWordIndex(DOMAIN_STOP_WORDS)
+    list_time, list_kept = _timed(_filter_entries, entries, lambda w, c: w in DOMAIN_STOP_WORDS)
+    index_time, index_kept = _timed(_filter_entries, entries, index.is_stopword)
+    assert list_kept == index_kept
+    results = {'vocabulary_entries': len(entries),
+               'entries_kept': index_kept,
+               'filter_list_seconds': list_time,
+               'filter_index_seconds': index_time,
+               'filter_speedup': list_time / index_time}
+    if not args.skip_build:
+        results['construction_seconds'] = _timed(BioEntityTagger, use_cache=False)[0]
+    return results
+
+
+class _LegacyBuildTagger(BioEntityTagger):
+    '''builds the automaton the former way, looking up and inserting every key in it as it comes'''
+
+    def add_tag(self, element_text, idx, category, reference_db, ids, element, match, pref_name, state,
+                variant=None):
+        automaton = state['automaton']
+        payloads = state['payloads']
+        entry_id = automaton.get(element_text, None)
+        if entry_id is None:
+            concept_id = payloads.add_concept(category, reference_db, ids, element, pref_name, variant)
+            automaton.add_word(element_text, payloads.add_entry(len(match), concept_id))
+        else:
+            payloads.merge_concept(entry_id, category, reference_db, ids, element, pref_name, variant)
+
+    @staticmethod
+    def _insert_keys(state):
+        state.pop('keys')
+
+
+class _PhaseTimingTagger(BioEntityTagger):
+    '''records the time spent inserting the keys in the automaton'''
+    insert_seconds = 0.0
+
+    @staticmethod
+    def _insert_keys(state):
+        _PhaseTimingTagger.insert_seconds = _timed(BioEntityTagger._insert_keys, state)[0]
+
+
+def bench_build(args):
+    '''
+    compares the construction of the automaton from the full vocabulary set (bypassing the on-disk cache)
+    when every key is looked up and inserted as it comes, and in two phases: aggregation of all the entries
+    in a dict, then insertion of each key once. Also times the build with the vocabulary files parsed one
+    after another rather than in parallel
+    '''
+    results = {'vocabulary_files': [os.path.basename(f) for f in BioEntityTagger.default_vocabulary_files()],
+               'partial_match': args.partial_match}
+    legacy_times = []
+    two_phase_times = []
+    insert_times = []
+    sequential_times = []
+    for _ in range(args.repeat):
+        legacy_time, legacy = _timed(_LegacyBuildTagger, use_cache=False, partial_match=args.partial_match)
+        legacy_times.append(legacy_time)
+        two_phase_time, tagger = _timed(_PhaseTimingTagger, use_cache=False, partial_match=args.partial_match)
+        two_phase_times.append(two_phase_time)
+        insert_times.append(_PhaseTimingTagger.insert_seconds)
+        sequential_times.append(_timed(BioEntityTagger, use_cache=False, partial_match=args.partial_match,
+                                       build_processes=1)[0])
+    assert sorted(legacy.A.keys()) == sorted(tagger.A.keys())
+    results.update({'keys': len(tagger.A),
+                    'entries': len(tagger.payloads.entry_length),
+                    'concepts': len(tagger.payloads.concept_source),
+                    'legacy_seconds': min(legacy_times),
+                    'two_phase_seconds': min(two_phase_times),
+                    'two_phase_insert_seconds': min(insert_times),
+                    'speedup': min(legacy_times) / min(two_phase_times),
+                    'build_processes': multiprocessing.cpu_count(),
+                    'sequential_parse_seconds': min(sequential_times),
+                    'parallel_parse_speedup': min(sequential_times) / min(two_phase_times)})
+    return results
+
+
+def _corpus_texts(corpusfile, field='raw'):
+    with open(corpusfile) as f:
+        return [json.loads(line)[field] for line in f]
+
+
+def bench_tagging(args):
+    '''
+    reports the throughput of BioEntityTagger.tag (tags/sec and documents/sec) on a JSON corpus, and its
+    match funnel counters summed over all the runs
+    '''
+    texts = _corpus_texts(args.corpus)
+    tagger = BioEntityTagger(collect_stats=True, partial_match=args.partial_match,
+                             variants=ALL_VARIANTS if args.all_variants else None)
+    tagger.tag(texts[0])  # warm up
+    tagger.reset_stats()
+    best_time = None
+    for _ in range(args.repeat):
+        elapsed, tags = _timed(lambda: [tagger.tag(text) for text in texts])
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    tag_count = sum(len(t) for t in tags)
+    return {'corpus': args.corpus,
+            'documents': len(texts),
+            'characters': sum(len(text) for text in texts),
+            'tags': tag_count,
+            'seconds': best_time,
+            'documents_per_second': len(texts) / best_time,
+            'tags_per_second': tag_count / best_time,
+            'funnel': tagger.stats_snapshot()}
+
+
+def _legacy_remove_nested(matches):
+    '''quadratic nested match removal formerly used by BioEntityTagger.remove_nested_matches'''
+    filtered_matches = []
+    sorted_matches = sorted(matches, key=lambda x: (x['start'], -x['end']))
+    for i, tag_i in enumerate(sorted_matches):
+        keep = True
+        for j, tag_j in enumerate(sorted_matches):
+            if i != j:
+                if tag_j['start'] <= tag_i['start'] <= tag_j['end'] and \
+                        tag_j['start'] <= tag_i['end'] <= tag_j['end']:
+                    keep = False
+                    break
+                elif tag_j['start'] > tag_i['start']:
+                    break
+        if keep:
+            filtered_matches.append(tag_i)
+    return filtered_matches
+
+
+def _random_spans(count, text_length, max_length, rng):
+    '''distinct random spans, as the tagger produces within one category and reference db'''
+    spans = set()
+    while len(spans) < count:
+        start = rng.randrange(text_length)
+        spans.add((start, start + rng.randint(1, max_length)))
+    return [{'start': start, 'end': end} for start, end in spans]
+
+
+def bench_nesting(args):
+    '''
+    times the interval sweep of NER.intervals.remove_nested and the former quadratic implementation on
+    growing numbers of matches. Their equivalence is checked by NER/test_intervals.py
+    '''
+    rng = random.Random(args.seed)
+    results = {'timings': []}
+    for count in (100, 1000, 5000):
+        # full text density: roughly one hit every 20 characters
+        spans = _random_spans(count, count * 20, 40, rng)
+        results['timings'].append({'matches': count,
+                                   'legacy_seconds': _timed(_legacy_remove_nested, spans)[0],
+                                   'sweep_seconds': _timed(remove_nested, spans)[0]})
+    return results
+
+
+def _import_time(module):
+    '''
+    imports module in a fresh interpreter with -X importtime
+    :return: dict module -> cumulative import time in seconds
+    '''
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            cwd=src_dir, stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        m = re.match(r'import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)', line)
+        if m:
+            times[m.group(4)] = int(m.group(2)) / 1e6
+    return times
+
+
+def bench_importtime(args):
+    '''
+    measures the cold start of the package: the cumulative time of importing a module in a fresh
+    interpreter (best of several runs) and its slowest dependencies
+    '''
+    runs = [_import_time(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module])
+    ner_modules = sorted(((name, seconds) for name, seconds in best.items() if name.startswith('NER')),
+                         key=lambda x: -x[1])
+    results = {'module': args.module,
+               'seconds': best[args.module],
+               'target_seconds': args.target,
+               'within_target': best[args.module] <= args.target,
+               'ner_modules_seconds': dict(ner_modules)}
+    if not results['within_target']:
+        # makes main exit with an error
+        results['regressions'] = ['%s import: %.4g s over the %.4g s target'
+                                  % (args.module, results['seconds'], args.target)]
+    return results
+
+
+def _peak_rss():
+    '''
+    :return: peak resident set size of this process so far, in bytes
+    '''
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _title(text, length=120):
+    '''the beginning of text, cut on a word boundary, standing for a title'''
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0]
+
+
+def _synthetic_texts(texts, length, count, rng):
+    '''
+    :return: count texts of about length characters, made of random documents of texts put end to end
+    '''
+    synthetic = []
+    for _ in range(count):
+        parts = []
+        size = 0
+        while size < length:
+            parts.append(rng.choice(texts))
+            size += len(parts[-1]) + 2
+        synthetic.append('\n\n'.join(parts)[:length])
+    return synthetic
+
+
+def _text_sets(texts, args, rng):
+    '''
+    :return: dict size class -> texts, from titles to full article bodies, then the synthetic sizes
+    '''
+    text_sets = {'title': [_title(text) for text in texts],
+                 'abstract': texts,
+                 'body': _synthetic_texts(texts, args.body_length, max(1, len(texts) // 10), rng)}
+    for length in args.scale:
+        text_sets['synthetic-%d' % length] = _synthetic_texts(texts, length, args.synthetic_count, rng)
+    return text_sets
+
+
+def _tag_phases(tagger, texts):
+    '''
+    tags texts, timing separately the phases of tagging (see NER.tagger_stats.PHASES), the nested removal
+    across categories and the markup rendering
+    :param tagger: BioEntityTagger collecting stats, whose counters are reset
+    :return: (dict phase -> seconds, number of tags)
+    '''
+    tagger.reset_stats()
+    cross_category_nesting = markup = 0.0
+    tag_count = 0
+    for text in texts:
+        tags = tagger.tag(text)
+        nesting_time, tags = _timed(remove_nested, tags)
+        cross_category_nesting += nesting_time
+        markup += _timed(highlight_tags, text, tags)[0]
+        tag_count += len(tags)
+    phases = dict(tagger.stats_snapshot()['phase_seconds'])
+    phases['cross_category_nesting'] = cross_category_nesting
+    phases['markup'] = markup
+    return phases, tag_count
+
+
+def _regressions(results, baseline, tolerance):
+    '''
+    :return: descriptions of the figures of results that are worse than in baseline by more than tolerance
+    '''
+    regressions = []
+    for name in ('build_seconds', 'cached_load_seconds', 'peak_rss_bytes'):
+        if name in baseline and results[name] > baseline[name] * (1 + tolerance):
+            regressions.append('%s: %.4g -> %.4g' % (name, baseline[name], results[name]))
+    for size, figures in results['sizes'].items():
+        previous = baseline.get('sizes', {}).get(size)
+        if previous and figures['documents_per_second'] < previous['documents_per_second'] * (1 - tolerance):
+            regressions.append('%s documents_per_second: %.4g -> %.4g'
+                               % (size, previous['documents_per_second'], figures['documents_per_second']))
+    return regressions
+
+
+def bench_suite(args):
+    '''
+    measures BioEntityTagger as deployed: automaton build and cached load times, peak memory, and for texts
+    from titles to full article bodies the documents/sec, tags/sec and time spent in each tagging phase.
+    Optionally compares the results with those of a previous run to detect regressions
+    '''
+    rng = random.Random(args.seed)
+    texts = [text for corpus in args.corpus for text in _corpus_texts(corpus)]
+    results = {'corpora': args.corpus,
+               'vocabulary_files': [os.path.basename(f) for f in BioEntityTagger.default_vocabulary_files()]}
+    results['build_seconds'] = _timed(BioEntityTagger, use_cache=False)[0]
+    # a build without the cache does not write it: make sure the timed load finds it
+    BioEntityTagger()
+    results['cached_load_seconds'], tagger = _timed(BioEntityTagger, collect_stats=True)
+    results['peak_rss_after_build_bytes'] = _peak_rss()
+    tagger.tag(texts[0])  # warm up
+    results['sizes'] = {}
+    for size, size_texts in _text_sets(texts, args, rng).items():
+        best = None
+        for _ in range(args.repeat):
+            elapsed, (phases, tag_count) = _timed(_tag_phases, tagger, size_texts)
+            if best is None or elapsed < best[0]:
+                best = (elapsed, phases, tag_count)
+        elapsed, phases, tag_count = best
+        results['sizes'][size] = {'documents': len(size_texts),
+                                  'mean_characters': sum(len(text) for text in size_texts) / len(size_texts),
+                                  'tags': tag_count,
+                                  'seconds': elapsed,
+                                  'documents_per_second': len(size_texts) / elapsed,
+                                  'tags_per_second': tag_count / elapsed,
+                                  'characters_per_second': sum(len(text) for text in size_texts) / elapsed,
+                                  'phase_seconds': phases}
+    results['peak_rss_bytes'] = _peak_rss()
+    if args.baseline:
+        with open(args.baseline) as f:
+            results['regressions'] = _regressions(results, json.load(f), args.tolerance)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark')
+    subparsers.required = True
+
+    stopwords_parser = subparsers.add_parser('stopwords', help=bench_stopwords.__doc__)
+    stopwords_parser.add_argument('--skip-build', action='store_true', help='do not time a full automaton build')
+    stopwords_parser.set_defaults(function=bench_stopwords)
+
+    tagging_parser = subparsers.add_parser('tagging', help=bench_tagging.__doc__)
+    tagging_parser.add_argument('--corpus', default=TEST1_JSON_DS, help='JSON corpus to tag, one document per line')
+    tagging_parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    tagging_parser.add_argument('--partial-match', action='store_true', help='tag with partial matches')
+    tagging_parser.add_argument('--all-variants', action='store_true',
+                                help='match all the surface variants of NER.variants')
+    tagging_parser.set_defaults(function=bench_tagging)
+
+    nesting_parser = subparsers.add_parser('nesting', help=bench_nesting.__doc__)
+    nesting_parser.add_argument('--seed', type=int, default=0)
+    nesting_parser.set_defaults(function=bench_nesting)
+
+    build_parser = subparsers.add_parser('build', help=bench_build.__doc__)
+    build_parser.add_argument('--repeat', type=int, default=3, help='number of builds, the best one is reported')
+    build_parser.add_argument('--partial-match', action='store_true', help='also add the partial match entries')
+    build_parser.set_defaults(function=bench_build)
+
+    importtime_parser = subparsers.add_parser('importtime', help=bench_importtime.__doc__)
+    importtime_parser.add_argument('--module', default='NER.BioentityTagger', help='module to import')
+    importtime_parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    importtime_parser.add_argument('--target', type=float, default=1.0, help='import time budget in seconds')
+    importtime_parser.set_defaults(function=bench_importtime)
+
+    suite_parser = subparsers.add_parser('suite', help=bench_suite.__doc__)
+    suite_parser.add_argument('--corpus', nargs='+', default=sorted(glob.glob(TEST_DATA_DIR + '*.json')),
+                              help='JSON corpora to tag, one document per line')
+    suite_parser.add_argument('--body-length', type=int, default=40000,
+                              help='length of the synthetic full article bodies, in characters')
+    suite_parser.add_argument('--scale', type=int, nargs='*', default=[100000, 1000000],
+                              help='lengths of additional synthetic texts, in characters')
+    suite_parser.add_argument('--synthetic-count', type=int, default=3, help='number of texts of each synthetic length')
+    suite_parser.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is reported')
+    suite_parser.add_argument('--seed', type=int, default=0)
+    suite_parser.add_argument('--output', help='file to write the results to, as JSON')
+    suite_parser.add_argument('--baseline', help='results of a previous run to compare with')
+    suite_parser.add_argument('--tolerance', type=float, default=0.2,
+                              help='relative degradation from the baseline reported as a regression')
+    suite_parser.set_defaults(function=bench_suite)
+
+    args = parser.parse_args(argv)
+    results = args.function(args)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 1 if results.get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
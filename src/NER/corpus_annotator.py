@@ -0,0 +1,196 @@
+'''
+Annotation of whole JSON corpora with BioEntityTagger.
+
+The documents of a corpus are tagged by a pool of worker processes and written, with their entities,
+to JSONL shards of a fixed number of documents. A checkpoint recording the shards written and where
+they stop in the corpus is saved after each shard, so an interrupted run resumes from the last
+complete shard. Throughput and an estimated time of completion are logged while it runs.
+
+Run from the src directory, e.g.:
+    python -m NER.corpus_annotator asthma ../data/asthma/annotated --processes 8
+'''
+import itertools
+import json
+import logging
+import os
+import time
+
+from .intervals import remove_nested
+
+CHECKPOINT_FILE = 'checkpoint.json'
+# fields of the tags written in the shards
+ENTITY_FIELDS = ('start', 'end', 'match', 'category', 'reference_db', 'reference', 'label')
+
+
+def _iter_corpus(corpusfile, start):
+    '''
+    yields (document, byte offset of the end of its line) for each document after the byte offset start
+    '''
+    with open(corpusfile, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            offset += len(line)
+            if line.strip():
+                yield json.loads(line.decode('utf-8')), offset
+
+
+def _write_json(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class _Progress(object):
+    '''logs the throughput and the estimated time of completion every interval seconds'''
+
+    def __init__(self, corpusfile, start_offset, interval):
+        self.corpusfile = corpusfile
+        self.total_bytes = os.path.getsize(corpusfile)
+        self.start_offset = start_offset
+        self.interval = interval
+        self.start_time = self.last_report = time.time()
+        self.documents = 0
+        self.tags = 0
+        self.offset = start_offset
+
+    def update(self, tags, offset):
+        '''
+        :param tags: number of tags of a document just annotated
+        :param offset: byte offset of the end of the document in the corpus
+        '''
+        self.documents += 1
+        self.tags += tags
+        self.offset = offset
+        if time.time() - self.last_report >= self.interval:
+            self.report()
+
+    def report(self):
+        self.last_report = now = time.time()
+        elapsed = max(now - self.start_time, 1e-9)
+        # documents vary in length, the progress is measured in bytes of the corpus
+        bytes_per_second = (self.offset - self.start_offset) / elapsed
+        if bytes_per_second:
+            eta = time.strftime('%H:%M:%S', time.gmtime((self.total_bytes - self.offset) / bytes_per_second))
+        else:
+            eta = 'unknown'
+        logging.info('%s: %.1f%% done, %d documents (%.1f docs/s, %.1f tags/s), ETA %s',
+                     os.path.basename(self.corpusfile), 100.0 * self.offset / max(self.total_bytes, 1),
+                     self.documents, self.documents / elapsed, self.tags / elapsed, eta)
+
+
+class _Shard(object):
+    '''shard being written, under a temporary name until it is complete'''
+
+    def __init__(self, output_dir, name):
+        self.name = name
+        self.path = os.path.join(output_dir, name)
+        self.file = open(self.path + '.tmp', 'w')
+        self.documents = 0
+        self.corpus_offset = None
+
+    def write(self, doc, offset):
+        self.file.write(json.dumps(doc) + '\n')
+        self.documents += 1
+        self.corpus_offset = offset
+
+    def commit(self, checkpoint, checkpoint_path):
+        '''
+        renames the complete shard and records it in the checkpoint
+        '''
+        self.file.close()
+        os.replace(self.path + '.tmp', self.path)
+        checkpoint['shards'].append(self.name)
+        checkpoint['documents'] += self.documents
+        checkpoint['corpus_offset'] = self.corpus_offset
+        _write_json(checkpoint_path, checkpoint)
+
+
+def annotate_corpus(corpusfile, output_dir, tagger=None, categories=None, nested=False, shard_size=10000,
+                    field='raw', processes=None, chunksize=16, progress_interval=10.0):
+    '''
+    tags every document of a JSON corpus and writes the documents, with an 'entities' field listing their
+    tags, to output_dir/shard-00000.jsonl, output_dir/shard-00001.jsonl... Resumes the previous run writing
+    to output_dir if it was interrupted
+    :param corpusfile: JSON corpus, one document per line
+    :param output_dir: directory of the shards and of the checkpoint, created if needed
+    :param tagger: BioEntityTagger to use, built if not given
+    :param categories: categories of the entities to keep, all of them if None
+    :param nested: keep the tags nested in longer tags of other categories
+    :param shard_size: number of documents per shard
+    :param field: field of the documents holding the text to tag
+    :param processes: number of tagging processes, see BioEntityTagger.iter_tag_many
+    :param chunksize: number of documents sent to a tagging process at once
+    :param progress_interval: seconds between two progress reports
+    :return: list of the paths of the shards
+    '''
+    if tagger is None:
+        from .BioentityTagger import BioEntityTagger
+        tagger = BioEntityTagger()
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+    settings = {'corpus': os.path.abspath(corpusfile),
+                'tagger_fingerprint': tagger.fingerprint(),
+                'categories': sorted(categories) if categories is not None else None,
+                'nested': nested,
+                'shard_size': shard_size,
+                'field': field}
+    checkpoint = dict(settings, shards=[], documents=0, corpus_offset=0)
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            previous = json.load(f)
+        if any(previous.get(name) != value for name, value in settings.items()):
+            raise ValueError('%s holds the annotations of another corpus or of other settings' % output_dir)
+        checkpoint = previous
+        logging.info('resuming after %d documents in %d shards', checkpoint['documents'], len(checkpoint['shards']))
+    if checkpoint['corpus_offset'] >= os.path.getsize(corpusfile):
+        return [os.path.join(output_dir, shard) for shard in checkpoint['shards']]
+
+    docs, docs_to_tag = itertools.tee(_iter_corpus(corpusfile, checkpoint['corpus_offset']))
+    texts = (doc[field] for doc, offset in docs_to_tag)
+    tagged = zip(docs, tagger.iter_tag_many(texts, processes=processes, chunksize=chunksize, categories=categories))
+    progress = _Progress(corpusfile, checkpoint['corpus_offset'], progress_interval)
+    shard = None
+    try:
+        for (doc, offset), tags in tagged:
+            if shard is None:
+                shard = _Shard(output_dir, 'shard-%05d.jsonl' % len(checkpoint['shards']))
+            if not nested:
+                tags = remove_nested(tags)
+            doc['entities'] = [{name: tag[name] for name in ENTITY_FIELDS} for tag in tags]
+            shard.write(doc, offset)
+            progress.update(len(tags), offset)
+            if shard.documents == shard_size:
+                shard.commit(checkpoint, checkpoint_path)
+                shard = None
+        if shard is not None:
+            shard.commit(checkpoint, checkpoint_path)
+            shard = None
+    finally:
+        # an incomplete shard is written again when the run is resumed
+        if shard is not None:
+            shard.file.close()
+    if progress.documents:
+        progress.report()
+    return [os.path.join(output_dir, shard) for shard in checkpoint['shards']]
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys; sys.path += ['../']
+    from constants import NAME_TO_DATASET
+
+    parser = argparse.ArgumentParser(description='writes the documents of a JSON corpus with their entities to JSONL shards')
+    parser.add_argument('corpus', help='name of a corpus of NAME_TO_DATASET or path of a JSON corpus')
+    parser.add_argument('output_dir', help='directory of the shards, an interrupted run writing there is resumed')
+    parser.add_argument('--categories', nargs='+', help='categories of the entities to keep')
+    parser.add_argument('--nested', action='store_true', help='keep the tags nested in longer tags of other categories')
+    parser.add_argument('--shard-size', type=int, default=10000, help='number of documents per shard')
+    parser.add_argument('--processes', type=int, help='number of tagging processes')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    shards = annotate_corpus(NAME_TO_DATASET.get(args.corpus.lower(), args.corpus), args.output_dir,
+                             categories=args.categories, nested=args.nested, shard_size=args.shard_size,
+                             processes=args.processes)
+    print('\n'.join(shards))
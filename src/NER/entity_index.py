@@ -0,0 +1,318 @@
+'''
+On-disk inverted index from entity ids to the documents of a JSON corpus mentioning them.
+
+A corpus is tagged once with BioEntityTagger and, for each entity id (the 'reference' of the tags,
+e.g. an Open Targets or MeSH id), the sorted ids of the documents mentioning it are written along
+with the number of mentions in each document and, optionally, their offsets. Document ids are the
+positions of the documents in the corpus file. The postings of all the entities are stored end to end
+in flat .npy arrays, which are memory-mapped when the index is opened, so queries only read the
+postings they need:
+
+    entities.json           [reference, category, reference_db] of each entity, sorted by reference
+    postings_offsets.npy    first posting of each entity, plus the number of postings (int64)
+    postings_docs.npy       document id of each posting (uint32)
+    postings_counts.npy     number of mentions of the entity in the document (uint32)
+    mentions_offsets.npy    first mention of each posting, plus the number of mentions (int64, optional)
+    mentions.npy            (start, end) offsets of each mention in the text of the document (uint32, optional)
+    meta.json               corpus, tagger fingerprint and how much of the corpus was indexed
+
+Corpora only grow by appending documents, so when the corpus file still starts with the part that was
+indexed and the tagger is unchanged, updating the index only tags the new documents: their ids are
+all greater than the indexed ones and their postings are appended to those of each entity.
+'''
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections import defaultdict
+
+import numpy as np
+
+INDEX_FORMAT_VERSION = 1
+
+
+def _prefix_digest(corpusfile, length):
+    '''
+    :return: hex digest of the first length bytes of corpusfile
+    '''
+    h = hashlib.sha1()
+    with open(corpusfile, 'rb') as f:
+        while length > 0:
+            block = f.read(min(length, 1 << 20))
+            if not block:
+                break
+            h.update(block)
+            length -= len(block)
+    return h.hexdigest()
+
+
+def _iter_documents(corpusfile, start, field):
+    '''
+    yields the text of each document of corpusfile found after the byte offset start
+    '''
+    with open(corpusfile, 'rb') as f:
+        f.seek(start)
+        for line in f:
+            if line.strip():
+                yield json.loads(line.decode('utf-8'))[field]
+
+
+def _load_array(path):
+    try:
+        return np.load(path, mmap_mode='r')
+    except ValueError:
+        # empty arrays cannot be memory-mapped
+        return np.load(path)
+
+
+class EntityIndex(object):
+    def __init__(self, index_dir):
+        '''
+        :param index_dir: directory of an index written by build_entity_index
+        '''
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, 'meta.json')) as f:
+            self.meta = json.load(f)
+        with open(os.path.join(index_dir, 'entities.json')) as f:
+            self.entities = json.load(f)
+        self.entity_ids = {entity[0]: i for i, entity in enumerate(self.entities)}
+        self.postings_offsets = _load_array(os.path.join(index_dir, 'postings_offsets.npy'))
+        self.postings_docs = _load_array(os.path.join(index_dir, 'postings_docs.npy'))
+        self.postings_counts = _load_array(os.path.join(index_dir, 'postings_counts.npy'))
+        if self.meta['with_offsets']:
+            self.mentions_offsets = _load_array(os.path.join(index_dir, 'mentions_offsets.npy'))
+            self.mentions_array = _load_array(os.path.join(index_dir, 'mentions.npy'))
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.entity_ids
+
+    def _postings(self, entity_id):
+        i = self.entity_ids.get(entity_id)
+        if i is None:
+            return 0, 0
+        return int(self.postings_offsets[i]), int(self.postings_offsets[i + 1])
+
+    def documents(self, entity_id):
+        '''
+        :param entity_id: reference of an entity, e.g. 'D001249'
+        :return: sorted array of the ids of the documents mentioning the entity
+        '''
+        start, end = self._postings(entity_id)
+        return self.postings_docs[start:end]
+
+    def counts(self, entity_id):
+        '''
+        :return: array of the number of mentions of the entity in each of its documents
+        '''
+        start, end = self._postings(entity_id)
+        return self.postings_counts[start:end]
+
+    def document_frequency(self, entity_id):
+        '''
+        :return: number of documents mentioning the entity
+        '''
+        start, end = self._postings(entity_id)
+        return end - start
+
+    def mentions(self, entity_id, doc_id):
+        '''
+        :return: array of the (start, end) offsets of the mentions of the entity in a document
+        '''
+        if not self.meta['with_offsets']:
+            raise ValueError('the index was built without the offsets of the mentions')
+        start, end = self._postings(entity_id)
+        docs = self.postings_docs[start:end]
+        posting = start + int(np.searchsorted(docs, doc_id))
+        if posting == end or self.postings_docs[posting] != doc_id:
+            return np.empty((0, 2), dtype=np.uint32)
+        return self.mentions_array[self.mentions_offsets[posting]:self.mentions_offsets[posting + 1]]
+
+    def _documents(self, term):
+        return self.documents(term) if isinstance(term, str) else term
+
+    def all_of(self, *terms):
+        '''
+        :param terms: entity ids, or arrays of document ids such as the results of other queries
+        :return: sorted array of the documents matching all the terms
+        '''
+        documents = sorted((self._documents(term) for term in terms), key=len)
+        if not documents:
+            return np.empty(0, dtype=np.uint32)
+        result = np.asarray(documents[0])
+        for other in documents[1:]:
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def any_of(self, *terms):
+        '''
+        :param terms: entity ids, or arrays of document ids such as the results of other queries
+        :return: sorted array of the documents matching at least one of the terms
+        '''
+        documents = [self._documents(term) for term in terms]
+        if not documents:
+            return np.empty(0, dtype=np.uint32)
+        return np.unique(np.concatenate(documents))
+
+    def cooccurrences(self, *entity_ids):
+        '''
+        :return: number of documents mentioning all the entities
+        '''
+        return len(self.all_of(*entity_ids))
+
+
+def _tag_postings(texts, tagger, first_doc_id, with_offsets, processes, chunksize):
+    '''
+    tags texts and collects the postings of their entities
+    :return: (dict reference -> (category, reference_db), dict reference -> list of postings
+             (doc id, count, mentions), number of documents)
+    '''
+    entities = {}
+    postings = defaultdict(list)
+    documents = 0
+    for tags in tagger.iter_tag_many(texts, processes=processes, chunksize=chunksize):
+        mentions = defaultdict(set)
+        for tag in tags:
+            entities.setdefault(tag['reference'], (tag['category'], tag['reference_db']))
+            mentions[tag['reference']].add((tag['start'], tag['end']))
+        for reference, spans in mentions.items():
+            postings[reference].append((first_doc_id + documents,
+                                        len(spans),
+                                        sorted(spans) if with_offsets else None))
+        documents += 1
+    return entities, postings, documents
+
+
+def _write_index(index_dir, meta, entities, previous, postings):
+    '''
+    writes the index in a new directory, then moves it in place of index_dir
+    :param entities: dict reference -> (category, reference_db) of the entities of the new postings
+    :param previous: EntityIndex whose postings come first, or None
+    :param postings: dict reference -> list of the new postings, see _tag_postings
+    '''
+    with_offsets = meta['with_offsets']
+    all_entities = dict(entities)
+    if previous is not None:
+        all_entities.update((reference, (category, reference_db))
+                            for reference, category, reference_db in previous.entities)
+    references = sorted(all_entities)
+    offsets = [0]
+    docs_parts = []
+    counts_parts = []
+    mentions_parts = []
+    for reference in references:
+        size = 0
+        if previous is not None and reference in previous:
+            start, end = previous._postings(reference)
+            docs_parts.append(np.asarray(previous.postings_docs[start:end]))
+            counts_parts.append(np.asarray(previous.postings_counts[start:end]))
+            if with_offsets:
+                mentions_parts.append(np.asarray(previous.mentions_array[previous.mentions_offsets[start]:
+                                                                         previous.mentions_offsets[end]]))
+            size += end - start
+        new_postings = postings.get(reference, ())
+        if new_postings:
+            docs_parts.append(np.array([p[0] for p in new_postings], dtype=np.uint32))
+            counts_parts.append(np.array([p[1] for p in new_postings], dtype=np.uint32))
+            if with_offsets:
+                mentions_parts.append(np.array([span for p in new_postings for span in p[2]],
+                                               dtype=np.uint32).reshape(-1, 2))
+            size += len(new_postings)
+        offsets.append(offsets[-1] + size)
+    postings_counts = np.concatenate(counts_parts) if counts_parts else np.empty(0, dtype=np.uint32)
+
+    tmp_dir = index_dir.rstrip('/') + '.tmp'
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+    with open(os.path.join(tmp_dir, 'entities.json'), 'w') as f:
+        json.dump([[reference] + list(all_entities[reference]) for reference in references], f)
+    np.save(os.path.join(tmp_dir, 'postings_offsets.npy'), np.array(offsets, dtype=np.int64))
+    np.save(os.path.join(tmp_dir, 'postings_docs.npy'),
+            np.concatenate(docs_parts) if docs_parts else np.empty(0, dtype=np.uint32))
+    np.save(os.path.join(tmp_dir, 'postings_counts.npy'), postings_counts)
+    if with_offsets:
+        # the mentions of each posting are stored in the order of the postings, count of them per posting
+        mentions_offsets = np.zeros(len(postings_counts) + 1, dtype=np.int64)
+        np.cumsum(postings_counts, out=mentions_offsets[1:])
+        np.save(os.path.join(tmp_dir, 'mentions_offsets.npy'), mentions_offsets)
+        np.save(os.path.join(tmp_dir, 'mentions.npy'),
+                np.concatenate(mentions_parts) if mentions_parts else np.empty((0, 2), dtype=np.uint32))
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    old_dir = index_dir.rstrip('/') + '.old'
+    if os.path.exists(index_dir):
+        os.rename(index_dir, old_dir)
+    os.rename(tmp_dir, index_dir)
+    if os.path.exists(old_dir):
+        shutil.rmtree(old_dir)
+
+
+def build_entity_index(corpusfile, index_dir, tagger=None, with_offsets=False, field='raw',
+                       processes=None, chunksize=16):
+    '''
+    indexes the documents of a corpus by the entities they mention, or updates the index of the corpus
+    with the documents appended to it since the index was built
+    :param corpusfile: JSON corpus, one document per line
+    :param index_dir: directory of the index, created if needed
+    :param tagger: BioEntityTagger to tag the documents with, built if not given
+    :param with_offsets: also store the offsets of every mention
+    :param field: field of the documents holding the text to tag
+    :param processes: number of tagging processes, see BioEntityTagger.iter_tag_many
+    :param chunksize: number of documents sent to a tagging process at once
+    :return: the EntityIndex
+    '''
+    if tagger is None:
+        from .BioentityTagger import BioEntityTagger
+        tagger = BioEntityTagger()
+    corpus_bytes = os.path.getsize(corpusfile)
+    meta = {'format_version': INDEX_FORMAT_VERSION,
+            'corpus': os.path.abspath(corpusfile),
+            'field': field,
+            'with_offsets': with_offsets,
+            'tagger_fingerprint': tagger.fingerprint(),
+            'corpus_bytes': corpus_bytes,
+            'corpus_digest': _prefix_digest(corpusfile, corpus_bytes)}
+
+    previous = None
+    if os.path.exists(os.path.join(index_dir, 'meta.json')):
+        previous = EntityIndex(index_dir)
+        old_meta = previous.meta
+        if any(old_meta.get(name) != meta[name]
+               for name in ('format_version', 'field', 'with_offsets', 'tagger_fingerprint')) or \
+                old_meta['corpus_bytes'] > corpus_bytes or \
+                _prefix_digest(corpusfile, old_meta['corpus_bytes']) != old_meta['corpus_digest']:
+            logging.info('rebuilding the entity index %s from scratch', index_dir)
+            previous = None
+        elif old_meta['corpus_bytes'] == corpus_bytes:
+            return previous
+
+    start = previous.meta['corpus_bytes'] if previous is not None else 0
+    first_doc_id = previous.meta['documents'] if previous is not None else 0
+    entities, postings, documents = _tag_postings(_iter_documents(corpusfile, start, field), tagger,
+                                                  first_doc_id, with_offsets, processes, chunksize)
+    meta['documents'] = first_doc_id + documents
+    logging.info('indexed %d new documents of %s', documents, corpusfile)
+    _write_index(index_dir, meta, entities, previous, postings)
+    return EntityIndex(index_dir)
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys; sys.path += ['../']
+    from constants import NAME_TO_DATASET
+
+    parser = argparse.ArgumentParser(description='builds or updates the entity index of a JSON corpus')
+    parser.add_argument('corpus', help='name of a known corpus or path of a JSON corpus')
+    parser.add_argument('index_dir', help='directory of the index')
+    parser.add_argument('--offsets', action='store_true', help='store the offsets of the mentions')
+    parser.add_argument('--processes', type=int, help='number of tagging processes')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    index = build_entity_index(NAME_TO_DATASET.get(args.corpus, args.corpus), args.index_dir,
+                               with_offsets=args.offsets, processes=args.processes)
+    print('%d entities in %d documents' % (len(index), index.meta['documents']))
@@ -0,0 +1,103 @@
+'''
+Fuzzy verification of the partial (-TOKEN) matches of BioEntityTagger.
+
+A token hit is accepted when the text around it is close enough to the full dictionary entry,
+as measured by fuzzywuzzy's token_sort_ratio. token_sort_ratio normalizes and sorts the tokens of
+both strings before comparing them: the sorted form of the dictionary entries is computed once,
+when the automaton is built, and scores are memoized on the normalized pair since the same
+(entity, surface string) pairs come up again and again across a corpus.
+'''
+from functools import lru_cache
+
+from fuzzywuzzy import fuzz, utils
+
+
+def sorted_token_form(s):
+    '''
+    normalization applied by fuzz.token_sort_ratio to each of its arguments
+    :param s: string to normalize
+    :return: the lowercased alphanumeric tokens of s, sorted and joined by spaces
+    '''
+    return ' '.join(sorted(utils.full_process(s, force_ascii=True).split())).strip()
+
+
+class FuzzyVerifier(object):
+    def __init__(self, threshold=90, cache_size=1 << 16):
+        '''
+        :param threshold: a candidate is accepted if its score is strictly above threshold
+        :param cache_size: number of normalized (entry, surface) scores and surface forms to memoize
+        '''
+        self.threshold = threshold
+        self.cache_size = cache_size
+        # original_value -> sorted token form
+        self.sorted_forms = {}
+        # (original_value, token) -> length of the text following the first occurrence of token in original_value
+        self.suffix_lengths = {}
+        self._init_caches()
+
+    def _init_caches(self):
+        self._surface_form = lru_cache(maxsize=self.cache_size)(sorted_token_form)
+        self._ratio = lru_cache(maxsize=self.cache_size)(fuzz.ratio)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_surface_form']
+        del state['_ratio']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
+
+    def add_entry(self, original_value, token):
+        '''
+        precomputes what verifying the hits of token, a token of the dictionary entry original_value, requires
+        '''
+        if original_value not in self.sorted_forms:
+            self.sorted_forms[original_value] = sorted_token_form(original_value)
+        if (original_value, token) not in self.suffix_lengths:
+            # payloads merged across vocabularies keep the original value of their first entry,
+            # which may only contain the token with a different case, or not at all
+            parts = original_value.lower().split(token.lower())
+            self.suffix_lengths[(original_value, token)] = len(parts[1]) if len(parts) > 1 else 0
+
+    def candidate_end(self, original_value, token, end):
+        '''
+        :param original_value: dictionary entry the token belongs to
+        :param token: token matched in the text
+        :param end: end offset of the token in the text
+        :return: end offset of the surface string to compare with the dictionary entry
+        '''
+        try:
+            return end + self.suffix_lengths[(original_value, token)]
+        except KeyError:
+            self.add_entry(original_value, token)
+            return end + self.suffix_lengths[(original_value, token)]
+
+    def score(self, original_value, surface):
+        '''
+        :return: fuzz.token_sort_ratio(original_value, surface)
+        '''
+        try:
+            entry_form = self.sorted_forms[original_value]
+        except KeyError:
+            entry_form = self.sorted_forms[original_value] = sorted_token_form(original_value)
+        return self._ratio(entry_form, self._surface_form(surface))
+
+    def verify_many(self, candidates):
+        '''
+        verifies all the candidates of one text at once, scoring each distinct pair only once
+        :param candidates: list of (original_value, surface) pairs
+        :return: list of booleans, True for the accepted candidates
+        '''
+        scores = {}
+        for pair in candidates:
+            if pair not in scores:
+                scores[pair] = self.score(*pair)
+        return [scores[pair] > self.threshold for pair in candidates]
+
+    def cache_info(self):
+        '''
+        :return: hit/miss statistics of the score cache
+        '''
+        return self._ratio.cache_info()
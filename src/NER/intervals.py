@@ -0,0 +1,55 @@
+'''
+Interval helpers used to post-process tags.
+'''
+from operator import itemgetter
+
+
+def remove_nested(items, start=itemgetter('start'), end=itemgetter('end')):
+    '''
+    keeps the longest matches: drops every item whose span is contained in the span of a strictly larger item.
+    Items sharing exactly the same span are all kept.
+    Runs in O(n log n) with a single sweep over the items sorted by (start, -end).
+    :param items: iterable of tags (dicts by default)
+    :param start: function returning the start offset of an item
+    :param end: function returning the end offset of an item
+    :return: list of the non nested items, sorted by (start, -end)
+    '''
+    sorted_items = sorted(items, key=lambda x: (start(x), -end(x)))
+    kept = []
+    max_end = -1
+    i = 0
+    n = len(sorted_items)
+    while i < n:
+        span_start, span_end = start(sorted_items[i]), end(sorted_items[i])
+        # items with an identical span are contiguous once sorted
+        j = i + 1
+        while j < n and start(sorted_items[j]) == span_start and end(sorted_items[j]) == span_end:
+            j += 1
+        # every item seen before starts at or before span_start, and those starting at span_start end after span_end
+        if max_end < span_end:
+            kept.extend(sorted_items[i:j])
+            max_end = span_end
+        i = j
+    return kept
+
+
+def remove_nested_by_group(items, group, start=itemgetter('start'), end=itemgetter('end')):
+    '''
+    applies remove_nested separately to each group of items
+    :param items: iterable of tags
+    :param group: function returning the group key of an item, e.g. its (category, reference_db)
+    :param start: function returning the start offset of an item
+    :param end: function returning the end offset of an item
+    :return: list of the non nested items, group after group in order of first appearance
+    '''
+    grouped = {}
+    for item in items:
+        key = group(item)
+        if key in grouped:
+            grouped[key].append(item)
+        else:
+            grouped[key] = [item]
+    kept = []
+    for items_in_group in grouped.values():
+        kept.extend(remove_nested(items_in_group, start, end))
+    return kept
@@ -0,0 +1,79 @@
+'''
+Renders tagged text as HTML markup in a single pass.
+
+Tags are sorted once and the text is written segment by segment into a list. Tags that overlap
+without being nested are split where they cross: the inner elements are closed and reopened
+around the end of the outer one, so the markup is always well formed.
+'''
+import heapq
+
+
+def render_tags(text, tags, open_markup, close_markup):
+    '''
+    :param text: tagged text
+    :param tags: tags as dicts with 'start' and 'end' offsets in text
+    :param open_markup: function (tag, i) -> opening markup of the i-th tag in (start, -end) order
+    :param close_markup: function (tag, i) -> closing markup of the i-th tag
+    :return: the text with the markup of the tags inserted
+    '''
+    ordered = sorted((tag for tag in tags if 0 <= tag['start'] <= tag['end'] <= len(text)),
+                     key=lambda x: (x['start'], -x['end']))
+    out = []
+    position = 0
+    # open elements, outermost first, as (end, i, tag), and a heap of their ends
+    stack = []
+    ends = []
+
+    def close_until(limit):
+        '''closes every open element ending at or before limit'''
+        nonlocal position, stack
+        while ends and ends[0][0] <= limit:
+            end = ends[0][0]
+            out.append(text[position:end])
+            position = end
+            first_closed = min(k for k, element in enumerate(stack) if element[0] <= end)
+            closed = stack[first_closed:]
+            for element_end, i, tag in reversed(closed):
+                out.append(close_markup(tag, i))
+            reopened = [element for element in closed if element[0] > end]
+            for element_end, i, tag in reopened:
+                out.append(open_markup(tag, i))
+            stack = stack[:first_closed] + reopened
+            while ends and ends[0][0] <= end:
+                heapq.heappop(ends)
+
+    for i, tag in enumerate(ordered):
+        close_until(tag['start'])
+        out.append(text[position:tag['start']])
+        position = tag['start']
+        out.append(open_markup(tag, i))
+        stack.append((tag['end'], i, tag))
+        heapq.heappush(ends, (tag['end'], i))
+    close_until(len(text))
+    out.append(text[position:])
+    return ''.join(out)
+
+
+def highlight_tags(text, tags):
+    '''
+    :return: the text with each tag in a <mark> element titled with its category
+    '''
+    return render_tags(text, tags,
+                       lambda tag, i: '<mark title="' + tag['category'] + '">',
+                       lambda tag, i: '</mark>')
+
+
+def _entity_open_markup(tag, i):
+    if isinstance(tag['reference'], (list, tuple)):
+        tag_reference = '|'.join(tag['reference'])
+    else:
+        tag_reference = tag['reference']
+    return '<mark-%s data-entity="%s" reference-db="%s"  reference="%s">' % (
+        str(i), tag['category'], tag['reference_db'], tag_reference)
+
+
+def entity_markup(text, tags):
+    '''
+    :return: the text with each tag in a numbered <mark-i> element carrying its category and references
+    '''
+    return render_tags(text, tags, _entity_open_markup, lambda tag, i: '</mark-%s>' % str(i))
@@ -0,0 +1,193 @@
+'''
+Interned side tables for the payloads of the tagger automaton.
+
+The automaton only stores an integer per key (ahocorasick.STORE_INTS), the handle of an entry.
+An entry knows the length of its key and the concepts it refers to. A concept is one dictionary
+element of one vocabulary: its source (a (category, reference db) pair from a small enum), its
+reference id, its original value and its preferred name, the strings being interned in a single
+pool. Strings are only looked up when a tag is emitted.
+
+Each category gets a bit, and each entry keeps the mask of the categories of its concepts, so that
+tagging restricted to some categories can skip the other hits before doing any work on them.
+
+A concept also remembers whether the key of its entry is the element itself or a generated variant of
+it, and then the name of the generator (see NER.variants), as an index into a small table of names.
+'''
+from array import array
+
+
+class PayloadTable(object):
+    def __init__(self):
+        # string pool
+        self.strings = []
+        self._string_ids = {}
+        # source enum: (category, reference_db, is_token) where category has no -TOKEN suffix
+        self.sources = []
+        self._source_ids = {}
+        # category -> bit, and the bit of the category of each source
+        self.category_bits = {}
+        self.source_mask = []
+        # concept table, one row per (source, element)
+        self.concept_source = array('H')
+        self.concept_reference = array('I')
+        self.concept_original_value = array('I')
+        self.concept_pref_name = array('I')
+        self.concept_variant = array('B')
+        # name of the variant generator of each variant index, None (0) standing for the elements themselves
+        self.variant_names = [None]
+        # extra reference ids of the concepts having more than one, concept -> tuple of string ids
+        self.concept_extra_references = {}
+        # entry table: key length and concepts, as a list of concepts per entry while building,
+        # then as offsets into one flat array once frozen
+        self.entry_length = array('I')
+        self.entry_category_mask = array('Q')
+        self._entry_concepts = []
+        self.entry_concepts_offsets = None
+        self.entry_concepts = None
+
+    def intern(self, s):
+        '''
+        :return: the id of s in the string pool
+        '''
+        string_id = self._string_ids.get(s)
+        if string_id is None:
+            string_id = self._string_ids[s] = len(self.strings)
+            self.strings.append(s)
+        return string_id
+
+    def source_id(self, category, reference_db):
+        '''
+        :param category: category of a vocabulary, with a -TOKEN suffix for partial match entries
+        :param reference_db: reference db of the vocabulary
+        :return: id of the (category, reference_db) pair in the source enum
+        '''
+        key = (category, reference_db)
+        source_id = self._source_ids.get(key)
+        if source_id is None:
+            source_id = self._source_ids[key] = len(self.sources)
+            is_token = category.endswith('-TOKEN')
+            category = category[:-len('-TOKEN')] if is_token else category
+            self.sources.append((category, reference_db, is_token))
+            if category not in self.category_bits:
+                self.category_bits[category] = 1 << len(self.category_bits)
+            self.source_mask.append(self.category_bits[category])
+        return source_id
+
+    def variant_id(self, variant):
+        '''
+        :param variant: name of a variant generator, None for the elements themselves
+        :return: index of the variant in variant_names
+        '''
+        try:
+            return self.variant_names.index(variant)
+        except ValueError:
+            self.variant_names.append(variant)
+            return len(self.variant_names) - 1
+
+    def add_concept(self, category, reference_db, ids, original_value, pref_name, variant=None):
+        '''
+        :param variant: name of the generator of the key of the concept, None if the key is the element itself
+        :return: id of the new concept
+        '''
+        concept_id = len(self.concept_source)
+        self.concept_source.append(self.source_id(category, reference_db))
+        ids = list(ids)
+        self.concept_reference.append(self.intern(ids[0]) if ids else self.intern(''))
+        if len(ids) > 1:
+            self.concept_extra_references[concept_id] = tuple(self.intern(i) for i in ids[1:])
+        self.concept_original_value.append(self.intern(original_value))
+        self.concept_pref_name.append(self.intern(pref_name))
+        self.concept_variant.append(self.variant_id(variant))
+        return concept_id
+
+    def add_entry(self, key_length, concept_id):
+        '''
+        :return: id of a new entry, to be stored as the value of its key in the automaton
+        '''
+        self.entry_length.append(key_length)
+        self.entry_category_mask.append(self.source_mask[self.concept_source[concept_id]])
+        self._entry_concepts.append([concept_id])
+        return len(self._entry_concepts) - 1
+
+    def merge_concept(self, entry_id, category, reference_db, ids, original_value, pref_name, variant=None):
+        '''
+        adds a concept to an existing entry, unless the entry already has a concept from the same
+        category and reference db. An element whose key is the element itself replaces the concept of
+        the same category and reference db whose key is only a variant
+        :return: True if the concept was added
+        '''
+        source_id = self.source_id(category, reference_db)
+        concepts = self._entry_concepts[entry_id]
+        for concept_id in concepts:
+            if self.concept_source[concept_id] == source_id:
+                if variant is None and self.concept_variant[concept_id]:
+                    ids = list(ids)
+                    self.concept_reference[concept_id] = self.intern(ids[0]) if ids else self.intern('')
+                    self.concept_extra_references.pop(concept_id, None)
+                    if len(ids) > 1:
+                        self.concept_extra_references[concept_id] = tuple(self.intern(i) for i in ids[1:])
+                    self.concept_original_value[concept_id] = self.intern(original_value)
+                    self.concept_pref_name[concept_id] = self.intern(pref_name)
+                    self.concept_variant[concept_id] = 0
+                    return True
+                return False
+        concepts.append(self.add_concept(category, reference_db, ids, original_value, pref_name, variant))
+        self.entry_category_mask[entry_id] |= self.source_mask[source_id]
+        return True
+
+    def freeze(self):
+        '''
+        packs the per entry concept lists in flat arrays and drops the build time indices
+        '''
+        self.entry_concepts_offsets = array('I', [0])
+        self.entry_concepts = array('I')
+        for concepts in self._entry_concepts:
+            self.entry_concepts.extend(concepts)
+            self.entry_concepts_offsets.append(len(self.entry_concepts))
+        self._entry_concepts = None
+        self._string_ids = None
+
+    def category_mask(self, categories):
+        '''
+        :param categories: iterable of categories, e.g. ['DISEASE', 'GENE']
+        :return: mask of the bits of the categories, the unknown ones are ignored
+        '''
+        mask = 0
+        for category in categories:
+            mask |= self.category_bits.get(category, 0)
+        return mask
+
+    def concepts(self, entry_id):
+        '''
+        :return: the ids of the concepts of an entry
+        '''
+        if self._entry_concepts is not None:
+            return self._entry_concepts[entry_id]
+        return self.entry_concepts[self.entry_concepts_offsets[entry_id]:self.entry_concepts_offsets[entry_id + 1]]
+
+    def references(self, concept_id):
+        '''
+        :return: all the reference ids of a concept
+        '''
+        strings = self.strings
+        return [strings[self.concept_reference[concept_id]]] + \
+               [strings[i] for i in self.concept_extra_references.get(concept_id, ())]
+
+    def variant(self, concept_id):
+        '''
+        :return: name of the generator of the key of a concept, None if the key is the element itself
+        '''
+        return self.variant_names[self.concept_variant[concept_id]]
+
+    def resolve(self, concept_id):
+        '''
+        :return: (category, reference_db, is_token, reference, original_value, pref_name) of a concept
+        '''
+        strings = self.strings
+        category, reference_db, is_token = self.sources[self.concept_source[concept_id]]
+        return (category,
+                reference_db,
+                is_token,
+                strings[self.concept_reference[concept_id]],
+                strings[self.concept_original_value[concept_id]],
+                strings[self.concept_pref_name[concept_id]])
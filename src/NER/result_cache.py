@@ -0,0 +1,84 @@
+'''
+Cache of the tags of whole texts, for the web interface.
+
+The same texts are submitted again and again (the default example text, the same abstracts pasted
+again, only the category checkboxes toggled), so the full, unfiltered tag list of each text is
+kept in an LRU cache keyed by a hash of the text and the version of the tagger automaton. Filtering
+by category and rendering are left to the caller, on the cached tags.
+'''
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TagResultCache(object):
+    def __init__(self, tagger, max_entries=1024, max_characters=16 << 20, ttl=3600.0):
+        '''
+        :param tagger: BioEntityTagger used on cache misses
+        :param max_entries: maximum number of texts whose tags are kept
+        :param max_characters: maximum total length of the texts whose tags are kept
+        :param ttl: seconds after which cached tags are discarded
+        '''
+        self.tagger = tagger
+        self.max_entries = max_entries
+        self.max_characters = max_characters
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._characters = 0
+        self._lock = threading.Lock()
+
+    def _key(self, text):
+        return hashlib.sha1(text.encode('utf-8')).hexdigest(), self.tagger.version
+
+    def _evict(self, key):
+        tags, length, expires = self._entries.pop(key)
+        self._characters -= length
+        self.evictions += 1
+
+    def get(self, text):
+        '''
+        :param text: text to tag
+        :return: all the tags of text, as returned by BioEntityTagger.tag. The list is shared with
+                 the cache and must not be modified
+        '''
+        key = self._key(text)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[2] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._evict(key)
+            self.misses += 1
+        tags = self.tagger.tag(text)
+        if len(text) <= self.max_characters:
+            with self._lock:
+                if key in self._entries:
+                    self._evict(key)
+                self._entries[key] = (tags, len(text), now + self.ttl)
+                self._characters += len(text)
+                while len(self._entries) > self.max_entries or self._characters > self.max_characters:
+                    self._evict(next(iter(self._entries)))
+        return tags
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._characters = 0
+
+    def info(self):
+        '''
+        :return: dict with the hits, misses, evictions, number of entries and total text length of the cache
+        '''
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'entries': len(self._entries),
+                    'characters': self._characters}
@@ -0,0 +1,100 @@
+'''
+Hash-based stopword lookups shared by the tagger and any code filtering tokens.
+'''
+import hashlib
+
+from . import BioStopWords
+
+
+class StopWordIndex(object):
+    '''
+    Set-backed stopword list with O(1) lookups. Keeps both the words as given
+    (case-sensitive lookups) and a pre-lowercased copy (case-insensitive lookups),
+    plus optional extra stopwords that only apply to some categories.
+    '''
+
+    def __init__(self, stopwords=(), category_stopwords=None):
+        '''
+        :param stopwords: iterable of stopwords applying to every category
+        :param category_stopwords: optional dict category -> iterable of extra stopwords for that category
+        '''
+        self.words = frozenset(stopwords)
+        self.lowered_words = frozenset(w.lower() for w in self.words)
+        self.category_words = {}
+        self.category_lowered_words = {}
+        for category, words in (category_stopwords or {}).items():
+            self.add_category_stopwords(category, words)
+        self._fingerprint = None
+
+    def add_category_stopwords(self, category, words):
+        '''
+        :param category: category the stopwords apply to, e.g. 'GENE'
+        :param words: iterable of extra stopwords
+        '''
+        words = self.category_words.get(category, frozenset()) | frozenset(words)
+        self.category_words[category] = words
+        self.category_lowered_words[category] = frozenset(w.lower() for w in words)
+        self._fingerprint = None
+
+    def is_stopword(self, word, category=None, ignorecase=False):
+        '''
+        :param word: token to look up
+        :param category: if given, the extra stopwords of this category are also checked
+        :param ignorecase: compare against the lowercased stopwords
+        :return: True if word is a stopword
+        '''
+        if ignorecase:
+            word = word.lower()
+            if word in self.lowered_words:
+                return True
+            return category is not None and word in self.category_lowered_words.get(category, ())
+        if word in self.words:
+            return True
+        return category is not None and word in self.category_words.get(category, ())
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def fingerprint(self):
+        '''
+        :return: hex digest of the content of the index, stable across processes
+        '''
+        if self._fingerprint is None:
+            h = hashlib.sha1('\n'.join(sorted(self.words)).encode('utf-8'))
+            for category in sorted(self.category_words):
+                h.update(('\n[%s]\n' % category).encode('utf-8'))
+                h.update('\n'.join(sorted(self.category_words[category])).encode('utf-8'))
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    @classmethod
+    def from_stopwords(cls, stopwords=None):
+        '''
+        :param stopwords: a StopWordIndex (returned as is), any iterable of words,
+                          or None for the shared default domain index
+        :return: a StopWordIndex
+        '''
+        if stopwords is None:
+            return default_stopword_index()
+        if isinstance(stopwords, cls):
+            return stopwords
+        return cls(stopwords)
+
+
+_default_index = None
+
+
+def default_stopword_index():
+    '''
+    :return: the StopWordIndex over DOMAIN_STOP_WORDS, built once per process
+    '''
+    global _default_index
+    if _default_index is None:
+        _default_index = StopWordIndex(BioStopWords.DOMAIN_STOP_WORDS)
+    return _default_index
@@ -0,0 +1,87 @@
+'''
+Sorted index over the tags of one document.
+
+The tags are sorted once by (start, end), with their starts kept in a separate list, so that range
+queries are two bisections plus the tags returned instead of a scan of the whole list. Sentence ids
+are attached to the tags from the sorted array of the sentence start offsets of the document, which
+turns per sentence entity extraction (e.g. for relation mining) into one pass over the tags.
+'''
+import re
+from bisect import bisect_left, bisect_right
+
+# end of a sentence: terminal punctuation (and closing quotes or brackets) followed by blanks and what
+# looks like the beginning of the next sentence, or a blank line
+_sentence_end_regex = re.compile(r'[.!?]+["\')\]]*\s+(?=["(\[]?[A-Z0-9])|\n\s*\n')
+
+
+def sentence_starts(text):
+    '''
+    :param text: text to split in sentences
+    :return: sorted list of the start offsets of the sentences of text, the first one being 0
+    '''
+    return [0] + [m.end() for m in _sentence_end_regex.finditer(text) if m.end() < len(text)]
+
+
+class TagIndex(object):
+    def __init__(self, tags, sentence_offsets=None):
+        '''
+        :param tags: tags of one document as dicts with 'start' and 'end' offsets, in any order
+        :param sentence_offsets: sorted start offsets of the sentences of the document, see sentence_starts.
+                                 If given, the 'sentence' of each tag is set to the index of the sentence
+                                 it starts in
+        '''
+        self.tags = sorted(tags, key=lambda x: (x['start'], x['end']))
+        self.starts = [tag['start'] for tag in self.tags]
+        self.ends = [tag['end'] for tag in self.tags]
+        self.max_length = max((tag['end'] - tag['start'] for tag in self.tags), default=0)
+        self.sentence_offsets = sentence_offsets
+        self.sentence_bounds = None
+        if sentence_offsets is not None:
+            # first tag of each sentence, plus the number of tags
+            self.sentence_bounds = [bisect_left(self.starts, offset) for offset in sentence_offsets]
+            self.sentence_bounds.append(len(self.tags))
+            for sentence in range(len(sentence_offsets)):
+                for i in range(self.sentence_bounds[sentence], self.sentence_bounds[sentence + 1]):
+                    self.tags[i]['sentence'] = sentence
+
+    @classmethod
+    def for_text(cls, text, tags):
+        '''
+        :return: the TagIndex of the tags of text, with the sentence of each tag set
+        '''
+        return cls(tags, sentence_starts(text))
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __iter__(self):
+        return iter(self.tags)
+
+    def in_range(self, start, end):
+        '''
+        :return: the tags lying within [start, end], in (start, end) order
+        '''
+        return [tag for tag in self.tags[bisect_left(self.starts, start):bisect_right(self.starts, end)]
+                if tag['end'] <= end]
+
+    def overlapping(self, start, end):
+        '''
+        :return: the tags sharing at least one character with [start, end), in (start, end) order
+        '''
+        first = bisect_left(self.starts, start - self.max_length)
+        return [tag for tag in self.tags[first:bisect_left(self.starts, end)] if tag['end'] > start]
+
+    def in_sentence(self, sentence):
+        '''
+        :param sentence: index of a sentence in sentence_offsets
+        :return: the tags starting in the sentence, in (start, end) order
+        '''
+        if self.sentence_bounds is None:
+            raise ValueError('the TagIndex was built without sentence offsets')
+        return self.tags[self.sentence_bounds[sentence]:self.sentence_bounds[sentence + 1]]
+
+    def by_sentence(self):
+        '''
+        :return: list holding, for each sentence, the list of the tags starting in it
+        '''
+        return [self.in_sentence(sentence) for sentence in range(len(self.sentence_offsets or ()))]
@@ -0,0 +1,61 @@
+'''
+Match funnel counters of BioEntityTagger.
+
+When a tagger is created with collect_stats=True, every tagging call adds to a dict of counters
+following the hits through the tagging phases, from the raw automaton hits to the tags emitted, and
+the time spent in each phase. Without it, the tagging core does not even read the clock.
+'''
+import copy
+
+PHASES = ('preprocessing', 'scan', 'fuzzy', 'nesting')
+
+
+def new_stats():
+    '''
+    :return: dict of zeroed counters:
+             documents: number of texts tagged
+             raw_hits: hits of the automaton in the categories looked for
+             boundary_rejections: raw hits rejected because they do not lie on token boundaries
+             fuzzy_checks: partial match candidates verified against their dictionary entry
+             fuzzy_rejections: partial match candidates not close enough to their dictionary entry
+             nested_removed: matches dropped because a longer match of the same category and reference db contains them
+             tags: tags emitted
+             tags_per_category: dict category -> tags emitted
+             phase_seconds: dict phase -> seconds spent lowercasing the text and computing its token boundaries
+                            (preprocessing), running the automaton and validating its hits (scan), verifying
+                            the partial matches (fuzzy) and removing the nested matches (nesting)
+    '''
+    return {'documents': 0,
+            'raw_hits': 0,
+            'boundary_rejections': 0,
+            'fuzzy_checks': 0,
+            'fuzzy_rejections': 0,
+            'nested_removed': 0,
+            'tags': 0,
+            'tags_per_category': {},
+            'phase_seconds': dict.fromkeys(PHASES, 0.0)}
+
+
+def merge_stats(stats, other):
+    '''
+    adds the counters of other to those of stats
+    '''
+    for name, value in other.items():
+        if isinstance(value, dict):
+            merged = stats.setdefault(name, {})
+            for key, sub_value in value.items():
+                merged[key] = merged.get(key, 0) + sub_value
+        else:
+            stats[name] = stats.get(name, 0) + value
+    return stats
+
+
+def snapshot(stats):
+    '''
+    :return: a copy of stats, with the derived rates of the funnel
+    '''
+    result = copy.deepcopy(stats)
+    result['boundary_rejection_rate'] = stats['boundary_rejections'] / stats['raw_hits'] if stats['raw_hits'] else 0.0
+    result['fuzzy_rejection_rate'] = stats['fuzzy_rejections'] / stats['fuzzy_checks'] if stats['fuzzy_checks'] else 0.0
+    result['seconds'] = sum(stats['phase_seconds'].values())
+    return result
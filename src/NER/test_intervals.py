@@ -0,0 +1,60 @@
+'''
+Tests of NER.intervals. Run from the repository root with:
+    python -m pytest src/NER/test_intervals.py
+'''
+import os
+import random
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NER.benchmark import _legacy_remove_nested, _random_spans
+from NER.intervals import remove_nested, remove_nested_by_group
+
+
+def _brute_force_remove_nested(items):
+    '''keeps the items whose span is not contained in the span of a strictly larger item'''
+    kept = [item for item in items
+            if not any(other['start'] <= item['start'] and item['end'] <= other['end'] and
+                       other['end'] - other['start'] > item['end'] - item['start'] for other in items)]
+    return sorted(kept, key=lambda x: (x['start'], -x['end']))
+
+
+def test_remove_nested_matches_legacy_on_distinct_spans():
+    rng = random.Random(0)
+    for _ in range(2000):
+        spans = _random_spans(rng.randint(1, 60), rng.randint(60, 200), 15, rng)
+        assert remove_nested(spans) == _legacy_remove_nested(spans), spans
+
+
+def test_remove_nested_keeps_identical_spans():
+    # e.g. a -TOKEN hit and a full hit of the same category on the same text: the former quadratic
+    # implementation dropped both, they are now both kept
+    token_hit = {'start': 10, 'end': 18, 'category': 'DISEASE-TOKEN'}
+    full_hit = {'start': 10, 'end': 18, 'category': 'DISEASE'}
+    nested = {'start': 12, 'end': 16, 'category': 'DISEASE'}
+    assert remove_nested([token_hit, full_hit, nested]) == [token_hit, full_hit]
+    assert _legacy_remove_nested([token_hit, full_hit]) == []
+    # identical spans nested in a larger one are all dropped
+    larger = {'start': 5, 'end': 20, 'category': 'DISEASE'}
+    assert remove_nested([token_hit, full_hit, larger]) == [larger]
+
+
+def test_remove_nested_with_duplicate_spans_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(2000):
+        spans = _random_spans(rng.randint(1, 30), rng.randint(30, 100), 10, rng)
+        items = [dict(span, copy=0) for span in spans]
+        items += [dict(rng.choice(spans), copy=1) for _ in range(rng.randint(1, 10))]
+        rng.shuffle(items)
+        expected = _brute_force_remove_nested(items)
+        # the order of the items sharing a span is not specified
+        key = lambda x: (x['start'], -x['end'], x['copy'])
+        assert sorted(remove_nested(items), key=key) == sorted(expected, key=key), items
+
+
+def test_remove_nested_by_group_keeps_groups_apart():
+    outer = {'start': 0, 'end': 10, 'category': 'DISEASE'}
+    inner_same = {'start': 2, 'end': 5, 'category': 'DISEASE'}
+    inner_other = {'start': 2, 'end': 5, 'category': 'GENE'}
+    kept = remove_nested_by_group([outer, inner_same, inner_other], lambda x: x['category'])
+    assert kept == [outer, inner_other]
@@ -0,0 +1,177 @@
+'''
+Surface variants of the vocabulary terms, added to the automaton when it is built.
+
+A variant generator is a function taking the key of a term (lowercased when the tagger ignores case)
+and returning the other spellings to match for it. The generators are registered by name in
+VARIANT_GENERATORS and chosen with the variants argument of BioEntityTagger. The keys they produce are
+deduplicated, and the entries created for them remember the name of the generator, which tags found
+through them carry as their 'variant'.
+
+Generators run in the processes parsing the vocabulary files, so custom ones must be module level
+functions (see NER.vocabulary_loader).
+'''
+import re
+from collections import OrderedDict
+
+GREEK_LETTERS = OrderedDict([('alpha', 'α'), ('beta', 'β'), ('gamma', 'γ'), ('delta', 'δ'),
+                             ('epsilon', 'ε'), ('zeta', 'ζ'), ('eta', 'η'), ('theta', 'θ'),
+                             ('iota', 'ι'), ('kappa', 'κ'), ('lambda', 'λ'), ('mu', 'μ'),
+                             ('nu', 'ν'), ('xi', 'ξ'), ('omicron', 'ο'), ('pi', 'π'),
+                             ('rho', 'ρ'), ('sigma', 'σ'), ('tau', 'τ'), ('upsilon', 'υ'),
+                             ('phi', 'φ'), ('chi', 'χ'), ('psi', 'ψ'), ('omega', 'ω')])
+GREEK_NAMES = {letter: name for name, letter in GREEK_LETTERS.items()}
+# the names of the letters are only replaced when they are not part of a longer word, e.g. not in 'alphavirus'
+_greek_name_regex = re.compile(r'(?<![^\W\d_])(' + '|'.join(sorted(GREEK_LETTERS, key=len, reverse=True)) +
+                               r')(?![^\W\d_])', re.IGNORECASE)
+_greek_letter_regex = re.compile('[' + ''.join(GREEK_NAMES) + ']')
+
+ROMAN_NUMERALS = ['i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                  'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx']
+ROMAN_TO_ARABIC = {roman: str(i) for i, roman in enumerate(ROMAN_NUMERALS, 1)}
+ARABIC_TO_ROMAN = {arabic: roman for roman, arabic in ROMAN_TO_ARABIC.items()}
+# words after which a number is read as such, and not as a letter ('fragile x syndrome') or as part of a
+# name ('covid 19')
+NUMBERED_WORDS = {'type', 'subtype', 'class', 'grade', 'stage', 'phase', 'factor', 'group', 'complex',
+                  'level', 'degree', 'category'}
+_token_regex = re.compile(r'[^\s-]+|[\s-]+')
+
+
+def dashless(key):
+    '''
+    :return: the key without its dashes, e.g. 'il-6' -> 'il6'
+    '''
+    if '-' in key:
+        return [key.replace('-', '')]
+    return []
+
+
+def hyphen_space(key):
+    '''
+    :return: the key with its dashes replaced by spaces, and the key of up to three words with its spaces
+             replaced by dashes, e.g. 'non-hodgkin lymphoma' -> 'non hodgkin lymphoma', 'il 6' -> 'il-6'
+    '''
+    variants = []
+    if '-' in key:
+        variants.append(key.replace('-', ' '))
+    if ' ' in key and key.count(' ') <= 2:
+        variants.append(key.replace(' ', '-'))
+    return variants
+
+
+def greek_letters(key):
+    '''
+    :return: the key with the names of greek letters replaced by the letters, or the other way round,
+             e.g. 'tnf-alpha' -> 'tnf-α', 'α-synuclein' -> 'alpha-synuclein'
+    '''
+    variants = []
+    # 'xi' is more often a roman numeral, e.g. in 'factor xi deficiency'
+    with_letters = _greek_name_regex.sub(lambda m: m.group(1) if m.group(1).lower() in ROMAN_TO_ARABIC
+                                         else GREEK_LETTERS[m.group(1).lower()], key)
+    if with_letters != key:
+        variants.append(with_letters)
+    with_names = _greek_letter_regex.sub(lambda m: GREEK_NAMES[m.group(0)], key)
+    if with_names != key:
+        variants.append(with_names)
+    return variants
+
+
+def plurals(key):
+    '''
+    :return: the plural of the last word of the key, or its singular if it looks plural,
+             e.g. 'breast neoplasm' -> 'breast neoplasms', 'arteries' -> 'artery', 'metastasis' -> 'metastases'.
+             Latin words in -us, e.g. 'diabetes mellitus', are left alone
+    '''
+    words = key.split()
+    if not words:
+        return []
+    last = words[-1]
+    head = key[:len(key) - len(last)]
+    if len(last) < 4 or not last.isalpha():
+        return []
+    if last.endswith('ies'):
+        return [head + last[:-3] + 'y']
+    if last.endswith(('ches', 'shes', 'sses', 'xes', 'zes')):
+        return [head + last[:-2]]
+    if last.endswith('s'):
+        if last.endswith('ss'):
+            return [head + last + 'es']
+        if last.endswith('is'):
+            return [head + last[:-2] + 'es']
+        if last.endswith('us'):
+            return []
+        if last[-2] in 'aeio' or len(last) < 5:
+            # e.g. diabetes, or acronyms such as cors
+            return []
+        return [head + last[:-1]]
+    if last.endswith('y') and last[-2] not in 'aeiou':
+        return [head + last[:-1] + 'ies']
+    if last.endswith(('ch', 'sh', 'x', 'z')):
+        return [head + last + 'es']
+    return [head + last + 's']
+
+
+def numerals(key):
+    '''
+    :return: the key with its roman numerals (up to XX) written in arabic numerals, or the other way round.
+             Only the words following one of NUMBERED_WORDS and a space are changed,
+             e.g. 'type ii diabetes' -> 'type 2 diabetes', but not 'fragile x syndrome' nor 'covid 19'
+    '''
+    tokens = _token_regex.findall(key)
+    to_arabic = list(tokens)
+    to_roman = list(tokens)
+    for i, token in enumerate(tokens):
+        if i < 2 or not tokens[i - 1].isspace() or tokens[i - 2].lower() not in NUMBERED_WORDS:
+            continue
+        if token.lower() in ROMAN_TO_ARABIC:
+            to_arabic[i] = ROMAN_TO_ARABIC[token.lower()]
+        elif token in ARABIC_TO_ROMAN:
+            roman = ARABIC_TO_ROMAN[token]
+            to_roman[i] = roman if key.islower() else roman.upper()
+    return [''.join(variant) for variant in (to_arabic, to_roman) if variant != tokens]
+
+
+VARIANT_GENERATORS = OrderedDict([('dashless', dashless),
+                                  ('hyphen_space', hyphen_space),
+                                  ('greek_letters', greek_letters),
+                                  ('plurals', plurals),
+                                  ('numerals', numerals)])
+# variants generated when none are specified: only the dash-less forms the tagger has always matched
+DEFAULT_VARIANTS = ('dashless',)
+ALL_VARIANTS = tuple(VARIANT_GENERATORS)
+
+
+def resolve_generators(variants):
+    '''
+    :param variants: names of registered generators or generator functions, None for DEFAULT_VARIANTS
+    :return: list of (name, generator)
+    '''
+    if variants is None:
+        variants = DEFAULT_VARIANTS
+    generators = []
+    for variant in variants:
+        if callable(variant):
+            generators.append((variant.__name__, variant))
+        else:
+            try:
+                generators.append((variant, VARIANT_GENERATORS[variant]))
+            except KeyError:
+                raise ValueError('unknown variant generator %r, known ones are %s'
+                                 % (variant, ', '.join(VARIANT_GENERATORS)))
+    return generators
+
+
+def generate_variants(key, generators, min_length=3):
+    '''
+    :param key: key of a term
+    :param generators: list of (name, generator), see resolve_generators
+    :param min_length: shortest variant kept
+    :return: list of (variant, name of the first generator producing it), without duplicates nor the key itself
+    '''
+    seen = {key}
+    variants = []
+    for name, generator in generators:
+        for variant in generator(key):
+            if variant not in seen and len(variant) >= min_length:
+                seen.add(variant)
+                variants.append((variant, name))
+    return variants
@@ -0,0 +1,202 @@
+'''
+Parsing of the vocabulary files of BioEntityTagger.
+
+Each vocabulary file is parsed, filtered (short terms, stopwords, removed terms) and normalized into
+the keys to add to the automaton in a worker process of its own. The workers send back compact
+records, in batches through bounded queues, instead of the parsed dictionaries, and the parent
+consumes them file by file, in order, so that the automaton is the same as with a sequential build.
+The parent never holds more than a few batches of records on top of the automaton being built, and
+the parsing of the next files overlaps with the insertion of the records of the current one.
+'''
+import collections
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import threading
+import traceback
+
+from .variants import generate_variants
+
+# number of records sent at once by a worker process, and number of batches a worker can send ahead
+BATCH_SIZE = 10000
+QUEUE_BATCHES = 4
+
+
+def vocabulary_source(vocabulary_file):
+    '''
+    :param vocabulary_file: path of a vocabulary file, named CATEGORY-REFERENCEDB.json
+    :return: (category, reference_db) of the vocabulary
+    '''
+    category, reference_db = os.path.basename(vocabulary_file).split('.')[0].split('_')[0].split('-')
+    return category, reference_db
+
+
+def vocabulary_records(category, reference_db, dictionary, stopwords, ignorecase=True, partial_match=False,
+                       removed_terms=None, generators=()):
+    '''
+    yields the keys to add to the automaton for the terms of a vocabulary: the terms that are not too short
+    nor stopwords, their variants, and with partial_match their long tokens
+    :param category: category of the vocabulary
+    :param reference_db: reference db of the vocabulary
+    :param dictionary: dict term -> {'ids': [...], 'pref_name': ...}, the format of the vocabulary files
+    :param stopwords: StopWordIndex of the stopwords to skip
+    :param ignorecase: lowercase the keys
+    :param partial_match: also yield the tokens of the terms
+    :param removed_terms: set of (category, reference_db, term) to skip
+    :param generators: variant generators, see NER.variants.resolve_generators
+    :return: generator of (key, is_token, variant, term, ids, pref_name) records, variant being the name of
+             the generator of the key, None for the terms themselves and their tokens
+    '''
+    for element, element_data in dictionary.items():
+        if removed_terms and (category, reference_db, element) in removed_terms:
+            continue
+        if len(element) <= 2:
+            continue
+        if len(element) < 5:
+            if stopwords.is_stopword(element, category):
+                continue
+        elif stopwords.is_stopword(element.lower(), category):
+            continue
+        ids = element_data['ids']
+        pref_name = element_data['pref_name']
+        element_match = element.lower() if ignorecase else element
+        yield element_match, False, None, element, ids, pref_name
+        for variant, generator_name in generate_variants(element_match, generators):
+            yield variant, False, generator_name, element, ids, pref_name
+        # if supporting partial match
+        if partial_match:
+            for longest_token in element.split():
+                if longest_token != element and \
+                   len(longest_token) > 5 and \
+                   not stopwords.is_stopword(longest_token.lower(), category):
+                    yield longest_token, True, None, element, ids, pref_name
+
+
+def read_vocabulary_file(vocabulary_file):
+    '''
+    :param vocabulary_file: path of a vocabulary file, named CATEGORY-REFERENCEDB.json
+    :return: (category, reference_db, dictionary of the terms of the vocabulary)
+    '''
+    category, reference_db = vocabulary_source(vocabulary_file)
+    with open(vocabulary_file) as f:
+        dictionary = json.load(f)
+    return category, reference_db, dictionary
+
+
+def _batches(records, batch_size=BATCH_SIZE):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _parse_in_worker(queue, vocabulary_file, options):
+    '''
+    runs in a worker process: puts (category, reference_db) then the batches of records of a vocabulary
+    file in queue, then None, or ('error', traceback) if the parsing fails
+    '''
+    try:
+        category, reference_db, dictionary = read_vocabulary_file(vocabulary_file)
+        queue.put((category, reference_db))
+        for batch in _batches(vocabulary_records(category, reference_db, dictionary, **options)):
+            queue.put(batch)
+        queue.put(None)
+    except Exception:
+        queue.put(('error', traceback.format_exc()))
+
+
+def _get(queue, process, vocabulary_file):
+    '''
+    :return: next item a worker process put in queue, raising RuntimeError if the process failed or died
+    '''
+    while True:
+        try:
+            item = queue.get(timeout=1.0)
+        except queue_module.Empty:
+            if process.is_alive():
+                continue
+            raise RuntimeError('the process parsing %s exited with code %s' % (vocabulary_file, process.exitcode))
+        if isinstance(item, tuple) and item[0] == 'error':
+            raise RuntimeError('parsing %s failed:\n%s' % (vocabulary_file, item[1]))
+        return item
+
+
+def _can_fork():
+    '''
+    forking a process while other threads run (e.g. a rebuild in a VocabularyWatcher thread, or a build in
+    a request thread of the webapp) can leave the child blocked on a lock one of them held: the files are
+    only parsed in worker processes when the calling thread is the only one
+    '''
+    return 'fork' in multiprocessing.get_all_start_methods() and threading.active_count() == 1
+
+
+def _iter_parallel(vocabulary_files, options, processes):
+    '''
+    parses each vocabulary file in its own worker process, at most processes at a time, each one sending
+    its records through a queue of at most QUEUE_BATCHES batches. The files are consumed in order, the
+    workers of the next files blocking once their queue is full
+    '''
+    context = multiprocessing.get_context('fork')
+    files = iter(vocabulary_files)
+    workers = collections.deque()
+
+    def start_next():
+        vocabulary_file = next(files, None)
+        if vocabulary_file is not None:
+            queue = context.Queue(QUEUE_BATCHES)
+            process = context.Process(target=_parse_in_worker, args=(queue, vocabulary_file, options))
+            process.daemon = True
+            process.start()
+            workers.append((vocabulary_file, queue, process))
+
+    try:
+        for _ in range(processes):
+            start_next()
+        while workers:
+            vocabulary_file, queue, process = workers[0]
+            category, reference_db = _get(queue, process, vocabulary_file)
+            batch = _get(queue, process, vocabulary_file)
+            while batch is not None:
+                yield category, reference_db, batch
+                batch = _get(queue, process, vocabulary_file)
+            process.join()
+            workers.popleft()
+            start_next()
+    finally:
+        for vocabulary_file, queue, process in workers:
+            process.terminate()
+            process.join()
+
+
+def iter_vocabulary_records(vocabulary_files, extra_terms, stopwords, ignorecase=True, partial_match=False,
+                            removed_terms=None, processes=None, generators=()):
+    '''
+    :param vocabulary_files: paths of the vocabulary files to load
+    :param extra_terms: dict (category, reference_db) -> dictionary of terms added to the vocabularies
+    :param processes: number of processes parsing the vocabulary files, defaults to the number of CPUs. The
+                      files are parsed in this process when it is 1 or when other threads are running
+    :return: generator of (category, reference_db, records) for each batch of at most BATCH_SIZE records of
+             each vocabulary file, in order, then of each set of extra terms, see vocabulary_records
+    '''
+    options = dict(stopwords=stopwords, ignorecase=ignorecase, partial_match=partial_match,
+                   removed_terms=removed_terms, generators=generators)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = min(processes, len(vocabulary_files))
+    if processes > 1 and _can_fork():
+        for result in _iter_parallel(vocabulary_files, options, processes):
+            yield result
+    else:
+        for vocabulary_file in vocabulary_files:
+            category, reference_db, dictionary = read_vocabulary_file(vocabulary_file)
+            for batch in _batches(vocabulary_records(category, reference_db, dictionary, **options)):
+                yield category, reference_db, batch
+            del dictionary
+    for (category, reference_db), dictionary in list(extra_terms.items()):
+        for batch in _batches(vocabulary_records(category, reference_db, dictionary, **options)):
+            yield category, reference_db, batch
@@ -0,0 +1,85 @@
+'''
+Watches the vocabulary directory and hot-reloads a BioEntityTagger when its vocabulary files change.
+'''
+import logging
+import os
+import threading
+
+VOCABULARY_DIR = os.path.dirname(os.path.abspath(__file__)) + "/vocabulary/"
+
+
+class VocabularyWatcher(threading.Thread):
+    '''
+    Polls the vocabulary files of a tagger and rebuilds the tagger when one of them is modified or deleted
+    (deleted files are dropped from the tagger). New files appearing in the directory are loaded too if
+    add_new_files is set. The rebuild happens in this thread and the new automaton is swapped in atomically,
+    see BioEntityTagger.rebuild.
+    '''
+
+    def __init__(self, tagger, directory=VOCABULARY_DIR, interval=10.0, add_new_files=False):
+        '''
+        :param tagger: BioEntityTagger to keep up to date
+        :param directory: directory to watch for new vocabulary files
+        :param interval: seconds between two polls
+        :param add_new_files: load the .json files added to the directory
+        '''
+        super(VocabularyWatcher, self).__init__(name='VocabularyWatcher')
+        self.daemon = True
+        self.tagger = tagger
+        self.directory = directory
+        self.interval = interval
+        self.add_new_files = add_new_files
+        self._stop_event = threading.Event()
+        self._snapshot = self.snapshot()
+
+    def _watched_files(self):
+        files = set(os.path.abspath(f) for f in self.tagger.vocabulary_files)
+        if self.add_new_files and os.path.isdir(self.directory):
+            files.update(os.path.abspath(os.path.join(self.directory, f))
+                         for f in os.listdir(self.directory) if f.endswith('.json'))
+        return files
+
+    def snapshot(self):
+        '''
+        :return: dict path -> (mtime, size) of the watched files, None for the missing ones
+        '''
+        snapshot = {}
+        for path in self._watched_files():
+            try:
+                st = os.stat(path)
+                snapshot[path] = (st.st_mtime, st.st_size)
+            except OSError:
+                snapshot[path] = None
+        return snapshot
+
+    def check(self):
+        '''
+        compares the watched files with the last snapshot and rebuilds the tagger if needed
+        :return: True if the tagger was rebuilt
+        '''
+        snapshot = self.snapshot()
+        if snapshot == self._snapshot:
+            return False
+        with self.tagger._terms_lock:
+            loaded = set(os.path.abspath(f) for f in self.tagger.vocabulary_files)
+            for path, stat in snapshot.items():
+                if stat is None:
+                    logging.warning('vocabulary file %s disappeared, removing it from the tagger', path)
+                    self.tagger.vocabulary_files = [f for f in self.tagger.vocabulary_files
+                                                    if os.path.abspath(f) != path]
+                elif path not in loaded:
+                    logging.info('loading new vocabulary file %s', path)
+                    self.tagger.vocabulary_files.append(path)
+        self._snapshot = self.snapshot()
+        self.tagger.rebuild(background=False)
+        return True
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logging.exception('vocabulary rebuild failed, keeping the previous automaton')
+
+    def stop(self):
+        self._stop_event.set()
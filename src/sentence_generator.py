@@ -1,31 +1,212 @@
-"""This module defines a data structure that can be lazily iterated on multiple times to provide articles as lists of sentences"""
+"""This module defines a data structure that can be lazily iterated on multiple times to provide articles as lists of sentences
+
+The first iteration over a corpus tokenizes it once and for all into a cache next to it: the ids of
+its tokens, the offsets of its sentences in them and its vocabulary. The following iterations read
+the tokens from a memory map instead of parsing the JSON and stripping the punctuation again, which
+matters for the multiple passes of Word2Vec and Phrases. The cache is rebuilt when the corpus changes.
+"""
 import sys; sys.path += ['../']
 import json
-import re
+import logging
+import os
 import string
+import tempfile
+
+import numpy as np
+
+# the regex '[' + string.punctuation + ']' the sentences used to be stripped with reads its backslash
+# as the escape of the closing bracket, so backslashes are kept
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation.replace('\\', ''))
+CACHE_FORMAT_VERSION = 1
+TOKEN_DTYPE = np.uint32
+OFFSET_DTYPE = np.int64
+# number of sentences converted back to words at once when reading the cache
+READ_BLOCK_SENTENCES = 1024
+
+
+def tokenize(text):
+    """ Removes the punctuation of a text, converts it to lower case and splits it on whitespace
+        Arguments:
+            - (str) text: the text to tokenize
+        Returns:
+            - (list<str>): the tokens of the text
+    """
+    return text.lower().translate(PUNCTUATION_TABLE).split()
+
+
+def iter_corpus_sentences(filename):
+    """ Reads a JSON corpus and yields the tokens of the abstract (if any)
+        and of the full text of each article
+        Arguments:
+            - (str) filename: path to the corpus, one JSON article per line
+        Yields:
+            - (list<str>): the tokens of each sentence
+    """
+    with open(filename) as corpus:
+        for article_as_json in corpus:
+            article = json.loads(article_as_json)
+            if "ab" in article:
+                yield tokenize(article["ab"])
+            yield tokenize(article["raw"])
+
+
+def _source_signature(filename):
+    stat = os.stat(filename)
+    return {'source': os.path.abspath(filename),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'format_version': CACHE_FORMAT_VERSION}
+
+
+def _write_array(f, values, dtype):
+    f.write(np.asarray(values, dtype=dtype).tobytes())
+
+
+def _temporary_file(cache_dir, mode, **kwargs):
+    # a file of its own for each builder, in case several of them build the same cache at once
+    fd, path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+    return open(fd, mode, **kwargs), path
+
+
+def build_sentence_cache(filename, cache_dir):
+    """ Tokenizes a JSON corpus and writes its tokens to cache_dir:
+        tokens.bin, the ids of the tokens of all the sentences one after the other,
+        offsets.bin, the index in tokens.bin of the start of each sentence plus
+        the number of tokens, vocab.txt, the token of each id, one per line, and
+        meta.json, the signature of the corpus the cache was built from
+        Arguments:
+            - (str) filename: path to the corpus
+            - (str) cache_dir: directory of the cache, created if needed
+        Returns:
+            - (dict): the signature of the corpus, as written in meta.json
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    # the cache is invalid until the new signature is written, after the rest
+    try:
+        os.remove(meta_path)
+    except FileNotFoundError:
+        pass
+    signature = _source_signature(filename)
+    vocab = {}
+    n_tokens = 0
+    tmp_paths = {}
+    try:
+        tokens_file, tmp_paths['tokens.bin'] = _temporary_file(cache_dir, 'wb')
+        offsets_file, tmp_paths['offsets.bin'] = _temporary_file(cache_dir, 'wb')
+        with tokens_file, offsets_file:
+            offsets = [0]
+            for sentence in iter_corpus_sentences(filename):
+                ids = [vocab.setdefault(token, len(vocab)) for token in sentence]
+                _write_array(tokens_file, ids, TOKEN_DTYPE)
+                n_tokens += len(ids)
+                offsets.append(n_tokens)
+                if len(offsets) >= 1 << 16:
+                    _write_array(offsets_file, offsets, OFFSET_DTYPE)
+                    offsets = []
+            _write_array(offsets_file, offsets, OFFSET_DTYPE)
+            n_sentences = offsets_file.tell() // np.dtype(OFFSET_DTYPE).itemsize - 1
+        # lone surrogates, valid in JSON strings, can't be encoded in UTF-8 otherwise
+        vocab_file, tmp_paths['vocab.txt'] = _temporary_file(cache_dir, 'w', encoding='utf-8',
+                                                             errors='surrogatepass')
+        with vocab_file:
+            # the tokens hold no whitespace, the dict keeps them in the order of their ids
+            vocab_file.write('\n'.join(vocab))
+        meta_file, tmp_paths['meta.json'] = _temporary_file(cache_dir, 'w')
+        with meta_file:
+            json.dump(dict(signature, sentences=n_sentences, tokens=n_tokens, vocabulary=len(vocab)),
+                      meta_file, indent=2)
+        # the builders of the same corpus write the same files, meta.json comes last
+        for name, tmp_path in tmp_paths.items():
+            os.replace(tmp_path, os.path.join(cache_dir, name))
+    except BaseException:
+        for tmp_path in tmp_paths.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+    return signature
+
+
+def _memmap(path, dtype):
+    # np.memmap can't map an empty file
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
 
 
 class Sentences():  # generator on the text in the corpus
-    def __init__(self, filename):
+    """ Iterable over the sentences of a JSON corpus, the abstract (if any)
+        and the full text of each article, as lists of lowercase tokens
+        without punctuation.
+        Arguments:
+            - (str) filename: path to the corpus
+            - (str) cache_dir: directory of the tokenized corpus, defaults to
+                the path of the corpus without its extension plus '.tokens'
+            - (bool) use_cache: read the sentences from the tokenized corpus,
+                built at the first iteration and whenever the corpus changes,
+                instead of parsing the corpus every time
+    """
+    def __init__(self, filename, cache_dir=None, use_cache=True):
         self.filename = filename
+        self.cache_dir = cache_dir or os.path.splitext(filename)[0] + '.tokens'
+        self.use_cache = use_cache
 
     def __iter__(self):
         return next(self)
 
     def __next__(self):
-        # regex containing all punctution
-        punct_regex = '[' + string.punctuation + ']'
-        with open(self.filename) as corpus:
-            for article_as_json in corpus:
-                # loading each json article
-                article = json.loads(article_as_json)
-                # removing punctuation, converting to lower case,
-                # removing article separators, loading each line
-                # as a seperate document
-                try:
-                    # yielding abstract
-                    yield re.sub(punct_regex, '', article["ab"].lower()).split()
-                except KeyError:  # ignore if article has no abstract
-                    pass
-                # yielding full article text
-                yield re.sub(punct_regex, '', article["raw"].lower()).split()
+        if not self.use_cache:
+            return iter_corpus_sentences(self.filename)
+        try:
+            self.build_cache()
+        except OSError as e:
+            # e.g. a read-only data directory or a full disk
+            logging.warning('could not tokenize %s into %s (%s), reading it directly',
+                            self.filename, self.cache_dir, e)
+            return iter_corpus_sentences(self.filename)
+        return self._iter_cache()
+
+    def cache_is_valid(self):
+        """ Returns:
+                - (bool): whether the tokenized corpus was built from the
+                    current version of the corpus
+        """
+        try:
+            with open(os.path.join(self.cache_dir, 'meta.json')) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return all(meta.get(name) == value for name, value in _source_signature(self.filename).items())
+
+    def build_cache(self, force=False):
+        """ Tokenizes the corpus into cache_dir, unless it already was
+            since the corpus last changed
+            Arguments:
+                - (bool) force: tokenize the corpus even if the cache is valid
+        """
+        if force or not self.cache_is_valid():
+            build_sentence_cache(self.filename, self.cache_dir)
+
+    def _iter_cache(self):
+        with open(os.path.join(self.cache_dir, 'vocab.txt'), encoding='utf-8', errors='surrogatepass') as f:
+            content = f.read()
+        vocab = content.split('\n') if content else []
+        tokens = _memmap(os.path.join(self.cache_dir, 'tokens.bin'), TOKEN_DTYPE)
+        offsets = _memmap(os.path.join(self.cache_dir, 'offsets.bin'), OFFSET_DTYPE)
+        for block_start in range(0, len(offsets) - 1, READ_BLOCK_SENTENCES):
+            block = offsets[block_start:block_start + READ_BLOCK_SENTENCES + 1].tolist()
+            words = [vocab[i] for i in tokens[block[0]:block[-1]].tolist()]
+            for start, end in zip(block, block[1:]):
+                yield words[start - block[0]:end - block[0]]
+
+
+if __name__ == '__main__':
+    # tokenizes the corpora given by name ahead of their first use
+    from constants import NAME_TO_DATASET
+
+    for corpusname in sys.argv[1:] or NAME_TO_DATASET:
+        corpusfile = NAME_TO_DATASET[corpusname.lower().strip()]
+        if os.path.exists(corpusfile):
+            sentences = Sentences(corpusfile)
+            sentences.build_cache()
+            print(corpusname, '->', sentences.cache_dir)
@@ -243,6 +243,38 @@ def get_oov_rate(corpusname, modelname="google"):
     return len(vocab - set(model.vocab.keys())) / len(vocab)
 
 
+def iter_tagged_corpus(corpusname=None, corpusfile=None, tagger=None,
+                       processes=None, chunksize=16):
+    """ Tags the full text of every document of a JSON corpus with a pool
+        of worker processes, streaming the documents and their tags.
+        Arguments:
+            - (str) corpusname: name of the corpus to read from.
+                (should be specified iff corpusfile is not)
+            - (str) corpusfile: path to the corpus to read from.
+                (should be specified iff corpusname is not)
+            - (BioEntityTagger) tagger: tagger to use, built if not given
+            - (int) processes: number of worker processes, defaults
+                to the number of CPUs
+            - (int) chunksize: number of documents sent to a worker at once
+        Yields:
+            - (dict, list<dict>): each document of the corpus, in order,
+                along with the tags found in its full text
+    """
+    import itertools
+    import sys; sys.path += ['../']
+    from NER.BioentityTagger import BioEntityTagger
+
+    if tagger is None:
+        tagger = BioEntityTagger()
+    docs, docs_to_tag = itertools.tee(
+        get_docs_from_json_corpus(corpusname=corpusname, corpusfile=corpusfile))
+    texts = (doc["raw"] for doc in docs_to_tag)
+    for doc, tags in zip(docs, tagger.iter_tag_many(texts,
+                                                    processes=processes,
+                                                    chunksize=chunksize)):
+        yield doc, tags
+
+
 def tag_corpus(corpusname,
                tag_whitelist=['ORGANISM',
                               'DISEASE',
@@ -254,28 +286,34 @@ def tag_corpus(corpusname,
                               'DISEASEALT',
                               'HEALTHCARE',
                               'PROCESS',
-                              'DIAGNOSTICS']):
+                              'DIAGNOSTICS'],
+               output_dir=None, tagger=None, processes=None,
+               shard_size=10000):
+    """ Tags every document of a corpus and writes them, along with their
+        entities, to JSONL shards. An interrupted run is resumed from its
+        last complete shard, see NER.corpus_annotator.annotate_corpus.
+        Arguments:
+            - (str) corpusname: name of the corpus to tag
+            - (list<str>) tag_whitelist: categories of the entities to keep
+            - (list<str>) tag_blacklist: categories of the entities to drop
+            - (str) output_dir: directory of the shards, defaults to an
+                'annotated' directory next to the corpus file
+            - (BioEntityTagger) tagger: tagger to use, built if not given
+            - (int) processes: number of worker processes, defaults
+                to the number of CPUs
+            - (int) shard_size: number of documents per shard
+        Returns:
+            - (list<str>): the paths of the shards
+    """
+    import os
     import sys; sys.path += ['../']
-    from NER.BioentityTagger import BioEntityTagger
-    import json
+    from NER.corpus_annotator import annotate_corpus
 
     corpusfile = get_json_dataset_by_name(corpusname)
-    bet = BioEntityTagger()
-
-    with open(corpusfile) as f:
-        for line in f:
-            article = json.loads(line)
-            tags = [tag for tag in bet.tag(article["raw"])
-                    if tag['category'] not in tag_blacklist]
-            break
-
-    i = 0
-    while i < len(tags):
-        # finding all the items that start at the same index as some other
-        ends_of_tags_that_start_at_same_index = \
-            [tag['end'] for tag in tags if tag['start'] == tags[i]['start']]
-        # deleting the current tag if it ends after another tag that starts at the same index
-        # this means deleting tags that contain others
-        if tags[i]['end'] > min(ends_of_tags_that_start_at_same_index):
-            del tags[i]
-    tags[0].keys()
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(corpusfile), 'annotated')
+    categories = [category for category in tag_whitelist
+                  if category not in tag_blacklist]
+    return annotate_corpus(corpusfile, output_dir, tagger=tagger,
+                           categories=categories, processes=processes,
+                           shard_size=shard_size)